@@ -14,19 +14,36 @@
 
 from __future__ import annotations
 
-import importlib.metadata
+import importlib
 import os
+from typing import TYPE_CHECKING, Any
 
-import toml
+if TYPE_CHECKING:
+    from astrapy import api_options  # noqa: F401
+    from astrapy.admin import (
+        AstraDBAdmin,
+        AstraDBDatabaseAdmin,
+        DataAPIDatabaseAdmin,
+    )
+    from astrapy.client import DataAPIClient
+    from astrapy.collection import AsyncCollection, Collection
+    from astrapy.database import AsyncDatabase, Database
+    from astrapy.table import AsyncTable, Table
+
+    __version__: str
 
 
 def get_version() -> str:
+    import importlib.metadata
+
     try:
         # Expect a __version__ attribute in the package's __init__.py file
         return importlib.metadata.version(__package__)
 
     # If the package is not installed, we can still get the version from the pyproject.toml file
     except importlib.metadata.PackageNotFoundError:
+        import toml
+
         # Get the path to the pyproject.toml file
         dir_path = os.path.dirname(os.path.realpath(__file__))
         pyproject_path = os.path.join(dir_path, "..", "pyproject.toml")
@@ -46,21 +63,68 @@ def get_version() -> str:
             return "unknown"
 
 
-__version__: str = get_version()
-
+# The public names are imported on first access (PEP 562), so that
+# `import astrapy` stays cheap: the HTTP stack, the SSL setup and the
+# (de)serialization machinery are only loaded when actually needed.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "AstraDBAdmin": "astrapy.admin",
+    "AstraDBDatabaseAdmin": "astrapy.admin",
+    "AsyncCollection": "astrapy.collection",
+    "AsyncDatabase": "astrapy.database",
+    "AsyncTable": "astrapy.table",
+    "Collection": "astrapy.collection",
+    "Database": "astrapy.database",
+    "DataAPIClient": "astrapy.client",
+    "DataAPIDatabaseAdmin": "astrapy.admin",
+    "Table": "astrapy.table",
+}
 
-from astrapy import api_options  # noqa: E402, F401
-from astrapy.admin import (  # noqa: E402
-    AstraDBAdmin,
-    AstraDBDatabaseAdmin,
-    DataAPIDatabaseAdmin,
+_LAZY_SUBMODULES: frozenset[str] = frozenset(
+    {
+        "admin",
+        "api_options",
+        "authentication",
+        "client",
+        "collection",
+        "constants",
+        "cursors",
+        "data",
+        "data_types",
+        "database",
+        "event_observers",
+        "exceptions",
+        "ids",
+        "info",
+        "loaders",
+        "operations",
+        "profiling",
+        "results",
+        "settings",
+        "table",
+        "testing",
+        "utils",
+    }
 )
-from astrapy.client import DataAPIClient  # noqa: E402
-from astrapy.collection import AsyncCollection, Collection  # noqa: E402
 
-# A circular-import issue requires this to happen at the end of this module:
-from astrapy.database import AsyncDatabase, Database  # noqa: E402
-from astrapy.table import AsyncTable, Table  # noqa: E402
+
+def __getattr__(name: str) -> Any:
+    value: Any
+    if name == "__version__":
+        value = get_version()
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # later accesses do not go through this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | _LAZY_SUBMODULES)
+
 
 __all__ = [
     "AstraDBAdmin",
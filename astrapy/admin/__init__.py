@@ -24,13 +24,29 @@ from astrapy.admin.admin import (
     fetch_database_info,
     parse_api_endpoint,
 )
+from astrapy.admin.polling import (
+    AdaptivePollingStrategy,
+    DatabaseStatusPoller,
+    DeadlineAwarePollingStrategy,
+    ExponentialPollingStrategy,
+    FixedPollingStrategy,
+    PollingState,
+    PollingStrategy,
+)
 
 __all__ = [
+    "AdaptivePollingStrategy",
     "AstraDBAdmin",
     "AstraDBDatabaseAdmin",
     "DataAPIDatabaseAdmin",
     "DatabaseAdmin",
+    "DatabaseStatusPoller",
+    "DeadlineAwarePollingStrategy",
+    "ExponentialPollingStrategy",
+    "FixedPollingStrategy",
     "ParsedAPIEndpoint",
+    "PollingState",
+    "PollingStrategy",
     "async_fetch_database_info",
     "fetch_database_info",
     "parse_api_endpoint",
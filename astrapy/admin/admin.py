@@ -15,10 +15,13 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import re
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from typing import TYPE_CHECKING, Any, cast, overload
 
 from astrapy.admin.endpoints import (
@@ -29,6 +32,12 @@ from astrapy.admin.endpoints import (
     database_id_matcher,
     parse_api_endpoint,
 )
+from astrapy.admin.polling import (
+    DATABASE_POLLING_TARGET,
+    KEYSPACE_POLLING_TARGET,
+    DatabaseStatusPoller,
+    _PollingTracker,
+)
 from astrapy.constants import DatabaseStatus, Environment, ModelStatus
 from astrapy.exceptions import (
     DevOpsAPIException,
@@ -57,13 +66,17 @@ from astrapy.settings.defaults import (
     DEFAULT_DATA_API_AUTH_HEADER,
     DEFAULT_DEV_OPS_AUTH_HEADER,
     DEFAULT_DEV_OPS_AUTH_PREFIX,
-    DEV_OPS_DATABASE_POLL_INTERVAL_S,
     DEV_OPS_DEFAULT_DATABASES_PAGE_SIZE,
-    DEV_OPS_KEYSPACE_POLL_INTERVAL_S,
     DEV_OPS_RESPONSE_HTTP_ACCEPTED,
     DEV_OPS_RESPONSE_HTTP_CREATED,
     DEV_OPS_RESPONSE_HTTP_NOT_FOUND,
 )
+from astrapy.utils.admin_metadata_cache import (
+    AdminMetadataCache,
+    admin_metadata_cache_key,
+    async_cached_admin_lookup,
+    cached_admin_lookup,
+)
 from astrapy.utils.api_commander import APICommander
 from astrapy.utils.api_options import (
     APIOptions,
@@ -133,6 +146,50 @@ def check_id_endpoint_parg_kwargs(
     return (api_endpoint, None)
 
 
+def _dev_ops_cache_key(
+    kind: str,
+    api_options: FullAPIOptions,
+    *,
+    detail: str,
+) -> tuple[str, ...]:
+    # the key of an AdminMetadataCache entry for a DevOps API lookup
+    base_url = "/".join(
+        comp.strip("/")
+        for comp in (
+            api_options.dev_ops_api_url_options.dev_ops_url,
+            api_options.dev_ops_api_url_options.dev_ops_api_version,
+        )
+        if comp
+    )
+    return admin_metadata_cache_key(
+        kind,
+        token=api_options.token.get_token(),
+        base_url=base_url,
+        detail=detail,
+    )
+
+
+def _database_info_cache_key(id: str, api_options: FullAPIOptions) -> tuple[str, ...]:
+    return _dev_ops_cache_key(
+        AdminMetadataCache.DATABASE_INFO,
+        api_options,
+        detail=id,
+    )
+
+
+def _invalidate_cached_database_info(api_options: FullAPIOptions, id: str) -> None:
+    if api_options.admin_metadata_cache is not None:
+        api_options.admin_metadata_cache.invalidate(database_id=id)
+
+
+async def _async_invalidate_cached_database_info(
+    api_options: FullAPIOptions,
+    id: str,
+) -> None:
+    if api_options.admin_metadata_cache is not None:
+        await api_options.admin_metadata_cache._async_invalidate(database_id=id)
+
+
 def fetch_raw_database_info_from_id_token(
     id: str,
     *,
@@ -218,17 +275,25 @@ def fetch_raw_database_info_from_id_token(
         redacted_header_names=_api_options.redacted_header_names,
         event_observers=_api_options.event_observers,
         ca_cert_path=_api_options.ca_cert_path,
+        connection_reuse_mode=_api_options.connection_reuse_mode,
     )
 
-    gd_response = dev_ops_commander.request(
-        http_method=HttpMethod.GET,
-        timeout_context=_TimeoutContext(
-            request_ms=_api_options.timeout_options.request_timeout_ms,
-            label=_timeout_context_label,
+    timeout_context = _TimeoutContext(
+        request_ms=_api_options.timeout_options.request_timeout_ms,
+        label=_timeout_context_label,
+    )
+    gd_response = cached_admin_lookup(
+        _api_options.admin_metadata_cache,
+        _database_info_cache_key(id, _api_options),
+        lambda: dev_ops_commander.request(
+            http_method=HttpMethod.GET,
+            timeout_context=timeout_context,
+            caller_function_name="fetch_raw_database_info_from_id_token",
         ),
-        caller_function_name="fetch_raw_database_info_from_id_token",
+        timeout_context=timeout_context,
+        dev_ops_api=True,
     )
-    return gd_response
+    return cast(dict[str, Any], gd_response)
 
 
 async def async_fetch_raw_database_info_from_id_token(
@@ -317,17 +382,25 @@ async def async_fetch_raw_database_info_from_id_token(
         redacted_header_names=_api_options.redacted_header_names,
         event_observers=_api_options.event_observers,
         ca_cert_path=_api_options.ca_cert_path,
+        connection_reuse_mode=_api_options.connection_reuse_mode,
     )
 
-    gd_response = await dev_ops_commander.async_request(
-        http_method=HttpMethod.GET,
-        timeout_context=_TimeoutContext(
-            request_ms=_api_options.timeout_options.request_timeout_ms,
-            label=_timeout_context_label,
+    timeout_context = _TimeoutContext(
+        request_ms=_api_options.timeout_options.request_timeout_ms,
+        label=_timeout_context_label,
+    )
+    gd_response = await async_cached_admin_lookup(
+        _api_options.admin_metadata_cache,
+        _database_info_cache_key(id, _api_options),
+        lambda: dev_ops_commander.async_request(
+            http_method=HttpMethod.GET,
+            timeout_context=timeout_context,
+            caller_function_name="async_fetch_raw_database_info_from_id_token",
         ),
-        caller_function_name="async_fetch_raw_database_info_from_id_token",
+        timeout_context=timeout_context,
+        dev_ops_api=True,
     )
-    return gd_response
+    return cast(dict[str, Any], gd_response)
 
 
 def fetch_database_info(
@@ -419,6 +492,21 @@ async def async_fetch_database_info(
         return None
 
 
+def _chain_future(source: Future[Any], result: Any) -> Future[Any]:
+    # a future completing with `result` when `source` succeeds (failing with it)
+    chained: Future[Any] = Future()
+
+    def _propagate(_source: Future[Any]) -> None:
+        exception = _source.exception()
+        if exception is not None:
+            chained.set_exception(exception)
+        else:
+            chained.set_result(result)
+
+    source.add_done_callback(_propagate)
+    return chained
+
+
 def _recast_as_admin_database_info(
     admin_database_info_dict: dict[str, Any],
     *,
@@ -485,6 +573,8 @@ class AstraDBAdmin:
             }
         self._dev_ops_api_commander = self._get_dev_ops_api_commander()
         self._orgwide_dev_ops_api_commander = self._get_dev_ops_orgwide_api_commander()
+        self._status_poller: DatabaseStatusPoller | None = None
+        self._status_poller_lock = threading.Lock()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.api_options})"
@@ -520,6 +610,7 @@ class AstraDBAdmin:
             event_observers=self.api_options.event_observers,
             spawner=self,
             ca_cert_path=self.api_options.ca_cert_path,
+            connection_reuse_mode=self.api_options.connection_reuse_mode,
         )
         return dev_ops_commander
 
@@ -552,6 +643,7 @@ class AstraDBAdmin:
             event_observers=self.api_options.event_observers,
             spawner=self,
             ca_cert_path=self.api_options.ca_cert_path,
+            connection_reuse_mode=self.api_options.connection_reuse_mode,
         )
         return ow_dev_ops_commander
 
@@ -965,6 +1057,7 @@ class AstraDBAdmin:
                 request_ms=_database_admin_timeout_ms, label=_da_label
             ),
             caller_function_name="database_info",
+            use_cache=True,
         )
 
     def _database_info_ctx(
@@ -973,16 +1066,24 @@ class AstraDBAdmin:
         *,
         timeout_context: _TimeoutContext,
         caller_function_name: str,
+        use_cache: bool = False,
     ) -> AstraDBAdminDatabaseInfo:
-        # version of the method, but with timeouts made into a _TimeoutContext
+        # version of the method, but with timeouts made into a _TimeoutContext.
+        # The admin metadata cache is used only if requested (never when polling)
         if id == "":
             raise ValueError("Database ID cannot be empty.")
         logger.info(f"getting database info for '{id}' (DevOps API)")
-        gd_response = self._dev_ops_api_commander.request(
-            http_method=HttpMethod.GET,
-            additional_path=id,
+        gd_response = cached_admin_lookup(
+            self.api_options.admin_metadata_cache if use_cache else None,
+            _database_info_cache_key(id, self.api_options),
+            lambda: self._dev_ops_api_commander.request(
+                http_method=HttpMethod.GET,
+                additional_path=id,
+                timeout_context=timeout_context,
+                caller_function_name=caller_function_name,
+            ),
             timeout_context=timeout_context,
-            caller_function_name=caller_function_name,
+            dev_ops_api=True,
         )
         logger.info(f"finished getting database info for '{id}' (DevOps API)")
         return _recast_as_admin_database_info(
@@ -1037,6 +1138,7 @@ class AstraDBAdmin:
                 request_ms=_database_admin_timeout_ms, label=_da_label
             ),
             caller_function_name="async_database_info",
+            use_cache=True,
         )
 
     async def _async_database_info_ctx(
@@ -1045,16 +1147,24 @@ class AstraDBAdmin:
         *,
         timeout_context: _TimeoutContext,
         caller_function_name: str,
+        use_cache: bool = False,
     ) -> AstraDBAdminDatabaseInfo:
-        # version of the method, but with timeouts made into a _TimeoutContext
+        # version of the method, but with timeouts made into a _TimeoutContext.
+        # The admin metadata cache is used only if requested (never when polling)
         if id == "":
             raise ValueError("Database ID cannot be empty.")
         logger.info(f"getting database info for '{id}' (DevOps API), async")
-        gd_response = await self._dev_ops_api_commander.async_request(
-            http_method=HttpMethod.GET,
-            additional_path=id,
+        gd_response = await async_cached_admin_lookup(
+            self.api_options.admin_metadata_cache if use_cache else None,
+            _database_info_cache_key(id, self.api_options),
+            lambda: self._dev_ops_api_commander.async_request(
+                http_method=HttpMethod.GET,
+                additional_path=id,
+                timeout_context=timeout_context,
+                caller_function_name=caller_function_name,
+            ),
             timeout_context=timeout_context,
-            caller_function_name=caller_function_name,
+            dev_ops_api=True,
         )
         logger.info(f"finished getting database info for '{id}' (DevOps API), async")
         return _recast_as_admin_database_info(
@@ -1330,9 +1440,15 @@ class AstraDBAdmin:
         )
         if wait_until_active:
             last_status_seen = DatabaseStatus.PENDING.value
+            polling_tracker = _PollingTracker(
+                self.api_options.polling_strategy,
+                target=DATABASE_POLLING_TARGET,
+                status=last_status_seen,
+                deadline_ms=timeout_manager.deadline_ms,
+            )
             while last_status_seen in CREATEE_DATABASE_VALID_STATUSES:
                 logger.info(f"sleeping to poll for status of '{new_database_id}'")
-                time.sleep(DEV_OPS_DATABASE_POLL_INTERVAL_S)
+                time.sleep(polling_tracker.next_interval_s())
                 last_db_info = self._database_info_ctx(
                     id=new_database_id,
                     timeout_context=timeout_manager.remaining_timeout(
@@ -1342,6 +1458,7 @@ class AstraDBAdmin:
                     caller_function_name="create_database",
                 )
                 last_status_seen = last_db_info.status
+                polling_tracker.record(last_status_seen)
             if last_status_seen != DatabaseStatus.ACTIVE.value:
                 raise DevOpsAPIException(
                     f"Database {name} entered unexpected status "
@@ -1635,11 +1752,17 @@ class AstraDBAdmin:
         )
         if wait_until_active:
             last_status_seen = DatabaseStatus.PENDING.value
+            polling_tracker = _PollingTracker(
+                self.api_options.polling_strategy,
+                target=DATABASE_POLLING_TARGET,
+                status=last_status_seen,
+                deadline_ms=timeout_manager.deadline_ms,
+            )
             while last_status_seen in CREATEE_DATABASE_VALID_STATUSES:
                 logger.info(
                     f"sleeping to poll for status of '{new_database_id}', async"
                 )
-                await asyncio.sleep(DEV_OPS_DATABASE_POLL_INTERVAL_S)
+                await asyncio.sleep(polling_tracker.next_interval_s())
                 last_db_info = await self._async_database_info_ctx(
                     id=new_database_id,
                     timeout_context=timeout_manager.remaining_timeout(
@@ -1649,6 +1772,7 @@ class AstraDBAdmin:
                     caller_function_name="async_create_database",
                 )
                 last_status_seen = last_db_info.status
+                polling_tracker.record(last_status_seen)
             if last_status_seen != DatabaseStatus.ACTIVE.value:
                 raise DevOpsAPIException(
                     f"Database {name} entered unexpected status "
@@ -1768,12 +1892,19 @@ class AstraDBAdmin:
                 f"{DEV_OPS_RESPONSE_HTTP_ACCEPTED} - Created"
             )
         logger.info(f"DevOps API returned from dropping database '{id}'")
+        _invalidate_cached_database_info(self.api_options, id)
         if wait_until_active:
             last_status_seen: str = DatabaseStatus.TERMINATING.value
+            polling_tracker = _PollingTracker(
+                self.api_options.polling_strategy,
+                target=DATABASE_POLLING_TARGET,
+                status=last_status_seen,
+                deadline_ms=timeout_manager.deadline_ms,
+            )
             _db_name: str | None = None
             while last_status_seen == DatabaseStatus.TERMINATING.value:
                 logger.info(f"sleeping to poll for status of '{id}'")
-                time.sleep(DEV_OPS_DATABASE_POLL_INTERVAL_S)
+                time.sleep(polling_tracker.next_interval_s())
                 # poll for status
                 last_db_info = self._database_info_ctx(
                     id=id,
@@ -1784,6 +1915,7 @@ class AstraDBAdmin:
                     caller_function_name="drop_database",
                 )
                 last_status_seen = last_db_info.status
+                polling_tracker.record(last_status_seen)
             if last_status_seen != DatabaseStatus.TERMINATED.value:
                 _name_desc = f" ({_db_name})" if _db_name else ""
                 raise DevOpsAPIException(
@@ -1885,12 +2017,19 @@ class AstraDBAdmin:
                 f"{DEV_OPS_RESPONSE_HTTP_ACCEPTED} - Created"
             )
         logger.info(f"DevOps API returned from dropping database '{id}', async")
+        await _async_invalidate_cached_database_info(self.api_options, id)
         if wait_until_active:
             last_status_seen: str = DatabaseStatus.TERMINATING.value
+            polling_tracker = _PollingTracker(
+                self.api_options.polling_strategy,
+                target=DATABASE_POLLING_TARGET,
+                status=last_status_seen,
+                deadline_ms=timeout_manager.deadline_ms,
+            )
             _db_name: str | None = None
             while last_status_seen == DatabaseStatus.TERMINATING.value:
                 logger.info(f"sleeping to poll for status of '{id}', async")
-                await asyncio.sleep(DEV_OPS_DATABASE_POLL_INTERVAL_S)
+                await asyncio.sleep(polling_tracker.next_interval_s())
                 # poll for status
                 last_db_info = await self._async_database_info_ctx(
                     id=id,
@@ -1901,6 +2040,7 @@ class AstraDBAdmin:
                     caller_function_name="async_drop_database",
                 )
                 last_status_seen = last_db_info.status
+                polling_tracker.record(last_status_seen)
             if last_status_seen != DatabaseStatus.TERMINATED.value:
                 _name_desc = f" ({_db_name})" if _db_name else ""
                 raise DevOpsAPIException(
@@ -1909,6 +2049,353 @@ class AstraDBAdmin:
                 )
         logger.info(f"finished dropping database '{id}' (DevOps API), async")
 
+    def get_status_poller(self) -> DatabaseStatusPoller:
+        """
+        Get the database status poller of this admin object, creating it if needed.
+
+        The poller is shared by all `submit_*` methods of this object (and of the
+        database admins it spawns), so that all pending operations are watched
+        with a single `list_databases` request per polling cycle.
+        Its polling strategy is the one set in this object's API options.
+        Once the poller is closed (e.g. at the end of a `with` block), a new one
+        is created for the subsequent calls.
+
+        Returns:
+            a DatabaseStatusPoller.
+
+        Example:
+            >>> new_db_admin = my_astra_db_admin.create_database(
+            ...     "new_database",
+            ...     cloud_provider="aws",
+            ...     region="ap-south-1",
+            ...     wait_until_active=False,
+            ... )
+            >>> my_poller = my_astra_db_admin.get_status_poller()
+            >>> my_poller.wait_for_database_creation(new_db_admin.id).result().status
+            'ACTIVE'
+        """
+
+        with self._status_poller_lock:
+            if self._status_poller is None or self._status_poller._closed:
+                self._status_poller = DatabaseStatusPoller(self)
+            return self._status_poller
+
+    def _submit_create_database_definition(
+        self,
+        *,
+        definition: DatabaseDefinition | None,
+        cloud_provider: str | None,
+        region: str | None,
+        keyspace: str | None,
+    ) -> DatabaseDefinition:
+        if definition is None:
+            if cloud_provider is None or region is None:
+                raise ValueError(
+                    "Either 'definition' or both 'cloud_provider' and 'region' "
+                    "must be provided."
+                )
+            return DatabaseDefinition(
+                cloud_provider=cloud_provider,
+                region=region,
+                keyspace=keyspace,
+            )
+        if any(f is not None for f in [cloud_provider, region, keyspace]):
+            raise ValueError(
+                "Cannot specify both 'definition' and any of "
+                "'cloud_provider', 'region', 'keyspace'."
+            )
+        return definition
+
+    def submit_create_database(
+        self,
+        name: str,
+        *,
+        definition: DatabaseDefinition | None = None,
+        cloud_provider: str | None = None,
+        region: str | None = None,
+        keyspace: str | None = None,
+        database_admin_timeout_ms: int | None = None,
+        request_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+        token: str | TokenProvider | UnsetType = _UNSET,
+        spawn_api_options: APIOptions | UnsetType = _UNSET,
+    ) -> Future[AstraDBDatabaseAdmin]:
+        """
+        Create a database as requested, returning a future for its readiness.
+
+        The creation request is issued right away; the returned future completes
+        when the database is ACTIVE. All pending operations submitted through this
+        object are watched by a single, shared poller (see `get_status_poller`),
+        which makes it practical to provision many databases concurrently.
+
+        Args:
+            name: the desired name for the database.
+            definition: a DatabaseDefinition object for the database.
+                If provided, `cloud_provider`, `region`, and `keyspace`
+                must not be specified.
+            cloud_provider: one of 'aws', 'gcp' or 'azure'. Required if
+                `definition` is not provided.
+            region: any of the available cloud regions. Required if
+                `definition` is not provided.
+            keyspace: name for the one keyspace the database starts with.
+                If omitted, DevOps API will use its default.
+            database_admin_timeout_ms: a timeout, in milliseconds, for the database
+                to become active once the creation request is accepted. If the
+                timeout is exceeded, the future fails with a timeout exception.
+            request_timeout_ms: a timeout, in milliseconds, for the creation request.
+            timeout_ms: an alias for *both* the `request_timeout_ms` and
+                `database_admin_timeout_ms` timeout parameters.
+            token: if supplied, is passed to the resulting database admin instead
+                of the one set for this object.
+            spawn_api_options: a specification - complete or partial - of the
+                API Options to override the defaults inherited from the AstraDBAdmin.
+
+        Returns:
+            a `concurrent.futures.Future` for an AstraDBDatabaseAdmin instance.
+
+        Example:
+            >>> db_futures = [
+            ...     my_astra_db_admin.submit_create_database(
+            ...         f"ci_database_{i}",
+            ...         cloud_provider="aws",
+            ...         region="us-east-2",
+            ...     )
+            ...     for i in range(5)
+            ... ]
+            >>> db_admins = [db_future.result() for db_future in db_futures]
+        """
+
+        _definition = self._submit_create_database_definition(
+            definition=definition,
+            cloud_provider=cloud_provider,
+            region=region,
+            keyspace=keyspace,
+        )
+        _database_admin_timeout_ms, _ = _first_valid_timeout(
+            (database_admin_timeout_ms, "database_admin_timeout_ms"),
+            (timeout_ms, "timeout_ms"),
+            (self.api_options.timeout_options.database_admin_timeout_ms, None),
+        )
+        new_db_admin = self.create_database(
+            name,
+            definition=_definition,
+            wait_until_active=False,
+            request_timeout_ms=request_timeout_ms,
+            timeout_ms=timeout_ms,
+            token=token,
+            spawn_api_options=spawn_api_options,
+        )
+        return _chain_future(
+            self.get_status_poller().wait_for_database_creation(
+                new_db_admin.id,
+                timeout_ms=_database_admin_timeout_ms,
+            ),
+            new_db_admin,
+        )
+
+    async def async_submit_create_database(
+        self,
+        name: str,
+        *,
+        definition: DatabaseDefinition | None = None,
+        cloud_provider: str | None = None,
+        region: str | None = None,
+        keyspace: str | None = None,
+        database_admin_timeout_ms: int | None = None,
+        request_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+        token: str | TokenProvider | UnsetType = _UNSET,
+        spawn_api_options: APIOptions | UnsetType = _UNSET,
+    ) -> asyncio.Future[AstraDBDatabaseAdmin]:
+        """
+        Create a database as requested, returning an awaitable for its readiness.
+        Async version of the method, for use in an asyncio context.
+
+        The creation request is issued (and awaited) right away; the returned
+        asyncio future completes when the database is ACTIVE. All pending operations
+        are watched by a single, shared poller (see `get_status_poller`).
+
+        Args:
+            name: the desired name for the database.
+            definition: a DatabaseDefinition object for the database.
+                If provided, `cloud_provider`, `region`, and `keyspace`
+                must not be specified.
+            cloud_provider: one of 'aws', 'gcp' or 'azure'. Required if
+                `definition` is not provided.
+            region: any of the available cloud regions. Required if
+                `definition` is not provided.
+            keyspace: name for the one keyspace the database starts with.
+                If omitted, DevOps API will use its default.
+            database_admin_timeout_ms: a timeout, in milliseconds, for the database
+                to become active once the creation request is accepted. If the
+                timeout is exceeded, the future fails with a timeout exception.
+            request_timeout_ms: a timeout, in milliseconds, for the creation request.
+            timeout_ms: an alias for *both* the `request_timeout_ms` and
+                `database_admin_timeout_ms` timeout parameters.
+            token: if supplied, is passed to the resulting database admin instead
+                of the one set for this object.
+            spawn_api_options: a specification - complete or partial - of the
+                API Options to override the defaults inherited from the AstraDBAdmin.
+
+        Returns:
+            an `asyncio.Future` for an AstraDBDatabaseAdmin instance.
+
+        Example:
+            >>> async def create_many(n: int) -> list[AstraDBDatabaseAdmin]:
+            ...     db_futures = [
+            ...         await my_astra_db_admin.async_submit_create_database(
+            ...             f"ci_database_{i}",
+            ...             cloud_provider="aws",
+            ...             region="us-east-2",
+            ...         )
+            ...         for i in range(n)
+            ...     ]
+            ...     return await asyncio.gather(*db_futures)
+            ...
+            >>> db_admins = asyncio.run(create_many(5))
+        """
+
+        _definition = self._submit_create_database_definition(
+            definition=definition,
+            cloud_provider=cloud_provider,
+            region=region,
+            keyspace=keyspace,
+        )
+        _database_admin_timeout_ms, _ = _first_valid_timeout(
+            (database_admin_timeout_ms, "database_admin_timeout_ms"),
+            (timeout_ms, "timeout_ms"),
+            (self.api_options.timeout_options.database_admin_timeout_ms, None),
+        )
+        new_db_admin = await self.async_create_database(
+            name,
+            definition=_definition,
+            wait_until_active=False,
+            request_timeout_ms=request_timeout_ms,
+            timeout_ms=timeout_ms,
+            token=token,
+            spawn_api_options=spawn_api_options,
+        )
+        return asyncio.wrap_future(
+            _chain_future(
+                self.get_status_poller().wait_for_database_creation(
+                    new_db_admin.id,
+                    timeout_ms=_database_admin_timeout_ms,
+                ),
+                new_db_admin,
+            )
+        )
+
+    def submit_drop_database(
+        self,
+        id: str,
+        *,
+        database_admin_timeout_ms: int | None = None,
+        request_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> Future[None]:
+        """
+        Drop a database, returning a future for the completion of its termination.
+
+        The termination request is issued right away; the returned future completes
+        when the database is terminated. All pending operations submitted through
+        this object are watched by a single, shared poller (see `get_status_poller`).
+
+        Args:
+            id: The ID of the database to drop, e. g.
+                "01234567-89ab-cdef-0123-456789abcdef".
+            database_admin_timeout_ms: a timeout, in milliseconds, for the database
+                to be terminated once the request is accepted. If the timeout
+                is exceeded, the future fails with a timeout exception.
+            request_timeout_ms: a timeout, in milliseconds, for the termination request.
+            timeout_ms: an alias for *both* the `request_timeout_ms` and
+                `database_admin_timeout_ms` timeout parameters.
+
+        Returns:
+            a `concurrent.futures.Future`, completed with None upon termination.
+
+        Example:
+            >>> drop_futures = [
+            ...     my_astra_db_admin.submit_drop_database(db_id)
+            ...     for db_id in ci_database_ids
+            ... ]
+            >>> for drop_future in drop_futures:
+            ...     drop_future.result()
+            ...
+        """
+
+        _database_admin_timeout_ms, _ = _first_valid_timeout(
+            (database_admin_timeout_ms, "database_admin_timeout_ms"),
+            (timeout_ms, "timeout_ms"),
+            (self.api_options.timeout_options.database_admin_timeout_ms, None),
+        )
+        self.drop_database(
+            id,
+            wait_until_active=False,
+            request_timeout_ms=request_timeout_ms,
+            timeout_ms=timeout_ms,
+        )
+        return self.get_status_poller().wait_for_database_termination(
+            id,
+            timeout_ms=_database_admin_timeout_ms,
+        )
+
+    async def async_submit_drop_database(
+        self,
+        id: str,
+        *,
+        database_admin_timeout_ms: int | None = None,
+        request_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> asyncio.Future[None]:
+        """
+        Drop a database, returning an awaitable for the completion of its termination.
+        Async version of the method, for use in an asyncio context.
+
+        The termination request is issued (and awaited) right away; the returned
+        asyncio future completes when the database is terminated. All pending
+        operations are watched by a single, shared poller (see `get_status_poller`).
+
+        Args:
+            id: The ID of the database to drop, e. g.
+                "01234567-89ab-cdef-0123-456789abcdef".
+            database_admin_timeout_ms: a timeout, in milliseconds, for the database
+                to be terminated once the request is accepted. If the timeout
+                is exceeded, the future fails with a timeout exception.
+            request_timeout_ms: a timeout, in milliseconds, for the termination request.
+            timeout_ms: an alias for *both* the `request_timeout_ms` and
+                `database_admin_timeout_ms` timeout parameters.
+
+        Returns:
+            an `asyncio.Future`, completed with None upon termination.
+
+        Example:
+            >>> async def drop_all(db_ids: list[str]) -> None:
+            ...     await asyncio.gather(*[
+            ...         await my_astra_db_admin.async_submit_drop_database(db_id)
+            ...         for db_id in db_ids
+            ...     ])
+            ...
+            >>> asyncio.run(drop_all(ci_database_ids))
+        """
+
+        _database_admin_timeout_ms, _ = _first_valid_timeout(
+            (database_admin_timeout_ms, "database_admin_timeout_ms"),
+            (timeout_ms, "timeout_ms"),
+            (self.api_options.timeout_options.database_admin_timeout_ms, None),
+        )
+        await self.async_drop_database(
+            id,
+            wait_until_active=False,
+            request_timeout_ms=request_timeout_ms,
+            timeout_ms=timeout_ms,
+        )
+        return asyncio.wrap_future(
+            self.get_status_poller().wait_for_database_termination(
+                id,
+                timeout_ms=_database_admin_timeout_ms,
+            )
+        )
+
     def get_database_admin(
         self,
         api_endpoint_or_id: str | None = None,
@@ -2283,12 +2770,22 @@ class AstraDBAdmin:
         # this cast is required by this DevOps API response being in fact a JSON list:
         fr_response = cast(
             list[dict[str, Any]],
-            self._orgwide_dev_ops_api_commander.request(
-                http_method=HttpMethod.GET,
-                additional_path="regions/serverless",
-                request_params=req_params,
+            cached_admin_lookup(
+                self.api_options.admin_metadata_cache,
+                _dev_ops_cache_key(
+                    AdminMetadataCache.AVAILABLE_REGIONS,
+                    self.api_options,
+                    detail=json.dumps(req_params, sort_keys=True),
+                ),
+                lambda: self._orgwide_dev_ops_api_commander.request(
+                    http_method=HttpMethod.GET,
+                    additional_path="regions/serverless",
+                    request_params=req_params,
+                    timeout_context=timeout_ctx,
+                    caller_function_name="find_available_regions",
+                ),
                 timeout_context=timeout_ctx,
-                caller_function_name="find_available_regions",
+                dev_ops_api=True,
             ),
         )
         logger.info("finished getting available regions (DevOps API)")
@@ -2374,12 +2871,22 @@ class AstraDBAdmin:
         # this cast is required by this DevOps API response being in fact a JSON list:
         fr_response = cast(
             list[dict[str, Any]],
-            await self._orgwide_dev_ops_api_commander.async_request(
-                http_method=HttpMethod.GET,
-                additional_path="regions/serverless",
-                request_params=req_params,
+            await async_cached_admin_lookup(
+                self.api_options.admin_metadata_cache,
+                _dev_ops_cache_key(
+                    AdminMetadataCache.AVAILABLE_REGIONS,
+                    self.api_options,
+                    detail=json.dumps(req_params, sort_keys=True),
+                ),
+                lambda: self._orgwide_dev_ops_api_commander.async_request(
+                    http_method=HttpMethod.GET,
+                    additional_path="regions/serverless",
+                    request_params=req_params,
+                    timeout_context=timeout_ctx,
+                    caller_function_name="async_find_available_regions",
+                ),
                 timeout_context=timeout_ctx,
-                caller_function_name="async_find_available_regions",
+                dev_ops_api=True,
             ),
         )
         logger.info("finished getting available regions (DevOps API), async")
@@ -2741,6 +3248,19 @@ class ProviderQueryingDatabaseAdmin(DatabaseAdmin):
     _api_commander: APICommander
     api_options: FullAPIOptions
 
+    def _providers_cache_key(
+        self,
+        kind: str,
+        body: dict[str, Any],
+    ) -> tuple[str, ...]:
+        # the key of an AdminMetadataCache entry for a provider catalog lookup
+        return admin_metadata_cache_key(
+            kind,
+            token=self.api_options.token.get_token(),
+            base_url=self._api_commander.full_path,
+            detail=json.dumps(body, sort_keys=True),
+        )
+
     def find_embedding_providers(
         self,
         *,
@@ -2803,12 +3323,19 @@ class ProviderQueryingDatabaseAdmin(DatabaseAdmin):
             }
         )
         logger.info("findEmbeddingProviders")
-        fe_response = self._api_commander.request(
-            payload={"findEmbeddingProviders": fep_body},
-            timeout_context=_TimeoutContext(
-                request_ms=_database_admin_timeout_ms, label=_da_label
+        timeout_context = _TimeoutContext(
+            request_ms=_database_admin_timeout_ms, label=_da_label
+        )
+        fe_response = cached_admin_lookup(
+            self.api_options.admin_metadata_cache,
+            self._providers_cache_key(AdminMetadataCache.EMBEDDING_PROVIDERS, fep_body),
+            lambda: self._api_commander.request(
+                payload={"findEmbeddingProviders": fep_body},
+                timeout_context=timeout_context,
+                caller_function_name="find_embedding_providers",
             ),
-            caller_function_name="find_embedding_providers",
+            timeout_context=timeout_context,
+            dev_ops_api=False,
         )
         if "embeddingProviders" not in fe_response.get("status", {}):
             raise UnexpectedDataAPIResponseException(
@@ -2885,12 +3412,19 @@ class ProviderQueryingDatabaseAdmin(DatabaseAdmin):
             }
         )
         logger.info("findEmbeddingProviders, async")
-        fe_response = await self._api_commander.async_request(
-            payload={"findEmbeddingProviders": fep_body},
-            timeout_context=_TimeoutContext(
-                request_ms=_database_admin_timeout_ms, label=_da_label
+        timeout_context = _TimeoutContext(
+            request_ms=_database_admin_timeout_ms, label=_da_label
+        )
+        fe_response = await async_cached_admin_lookup(
+            self.api_options.admin_metadata_cache,
+            self._providers_cache_key(AdminMetadataCache.EMBEDDING_PROVIDERS, fep_body),
+            lambda: self._api_commander.async_request(
+                payload={"findEmbeddingProviders": fep_body},
+                timeout_context=timeout_context,
+                caller_function_name="async_find_embedding_providers",
             ),
-            caller_function_name="async_find_embedding_providers",
+            timeout_context=timeout_context,
+            dev_ops_api=False,
         )
         if "embeddingProviders" not in fe_response.get("status", {}):
             raise UnexpectedDataAPIResponseException(
@@ -2967,12 +3501,19 @@ class ProviderQueryingDatabaseAdmin(DatabaseAdmin):
             }
         )
         logger.info("findRerankingProviders")
-        fr_response = self._api_commander.request(
-            payload={"findRerankingProviders": frp_body},
-            timeout_context=_TimeoutContext(
-                request_ms=_database_admin_timeout_ms, label=_da_label
+        timeout_context = _TimeoutContext(
+            request_ms=_database_admin_timeout_ms, label=_da_label
+        )
+        fr_response = cached_admin_lookup(
+            self.api_options.admin_metadata_cache,
+            self._providers_cache_key(AdminMetadataCache.RERANKING_PROVIDERS, frp_body),
+            lambda: self._api_commander.request(
+                payload={"findRerankingProviders": frp_body},
+                timeout_context=timeout_context,
+                caller_function_name="find_reranking_providers",
             ),
-            caller_function_name="find_reranking_providers",
+            timeout_context=timeout_context,
+            dev_ops_api=False,
         )
         if "rerankingProviders" not in fr_response.get("status", {}):
             raise UnexpectedDataAPIResponseException(
@@ -3053,12 +3594,19 @@ class ProviderQueryingDatabaseAdmin(DatabaseAdmin):
             }
         )
         logger.info("findRerankingProviders, async")
-        fr_response = await self._api_commander.async_request(
-            payload={"findRerankingProviders": frp_body},
-            timeout_context=_TimeoutContext(
-                request_ms=_database_admin_timeout_ms, label=_da_label
+        timeout_context = _TimeoutContext(
+            request_ms=_database_admin_timeout_ms, label=_da_label
+        )
+        fr_response = await async_cached_admin_lookup(
+            self.api_options.admin_metadata_cache,
+            self._providers_cache_key(AdminMetadataCache.RERANKING_PROVIDERS, frp_body),
+            lambda: self._api_commander.async_request(
+                payload={"findRerankingProviders": frp_body},
+                timeout_context=timeout_context,
+                caller_function_name="async_find_reranking_providers",
             ),
-            caller_function_name="async_find_reranking_providers",
+            timeout_context=timeout_context,
+            dev_ops_api=False,
         )
         if "rerankingProviders" not in fr_response.get("status", {}):
             raise UnexpectedDataAPIResponseException(
@@ -3245,6 +3793,7 @@ class AstraDBDatabaseAdmin(ProviderQueryingDatabaseAdmin):
             event_observers=self.api_options.event_observers,
             spawner=self,
             ca_cert_path=self.api_options.ca_cert_path,
+            connection_reuse_mode=self.api_options.connection_reuse_mode,
         )
         return api_commander
 
@@ -3274,6 +3823,7 @@ class AstraDBDatabaseAdmin(ProviderQueryingDatabaseAdmin):
             event_observers=self.api_options.event_observers,
             spawner=self,
             ca_cert_path=self.api_options.ca_cert_path,
+            connection_reuse_mode=self.api_options.connection_reuse_mode,
         )
         return dev_ops_commander
 
@@ -3701,11 +4251,18 @@ class AstraDBDatabaseAdmin(ProviderQueryingDatabaseAdmin):
             "DevOps API returned from creating keyspace "
             f"'{name}' on '{self._database_id}'"
         )
+        _invalidate_cached_database_info(self.api_options, self._database_id)
         if wait_until_active:
             last_status_seen = DatabaseStatus.MAINTENANCE.value
+            polling_tracker = _PollingTracker(
+                self.api_options.polling_strategy,
+                target=KEYSPACE_POLLING_TARGET,
+                status=last_status_seen,
+                deadline_ms=timeout_manager.deadline_ms,
+            )
             while last_status_seen == DatabaseStatus.MAINTENANCE.value:
                 logger.info(f"sleeping to poll for status of '{self._database_id}'")
-                time.sleep(DEV_OPS_KEYSPACE_POLL_INTERVAL_S)
+                time.sleep(polling_tracker.next_interval_s())
                 last_status_seen = (
                     self._astra_db_admin.with_options(
                         api_options=self.api_options,
@@ -3720,11 +4277,13 @@ class AstraDBDatabaseAdmin(ProviderQueryingDatabaseAdmin):
                     )
                     .status
                 )
+                polling_tracker.record(last_status_seen)
             if last_status_seen != DatabaseStatus.ACTIVE.value:
                 raise DevOpsAPIException(
                     f"Database entered unexpected status {last_status_seen} after MAINTENANCE."
                 )
-            # is the keyspace found?
+            # is the keyspace found? (lookups during polling may have been cached)
+            _invalidate_cached_database_info(self.api_options, self._database_id)
             if name not in self.list_keyspaces():
                 raise DevOpsAPIException("Could not create the keyspace.")
         logger.info(
@@ -3837,13 +4396,22 @@ class AstraDBDatabaseAdmin(ProviderQueryingDatabaseAdmin):
             f"DevOps API returned from creating keyspace "
             f"'{name}' on '{self._database_id}', async"
         )
+        await _async_invalidate_cached_database_info(
+            self.api_options, self._database_id
+        )
         if wait_until_active:
             last_status_seen = DatabaseStatus.MAINTENANCE.value
+            polling_tracker = _PollingTracker(
+                self.api_options.polling_strategy,
+                target=KEYSPACE_POLLING_TARGET,
+                status=last_status_seen,
+                deadline_ms=timeout_manager.deadline_ms,
+            )
             while last_status_seen == DatabaseStatus.MAINTENANCE.value:
                 logger.info(
                     f"sleeping to poll for status of '{self._database_id}', async"
                 )
-                await asyncio.sleep(DEV_OPS_KEYSPACE_POLL_INTERVAL_S)
+                await asyncio.sleep(polling_tracker.next_interval_s())
                 last_db_info = await self._astra_db_admin.with_options(
                     api_options=self.api_options,
                 )._async_database_info_ctx(
@@ -3855,11 +4423,15 @@ class AstraDBDatabaseAdmin(ProviderQueryingDatabaseAdmin):
                     caller_function_name="async_create_keyspace",
                 )
                 last_status_seen = last_db_info.status
+                polling_tracker.record(last_status_seen)
             if last_status_seen != DatabaseStatus.ACTIVE.value:
                 raise DevOpsAPIException(
                     f"Database entered unexpected status {last_status_seen} after MAINTENANCE."
                 )
-            # is the keyspace found?
+            # is the keyspace found? (lookups during polling may have been cached)
+            await _async_invalidate_cached_database_info(
+                self.api_options, self._database_id
+            )
             if name not in await self.async_list_keyspaces():
                 raise DevOpsAPIException("Could not create the keyspace.")
         logger.info(
@@ -3965,11 +4537,18 @@ class AstraDBDatabaseAdmin(ProviderQueryingDatabaseAdmin):
             "DevOps API returned from dropping keyspace "
             f"'{name}' on '{self._database_id}'"
         )
+        _invalidate_cached_database_info(self.api_options, self._database_id)
         if wait_until_active:
             last_status_seen = DatabaseStatus.MAINTENANCE.value
+            polling_tracker = _PollingTracker(
+                self.api_options.polling_strategy,
+                target=KEYSPACE_POLLING_TARGET,
+                status=last_status_seen,
+                deadline_ms=timeout_manager.deadline_ms,
+            )
             while last_status_seen == DatabaseStatus.MAINTENANCE.value:
                 logger.info(f"sleeping to poll for status of '{self._database_id}'")
-                time.sleep(DEV_OPS_KEYSPACE_POLL_INTERVAL_S)
+                time.sleep(polling_tracker.next_interval_s())
                 last_status_seen = (
                     self._astra_db_admin.with_options(
                         api_options=self.api_options,
@@ -3984,11 +4563,13 @@ class AstraDBDatabaseAdmin(ProviderQueryingDatabaseAdmin):
                     )
                     .status
                 )
+                polling_tracker.record(last_status_seen)
             if last_status_seen != DatabaseStatus.ACTIVE.value:
                 raise DevOpsAPIException(
                     f"Database entered unexpected status {last_status_seen} after MAINTENANCE."
                 )
-            # is the keyspace found?
+            # is the keyspace found? (lookups during polling may have been cached)
+            _invalidate_cached_database_info(self.api_options, self._database_id)
             if name in self.list_keyspaces():
                 raise DevOpsAPIException("Could not drop the keyspace.")
         logger.info(
@@ -4093,13 +4674,22 @@ class AstraDBDatabaseAdmin(ProviderQueryingDatabaseAdmin):
             f"DevOps API returned from dropping keyspace "
             f"'{name}' on '{self._database_id}', async"
         )
+        await _async_invalidate_cached_database_info(
+            self.api_options, self._database_id
+        )
         if wait_until_active:
             last_status_seen = DatabaseStatus.MAINTENANCE.value
+            polling_tracker = _PollingTracker(
+                self.api_options.polling_strategy,
+                target=KEYSPACE_POLLING_TARGET,
+                status=last_status_seen,
+                deadline_ms=timeout_manager.deadline_ms,
+            )
             while last_status_seen == DatabaseStatus.MAINTENANCE.value:
                 logger.info(
                     f"sleeping to poll for status of '{self._database_id}', async"
                 )
-                await asyncio.sleep(DEV_OPS_KEYSPACE_POLL_INTERVAL_S)
+                await asyncio.sleep(polling_tracker.next_interval_s())
                 last_db_info = await self._astra_db_admin.with_options(
                     api_options=self.api_options,
                 )._async_database_info_ctx(
@@ -4111,11 +4701,15 @@ class AstraDBDatabaseAdmin(ProviderQueryingDatabaseAdmin):
                     caller_function_name="async_drop_keyspace",
                 )
                 last_status_seen = last_db_info.status
+                polling_tracker.record(last_status_seen)
             if last_status_seen != DatabaseStatus.ACTIVE.value:
                 raise DevOpsAPIException(
                     f"Database entered unexpected status {last_status_seen} after MAINTENANCE."
                 )
-            # is the keyspace found?
+            # is the keyspace found? (lookups during polling may have been cached)
+            await _async_invalidate_cached_database_info(
+                self.api_options, self._database_id
+            )
             if name in await self.async_list_keyspaces():
                 raise DevOpsAPIException("Could not drop the keyspace.")
         logger.info(
@@ -4123,6 +4717,235 @@ class AstraDBDatabaseAdmin(ProviderQueryingDatabaseAdmin):
             f"'{self._database_id}' (DevOps API), async"
         )
 
+    def submit_create_keyspace(
+        self,
+        name: str,
+        *,
+        keyspace_admin_timeout_ms: int | None = None,
+        request_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> Future[None]:
+        """
+        Create a keyspace in this database, returning a future for its availability.
+
+        The creation request is issued right away; the returned future completes
+        when the keyspace is there and the database is ACTIVE again. Pending
+        operations are watched by the shared poller of the AstraDBAdmin
+        that spawned this object (see `AstraDBAdmin.get_status_poller`).
+
+        Args:
+            name: the keyspace name.
+            keyspace_admin_timeout_ms: a timeout, in milliseconds, for the keyspace
+                to be available once the creation request is accepted. If the
+                timeout is exceeded, the future fails with a timeout exception.
+            request_timeout_ms: a timeout, in milliseconds, for the creation request.
+            timeout_ms: an alias for *both* the `request_timeout_ms` and
+                `keyspace_admin_timeout_ms` timeout parameters.
+
+        Returns:
+            a `concurrent.futures.Future`, completed with None when the keyspace
+            is available.
+
+        Example:
+            >>> ks_future = my_db_admin.submit_create_keyspace("that_other_one")
+            >>> ks_future.result()
+            >>> my_db_admin.list_keyspaces()
+            ['default_keyspace', 'that_other_one']
+        """
+
+        _keyspace_admin_timeout_ms, _ = _first_valid_timeout(
+            (keyspace_admin_timeout_ms, "keyspace_admin_timeout_ms"),
+            (timeout_ms, "timeout_ms"),
+            (self.api_options.timeout_options.keyspace_admin_timeout_ms, None),
+        )
+        self.create_keyspace(
+            name,
+            wait_until_active=False,
+            request_timeout_ms=request_timeout_ms,
+            timeout_ms=timeout_ms,
+        )
+        return _chain_future(
+            self._astra_db_admin.get_status_poller().wait_for_keyspace_creation(
+                self._database_id,
+                name,
+                timeout_ms=_keyspace_admin_timeout_ms,
+            ),
+            None,
+        )
+
+    async def async_submit_create_keyspace(
+        self,
+        name: str,
+        *,
+        keyspace_admin_timeout_ms: int | None = None,
+        request_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> asyncio.Future[None]:
+        """
+        Create a keyspace in this database, returning an awaitable for its
+        availability. Async version of the method, for use in an asyncio context.
+
+        The creation request is issued (and awaited) right away; the returned
+        asyncio future completes when the keyspace is there and the database
+        is ACTIVE again. Pending operations are watched by the shared poller of
+        the AstraDBAdmin that spawned this object.
+
+        Args:
+            name: the keyspace name.
+            keyspace_admin_timeout_ms: a timeout, in milliseconds, for the keyspace
+                to be available once the creation request is accepted. If the
+                timeout is exceeded, the future fails with a timeout exception.
+            request_timeout_ms: a timeout, in milliseconds, for the creation request.
+            timeout_ms: an alias for *both* the `request_timeout_ms` and
+                `keyspace_admin_timeout_ms` timeout parameters.
+
+        Returns:
+            an `asyncio.Future`, completed with None when the keyspace is available.
+
+        Example:
+            >>> async def create_ks(name: str) -> None:
+            ...     await (await my_db_admin.async_submit_create_keyspace(name))
+            ...
+            >>> asyncio.run(create_ks("that_other_one"))
+        """
+
+        _keyspace_admin_timeout_ms, _ = _first_valid_timeout(
+            (keyspace_admin_timeout_ms, "keyspace_admin_timeout_ms"),
+            (timeout_ms, "timeout_ms"),
+            (self.api_options.timeout_options.keyspace_admin_timeout_ms, None),
+        )
+        await self.async_create_keyspace(
+            name,
+            wait_until_active=False,
+            request_timeout_ms=request_timeout_ms,
+            timeout_ms=timeout_ms,
+        )
+        return asyncio.wrap_future(
+            _chain_future(
+                self._astra_db_admin.get_status_poller().wait_for_keyspace_creation(
+                    self._database_id,
+                    name,
+                    timeout_ms=_keyspace_admin_timeout_ms,
+                ),
+                None,
+            )
+        )
+
+    def submit_drop_keyspace(
+        self,
+        name: str,
+        *,
+        keyspace_admin_timeout_ms: int | None = None,
+        request_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> Future[None]:
+        """
+        Delete a keyspace from the database, returning a future for the completion
+        of the deletion.
+
+        The deletion request is issued right away; the returned future completes
+        when the keyspace is gone and the database is ACTIVE again. Pending
+        operations are watched by the shared poller of the AstraDBAdmin
+        that spawned this object (see `AstraDBAdmin.get_status_poller`).
+
+        Args:
+            name: the keyspace to delete.
+            keyspace_admin_timeout_ms: a timeout, in milliseconds, for the keyspace
+                to be deleted once the request is accepted. If the
+                timeout is exceeded, the future fails with a timeout exception.
+            request_timeout_ms: a timeout, in milliseconds, for the deletion request.
+            timeout_ms: an alias for *both* the `request_timeout_ms` and
+                `keyspace_admin_timeout_ms` timeout parameters.
+
+        Returns:
+            a `concurrent.futures.Future`, completed with None upon deletion.
+
+        Example:
+            >>> ks_future = my_db_admin.submit_drop_keyspace("that_other_one")
+            >>> ks_future.result()
+            >>> my_db_admin.list_keyspaces()
+            ['default_keyspace']
+        """
+
+        _keyspace_admin_timeout_ms, _ = _first_valid_timeout(
+            (keyspace_admin_timeout_ms, "keyspace_admin_timeout_ms"),
+            (timeout_ms, "timeout_ms"),
+            (self.api_options.timeout_options.keyspace_admin_timeout_ms, None),
+        )
+        self.drop_keyspace(
+            name,
+            wait_until_active=False,
+            request_timeout_ms=request_timeout_ms,
+            timeout_ms=timeout_ms,
+        )
+        return _chain_future(
+            self._astra_db_admin.get_status_poller().wait_for_keyspace_deletion(
+                self._database_id,
+                name,
+                timeout_ms=_keyspace_admin_timeout_ms,
+            ),
+            None,
+        )
+
+    async def async_submit_drop_keyspace(
+        self,
+        name: str,
+        *,
+        keyspace_admin_timeout_ms: int | None = None,
+        request_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> asyncio.Future[None]:
+        """
+        Delete a keyspace from the database, returning an awaitable for the
+        completion of the deletion.
+        Async version of the method, for use in an asyncio context.
+
+        The deletion request is issued (and awaited) right away; the returned
+        asyncio future completes when the keyspace is gone and the database
+        is ACTIVE again. Pending operations are watched by the shared poller of
+        the AstraDBAdmin that spawned this object.
+
+        Args:
+            name: the keyspace to delete.
+            keyspace_admin_timeout_ms: a timeout, in milliseconds, for the keyspace
+                to be deleted once the request is accepted. If the
+                timeout is exceeded, the future fails with a timeout exception.
+            request_timeout_ms: a timeout, in milliseconds, for the deletion request.
+            timeout_ms: an alias for *both* the `request_timeout_ms` and
+                `keyspace_admin_timeout_ms` timeout parameters.
+
+        Returns:
+            an `asyncio.Future`, completed with None upon deletion.
+
+        Example:
+            >>> async def drop_ks(name: str) -> None:
+            ...     await (await my_db_admin.async_submit_drop_keyspace(name))
+            ...
+            >>> asyncio.run(drop_ks("that_other_one"))
+        """
+
+        _keyspace_admin_timeout_ms, _ = _first_valid_timeout(
+            (keyspace_admin_timeout_ms, "keyspace_admin_timeout_ms"),
+            (timeout_ms, "timeout_ms"),
+            (self.api_options.timeout_options.keyspace_admin_timeout_ms, None),
+        )
+        await self.async_drop_keyspace(
+            name,
+            wait_until_active=False,
+            request_timeout_ms=request_timeout_ms,
+            timeout_ms=timeout_ms,
+        )
+        return asyncio.wrap_future(
+            _chain_future(
+                self._astra_db_admin.get_status_poller().wait_for_keyspace_deletion(
+                    self._database_id,
+                    name,
+                    timeout_ms=_keyspace_admin_timeout_ms,
+                ),
+                None,
+            )
+        )
+
     def drop(
         self,
         *,
@@ -4462,6 +5285,7 @@ class DataAPIDatabaseAdmin(ProviderQueryingDatabaseAdmin):
             event_observers=self.api_options.event_observers,
             spawner=self,
             ca_cert_path=self.api_options.ca_cert_path,
+            connection_reuse_mode=self.api_options.connection_reuse_mode,
         )
         return api_commander
 
@@ -0,0 +1,780 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from astrapy.constants import DatabaseStatus
+from astrapy.exceptions import DevOpsAPIException, DevOpsAPITimeoutException
+from astrapy.settings.defaults import (
+    DEV_OPS_DATABASE_POLL_INTERVAL_S,
+    DEV_OPS_KEYSPACE_POLL_INTERVAL_S,
+)
+
+if TYPE_CHECKING:
+    from astrapy.admin.admin import AstraDBAdmin
+    from astrapy.info import AstraDBAdminDatabaseInfo
+
+
+logger = logging.getLogger(__name__)
+
+# the targets of a polling operation
+DATABASE_POLLING_TARGET = "database"
+KEYSPACE_POLLING_TARGET = "keyspace"
+
+# the poller gives up on its operations after this many failed checks in a row
+MAX_CONSECUTIVE_POLL_FAILURES = 3
+
+# the statuses a database goes through while being created
+_CREATING_DATABASE_STATUSES = {
+    DatabaseStatus.ASSOCIATING.value,
+    DatabaseStatus.INITIALIZING.value,
+    DatabaseStatus.PENDING.value,
+}
+
+
+@dataclass(frozen=True)
+class PollingState:
+    """
+    The state of an operation waiting for a database to change status, as seen
+    by a `PollingStrategy` when choosing how long to wait before the next check.
+
+    Attributes:
+        target: what the operation waits for: "database" (creation/termination
+            of a database) or "keyspace" (creation/deletion of a keyspace).
+        status: the last status seen for the database.
+        polls: the number of status checks done so far.
+        status_polls: the number of status checks done since the current status
+            was first seen.
+        elapsed_s: the time since the waiting started, in seconds.
+        status_elapsed_s: the time since the current status was first seen, in seconds.
+        remaining_s: the time left before the operation times out, in seconds
+            (None if there is no timeout).
+    """
+
+    target: str
+    status: str
+    polls: int
+    status_polls: int
+    elapsed_s: float
+    status_elapsed_s: float
+    remaining_s: float | None
+
+
+class PollingStrategy(ABC):
+    """
+    A strategy choosing the interval between successive status checks while
+    waiting for a database or keyspace operation to complete (e.g. in
+    `AstraDBAdmin.create_database` with `wait_until_active=True`).
+
+    A strategy is set through the `polling_strategy` setting of the API options.
+    Strategies may be stateful (e.g. learning from the transitions they observe):
+    a single instance can be shared by many operations and must be thread-safe.
+    """
+
+    @abstractmethod
+    def next_interval_s(self, state: PollingState) -> float:
+        """
+        Return the time to wait, in seconds, before the next status check.
+
+        Args:
+            state: a PollingState describing the operation being waited for.
+
+        Returns:
+            a non-negative number of seconds.
+        """
+        ...
+
+    def observe_transition(
+        self,
+        target: str,
+        from_status: str,
+        to_status: str,
+        duration_s: float,
+    ) -> None:
+        """
+        Receive notice of an observed status transition. The default
+        implementation does nothing.
+
+        Args:
+            target: the target of the operation ("database" or "keyspace").
+            from_status: the status left.
+            to_status: the status entered.
+            duration_s: the time spent in `from_status`, in seconds, as observed
+                (i.e. at the polling resolution).
+        """
+        return None
+
+
+class FixedPollingStrategy(PollingStrategy):
+    """
+    A polling strategy with constant intervals. The defaults reproduce the
+    behavior of astrapy when no strategy is set.
+
+    Args:
+        database_interval_s: the interval between checks when waiting for a
+            database to be created or terminated, in seconds.
+        keyspace_interval_s: the interval between checks when waiting for a
+            keyspace to be created or deleted, in seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        database_interval_s: float = DEV_OPS_DATABASE_POLL_INTERVAL_S,
+        keyspace_interval_s: float = DEV_OPS_KEYSPACE_POLL_INTERVAL_S,
+    ) -> None:
+        self.database_interval_s = database_interval_s
+        self.keyspace_interval_s = keyspace_interval_s
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(database_interval_s={self.database_interval_s}"
+            f", keyspace_interval_s={self.keyspace_interval_s})"
+        )
+
+    def next_interval_s(self, state: PollingState) -> float:
+        if state.target == KEYSPACE_POLLING_TARGET:
+            return self.keyspace_interval_s
+        return self.database_interval_s
+
+
+class ExponentialPollingStrategy(PollingStrategy):
+    """
+    A polling strategy with exponentially growing intervals, restarting from
+    the initial interval whenever the database changes status.
+
+    Args:
+        initial_interval_s: the first interval, in seconds.
+        factor: the growth factor between successive intervals.
+        max_interval_s: the cap to the intervals, in seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_interval_s: float = 1.0,
+        factor: float = 2.0,
+        max_interval_s: float = DEV_OPS_DATABASE_POLL_INTERVAL_S,
+    ) -> None:
+        if initial_interval_s <= 0 or factor < 1 or max_interval_s <= 0:
+            raise ValueError(
+                "Exponential polling requires positive intervals and a factor >= 1."
+            )
+        self.initial_interval_s = initial_interval_s
+        self.factor = factor
+        self.max_interval_s = max_interval_s
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(initial_interval_s={self.initial_interval_s}"
+            f", factor={self.factor}, max_interval_s={self.max_interval_s})"
+        )
+
+    def next_interval_s(self, state: PollingState) -> float:
+        # (capping the exponent avoids overflows for very long waits)
+        exponent = min(state.status_polls, 64)
+        return min(self.initial_interval_s * self.factor**exponent, self.max_interval_s)
+
+
+class AdaptivePollingStrategy(PollingStrategy):
+    """
+    A polling strategy learning from the status transitions it observes.
+
+    For each target and status, the strategy keeps a running estimate of the
+    time spent in that status before a transition. While waiting, it polls
+    sparsely until the expected transition time approaches, then densely;
+    for statuses not observed yet, it uses exponentially growing intervals.
+    A single instance should be shared across operations (e.g. by setting it in
+    the API options of the client), so that what is learned is reused.
+
+    Args:
+        min_interval_s: the shortest interval between checks, in seconds.
+        max_interval_s: the longest interval between checks, in seconds.
+        smoothing: the weight (between 0 and 1) of each new observation in the
+            running estimate of the transition times.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_interval_s: float = 1.0,
+        max_interval_s: float = DEV_OPS_DATABASE_POLL_INTERVAL_S,
+        smoothing: float = 0.3,
+    ) -> None:
+        if min_interval_s <= 0 or max_interval_s < min_interval_s:
+            raise ValueError(
+                "Adaptive polling requires 0 < min_interval_s <= max_interval_s."
+            )
+        if not 0 < smoothing <= 1:
+            raise ValueError("Adaptive polling requires 0 < smoothing <= 1.")
+        self.min_interval_s = min_interval_s
+        self.max_interval_s = max_interval_s
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        self._expected_durations_s: dict[tuple[str, str], float] = {}
+        self._fallback = ExponentialPollingStrategy(
+            initial_interval_s=min_interval_s,
+            max_interval_s=max_interval_s,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(min_interval_s={self.min_interval_s}"
+            f", max_interval_s={self.max_interval_s}, smoothing={self.smoothing})"
+        )
+
+    def expected_duration_s(self, target: str, status: str) -> float | None:
+        """
+        Return the current estimate of the time spent in a status, in seconds.
+
+        Args:
+            target: the target of the operation ("database" or "keyspace").
+            status: a database status.
+
+        Returns:
+            the estimated duration, or None if no transitions from the status
+            have been observed yet.
+        """
+
+        with self._lock:
+            return self._expected_durations_s.get((target, status))
+
+    def observe_transition(
+        self,
+        target: str,
+        from_status: str,
+        to_status: str,
+        duration_s: float,
+    ) -> None:
+        with self._lock:
+            previous = self._expected_durations_s.get((target, from_status))
+            if previous is None:
+                self._expected_durations_s[(target, from_status)] = duration_s
+            else:
+                self._expected_durations_s[(target, from_status)] = (
+                    1 - self.smoothing
+                ) * previous + self.smoothing * duration_s
+
+    def next_interval_s(self, state: PollingState) -> float:
+        expected_s = self.expected_duration_s(state.target, state.status)
+        if expected_s is None:
+            return self._fallback.next_interval_s(state)
+        time_to_expected_s = expected_s - state.status_elapsed_s
+        return min(max(time_to_expected_s, self.min_interval_s), self.max_interval_s)
+
+
+class DeadlineAwarePollingStrategy(PollingStrategy):
+    """
+    A polling strategy wrapping another one, shortening the intervals so as
+    to make a last status check right before the operation would time out
+    (instead of sleeping past the deadline).
+
+    Args:
+        base_strategy: the polling strategy to wrap. If omitted,
+            a default `ExponentialPollingStrategy` is used.
+        margin_s: how long before the deadline the last check is done, in seconds.
+    """
+
+    def __init__(
+        self,
+        base_strategy: PollingStrategy | None = None,
+        *,
+        margin_s: float = 1.0,
+    ) -> None:
+        self.base_strategy = (
+            base_strategy if base_strategy is not None else ExponentialPollingStrategy()
+        )
+        self.margin_s = margin_s
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.base_strategy}, margin_s={self.margin_s})"
+        )
+
+    def next_interval_s(self, state: PollingState) -> float:
+        interval_s = self.base_strategy.next_interval_s(state)
+        if state.remaining_s is None:
+            return interval_s
+        return max(min(interval_s, state.remaining_s - self.margin_s), 0.0)
+
+    def observe_transition(
+        self,
+        target: str,
+        from_status: str,
+        to_status: str,
+        duration_s: float,
+    ) -> None:
+        self.base_strategy.observe_transition(
+            target, from_status, to_status, duration_s
+        )
+
+
+class _PollingTracker:
+    """
+    Keep track of the status checks of a single waiting operation, to ask
+    a polling strategy for the intervals and to notify it of transitions.
+
+    Args:
+        polling_strategy: the strategy (None for the default fixed intervals).
+        target: the target of the operation ("database" or "keyspace").
+        status: the status the database is assumed to be in at the start.
+        deadline_ms: the optional wall-clock deadline of the operation,
+            in milliseconds (as in `MultiCallTimeoutManager.deadline_ms`).
+    """
+
+    def __init__(
+        self,
+        polling_strategy: PollingStrategy | None,
+        *,
+        target: str,
+        status: str,
+        deadline_ms: int | None,
+    ) -> None:
+        self.polling_strategy = (
+            polling_strategy if polling_strategy is not None else FixedPollingStrategy()
+        )
+        self.target = target
+        self.status = status
+        self.deadline_ms = deadline_ms
+        self.started_s = time.monotonic()
+        self.status_since_s = self.started_s
+        self.polls = 0
+        self.status_polls = 0
+
+    def state(self) -> PollingState:
+        now_s = time.monotonic()
+        return PollingState(
+            target=self.target,
+            status=self.status,
+            polls=self.polls,
+            status_polls=self.status_polls,
+            elapsed_s=now_s - self.started_s,
+            status_elapsed_s=now_s - self.status_since_s,
+            remaining_s=(
+                None
+                if self.deadline_ms is None
+                else max(self.deadline_ms / 1000.0 - time.time(), 0.0)
+            ),
+        )
+
+    def next_interval_s(self) -> float:
+        return max(self.polling_strategy.next_interval_s(self.state()), 0.0)
+
+    def record(self, status: str) -> None:
+        now_s = time.monotonic()
+        self.polls += 1
+        if status != self.status:
+            self.polling_strategy.observe_transition(
+                self.target,
+                self.status,
+                status,
+                now_s - self.status_since_s,
+            )
+            self.status = status
+            self.status_since_s = now_s
+            self.status_polls = 0
+        else:
+            self.status_polls += 1
+
+
+class _StatusWaiter:
+    """A pending wait of a DatabaseStatusPoller, with its completion criterion."""
+
+    def __init__(
+        self,
+        *,
+        database_id: str,
+        kind: str,
+        keyspace: str | None,
+        tracker: _PollingTracker,
+        timeout_ms: int | None,
+    ) -> None:
+        self.database_id = database_id
+        self.kind = kind
+        self.keyspace = keyspace
+        self.tracker = tracker
+        self.timeout_ms = timeout_ms
+        self.future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+
+    def description(self) -> str:
+        if self.kind in {"create_keyspace", "drop_keyspace"}:
+            return f"{self.kind} '{self.keyspace}' on '{self.database_id}'"
+        return f"{self.kind} '{self.database_id}'"
+
+    def check(self, db_info: AstraDBAdminDatabaseInfo | None) -> None:
+        """Inspect a fresh database info (None if not found), completing if done."""
+
+        status = DatabaseStatus.TERMINATED.value if db_info is None else db_info.status
+        if db_info is None and self.kind != "drop_database":
+            # the database may not be listed yet: keep waiting
+            self._check_deadline()
+            return
+        self.tracker.record(status)
+        if self.kind == "create_database":
+            if status == DatabaseStatus.ACTIVE.value:
+                self._complete(db_info)
+            elif status not in _CREATING_DATABASE_STATUSES:
+                self._fail(f"Database entered unexpected status {status}")
+        elif self.kind == "drop_database":
+            if status == DatabaseStatus.TERMINATED.value:
+                self._complete(None)
+            elif status not in {
+                DatabaseStatus.ACTIVE.value,
+                DatabaseStatus.TERMINATING.value,
+            }:
+                self._fail(f"Database entered unexpected status {status}")
+        else:
+            assert db_info is not None
+            keyspace_found = self.keyspace in db_info.keyspaces
+            wanted = self.kind == "create_keyspace"
+            if status == DatabaseStatus.ACTIVE.value and keyspace_found == wanted:
+                self._complete(db_info)
+            elif status not in {
+                DatabaseStatus.ACTIVE.value,
+                DatabaseStatus.MAINTENANCE.value,
+            }:
+                self._fail(f"Database entered unexpected status {status}")
+        if not self.future.done():
+            self._check_deadline()
+
+    def _check_deadline(self) -> None:
+        deadline_ms = self.tracker.deadline_ms
+        if deadline_ms is not None and time.time() * 1000 >= deadline_ms:
+            self._complete_with_exception(
+                DevOpsAPITimeoutException(
+                    text=(
+                        f"Timed out waiting for {self.description()} to complete "
+                        f"(timeout honoured: {self.timeout_ms} ms)"
+                    ),
+                    timeout_type="generic",
+                    endpoint=None,
+                    raw_payload=None,
+                )
+            )
+
+    def _fail(self, reason: str) -> None:
+        self._complete_with_exception(
+            DevOpsAPIException(f"{reason} while waiting for {self.description()}.")
+        )
+
+    def _complete(self, result: Any) -> None:
+        # (the poller may have been closed in the meantime)
+        try:
+            self.future.set_result(result)
+        except concurrent.futures.InvalidStateError:
+            pass
+
+    def _complete_with_exception(self, exception: BaseException) -> None:
+        try:
+            self.future.set_exception(exception)
+        except concurrent.futures.InvalidStateError:
+            pass
+
+
+class DatabaseStatusPoller:
+    """
+    A poller watching many pending database and keyspace operations at once.
+
+    Each wait method registers an operation and returns immediately
+    a `concurrent.futures.Future`, completed when the operation is done (or
+    failed, or timed out). A single background thread checks all operations
+    with one `list_databases` request per cycle, whatever their number, thus
+    making it practical to provision many databases or keyspaces concurrently.
+    For use in asyncio code, the futures can be awaited after wrapping them
+    with `asyncio.wrap_future`.
+
+    The interval between cycles is the shortest of the intervals chosen by the
+    polling strategy for the operations being waited for. The poller thread
+    is started on the first wait and stopped by `close()` (also invoked when
+    using the poller as a context manager).
+
+    This class is not meant for direct instantiation by the user: poller objects
+    are obtained with the `get_status_poller` method of AstraDBAdmin.
+
+    Args:
+        astra_db_admin: the AstraDBAdmin issuing the `list_databases` requests.
+        polling_strategy: the polling strategy to use. If omitted, the strategy
+            in the admin's API options (or a default one) is used.
+
+    Example:
+        >>> my_poller = my_astra_db_admin.get_status_poller()
+        >>> db_futures = [
+        ...     my_astra_db_admin.submit_create_database(
+        ...         f"ephemeral_{i}",
+        ...         cloud_provider="aws",
+        ...         region="us-east-2",
+        ...     )
+        ...     for i in range(10)
+        ... ]
+        >>> db_admins = [db_future.result() for db_future in db_futures]
+    """
+
+    def __init__(
+        self,
+        astra_db_admin: AstraDBAdmin,
+        *,
+        polling_strategy: PollingStrategy | None = None,
+    ) -> None:
+        self.astra_db_admin = astra_db_admin
+        self.polling_strategy = (
+            polling_strategy
+            if polling_strategy is not None
+            else astra_db_admin.api_options.polling_strategy
+        )
+        self._condition = threading.Condition()
+        self._waiters: list[_StatusWaiter] = []
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._consecutive_failures = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(polling_strategy={self.polling_strategy})"
+
+    def __enter__(self) -> DatabaseStatusPoller:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stop the poller thread. Operations still being waited for
+        get a `DevOpsAPIException`.
+        """
+
+        with self._condition:
+            self._closed = True
+            pending_waiters = self._waiters
+            self._waiters = []
+            self._condition.notify_all()
+        for waiter in pending_waiters:
+            waiter._fail("Poller closed")
+
+    def wait_for_database_creation(
+        self,
+        id: str,
+        *,
+        timeout_ms: int | None = None,
+    ) -> concurrent.futures.Future[AstraDBAdminDatabaseInfo]:
+        """
+        Wait for a newly-created database to become ACTIVE.
+
+        Args:
+            id: the ID of the database.
+            timeout_ms: an optional timeout, in milliseconds, for the wait.
+
+        Returns:
+            a future for the AstraDBAdminDatabaseInfo of the active database.
+        """
+
+        return self._watch(
+            id,
+            kind="create_database",
+            keyspace=None,
+            initial_status=DatabaseStatus.PENDING.value,
+            target=DATABASE_POLLING_TARGET,
+            timeout_ms=timeout_ms,
+        )
+
+    def wait_for_database_termination(
+        self,
+        id: str,
+        *,
+        timeout_ms: int | None = None,
+    ) -> concurrent.futures.Future[None]:
+        """
+        Wait for a database being dropped to be terminated.
+
+        Args:
+            id: the ID of the database.
+            timeout_ms: an optional timeout, in milliseconds, for the wait.
+
+        Returns:
+            a future completed (with None) when the database is terminated.
+        """
+
+        return self._watch(
+            id,
+            kind="drop_database",
+            keyspace=None,
+            initial_status=DatabaseStatus.TERMINATING.value,
+            target=DATABASE_POLLING_TARGET,
+            timeout_ms=timeout_ms,
+        )
+
+    def wait_for_keyspace_creation(
+        self,
+        id: str,
+        keyspace: str,
+        *,
+        timeout_ms: int | None = None,
+    ) -> concurrent.futures.Future[AstraDBAdminDatabaseInfo]:
+        """
+        Wait for a keyspace being created to be available, with its database ACTIVE.
+
+        Args:
+            id: the ID of the database.
+            keyspace: the name of the keyspace.
+            timeout_ms: an optional timeout, in milliseconds, for the wait.
+
+        Returns:
+            a future for the AstraDBAdminDatabaseInfo of the database.
+        """
+
+        return self._watch(
+            id,
+            kind="create_keyspace",
+            keyspace=keyspace,
+            initial_status=DatabaseStatus.MAINTENANCE.value,
+            target=KEYSPACE_POLLING_TARGET,
+            timeout_ms=timeout_ms,
+        )
+
+    def wait_for_keyspace_deletion(
+        self,
+        id: str,
+        keyspace: str,
+        *,
+        timeout_ms: int | None = None,
+    ) -> concurrent.futures.Future[AstraDBAdminDatabaseInfo]:
+        """
+        Wait for a keyspace being dropped to be gone, with its database ACTIVE.
+
+        Args:
+            id: the ID of the database.
+            keyspace: the name of the keyspace.
+            timeout_ms: an optional timeout, in milliseconds, for the wait.
+
+        Returns:
+            a future for the AstraDBAdminDatabaseInfo of the database.
+        """
+
+        return self._watch(
+            id,
+            kind="drop_keyspace",
+            keyspace=keyspace,
+            initial_status=DatabaseStatus.MAINTENANCE.value,
+            target=KEYSPACE_POLLING_TARGET,
+            timeout_ms=timeout_ms,
+        )
+
+    def _watch(
+        self,
+        id: str,
+        *,
+        kind: str,
+        keyspace: str | None,
+        initial_status: str,
+        target: str,
+        timeout_ms: int | None,
+    ) -> concurrent.futures.Future[Any]:
+        waiter = _StatusWaiter(
+            database_id=id,
+            kind=kind,
+            keyspace=keyspace,
+            tracker=_PollingTracker(
+                self.polling_strategy,
+                target=target,
+                status=initial_status,
+                deadline_ms=(
+                    None if not timeout_ms else int(time.time() * 1000) + timeout_ms
+                ),
+            ),
+            timeout_ms=timeout_ms,
+        )
+        with self._condition:
+            if self._closed:
+                raise ValueError("Cannot wait on a closed DatabaseStatusPoller.")
+            self._waiters.append(waiter)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="astrapy-database-status-poller",
+                    daemon=True,
+                )
+                self._thread.start()
+            # the new operation may call for an earlier check
+            self._condition.notify_all()
+        return waiter.future
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._waiters and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                # sleep until the earliest check requested by any waiting operation
+                wake_at_s = time.monotonic() + min(
+                    waiter.tracker.next_interval_s() for waiter in self._waiters
+                )
+                waiter_count = len(self._waiters)
+                while not self._closed:
+                    remaining_s = wake_at_s - time.monotonic()
+                    if remaining_s <= 0:
+                        break
+                    self._condition.wait(timeout=remaining_s)
+                    if self._closed:
+                        # (`close` has emptied the list of waiters)
+                        break
+                    if len(self._waiters) != waiter_count:
+                        wake_at_s = min(
+                            wake_at_s,
+                            time.monotonic()
+                            + min(
+                                waiter.tracker.next_interval_s()
+                                for waiter in self._waiters
+                            ),
+                        )
+                        waiter_count = len(self._waiters)
+                if self._closed:
+                    return
+                waiters = list(self._waiters)
+            self._poll(waiters)
+            with self._condition:
+                self._waiters = [
+                    waiter for waiter in self._waiters if not waiter.future.done()
+                ]
+
+    def _poll(self, waiters: list[_StatusWaiter]) -> None:
+        logger.info(f"polling for the status of {len(waiters)} operation(s)")
+        try:
+            db_infos = self.astra_db_admin.list_databases()
+        except Exception as exc:
+            self._consecutive_failures += 1
+            logger.warning(f"Database status polling failed: {exc}")
+            for waiter in waiters:
+                if self._consecutive_failures >= MAX_CONSECUTIVE_POLL_FAILURES:
+                    waiter._complete_with_exception(exc)
+                else:
+                    waiter._check_deadline()
+            return
+        self._consecutive_failures = 0
+        db_infos_by_id = {db_info.id: db_info for db_info in db_infos}
+        for waiter in waiters:
+            waiter.check(db_infos_by_id.get(waiter.database_id))
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+from astrapy.utils.admin_metadata_cache import AdminMetadataCache
 from astrapy.utils.api_options import (
     APIOptions,
     DataAPIURLOptions,
@@ -21,11 +22,18 @@ from astrapy.utils.api_options import (
     SerdesOptions,
     TimeoutOptions,
 )
+from astrapy.utils.metadata_cache import MetadataCache, MetadataCacheStats
+from astrapy.utils.read_cache import ReadCache, ReadCacheStats
 
 __all__ = [
+    "AdminMetadataCache",
     "APIOptions",
     "DataAPIURLOptions",
     "DevOpsAPIURLOptions",
+    "MetadataCache",
+    "MetadataCacheStats",
+    "ReadCache",
+    "ReadCacheStats",
     "SerdesOptions",
     "TimeoutOptions",
 ]
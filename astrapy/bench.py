@@ -0,0 +1,651 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The `astrapy-bench` command-line tool: microbenchmarks of the client-side
+hot paths (payload conversion, vector encoding, request encoding and response
+parsing, cursor iteration, insert_many), the last two against the in-memory
+Data API emulator, so that no database or network is involved.
+
+Results can be saved as a baseline, and later runs compared to it: the tool
+exits with an error if any benchmark is slower than its baseline beyond a
+tolerance. Baselines are only meaningful on the machine that produced them.
+
+The benchmarks are also available programmatically through `run_benchmarks`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import platform
+import re
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, TextIO
+
+import httpx
+
+from astrapy.client import DataAPIClient
+from astrapy.data.utils.collection_converters import (
+    postprocess_collection_response,
+    preprocess_collection_payload,
+)
+from astrapy.data.utils.table_converters import (
+    _TableConverterAgent,
+    preprocess_table_payload,
+)
+from astrapy.data_types import DataAPIDate, DataAPIVector
+from astrapy.database import Database
+from astrapy.ids import UUID, ObjectId
+from astrapy.testing import DataAPIEmulator
+from astrapy.utils.api_commander import APICommander
+from astrapy.utils.api_options import defaultAPIOptions
+
+BENCH_API_ENDPOINT = "http://astrapy-bench.emulator"
+BENCH_KEYSPACE = "bench"
+DEFAULT_BENCH_ROUNDS = 5
+DEFAULT_BENCH_TOLERANCE = 0.25
+BENCH_VECTOR_DIMENSION = 1024
+BENCH_BATCH_SIZE = 100
+BENCH_CURSOR_DOCUMENTS = 1000
+BENCH_INSERT_DOCUMENTS = 1000
+# (chunk size, concurrency) of the insert_many benchmarks
+BENCH_INSERT_MANY_SETTINGS = [(20, 1), (20, 8), (100, 1), (100, 8)]
+BASELINE_FORMAT_VERSION = 1
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The timings of a benchmark, all per call of the benchmarked function.
+
+    Attributes:
+        name: the name of the benchmark.
+        rounds: the number of timed rounds.
+        calls_per_round: the number of calls in each round.
+        median_s: the median time per call over the rounds, in seconds. This
+            is the figure compared with the baseline.
+        min_s: the shortest time per call over the rounds, in seconds.
+        max_s: the longest time per call over the rounds, in seconds.
+    """
+
+    name: str
+    rounds: int
+    calls_per_round: int
+    median_s: float
+    min_s: float
+    max_s: float
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "rounds": self.rounds,
+            "calls_per_round": self.calls_per_round,
+            "median_s": self.median_s,
+            "min_s": self.min_s,
+            "max_s": self.max_s,
+        }
+
+    @staticmethod
+    def from_dict(raw_dict: dict[str, Any]) -> BenchmarkResult:
+        return BenchmarkResult(
+            name=raw_dict["name"],
+            rounds=raw_dict["rounds"],
+            calls_per_round=raw_dict["calls_per_round"],
+            median_s=raw_dict["median_s"],
+            min_s=raw_dict["min_s"],
+            max_s=raw_dict["max_s"],
+        )
+
+
+@dataclass
+class BenchmarkComparison:
+    """
+    The comparison of a benchmark result with its baseline.
+
+    Attributes:
+        name: the name of the benchmark.
+        baseline_s: the median time per call of the baseline, in seconds.
+        current_s: the median time per call of the current run, in seconds.
+        ratio: current_s / baseline_s (above 1 means slower).
+        regressed: whether the ratio exceeds 1 + tolerance.
+    """
+
+    name: str
+    baseline_s: float
+    current_s: float
+    ratio: float
+    regressed: bool
+
+
+@dataclass
+class _Benchmark:
+    name: str
+    # run once before timing: returns the function to time
+    setup: Callable[[_BenchmarkContext], Callable[[], Any]]
+    calls_per_round: int
+
+
+class _BenchmarkContext:
+    """The emulator (and a database on it) shared by the benchmarks of a run."""
+
+    def __init__(self, emulator: DataAPIEmulator, database: Database) -> None:
+        self.emulator = emulator
+        self.database = database
+        self.serdes_options = defaultAPIOptions("other").serdes_options
+
+
+def _bench_document(index: int, dimension: int) -> dict[str, Any]:
+    return {
+        "_id": UUID(int=index),
+        "index": index,
+        "name": f"document {index}",
+        "tags": ["a", "b", "c"],
+        "created_at": datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+        + datetime.timedelta(seconds=index),
+        "ref": ObjectId(),
+        "nested": {"x": index / 3, "y": [index, index + 1]},
+        "$vector": DataAPIVector([(index % 7) / 7.0] * dimension),
+    }
+
+
+def _bench_row(index: int, dimension: int) -> dict[str, Any]:
+    return {
+        "p": index,
+        "name": f"row {index}",
+        "d": DataAPIDate(2025, 1, 1 + index % 28),
+        "score": index / 3,
+        "tags": {"a", "b", "c"},
+        "v": DataAPIVector([(index % 7) / 7.0] * dimension),
+    }
+
+
+BENCH_TABLE_SCHEMA: dict[str, dict[str, Any]] = {
+    "p": {"type": "int"},
+    "name": {"type": "text"},
+    "d": {"type": "date"},
+    "score": {"type": "double"},
+    "tags": {"type": "set", "valueType": "text"},
+    "v": {"type": "vector", "dimension": BENCH_VECTOR_DIMENSION},
+}
+
+
+def _setup_collection_preprocess(ctx: _BenchmarkContext) -> Callable[[], Any]:
+    payload = {
+        "insertMany": {
+            "documents": [
+                _bench_document(i, BENCH_VECTOR_DIMENSION)
+                for i in range(BENCH_BATCH_SIZE)
+            ]
+        }
+    }
+    return lambda: preprocess_collection_payload(payload, ctx.serdes_options)
+
+
+def _setup_collection_postprocess(ctx: _BenchmarkContext) -> Callable[[], Any]:
+    raw_documents = preprocess_collection_payload(
+        {
+            "documents": [
+                _bench_document(i, BENCH_VECTOR_DIMENSION)
+                for i in range(BENCH_BATCH_SIZE)
+            ]
+        },
+        ctx.serdes_options,
+    )
+    response = {"data": raw_documents}
+    return lambda: postprocess_collection_response(response, ctx.serdes_options)
+
+
+def _setup_table_preprocess(ctx: _BenchmarkContext) -> Callable[[], Any]:
+    payload = {
+        "insertMany": {
+            "documents": [
+                _bench_row(i, BENCH_VECTOR_DIMENSION) for i in range(BENCH_BATCH_SIZE)
+            ]
+        }
+    }
+    return lambda: preprocess_table_payload(
+        payload, options=ctx.serdes_options, map2tuple_checker=None
+    )
+
+
+def _setup_table_postprocess(ctx: _BenchmarkContext) -> Callable[[], Any]:
+    wire_payload = preprocess_table_payload(
+        {
+            "rows": [
+                _bench_row(i, BENCH_VECTOR_DIMENSION) for i in range(BENCH_BATCH_SIZE)
+            ]
+        },
+        options=ctx.serdes_options,
+        map2tuple_checker=None,
+    )
+    # the rows as they come from the API (e.g. sets as lists)
+    raw_rows = json.loads(json.dumps(wire_payload))["rows"]
+    agent: _TableConverterAgent[dict[str, Any]] = _TableConverterAgent(
+        options=ctx.serdes_options
+    )
+    return lambda: agent.postprocess_rows(
+        raw_rows, columns_dict=BENCH_TABLE_SCHEMA, similarity_pseudocolumn=None
+    )
+
+
+def _setup_vector_to_bytes(ctx: _BenchmarkContext) -> Callable[[], Any]:
+    vector = DataAPIVector(
+        [i / BENCH_VECTOR_DIMENSION for i in range(BENCH_VECTOR_DIMENSION)]
+    )
+    return vector.to_bytes
+
+
+def _setup_vector_from_bytes(ctx: _BenchmarkContext) -> Callable[[], Any]:
+    blob = DataAPIVector(
+        [i / BENCH_VECTOR_DIMENSION for i in range(BENCH_VECTOR_DIMENSION)]
+    ).to_bytes()
+    return lambda: DataAPIVector.from_bytes(blob)
+
+
+def _bench_commander() -> APICommander:
+    return APICommander(
+        api_endpoint=BENCH_API_ENDPOINT,
+        path=f"v1/{BENCH_KEYSPACE}/bench_commander",
+        spawner=None,
+    )
+
+
+def _setup_commander_encode(ctx: _BenchmarkContext) -> Callable[[], Any]:
+    commander = _bench_commander()
+    payload = preprocess_collection_payload(
+        {
+            "insertMany": {
+                "documents": [
+                    _bench_document(i, BENCH_VECTOR_DIMENSION)
+                    for i in range(BENCH_BATCH_SIZE)
+                ]
+            }
+        },
+        ctx.serdes_options,
+    )
+    return lambda: commander._decimal_unaware_encode_payload(payload)
+
+
+def _parse_benchmark(
+    ctx: _BenchmarkContext, handle_decimals_reads: bool
+) -> Callable[[], Any]:
+    commander = _bench_commander()
+    commander.handle_decimals_reads = handle_decimals_reads
+    raw_documents = preprocess_collection_payload(
+        {
+            "documents": [
+                _bench_document(i, BENCH_VECTOR_DIMENSION)
+                for i in range(BENCH_BATCH_SIZE)
+            ]
+        },
+        ctx.serdes_options,
+    )
+    assert raw_documents is not None
+    content = json.dumps(
+        {"data": {"documents": raw_documents["documents"], "nextPageState": None}}
+    ).encode()
+    payload: dict[str, Any] = {"find": {}}
+
+    def _parse() -> Any:
+        # a new response each time, as the decoded body text is cached on it
+        return commander._raw_response_to_json(
+            httpx.Response(200, content=content),
+            raise_api_errors=True,
+            payload=payload,
+            caller_function_name=None,
+            request_id="bench",
+        )
+
+    return _parse
+
+
+def _setup_commander_parse(ctx: _BenchmarkContext) -> Callable[[], Any]:
+    return _parse_benchmark(ctx, handle_decimals_reads=False)
+
+
+def _setup_commander_parse_decimals(ctx: _BenchmarkContext) -> Callable[[], Any]:
+    return _parse_benchmark(ctx, handle_decimals_reads=True)
+
+
+def _setup_collection_cursor(ctx: _BenchmarkContext) -> Callable[[], Any]:
+    ctx.emulator.create_collection(
+        "bench_cursor",
+        keyspace=BENCH_KEYSPACE,
+        documents=[
+            preprocess_collection_payload(
+                {"document": _bench_document(i, 16)}, ctx.serdes_options
+            )["document"]  # type: ignore[index]
+            for i in range(BENCH_CURSOR_DOCUMENTS)
+        ],
+    )
+    collection = ctx.database.get_collection("bench_cursor")
+    return lambda: sum(1 for _ in collection.find({}))
+
+
+def _setup_table_cursor(ctx: _BenchmarkContext) -> Callable[[], Any]:
+    raw_rows = preprocess_table_payload(
+        {"rows": [_bench_row(i, 16) for i in range(BENCH_CURSOR_DOCUMENTS)]},
+        options=ctx.serdes_options,
+        map2tuple_checker=None,
+    )
+    ctx.emulator.create_table(
+        "bench_table_cursor",
+        keyspace=BENCH_KEYSPACE,
+        columns={**BENCH_TABLE_SCHEMA, "v": {"type": "vector", "dimension": 16}},
+        primary_key=["p"],
+        rows=json.loads(json.dumps(raw_rows))["rows"],
+    )
+    table = ctx.database.get_table("bench_table_cursor")
+    return lambda: sum(1 for _ in table.find({}))
+
+
+def _insert_many_setup(
+    chunk_size: int, concurrency: int
+) -> Callable[[_BenchmarkContext], Callable[[], Any]]:
+    def _setup(ctx: _BenchmarkContext) -> Callable[[], Any]:
+        documents = [
+            {k: v for k, v in _bench_document(i, 16).items() if k != "_id"}
+            for i in range(BENCH_INSERT_DOCUMENTS)
+        ]
+        collection = ctx.database.get_collection("bench_insert")
+
+        def _insert() -> Any:
+            # start from an empty collection each time
+            ctx.emulator.create_collection("bench_insert", keyspace=BENCH_KEYSPACE)
+            return collection.insert_many(
+                documents, chunk_size=chunk_size, concurrency=concurrency
+            )
+
+        return _insert
+
+    return _setup
+
+
+BENCHMARKS: list[_Benchmark] = [
+    _Benchmark("collection_preprocess", _setup_collection_preprocess, 5),
+    _Benchmark("collection_postprocess", _setup_collection_postprocess, 5),
+    _Benchmark("table_preprocess", _setup_table_preprocess, 5),
+    _Benchmark("table_postprocess_rows", _setup_table_postprocess, 5),
+    _Benchmark("vector_to_bytes", _setup_vector_to_bytes, 2000),
+    _Benchmark("vector_from_bytes", _setup_vector_from_bytes, 2000),
+    _Benchmark("commander_encode", _setup_commander_encode, 10),
+    _Benchmark("commander_parse", _setup_commander_parse, 10),
+    _Benchmark("commander_parse_decimals", _setup_commander_parse_decimals, 5),
+    _Benchmark("collection_cursor_iteration", _setup_collection_cursor, 1),
+    _Benchmark("table_cursor_iteration", _setup_table_cursor, 1),
+    *[
+        _Benchmark(
+            f"insert_many_chunk{chunk_size}_conc{concurrency}",
+            _insert_many_setup(chunk_size, concurrency),
+            1,
+        )
+        for chunk_size, concurrency in BENCH_INSERT_MANY_SETTINGS
+    ],
+]
+
+
+@contextmanager
+def _benchmark_context(emulator_latency_s: float) -> Iterator[_BenchmarkContext]:
+    emulator = DataAPIEmulator(latency_s=emulator_latency_s)
+    with emulator.mounted(BENCH_API_ENDPOINT) as api_endpoint:
+        database = DataAPIClient(environment="other").get_database(
+            api_endpoint, keyspace=BENCH_KEYSPACE
+        )
+        yield _BenchmarkContext(emulator=emulator, database=database)
+
+
+def _time_benchmark(
+    benchmark: _Benchmark, ctx: _BenchmarkContext, rounds: int
+) -> BenchmarkResult:
+    function = benchmark.setup(ctx)
+    # warm-up (e.g. caches, first client creation)
+    function()
+    round_times: list[float] = []
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        for _ in range(benchmark.calls_per_round):
+            function()
+        elapsed = time.perf_counter() - started_at
+        round_times.append(elapsed / benchmark.calls_per_round)
+    return BenchmarkResult(
+        name=benchmark.name,
+        rounds=rounds,
+        calls_per_round=benchmark.calls_per_round,
+        median_s=statistics.median(round_times),
+        min_s=min(round_times),
+        max_s=max(round_times),
+    )
+
+
+def run_benchmarks(
+    *,
+    only: str | None = None,
+    rounds: int = DEFAULT_BENCH_ROUNDS,
+    emulator_latency_s: float = 0.0,
+    progress_file: TextIO | None = None,
+) -> list[BenchmarkResult]:
+    """
+    Run the benchmarks.
+
+    Args:
+        only: a regular expression: if given, only the benchmarks whose name
+            it matches (`re.search`) are run.
+        rounds: the number of timed rounds for each benchmark.
+        emulator_latency_s: the latency of the emulated Data API. With the
+            default, zero, only the client-side overhead is measured.
+        progress_file: if given, a line is written to it as each benchmark
+            completes.
+
+    Returns:
+        the list of BenchmarkResult, in the order the benchmarks were run.
+    """
+
+    if rounds < 1:
+        raise ValueError("The number of rounds must be positive.")
+    pattern = re.compile(only) if only else None
+    results: list[BenchmarkResult] = []
+    with _benchmark_context(emulator_latency_s) as ctx:
+        for benchmark in BENCHMARKS:
+            if pattern is not None and not pattern.search(benchmark.name):
+                continue
+            result = _time_benchmark(benchmark, ctx, rounds=rounds)
+            results.append(result)
+            if progress_file is not None:
+                progress_file.write(
+                    f"[astrapy-bench] {result.name}: "
+                    f"{result.median_s * 1e6:.1f} us/call\n"
+                )
+    return results
+
+
+def save_results(results: list[BenchmarkResult], path: str) -> None:
+    """Write benchmark results to a JSON file, for use as a baseline."""
+
+    from astrapy import __version__
+
+    contents = {
+        "format_version": BASELINE_FORMAT_VERSION,
+        "astrapy_version": __version__,
+        "python_version": platform.python_version(),
+        "machine": platform.machine(),
+        "results": [result.as_dict() for result in results],
+    }
+    with open(path, "w", encoding="utf-8") as o_file:
+        json.dump(contents, o_file, indent=2)
+        o_file.write("\n")
+
+
+def load_results(path: str) -> list[BenchmarkResult]:
+    """Read benchmark results from a JSON file written by `save_results`."""
+
+    with open(path, encoding="utf-8") as i_file:
+        contents = json.load(i_file)
+    if contents.get("format_version") != BASELINE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark results file: {path}.")
+    return [BenchmarkResult.from_dict(raw) for raw in contents["results"]]
+
+
+def compare_results(
+    results: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    *,
+    tolerance: float = DEFAULT_BENCH_TOLERANCE,
+) -> list[BenchmarkComparison]:
+    """
+    Compare benchmark results with a baseline.
+
+    Args:
+        results: the current results.
+        baseline: the baseline results. Benchmarks missing from either list
+            are not compared.
+        tolerance: the accepted slowdown, as a fraction of the baseline
+            median (e.g. 0.25 for 25%).
+
+    Returns:
+        a list of BenchmarkComparison, one per benchmark in both lists.
+    """
+
+    baseline_map = {result.name: result for result in baseline}
+    comparisons: list[BenchmarkComparison] = []
+    for result in results:
+        baseline_result = baseline_map.get(result.name)
+        if baseline_result is None:
+            continue
+        ratio = result.median_s / baseline_result.median_s
+        comparisons.append(
+            BenchmarkComparison(
+                name=result.name,
+                baseline_s=baseline_result.median_s,
+                current_s=result.median_s,
+                ratio=ratio,
+                regressed=ratio > 1 + tolerance,
+            )
+        )
+    return comparisons
+
+
+def _report(
+    results: list[BenchmarkResult],
+    comparisons: list[BenchmarkComparison],
+) -> str:
+    comparison_map = {comparison.name: comparison for comparison in comparisons}
+    name_width = max([len(result.name) for result in results] + [9])
+    lines = [
+        f"{'benchmark':<{name_width}}{'median_us':>14}{'min_us':>14}"
+        f"{'baseline_us':>14}{'change':>10}"
+    ]
+    for result in results:
+        comparison = comparison_map.get(result.name)
+        if comparison is None:
+            baseline_str, change_str = "-", "-"
+        else:
+            baseline_str = f"{comparison.baseline_s * 1e6:.1f}"
+            change_str = f"{comparison.ratio - 1:+.1%}"
+            if comparison.regressed:
+                change_str += " !"
+        lines.append(
+            f"{result.name:<{name_width}}{result.median_s * 1e6:>14.1f}"
+            f"{result.min_s * 1e6:>14.1f}{baseline_str:>14}{change_str:>10}"
+        )
+    return "\n".join(lines)
+
+
+parser = argparse.ArgumentParser(
+    description=(
+        "Microbenchmarks of the astrapy client-side hot paths, run against "
+        "an in-memory Data API emulator, with comparison to a stored baseline."
+    ),
+)
+parser.add_argument(
+    "--only",
+    type=str,
+    help="Regular expression selecting the benchmarks to run (by name).",
+)
+parser.add_argument(
+    "--rounds",
+    type=int,
+    default=DEFAULT_BENCH_ROUNDS,
+    help="Number of timed rounds for each benchmark.",
+)
+parser.add_argument(
+    "--emulator-latency-ms",
+    type=float,
+    default=0.0,
+    help="Latency of the emulated Data API, in milliseconds.",
+)
+parser.add_argument(
+    "--save",
+    type=str,
+    help="Write the results to this JSON file (e.g. to make a new baseline).",
+)
+parser.add_argument(
+    "--baseline",
+    type=str,
+    help="Compare the results with the baseline in this JSON file.",
+)
+parser.add_argument(
+    "--tolerance",
+    type=float,
+    default=DEFAULT_BENCH_TOLERANCE,
+    help=(
+        "Accepted slowdown with respect to the baseline, as a fraction "
+        "(e.g. 0.25 for 25%%). Beyond this, the tool exits with an error."
+    ),
+)
+parser.add_argument(
+    "--list",
+    action="store_true",
+    help="List the benchmarks and exit.",
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parser.parse_args(argv)
+    if args.list:
+        for benchmark in BENCHMARKS:
+            sys.stdout.write(f"{benchmark.name}\n")
+        return
+
+    try:
+        baseline = load_results(args.baseline) if args.baseline else None
+        results = run_benchmarks(
+            only=args.only,
+            rounds=args.rounds,
+            emulator_latency_s=args.emulator_latency_ms / 1000.0,
+            progress_file=sys.stderr,
+        )
+        if args.save:
+            save_results(results, args.save)
+    except (ValueError, OSError, re.error) as exc:
+        raise SystemExit(f"astrapy-bench: {exc}")
+    comparisons = (
+        compare_results(results, baseline, tolerance=args.tolerance)
+        if baseline is not None
+        else []
+    )
+    sys.stdout.write(_report(results, comparisons) + "\n")
+    regressions = [comparison for comparison in comparisons if comparison.regressed]
+    if regressions:
+        raise SystemExit(
+            f"astrapy-bench: {len(regressions)} benchmark(s) regressed beyond "
+            f"{args.tolerance:.0%}: "
+            f"{', '.join(comparison.name for comparison in regressions)}"
+        )
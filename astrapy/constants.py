@@ -20,6 +20,7 @@ from astrapy.settings.definitions.definitions_admin import (
     ModelStatus,
 )
 from astrapy.settings.definitions.definitions_data import (
+    ConnectionReuseMode,
     DefaultIdType,
     MapEncodingMode,
     ReturnDocument,
@@ -44,6 +45,7 @@ from astrapy.settings.definitions.definitions_types import (
 )
 
 __all__ = [
+    "ConnectionReuseMode",
     "DatabaseStatus",
     "DefaultIdType",
     "Environment",
@@ -14,6 +14,12 @@
 
 from __future__ import annotations
 
+from astrapy.data.cursors.checkpoint import (
+    CursorCheckpoint,
+    CursorCheckpointStore,
+    FileCursorCheckpointStore,
+    InMemoryCursorCheckpointStore,
+)
 from astrapy.data.cursors.cursor import (
     AbstractCursor,
     CursorState,
@@ -38,9 +44,13 @@ __all__ = [
     "AsyncTableFindCursor",
     "CollectionFindAndRerankCursor",
     "CollectionFindCursor",
+    "CursorCheckpoint",
+    "CursorCheckpointStore",
     "CursorState",
+    "FileCursorCheckpointStore",
     "FindAndRerankPage",
     "FindPage",
+    "InMemoryCursorCheckpointStore",
     "RerankedResult",
     "TableFindCursor",
 ]
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
 from collections.abc import Iterable
 from concurrent.futures import ThreadPoolExecutor
@@ -31,6 +32,15 @@ from astrapy.constants import (
     SortType,
     normalize_optional_projection,
 )
+from astrapy.data.loaders import AsyncCollectionLoader, CollectionLoader
+from astrapy.data.utils.bulk_write import (
+    _aexecute_bulk_write,
+    _bulk_write_settings,
+    _collection_bulk_write_result,
+    _collection_insertion_documents,
+    _execute_bulk_write,
+    _plan_bulk_write,
+)
 from astrapy.data.utils.collection_converters import (
     postprocess_collection_response,
     preprocess_collection_payload,
@@ -42,6 +52,7 @@ from astrapy.data.utils.distinct_extractors import (
 )
 from astrapy.database import AsyncDatabase, Database
 from astrapy.exceptions import (
+    CollectionBulkWriteException,
     CollectionDeleteManyException,
     CollectionInsertManyException,
     CollectionUpdateManyException,
@@ -58,6 +69,7 @@ from astrapy.exceptions.utils import (
 )
 from astrapy.info import CollectionDefinition, CollectionInfo, RerankServiceOptions
 from astrapy.results import (
+    CollectionBulkWriteResult,
     CollectionDeleteResult,
     CollectionInsertManyResult,
     CollectionInsertOneResult,
@@ -70,7 +82,17 @@ from astrapy.settings.defaults import (
 )
 from astrapy.utils.api_commander import APICommander
 from astrapy.utils.api_options import APIOptions, FullAPIOptions
+from astrapy.utils.operation_stats import (
+    timed_queueing,
+    timed_slot,
+    with_operation_stats,
+)
 from astrapy.utils.request_tools import HttpMethod
+from astrapy.utils.tracing import (
+    in_current_context,
+    request_attributes,
+    traced_operation,
+)
 from astrapy.utils.unset import _UNSET, UnsetType
 
 if TYPE_CHECKING:
@@ -85,6 +107,7 @@ if TYPE_CHECKING:
         CollectionFindCursor,
         RerankedResult,
     )
+    from astrapy.operations import BaseOperation
 
 
 logger = logging.getLogger(__name__)
@@ -344,6 +367,9 @@ class Collection(Generic[DOC]):
                 self.api_options.serdes_options.use_decimals_in_collections
             ),
             ca_cert_path=self.api_options.ca_cert_path,
+            connection_reuse_mode=self.api_options.connection_reuse_mode,
+            read_cache=self.api_options.read_cache,
+            metadata_cache=self.api_options.metadata_cache,
         )
         return api_commander
 
@@ -541,7 +567,7 @@ class Collection(Generic[DOC]):
             request_timeout_ms=request_timeout_ms,
             timeout_ms=timeout_ms,
         )
-        logger.info(f"getting collections in search of '{self.name}'")
+        logger.info("getting collections in search of '%s'", self.name)
         self_descriptors = [
             coll_desc
             for coll_desc in self.database._list_collections_ctx(
@@ -553,7 +579,7 @@ class Collection(Generic[DOC]):
             )
             if coll_desc.name == self.name
         ]
-        logger.info(f"finished getting collections in search of '{self.name}'")
+        logger.info("finished getting collections in search of '%s'", self.name)
         if self_descriptors:
             return self_descriptors[0].definition
         else:
@@ -719,7 +745,7 @@ class Collection(Generic[DOC]):
             timeout_ms=timeout_ms,
         )
         io_payload = {"insertOne": {"document": document}}
-        logger.info(f"insertOne on '{self.name}'")
+        logger.info("insertOne on '%s'", self.name)
         io_response = self._converted_request(
             payload=io_payload,
             timeout_context=_TimeoutContext(
@@ -727,7 +753,7 @@ class Collection(Generic[DOC]):
             ),
             caller_function_name="insert_one",
         )
-        logger.info(f"finished insertOne on '{self.name}'")
+        logger.info("finished insertOne on '%s'", self.name)
         if "insertedIds" in io_response.get("status", {}):
             if io_response["status"]["insertedIds"]:
                 inserted_id = io_response["status"]["insertedIds"][0]
@@ -746,6 +772,8 @@ class Collection(Generic[DOC]):
                 raw_response=io_response,
             )
 
+    @traced_operation("insert_many")
+    @with_operation_stats
     def insert_many(
         self,
         documents: Iterable[DOC],
@@ -862,7 +890,7 @@ class Collection(Generic[DOC]):
         else:
             _chunk_size = chunk_size
         _documents = list(documents)
-        logger.info(f"inserting {len(_documents)} documents in '{self.name}'")
+        logger.info("inserting %s documents in '%s'", len(_documents), self.name)
         raw_results: list[dict[str, Any]] = []
         im_payloads: list[dict[str, Any]] = []
         timeout_manager = MultiCallTimeoutManager(
@@ -879,17 +907,18 @@ class Collection(Generic[DOC]):
                         "options": options,
                     },
                 }
-                logger.info(f"insertMany(chunk) on '{self.name}'")
-                chunk_response = self._converted_request(
-                    payload=im_payload,
-                    raise_api_errors=False,
-                    timeout_context=timeout_manager.remaining_timeout(
-                        cap_time_ms=_request_timeout_ms,
-                        cap_timeout_label=_rt_label,
-                    ),
-                    caller_function_name="insert_many",
-                )
-                logger.info(f"finished insertMany(chunk) on '{self.name}'")
+                logger.info("insertMany(chunk) on '%s'", self.name)
+                with request_attributes(chunk_index=i // _chunk_size):
+                    chunk_response = self._converted_request(
+                        payload=im_payload,
+                        raise_api_errors=False,
+                        timeout_context=timeout_manager.remaining_timeout(
+                            cap_time_ms=_request_timeout_ms,
+                            cap_timeout_label=_rt_label,
+                        ),
+                        caller_function_name="insert_many",
+                    )
+                logger.info("finished insertMany(chunk) on '%s'", self.name)
                 # accumulate the results in this call
                 chunk_inserted_ids = [
                     doc_resp["_id"]
@@ -917,7 +946,7 @@ class Collection(Generic[DOC]):
                 inserted_ids=inserted_ids,
             )
             logger.info(
-                f"finished inserting {len(_documents)} documents in '{self.name}'"
+                "finished inserting %s documents in '%s'", len(_documents), self.name
             )
             return full_result
 
@@ -928,6 +957,7 @@ class Collection(Generic[DOC]):
                 with ThreadPoolExecutor(max_workers=_concurrency) as executor:
 
                     def _chunk_insertor(
+                        chunk_index: int,
                         document_chunk: list[dict[str, Any]],
                     ) -> tuple[dict[str, Any], dict[str, Any]]:
                         im_payload = {
@@ -936,22 +966,24 @@ class Collection(Generic[DOC]):
                                 "options": options,
                             },
                         }
-                        logger.info(f"insertMany(chunk) on '{self.name}'")
-                        im_response = self._converted_request(
-                            payload=im_payload,
-                            raise_api_errors=False,
-                            timeout_context=timeout_manager.remaining_timeout(
-                                cap_time_ms=_request_timeout_ms,
-                                cap_timeout_label=_rt_label,
-                            ),
-                            caller_function_name="insert_many",
-                        )
-                        logger.info(f"finished insertMany(chunk) on '{self.name}'")
+                        logger.info("insertMany(chunk) on '%s'", self.name)
+                        with request_attributes(chunk_index=chunk_index):
+                            im_response = self._converted_request(
+                                payload=im_payload,
+                                raise_api_errors=False,
+                                timeout_context=timeout_manager.remaining_timeout(
+                                    cap_time_ms=_request_timeout_ms,
+                                    cap_timeout_label=_rt_label,
+                                ),
+                                caller_function_name="insert_many",
+                            )
+                        logger.info("finished insertMany(chunk) on '%s'", self.name)
                         return im_payload, im_response
 
                     raw_pl_results_pairs = list(
                         executor.map(
-                            _chunk_insertor,
+                            timed_queueing(in_current_context(_chunk_insertor)),
+                            itertools.count(),
                             (
                                 _documents[i : i + _chunk_size]
                                 for i in range(0, len(_documents), _chunk_size)
@@ -971,17 +1003,18 @@ class Collection(Generic[DOC]):
                             "options": options,
                         },
                     }
-                    logger.info(f"insertMany(chunk) on '{self.name}'")
-                    im_response = self._converted_request(
-                        payload=im_payload,
-                        raise_api_errors=False,
-                        timeout_context=timeout_manager.remaining_timeout(
-                            cap_time_ms=_request_timeout_ms,
-                            cap_timeout_label=_rt_label,
-                        ),
-                        caller_function_name="insert_many",
-                    )
-                    logger.info(f"finished insertMany(chunk) on '{self.name}'")
+                    logger.info("insertMany(chunk) on '%s'", self.name)
+                    with request_attributes(chunk_index=i // _chunk_size):
+                        im_response = self._converted_request(
+                            payload=im_payload,
+                            raise_api_errors=False,
+                            timeout_context=timeout_manager.remaining_timeout(
+                                cap_time_ms=_request_timeout_ms,
+                                cap_timeout_label=_rt_label,
+                            ),
+                            caller_function_name="insert_many",
+                        )
+                    logger.info("finished insertMany(chunk) on '%s'", self.name)
                     raw_results.append(im_response)
                     im_payloads.append(im_payload)
             # recast raw_results
@@ -1015,7 +1048,7 @@ class Collection(Generic[DOC]):
                 inserted_ids=inserted_ids,
             )
             logger.info(
-                f"finished inserting {len(_documents)} documents in '{self.name}'"
+                "finished inserting %s documents in '%s'", len(_documents), self.name
             )
             return full_result
 
@@ -1385,6 +1418,58 @@ class Collection(Generic[DOC]):
             return None
         return fo_response["data"]["document"]  # type: ignore[no-any-return]
 
+    def loader(
+        self,
+        *,
+        projection: ProjectionType | None = None,
+        max_batch_size: int | None = None,
+        batch_window_ms: int | None = None,
+        concurrency: int | None = None,
+        request_timeout_ms: int | None = None,
+    ) -> CollectionLoader[DOC]:
+        """
+        Create a loader for batched lookups of documents by `_id`.
+
+        Individual lookups made through the loader within a short time window
+        are collected and sent as `$in` queries, in batches running concurrently.
+        This greatly reduces the number of requests compared to issuing one
+        `find_one` per document, when many lookups are made at the same time.
+
+        Args:
+            projection: a projection to apply to the documents. The `_id`
+                is always included, as it is needed to match documents to lookups.
+            max_batch_size: the maximum number of keys in a single `$in` query.
+                It cannot exceed the maximum allowed by the Data API. The default
+                matches the size of a page of `find` results, so that each batch
+                takes a single request: larger batches are fetched page by page.
+            batch_window_ms: how long, in milliseconds, to wait for more lookups
+                before sending a batch. Leave it unspecified to use the
+                system default (a couple of milliseconds).
+            concurrency: the maximum number of batches running at the same time.
+            request_timeout_ms: a timeout, in milliseconds, for each API request.
+                If not provided, this object's defaults apply.
+
+        Returns:
+            a CollectionLoader object, whose `load` and `load_many` methods return
+            the documents (or None when not found).
+
+        Example:
+            >>> with my_coll.loader() as loader:
+            ...     loader.load("doc1")
+            ...
+            {'_id': 'doc1', 'seq': 1}
+        """
+
+        return CollectionLoader(
+            self,
+            projection=projection,
+            max_batch_size=max_batch_size,
+            batch_window_ms=batch_window_ms,
+            concurrency=concurrency,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+    @traced_operation("distinct")
     def distinct(
         self,
         key: str | Iterable[str | int],
@@ -1495,7 +1580,7 @@ class Collection(Generic[DOC]):
         # consuming it:
         _item_hashes = set()
         distinct_items: list[Any] = []
-        logger.info(f"running distinct() on '{self.name}'")
+        logger.info("running distinct() on '%s'", self.name)
         for document in f_cursor:
             for item in _extractor(document):
                 _item_hash = _hash_collection_document(
@@ -1504,7 +1589,7 @@ class Collection(Generic[DOC]):
                 if _item_hash not in _item_hashes:
                     _item_hashes.add(_item_hash)
                     distinct_items.append(item)
-        logger.info(f"finished running distinct() on '{self.name}'")
+        logger.info("finished running distinct() on '%s'", self.name)
         return distinct_items
 
     @overload
@@ -1938,7 +2023,7 @@ class Collection(Generic[DOC]):
             timeout_ms=timeout_ms,
         )
         cd_payload = {"countDocuments": {"filter": filter}}
-        logger.info(f"countDocuments on '{self.name}'")
+        logger.info("countDocuments on '%s'", self.name)
         cd_response = self._converted_request(
             payload=cd_payload,
             timeout_context=_TimeoutContext(
@@ -1946,7 +2031,7 @@ class Collection(Generic[DOC]):
             ),
             caller_function_name="count_documents",
         )
-        logger.info(f"finished countDocuments on '{self.name}'")
+        logger.info("finished countDocuments on '%s'", self.name)
         if "count" in cd_response.get("status", {}):
             count: int = cd_response["status"]["count"]
             if cd_response["status"].get("moreData", False):
@@ -2003,7 +2088,7 @@ class Collection(Generic[DOC]):
             timeout_ms=timeout_ms,
         )
         ed_payload: dict[str, Any] = {"estimatedDocumentCount": {}}
-        logger.info(f"estimatedDocumentCount on '{self.name}'")
+        logger.info("estimatedDocumentCount on '%s'", self.name)
         ed_response = self._converted_request(
             payload=ed_payload,
             timeout_context=_TimeoutContext(
@@ -2011,7 +2096,7 @@ class Collection(Generic[DOC]):
             ),
             caller_function_name="estimated_document_count",
         )
-        logger.info(f"finished estimatedDocumentCount on '{self.name}'")
+        logger.info("finished estimatedDocumentCount on '%s'", self.name)
         if "count" in ed_response.get("status", {}):
             count: int = ed_response["status"]["count"]
             return count
@@ -2145,7 +2230,7 @@ class Collection(Generic[DOC]):
                 if v is not None
             }
         }
-        logger.info(f"findOneAndReplace on '{self.name}'")
+        logger.info("findOneAndReplace on '%s'", self.name)
         fo_response = self._converted_request(
             payload=fo_payload,
             timeout_context=_TimeoutContext(
@@ -2153,7 +2238,7 @@ class Collection(Generic[DOC]):
             ),
             caller_function_name="find_one_and_replace",
         )
-        logger.info(f"finished findOneAndReplace on '{self.name}'")
+        logger.info("finished findOneAndReplace on '%s'", self.name)
         if "document" in fo_response.get("data", {}):
             ret_document = fo_response.get("data", {}).get("document")
             if ret_document is None:
@@ -2245,7 +2330,7 @@ class Collection(Generic[DOC]):
                 if v is not None
             }
         }
-        logger.info(f"findOneAndReplace on '{self.name}'")
+        logger.info("findOneAndReplace on '%s'", self.name)
         fo_response = self._converted_request(
             payload=fo_payload,
             timeout_context=_TimeoutContext(
@@ -2253,7 +2338,7 @@ class Collection(Generic[DOC]):
             ),
             caller_function_name="replace_one",
         )
-        logger.info(f"finished findOneAndReplace on '{self.name}'")
+        logger.info("finished findOneAndReplace on '%s'", self.name)
         if "document" in fo_response.get("data", {}):
             fo_status = fo_response.get("status") or {}
             _update_info = _prepare_update_info([fo_status])
@@ -2397,7 +2482,7 @@ class Collection(Generic[DOC]):
                 if v is not None
             }
         }
-        logger.info(f"findOneAndUpdate on '{self.name}'")
+        logger.info("findOneAndUpdate on '%s'", self.name)
         fo_response = self._converted_request(
             payload=fo_payload,
             timeout_context=_TimeoutContext(
@@ -2405,7 +2490,7 @@ class Collection(Generic[DOC]):
             ),
             caller_function_name="find_one_and_update",
         )
-        logger.info(f"finished findOneAndUpdate on '{self.name}'")
+        logger.info("finished findOneAndUpdate on '%s'", self.name)
         if "document" in fo_response.get("data", {}):
             ret_document = fo_response.get("data", {}).get("document")
             if ret_document is None:
@@ -2501,7 +2586,7 @@ class Collection(Generic[DOC]):
                 if v is not None
             }
         }
-        logger.info(f"updateOne on '{self.name}'")
+        logger.info("updateOne on '%s'", self.name)
         uo_response = self._converted_request(
             payload=uo_payload,
             timeout_context=_TimeoutContext(
@@ -2509,7 +2594,7 @@ class Collection(Generic[DOC]):
             ),
             caller_function_name="update_one",
         )
-        logger.info(f"finished updateOne on '{self.name}'")
+        logger.info("finished updateOne on '%s'", self.name)
         if "status" in uo_response:
             uo_status = uo_response["status"]
             _update_info = _prepare_update_info([uo_status])
@@ -2523,6 +2608,8 @@ class Collection(Generic[DOC]):
                 raw_response=uo_response,
             )
 
+    @traced_operation("update_many")
+    @with_operation_stats
     def update_many(
         self,
         filter: FilterType,
@@ -2611,7 +2698,7 @@ class Collection(Generic[DOC]):
         um_responses: list[dict[str, Any]] = []
         um_statuses: list[dict[str, Any]] = []
         must_proceed = True
-        logger.info(f"starting update_many on '{self.name}'")
+        logger.info("starting update_many on '%s'", self.name)
         timeout_manager = MultiCallTimeoutManager(
             overall_timeout_ms=_general_method_timeout_ms,
             timeout_label=_gmt_label,
@@ -2629,17 +2716,18 @@ class Collection(Generic[DOC]):
                     if v is not None
                 }
             }
-            logger.info(f"updateMany on '{self.name}'")
-            this_um_response = self._converted_request(
-                payload=this_um_payload,
-                raise_api_errors=False,
-                timeout_context=timeout_manager.remaining_timeout(
-                    cap_time_ms=_request_timeout_ms,
-                    cap_timeout_label=_rt_label,
-                ),
-                caller_function_name="update_many",
-            )
-            logger.info(f"finished updateMany on '{self.name}'")
+            logger.info("updateMany on '%s'", self.name)
+            with request_attributes(page_number=len(um_responses) + 1):
+                this_um_response = self._converted_request(
+                    payload=this_um_payload,
+                    raise_api_errors=False,
+                    timeout_context=timeout_manager.remaining_timeout(
+                        cap_time_ms=_request_timeout_ms,
+                        cap_timeout_label=_rt_label,
+                    ),
+                    caller_function_name="update_many",
+                )
+            logger.info("finished updateMany on '%s'", self.name)
             this_um_status = this_um_response.get("status") or {}
             #
             # if errors, quit early
@@ -2674,7 +2762,7 @@ class Collection(Generic[DOC]):
                     page_state_options = {}
 
         update_info = _prepare_update_info(um_statuses)
-        logger.info(f"finished update_many on '{self.name}'")
+        logger.info("finished update_many on '%s'", self.name)
         return CollectionUpdateResult(
             raw_results=um_responses,
             update_info=update_info,
@@ -2768,7 +2856,7 @@ class Collection(Generic[DOC]):
                 if v is not None
             }
         }
-        logger.info(f"findOneAndDelete on '{self.name}'")
+        logger.info("findOneAndDelete on '%s'", self.name)
         fo_response = self._converted_request(
             payload=fo_payload,
             timeout_context=_TimeoutContext(
@@ -2776,7 +2864,7 @@ class Collection(Generic[DOC]):
             ),
             caller_function_name="find_one_and_delete",
         )
-        logger.info(f"finished findOneAndDelete on '{self.name}'")
+        logger.info("finished findOneAndDelete on '%s'", self.name)
         if "document" in fo_response.get("data", {}):
             document = fo_response["data"]["document"]
             return document  # type: ignore[no-any-return]
@@ -2861,7 +2949,7 @@ class Collection(Generic[DOC]):
                 if v is not None
             }
         }
-        logger.info(f"deleteOne on '{self.name}'")
+        logger.info("deleteOne on '%s'", self.name)
         do_response = self._converted_request(
             payload=do_payload,
             timeout_context=_TimeoutContext(
@@ -2869,7 +2957,7 @@ class Collection(Generic[DOC]):
             ),
             caller_function_name="delete_one",
         )
-        logger.info(f"finished deleteOne on '{self.name}'")
+        logger.info("finished deleteOne on '%s'", self.name)
         if "deletedCount" in do_response.get("status", {}):
             deleted_count = do_response["status"]["deletedCount"]
             return CollectionDeleteResult(
@@ -2882,6 +2970,8 @@ class Collection(Generic[DOC]):
                 raw_response=do_response,
             )
 
+    @traced_operation("delete_many")
+    @with_operation_stats
     def delete_many(
         self,
         filter: FilterType,
@@ -2956,19 +3046,20 @@ class Collection(Generic[DOC]):
             timeout_label=_gmt_label,
         )
         this_dm_payload = {"deleteMany": {"filter": filter}}
-        logger.info(f"starting delete_many on '{self.name}'")
+        logger.info("starting delete_many on '%s'", self.name)
         while must_proceed:
-            logger.info(f"deleteMany on '{self.name}'")
-            this_dm_response = self._converted_request(
-                payload=this_dm_payload,
-                raise_api_errors=False,
-                timeout_context=timeout_manager.remaining_timeout(
-                    cap_time_ms=_request_timeout_ms,
-                    cap_timeout_label=_rt_label,
-                ),
-                caller_function_name="delete_many",
-            )
-            logger.info(f"finished deleteMany on '{self.name}'")
+            logger.info("deleteMany on '%s'", self.name)
+            with request_attributes(page_number=len(dm_responses) + 1):
+                this_dm_response = self._converted_request(
+                    payload=this_dm_payload,
+                    raise_api_errors=False,
+                    timeout_context=timeout_manager.remaining_timeout(
+                        cap_time_ms=_request_timeout_ms,
+                        cap_timeout_label=_rt_label,
+                    ),
+                    caller_function_name="delete_many",
+                )
+            logger.info("finished deleteMany on '%s'", self.name)
             # if errors, quit early
             if this_dm_response.get("errors", []):
                 partial_result = CollectionDeleteResult(
@@ -2994,12 +3085,123 @@ class Collection(Generic[DOC]):
                 deleted_count += this_dc
                 must_proceed = this_dm_response.get("status", {}).get("moreData", False)
 
-        logger.info(f"finished delete_many on '{self.name}'")
+        logger.info("finished delete_many on '%s'", self.name)
         return CollectionDeleteResult(
             deleted_count=deleted_count,
             raw_results=dm_responses,
         )
 
+    @traced_operation("bulk_write")
+    def bulk_write(
+        self,
+        requests: Iterable[BaseOperation],
+        *,
+        ordered: bool = False,
+        chunk_size: int | None = None,
+        concurrency: int | None = None,
+        general_method_timeout_ms: int | None = None,
+        request_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> CollectionBulkWriteResult:
+        """
+        Execute an arbitrary amount of operations such as inserts, updates, deletes
+        either sequentially or concurrently.
+        This is not an atomic operation.
+
+        Consecutive insertions (for unordered bulk writes: all insertions) are
+        coalesced into `insertMany` commands; all other operations are executed
+        as individual method calls.
+
+        Args:
+            requests: an iterable over concrete subclasses of `BaseOperation`,
+                such as `InsertOne`, `InsertMany`, `UpdateOne`, `UpdateMany`,
+                `ReplaceOne`, `DeleteOne`, `DeleteMany` (from `astrapy.operations`).
+            ordered: whether to launch the `requests` one after the other or
+                in arbitrary order, possibly in a concurrent fashion. An ordered
+                bulk write stops at the first failure, while an unordered one
+                tries to execute all operations in any case.
+            chunk_size: how many documents to include in a single `insertMany`
+                API request. Leave it unspecified (recommended) to use the
+                system default.
+            concurrency: maximum number of concurrent operations executing at
+                a given time. It cannot be more than one for ordered bulk writes.
+            general_method_timeout_ms: a timeout, in milliseconds, for the whole
+                bulk write. If not passed, the collection-level setting is used.
+            request_timeout_ms: a timeout, in milliseconds, for each API request.
+                If not passed, the collection-level setting is used instead.
+            timeout_ms: an alias for `general_method_timeout_ms`.
+
+        Returns:
+            A single CollectionBulkWriteResult summarizing the whole list of
+            requested operations. The keys in the maps (e.g. `inserted_ids`)
+            are the positions of the operations in the `requests` iterable.
+
+        Example:
+            >>> from astrapy.operations import DeleteOne, InsertOne, UpdateOne
+            >>> my_coll.bulk_write(
+            ...     [
+            ...         InsertOne({"_id": "a", "seq": 1}),
+            ...         InsertOne({"_id": "b", "seq": 2}),
+            ...         UpdateOne({"_id": "a"}, {"$inc": {"seq": 10}}),
+            ...         DeleteOne({"_id": "b"}),
+            ...     ],
+            ...     ordered=True,
+            ... )
+            CollectionBulkWriteResult(inserted_count=2, matched_count=1, modified_count=1, deleted_count=1, upserted_count=0, inserted_ids={0: ['a'], 1: ['b']}, raw_results=...)
+
+        Note:
+            If some of the operations fail, a `CollectionBulkWriteException` is
+            raised, carrying a partial result (accounting for the successful
+            operations), the root exceptions and a map from the position of
+            each failed operation to its error.
+        """
+
+        _general_method_timeout_ms, _gmt_label = _first_valid_timeout(
+            (general_method_timeout_ms, "general_method_timeout_ms"),
+            (timeout_ms, "timeout_ms"),
+            (
+                self.api_options.timeout_options.general_method_timeout_ms,
+                "general_method_timeout_ms",
+            ),
+        )
+        _request_timeout_ms, _ = _first_valid_timeout(
+            (request_timeout_ms, "request_timeout_ms"),
+            (self.api_options.timeout_options.request_timeout_ms, "request_timeout_ms"),
+        )
+        _chunk_size, _concurrency = _bulk_write_settings(
+            ordered=ordered,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+        units = _plan_bulk_write(
+            requests,
+            insertion_documents=_collection_insertion_documents,
+            ordered=ordered,
+            chunk_size=_chunk_size,
+        )
+        logger.info("bulk_write (%s units) on '%s'", len(units), self.name)
+        timeout_manager = MultiCallTimeoutManager(
+            overall_timeout_ms=_general_method_timeout_ms,
+            timeout_label=_gmt_label,
+        )
+        outcome = _execute_bulk_write(
+            self,
+            units,
+            ordered=ordered,
+            concurrency=_concurrency,
+            timeout_manager=timeout_manager,
+            request_timeout_ms=_request_timeout_ms,
+        )
+        bulk_write_result = _collection_bulk_write_result(outcome)
+        if outcome.operation_errors:
+            raise CollectionBulkWriteException(
+                partial_result=bulk_write_result,
+                exceptions=outcome.exceptions,
+                operation_errors=dict(sorted(outcome.operation_errors.items())),
+            )
+        logger.info("finished bulk_write on '%s'", self.name)
+        return bulk_write_result
+
     def drop(
         self,
         *,
@@ -3039,14 +3241,14 @@ class Collection(Generic[DOC]):
             which avoids using a deceased collection any further.
         """
 
-        logger.info(f"dropping collection '{self.name}' (self)")
+        logger.info("dropping collection '%s' (self)", self.name)
         self.database.drop_collection(
             self.name,
             collection_admin_timeout_ms=collection_admin_timeout_ms,
             request_timeout_ms=request_timeout_ms,
             timeout_ms=timeout_ms,
         )
-        logger.info(f"finished dropping collection '{self.name}' (self)")
+        logger.info("finished dropping collection '%s' (self)", self.name)
 
     def command(
         self,
@@ -3092,7 +3294,7 @@ class Collection(Generic[DOC]):
             _cmd_desc = ",".join(sorted(body.keys()))
         else:
             _cmd_desc = "(none)"
-        logger.info(f"command={_cmd_desc} on '{self.name}'")
+        logger.info("command=%s on '%s'", _cmd_desc, self.name)
         command_result = self._api_commander.request(
             payload=body,
             raise_api_errors=raise_api_errors,
@@ -3101,7 +3303,7 @@ class Collection(Generic[DOC]):
             ),
             caller_function_name="command",
         )
-        logger.info(f"finished command={_cmd_desc} on '{self.name}'")
+        logger.info("finished command=%s on '%s'", _cmd_desc, self.name)
         return command_result
 
 
@@ -3324,6 +3526,9 @@ class AsyncCollection(Generic[DOC]):
                 self.api_options.serdes_options.use_decimals_in_collections
             ),
             ca_cert_path=self.api_options.ca_cert_path,
+            connection_reuse_mode=self.api_options.connection_reuse_mode,
+            read_cache=self.api_options.read_cache,
+            metadata_cache=self.api_options.metadata_cache,
         )
         return api_commander
 
@@ -3541,7 +3746,7 @@ class AsyncCollection(Generic[DOC]):
             request_timeout_ms=request_timeout_ms,
             timeout_ms=timeout_ms,
         )
-        logger.info(f"getting collections in search of '{self.name}'")
+        logger.info("getting collections in search of '%s'", self.name)
         self_descriptors = [
             coll_desc
             for coll_desc in await self.database._list_collections_ctx(
@@ -3553,7 +3758,7 @@ class AsyncCollection(Generic[DOC]):
             )
             if coll_desc.name == self.name
         ]
-        logger.info(f"finished getting collections in search of '{self.name}'")
+        logger.info("finished getting collections in search of '%s'", self.name)
         if self_descriptors:
             return self_descriptors[0].definition
         else:
@@ -3727,7 +3932,7 @@ class AsyncCollection(Generic[DOC]):
             timeout_ms=timeout_ms,
         )
         io_payload = {"insertOne": {"document": document}}
-        logger.info(f"insertOne on '{self.name}'")
+        logger.info("insertOne on '%s'", self.name)
         io_response = await self._converted_request(
             payload=io_payload,
             timeout_context=_TimeoutContext(
@@ -3735,7 +3940,7 @@ class AsyncCollection(Generic[DOC]):
             ),
             caller_function_name="insert_one",
         )
-        logger.info(f"finished insertOne on '{self.name}'")
+        logger.info("finished insertOne on '%s'", self.name)
         if "insertedIds" in io_response.get("status", {}):
             if io_response["status"]["insertedIds"]:
                 inserted_id = io_response["status"]["insertedIds"][0]
@@ -3754,6 +3959,8 @@ class AsyncCollection(Generic[DOC]):
                 raw_response=io_response,
             )
 
+    @traced_operation("insert_many")
+    @with_operation_stats
     async def insert_many(
         self,
         documents: Iterable[DOC],
@@ -3882,7 +4089,7 @@ class AsyncCollection(Generic[DOC]):
         else:
             _chunk_size = chunk_size
         _documents = list(documents)
-        logger.info(f"inserting {len(_documents)} documents in '{self.name}'")
+        logger.info("inserting %s documents in '%s'", len(_documents), self.name)
         raw_results: list[dict[str, Any]] = []
         im_payloads: list[dict[str, Any]] = []
         timeout_manager = MultiCallTimeoutManager(
@@ -3899,17 +4106,18 @@ class AsyncCollection(Generic[DOC]):
                         "options": options,
                     },
                 }
-                logger.info(f"insertMany(chunk) on '{self.name}'")
-                chunk_response = await self._converted_request(
-                    payload=im_payload,
-                    raise_api_errors=False,
-                    timeout_context=timeout_manager.remaining_timeout(
-                        cap_time_ms=_request_timeout_ms,
-                        cap_timeout_label=_rt_label,
-                    ),
-                    caller_function_name="insert_many",
-                )
-                logger.info(f"finished insertMany(chunk) on '{self.name}'")
+                logger.info("insertMany(chunk) on '%s'", self.name)
+                with request_attributes(chunk_index=i // _chunk_size):
+                    chunk_response = await self._converted_request(
+                        payload=im_payload,
+                        raise_api_errors=False,
+                        timeout_context=timeout_manager.remaining_timeout(
+                            cap_time_ms=_request_timeout_ms,
+                            cap_timeout_label=_rt_label,
+                        ),
+                        caller_function_name="insert_many",
+                    )
+                logger.info("finished insertMany(chunk) on '%s'", self.name)
                 # accumulate the results in this call
                 chunk_inserted_ids = [
                     doc_resp["_id"]
@@ -3937,7 +4145,7 @@ class AsyncCollection(Generic[DOC]):
                 inserted_ids=inserted_ids,
             )
             logger.info(
-                f"finished inserting {len(_documents)} documents in '{self.name}'"
+                "finished inserting %s documents in '%s'", len(_documents), self.name
             )
             return full_result
 
@@ -3948,40 +4156,46 @@ class AsyncCollection(Generic[DOC]):
             sem = asyncio.Semaphore(_concurrency)
 
             async def concurrent_insert_chunk(
+                chunk_index: int,
                 document_chunk: list[DOC],
             ) -> tuple[dict[str, Any], dict[str, Any]]:
-                async with sem:
+                async with timed_slot(sem):
                     im_payload = {
                         "insertMany": {
                             "documents": document_chunk,
                             "options": options,
                         },
                     }
-                    logger.info(f"insertMany(chunk) on '{self.name}'")
-                    im_response = await self._converted_request(
-                        payload=im_payload,
-                        raise_api_errors=False,
-                        timeout_context=timeout_manager.remaining_timeout(
-                            cap_time_ms=_request_timeout_ms,
-                            cap_timeout_label=_rt_label,
-                        ),
-                        caller_function_name="insert_many",
-                    )
-                    logger.info(f"finished insertMany(chunk) on '{self.name}'")
+                    logger.info("insertMany(chunk) on '%s'", self.name)
+                    with request_attributes(chunk_index=chunk_index):
+                        im_response = await self._converted_request(
+                            payload=im_payload,
+                            raise_api_errors=False,
+                            timeout_context=timeout_manager.remaining_timeout(
+                                cap_time_ms=_request_timeout_ms,
+                                cap_timeout_label=_rt_label,
+                            ),
+                            caller_function_name="insert_many",
+                        )
+                    logger.info("finished insertMany(chunk) on '%s'", self.name)
                     return im_payload, im_response
 
             raw_pl_results_pairs: list[tuple[dict[str, Any], dict[str, Any]]]
             if _concurrency > 1:
                 tasks = [
                     asyncio.create_task(
-                        concurrent_insert_chunk(_documents[i : i + _chunk_size])
+                        concurrent_insert_chunk(
+                            i // _chunk_size, _documents[i : i + _chunk_size]
+                        )
                     )
                     for i in range(0, len(_documents), _chunk_size)
                 ]
                 raw_pl_results_pairs = await asyncio.gather(*tasks)
             else:
                 raw_pl_results_pairs = [
-                    await concurrent_insert_chunk(_documents[i : i + _chunk_size])
+                    await concurrent_insert_chunk(
+                        i // _chunk_size, _documents[i : i + _chunk_size]
+                    )
                     for i in range(0, len(_documents), _chunk_size)
                 ]
 
@@ -4021,7 +4235,7 @@ class AsyncCollection(Generic[DOC]):
                 inserted_ids=inserted_ids,
             )
             logger.info(
-                f"finished inserting {len(_documents)} documents in '{self.name}'"
+                "finished inserting %s documents in '%s'", len(_documents), self.name
             )
             return full_result
 
@@ -4419,6 +4633,62 @@ class AsyncCollection(Generic[DOC]):
             return None
         return fo_response["data"]["document"]  # type: ignore[no-any-return]
 
+    def loader(
+        self,
+        *,
+        projection: ProjectionType | None = None,
+        max_batch_size: int | None = None,
+        batch_window_ms: int | None = None,
+        concurrency: int | None = None,
+        request_timeout_ms: int | None = None,
+    ) -> AsyncCollectionLoader[DOC]:
+        """
+        Create a loader for batched lookups of documents by `_id`.
+
+        Individual lookups made through the loader within a short time window
+        are collected and sent as `$in` queries, in batches running concurrently.
+        This greatly reduces the number of requests compared to issuing one
+        `find_one` per document, when many lookups are made at the same time.
+
+        Args:
+            projection: a projection to apply to the documents. The `_id`
+                is always included, as it is needed to match documents to lookups.
+            max_batch_size: the maximum number of keys in a single `$in` query.
+                It cannot exceed the maximum allowed by the Data API. The default
+                matches the size of a page of `find` results, so that each batch
+                takes a single request: larger batches are fetched page by page.
+            batch_window_ms: how long, in milliseconds, to wait for more lookups
+                before sending a batch. The default of zero means that all lookups
+                made within the same event-loop iteration are batched together.
+            concurrency: the maximum number of batches running at the same time.
+            request_timeout_ms: a timeout, in milliseconds, for each API request.
+                If not provided, this object's defaults apply.
+
+        Returns:
+            an AsyncCollectionLoader object, whose `load` and `load_many` methods return
+            the documents (or None when not found).
+
+        Example:
+            >>> async def get_two(loader):
+            ...     return await asyncio.gather(
+            ...         loader.load("doc1"),
+            ...         loader.load("doc2"),
+            ...     )
+            ...
+            >>> asyncio.run(get_two(my_async_coll.loader()))
+            [{'_id': 'doc1', 'seq': 1}, {'_id': 'doc2', 'seq': 2}]
+        """
+
+        return AsyncCollectionLoader(
+            self,
+            projection=projection,
+            max_batch_size=max_batch_size,
+            batch_window_ms=batch_window_ms,
+            concurrency=concurrency,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+    @traced_operation("distinct")
     async def distinct(
         self,
         key: str | Iterable[str | int],
@@ -4539,7 +4809,7 @@ class AsyncCollection(Generic[DOC]):
         # consuming it:
         _item_hashes = set()
         distinct_items: list[Any] = []
-        logger.info(f"running distinct() on '{self.name}'")
+        logger.info("running distinct() on '%s'", self.name)
         async for document in f_cursor:
             for item in _extractor(document):
                 _item_hash = _hash_collection_document(
@@ -4548,7 +4818,7 @@ class AsyncCollection(Generic[DOC]):
                 if _item_hash not in _item_hashes:
                     _item_hashes.add(_item_hash)
                     distinct_items.append(item)
-        logger.info(f"finished running distinct() on '{self.name}'")
+        logger.info("finished running distinct() on '%s'", self.name)
         return distinct_items
 
     @overload
@@ -4824,7 +5094,7 @@ class AsyncCollection(Generic[DOC]):
             timeout_ms=timeout_ms,
         )
         cd_payload = {"countDocuments": {"filter": filter}}
-        logger.info(f"countDocuments on '{self.name}'")
+        logger.info("countDocuments on '%s'", self.name)
         cd_response = await self._converted_request(
             payload=cd_payload,
             timeout_context=_TimeoutContext(
@@ -4832,7 +5102,7 @@ class AsyncCollection(Generic[DOC]):
             ),
             caller_function_name="count_documents",
         )
-        logger.info(f"finished countDocuments on '{self.name}'")
+        logger.info("finished countDocuments on '%s'", self.name)
         if "count" in cd_response.get("status", {}):
             count: int = cd_response["status"]["count"]
             if cd_response["status"].get("moreData", False):
@@ -4891,7 +5161,7 @@ class AsyncCollection(Generic[DOC]):
             timeout_ms=timeout_ms,
         )
         ed_payload: dict[str, Any] = {"estimatedDocumentCount": {}}
-        logger.info(f"estimatedDocumentCount on '{self.name}'")
+        logger.info("estimatedDocumentCount on '%s'", self.name)
         ed_response = await self._converted_request(
             payload=ed_payload,
             timeout_context=_TimeoutContext(
@@ -4899,7 +5169,7 @@ class AsyncCollection(Generic[DOC]):
             ),
             caller_function_name="estimated_document_count",
         )
-        logger.info(f"finished estimatedDocumentCount on '{self.name}'")
+        logger.info("finished estimatedDocumentCount on '%s'", self.name)
         if "count" in ed_response.get("status", {}):
             count: int = ed_response["status"]["count"]
             return count
@@ -5045,7 +5315,7 @@ class AsyncCollection(Generic[DOC]):
                 if v is not None
             }
         }
-        logger.info(f"findOneAndReplace on '{self.name}'")
+        logger.info("findOneAndReplace on '%s'", self.name)
         fo_response = await self._converted_request(
             payload=fo_payload,
             timeout_context=_TimeoutContext(
@@ -5053,7 +5323,7 @@ class AsyncCollection(Generic[DOC]):
             ),
             caller_function_name="find_one_and_replace",
         )
-        logger.info(f"finished findOneAndReplace on '{self.name}'")
+        logger.info("finished findOneAndReplace on '%s'", self.name)
         if "document" in fo_response.get("data", {}):
             ret_document = fo_response.get("data", {}).get("document")
             if ret_document is None:
@@ -5163,7 +5433,7 @@ class AsyncCollection(Generic[DOC]):
                 if v is not None
             }
         }
-        logger.info(f"findOneAndReplace on '{self.name}'")
+        logger.info("findOneAndReplace on '%s'", self.name)
         fo_response = await self._converted_request(
             payload=fo_payload,
             timeout_context=_TimeoutContext(
@@ -5171,7 +5441,7 @@ class AsyncCollection(Generic[DOC]):
             ),
             caller_function_name="replace_one",
         )
-        logger.info(f"finished findOneAndReplace on '{self.name}'")
+        logger.info("finished findOneAndReplace on '%s'", self.name)
         if "document" in fo_response.get("data", {}):
             fo_status = fo_response.get("status") or {}
             _update_info = _prepare_update_info([fo_status])
@@ -5323,7 +5593,7 @@ class AsyncCollection(Generic[DOC]):
                 if v is not None
             }
         }
-        logger.info(f"findOneAndUpdate on '{self.name}'")
+        logger.info("findOneAndUpdate on '%s'", self.name)
         fo_response = await self._converted_request(
             payload=fo_payload,
             timeout_context=_TimeoutContext(
@@ -5331,7 +5601,7 @@ class AsyncCollection(Generic[DOC]):
             ),
             caller_function_name="find_one_and_update",
         )
-        logger.info(f"finished findOneAndUpdate on '{self.name}'")
+        logger.info("finished findOneAndUpdate on '%s'", self.name)
         if "document" in fo_response.get("data", {}):
             ret_document = fo_response.get("data", {}).get("document")
             if ret_document is None:
@@ -5444,7 +5714,7 @@ class AsyncCollection(Generic[DOC]):
                 if v is not None
             }
         }
-        logger.info(f"updateOne on '{self.name}'")
+        logger.info("updateOne on '%s'", self.name)
         uo_response = await self._converted_request(
             payload=uo_payload,
             timeout_context=_TimeoutContext(
@@ -5452,7 +5722,7 @@ class AsyncCollection(Generic[DOC]):
             ),
             caller_function_name="update_one",
         )
-        logger.info(f"finished updateOne on '{self.name}'")
+        logger.info("finished updateOne on '%s'", self.name)
         if "status" in uo_response:
             uo_status = uo_response["status"]
             _update_info = _prepare_update_info([uo_status])
@@ -5466,6 +5736,8 @@ class AsyncCollection(Generic[DOC]):
                 raw_response=uo_response,
             )
 
+    @traced_operation("update_many")
+    @with_operation_stats
     async def update_many(
         self,
         filter: FilterType,
@@ -5567,7 +5839,7 @@ class AsyncCollection(Generic[DOC]):
         um_responses: list[dict[str, Any]] = []
         um_statuses: list[dict[str, Any]] = []
         must_proceed = True
-        logger.info(f"starting update_many on '{self.name}'")
+        logger.info("starting update_many on '%s'", self.name)
         timeout_manager = MultiCallTimeoutManager(
             overall_timeout_ms=_general_method_timeout_ms,
             timeout_label=_gmt_label,
@@ -5585,17 +5857,18 @@ class AsyncCollection(Generic[DOC]):
                     if v is not None
                 }
             }
-            logger.info(f"updateMany on '{self.name}'")
-            this_um_response = await self._converted_request(
-                payload=this_um_payload,
-                raise_api_errors=False,
-                timeout_context=timeout_manager.remaining_timeout(
-                    cap_time_ms=_request_timeout_ms,
-                    cap_timeout_label=_rt_label,
-                ),
-                caller_function_name="update_many",
-            )
-            logger.info(f"finished updateMany on '{self.name}'")
+            logger.info("updateMany on '%s'", self.name)
+            with request_attributes(page_number=len(um_responses) + 1):
+                this_um_response = await self._converted_request(
+                    payload=this_um_payload,
+                    raise_api_errors=False,
+                    timeout_context=timeout_manager.remaining_timeout(
+                        cap_time_ms=_request_timeout_ms,
+                        cap_timeout_label=_rt_label,
+                    ),
+                    caller_function_name="update_many",
+                )
+            logger.info("finished updateMany on '%s'", self.name)
             this_um_status = this_um_response.get("status") or {}
             #
             # if errors, quit early
@@ -5630,7 +5903,7 @@ class AsyncCollection(Generic[DOC]):
                     page_state_options = {}
 
         update_info = _prepare_update_info(um_statuses)
-        logger.info(f"finished update_many on '{self.name}'")
+        logger.info("finished update_many on '%s'", self.name)
         return CollectionUpdateResult(
             raw_results=um_responses,
             update_info=update_info,
@@ -5734,7 +6007,7 @@ class AsyncCollection(Generic[DOC]):
                 if v is not None
             }
         }
-        logger.info(f"findOneAndDelete on '{self.name}'")
+        logger.info("findOneAndDelete on '%s'", self.name)
         fo_response = await self._converted_request(
             payload=fo_payload,
             timeout_context=_TimeoutContext(
@@ -5742,7 +6015,7 @@ class AsyncCollection(Generic[DOC]):
             ),
             caller_function_name="find_one_and_delete",
         )
-        logger.info(f"finished findOneAndDelete on '{self.name}'")
+        logger.info("finished findOneAndDelete on '%s'", self.name)
         if "document" in fo_response.get("data", {}):
             document = fo_response["data"]["document"]
             return document  # type: ignore[no-any-return]
@@ -5833,7 +6106,7 @@ class AsyncCollection(Generic[DOC]):
                 if v is not None
             }
         }
-        logger.info(f"deleteOne on '{self.name}'")
+        logger.info("deleteOne on '%s'", self.name)
         do_response = await self._converted_request(
             payload=do_payload,
             timeout_context=_TimeoutContext(
@@ -5841,7 +6114,7 @@ class AsyncCollection(Generic[DOC]):
             ),
             caller_function_name="delete_one",
         )
-        logger.info(f"finished deleteOne on '{self.name}'")
+        logger.info("finished deleteOne on '%s'", self.name)
         if "deletedCount" in do_response.get("status", {}):
             deleted_count = do_response["status"]["deletedCount"]
             return CollectionDeleteResult(
@@ -5854,6 +6127,8 @@ class AsyncCollection(Generic[DOC]):
                 raw_response=do_response,
             )
 
+    @traced_operation("delete_many")
+    @with_operation_stats
     async def delete_many(
         self,
         filter: FilterType,
@@ -5935,19 +6210,20 @@ class AsyncCollection(Generic[DOC]):
             timeout_label=_gmt_label,
         )
         this_dm_payload = {"deleteMany": {"filter": filter}}
-        logger.info(f"starting delete_many on '{self.name}'")
+        logger.info("starting delete_many on '%s'", self.name)
         while must_proceed:
-            logger.info(f"deleteMany on '{self.name}'")
-            this_dm_response = await self._converted_request(
-                payload=this_dm_payload,
-                raise_api_errors=False,
-                timeout_context=timeout_manager.remaining_timeout(
-                    cap_time_ms=_request_timeout_ms,
-                    cap_timeout_label=_rt_label,
-                ),
-                caller_function_name="delete_many",
-            )
-            logger.info(f"finished deleteMany on '{self.name}'")
+            logger.info("deleteMany on '%s'", self.name)
+            with request_attributes(page_number=len(dm_responses) + 1):
+                this_dm_response = await self._converted_request(
+                    payload=this_dm_payload,
+                    raise_api_errors=False,
+                    timeout_context=timeout_manager.remaining_timeout(
+                        cap_time_ms=_request_timeout_ms,
+                        cap_timeout_label=_rt_label,
+                    ),
+                    caller_function_name="delete_many",
+                )
+            logger.info("finished deleteMany on '%s'", self.name)
             # if errors, quit early
             if this_dm_response.get("errors", []):
                 partial_result = CollectionDeleteResult(
@@ -5973,12 +6249,123 @@ class AsyncCollection(Generic[DOC]):
                 deleted_count += this_dc
                 must_proceed = this_dm_response.get("status", {}).get("moreData", False)
 
-        logger.info(f"finished delete_many on '{self.name}'")
+        logger.info("finished delete_many on '%s'", self.name)
         return CollectionDeleteResult(
             deleted_count=deleted_count,
             raw_results=dm_responses,
         )
 
+    @traced_operation("bulk_write")
+    async def bulk_write(
+        self,
+        requests: Iterable[BaseOperation],
+        *,
+        ordered: bool = False,
+        chunk_size: int | None = None,
+        concurrency: int | None = None,
+        general_method_timeout_ms: int | None = None,
+        request_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> CollectionBulkWriteResult:
+        """
+        Execute an arbitrary amount of operations such as inserts, updates, deletes
+        either sequentially or concurrently.
+        This is not an atomic operation.
+
+        Consecutive insertions (for unordered bulk writes: all insertions) are
+        coalesced into `insertMany` commands; all other operations are executed
+        as individual method calls.
+
+        Args:
+            requests: an iterable over concrete subclasses of `BaseOperation`,
+                such as `InsertOne`, `InsertMany`, `UpdateOne`, `UpdateMany`,
+                `ReplaceOne`, `DeleteOne`, `DeleteMany` (from `astrapy.operations`).
+            ordered: whether to launch the `requests` one after the other or
+                in arbitrary order, possibly in a concurrent fashion. An ordered
+                bulk write stops at the first failure, while an unordered one
+                tries to execute all operations in any case.
+            chunk_size: how many documents to include in a single `insertMany`
+                API request. Leave it unspecified (recommended) to use the
+                system default.
+            concurrency: maximum number of concurrent operations executing at
+                a given time. It cannot be more than one for ordered bulk writes.
+            general_method_timeout_ms: a timeout, in milliseconds, for the whole
+                bulk write. If not passed, the collection-level setting is used.
+            request_timeout_ms: a timeout, in milliseconds, for each API request.
+                If not passed, the collection-level setting is used instead.
+            timeout_ms: an alias for `general_method_timeout_ms`.
+
+        Returns:
+            A single CollectionBulkWriteResult summarizing the whole list of
+            requested operations. The keys in the maps (e.g. `inserted_ids`)
+            are the positions of the operations in the `requests` iterable.
+
+        Example:
+            >>> from astrapy.operations import DeleteOne, InsertOne, UpdateOne
+            >>> asyncio.run(my_async_coll.bulk_write(
+            ...     [
+            ...         InsertOne({"_id": "a", "seq": 1}),
+            ...         InsertOne({"_id": "b", "seq": 2}),
+            ...         UpdateOne({"_id": "a"}, {"$inc": {"seq": 10}}),
+            ...         DeleteOne({"_id": "b"}),
+            ...     ],
+            ...     ordered=True,
+            ... ))
+            CollectionBulkWriteResult(inserted_count=2, matched_count=1, modified_count=1, deleted_count=1, upserted_count=0, inserted_ids={0: ['a'], 1: ['b']}, raw_results=...)
+
+        Note:
+            If some of the operations fail, a `CollectionBulkWriteException` is
+            raised, carrying a partial result (accounting for the successful
+            operations), the root exceptions and a map from the position of
+            each failed operation to its error.
+        """
+
+        _general_method_timeout_ms, _gmt_label = _first_valid_timeout(
+            (general_method_timeout_ms, "general_method_timeout_ms"),
+            (timeout_ms, "timeout_ms"),
+            (
+                self.api_options.timeout_options.general_method_timeout_ms,
+                "general_method_timeout_ms",
+            ),
+        )
+        _request_timeout_ms, _ = _first_valid_timeout(
+            (request_timeout_ms, "request_timeout_ms"),
+            (self.api_options.timeout_options.request_timeout_ms, "request_timeout_ms"),
+        )
+        _chunk_size, _concurrency = _bulk_write_settings(
+            ordered=ordered,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+        units = _plan_bulk_write(
+            requests,
+            insertion_documents=_collection_insertion_documents,
+            ordered=ordered,
+            chunk_size=_chunk_size,
+        )
+        logger.info("bulk_write (%s units) on '%s'", len(units), self.name)
+        timeout_manager = MultiCallTimeoutManager(
+            overall_timeout_ms=_general_method_timeout_ms,
+            timeout_label=_gmt_label,
+        )
+        outcome = await _aexecute_bulk_write(
+            self,
+            units,
+            ordered=ordered,
+            concurrency=_concurrency,
+            timeout_manager=timeout_manager,
+            request_timeout_ms=_request_timeout_ms,
+        )
+        bulk_write_result = _collection_bulk_write_result(outcome)
+        if outcome.operation_errors:
+            raise CollectionBulkWriteException(
+                partial_result=bulk_write_result,
+                exceptions=outcome.exceptions,
+                operation_errors=dict(sorted(outcome.operation_errors.items())),
+            )
+        logger.info("finished bulk_write on '%s'", self.name)
+        return bulk_write_result
+
     async def drop(
         self,
         *,
@@ -6024,14 +6411,14 @@ class AsyncCollection(Generic[DOC]):
             which avoids using a deceased collection any further.
         """
 
-        logger.info(f"dropping collection '{self.name}' (self)")
+        logger.info("dropping collection '%s' (self)", self.name)
         await self.database.drop_collection(
             self.name,
             collection_admin_timeout_ms=collection_admin_timeout_ms,
             request_timeout_ms=request_timeout_ms,
             timeout_ms=timeout_ms,
         )
-        logger.info(f"finished dropping collection '{self.name}' (self)")
+        logger.info("finished dropping collection '%s' (self)", self.name)
 
     async def command(
         self,
@@ -6079,7 +6466,7 @@ class AsyncCollection(Generic[DOC]):
             _cmd_desc = ",".join(sorted(body.keys()))
         else:
             _cmd_desc = "(none)"
-        logger.info(f"command={_cmd_desc} on '{self.name}'")
+        logger.info("command=%s on '%s'", _cmd_desc, self.name)
         command_result = await self._api_commander.async_request(
             payload=body,
             raise_api_errors=raise_api_errors,
@@ -6088,5 +6475,5 @@ class AsyncCollection(Generic[DOC]):
             ),
             caller_function_name="command",
         )
-        logger.info(f"finished command={_cmd_desc} on '{self.name}'")
+        logger.info("finished command=%s on '%s'", _cmd_desc, self.name)
         return command_result
@@ -0,0 +1,477 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, overload
+
+from astrapy import AsyncCollection, AsyncTable, Collection, Table
+from astrapy.constants import DOC, ROW, normalize_optional_projection
+from astrapy.data.cursors.cursor import CursorState
+from astrapy.data.utils.collection_converters import preprocess_collection_payload
+from astrapy.data.utils.table_converters import preprocess_table_payload
+from astrapy.exceptions import CursorException
+from astrapy.utils.api_commander import APICommander
+from astrapy.utils.file_utils import _atomic_write_text
+from astrapy.utils.unset import _UNSET
+
+if TYPE_CHECKING:
+    from astrapy.data.cursors.find_cursor import (
+        AsyncCollectionFindCursor,
+        AsyncTableFindCursor,
+        CollectionFindCursor,
+        TableFindCursor,
+    )
+
+
+CHECKPOINT_SOURCE_COLLECTION = "collection"
+CHECKPOINT_SOURCE_TABLE = "table"
+CHECKPOINT_FORMAT_VERSION = 1
+
+
+@dataclass
+class CursorCheckpoint:
+    """
+    A snapshot of the progress of a find cursor (on a collection or a table),
+    taken at a page boundary, containing all that is needed to build an
+    equivalent cursor resuming the scan from that point on.
+
+    The query settings (filter, projection, sort) are stored in the same
+    JSON-ready form as they are sent to the Data API, so that a checkpoint
+    can be persisted and read back e.g. from a file.
+    A checkpoint does not record mapping functions set on the cursor: these,
+    if needed, must be re-applied to the resumed cursor.
+
+    Attributes:
+        source_type: either "collection" or "table".
+        keyspace: the keyspace of the collection/table the cursor reads from.
+        source_name: the name of the collection/table the cursor reads from.
+        filter: the filter of the find operation, in its JSON-ready form.
+        projection: the projection of the find operation, in its JSON-ready form.
+        sort: the sort clause of the find operation, in its JSON-ready form.
+        limit: the limit setting for the find operation.
+        skip: the skip setting for the find operation.
+        include_similarity: the include_similarity setting for the find operation.
+        include_sort_vector: the include_sort_vector setting for the find operation.
+        request_timeout_ms: the per-request timeout set on the cursor.
+        page_state: the page state from which the scan is to be resumed.
+            If None, the scan resumes from the start (unless `exhausted` is True).
+        consumed: how many items had been consumed when the checkpoint was taken.
+        pages_retrieved: how many pages had been retrieved at checkpoint time.
+        exhausted: whether the cursor had been fully consumed (or closed).
+    """
+
+    source_type: str
+    keyspace: str
+    source_name: str
+    filter: dict[str, Any] | None
+    projection: dict[str, Any] | None
+    sort: dict[str, Any] | None
+    limit: int | None
+    skip: int | None
+    include_similarity: bool | None
+    include_sort_vector: bool | None
+    request_timeout_ms: int | None
+    page_state: str | None
+    consumed: int
+    pages_retrieved: int
+    exhausted: bool
+
+    def __repr__(self) -> str:
+        pieces = [
+            pc
+            for pc in (
+                f"{self.source_type}={self.keyspace}.{self.source_name}",
+                "page_state=..." if self.page_state else None,
+                f"consumed={self.consumed}",
+                f"pages_retrieved={self.pages_retrieved}",
+                "exhausted=True" if self.exhausted else None,
+            )
+            if pc is not None
+        ]
+        return f"{self.__class__.__name__}({', '.join(pieces)})"
+
+    def as_dict(self) -> dict[str, Any]:
+        """Recast this object into a dictionary."""
+
+        return {
+            "version": CHECKPOINT_FORMAT_VERSION,
+            "sourceType": self.source_type,
+            "keyspace": self.keyspace,
+            "sourceName": self.source_name,
+            "filter": self.filter,
+            "projection": self.projection,
+            "sort": self.sort,
+            "limit": self.limit,
+            "skip": self.skip,
+            "includeSimilarity": self.include_similarity,
+            "includeSortVector": self.include_sort_vector,
+            "requestTimeoutMs": self.request_timeout_ms,
+            "pageState": self.page_state,
+            "consumed": self.consumed,
+            "pagesRetrieved": self.pages_retrieved,
+            "exhausted": self.exhausted,
+        }
+
+    @classmethod
+    def _from_dict(cls, raw_dict: dict[str, Any]) -> CursorCheckpoint:
+        """
+        Create an instance of CursorCheckpoint from a dictionary
+        such as one obtained from `as_dict`.
+        """
+
+        if raw_dict.get("version") != CHECKPOINT_FORMAT_VERSION:
+            raise ValueError(
+                "Unsupported cursor checkpoint format version: "
+                f"'{raw_dict.get('version')}'."
+            )
+        if raw_dict.get("sourceType") not in {
+            CHECKPOINT_SOURCE_COLLECTION,
+            CHECKPOINT_SOURCE_TABLE,
+        }:
+            raise ValueError(
+                f"Unknown cursor checkpoint source type: '{raw_dict.get('sourceType')}'."
+            )
+        return CursorCheckpoint(
+            source_type=raw_dict["sourceType"],
+            keyspace=raw_dict["keyspace"],
+            source_name=raw_dict["sourceName"],
+            filter=raw_dict.get("filter"),
+            projection=raw_dict.get("projection"),
+            sort=raw_dict.get("sort"),
+            limit=raw_dict.get("limit"),
+            skip=raw_dict.get("skip"),
+            include_similarity=raw_dict.get("includeSimilarity"),
+            include_sort_vector=raw_dict.get("includeSortVector"),
+            request_timeout_ms=raw_dict.get("requestTimeoutMs"),
+            page_state=raw_dict.get("pageState"),
+            consumed=raw_dict["consumed"],
+            pages_retrieved=raw_dict["pagesRetrieved"],
+            exhausted=raw_dict["exhausted"],
+        )
+
+    def to_json(self) -> str:
+        """Serialize this checkpoint to a JSON string."""
+
+        return APICommander._decimal_aware_encode_payload(self.as_dict()) or ""
+
+    @classmethod
+    def from_json(cls, json_string: str) -> CursorCheckpoint:
+        """
+        Create a checkpoint from a JSON string such as one obtained from `to_json`.
+        """
+
+        raw_dict = json.loads(json_string)
+        if raw_dict.get("sourceType") == CHECKPOINT_SOURCE_TABLE:
+            # tables admit Decimal values, which must be read back as such
+            raw_dict = json.loads(json_string, parse_float=Decimal)
+        return cls._from_dict(raw_dict)
+
+    @overload
+    def resume(self, source: Collection[DOC]) -> CollectionFindCursor[DOC, DOC]: ...
+
+    @overload
+    def resume(
+        self, source: AsyncCollection[DOC]
+    ) -> AsyncCollectionFindCursor[DOC, DOC]: ...
+
+    @overload
+    def resume(self, source: Table[ROW]) -> TableFindCursor[ROW, ROW]: ...
+
+    @overload
+    def resume(self, source: AsyncTable[ROW]) -> AsyncTableFindCursor[ROW, ROW]: ...
+
+    def resume(self, source: Any) -> Any:
+        """
+        Build a cursor equivalent to the one this checkpoint was taken from,
+        positioned to continue the scan from the checkpoint.
+
+        The new cursor issues the very same requests as the original cursor
+        would have issued. Its `consumed` count starts from the checkpointed value.
+        If the checkpoint marks an exhausted cursor, the returned cursor is CLOSED.
+
+        Args:
+            source: a Collection, AsyncCollection, Table or AsyncTable matching
+                the one that originated the checkpointed cursor.
+
+        Returns:
+            a find cursor (of the type matching the provided `source`). No mapping
+            function is set on it.
+
+        Example:
+            >>> store = FileCursorCheckpointStore("scan.checkpoint")
+            >>> checkpoint = store.load()
+            >>> if checkpoint is None:
+            ...     cursor = my_collection.find({"category": "x"})
+            ... else:
+            ...     cursor = checkpoint.resume(my_collection)
+            ...
+            >>> for document in cursor.iter_with_checkpoints(store):
+            ...     process(document)
+        """
+
+        source_type = _source_type_of(source)
+        if (
+            source_type != self.source_type
+            or source.name != self.source_name
+            or source.keyspace != self.keyspace
+        ):
+            raise ValueError(
+                "Cannot resume a cursor checkpoint taken on "
+                f"{self.source_type} '{self.keyspace}.{self.source_name}' from "
+                f"{source_type} '{source.keyspace}.{source.name}'."
+            )
+        cursor = source.find(
+            self.filter,
+            projection=self.projection,
+            skip=self.skip,
+            limit=self.limit,
+            initial_page_state=self.page_state
+            if self.page_state is not None
+            else _UNSET,
+            include_similarity=self.include_similarity,
+            include_sort_vector=self.include_sort_vector,
+            sort=self.sort,
+            request_timeout_ms=self.request_timeout_ms,
+        )
+        cursor._consumed = self.consumed
+        cursor._pages_retrieved = self.pages_retrieved
+        if self.exhausted:
+            cursor.close()
+        return cursor
+
+
+class CursorCheckpointStore(ABC):
+    """
+    A place where cursor checkpoints are persisted. Subclass this to
+    checkpoint cursors to any storage (e.g. a key-value store or a database).
+
+    A store holds (at most) one checkpoint, corresponding to one scan:
+    each `save` must atomically replace the previously saved checkpoint.
+    """
+
+    @abstractmethod
+    def save(self, checkpoint: CursorCheckpoint) -> None:
+        """Persist a checkpoint, replacing the previous one if any."""
+        ...
+
+    @abstractmethod
+    def load(self) -> CursorCheckpoint | None:
+        """Read back the saved checkpoint, or None if there is none."""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove the saved checkpoint, if any."""
+        ...
+
+
+class InMemoryCursorCheckpointStore(CursorCheckpointStore):
+    """
+    A checkpoint store that keeps the checkpoint in memory. This is mostly useful
+    for testing and to inspect the progress of a scan from another thread.
+    """
+
+    checkpoint: CursorCheckpoint | None
+
+    def __init__(self) -> None:
+        self.checkpoint = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.checkpoint})"
+
+    def save(self, checkpoint: CursorCheckpoint) -> None:
+        self.checkpoint = checkpoint
+
+    def load(self) -> CursorCheckpoint | None:
+        return self.checkpoint
+
+    def clear(self) -> None:
+        self.checkpoint = None
+
+
+class FileCursorCheckpointStore(CursorCheckpointStore):
+    """
+    A checkpoint store writing the checkpoint, as JSON, to a local file.
+
+    Each save writes to a temporary file in the same directory, flushes it
+    to disk and then atomically renames it over the checkpoint file:
+    a crash at any time leaves either the previous or the new checkpoint in place.
+
+    Args:
+        path: the path to the checkpoint file.
+    """
+
+    path: str
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}("{self.path}")'
+
+    def save(self, checkpoint: CursorCheckpoint) -> None:
+        _atomic_write_text(self.path, checkpoint.to_json())
+
+    def load(self) -> CursorCheckpoint | None:
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, encoding="utf-8") as i_file:
+            return CursorCheckpoint.from_json(i_file.read())
+
+    def clear(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _source_type_of(source: Any) -> str:
+    if isinstance(source, Collection | AsyncCollection):
+        return CHECKPOINT_SOURCE_COLLECTION
+    if isinstance(source, Table | AsyncTable):
+        return CHECKPOINT_SOURCE_TABLE
+    raise TypeError(
+        f"Cursor checkpoints require a collection or a table, not {type(source)}."
+    )
+
+
+def _checkpoint_from_find_cursor(cursor: Any) -> CursorCheckpoint:
+    """
+    Take a checkpoint of any find cursor (sync/async, collection/table).
+    This is only possible when the cursor buffer is empty, i.e. at page boundaries.
+    """
+
+    if cursor._buffer:
+        raise CursorException(
+            text=(
+                "A checkpoint can only be taken when the cursor has fully "
+                "consumed its current page (i.e. with an empty buffer)."
+            ),
+            cursor_state=cursor._state.value,
+        )
+    source = cursor.data_source
+    source_type = _source_type_of(source)
+    query_subpayload = {
+        "filter": cursor._filter,
+        "projection": normalize_optional_projection(cursor._projection),
+        "sort": cursor._sort,
+    }
+    wire_query: dict[str, Any] | None
+    if source_type == CHECKPOINT_SOURCE_COLLECTION:
+        wire_query = preprocess_collection_payload(
+            query_subpayload,
+            options=source.api_options.serdes_options,
+        )
+    else:
+        wire_query = preprocess_table_payload(
+            query_subpayload,
+            options=source.api_options.serdes_options,
+            map2tuple_checker=None,
+        )
+    assert wire_query is not None
+    exhausted = cursor._state == CursorState.CLOSED or (
+        cursor._state == CursorState.STARTED and cursor._next_page_state is None
+    )
+    return CursorCheckpoint(
+        source_type=source_type,
+        keyspace=source.keyspace,
+        source_name=source.name,
+        filter=wire_query["filter"],
+        projection=wire_query["projection"],
+        sort=wire_query["sort"],
+        limit=cursor._limit,
+        skip=cursor._skip,
+        include_similarity=cursor._include_similarity,
+        include_sort_vector=cursor._include_sort_vector,
+        request_timeout_ms=cursor._request_timeout_ms,
+        page_state=None if exhausted else cursor._next_page_state,
+        consumed=cursor._consumed,
+        pages_retrieved=cursor._pages_retrieved,
+        exhausted=exhausted,
+    )
+
+
+def _validate_checkpointing_parameters(cursor: Any, every_n_pages: int) -> None:
+    if every_n_pages < 1:
+        raise ValueError("Parameter every_n_pages must be a positive integer.")
+    cursor._ensure_alive()
+    # fail early if not at a page boundary
+    _checkpoint_from_find_cursor(cursor)
+
+
+def _checkpointing_generator(
+    cursor: Any,
+    work_cursor: Any,
+    store: CursorCheckpointStore,
+    every_n_pages: int,
+) -> Iterator[Any]:
+    """
+    Consume `work_cursor` (a copy of `cursor`, sharing its state) page by page,
+    saving a checkpoint after every N fully-consumed pages and at the end.
+    The state of `cursor` is kept in sync with that of the work cursor.
+    """
+
+    pages_since_checkpoint = 0
+    while work_cursor._state != CursorState.CLOSED:
+        work_cursor._try_ensure_fill_buffer()
+        page_size = len(work_cursor._buffer)
+        if page_size == 0:
+            work_cursor._state = CursorState.CLOSED
+            work_cursor._imprint_internal_state(cursor)
+            break
+        for _ in range(page_size):
+            item = next(work_cursor)
+            work_cursor._imprint_internal_state(cursor)
+            yield item
+        pages_since_checkpoint += 1
+        if pages_since_checkpoint >= every_n_pages:
+            store.save(_checkpoint_from_find_cursor(cursor))
+            pages_since_checkpoint = 0
+    store.save(_checkpoint_from_find_cursor(cursor))
+
+
+async def _async_checkpointing_generator(
+    cursor: Any,
+    work_cursor: Any,
+    store: CursorCheckpointStore,
+    every_n_pages: int,
+) -> AsyncIterator[Any]:
+    """
+    Async counterpart of `_checkpointing_generator`. Saving checkpoints
+    (a possibly blocking operation) is delegated to a worker thread.
+    """
+
+    pages_since_checkpoint = 0
+    while work_cursor._state != CursorState.CLOSED:
+        await work_cursor._try_ensure_fill_buffer()
+        page_size = len(work_cursor._buffer)
+        if page_size == 0:
+            work_cursor._state = CursorState.CLOSED
+            work_cursor._imprint_internal_state(cursor)
+            break
+        for _ in range(page_size):
+            item = await work_cursor.__anext__()
+            work_cursor._imprint_internal_state(cursor)
+            yield item
+        pages_since_checkpoint += 1
+        if pages_since_checkpoint >= every_n_pages:
+            await asyncio.to_thread(store.save, _checkpoint_from_find_cursor(cursor))
+            pages_since_checkpoint = 0
+    await asyncio.to_thread(store.save, _checkpoint_from_find_cursor(cursor))
@@ -16,6 +16,8 @@ from __future__ import annotations
 
 import logging
 from abc import ABC
+from collections.abc import Iterator
+from contextlib import contextmanager
 from decimal import Decimal
 from enum import Enum
 from typing import Any, Generic, TypeVar
@@ -23,6 +25,8 @@ from typing import Any, Generic, TypeVar
 from astrapy.data_types import DataAPIVector
 from astrapy.exceptions import CursorException
 from astrapy.utils.api_options import FullSerdesOptions
+from astrapy.utils.operation_stats import OperationStats, collecting_stats
+from astrapy.utils.tracing import _OperationScope, current_scope, request_attributes
 from astrapy.utils.unset import _UNSET, UnsetType
 
 # A cursor reads TRAW from DB and maps them to T if any mapping.
@@ -140,12 +144,17 @@ class AbstractCursor(ABC, Generic[TRAW]):
     _consumed: int
     _next_page_state: str | None
     _last_response_status: dict[str, Any] | None
+    _stats: OperationStats
+    # the operation scope of the scan in progress, linking its page requests
+    _trace_scope: _OperationScope | None
+    _trace_operation_name: str = "find"
 
     def __init__(
         self,
         *,
         initial_page_state: str | UnsetType,
     ) -> None:
+        self._trace_scope = None
         self.rewind(initial_page_state=initial_page_state)
 
     def _imprint_internal_state(self, other: AbstractCursor[TRAW]) -> None:
@@ -156,6 +165,35 @@ class AbstractCursor(ABC, Generic[TRAW]):
         other._consumed = self._consumed
         other._next_page_state = self._next_page_state
         other._last_response_status = self._last_response_status
+        other._stats = self._stats
+        other._trace_scope = self._trace_scope
+
+    @contextmanager
+    def _traced_page_fetch(self) -> Iterator[None]:
+        """
+        Run the retrieval of a page (including the cursor state update) within
+        the operation scope of the scan, started with the first page and ended
+        after the last one, recording its requests in the cursor stats.
+        """
+
+        if self._trace_scope is None:
+            self._trace_scope = _OperationScope(
+                self._trace_operation_name, parent=current_scope()
+            )
+        with self._trace_scope.activate(), collecting_stats(self._stats):
+            with request_attributes(page_number=self._pages_retrieved + 1):
+                try:
+                    yield
+                except BaseException as exc:
+                    self._end_trace_scope(exc)
+                    raise
+        if self._next_page_state is None:
+            self._end_trace_scope()
+
+    def _end_trace_scope(self, error: BaseException | None = None) -> None:
+        if self._trace_scope is not None:
+            self._trace_scope.end(error)
+            self._trace_scope = None
 
     def _ensure_alive(self) -> None:
         if self._state == CursorState.CLOSED:
@@ -194,6 +232,19 @@ class AbstractCursor(ABC, Generic[TRAW]):
 
         return self._consumed
 
+    @property
+    def stats(self) -> OperationStats:
+        """
+        Statistics about the requests made by the cursor since it was created
+        or last rewound: pages fetched, time spent waiting for them (total and
+        longest), bytes sent and received, warnings returned by the Data API.
+
+        Returns:
+            stats: an OperationStats object, updated as further pages are fetched.
+        """
+
+        return self._stats
+
     @property
     def cursor_id(self) -> int:
         """
@@ -228,6 +279,7 @@ class AbstractCursor(ABC, Generic[TRAW]):
         This is an in-place modification of the cursor.
         """
 
+        self._end_trace_scope()
         self._state = CursorState.CLOSED
         self._buffer = []
 
@@ -253,10 +305,12 @@ class AbstractCursor(ABC, Generic[TRAW]):
 
         This is an in-place modification of the cursor.
         """
+        self._end_trace_scope()
         self._state = CursorState.IDLE
         self._buffer = []
         self._pages_retrieved = 0
         self._consumed = 0
+        self._stats = OperationStats()
         if initial_page_state is None:
             msg = "Passing an explicit null for initial_page_state is not allowed."
             raise ValueError(msg)
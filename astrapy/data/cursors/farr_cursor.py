@@ -105,6 +105,7 @@ class CollectionFindAndRerankCursor(
     _rerank_query: str | None
     _rerank_service: RerankServiceOptions | None
     _mapper: Callable[[RerankedResult[TRAW]], T] | None
+    _trace_operation_name = "find_and_rerank"
 
     def __init__(
         self,
@@ -240,20 +241,21 @@ class CollectionFindAndRerankCursor(
             return
         if not self._buffer:
             if self._next_page_state is not None or self._state == CursorState.IDLE:
-                new_buffer, next_page_state, resp_status = (
-                    self._query_engine._fetch_page(
-                        page_state=self._next_page_state,
-                        timeout_context=self._timeout_manager.remaining_timeout(
-                            cap_time_ms=self._request_timeout_ms,
-                            cap_timeout_label=self._request_timeout_label,
-                        ),
+                with self._traced_page_fetch():
+                    new_buffer, next_page_state, resp_status = (
+                        self._query_engine._fetch_page(
+                            page_state=self._next_page_state,
+                            timeout_context=self._timeout_manager.remaining_timeout(
+                                cap_time_ms=self._request_timeout_ms,
+                                cap_timeout_label=self._request_timeout_label,
+                            ),
+                        )
                     )
-                )
-                self._state = CursorState.STARTED
-                self._next_page_state = next_page_state
-                self._last_response_status = resp_status
-                self._pages_retrieved += 1
-                self._buffer = new_buffer
+                    self._state = CursorState.STARTED
+                    self._next_page_state = next_page_state
+                    self._last_response_status = resp_status
+                    self._pages_retrieved += 1
+                    self._buffer = new_buffer
 
     def __repr__(self) -> str:
         return (
@@ -990,6 +992,7 @@ class AsyncCollectionFindAndRerankCursor(
     _rerank_query: str | None
     _rerank_service: RerankServiceOptions | None
     _mapper: Callable[[RerankedResult[TRAW]], T] | None
+    _trace_operation_name = "find_and_rerank"
 
     def __init__(
         self,
@@ -1125,22 +1128,23 @@ class AsyncCollectionFindAndRerankCursor(
             return
         if not self._buffer:
             if self._next_page_state is not None or self._state == CursorState.IDLE:
-                (
-                    new_buffer,
-                    next_page_state,
-                    resp_status,
-                ) = await self._query_engine._async_fetch_page(
-                    page_state=self._next_page_state,
-                    timeout_context=self._timeout_manager.remaining_timeout(
-                        cap_time_ms=self._request_timeout_ms,
-                        cap_timeout_label=self._request_timeout_label,
-                    ),
-                )
-                self._state = CursorState.STARTED
-                self._next_page_state = next_page_state
-                self._last_response_status = resp_status
-                self._pages_retrieved += 1
-                self._buffer = new_buffer
+                with self._traced_page_fetch():
+                    (
+                        new_buffer,
+                        next_page_state,
+                        resp_status,
+                    ) = await self._query_engine._async_fetch_page(
+                        page_state=self._next_page_state,
+                        timeout_context=self._timeout_manager.remaining_timeout(
+                            cap_time_ms=self._request_timeout_ms,
+                            cap_timeout_label=self._request_timeout_label,
+                        ),
+                    )
+                    self._state = CursorState.STARTED
+                    self._next_page_state = next_page_state
+                    self._last_response_status = resp_status
+                    self._pages_retrieved += 1
+                    self._buffer = new_buffer
 
     def __repr__(self) -> str:
         return (
@@ -14,7 +14,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 from copy import deepcopy
 from inspect import iscoroutinefunction
 from typing import Any, Generic, cast
@@ -24,6 +24,14 @@ from astrapy.constants import (
     FilterType,
     ProjectionType,
 )
+from astrapy.data.cursors.checkpoint import (
+    CursorCheckpoint,
+    CursorCheckpointStore,
+    _async_checkpointing_generator,
+    _checkpoint_from_find_cursor,
+    _checkpointing_generator,
+    _validate_checkpointing_parameters,
+)
 from astrapy.data.cursors.cursor import (
     TNEW,
     TRAW,
@@ -38,6 +46,13 @@ from astrapy.data.cursors.query_engine import (
     _CollectionFindQueryEngine,
     _TableFindQueryEngine,
 )
+from astrapy.data.utils.table_columnar import (
+    COLUMNAR_FORMAT_NUMPY,
+    _TableColumnarBuilder,
+    concatenate_arrow_batches,
+    concatenate_numpy_batches,
+    validate_columnar_format,
+)
 from astrapy.data_types import DataAPIVector
 from astrapy.exceptions import CursorException, MultiCallTimeoutManager
 from astrapy.utils.unset import _UNSET, UnsetType
@@ -204,20 +219,21 @@ class CollectionFindCursor(Generic[TRAW, T], AbstractCursor[TRAW]):
             return
         if not self._buffer:
             if self._next_page_state is not None or self._state == CursorState.IDLE:
-                new_buffer, next_page_state, resp_status = (
-                    self._query_engine._fetch_page(
-                        page_state=self._next_page_state,
-                        timeout_context=self._timeout_manager.remaining_timeout(
-                            cap_time_ms=self._request_timeout_ms,
-                            cap_timeout_label=self._request_timeout_label,
-                        ),
+                with self._traced_page_fetch():
+                    new_buffer, next_page_state, resp_status = (
+                        self._query_engine._fetch_page(
+                            page_state=self._next_page_state,
+                            timeout_context=self._timeout_manager.remaining_timeout(
+                                cap_time_ms=self._request_timeout_ms,
+                                cap_timeout_label=self._request_timeout_label,
+                            ),
+                        )
                     )
-                )
-                self._state = CursorState.STARTED
-                self._next_page_state = next_page_state
-                self._last_response_status = resp_status
-                self._pages_retrieved += 1
-                self._buffer = new_buffer
+                    self._state = CursorState.STARTED
+                    self._next_page_state = next_page_state
+                    self._last_response_status = resp_status
+                    self._pages_retrieved += 1
+                    self._buffer = new_buffer
 
     def __repr__(self) -> str:
         return (
@@ -842,6 +858,114 @@ class CollectionFindCursor(Generic[TRAW, T], AbstractCursor[TRAW]):
             sort_vector=_tr_sort_vector,
         )
 
+    def _fetch_next_raw_page(self) -> list[dict[str, Any]] | None:
+        """
+        Fetch the next page as raw (i.e. non-postprocessed) documents, updating the
+        cursor state as a regular page retrieval would, and marking all documents
+        in the page as consumed. Return None if there are no more pages.
+        """
+
+        if self._state == CursorState.CLOSED:
+            return None
+        if self._next_page_state is None and self._state != CursorState.IDLE:
+            self._state = CursorState.CLOSED
+            return None
+        with self._traced_page_fetch():
+            raw_documents, next_page_state, resp_status = (
+                self._query_engine._fetch_raw_page(
+                    page_state=self._next_page_state,
+                    timeout_context=self._timeout_manager.remaining_timeout(
+                        cap_time_ms=self._request_timeout_ms,
+                        cap_timeout_label=self._request_timeout_label,
+                    ),
+                )
+            )
+            self._state = CursorState.STARTED
+            self._next_page_state = next_page_state
+            self._last_response_status = resp_status
+            self._pages_retrieved += 1
+            self._consumed += len(raw_documents)
+        return raw_documents
+
+    def checkpoint(self) -> CursorCheckpoint:
+        """
+        Take a checkpoint of this cursor, i.e. a snapshot of its settings and
+        progress that can later be used to build an equivalent cursor, resuming
+        the scan from the current point (see `CursorCheckpoint.resume`).
+
+        A checkpoint can only be taken when the cursor is at a page boundary,
+        i.e. its buffer is empty (for instance before consumption starts, or
+        after a `fetch_next_page` call): otherwise an exception is raised.
+
+        Returns:
+            a CursorCheckpoint object.
+        """
+
+        return _checkpoint_from_find_cursor(self)
+
+    def iter_with_checkpoints(
+        self,
+        store: CursorCheckpointStore,
+        *,
+        every_n_pages: int = 1,
+        general_method_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> Iterator[T]:
+        """
+        Iterate over the documents of this cursor, while periodically persisting
+        a checkpoint of the scan progress to the provided store.
+
+        A checkpoint is saved each time `every_n_pages` pages have been entirely
+        consumed by the caller (that is, the next item has been requested after
+        the last one of the page), and once more when the cursor is exhausted.
+        Should the process crash, the scan can be resumed from the last saved
+        checkpoint with `CursorCheckpoint.resume`: items are then yielded
+        again only from the first not-checkpointed page onward.
+
+        The cursor must be at a page boundary (e.g. not yet started) when this
+        method is called. The cursor state is updated as the items are consumed.
+
+        Args:
+            store: a CursorCheckpointStore where checkpoints are saved,
+                e.g. a FileCursorCheckpointStore.
+            every_n_pages: how often (in terms of retrieved pages) a checkpoint
+                is saved. Defaults to 1, i.e. after every page.
+            general_method_timeout_ms: a timeout, in milliseconds, for the whole
+                iteration. If not provided, there is no such timeout.
+                Note that the per-request timeout set on the cursor still applies.
+            timeout_ms: an alias for `general_method_timeout_ms`.
+
+        Returns:
+            an iterator over the documents (possibly mapped, if a mapping
+                function is set on the cursor).
+
+        Example:
+            >>> store = FileCursorCheckpointStore("scan.checkpoint")
+            >>> checkpoint = store.load()
+            >>> if checkpoint is None:
+            ...     cursor = my_collection.find({})
+            ... else:
+            ...     cursor = checkpoint.resume(my_collection)
+            ...
+            >>> for document in cursor.iter_with_checkpoints(store):
+            ...     process(document)
+            ...
+            >>> store.clear()
+        """
+
+        _validate_checkpointing_parameters(self, every_n_pages)
+        copy_req_ms, copy_ovr_ms = _revise_timeouts_for_cursor_copy(
+            new_general_method_timeout_ms=general_method_timeout_ms,
+            new_timeout_ms=timeout_ms,
+            old_request_timeout_ms=self._request_timeout_ms,
+        )
+        _cursor = self._copy(
+            request_timeout_ms=copy_req_ms,
+            overall_timeout_ms=copy_ovr_ms,
+        )
+        self._imprint_internal_state(_cursor)
+        return _checkpointing_generator(self, _cursor, store, every_n_pages)
+
 
 class AsyncCollectionFindCursor(Generic[TRAW, T], AbstractCursor[TRAW]):
     """
@@ -993,22 +1117,23 @@ class AsyncCollectionFindCursor(Generic[TRAW, T], AbstractCursor[TRAW]):
             return
         if not self._buffer:
             if self._next_page_state is not None or self._state == CursorState.IDLE:
-                (
-                    new_buffer,
-                    next_page_state,
-                    resp_status,
-                ) = await self._query_engine._async_fetch_page(
-                    page_state=self._next_page_state,
-                    timeout_context=self._timeout_manager.remaining_timeout(
-                        cap_time_ms=self._request_timeout_ms,
-                        cap_timeout_label=self._request_timeout_label,
-                    ),
-                )
-                self._state = CursorState.STARTED
-                self._next_page_state = next_page_state
-                self._last_response_status = resp_status
-                self._pages_retrieved += 1
-                self._buffer = new_buffer
+                with self._traced_page_fetch():
+                    (
+                        new_buffer,
+                        next_page_state,
+                        resp_status,
+                    ) = await self._query_engine._async_fetch_page(
+                        page_state=self._next_page_state,
+                        timeout_context=self._timeout_manager.remaining_timeout(
+                            cap_time_ms=self._request_timeout_ms,
+                            cap_timeout_label=self._request_timeout_label,
+                        ),
+                    )
+                    self._state = CursorState.STARTED
+                    self._next_page_state = next_page_state
+                    self._last_response_status = resp_status
+                    self._pages_retrieved += 1
+                    self._buffer = new_buffer
 
     def __repr__(self) -> str:
         return (
@@ -1524,6 +1649,86 @@ class AsyncCollectionFindCursor(Generic[TRAW, T], AbstractCursor[TRAW]):
             sort_vector=_tr_sort_vector,
         )
 
+    def checkpoint(self) -> CursorCheckpoint:
+        """
+        Take a checkpoint of this cursor, i.e. a snapshot of its settings and
+        progress that can later be used to build an equivalent cursor, resuming
+        the scan from the current point (see `CursorCheckpoint.resume`).
+
+        A checkpoint can only be taken when the cursor is at a page boundary,
+        i.e. its buffer is empty (for instance before consumption starts, or
+        after a `fetch_next_page` call): otherwise an exception is raised.
+
+        Returns:
+            a CursorCheckpoint object.
+        """
+
+        return _checkpoint_from_find_cursor(self)
+
+    def iter_with_checkpoints(
+        self,
+        store: CursorCheckpointStore,
+        *,
+        every_n_pages: int = 1,
+        general_method_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> AsyncIterator[T]:
+        """
+        Iterate over the documents of this cursor, while periodically persisting
+        a checkpoint of the scan progress to the provided store.
+
+        A checkpoint is saved each time `every_n_pages` pages have been entirely
+        consumed by the caller (that is, the next item has been requested after
+        the last one of the page), and once more when the cursor is exhausted.
+        Should the process crash, the scan can be resumed from the last saved
+        checkpoint with `CursorCheckpoint.resume`: items are then yielded
+        again only from the first not-checkpointed page onward.
+
+        The cursor must be at a page boundary (e.g. not yet started) when this
+        method is called. The cursor state is updated as the items are consumed.
+        Checkpoints are saved from a worker thread, not to block the event loop.
+
+        Args:
+            store: a CursorCheckpointStore where checkpoints are saved,
+                e.g. a FileCursorCheckpointStore.
+            every_n_pages: how often (in terms of retrieved pages) a checkpoint
+                is saved. Defaults to 1, i.e. after every page.
+            general_method_timeout_ms: a timeout, in milliseconds, for the whole
+                iteration. If not provided, there is no such timeout.
+                Note that the per-request timeout set on the cursor still applies.
+            timeout_ms: an alias for `general_method_timeout_ms`.
+
+        Returns:
+            an async iterator over the documents (possibly mapped, if a mapping
+                function is set on the cursor).
+
+        Example:
+            >>> store = FileCursorCheckpointStore("scan.checkpoint")
+            >>> checkpoint = store.load()
+            >>> if checkpoint is None:
+            ...     cursor = my_async_collection.find({})
+            ... else:
+            ...     cursor = checkpoint.resume(my_async_collection)
+            ...
+            >>> async for document in cursor.iter_with_checkpoints(store):
+            ...     process(document)
+            ...
+            >>> store.clear()
+        """
+
+        _validate_checkpointing_parameters(self, every_n_pages)
+        copy_req_ms, copy_ovr_ms = _revise_timeouts_for_cursor_copy(
+            new_general_method_timeout_ms=general_method_timeout_ms,
+            new_timeout_ms=timeout_ms,
+            old_request_timeout_ms=self._request_timeout_ms,
+        )
+        _cursor = self._copy(
+            request_timeout_ms=copy_req_ms,
+            overall_timeout_ms=copy_ovr_ms,
+        )
+        self._imprint_internal_state(_cursor)
+        return _async_checkpointing_generator(self, _cursor, store, every_n_pages)
+
 
 class TableFindCursor(Generic[TRAW, T], AbstractCursor[TRAW]):
     """
@@ -1686,20 +1891,21 @@ class TableFindCursor(Generic[TRAW, T], AbstractCursor[TRAW]):
             return
         if not self._buffer:
             if self._next_page_state is not None or self._state == CursorState.IDLE:
-                new_buffer, next_page_state, resp_status = (
-                    self._query_engine._fetch_page(
-                        page_state=self._next_page_state,
-                        timeout_context=self._timeout_manager.remaining_timeout(
-                            cap_time_ms=self._request_timeout_ms,
-                            cap_timeout_label=self._request_timeout_label,
-                        ),
+                with self._traced_page_fetch():
+                    new_buffer, next_page_state, resp_status = (
+                        self._query_engine._fetch_page(
+                            page_state=self._next_page_state,
+                            timeout_context=self._timeout_manager.remaining_timeout(
+                                cap_time_ms=self._request_timeout_ms,
+                                cap_timeout_label=self._request_timeout_label,
+                            ),
+                        )
                     )
-                )
-                self._state = CursorState.STARTED
-                self._next_page_state = next_page_state
-                self._last_response_status = resp_status
-                self._pages_retrieved += 1
-                self._buffer = new_buffer
+                    self._state = CursorState.STARTED
+                    self._next_page_state = next_page_state
+                    self._last_response_status = resp_status
+                    self._pages_retrieved += 1
+                    self._buffer = new_buffer
 
     def __repr__(self) -> str:
         return (
@@ -2321,6 +2527,265 @@ class TableFindCursor(Generic[TRAW, T], AbstractCursor[TRAW]):
             sort_vector=_tr_sort_vector,
         )
 
+    def checkpoint(self) -> CursorCheckpoint:
+        """
+        Take a checkpoint of this cursor, i.e. a snapshot of its settings and
+        progress that can later be used to build an equivalent cursor, resuming
+        the scan from the current point (see `CursorCheckpoint.resume`).
+
+        A checkpoint can only be taken when the cursor is at a page boundary,
+        i.e. its buffer is empty (for instance before consumption starts, or
+        after a `fetch_next_page` call): otherwise an exception is raised.
+
+        Returns:
+            a CursorCheckpoint object.
+        """
+
+        return _checkpoint_from_find_cursor(self)
+
+    def iter_with_checkpoints(
+        self,
+        store: CursorCheckpointStore,
+        *,
+        every_n_pages: int = 1,
+        general_method_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> Iterator[T]:
+        """
+        Iterate over the rows of this cursor, while periodically persisting
+        a checkpoint of the scan progress to the provided store.
+
+        A checkpoint is saved each time `every_n_pages` pages have been entirely
+        consumed by the caller (that is, the next item has been requested after
+        the last one of the page), and once more when the cursor is exhausted.
+        Should the process crash, the scan can be resumed from the last saved
+        checkpoint with `CursorCheckpoint.resume`: items are then yielded
+        again only from the first not-checkpointed page onward.
+
+        The cursor must be at a page boundary (e.g. not yet started) when this
+        method is called. The cursor state is updated as the items are consumed.
+
+        Args:
+            store: a CursorCheckpointStore where checkpoints are saved,
+                e.g. a FileCursorCheckpointStore.
+            every_n_pages: how often (in terms of retrieved pages) a checkpoint
+                is saved. Defaults to 1, i.e. after every page.
+            general_method_timeout_ms: a timeout, in milliseconds, for the whole
+                iteration. If not provided, there is no such timeout.
+                Note that the per-request timeout set on the cursor still applies.
+            timeout_ms: an alias for `general_method_timeout_ms`.
+
+        Returns:
+            an iterator over the rows (possibly mapped, if a mapping
+                function is set on the cursor).
+
+        Example:
+            >>> store = FileCursorCheckpointStore("scan.checkpoint")
+            >>> checkpoint = store.load()
+            >>> if checkpoint is None:
+            ...     cursor = my_table.find({})
+            ... else:
+            ...     cursor = checkpoint.resume(my_table)
+            ...
+            >>> for row in cursor.iter_with_checkpoints(store):
+            ...     process(row)
+            ...
+            >>> store.clear()
+        """
+
+        _validate_checkpointing_parameters(self, every_n_pages)
+        copy_req_ms, copy_ovr_ms = _revise_timeouts_for_cursor_copy(
+            new_general_method_timeout_ms=general_method_timeout_ms,
+            new_timeout_ms=timeout_ms,
+            old_request_timeout_ms=self._request_timeout_ms,
+        )
+        _cursor = self._copy(
+            request_timeout_ms=copy_req_ms,
+            overall_timeout_ms=copy_ovr_ms,
+        )
+        self._imprint_internal_state(_cursor)
+        return _checkpointing_generator(self, _cursor, store, every_n_pages)
+
+    def _ensure_columnar_exportable(self) -> None:
+        self._ensure_alive()
+        if self._mapper is not None:
+            raise CursorException(
+                text="Columnar export is not available on a cursor with a mapping.",
+                cursor_state=self._state.value,
+            )
+        if self._buffer:
+            msg = "Columnar export cannot be mixed with regular cursor iteration."
+            raise CursorException(
+                text=msg,
+                cursor_state=self._state.value,
+            )
+
+    def _fetch_next_raw_page(
+        self,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]] | None:
+        """
+        Fetch the next page as raw (i.e. non-postprocessed) rows, updating the
+        cursor state as a regular page retrieval would, and marking all rows
+        in the page as consumed. Return None if there are no more pages.
+        """
+
+        if self._state == CursorState.CLOSED:
+            return None
+        if self._next_page_state is None and self._state != CursorState.IDLE:
+            self._state = CursorState.CLOSED
+            return None
+        with self._traced_page_fetch():
+            raw_documents, projection_schema, next_page_state, resp_status = (
+                self._query_engine._fetch_raw_page(
+                    page_state=self._next_page_state,
+                    timeout_context=self._timeout_manager.remaining_timeout(
+                        cap_time_ms=self._request_timeout_ms,
+                        cap_timeout_label=self._request_timeout_label,
+                    ),
+                )
+            )
+            self._state = CursorState.STARTED
+            self._next_page_state = next_page_state
+            self._last_response_status = resp_status
+            self._pages_retrieved += 1
+            self._consumed += len(raw_documents)
+        return raw_documents, projection_schema
+
+    def iter_column_batches(
+        self,
+        *,
+        format: str = "numpy",
+        general_method_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> Iterator[Any]:
+        """
+        Consume the remaining rows in the cursor page by page, yielding each page
+        as a typed columnar batch built directly from the raw API response,
+        without creating an intermediate dictionary for each row.
+
+        The column types are inferred from the `projectionSchema` returned by
+        the Data API: numeric, boolean and vector columns become native arrays,
+        while types with no columnar counterpart (dates, UUIDs, maps, UDTs, ...)
+        end up in object columns (NumPy) or as strings (Arrow).
+
+        This method requires the optional `numpy` (resp. `pyarrow`) dependency.
+        It cannot be used on a cursor with a mapping function, nor on a cursor
+        whose buffer is partially consumed. Calling it on a CLOSED cursor
+        results in an error.
+
+        Args:
+            format: either "numpy" (each batch is a NumPy structured array, one
+                field per column) or "arrow" (each batch is a pyarrow RecordBatch).
+                In NumPy batches, integer columns containing nulls are promoted to
+                float64 (nulls as NaN) and boolean columns containing nulls
+                to object arrays; vector columns are float32 sub-arrays.
+            general_method_timeout_ms: a timeout, in milliseconds, for the whole
+                duration of the iteration. If not provided, there is no such timeout.
+                Note that the per-request timeout set on the cursor still applies.
+            timeout_ms: an alias for `general_method_timeout_ms`.
+
+        Returns:
+            an iterator over columnar batches, one per each page of results.
+
+        Example:
+            >>> cursor = my_table.find({}, projection={"score": True, "v": True})
+            >>> for batch in cursor.iter_column_batches():
+            ...     print(batch.dtype.names, batch["score"].mean())
+            ...
+            ('score', 'v') 18.125
+            ('score', 'v') 16.5
+        """
+
+        validate_columnar_format(format)
+        self._ensure_columnar_exportable()
+        copy_req_ms, copy_ovr_ms = _revise_timeouts_for_cursor_copy(
+            new_general_method_timeout_ms=general_method_timeout_ms,
+            new_timeout_ms=timeout_ms,
+            old_request_timeout_ms=self._request_timeout_ms,
+        )
+        _cursor = self._copy(
+            request_timeout_ms=copy_req_ms,
+            overall_timeout_ms=copy_ovr_ms,
+        )
+        return self._column_batch_generator(_cursor, format=format)
+
+    def _column_batch_generator(
+        self,
+        _cursor: TableFindCursor[TRAW, T],
+        *,
+        format: str,
+    ) -> Iterator[Any]:
+        self._imprint_internal_state(_cursor)
+        similarity_pseudocolumn = "$similarity" if self._include_similarity else None
+        builder: _TableColumnarBuilder | None = None
+        while True:
+            raw_page = _cursor._fetch_next_raw_page()
+            _cursor._imprint_internal_state(self)
+            if raw_page is None:
+                return
+            raw_documents, projection_schema = raw_page
+            if builder is None or builder.columns_dict != projection_schema:
+                builder = _TableColumnarBuilder(
+                    columns_dict=projection_schema,
+                    similarity_pseudocolumn=similarity_pseudocolumn,
+                    options=self.data_source.api_options.serdes_options,
+                )
+            yield builder.build(raw_documents, format=format)
+
+    def to_columns(
+        self,
+        *,
+        format: str = "numpy",
+        general_method_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> Any:
+        """
+        Materialize all rows that remain to be consumed from a cursor into a single
+        columnar structure, bypassing the creation of one dictionary per row.
+
+        For numeric and vector columns, the result takes a fraction of the memory
+        needed by the list of dictionaries returned by `to_list` (in the order of
+        8 bytes per scalar value against several hundred bytes per row), and
+        building it is faster as no per-row postprocessing takes place.
+
+        This method requires the optional `numpy` (resp. `pyarrow`) dependency.
+        See `iter_column_batches` for the details on column types and restrictions.
+
+        Args:
+            format: either "numpy" or "arrow". With "numpy", the result is a
+                dictionary from column names to NumPy arrays (vector columns are
+                2-d arrays, shaped (number of rows, dimension)). With "arrow",
+                the result is a pyarrow Table.
+            general_method_timeout_ms: a timeout, in milliseconds, for the whole
+                duration of this method. If not provided, there is no such timeout.
+                Note that the per-request timeout set on the cursor still applies.
+            timeout_ms: an alias for `general_method_timeout_ms`.
+
+        Returns:
+            a dictionary of NumPy arrays or a pyarrow Table, depending on `format`.
+
+        Example:
+            >>> columns = my_table.find(
+            ...     {}, projection={"score": True, "v": True}
+            ... ).to_columns()
+            >>> columns["score"].dtype, columns["v"].shape
+            (dtype('int32'), (37, 3))
+            >>> arrow_table = my_table.find({}).to_columns(format="arrow")
+            >>> arrow_table.num_rows
+            37
+        """
+
+        batches = list(
+            self.iter_column_batches(
+                format=format,
+                general_method_timeout_ms=general_method_timeout_ms,
+                timeout_ms=timeout_ms,
+            )
+        )
+        if format == COLUMNAR_FORMAT_NUMPY:
+            return concatenate_numpy_batches(batches)
+        return concatenate_arrow_batches(batches)
+
 
 class AsyncTableFindCursor(Generic[TRAW, T], AbstractCursor[TRAW]):
     """
@@ -2472,22 +2937,23 @@ class AsyncTableFindCursor(Generic[TRAW, T], AbstractCursor[TRAW]):
             return
         if not self._buffer:
             if self._next_page_state is not None or self._state == CursorState.IDLE:
-                (
-                    new_buffer,
-                    next_page_state,
-                    resp_status,
-                ) = await self._query_engine._async_fetch_page(
-                    page_state=self._next_page_state,
-                    timeout_context=self._timeout_manager.remaining_timeout(
-                        cap_time_ms=self._request_timeout_ms,
-                        cap_timeout_label=self._request_timeout_label,
-                    ),
-                )
-                self._state = CursorState.STARTED
-                self._next_page_state = next_page_state
-                self._last_response_status = resp_status
-                self._pages_retrieved += 1
-                self._buffer = new_buffer
+                with self._traced_page_fetch():
+                    (
+                        new_buffer,
+                        next_page_state,
+                        resp_status,
+                    ) = await self._query_engine._async_fetch_page(
+                        page_state=self._next_page_state,
+                        timeout_context=self._timeout_manager.remaining_timeout(
+                            cap_time_ms=self._request_timeout_ms,
+                            cap_timeout_label=self._request_timeout_label,
+                        ),
+                    )
+                    self._state = CursorState.STARTED
+                    self._next_page_state = next_page_state
+                    self._last_response_status = resp_status
+                    self._pages_retrieved += 1
+                    self._buffer = new_buffer
 
     def __repr__(self) -> str:
         return (
@@ -3001,3 +3467,241 @@ class AsyncTableFindCursor(Generic[TRAW, T], AbstractCursor[TRAW]):
             next_page_state=_tr_next_ps,
             sort_vector=_tr_sort_vector,
         )
+
+    def checkpoint(self) -> CursorCheckpoint:
+        """
+        Take a checkpoint of this cursor, i.e. a snapshot of its settings and
+        progress that can later be used to build an equivalent cursor, resuming
+        the scan from the current point (see `CursorCheckpoint.resume`).
+
+        A checkpoint can only be taken when the cursor is at a page boundary,
+        i.e. its buffer is empty (for instance before consumption starts, or
+        after a `fetch_next_page` call): otherwise an exception is raised.
+
+        Returns:
+            a CursorCheckpoint object.
+        """
+
+        return _checkpoint_from_find_cursor(self)
+
+    def iter_with_checkpoints(
+        self,
+        store: CursorCheckpointStore,
+        *,
+        every_n_pages: int = 1,
+        general_method_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> AsyncIterator[T]:
+        """
+        Iterate over the rows of this cursor, while periodically persisting
+        a checkpoint of the scan progress to the provided store.
+
+        A checkpoint is saved each time `every_n_pages` pages have been entirely
+        consumed by the caller (that is, the next item has been requested after
+        the last one of the page), and once more when the cursor is exhausted.
+        Should the process crash, the scan can be resumed from the last saved
+        checkpoint with `CursorCheckpoint.resume`: items are then yielded
+        again only from the first not-checkpointed page onward.
+
+        The cursor must be at a page boundary (e.g. not yet started) when this
+        method is called. The cursor state is updated as the items are consumed.
+        Checkpoints are saved from a worker thread, not to block the event loop.
+
+        Args:
+            store: a CursorCheckpointStore where checkpoints are saved,
+                e.g. a FileCursorCheckpointStore.
+            every_n_pages: how often (in terms of retrieved pages) a checkpoint
+                is saved. Defaults to 1, i.e. after every page.
+            general_method_timeout_ms: a timeout, in milliseconds, for the whole
+                iteration. If not provided, there is no such timeout.
+                Note that the per-request timeout set on the cursor still applies.
+            timeout_ms: an alias for `general_method_timeout_ms`.
+
+        Returns:
+            an async iterator over the rows (possibly mapped, if a mapping
+                function is set on the cursor).
+
+        Example:
+            >>> store = FileCursorCheckpointStore("scan.checkpoint")
+            >>> checkpoint = store.load()
+            >>> if checkpoint is None:
+            ...     cursor = my_async_table.find({})
+            ... else:
+            ...     cursor = checkpoint.resume(my_async_table)
+            ...
+            >>> async for row in cursor.iter_with_checkpoints(store):
+            ...     process(row)
+            ...
+            >>> store.clear()
+        """
+
+        _validate_checkpointing_parameters(self, every_n_pages)
+        copy_req_ms, copy_ovr_ms = _revise_timeouts_for_cursor_copy(
+            new_general_method_timeout_ms=general_method_timeout_ms,
+            new_timeout_ms=timeout_ms,
+            old_request_timeout_ms=self._request_timeout_ms,
+        )
+        _cursor = self._copy(
+            request_timeout_ms=copy_req_ms,
+            overall_timeout_ms=copy_ovr_ms,
+        )
+        self._imprint_internal_state(_cursor)
+        return _async_checkpointing_generator(self, _cursor, store, every_n_pages)
+
+    def _ensure_columnar_exportable(self) -> None:
+        self._ensure_alive()
+        if self._mapper is not None:
+            raise CursorException(
+                text="Columnar export is not available on a cursor with a mapping.",
+                cursor_state=self._state.value,
+            )
+        if self._buffer:
+            msg = "Columnar export cannot be mixed with regular cursor iteration."
+            raise CursorException(
+                text=msg,
+                cursor_state=self._state.value,
+            )
+
+    async def _fetch_next_raw_page(
+        self,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]] | None:
+        """
+        Fetch the next page as raw (i.e. non-postprocessed) rows, updating the
+        cursor state as a regular page retrieval would, and marking all rows
+        in the page as consumed. Return None if there are no more pages.
+        """
+
+        if self._state == CursorState.CLOSED:
+            return None
+        if self._next_page_state is None and self._state != CursorState.IDLE:
+            self._state = CursorState.CLOSED
+            return None
+        with self._traced_page_fetch():
+            (
+                raw_documents,
+                projection_schema,
+                next_page_state,
+                resp_status,
+            ) = await self._query_engine._async_fetch_raw_page(
+                page_state=self._next_page_state,
+                timeout_context=self._timeout_manager.remaining_timeout(
+                    cap_time_ms=self._request_timeout_ms,
+                    cap_timeout_label=self._request_timeout_label,
+                ),
+            )
+            self._state = CursorState.STARTED
+            self._next_page_state = next_page_state
+            self._last_response_status = resp_status
+            self._pages_retrieved += 1
+            self._consumed += len(raw_documents)
+        return raw_documents, projection_schema
+
+    def iter_column_batches(
+        self,
+        *,
+        format: str = "numpy",
+        general_method_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Consume the remaining rows in the cursor page by page, yielding each page
+        as a typed columnar batch built directly from the raw API response,
+        without creating an intermediate dictionary for each row.
+
+        This method is the async counterpart of the `TableFindCursor` method
+        with the same name: please refer to it for details.
+
+        Args:
+            format: either "numpy" (each batch is a NumPy structured array, one
+                field per column) or "arrow" (each batch is a pyarrow RecordBatch).
+            general_method_timeout_ms: a timeout, in milliseconds, for the whole
+                duration of the iteration. If not provided, there is no such timeout.
+                Note that the per-request timeout set on the cursor still applies.
+            timeout_ms: an alias for `general_method_timeout_ms`.
+
+        Returns:
+            an async iterator over columnar batches, one per each page of results.
+
+        Example:
+            >>> async def mean_scores(acursor):
+            ...     async for batch in acursor.iter_column_batches():
+            ...         print(batch["score"].mean())
+            ...
+            >>> asyncio.run(mean_scores(my_async_table.find({})))
+            18.125
+            16.5
+        """
+
+        validate_columnar_format(format)
+        self._ensure_columnar_exportable()
+        copy_req_ms, copy_ovr_ms = _revise_timeouts_for_cursor_copy(
+            new_general_method_timeout_ms=general_method_timeout_ms,
+            new_timeout_ms=timeout_ms,
+            old_request_timeout_ms=self._request_timeout_ms,
+        )
+        _cursor = self._copy(
+            request_timeout_ms=copy_req_ms,
+            overall_timeout_ms=copy_ovr_ms,
+        )
+        return self._column_batch_generator(_cursor, format=format)
+
+    async def _column_batch_generator(
+        self,
+        _cursor: AsyncTableFindCursor[TRAW, T],
+        *,
+        format: str,
+    ) -> AsyncIterator[Any]:
+        self._imprint_internal_state(_cursor)
+        similarity_pseudocolumn = "$similarity" if self._include_similarity else None
+        builder: _TableColumnarBuilder | None = None
+        while True:
+            raw_page = await _cursor._fetch_next_raw_page()
+            _cursor._imprint_internal_state(self)
+            if raw_page is None:
+                return
+            raw_documents, projection_schema = raw_page
+            if builder is None or builder.columns_dict != projection_schema:
+                builder = _TableColumnarBuilder(
+                    columns_dict=projection_schema,
+                    similarity_pseudocolumn=similarity_pseudocolumn,
+                    options=self.data_source.api_options.serdes_options,
+                )
+            yield builder.build(raw_documents, format=format)
+
+    async def to_columns(
+        self,
+        *,
+        format: str = "numpy",
+        general_method_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> Any:
+        """
+        Materialize all rows that remain to be consumed from a cursor into a single
+        columnar structure, bypassing the creation of one dictionary per row.
+
+        This method is the async counterpart of the `TableFindCursor` method
+        with the same name: please refer to it for details.
+
+        Args:
+            format: either "numpy" (the result is a dictionary from column names
+                to NumPy arrays) or "arrow" (the result is a pyarrow Table).
+            general_method_timeout_ms: a timeout, in milliseconds, for the whole
+                duration of this method. If not provided, there is no such timeout.
+                Note that the per-request timeout set on the cursor still applies.
+            timeout_ms: an alias for `general_method_timeout_ms`.
+
+        Returns:
+            a dictionary of NumPy arrays or a pyarrow Table, depending on `format`.
+        """
+
+        batches = [
+            batch
+            async for batch in self.iter_column_batches(
+                format=format,
+                general_method_timeout_ms=general_method_timeout_ms,
+                timeout_ms=timeout_ms,
+            )
+        ]
+        if format == COLUMNAR_FORMAT_NUMPY:
+            return concatenate_numpy_batches(batches)
+        return concatenate_arrow_batches(batches)
@@ -116,13 +116,37 @@ class _CollectionFindQueryEngine(Generic[TRAW], _QueryEngine[TRAW]):
             if v is not None
         }
 
-    @override
-    def _fetch_page(
+    def _fetch_raw_page(
         self,
         *,
         page_state: str | None,
         timeout_context: _TimeoutContext,
-    ) -> tuple[list[TRAW], str | None, dict[str, Any] | None]:
+    ) -> tuple[list[dict[str, Any]], str | None, dict[str, Any] | None]:
+        """
+        Run a query for one page and return it without document postprocessing, as
+        (raw entries, next-page-state, response.status).
+        """
+        raw_f_response = self._request_page(
+            page_state=page_state,
+            timeout_context=timeout_context,
+        )
+        if "documents" not in raw_f_response.get("data", {}):
+            raise UnexpectedDataAPIResponseException(
+                text="Faulty response from find API command (no 'documents').",
+                raw_response=raw_f_response,
+            )
+        return (
+            raw_f_response["data"]["documents"],
+            raw_f_response["data"]["nextPageState"],
+            raw_f_response.get("status"),
+        )
+
+    def _request_page(
+        self,
+        *,
+        page_state: str | None,
+        timeout_context: _TimeoutContext,
+    ) -> dict[str, Any]:
         if self.collection is None:
             raise RuntimeError("Query engine has no sync collection.")
         f_payload = {
@@ -140,13 +164,30 @@ class _CollectionFindQueryEngine(Generic[TRAW], _QueryEngine[TRAW]):
 
         _page_str = page_state if page_state else "(empty page state)"
         _coll_name = self.collection.name if self.collection else "(none)"
-        logger.info(f"cursor fetching a page: {_page_str} from {_coll_name}")
+        logger.info("cursor fetching a page: %s from %s", _page_str, _coll_name)
         raw_f_response = self.collection._api_commander.request(
             payload=converted_f_payload,
             timeout_context=timeout_context,
             caller_function_name="_CollectionFindQueryEngine._fetch_page",
         )
-        logger.info(f"cursor finished fetching a page: {_page_str} from {_coll_name}")
+        logger.info(
+            "cursor finished fetching a page: %s from %s", _page_str, _coll_name
+        )
+        return raw_f_response
+
+    @override
+    def _fetch_page(
+        self,
+        *,
+        page_state: str | None,
+        timeout_context: _TimeoutContext,
+    ) -> tuple[list[TRAW], str | None, dict[str, Any] | None]:
+        if self.collection is None:
+            raise RuntimeError("Query engine has no sync collection.")
+        raw_f_response = self._request_page(
+            page_state=page_state,
+            timeout_context=timeout_context,
+        )
 
         f_response = postprocess_collection_response(
             raw_f_response, options=self.collection.api_options.serdes_options
@@ -185,14 +226,14 @@ class _CollectionFindQueryEngine(Generic[TRAW], _QueryEngine[TRAW]):
 
         _page_str = page_state if page_state else "(empty page state)"
         _coll_name = self.async_collection.name if self.async_collection else "(none)"
-        logger.info(f"cursor fetching a page: {_page_str} from {_coll_name}, async")
+        logger.info("cursor fetching a page: %s from %s, async", _page_str, _coll_name)
         raw_f_response = await self.async_collection._api_commander.async_request(
             payload=converted_f_payload,
             timeout_context=timeout_context,
             caller_function_name="_CollectionFindQueryEngine._async_fetch_page",
         )
         logger.info(
-            f"cursor finished fetching a page: {_page_str} from {_coll_name}, async"
+            "cursor finished fetching a page: %s from %s, async", _page_str, _coll_name
         )
 
         f_response = postprocess_collection_response(
@@ -265,13 +306,37 @@ class _TableFindQueryEngine(Generic[TRAW], _QueryEngine[TRAW]):
             if v is not None
         }
 
-    @override
-    def _fetch_page(
+    @staticmethod
+    def _unpack_raw_page(
+        f_response: dict[str, Any],
+    ) -> tuple[list[dict[str, Any]], dict[str, Any], str | None, dict[str, Any]]:
+        if "documents" not in f_response.get("data", {}):
+            raise UnexpectedDataAPIResponseException(
+                text="Response from find API command missing 'documents'.",
+                raw_response=f_response,
+            )
+        if "projectionSchema" not in f_response.get("status", {}):
+            raise UnexpectedDataAPIResponseException(
+                text="Response from find API command missing 'projectionSchema'.",
+                raw_response=f_response,
+            )
+        return (
+            f_response["data"]["documents"],
+            f_response["status"]["projectionSchema"],
+            f_response["data"]["nextPageState"],
+            f_response["status"],
+        )
+
+    def _fetch_raw_page(
         self,
         *,
         page_state: str | None,
         timeout_context: _TimeoutContext,
-    ) -> tuple[list[TRAW], str | None, dict[str, Any] | None]:
+    ) -> tuple[list[dict[str, Any]], dict[str, Any], str | None, dict[str, Any]]:
+        """
+        Run a query for one page and return it without row postprocessing, as
+        (raw entries, projection schema, next-page-state, response.status).
+        """
         if self.table is None:
             raise RuntimeError("Query engine has no sync table.")
         f_payload = self.table._converter_agent.preprocess_payload(
@@ -289,40 +354,47 @@ class _TableFindQueryEngine(Generic[TRAW], _QueryEngine[TRAW]):
 
         _page_str = page_state if page_state else "(empty page state)"
         _table_name = self.table.name if self.table else "(none)"
-        logger.info(f"cursor fetching a page: {_page_str} from {_table_name}")
+        logger.info("cursor fetching a page: %s from %s", _page_str, _table_name)
         f_response = self.table._api_commander.request(
             payload=f_payload,
             timeout_context=timeout_context,
             caller_function_name="_TableFindQueryEngine._fetch_page",
         )
-        logger.info(f"cursor finished fetching a page: {_page_str} from {_table_name}")
+        logger.info(
+            "cursor finished fetching a page: %s from %s", _page_str, _table_name
+        )
+        return self._unpack_raw_page(f_response)
 
-        if "documents" not in f_response.get("data", {}):
-            raise UnexpectedDataAPIResponseException(
-                text="Response from find API command missing 'documents'.",
-                raw_response=f_response,
-            )
-        if "projectionSchema" not in f_response.get("status", {}):
-            raise UnexpectedDataAPIResponseException(
-                text="Response from find API command missing 'projectionSchema'.",
-                raw_response=f_response,
-            )
+    @override
+    def _fetch_page(
+        self,
+        *,
+        page_state: str | None,
+        timeout_context: _TimeoutContext,
+    ) -> tuple[list[TRAW], str | None, dict[str, Any] | None]:
+        if self.table is None:
+            raise RuntimeError("Query engine has no sync table.")
+        raw_documents, projection_schema, n_p_state, p_r_status = self._fetch_raw_page(
+            page_state=page_state,
+            timeout_context=timeout_context,
+        )
         p_documents = self.table._converter_agent.postprocess_rows(
-            f_response["data"]["documents"],
-            columns_dict=f_response["status"]["projectionSchema"],
+            raw_documents,
+            columns_dict=projection_schema,
             similarity_pseudocolumn="$similarity" if self.include_similarity else None,
         )
-        n_p_state = f_response["data"]["nextPageState"]
-        p_r_status = f_response.get("status")
         return (p_documents, n_p_state, p_r_status)
 
-    @override
-    async def _async_fetch_page(
+    async def _async_fetch_raw_page(
         self,
         *,
         page_state: str | None,
         timeout_context: _TimeoutContext,
-    ) -> tuple[list[TRAW], str | None, dict[str, Any] | None]:
+    ) -> tuple[list[dict[str, Any]], dict[str, Any], str | None, dict[str, Any]]:
+        """
+        Run a query for one page and return it without row postprocessing, as
+        (raw entries, projection schema, next-page-state, response.status).
+        """
         if self.async_table is None:
             raise RuntimeError("Query engine has no async table.")
         f_payload = self.async_table._converter_agent.preprocess_payload(
@@ -340,31 +412,40 @@ class _TableFindQueryEngine(Generic[TRAW], _QueryEngine[TRAW]):
 
         _page_str = page_state if page_state else "(empty page state)"
         _table_name = self.async_table.name if self.async_table else "(none)"
-        logger.info(f"cursor fetching a page: {_page_str} from {_table_name}")
+        logger.info("cursor fetching a page: %s from %s", _page_str, _table_name)
         f_response = await self.async_table._api_commander.async_request(
             payload=f_payload,
             timeout_context=timeout_context,
             caller_function_name="_TableFindQueryEngine._async_fetch_page",
         )
-        logger.info(f"cursor finished fetching a page: {_page_str} from {_table_name}")
+        logger.info(
+            "cursor finished fetching a page: %s from %s", _page_str, _table_name
+        )
+        return self._unpack_raw_page(f_response)
 
-        if "documents" not in f_response.get("data", {}):
-            raise UnexpectedDataAPIResponseException(
-                text="Response from find API command missing 'documents'.",
-                raw_response=f_response,
-            )
-        if "projectionSchema" not in f_response.get("status", {}):
-            raise UnexpectedDataAPIResponseException(
-                text="Response from find API command missing 'projectionSchema'.",
-                raw_response=f_response,
-            )
+    @override
+    async def _async_fetch_page(
+        self,
+        *,
+        page_state: str | None,
+        timeout_context: _TimeoutContext,
+    ) -> tuple[list[TRAW], str | None, dict[str, Any] | None]:
+        if self.async_table is None:
+            raise RuntimeError("Query engine has no async table.")
+        (
+            raw_documents,
+            projection_schema,
+            n_p_state,
+            p_r_status,
+        ) = await self._async_fetch_raw_page(
+            page_state=page_state,
+            timeout_context=timeout_context,
+        )
         p_documents = self.async_table._converter_agent.postprocess_rows(
-            f_response["data"]["documents"],
-            columns_dict=f_response["status"]["projectionSchema"],
+            raw_documents,
+            columns_dict=projection_schema,
             similarity_pseudocolumn="$similarity" if self.include_similarity else None,
         )
-        n_p_state = f_response["data"]["nextPageState"]
-        p_r_status = f_response.get("status")
         return (p_documents, n_p_state, p_r_status)
 
 
@@ -464,13 +545,15 @@ class _CollectionFindAndRerankQueryEngine(
         _page_str = page_state if page_state else "(empty page state)"
         _coll_name = self.collection.name if self.collection else "(none)"
 
-        logger.info(f"cursor fetching a page: {_page_str} from {_coll_name}")
+        logger.info("cursor fetching a page: %s from %s", _page_str, _coll_name)
         raw_f_response = self.collection._api_commander.request(
             payload=converted_f_payload,
             timeout_context=timeout_context,
             caller_function_name="_CollectionFindAndRerankQueryEngine._fetch_page",
         )
-        logger.info(f"cursor finished fetching a page: {_page_str} from {_coll_name}")
+        logger.info(
+            "cursor finished fetching a page: %s from %s", _page_str, _coll_name
+        )
         f_response: dict[str, Any] = postprocess_collection_response(
             raw_f_response, options=self.collection.api_options.serdes_options
         )
@@ -526,14 +609,14 @@ class _CollectionFindAndRerankQueryEngine(
         _page_str = page_state if page_state else "(empty page state)"
         _coll_name = self.async_collection.name if self.async_collection else "(none)"
 
-        logger.info(f"cursor fetching a page: {_page_str} from {_coll_name}, async")
+        logger.info("cursor fetching a page: %s from %s, async", _page_str, _coll_name)
         raw_f_response = await self.async_collection._api_commander.async_request(
             payload=converted_f_payload,
             timeout_context=timeout_context,
             caller_function_name="_CollectionFindAndRerankQueryEngine._async_fetch_page",
         )
         logger.info(
-            f"cursor finished fetching a page: {_page_str} from {_coll_name}, async"
+            "cursor finished fetching a page: %s from %s, async", _page_str, _coll_name
         )
         f_response: dict[str, Any] = postprocess_collection_response(
             raw_f_response,
@@ -211,6 +211,8 @@ class Database:
                 event_observers=self.api_options.event_observers,
                 spawner=self,
                 ca_cert_path=self.api_options.ca_cert_path,
+                connection_reuse_mode=self.api_options.connection_reuse_mode,
+                metadata_cache=self.api_options.metadata_cache,
             )
             return api_commander
 
@@ -2218,6 +2220,8 @@ class Database:
             event_observers=self.api_options.event_observers,
             spawner=self,
             ca_cert_path=self.api_options.ca_cert_path,
+            connection_reuse_mode=self.api_options.connection_reuse_mode,
+            metadata_cache=self.api_options.metadata_cache,
         )
 
         _cmd_desc = ",".join(sorted(body.keys()))
@@ -2433,6 +2437,8 @@ class AsyncDatabase:
                 event_observers=self.api_options.event_observers,
                 spawner=self,
                 ca_cert_path=self.api_options.ca_cert_path,
+                connection_reuse_mode=self.api_options.connection_reuse_mode,
+                metadata_cache=self.api_options.metadata_cache,
             )
             return api_commander
 
@@ -4504,6 +4510,8 @@ class AsyncDatabase:
             event_observers=self.api_options.event_observers,
             spawner=self,
             ca_cert_path=self.api_options.ca_cert_path,
+            connection_reuse_mode=self.api_options.connection_reuse_mode,
+            metadata_cache=self.api_options.metadata_cache,
         )
 
         _cmd_desc = ",".join(sorted(body.keys()))
@@ -18,7 +18,6 @@ import datetime
 from dataclasses import dataclass
 from typing import Any
 
-from astrapy.admin.endpoints import build_api_endpoint, parse_api_endpoint
 from astrapy.data_types import DataAPITimestamp
 from astrapy.settings.defaults import (
     DEFAULT_CREATE_DB_CAPACITY_UNITS,
@@ -69,6 +68,9 @@ class AstraDBAdminDatabaseRegionInfo:
         environment: str,
         database_id: str,
     ) -> None:
+        # (a local import, as importing astrapy.admin here would be circular)
+        from astrapy.admin.endpoints import build_api_endpoint
+
         self.name = raw_datacenter_dict["region"]
         self.id = raw_datacenter_dict["id"]
         self.api_endpoint = build_api_endpoint(
@@ -204,6 +206,8 @@ class AstraDBDatabaseInfo(_BaseAstraDBDatabaseInfo):
         api_endpoint: str,
         raw_dict: dict[str, Any],
     ) -> None:
+        from astrapy.admin.endpoints import parse_api_endpoint
+
         self.api_endpoint = api_endpoint
         parsed_api_endpoint = parse_api_endpoint(self.api_endpoint)
         self.region = "" if parsed_api_endpoint is None else parsed_api_endpoint.region
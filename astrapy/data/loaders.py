@@ -0,0 +1,901 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Batched lookups by document ID / row primary key (the "DataLoader" pattern).
+
+Individual key lookups made within a short time window (for the async classes:
+within the same event-loop iteration, by default) are collected, deduplicated
+and sent as `$in` queries in batches, which run concurrently. Each caller then
+receives its own document/row, or None if not found.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Generic
+
+from astrapy.constants import DOC, ROW, FilterType, ProjectionType
+from astrapy.data.utils.table_converters import preprocess_table_payload_value
+from astrapy.settings.defaults import (
+    DEFAULT_LOADER_ASYNC_BATCH_WINDOW_MS,
+    DEFAULT_LOADER_BATCH_WINDOW_MS,
+    DEFAULT_LOADER_CONCURRENCY,
+    DEFAULT_LOADER_MAX_BATCH_SIZE,
+)
+from astrapy.settings.definitions.definitions_data import normalize_optional_projection
+
+if TYPE_CHECKING:
+    from astrapy import AsyncCollection, AsyncTable, Collection, Table
+    from astrapy.info import ListTableDefinition
+
+
+logger = logging.getLogger(__name__)
+
+
+def _loader_settings(
+    *,
+    max_batch_size: int | None,
+    batch_window_ms: int | None,
+    concurrency: int | None,
+    default_batch_window_ms: int,
+) -> tuple[int, int, int]:
+    _max_batch_size = (
+        DEFAULT_LOADER_MAX_BATCH_SIZE if max_batch_size is None else max_batch_size
+    )
+    _batch_window_ms = (
+        default_batch_window_ms if batch_window_ms is None else batch_window_ms
+    )
+    _concurrency = DEFAULT_LOADER_CONCURRENCY if concurrency is None else concurrency
+    if _max_batch_size < 1:
+        raise ValueError("The max_batch_size of a loader must be a positive integer.")
+    if _batch_window_ms < 0:
+        raise ValueError("The batch_window_ms of a loader cannot be negative.")
+    if _concurrency < 1:
+        raise ValueError("The concurrency of a loader must be a positive integer.")
+    return _max_batch_size, _batch_window_ms, _concurrency
+
+
+def _projection_with_keys(
+    projection: ProjectionType | None, key_columns: list[str]
+) -> dict[str, Any] | None:
+    """
+    Ensure the key columns are returned by the lookups, which need them
+    to hand each document/row to the right caller.
+    """
+    _projection = normalize_optional_projection(projection)
+    if _projection is None:
+        return None
+    if any(
+        key_column in _projection and not _projection[key_column]
+        for key_column in key_columns
+    ):
+        raise ValueError(
+            f"The projection of a loader cannot exclude the key columns {key_columns}."
+        )
+    if any(value is True for value in _projection.values()):
+        # an inclusion projection: add the key columns
+        return {**_projection, **{key_column: True for key_column in key_columns}}
+    return _projection
+
+
+def _group_batches(
+    keys: list[Hashable],
+    *,
+    group_of: Callable[[Hashable], Hashable],
+    max_batch_size: int,
+) -> list[list[Hashable]]:
+    """Split keys into batches sharing the same group, of bounded size."""
+    groups: dict[Hashable, list[Hashable]] = {}
+    for key in keys:
+        groups.setdefault(group_of(key), []).append(key)
+    return [
+        group_keys[start : start + max_batch_size]
+        for group_keys in groups.values()
+        for start in range(0, len(group_keys), max_batch_size)
+    ]
+
+
+def _no_group(key: Hashable) -> Hashable:
+    return None
+
+
+class _LoaderBatcher:
+    """
+    Collect keys from any number of threads and fetch them in batches,
+    on a thread pool, once the batch window is elapsed (or a batch is full).
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[list[Hashable]], dict[Hashable, Any]],
+        *,
+        group_of: Callable[[Hashable], Hashable],
+        max_batch_size: int,
+        batch_window_ms: int,
+        concurrency: int,
+    ) -> None:
+        self.fetch = fetch
+        self.group_of = group_of
+        self.max_batch_size = max_batch_size
+        self.batch_window_ms = batch_window_ms
+        self.concurrency = concurrency
+        self._lock = threading.Lock()
+        self._pending: dict[Hashable, list[Future[Any]]] = {}
+        self._timer: threading.Timer | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._closed = False
+
+    def submit(self, keys: Iterable[Hashable], *, flush: bool) -> list[Future[Any]]:
+        futures: list[Future[Any]] = []
+        with self._lock:
+            if self._closed:
+                raise ValueError("Cannot use a loader after closing it.")
+            for key in keys:
+                future: Future[Any] = Future()
+                self._pending.setdefault(key, []).append(future)
+                futures.append(future)
+            if flush or len(self._pending) >= self.max_batch_size:
+                to_dispatch = self._take_pending()
+            else:
+                to_dispatch = None
+                if self._timer is None:
+                    self._timer = threading.Timer(
+                        self.batch_window_ms / 1000.0, self.flush
+                    )
+                    self._timer.daemon = True
+                    self._timer.start()
+        self._dispatch(to_dispatch)
+        return futures
+
+    def flush(self) -> None:
+        with self._lock:
+            to_dispatch = self._take_pending()
+        self._dispatch(to_dispatch)
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _take_pending(
+        self,
+    ) -> tuple[dict[Hashable, list[Future[Any]]], ThreadPoolExecutor] | None:
+        # to be called with the lock held
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return None
+        pending, self._pending = self._pending, {}
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.concurrency,
+                thread_name_prefix="astrapy-loader",
+            )
+        return pending, self._executor
+
+    def _dispatch(
+        self,
+        to_dispatch: tuple[dict[Hashable, list[Future[Any]]], ThreadPoolExecutor]
+        | None,
+    ) -> None:
+        if to_dispatch is None:
+            return
+        pending, executor = to_dispatch
+        for batch in _group_batches(
+            list(pending.keys()),
+            group_of=self.group_of,
+            max_batch_size=self.max_batch_size,
+        ):
+            executor.submit(self._run_batch, {key: pending[key] for key in batch})
+
+    def _run_batch(self, batch: dict[Hashable, list[Future[Any]]]) -> None:
+        try:
+            results = self.fetch(list(batch.keys()))
+        except Exception as exc:
+            for futures in batch.values():
+                for future in futures:
+                    future.set_exception(exc)
+            return
+        for key, futures in batch.items():
+            for future in futures:
+                future.set_result(results.get(key))
+
+
+class _AsyncLoaderBatcher:
+    """
+    Collect keys from any number of coroutines and fetch them in batches,
+    as concurrent tasks, at the next event-loop iteration (or once the
+    batch window is elapsed, or a batch is full).
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[list[Hashable]], Awaitable[dict[Hashable, Any]]],
+        *,
+        group_of: Callable[[Hashable], Hashable],
+        max_batch_size: int,
+        batch_window_ms: int,
+        concurrency: int,
+    ) -> None:
+        self.fetch = fetch
+        self.group_of = group_of
+        self.max_batch_size = max_batch_size
+        self.batch_window_ms = batch_window_ms
+        self.concurrency = concurrency
+        self._pending: dict[Hashable, list[asyncio.Future[Any]]] = {}
+        self._handle: asyncio.Handle | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def submit(
+        self, keys: Iterable[Hashable], *, flush: bool
+    ) -> list[asyncio.Future[Any]]:
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[Any]] = []
+        for key in keys:
+            future: asyncio.Future[Any] = loop.create_future()
+            self._pending.setdefault(key, []).append(future)
+            futures.append(future)
+        if flush or len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._handle is None:
+            if self.batch_window_ms > 0:
+                self._handle = loop.call_later(
+                    self.batch_window_ms / 1000.0, self.flush
+                )
+            else:
+                self._handle = loop.call_soon(self.flush)
+        return futures
+
+    def flush(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        for batch in _group_batches(
+            list(pending.keys()),
+            group_of=self.group_of,
+            max_batch_size=self.max_batch_size,
+        ):
+            task = asyncio.get_running_loop().create_task(
+                self._run_batch({key: pending[key] for key in batch})
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        self.flush()
+        if self._tasks:
+            await asyncio.wait(self._tasks)
+
+    async def _run_batch(
+        self, batch: dict[Hashable, list[asyncio.Future[Any]]]
+    ) -> None:
+        assert self._semaphore is not None
+        async with self._semaphore:
+            try:
+                results = await self.fetch(list(batch.keys()))
+            except Exception as exc:
+                for futures in batch.values():
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(exc)
+                return
+        for key, futures in batch.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(results.get(key))
+
+
+class _TableKeyCodec:
+    """
+    Conversion between the user-supplied keys for a table (a primary-key
+    dictionary, a tuple or, for single-column keys, a bare value) and
+    tuples, and construction of the `$in` filter for a batch of tuples.
+
+    Key tuples, both from the user and from the rows read, are normalized to
+    the values a read returns for the key columns (e.g. "2024-01-01" becomes
+    a DataAPIDate for a `date` column, a UUID string a UUID), so that any key
+    accepted by `find_one` is matched to its row: values are encoded as for
+    a request, then decoded according to the column types in the definition.
+
+    A batch of keys must share all primary-key values but the last one
+    (see the `group_of` method), which is the target of the `$in`.
+    """
+
+    def __init__(
+        self,
+        key_columns: list[str],
+        *,
+        table: Table[Any] | AsyncTable[Any],
+        definition: ListTableDefinition,
+    ) -> None:
+        if not key_columns:
+            raise ValueError("A table loader requires at least one key column.")
+        unknown_columns = [
+            key_column
+            for key_column in key_columns
+            if key_column not in definition.columns
+        ]
+        if unknown_columns:
+            raise ValueError(
+                f"Unknown table loader key columns: {', '.join(unknown_columns)}."
+            )
+        self.key_columns = key_columns
+        self._serdes_options = table.api_options.serdes_options
+        self._key_postprocessor = table._converter_agent._get_key_postprocessor(
+            primary_key_schema_dict={
+                key_column: definition.columns[key_column].as_dict()
+                for key_column in key_columns
+            }
+        )
+
+    def _normalize(self, key_tuple: tuple[Any, ...]) -> tuple[Any, ...]:
+        wire_values = [
+            preprocess_table_payload_value(
+                [], value, options=self._serdes_options, map2tuple_checker=None
+            )
+            for value in key_tuple
+        ]
+        return self._key_postprocessor(wire_values)[0]
+
+    def to_tuple(self, key: Any) -> tuple[Any, ...]:
+        if isinstance(key, dict):
+            if set(key.keys()) != set(self.key_columns):
+                raise ValueError(
+                    f"Table loader keys must specify the primary key {self.key_columns}"
+                    f" in full, found {sorted(key.keys())}."
+                )
+            return self._normalize(
+                tuple(key[key_column] for key_column in self.key_columns)
+            )
+        if isinstance(key, tuple):
+            if len(key) != len(self.key_columns):
+                raise ValueError(
+                    f"Table loader key tuples must have {len(self.key_columns)} items."
+                )
+            return self._normalize(key)
+        if len(self.key_columns) == 1:
+            return self._normalize((key,))
+        raise ValueError(
+            "Table loader keys must be dictionaries or tuples for composite "
+            "primary keys."
+        )
+
+    def row_tuple(self, row: dict[str, Any]) -> tuple[Any, ...]:
+        return self._normalize(
+            tuple(row.get(key_column) for key_column in self.key_columns)
+        )
+
+    def group_of(self, key_tuple: Hashable) -> Hashable:
+        assert isinstance(key_tuple, tuple)
+        return key_tuple[:-1]
+
+    def batch_filter(self, key_tuples: list[Hashable]) -> FilterType:
+        first_tuple = key_tuples[0]
+        assert isinstance(first_tuple, tuple)
+        return {
+            **dict(zip(self.key_columns[:-1], first_tuple[:-1])),
+            self.key_columns[-1]: {
+                "$in": [key_tuple[-1] for key_tuple in key_tuples]  # type: ignore[index]
+            },
+        }
+
+
+class CollectionLoader(Generic[DOC]):
+    """
+    A batching loader of documents by `_id` for a collection, coalescing
+    the lookups made by any number of threads within a short time window
+    into `$in` queries. Obtain one through the collection `loader` method.
+
+    Loaders are thread-safe and hold a thread pool: remember to `close()` them
+    (or use them as context managers).
+
+    Example:
+        >>> with my_coll.loader() as loader:
+        ...     loader.load("doc1")
+        ...
+        {'_id': 'doc1', 'seq': 1}
+    """
+
+    def __init__(
+        self,
+        collection: Collection[DOC],
+        *,
+        projection: ProjectionType | None,
+        max_batch_size: int | None,
+        batch_window_ms: int | None,
+        concurrency: int | None,
+        request_timeout_ms: int | None,
+    ) -> None:
+        self.collection = collection
+        self.projection = _projection_with_keys(projection, ["_id"])
+        self.request_timeout_ms = request_timeout_ms
+        _max_batch_size, _batch_window_ms, _concurrency = _loader_settings(
+            max_batch_size=max_batch_size,
+            batch_window_ms=batch_window_ms,
+            concurrency=concurrency,
+            default_batch_window_ms=DEFAULT_LOADER_BATCH_WINDOW_MS,
+        )
+        self._batcher = _LoaderBatcher(
+            self._fetch,
+            group_of=_no_group,
+            max_batch_size=_max_batch_size,
+            batch_window_ms=_batch_window_ms,
+            concurrency=_concurrency,
+        )
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(collection="{self.collection.name}")'
+
+    def __enter__(self) -> CollectionLoader[DOC]:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        self.close()
+
+    def _fetch(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        logger.info("loading %s documents from '%s'", len(keys), self.collection.name)
+        return {
+            document["_id"]: document  # type: ignore[index]
+            for document in self.collection.find(
+                {"_id": {"$in": keys}},
+                projection=self.projection,
+                request_timeout_ms=self.request_timeout_ms,
+            )
+        }
+
+    def load(self, key: Any) -> DOC | None:
+        """
+        Look up a single document by its `_id`, blocking until the batch
+        containing this lookup completes.
+
+        Args:
+            key: the `_id` of the document to load.
+
+        Returns:
+            the document, or None if not found.
+        """
+        (future,) = self._batcher.submit([key], flush=False)
+        result: DOC | None = future.result()
+        return result
+
+    def load_many(self, keys: Iterable[Any]) -> list[DOC | None]:
+        """
+        Look up a number of documents by `_id`, without waiting for the batch
+        window to elapse.
+
+        Args:
+            keys: the `_id` values of the documents to load.
+
+        Returns:
+            a list of documents (None for those not found), in the order
+            of the provided keys.
+        """
+        futures = self._batcher.submit(list(keys), flush=True)
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Dispatch all pending lookups and release the loader resources."""
+        self._batcher.close()
+
+
+class AsyncCollectionLoader(Generic[DOC]):
+    """
+    A batching loader of documents by `_id` for an async collection, coalescing
+    the lookups made by concurrent coroutines (by default, within the same
+    event-loop iteration) into `$in` queries. Obtain one through the collection
+    `loader` method.
+
+    Example:
+        >>> async def get_docs(loader):
+        ...     return await asyncio.gather(
+        ...         loader.load("doc1"),
+        ...         loader.load("doc2"),
+        ...     )
+        ...
+        >>> asyncio.run(get_docs(my_async_coll.loader()))
+        [{'_id': 'doc1', 'seq': 1}, {'_id': 'doc2', 'seq': 2}]
+    """
+
+    def __init__(
+        self,
+        collection: AsyncCollection[DOC],
+        *,
+        projection: ProjectionType | None,
+        max_batch_size: int | None,
+        batch_window_ms: int | None,
+        concurrency: int | None,
+        request_timeout_ms: int | None,
+    ) -> None:
+        self.collection = collection
+        self.projection = _projection_with_keys(projection, ["_id"])
+        self.request_timeout_ms = request_timeout_ms
+        _max_batch_size, _batch_window_ms, _concurrency = _loader_settings(
+            max_batch_size=max_batch_size,
+            batch_window_ms=batch_window_ms,
+            concurrency=concurrency,
+            default_batch_window_ms=DEFAULT_LOADER_ASYNC_BATCH_WINDOW_MS,
+        )
+        self._batcher = _AsyncLoaderBatcher(
+            self._fetch,
+            group_of=_no_group,
+            max_batch_size=_max_batch_size,
+            batch_window_ms=_batch_window_ms,
+            concurrency=_concurrency,
+        )
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(collection="{self.collection.name}")'
+
+    async def __aenter__(self) -> AsyncCollectionLoader[DOC]:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        await self.close()
+
+    async def _fetch(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        logger.info("loading %s documents from '%s'", len(keys), self.collection.name)
+        return {
+            document["_id"]: document  # type: ignore[index]
+            async for document in self.collection.find(
+                {"_id": {"$in": keys}},
+                projection=self.projection,
+                request_timeout_ms=self.request_timeout_ms,
+            )
+        }
+
+    async def load(self, key: Any) -> DOC | None:
+        """
+        Look up a single document by its `_id`.
+
+        Args:
+            key: the `_id` of the document to load.
+
+        Returns:
+            the document, or None if not found.
+        """
+        (future,) = self._batcher.submit([key], flush=False)
+        result: DOC | None = await future
+        return result
+
+    async def load_many(self, keys: Iterable[Any]) -> list[DOC | None]:
+        """
+        Look up a number of documents by `_id`, without waiting for the batch
+        window to elapse.
+
+        Args:
+            keys: the `_id` values of the documents to load.
+
+        Returns:
+            a list of documents (None for those not found), in the order
+            of the provided keys.
+        """
+        futures = self._batcher.submit(list(keys), flush=True)
+        return list(await asyncio.gather(*futures))
+
+    async def close(self) -> None:
+        """Dispatch all pending lookups and wait for them to complete."""
+        await self._batcher.close()
+
+
+class TableLoader(Generic[ROW]):
+    """
+    A batching loader of rows by primary key for a table, coalescing
+    the lookups made by any number of threads within a short time window
+    into `$in` queries. Obtain one through the table `loader` method.
+
+    Keys can be given as primary-key dictionaries (as for a `find_one` filter),
+    as tuples in primary-key order or, for single-column primary keys, as bare
+    values. Lookups for composite primary keys are batched together if they
+    differ only in the last primary-key column.
+
+    Loaders are thread-safe and hold a thread pool: remember to `close()` them
+    (or use them as context managers).
+
+    Example:
+        >>> with my_table.loader() as loader:
+        ...     loader.load({"match_id": "fight4", "round": 1})
+        ...
+        {'match_id': 'fight4', 'round': 1, 'winner': 'Victor', ...
+    """
+
+    def __init__(
+        self,
+        table: Table[ROW],
+        *,
+        key_columns: list[str] | None,
+        projection: ProjectionType | None,
+        max_batch_size: int | None,
+        batch_window_ms: int | None,
+        concurrency: int | None,
+        request_timeout_ms: int | None,
+    ) -> None:
+        self.table = table
+        self.request_timeout_ms = request_timeout_ms
+        self._projection = projection
+        self._settings = _loader_settings(
+            max_batch_size=max_batch_size,
+            batch_window_ms=batch_window_ms,
+            concurrency=concurrency,
+            default_batch_window_ms=DEFAULT_LOADER_BATCH_WINDOW_MS,
+        )
+        self._key_columns = key_columns
+        self._lock = threading.Lock()
+        self._codec: _TableKeyCodec | None = None
+        self._batcher: _LoaderBatcher | None = None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(table="{self.table.name}")'
+
+    def __enter__(self) -> TableLoader[ROW]:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        self.close()
+
+    def _setup(self, definition: ListTableDefinition) -> None:
+        key_columns = self._key_columns or (
+            definition.primary_key.partition_by
+            + list(definition.primary_key.partition_sort)
+        )
+        self._codec = _TableKeyCodec(
+            key_columns, table=self.table, definition=definition
+        )
+        self.projection = _projection_with_keys(self._projection, key_columns)
+        _max_batch_size, _batch_window_ms, _concurrency = self._settings
+        self._batcher = _LoaderBatcher(
+            self._fetch,
+            group_of=self._codec.group_of,
+            max_batch_size=_max_batch_size,
+            batch_window_ms=_batch_window_ms,
+            concurrency=_concurrency,
+        )
+
+    def _ready(self) -> tuple[_TableKeyCodec, _LoaderBatcher]:
+        with self._lock:
+            if self._codec is None:
+                self._setup(self.table.definition())
+        assert self._codec is not None
+        assert self._batcher is not None
+        return self._codec, self._batcher
+
+    def _fetch(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        assert self._codec is not None
+        logger.info("loading %s rows from '%s'", len(keys), self.table.name)
+        return {
+            self._codec.row_tuple(row): row  # type: ignore[arg-type]
+            for row in self.table.find(
+                self._codec.batch_filter(keys),
+                projection=self.projection,
+                request_timeout_ms=self.request_timeout_ms,
+            )
+        }
+
+    def load(self, key: Any) -> ROW | None:
+        """
+        Look up a single row by its primary key, blocking until the batch
+        containing this lookup completes.
+
+        Args:
+            key: the primary key of the row to load.
+
+        Returns:
+            the row, or None if not found.
+        """
+        codec, batcher = self._ready()
+        (future,) = batcher.submit([codec.to_tuple(key)], flush=False)
+        result: ROW | None = future.result()
+        return result
+
+    def load_many(self, keys: Iterable[Any]) -> list[ROW | None]:
+        """
+        Look up a number of rows by primary key, without waiting for the batch
+        window to elapse.
+
+        Args:
+            keys: the primary keys of the rows to load.
+
+        Returns:
+            a list of rows (None for those not found), in the order
+            of the provided keys.
+        """
+        codec, batcher = self._ready()
+        futures = batcher.submit([codec.to_tuple(key) for key in keys], flush=True)
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Dispatch all pending lookups and release the loader resources."""
+        if self._batcher is not None:
+            self._batcher.close()
+
+
+class AsyncTableLoader(Generic[ROW]):
+    """
+    A batching loader of rows by primary key for an async table, coalescing
+    the lookups made by concurrent coroutines (by default, within the same
+    event-loop iteration) into `$in` queries. Obtain one through the table
+    `loader` method.
+
+    Keys can be given as primary-key dictionaries (as for a `find_one` filter),
+    as tuples in primary-key order or, for single-column primary keys, as bare
+    values. Lookups for composite primary keys are batched together if they
+    differ only in the last primary-key column.
+
+    Example:
+        >>> async def get_rows(loader):
+        ...     return await asyncio.gather(
+        ...         loader.load({"match_id": "fight4", "round": 1}),
+        ...         loader.load({"match_id": "fight4", "round": 2}),
+        ...     )
+        ...
+        >>> asyncio.run(get_rows(my_async_table.loader()))
+        [{'match_id': 'fight4', 'round': 1, ...}, {'match_id': 'fight4', ...}]
+    """
+
+    def __init__(
+        self,
+        table: AsyncTable[ROW],
+        *,
+        key_columns: list[str] | None,
+        projection: ProjectionType | None,
+        max_batch_size: int | None,
+        batch_window_ms: int | None,
+        concurrency: int | None,
+        request_timeout_ms: int | None,
+    ) -> None:
+        self.table = table
+        self.request_timeout_ms = request_timeout_ms
+        self._projection = projection
+        self._settings = _loader_settings(
+            max_batch_size=max_batch_size,
+            batch_window_ms=batch_window_ms,
+            concurrency=concurrency,
+            default_batch_window_ms=DEFAULT_LOADER_ASYNC_BATCH_WINDOW_MS,
+        )
+        self._key_columns = key_columns
+        self._setup_task: asyncio.Task[None] | None = None
+        self._codec: _TableKeyCodec | None = None
+        self._batcher: _AsyncLoaderBatcher | None = None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(table="{self.table.name}")'
+
+    async def __aenter__(self) -> AsyncTableLoader[ROW]:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        await self.close()
+
+    def _setup(self, definition: ListTableDefinition) -> None:
+        key_columns = self._key_columns or (
+            definition.primary_key.partition_by
+            + list(definition.primary_key.partition_sort)
+        )
+        self._codec = _TableKeyCodec(
+            key_columns, table=self.table, definition=definition
+        )
+        self.projection = _projection_with_keys(self._projection, key_columns)
+        _max_batch_size, _batch_window_ms, _concurrency = self._settings
+        self._batcher = _AsyncLoaderBatcher(
+            self._fetch,
+            group_of=self._codec.group_of,
+            max_batch_size=_max_batch_size,
+            batch_window_ms=_batch_window_ms,
+            concurrency=_concurrency,
+        )
+
+    async def _ready(self) -> tuple[_TableKeyCodec, _AsyncLoaderBatcher]:
+        if self._codec is None:
+            # concurrent first lookups share the retrieval of the definition
+            # (and resume together, so as to end up in the same batch)
+            if self._setup_task is None:
+                self._setup_task = asyncio.get_running_loop().create_task(
+                    self._setup_from_definition()
+                )
+            await asyncio.shield(self._setup_task)
+        assert self._codec is not None
+        assert self._batcher is not None
+        return self._codec, self._batcher
+
+    async def _setup_from_definition(self) -> None:
+        try:
+            definition = await self.table.definition()
+        except Exception:
+            # allow a later lookup to try again
+            self._setup_task = None
+            raise
+        self._setup(definition)
+
+    async def _fetch(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        assert self._codec is not None
+        logger.info("loading %s rows from '%s'", len(keys), self.table.name)
+        return {
+            self._codec.row_tuple(row): row  # type: ignore[arg-type]
+            async for row in self.table.find(
+                self._codec.batch_filter(keys),
+                projection=self.projection,
+                request_timeout_ms=self.request_timeout_ms,
+            )
+        }
+
+    async def load(self, key: Any) -> ROW | None:
+        """
+        Look up a single row by its primary key.
+
+        Args:
+            key: the primary key of the row to load.
+
+        Returns:
+            the row, or None if not found.
+        """
+        codec, batcher = await self._ready()
+        (future,) = batcher.submit([codec.to_tuple(key)], flush=False)
+        result: ROW | None = await future
+        return result
+
+    async def load_many(self, keys: Iterable[Any]) -> list[ROW | None]:
+        """
+        Look up a number of rows by primary key, without waiting for the batch
+        window to elapse.
+
+        Args:
+            keys: the primary keys of the rows to load.
+
+        Returns:
+            a list of rows (None for those not found), in the order
+            of the provided keys.
+        """
+        codec, batcher = await self._ready()
+        futures = batcher.submit([codec.to_tuple(key) for key in keys], flush=True)
+        return list(await asyncio.gather(*futures))
+
+    async def close(self) -> None:
+        """Dispatch all pending lookups and wait for them to complete."""
+        if self._batcher is not None:
+            await self._batcher.close()
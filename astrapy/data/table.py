@@ -15,9 +15,10 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
 from collections.abc import Iterable
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
 
@@ -31,6 +32,15 @@ from astrapy.constants import (
     normalize_optional_projection,
 )
 from astrapy.data.info.table_descriptor.table_altering import AlterTableOperation
+from astrapy.data.loaders import AsyncTableLoader, TableLoader
+from astrapy.data.utils.bulk_write import (
+    _aexecute_bulk_write,
+    _bulk_write_settings,
+    _execute_bulk_write,
+    _plan_bulk_write,
+    _table_bulk_write_result,
+    _table_insertion_documents,
+)
 from astrapy.data.utils.distinct_extractors import (
     _create_document_key_extractor,
     _hash_table_document,
@@ -39,9 +49,12 @@ from astrapy.data.utils.distinct_extractors import (
 from astrapy.data.utils.table_converters import _TableConverterAgent
 from astrapy.database import AsyncDatabase, Database
 from astrapy.exceptions import (
+    DataAPIException,
     DataAPIResponseException,
     MultiCallTimeoutManager,
+    TableBulkWriteException,
     TableInsertManyException,
+    TableUpdateManyException,
     TooManyRowsToCountException,
     UnexpectedDataAPIResponseException,
     _TimeoutContext,
@@ -61,14 +74,30 @@ from astrapy.info import (
     TableVectorIndexDefinition,
     TableVectorIndexOptions,
 )
-from astrapy.results import TableInsertManyResult, TableInsertOneResult
+from astrapy.results import (
+    TableBulkWriteResult,
+    TableInsertManyResult,
+    TableInsertOneResult,
+    TableUpdateManyResult,
+)
 from astrapy.settings.defaults import (
     DEFAULT_DATA_API_AUTH_HEADER,
     DEFAULT_INSERT_MANY_CHUNK_SIZE,
     DEFAULT_INSERT_MANY_CONCURRENCY,
+    DEFAULT_TABLE_UPDATE_MANY_CONCURRENCY,
 )
 from astrapy.utils.api_commander import APICommander
 from astrapy.utils.api_options import APIOptions, FullAPIOptions
+from astrapy.utils.operation_stats import (
+    timed_queueing,
+    timed_slot,
+    with_operation_stats,
+)
+from astrapy.utils.tracing import (
+    in_current_context,
+    request_attributes,
+    traced_operation,
+)
 from astrapy.utils.unset import _UNSET, UnsetType
 
 if TYPE_CHECKING:
@@ -78,6 +107,7 @@ if TYPE_CHECKING:
     )
     from astrapy.cursors import AsyncTableFindCursor, TableFindCursor
     from astrapy.info import ListTableDefinition
+    from astrapy.operations import BaseTableOperation
 
 
 logger = logging.getLogger(__name__)
@@ -110,6 +140,43 @@ def map2tuple_checker_update_one(path: list[str]) -> bool:
         return False
 
 
+class _TableUpdateManyAccumulator:
+    """
+    Collect the outcomes of the single-row updates issued by a table update_many.
+    """
+
+    def __init__(self, pk_columns: list[str]) -> None:
+        self.pk_columns = pk_columns
+        self.matched_count = 0
+        self.raw_results: list[dict[str, Any]] = []
+        self.failed_ids: list[dict[str, Any]] = []
+        self.exceptions: list[Exception] = []
+
+    def add_outcomes(
+        self,
+        outcomes: Iterable[tuple[dict[str, Any], dict[str, Any] | Exception]],
+    ) -> None:
+        for row_key, uo_outcome in outcomes:
+            if isinstance(uo_outcome, Exception):
+                self.failed_ids.append(row_key)
+                self.exceptions.append(uo_outcome)
+            else:
+                self.raw_results.append(uo_outcome)
+
+    def result(self) -> TableUpdateManyResult:
+        return TableUpdateManyResult(
+            raw_results=list(self.raw_results),
+            matched_count=self.matched_count,
+            modified_count=len(self.raw_results),
+            failed_ids=list(self.failed_ids),
+            failed_id_tuples=[
+                tuple(failed_id[pk_column] for pk_column in self.pk_columns)
+                for failed_id in self.failed_ids
+            ],
+            exceptions=list(self.exceptions),
+        )
+
+
 class Table(Generic[ROW]):
     """
     A Data API table, the object to interact with the Data API for structured data,
@@ -387,6 +454,9 @@ class Table(Generic[ROW]):
             handle_decimals_writes=True,
             handle_decimals_reads=True,
             ca_cert_path=self.api_options.ca_cert_path,
+            connection_reuse_mode=self.api_options.connection_reuse_mode,
+            read_cache=self.api_options.read_cache,
+            metadata_cache=self.api_options.metadata_cache,
         )
         return api_commander
 
@@ -556,7 +626,7 @@ class Table(Generic[ROW]):
             request_timeout_ms=request_timeout_ms,
             timeout_ms=timeout_ms,
         )
-        logger.info(f"getting tables in search of '{self.name}'")
+        logger.info("getting tables in search of '%s'", self.name)
         self_descriptors = [
             table_desc
             for table_desc in self.database._list_tables_ctx(
@@ -568,7 +638,7 @@ class Table(Generic[ROW]):
             )
             if table_desc.name == self.name
         ]
-        logger.info(f"finished getting tables in search of '{self.name}'")
+        logger.info("finished getting tables in search of '%s'", self.name)
         if self_descriptors:
             return self_descriptors[0].definition
         else:
@@ -702,7 +772,7 @@ class Table(Generic[ROW]):
                 "options": ci_options,
             }
         }
-        logger.info(f"{ci_command}('{i_name}')")
+        logger.info("%s('%s')", ci_command, i_name)
         ci_response = self._api_commander.request(
             payload=ci_payload,
             timeout_context=_TimeoutContext(
@@ -715,7 +785,7 @@ class Table(Generic[ROW]):
                 text=f"Faulty response from {ci_command} API command.",
                 raw_response=ci_response,
             )
-        logger.info(f"finished {ci_command}('{i_name}')")
+        logger.info("finished %s('%s')", ci_command, i_name)
 
     def create_index(
         self,
@@ -1345,7 +1415,7 @@ class Table(Generic[ROW]):
                 },
             },
         }
-        logger.info(f"alterTable({at_operation_name})")
+        logger.info("alterTable(%s)", at_operation_name)
         at_response = self._api_commander.request(
             payload=at_payload,
             timeout_context=_TimeoutContext(
@@ -1358,7 +1428,7 @@ class Table(Generic[ROW]):
                 text="Faulty response from alterTable API command.",
                 raw_response=at_response,
             )
-        logger.info(f"finished alterTable({at_operation_name})")
+        logger.info("finished alterTable(%s)", at_operation_name)
         return Table(
             database=self.database,
             name=self.name,
@@ -1476,7 +1546,7 @@ class Table(Generic[ROW]):
             {"insertOne": {"document": row}},
             map2tuple_checker=map2tuple_checker_insert_one,
         )
-        logger.info(f"insertOne on '{self.name}'")
+        logger.info("insertOne on '%s'", self.name)
         io_response = self._api_commander.request(
             payload=io_payload,
             timeout_context=_TimeoutContext(
@@ -1484,7 +1554,7 @@ class Table(Generic[ROW]):
             ),
             caller_function_name="insert_one",
         )
-        logger.info(f"finished insertOne on '{self.name}'")
+        logger.info("finished insertOne on '%s'", self.name)
         if "insertedIds" in io_response.get("status", {}):
             if not io_response["status"]["insertedIds"]:
                 raise UnexpectedDataAPIResponseException(
@@ -1563,6 +1633,8 @@ class Table(Generic[ROW]):
                 id_tuples = []
         return ids, id_tuples
 
+    @traced_operation("insert_many")
+    @with_operation_stats
     def insert_many(
         self,
         rows: Iterable[ROW],
@@ -1739,7 +1811,7 @@ class Table(Generic[ROW]):
         else:
             _chunk_size = chunk_size
         _rows = list(rows)
-        logger.info(f"inserting {len(_rows)} rows in '{self.name}'")
+        logger.info("inserting %s rows in '%s'", len(_rows), self.name)
         raw_results: list[dict[str, Any]] = []
         im_payloads: list[dict[str, Any] | None] = []
         timeout_manager = MultiCallTimeoutManager(
@@ -1760,17 +1832,18 @@ class Table(Generic[ROW]):
                     },
                     map2tuple_checker=map2tuple_checker_insert_many,
                 )
-                logger.info(f"insertMany on '{self.name}'")
-                chunk_response = self._api_commander.request(
-                    payload=im_payload,
-                    raise_api_errors=False,
-                    timeout_context=timeout_manager.remaining_timeout(
-                        cap_time_ms=_request_timeout_ms,
-                        cap_timeout_label=_rt_label,
-                    ),
-                    caller_function_name="insert_many",
-                )
-                logger.info(f"finished insertMany on '{self.name}'")
+                logger.info("insertMany on '%s'", self.name)
+                with request_attributes(chunk_index=i // _chunk_size):
+                    chunk_response = self._api_commander.request(
+                        payload=im_payload,
+                        raise_api_errors=False,
+                        timeout_context=timeout_manager.remaining_timeout(
+                            cap_time_ms=_request_timeout_ms,
+                            cap_timeout_label=_rt_label,
+                        ),
+                        caller_function_name="insert_many",
+                    )
+                logger.info("finished insertMany on '%s'", self.name)
                 # accumulate the results in this call
                 chunk_inserted_ids, chunk_inserted_ids_tuples = (
                     self._prepare_keys_from_status(chunk_response.get("status"))
@@ -1797,7 +1870,7 @@ class Table(Generic[ROW]):
                 inserted_ids=inserted_ids,
                 inserted_id_tuples=inserted_id_tuples,
             )
-            logger.info(f"finished inserting {len(_rows)} rows in '{self.name}'")
+            logger.info("finished inserting %s rows in '%s'", len(_rows), self.name)
             return full_result
 
         else:
@@ -1807,6 +1880,7 @@ class Table(Generic[ROW]):
                 with ThreadPoolExecutor(max_workers=_concurrency) as executor:
 
                     def _chunk_insertor(
+                        chunk_index: int,
                         row_chunk: list[dict[str, Any]],
                     ) -> tuple[dict[str, Any] | None, dict[str, Any]]:
                         im_payload = self._converter_agent.preprocess_payload(
@@ -1818,22 +1892,24 @@ class Table(Generic[ROW]):
                             },
                             map2tuple_checker=map2tuple_checker_insert_many,
                         )
-                        logger.info(f"insertMany(chunk) on '{self.name}'")
-                        im_response = self._api_commander.request(
-                            payload=im_payload,
-                            raise_api_errors=False,
-                            timeout_context=timeout_manager.remaining_timeout(
-                                cap_time_ms=_request_timeout_ms,
-                                cap_timeout_label=_rt_label,
-                            ),
-                            caller_function_name="insert_many",
-                        )
-                        logger.info(f"finished insertMany(chunk) on '{self.name}'")
+                        logger.info("insertMany(chunk) on '%s'", self.name)
+                        with request_attributes(chunk_index=chunk_index):
+                            im_response = self._api_commander.request(
+                                payload=im_payload,
+                                raise_api_errors=False,
+                                timeout_context=timeout_manager.remaining_timeout(
+                                    cap_time_ms=_request_timeout_ms,
+                                    cap_timeout_label=_rt_label,
+                                ),
+                                caller_function_name="insert_many",
+                            )
+                        logger.info("finished insertMany(chunk) on '%s'", self.name)
                         return im_payload, im_response
 
                     raw_pl_results_pairs = list(
                         executor.map(
-                            _chunk_insertor,
+                            timed_queueing(in_current_context(_chunk_insertor)),
+                            itertools.count(),
                             (
                                 _rows[i : i + _chunk_size]
                                 for i in range(0, len(_rows), _chunk_size)
@@ -1856,17 +1932,18 @@ class Table(Generic[ROW]):
                         },
                         map2tuple_checker=map2tuple_checker_insert_many,
                     )
-                    logger.info(f"insertMany(chunk) on '{self.name}'")
-                    im_response = self._api_commander.request(
-                        payload=im_payload,
-                        raise_api_errors=False,
-                        timeout_context=timeout_manager.remaining_timeout(
-                            cap_time_ms=_request_timeout_ms,
-                            cap_timeout_label=_rt_label,
-                        ),
-                        caller_function_name="insert_many",
-                    )
-                    logger.info(f"finished insertMany(chunk) on '{self.name}'")
+                    logger.info("insertMany(chunk) on '%s'", self.name)
+                    with request_attributes(chunk_index=i // _chunk_size):
+                        im_response = self._api_commander.request(
+                            payload=im_payload,
+                            raise_api_errors=False,
+                            timeout_context=timeout_manager.remaining_timeout(
+                                cap_time_ms=_request_timeout_ms,
+                                cap_timeout_label=_rt_label,
+                            ),
+                            caller_function_name="insert_many",
+                        )
+                    logger.info("finished insertMany(chunk) on '%s'", self.name)
                     raw_results.append(im_response)
                     im_payloads.append(im_payload)
             # recast raw_results. Each response has its schema: unfold appropriately
@@ -1906,7 +1983,7 @@ class Table(Generic[ROW]):
                 inserted_ids=inserted_ids,
                 inserted_id_tuples=inserted_id_tuples,
             )
-            logger.info(f"finished inserting {len(_rows)} rows in '{self.name}'")
+            logger.info("finished inserting %s rows in '%s'", len(_rows), self.name)
             return full_result
 
     @overload
@@ -2454,6 +2531,65 @@ class Table(Generic[ROW]):
             similarity_pseudocolumn="$similarity" if include_similarity else None,
         )
 
+    def loader(
+        self,
+        *,
+        key_columns: list[str] | None = None,
+        projection: ProjectionType | None = None,
+        max_batch_size: int | None = None,
+        batch_window_ms: int | None = None,
+        concurrency: int | None = None,
+        request_timeout_ms: int | None = None,
+    ) -> TableLoader[ROW]:
+        """
+        Create a loader for batched lookups of rows by primary key.
+
+        Individual lookups made through the loader within a short time window
+        are collected and sent as `$in` queries, in batches running concurrently.
+        This greatly reduces the number of requests compared to issuing one
+        `find_one` per row, when many lookups are made at the same time.
+
+        Args:
+            key_columns: the primary-key columns of the table, in order. If not
+                provided, they are taken from the table definition. In any case,
+                the definition is read on first use: keys are matched to rows
+                according to the column types (so that e.g. a `date` key can be
+                given as a string, as for `find_one`).
+            projection: a projection to apply to the rows. The primary key
+                is always included, as it is needed to match rows to lookups.
+            max_batch_size: the maximum number of keys in a single `$in` query.
+                It cannot exceed the maximum allowed by the Data API. The default
+                matches the size of a page of `find` results, so that each batch
+                takes a single request: larger batches are fetched page by page.
+            batch_window_ms: how long, in milliseconds, to wait for more lookups
+                before sending a batch. Leave it unspecified to use the
+                system default (a couple of milliseconds).
+            concurrency: the maximum number of batches running at the same time.
+            request_timeout_ms: a timeout, in milliseconds, for each API request.
+                If not provided, this object's defaults apply.
+
+        Returns:
+            a TableLoader object, whose `load` and `load_many` methods return
+            the rows (or None when not found).
+
+        Example:
+            >>> with my_table.loader() as loader:
+            ...     loader.load({"match_id": "fight4", "round": 1})
+            ...
+            {'match_id': 'fight4', 'round': 1, 'winner': 'Victor', ...
+        """
+
+        return TableLoader(
+            self,
+            key_columns=key_columns,
+            projection=projection,
+            max_batch_size=max_batch_size,
+            batch_window_ms=batch_window_ms,
+            concurrency=concurrency,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+    @traced_operation("distinct")
     def distinct(
         self,
         key: str | Iterable[str | int],
@@ -2571,7 +2707,7 @@ class Table(Generic[ROW]):
         # consuming it:
         _item_hashes = set()
         distinct_items: list[Any] = []
-        logger.info(f"running distinct() on '{self.name}'")
+        logger.info("running distinct() on '%s'", self.name)
         for document in f_cursor:
             for item in _extractor(document):
                 _item_hash = _hash_table_document(
@@ -2580,7 +2716,7 @@ class Table(Generic[ROW]):
                 if _item_hash not in _item_hashes:
                     _item_hashes.add(_item_hash)
                     distinct_items.append(item)
-        logger.info(f"finished running distinct() on '{self.name}'")
+        logger.info("finished running distinct() on '%s'", self.name)
         return distinct_items
 
     def count_documents(
@@ -2649,7 +2785,7 @@ class Table(Generic[ROW]):
             timeout_ms=timeout_ms,
         )
         cd_payload = {"countDocuments": {"filter": filter}}
-        logger.info(f"countDocuments on '{self.name}'")
+        logger.info("countDocuments on '%s'", self.name)
         cd_response = self._api_commander.request(
             payload=cd_payload,
             timeout_context=_TimeoutContext(
@@ -2657,7 +2793,7 @@ class Table(Generic[ROW]):
             ),
             caller_function_name="count_documents",
         )
-        logger.info(f"finished countDocuments on '{self.name}'")
+        logger.info("finished countDocuments on '%s'", self.name)
         if "count" in cd_response.get("status", {}):
             count: int = cd_response["status"]["count"]
             if cd_response["status"].get("moreData", False):
@@ -2714,7 +2850,7 @@ class Table(Generic[ROW]):
             timeout_ms=timeout_ms,
         )
         ed_payload: dict[str, Any] = {"estimatedDocumentCount": {}}
-        logger.info(f"estimatedDocumentCount on '{self.name}'")
+        logger.info("estimatedDocumentCount on '%s'", self.name)
         ed_response = self._api_commander.request(
             payload=ed_payload,
             timeout_context=_TimeoutContext(
@@ -2722,7 +2858,7 @@ class Table(Generic[ROW]):
             ),
             caller_function_name="estimated_document_count",
         )
-        logger.info(f"finished estimatedDocumentCount on '{self.name}'")
+        logger.info("finished estimatedDocumentCount on '%s'", self.name)
         if "count" in ed_response.get("status", {}):
             count: int = ed_response["status"]["count"]
             return count
@@ -2732,6 +2868,41 @@ class Table(Generic[ROW]):
                 raw_response=ed_response,
             )
 
+    def _update_one_ctx(
+        self,
+        filter: FilterType,
+        update: dict[str, Any],
+        *,
+        timeout_context: _TimeoutContext,
+    ) -> dict[str, Any]:
+        uo_payload = self._converter_agent.preprocess_payload(
+            {
+                "updateOne": {
+                    k: v
+                    for k, v in {
+                        "filter": filter,
+                        "update": update,
+                    }.items()
+                    if v is not None
+                }
+            },
+            map2tuple_checker=map2tuple_checker_update_one,
+        )
+        logger.info("updateOne on '%s'", self.name)
+        uo_response = self._api_commander.request(
+            payload=uo_payload,
+            timeout_context=timeout_context,
+            caller_function_name="update_one",
+        )
+        logger.info("finished updateOne on '%s'", self.name)
+        if "status" in uo_response:
+            return uo_response
+        else:
+            raise UnexpectedDataAPIResponseException(
+                text="Faulty response from updateOne API command.",
+                raw_response=uo_response,
+            )
+
     def update_one(
         self,
         filter: FilterType,
@@ -2826,36 +2997,162 @@ class Table(Generic[ROW]):
             request_timeout_ms=request_timeout_ms,
             timeout_ms=timeout_ms,
         )
-        uo_payload = self._converter_agent.preprocess_payload(
-            {
-                "updateOne": {
-                    k: v
-                    for k, v in {
-                        "filter": filter,
-                        "update": update,
-                    }.items()
-                    if v is not None
-                }
-            },
-            map2tuple_checker=map2tuple_checker_update_one,
-        )
-        logger.info(f"updateOne on '{self.name}'")
-        uo_response = self._api_commander.request(
-            payload=uo_payload,
+        self._update_one_ctx(
+            filter,
+            update,
             timeout_context=_TimeoutContext(
                 request_ms=_request_timeout_ms, label=_rt_label
             ),
-            caller_function_name="update_one",
         )
-        logger.info(f"finished updateOne on '{self.name}'")
-        if "status" in uo_response:
-            # the contents are disregarded and the method just returns:
-            return
+
+    @traced_operation("update_many")
+    @with_operation_stats
+    def update_many(
+        self,
+        filter: FilterType,
+        update: dict[str, Any],
+        *,
+        concurrency: int | None = None,
+        general_method_timeout_ms: int | None = None,
+        request_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> TableUpdateManyResult:
+        """
+        Update all rows matching a filter condition, applying the same update
+        prescription to each of them.
+
+        Since the Data API only supports updating a single row (identified by its
+        full primary key) per request, this method first reads the table primary
+        key from its definition, then scans the matching rows with a `find`
+        projecting the primary-key columns only, and issues one `update_one` per
+        row found. The updates are launched, with a certain degree of concurrency,
+        while the scan proceeds. This is not an atomic operation.
+
+        Args:
+            filter: a filter condition to select the rows to update, with the
+                same syntax as for the `find` method. An empty filter, `{}`,
+                targets all rows in the table.
+            update: the update prescription to apply to each row, with the same
+                syntax as for the `update_one` method.
+                Note that the update operation cannot alter the primary key columns.
+            concurrency: maximum number of concurrent `update_one` requests to the
+                API at a given time. Leave it unspecified to use the system default.
+            general_method_timeout_ms: a timeout, in milliseconds, to impose on the
+                whole operation, which may consist of several API requests.
+                If not provided, this object's defaults apply.
+            request_timeout_ms: a timeout, in milliseconds, to impose on each
+                individual HTTP request to the Data API to accomplish the operation.
+                If not provided, this object's defaults apply.
+            timeout_ms: an alias for `general_method_timeout_ms`.
+
+        Returns:
+            a TableUpdateManyResult object, reporting the number of rows found and
+            updated, and the primary key (and error) of each row whose
+            update failed.
+
+        Example:
+            >>> my_table.update_many(
+            ...     {"match_id": "fight7"},
+            ...     {"$set": {"winner": "Zoe"}},
+            ... )
+            TableUpdateManyResult(matched_count=3, modified_count=3, raw_results=...)
+
+        Note:
+            Errors on individual rows do not stop the operation and are collected
+            in the result. Conversely, if the scan of the primary keys fails
+            (or the overall timeout is exceeded) the method raises a
+            `TableUpdateManyException`, carrying the partial result up to
+            that point.
+
+        Note:
+            Similarly to the case of `find` (see its docstring for more details),
+            running this command while, at the same time, another process is
+            inserting new rows which match the filter can result in an unpredictable
+            fraction of these rows being updated.
+        """
+
+        _general_method_timeout_ms, _gmt_label = _first_valid_timeout(
+            (general_method_timeout_ms, "general_method_timeout_ms"),
+            (timeout_ms, "timeout_ms"),
+            (
+                self.api_options.timeout_options.general_method_timeout_ms,
+                "general_method_timeout_ms",
+            ),
+        )
+        _request_timeout_ms, _rt_label = _first_valid_timeout(
+            (request_timeout_ms, "request_timeout_ms"),
+            (self.api_options.timeout_options.request_timeout_ms, "request_timeout_ms"),
+        )
+        if concurrency is None:
+            _concurrency = DEFAULT_TABLE_UPDATE_MANY_CONCURRENCY
         else:
-            raise UnexpectedDataAPIResponseException(
-                text="Faulty response from updateOne API command.",
-                raw_response=uo_response,
+            _concurrency = concurrency
+        if _concurrency < 1:
+            raise ValueError(
+                "The concurrency of update_many must be a positive integer."
             )
+        timeout_manager = MultiCallTimeoutManager(
+            overall_timeout_ms=_general_method_timeout_ms,
+            timeout_label=_gmt_label,
+        )
+        logger.info("starting update_many on '%s'", self.name)
+        primary_key = self.definition(
+            table_admin_timeout_ms=timeout_manager.remaining_timeout(
+                cap_time_ms=_request_timeout_ms,
+                cap_timeout_label=_rt_label,
+            ).request_ms,
+        ).primary_key
+        pk_columns = primary_key.partition_by + list(primary_key.partition_sort)
+        accumulator = _TableUpdateManyAccumulator(pk_columns)
+
+        def _update_row(
+            row_key: dict[str, Any],
+        ) -> tuple[dict[str, Any], dict[str, Any] | Exception]:
+            try:
+                uo_response = self._update_one_ctx(
+                    row_key,
+                    update,
+                    timeout_context=timeout_manager.remaining_timeout(
+                        cap_time_ms=_request_timeout_ms,
+                        cap_timeout_label=_rt_label,
+                    ),
+                )
+                return row_key, uo_response
+            except DataAPIException as exc:
+                return row_key, exc
+
+        # (the updates run in the worker threads as part of this operation)
+        traced_update_row = in_current_context(_update_row)
+        with ThreadPoolExecutor(max_workers=_concurrency) as executor:
+            pending: set[Future[Any]] = set()
+            try:
+                pk_cursor = self.find(
+                    filter,
+                    projection={pk_column: True for pk_column in pk_columns},
+                    row_type=dict,
+                    request_timeout_ms=_request_timeout_ms,
+                )
+                for row in pk_cursor:
+                    timeout_manager.remaining_timeout()
+                    row_key = {pk_column: row[pk_column] for pk_column in pk_columns}
+                    accumulator.matched_count += 1
+                    pending.add(
+                        executor.submit(timed_queueing(traced_update_row), row_key)
+                    )
+                    # bound the updates in flight, so as not to outpace the scan
+                    if len(pending) >= 2 * _concurrency:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        accumulator.add_outcomes(fut.result() for fut in done)
+            except DataAPIException as exc:
+                accumulator.add_outcomes(fut.result() for fut in wait(pending).done)
+                raise TableUpdateManyException(
+                    partial_result=accumulator.result(),
+                    cause=exc,
+                )
+            accumulator.add_outcomes(fut.result() for fut in wait(pending).done)
+
+        logger.info("finished update_many on '%s'", self.name)
+        return accumulator.result()
 
     def delete_one(
         self,
@@ -2919,7 +3216,7 @@ class Table(Generic[ROW]):
             },
             map2tuple_checker=None,
         )
-        logger.info(f"deleteOne on '{self.name}'")
+        logger.info("deleteOne on '%s'", self.name)
         do_response = self._api_commander.request(
             payload=do_payload,
             timeout_context=_TimeoutContext(
@@ -2927,7 +3224,7 @@ class Table(Generic[ROW]):
             ),
             caller_function_name="delete_one",
         )
-        logger.info(f"finished deleteOne on '{self.name}'")
+        logger.info("finished deleteOne on '%s'", self.name)
         if do_response.get("status", {}).get("deletedCount") == -1:
             return
         else:
@@ -2936,6 +3233,7 @@ class Table(Generic[ROW]):
                 raw_response=do_response,
             )
 
+    @traced_operation("delete_many")
     def delete_many(
         self,
         filter: FilterType,
@@ -3015,7 +3313,7 @@ class Table(Generic[ROW]):
             },
             map2tuple_checker=None,
         )
-        logger.info(f"deleteMany on '{self.name}'")
+        logger.info("deleteMany on '%s'", self.name)
         dm_response = self._api_commander.request(
             payload=dm_payload,
             timeout_context=_TimeoutContext(
@@ -3023,7 +3321,7 @@ class Table(Generic[ROW]):
             ),
             caller_function_name="delete_many",
         )
-        logger.info(f"finished deleteMany on '{self.name}'")
+        logger.info("finished deleteMany on '%s'", self.name)
         if dm_response.get("status", {}).get("deletedCount") == -1:
             return
         else:
@@ -3032,6 +3330,124 @@ class Table(Generic[ROW]):
                 raw_response=dm_response,
             )
 
+    @traced_operation("bulk_write")
+    def bulk_write(
+        self,
+        requests: Iterable[BaseTableOperation],
+        *,
+        ordered: bool = False,
+        chunk_size: int | None = None,
+        concurrency: int | None = None,
+        general_method_timeout_ms: int | None = None,
+        request_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> TableBulkWriteResult:
+        """
+        Execute an arbitrary amount of operations such as inserts, updates, deletes
+        either sequentially or concurrently.
+        This is not an atomic operation.
+
+        Consecutive insertions (for unordered bulk writes: all insertions) are
+        coalesced into `insertMany` commands; all other operations are executed
+        as individual method calls.
+
+        Args:
+            requests: an iterable over concrete subclasses of `BaseTableOperation`,
+                such as `TableInsertOne`, `TableInsertMany`, `TableUpdateOne`,
+                `TableDeleteOne`, `TableDeleteMany` (from `astrapy.operations`).
+            ordered: whether to launch the `requests` one after the other or
+                in arbitrary order, possibly in a concurrent fashion. An ordered
+                bulk write stops at the first failure, while an unordered one
+                tries to execute all operations in any case.
+            chunk_size: how many rows to include in a single `insertMany`
+                API request. Leave it unspecified (recommended) to use the
+                system default.
+            concurrency: maximum number of concurrent operations executing at
+                a given time. It cannot be more than one for ordered bulk writes.
+            general_method_timeout_ms: a timeout, in milliseconds, for the whole
+                bulk write. If not passed, the table-level setting is used.
+            request_timeout_ms: a timeout, in milliseconds, for each API request.
+                If not passed, the table-level setting is used instead.
+            timeout_ms: an alias for `general_method_timeout_ms`.
+
+        Returns:
+            A single TableBulkWriteResult summarizing the whole list of
+            requested operations. The keys in the maps (e.g. `inserted_ids`)
+            are the positions of the operations in the `requests` iterable.
+
+        Example:
+            >>> from astrapy.operations import (
+            ...     TableDeleteOne,
+            ...     TableInsertOne,
+            ...     TableUpdateOne,
+            ... )
+            >>> my_table.bulk_write(
+            ...     [
+            ...         TableInsertOne({"match_id": "fight1", "round": 1}),
+            ...         TableInsertOne({"match_id": "fight1", "round": 2}),
+            ...         TableUpdateOne(
+            ...             {"match_id": "fight1", "round": 1},
+            ...             {"$set": {"winner": "Jules"}},
+            ...         ),
+            ...         TableDeleteOne({"match_id": "fight1", "round": 2}),
+            ...     ],
+            ...     ordered=True,
+            ... )
+            TableBulkWriteResult(inserted_count=2, update_count=1, delete_count=1, inserted_ids={0: [{'match_id': 'fight1', 'round': 1}], 1: [{'match_id': 'fight1', 'round': 2}]}, raw_results=...)
+
+        Note:
+            If some of the operations fail, a `TableBulkWriteException` is
+            raised, carrying a partial result (accounting for the successful
+            operations), the root exceptions and a map from the position of
+            each failed operation to its error.
+        """
+
+        _general_method_timeout_ms, _gmt_label = _first_valid_timeout(
+            (general_method_timeout_ms, "general_method_timeout_ms"),
+            (timeout_ms, "timeout_ms"),
+            (
+                self.api_options.timeout_options.general_method_timeout_ms,
+                "general_method_timeout_ms",
+            ),
+        )
+        _request_timeout_ms, _ = _first_valid_timeout(
+            (request_timeout_ms, "request_timeout_ms"),
+            (self.api_options.timeout_options.request_timeout_ms, "request_timeout_ms"),
+        )
+        _chunk_size, _concurrency = _bulk_write_settings(
+            ordered=ordered,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+        units = _plan_bulk_write(
+            requests,
+            insertion_documents=_table_insertion_documents,
+            ordered=ordered,
+            chunk_size=_chunk_size,
+        )
+        logger.info("bulk_write (%s units) on '%s'", len(units), self.name)
+        timeout_manager = MultiCallTimeoutManager(
+            overall_timeout_ms=_general_method_timeout_ms,
+            timeout_label=_gmt_label,
+        )
+        outcome = _execute_bulk_write(
+            self,
+            units,
+            ordered=ordered,
+            concurrency=_concurrency,
+            timeout_manager=timeout_manager,
+            request_timeout_ms=_request_timeout_ms,
+        )
+        bulk_write_result = _table_bulk_write_result(outcome)
+        if outcome.operation_errors:
+            raise TableBulkWriteException(
+                partial_result=bulk_write_result,
+                exceptions=outcome.exceptions,
+                operation_errors=dict(sorted(outcome.operation_errors.items())),
+            )
+        logger.info("finished bulk_write on '%s'", self.name)
+        return bulk_write_result
+
     def drop(
         self,
         *,
@@ -3087,7 +3503,7 @@ class Table(Generic[ROW]):
             which avoids using a deceased collection any further.
         """
 
-        logger.info(f"dropping table '{self.name}' (self)")
+        logger.info("dropping table '%s' (self)", self.name)
         self.database.drop_table(
             self.name,
             if_exists=if_exists,
@@ -3095,7 +3511,7 @@ class Table(Generic[ROW]):
             request_timeout_ms=request_timeout_ms,
             timeout_ms=timeout_ms,
         )
-        logger.info(f"finished dropping table '{self.name}' (self)")
+        logger.info("finished dropping table '%s' (self)", self.name)
 
     def command(
         self,
@@ -3146,7 +3562,7 @@ class Table(Generic[ROW]):
             _cmd_desc = ",".join(sorted(body.keys()))
         else:
             _cmd_desc = "(none)"
-        logger.info(f"command={_cmd_desc} on '{self.name}'")
+        logger.info("command=%s on '%s'", _cmd_desc, self.name)
         command_result = self._api_commander.request(
             payload=body,
             raise_api_errors=raise_api_errors,
@@ -3155,7 +3571,7 @@ class Table(Generic[ROW]):
             ),
             caller_function_name="command",
         )
-        logger.info(f"finished command={_cmd_desc} on '{self.name}'")
+        logger.info("finished command=%s on '%s'", _cmd_desc, self.name)
         return command_result
 
 
@@ -3439,6 +3855,9 @@ class AsyncTable(Generic[ROW]):
             handle_decimals_writes=True,
             handle_decimals_reads=True,
             ca_cert_path=self.api_options.ca_cert_path,
+            connection_reuse_mode=self.api_options.connection_reuse_mode,
+            read_cache=self.api_options.read_cache,
+            metadata_cache=self.api_options.metadata_cache,
         )
         return api_commander
 
@@ -3626,7 +4045,7 @@ class AsyncTable(Generic[ROW]):
             request_timeout_ms=request_timeout_ms,
             timeout_ms=timeout_ms,
         )
-        logger.info(f"getting tables in search of '{self.name}'")
+        logger.info("getting tables in search of '%s'", self.name)
         self_descriptors = [
             table_desc
             for table_desc in await self.database._list_tables_ctx(
@@ -3638,7 +4057,7 @@ class AsyncTable(Generic[ROW]):
             )
             if table_desc.name == self.name
         ]
-        logger.info(f"finished getting tables in search of '{self.name}'")
+        logger.info("finished getting tables in search of '%s'", self.name)
         if self_descriptors:
             return self_descriptors[0].definition
         else:
@@ -3775,7 +4194,7 @@ class AsyncTable(Generic[ROW]):
                 "options": ci_options,
             }
         }
-        logger.info(f"{ci_command}('{i_name}')")
+        logger.info("%s('%s')", ci_command, i_name)
         ci_response = await self._api_commander.async_request(
             payload=ci_payload,
             timeout_context=_TimeoutContext(
@@ -3788,7 +4207,7 @@ class AsyncTable(Generic[ROW]):
                 text=f"Faulty response from {ci_command} API command.",
                 raw_response=ci_response,
             )
-        logger.info(f"finished {ci_command}('{i_name}')")
+        logger.info("finished %s('%s')", ci_command, i_name)
 
     async def create_index(
         self,
@@ -4432,7 +4851,7 @@ class AsyncTable(Generic[ROW]):
                 },
             },
         }
-        logger.info(f"alterTable({at_operation_name})")
+        logger.info("alterTable(%s)", at_operation_name)
         at_response = await self._api_commander.async_request(
             payload=at_payload,
             timeout_context=_TimeoutContext(
@@ -4445,7 +4864,7 @@ class AsyncTable(Generic[ROW]):
                 text="Faulty response from alterTable API command.",
                 raw_response=at_response,
             )
-        logger.info(f"finished alterTable({at_operation_name})")
+        logger.info("finished alterTable(%s)", at_operation_name)
         return AsyncTable(
             database=self.database,
             name=self.name,
@@ -4565,7 +4984,7 @@ class AsyncTable(Generic[ROW]):
             {"insertOne": {"document": row}},
             map2tuple_checker=map2tuple_checker_insert_one,
         )
-        logger.info(f"insertOne on '{self.name}'")
+        logger.info("insertOne on '%s'", self.name)
         io_response = await self._api_commander.async_request(
             payload=io_payload,
             timeout_context=_TimeoutContext(
@@ -4573,7 +4992,7 @@ class AsyncTable(Generic[ROW]):
             ),
             caller_function_name="insert_one",
         )
-        logger.info(f"finished insertOne on '{self.name}'")
+        logger.info("finished insertOne on '%s'", self.name)
         if "insertedIds" in io_response.get("status", {}):
             if not io_response["status"]["insertedIds"]:
                 raise UnexpectedDataAPIResponseException(
@@ -4649,6 +5068,8 @@ class AsyncTable(Generic[ROW]):
                 id_tuples = []
         return ids, id_tuples
 
+    @traced_operation("insert_many")
+    @with_operation_stats
     async def insert_many(
         self,
         rows: Iterable[ROW],
@@ -4827,7 +5248,7 @@ class AsyncTable(Generic[ROW]):
         else:
             _chunk_size = chunk_size
         _rows = list(rows)
-        logger.info(f"inserting {len(_rows)} rows in '{self.name}'")
+        logger.info("inserting %s rows in '%s'", len(_rows), self.name)
         raw_results: list[dict[str, Any]] = []
         im_payloads: list[dict[str, Any] | None] = []
         timeout_manager = MultiCallTimeoutManager(
@@ -4848,17 +5269,18 @@ class AsyncTable(Generic[ROW]):
                     },
                     map2tuple_checker=map2tuple_checker_insert_many,
                 )
-                logger.info(f"insertMany(chunk) on '{self.name}'")
-                chunk_response = await self._api_commander.async_request(
-                    payload=im_payload,
-                    raise_api_errors=False,
-                    timeout_context=timeout_manager.remaining_timeout(
-                        cap_time_ms=_request_timeout_ms,
-                        cap_timeout_label=_rt_label,
-                    ),
-                    caller_function_name="insert_many",
-                )
-                logger.info(f"finished insertMany(chunk) on '{self.name}'")
+                logger.info("insertMany(chunk) on '%s'", self.name)
+                with request_attributes(chunk_index=i // _chunk_size):
+                    chunk_response = await self._api_commander.async_request(
+                        payload=im_payload,
+                        raise_api_errors=False,
+                        timeout_context=timeout_manager.remaining_timeout(
+                            cap_time_ms=_request_timeout_ms,
+                            cap_timeout_label=_rt_label,
+                        ),
+                        caller_function_name="insert_many",
+                    )
+                logger.info("finished insertMany(chunk) on '%s'", self.name)
                 # accumulate the results in this call
                 chunk_inserted_ids, chunk_inserted_ids_tuples = (
                     self._prepare_keys_from_status(chunk_response.get("status"))
@@ -4884,7 +5306,7 @@ class AsyncTable(Generic[ROW]):
                 inserted_ids=inserted_ids,
                 inserted_id_tuples=inserted_id_tuples,
             )
-            logger.info(f"finished inserting {len(_rows)} rows in '{self.name}'")
+            logger.info("finished inserting %s rows in '%s'", len(_rows), self.name)
             return full_result
 
         else:
@@ -4894,9 +5316,10 @@ class AsyncTable(Generic[ROW]):
             sem = asyncio.Semaphore(_concurrency)
 
             async def concurrent_insert_chunk(
+                chunk_index: int,
                 row_chunk: list[ROW],
             ) -> tuple[dict[str, Any] | None, dict[str, Any]]:
-                async with sem:
+                async with timed_slot(sem):
                     im_payload = self._converter_agent.preprocess_payload(
                         {
                             "insertMany": {
@@ -4906,31 +5329,36 @@ class AsyncTable(Generic[ROW]):
                         },
                         map2tuple_checker=map2tuple_checker_insert_many,
                     )
-                    logger.info(f"insertMany(chunk) on '{self.name}'")
-                    im_response = await self._api_commander.async_request(
-                        payload=im_payload,
-                        raise_api_errors=False,
-                        timeout_context=timeout_manager.remaining_timeout(
-                            cap_time_ms=_request_timeout_ms,
-                            cap_timeout_label=_rt_label,
-                        ),
-                        caller_function_name="insert_many",
-                    )
-                    logger.info(f"finished insertMany(chunk) on '{self.name}'")
+                    logger.info("insertMany(chunk) on '%s'", self.name)
+                    with request_attributes(chunk_index=chunk_index):
+                        im_response = await self._api_commander.async_request(
+                            payload=im_payload,
+                            raise_api_errors=False,
+                            timeout_context=timeout_manager.remaining_timeout(
+                                cap_time_ms=_request_timeout_ms,
+                                cap_timeout_label=_rt_label,
+                            ),
+                            caller_function_name="insert_many",
+                        )
+                    logger.info("finished insertMany(chunk) on '%s'", self.name)
                     return im_payload, im_response
 
             raw_pl_results_pairs: list[tuple[dict[str, Any] | None, dict[str, Any]]]
             if _concurrency > 1:
                 tasks = [
                     asyncio.create_task(
-                        concurrent_insert_chunk(_rows[i : i + _chunk_size])
+                        concurrent_insert_chunk(
+                            i // _chunk_size, _rows[i : i + _chunk_size]
+                        )
                     )
                     for i in range(0, len(_rows), _chunk_size)
                 ]
                 raw_pl_results_pairs = await asyncio.gather(*tasks)
             else:
                 raw_pl_results_pairs = [
-                    await concurrent_insert_chunk(_rows[i : i + _chunk_size])
+                    await concurrent_insert_chunk(
+                        i // _chunk_size, _rows[i : i + _chunk_size]
+                    )
                     for i in range(0, len(_rows), _chunk_size)
                 ]
 
@@ -4977,7 +5405,7 @@ class AsyncTable(Generic[ROW]):
                 inserted_ids=inserted_ids,
                 inserted_id_tuples=inserted_id_tuples,
             )
-            logger.info(f"finished inserting {len(_rows)} rows in '{self.name}'")
+            logger.info("finished inserting %s rows in '%s'", len(_rows), self.name)
             return full_result
 
     @overload
@@ -5554,6 +5982,69 @@ class AsyncTable(Generic[ROW]):
             similarity_pseudocolumn="$similarity" if include_similarity else None,
         )
 
+    def loader(
+        self,
+        *,
+        key_columns: list[str] | None = None,
+        projection: ProjectionType | None = None,
+        max_batch_size: int | None = None,
+        batch_window_ms: int | None = None,
+        concurrency: int | None = None,
+        request_timeout_ms: int | None = None,
+    ) -> AsyncTableLoader[ROW]:
+        """
+        Create a loader for batched lookups of rows by primary key.
+
+        Individual lookups made through the loader within a short time window
+        are collected and sent as `$in` queries, in batches running concurrently.
+        This greatly reduces the number of requests compared to issuing one
+        `find_one` per row, when many lookups are made at the same time.
+
+        Args:
+            key_columns: the primary-key columns of the table, in order. If not
+                provided, they are taken from the table definition. In any case,
+                the definition is read on first use: keys are matched to rows
+                according to the column types (so that e.g. a `date` key can be
+                given as a string, as for `find_one`).
+            projection: a projection to apply to the rows. The primary key
+                is always included, as it is needed to match rows to lookups.
+            max_batch_size: the maximum number of keys in a single `$in` query.
+                It cannot exceed the maximum allowed by the Data API. The default
+                matches the size of a page of `find` results, so that each batch
+                takes a single request: larger batches are fetched page by page.
+            batch_window_ms: how long, in milliseconds, to wait for more lookups
+                before sending a batch. The default of zero means that all lookups
+                made within the same event-loop iteration are batched together.
+            concurrency: the maximum number of batches running at the same time.
+            request_timeout_ms: a timeout, in milliseconds, for each API request.
+                If not provided, this object's defaults apply.
+
+        Returns:
+            an AsyncTableLoader object, whose `load` and `load_many` methods return
+            the rows (or None when not found).
+
+        Example:
+            >>> async def get_two(loader):
+            ...     return await asyncio.gather(
+            ...         loader.load({"match_id": "fight4", "round": 1}),
+            ...         loader.load({"match_id": "fight4", "round": 2}),
+            ...     )
+            ...
+            >>> asyncio.run(get_two(my_async_table.loader()))
+            [{'match_id': 'fight4', 'round': 1, ...}, {'match_id': 'fight4', ...}]
+        """
+
+        return AsyncTableLoader(
+            self,
+            key_columns=key_columns,
+            projection=projection,
+            max_batch_size=max_batch_size,
+            batch_window_ms=batch_window_ms,
+            concurrency=concurrency,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+    @traced_operation("distinct")
     async def distinct(
         self,
         key: str | Iterable[str | int],
@@ -5676,7 +6167,7 @@ class AsyncTable(Generic[ROW]):
         # consuming it:
         _item_hashes = set()
         distinct_items: list[Any] = []
-        logger.info(f"running distinct() on '{self.name}'")
+        logger.info("running distinct() on '%s'", self.name)
         async for document in f_cursor:
             for item in _extractor(document):
                 _item_hash = _hash_table_document(
@@ -5685,7 +6176,7 @@ class AsyncTable(Generic[ROW]):
                 if _item_hash not in _item_hashes:
                     _item_hashes.add(_item_hash)
                     distinct_items.append(item)
-        logger.info(f"finished running distinct() on '{self.name}'")
+        logger.info("finished running distinct() on '%s'", self.name)
         return distinct_items
 
     async def count_documents(
@@ -5756,7 +6247,7 @@ class AsyncTable(Generic[ROW]):
             timeout_ms=timeout_ms,
         )
         cd_payload = {"countDocuments": {"filter": filter}}
-        logger.info(f"countDocuments on '{self.name}'")
+        logger.info("countDocuments on '%s'", self.name)
         cd_response = await self._api_commander.async_request(
             payload=cd_payload,
             timeout_context=_TimeoutContext(
@@ -5764,7 +6255,7 @@ class AsyncTable(Generic[ROW]):
             ),
             caller_function_name="count_documents",
         )
-        logger.info(f"finished countDocuments on '{self.name}'")
+        logger.info("finished countDocuments on '%s'", self.name)
         if "count" in cd_response.get("status", {}):
             count: int = cd_response["status"]["count"]
             if cd_response["status"].get("moreData", False):
@@ -5823,7 +6314,7 @@ class AsyncTable(Generic[ROW]):
             timeout_ms=timeout_ms,
         )
         ed_payload: dict[str, Any] = {"estimatedDocumentCount": {}}
-        logger.info(f"estimatedDocumentCount on '{self.name}'")
+        logger.info("estimatedDocumentCount on '%s'", self.name)
         ed_response = await self._api_commander.async_request(
             payload=ed_payload,
             timeout_context=_TimeoutContext(
@@ -5831,7 +6322,7 @@ class AsyncTable(Generic[ROW]):
             ),
             caller_function_name="estimated_document_count",
         )
-        logger.info(f"finished estimatedDocumentCount on '{self.name}'")
+        logger.info("finished estimatedDocumentCount on '%s'", self.name)
         if "count" in ed_response.get("status", {}):
             count: int = ed_response["status"]["count"]
             return count
@@ -5841,6 +6332,41 @@ class AsyncTable(Generic[ROW]):
                 raw_response=ed_response,
             )
 
+    async def _update_one_ctx(
+        self,
+        filter: FilterType,
+        update: dict[str, Any],
+        *,
+        timeout_context: _TimeoutContext,
+    ) -> dict[str, Any]:
+        uo_payload = self._converter_agent.preprocess_payload(
+            {
+                "updateOne": {
+                    k: v
+                    for k, v in {
+                        "filter": filter,
+                        "update": update,
+                    }.items()
+                    if v is not None
+                }
+            },
+            map2tuple_checker=map2tuple_checker_update_one,
+        )
+        logger.info("updateOne on '%s'", self.name)
+        uo_response = await self._api_commander.async_request(
+            payload=uo_payload,
+            timeout_context=timeout_context,
+            caller_function_name="update_one",
+        )
+        logger.info("finished updateOne on '%s'", self.name)
+        if "status" in uo_response:
+            return uo_response
+        else:
+            raise UnexpectedDataAPIResponseException(
+                text="Faulty response from updateOne API command.",
+                raw_response=uo_response,
+            )
+
     async def update_one(
         self,
         filter: FilterType,
@@ -5937,36 +6463,168 @@ class AsyncTable(Generic[ROW]):
             request_timeout_ms=request_timeout_ms,
             timeout_ms=timeout_ms,
         )
-        uo_payload = self._converter_agent.preprocess_payload(
-            {
-                "updateOne": {
-                    k: v
-                    for k, v in {
-                        "filter": filter,
-                        "update": update,
-                    }.items()
-                    if v is not None
-                }
-            },
-            map2tuple_checker=map2tuple_checker_update_one,
-        )
-        logger.info(f"updateOne on '{self.name}'")
-        uo_response = await self._api_commander.async_request(
-            payload=uo_payload,
+        await self._update_one_ctx(
+            filter,
+            update,
             timeout_context=_TimeoutContext(
                 request_ms=_request_timeout_ms, label=_rt_label
             ),
-            caller_function_name="update_one",
         )
-        logger.info(f"finished updateOne on '{self.name}'")
-        if "status" in uo_response:
-            # the contents are disregarded and the method just returns:
-            return
+
+    @traced_operation("update_many")
+    @with_operation_stats
+    async def update_many(
+        self,
+        filter: FilterType,
+        update: dict[str, Any],
+        *,
+        concurrency: int | None = None,
+        general_method_timeout_ms: int | None = None,
+        request_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> TableUpdateManyResult:
+        """
+        Update all rows matching a filter condition, applying the same update
+        prescription to each of them.
+
+        Since the Data API only supports updating a single row (identified by its
+        full primary key) per request, this method first reads the table primary
+        key from its definition, then scans the matching rows with a `find`
+        projecting the primary-key columns only, and issues one `update_one` per
+        row found. The updates are launched, with a certain degree of concurrency,
+        while the scan proceeds. This is not an atomic operation.
+
+        Args:
+            filter: a filter condition to select the rows to update, with the
+                same syntax as for the `find` method. An empty filter, `{}`,
+                targets all rows in the table.
+            update: the update prescription to apply to each row, with the same
+                syntax as for the `update_one` method.
+                Note that the update operation cannot alter the primary key columns.
+            concurrency: maximum number of concurrent `update_one` requests to the
+                API at a given time. Leave it unspecified to use the system default.
+            general_method_timeout_ms: a timeout, in milliseconds, to impose on the
+                whole operation, which may consist of several API requests.
+                If not provided, this object's defaults apply.
+            request_timeout_ms: a timeout, in milliseconds, to impose on each
+                individual HTTP request to the Data API to accomplish the operation.
+                If not provided, this object's defaults apply.
+            timeout_ms: an alias for `general_method_timeout_ms`.
+
+        Returns:
+            a TableUpdateManyResult object, reporting the number of rows found and
+            updated, and the primary key (and error) of each row whose
+            update failed.
+
+        Example:
+            >>> asyncio.run(my_async_table.update_many(
+            ...     {"match_id": "fight7"},
+            ...     {"$set": {"winner": "Zoe"}},
+            ... ))
+            TableUpdateManyResult(matched_count=3, modified_count=3, raw_results=...)
+
+        Note:
+            Errors on individual rows do not stop the operation and are collected
+            in the result. Conversely, if the scan of the primary keys fails
+            (or the overall timeout is exceeded) the method raises a
+            `TableUpdateManyException`, carrying the partial result up to
+            that point.
+
+        Note:
+            Similarly to the case of `find` (see its docstring for more details),
+            running this command while, at the same time, another process is
+            inserting new rows which match the filter can result in an unpredictable
+            fraction of these rows being updated.
+        """
+
+        _general_method_timeout_ms, _gmt_label = _first_valid_timeout(
+            (general_method_timeout_ms, "general_method_timeout_ms"),
+            (timeout_ms, "timeout_ms"),
+            (
+                self.api_options.timeout_options.general_method_timeout_ms,
+                "general_method_timeout_ms",
+            ),
+        )
+        _request_timeout_ms, _rt_label = _first_valid_timeout(
+            (request_timeout_ms, "request_timeout_ms"),
+            (self.api_options.timeout_options.request_timeout_ms, "request_timeout_ms"),
+        )
+        if concurrency is None:
+            _concurrency = DEFAULT_TABLE_UPDATE_MANY_CONCURRENCY
         else:
-            raise UnexpectedDataAPIResponseException(
-                text="Faulty response from updateOne API command.",
-                raw_response=uo_response,
+            _concurrency = concurrency
+        if _concurrency < 1:
+            raise ValueError(
+                "The concurrency of update_many must be a positive integer."
+            )
+        timeout_manager = MultiCallTimeoutManager(
+            overall_timeout_ms=_general_method_timeout_ms,
+            timeout_label=_gmt_label,
+        )
+        logger.info("starting update_many on '%s'", self.name)
+        primary_key = (
+            await self.definition(
+                table_admin_timeout_ms=timeout_manager.remaining_timeout(
+                    cap_time_ms=_request_timeout_ms,
+                    cap_timeout_label=_rt_label,
+                ).request_ms,
             )
+        ).primary_key
+        pk_columns = primary_key.partition_by + list(primary_key.partition_sort)
+        accumulator = _TableUpdateManyAccumulator(pk_columns)
+
+        sem = asyncio.Semaphore(_concurrency)
+
+        async def _update_row(
+            row_key: dict[str, Any],
+        ) -> tuple[dict[str, Any], dict[str, Any] | Exception]:
+            async with timed_slot(sem):
+                try:
+                    uo_response = await self._update_one_ctx(
+                        row_key,
+                        update,
+                        timeout_context=timeout_manager.remaining_timeout(
+                            cap_time_ms=_request_timeout_ms,
+                            cap_timeout_label=_rt_label,
+                        ),
+                    )
+                    return row_key, uo_response
+                except DataAPIException as exc:
+                    return row_key, exc
+
+        pending: set[asyncio.Task[Any]] = set()
+        try:
+            pk_cursor = self.find(
+                filter,
+                projection={pk_column: True for pk_column in pk_columns},
+                row_type=dict,
+                request_timeout_ms=_request_timeout_ms,
+            )
+            async for row in pk_cursor:
+                timeout_manager.remaining_timeout()
+                row_key = {pk_column: row[pk_column] for pk_column in pk_columns}
+                accumulator.matched_count += 1
+                pending.add(asyncio.create_task(_update_row(row_key)))
+                # bound the updates in flight, so as not to outpace the scan
+                if len(pending) >= 2 * _concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    accumulator.add_outcomes(task.result() for task in done)
+        except DataAPIException as exc:
+            if pending:
+                await asyncio.wait(pending)
+            accumulator.add_outcomes(task.result() for task in pending)
+            raise TableUpdateManyException(
+                partial_result=accumulator.result(),
+                cause=exc,
+            )
+        if pending:
+            await asyncio.wait(pending)
+        accumulator.add_outcomes(task.result() for task in pending)
+
+        logger.info("finished update_many on '%s'", self.name)
+        return accumulator.result()
 
     async def delete_one(
         self,
@@ -6036,7 +6694,7 @@ class AsyncTable(Generic[ROW]):
             },
             map2tuple_checker=None,
         )
-        logger.info(f"deleteOne on '{self.name}'")
+        logger.info("deleteOne on '%s'", self.name)
         do_response = await self._api_commander.async_request(
             payload=do_payload,
             timeout_context=_TimeoutContext(
@@ -6044,7 +6702,7 @@ class AsyncTable(Generic[ROW]):
             ),
             caller_function_name="delete_one",
         )
-        logger.info(f"finished deleteOne on '{self.name}'")
+        logger.info("finished deleteOne on '%s'", self.name)
         if do_response.get("status", {}).get("deletedCount") == -1:
             return
         else:
@@ -6053,6 +6711,7 @@ class AsyncTable(Generic[ROW]):
                 raw_response=do_response,
             )
 
+    @traced_operation("delete_many")
     async def delete_many(
         self,
         filter: FilterType,
@@ -6134,7 +6793,7 @@ class AsyncTable(Generic[ROW]):
             },
             map2tuple_checker=None,
         )
-        logger.info(f"deleteMany on '{self.name}'")
+        logger.info("deleteMany on '%s'", self.name)
         dm_response = await self._api_commander.async_request(
             payload=dm_payload,
             timeout_context=_TimeoutContext(
@@ -6142,7 +6801,7 @@ class AsyncTable(Generic[ROW]):
             ),
             caller_function_name="delete_many",
         )
-        logger.info(f"finished deleteMany on '{self.name}'")
+        logger.info("finished deleteMany on '%s'", self.name)
         if dm_response.get("status", {}).get("deletedCount") == -1:
             return
         else:
@@ -6151,6 +6810,124 @@ class AsyncTable(Generic[ROW]):
                 raw_response=dm_response,
             )
 
+    @traced_operation("bulk_write")
+    async def bulk_write(
+        self,
+        requests: Iterable[BaseTableOperation],
+        *,
+        ordered: bool = False,
+        chunk_size: int | None = None,
+        concurrency: int | None = None,
+        general_method_timeout_ms: int | None = None,
+        request_timeout_ms: int | None = None,
+        timeout_ms: int | None = None,
+    ) -> TableBulkWriteResult:
+        """
+        Execute an arbitrary amount of operations such as inserts, updates, deletes
+        either sequentially or concurrently.
+        This is not an atomic operation.
+
+        Consecutive insertions (for unordered bulk writes: all insertions) are
+        coalesced into `insertMany` commands; all other operations are executed
+        as individual method calls.
+
+        Args:
+            requests: an iterable over concrete subclasses of `BaseTableOperation`,
+                such as `TableInsertOne`, `TableInsertMany`, `TableUpdateOne`,
+                `TableDeleteOne`, `TableDeleteMany` (from `astrapy.operations`).
+            ordered: whether to launch the `requests` one after the other or
+                in arbitrary order, possibly in a concurrent fashion. An ordered
+                bulk write stops at the first failure, while an unordered one
+                tries to execute all operations in any case.
+            chunk_size: how many rows to include in a single `insertMany`
+                API request. Leave it unspecified (recommended) to use the
+                system default.
+            concurrency: maximum number of concurrent operations executing at
+                a given time. It cannot be more than one for ordered bulk writes.
+            general_method_timeout_ms: a timeout, in milliseconds, for the whole
+                bulk write. If not passed, the table-level setting is used.
+            request_timeout_ms: a timeout, in milliseconds, for each API request.
+                If not passed, the table-level setting is used instead.
+            timeout_ms: an alias for `general_method_timeout_ms`.
+
+        Returns:
+            A single TableBulkWriteResult summarizing the whole list of
+            requested operations. The keys in the maps (e.g. `inserted_ids`)
+            are the positions of the operations in the `requests` iterable.
+
+        Example:
+            >>> from astrapy.operations import (
+            ...     TableDeleteOne,
+            ...     TableInsertOne,
+            ...     TableUpdateOne,
+            ... )
+            >>> asyncio.run(my_async_table.bulk_write(
+            ...     [
+            ...         TableInsertOne({"match_id": "fight1", "round": 1}),
+            ...         TableInsertOne({"match_id": "fight1", "round": 2}),
+            ...         TableUpdateOne(
+            ...             {"match_id": "fight1", "round": 1},
+            ...             {"$set": {"winner": "Jules"}},
+            ...         ),
+            ...         TableDeleteOne({"match_id": "fight1", "round": 2}),
+            ...     ],
+            ...     ordered=True,
+            ... ))
+            TableBulkWriteResult(inserted_count=2, update_count=1, delete_count=1, inserted_ids={0: [{'match_id': 'fight1', 'round': 1}], 1: [{'match_id': 'fight1', 'round': 2}]}, raw_results=...)
+
+        Note:
+            If some of the operations fail, a `TableBulkWriteException` is
+            raised, carrying a partial result (accounting for the successful
+            operations), the root exceptions and a map from the position of
+            each failed operation to its error.
+        """
+
+        _general_method_timeout_ms, _gmt_label = _first_valid_timeout(
+            (general_method_timeout_ms, "general_method_timeout_ms"),
+            (timeout_ms, "timeout_ms"),
+            (
+                self.api_options.timeout_options.general_method_timeout_ms,
+                "general_method_timeout_ms",
+            ),
+        )
+        _request_timeout_ms, _ = _first_valid_timeout(
+            (request_timeout_ms, "request_timeout_ms"),
+            (self.api_options.timeout_options.request_timeout_ms, "request_timeout_ms"),
+        )
+        _chunk_size, _concurrency = _bulk_write_settings(
+            ordered=ordered,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+        units = _plan_bulk_write(
+            requests,
+            insertion_documents=_table_insertion_documents,
+            ordered=ordered,
+            chunk_size=_chunk_size,
+        )
+        logger.info("bulk_write (%s units) on '%s'", len(units), self.name)
+        timeout_manager = MultiCallTimeoutManager(
+            overall_timeout_ms=_general_method_timeout_ms,
+            timeout_label=_gmt_label,
+        )
+        outcome = await _aexecute_bulk_write(
+            self,
+            units,
+            ordered=ordered,
+            concurrency=_concurrency,
+            timeout_manager=timeout_manager,
+            request_timeout_ms=_request_timeout_ms,
+        )
+        bulk_write_result = _table_bulk_write_result(outcome)
+        if outcome.operation_errors:
+            raise TableBulkWriteException(
+                partial_result=bulk_write_result,
+                exceptions=outcome.exceptions,
+                operation_errors=dict(sorted(outcome.operation_errors.items())),
+            )
+        logger.info("finished bulk_write on '%s'", self.name)
+        return bulk_write_result
+
     async def drop(
         self,
         *,
@@ -6211,7 +6988,7 @@ class AsyncTable(Generic[ROW]):
             which avoids using a deceased collection any further.
         """
 
-        logger.info(f"dropping table '{self.name}' (self)")
+        logger.info("dropping table '%s' (self)", self.name)
         await self.database.drop_table(
             self.name,
             if_exists=if_exists,
@@ -6219,7 +6996,7 @@ class AsyncTable(Generic[ROW]):
             request_timeout_ms=request_timeout_ms,
             timeout_ms=timeout_ms,
         )
-        logger.info(f"finished dropping table '{self.name}' (self)")
+        logger.info("finished dropping table '%s' (self)", self.name)
 
     async def command(
         self,
@@ -6272,7 +7049,7 @@ class AsyncTable(Generic[ROW]):
             _cmd_desc = ",".join(sorted(body.keys()))
         else:
             _cmd_desc = "(none)"
-        logger.info(f"command={_cmd_desc} on '{self.name}'")
+        logger.info("command=%s on '%s'", _cmd_desc, self.name)
         command_result = await self._api_commander.async_request(
             payload=body,
             raise_api_errors=raise_api_errors,
@@ -6281,5 +7058,5 @@ class AsyncTable(Generic[ROW]):
             ),
             caller_function_name="command",
         )
-        logger.info(f"finished command={_cmd_desc} on '{self.name}'")
+        logger.info("finished command=%s on '%s'", _cmd_desc, self.name)
         return command_result
@@ -0,0 +1,492 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Planning and execution of `bulk_write` for collections and tables.
+
+A bulk write is planned as a list of "units": insertions are coalesced into
+chunks, each executed as a single-request `insert_many`, while all other
+operations are units of their own. Units run sequentially (stopping at the
+first failure) for ordered bulk writes, concurrently otherwise.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from astrapy.exceptions import (
+    CollectionInsertManyException,
+    DataAPIException,
+    DataAPIResponseException,
+    MultiCallTimeoutManager,
+    TableInsertManyException,
+)
+from astrapy.operations import (
+    BaseOperation,
+    BaseTableOperation,
+    InsertMany,
+    InsertOne,
+    TableDeleteMany,
+    TableDeleteOne,
+    TableInsertMany,
+    TableInsertOne,
+    TableUpdateOne,
+    _CollectionSingleOperation,
+    _TableSingleOperation,
+)
+from astrapy.results import (
+    CollectionBulkWriteResult,
+    CollectionDeleteResult,
+    CollectionUpdateResult,
+    TableBulkWriteResult,
+)
+from astrapy.settings.defaults import (
+    DEFAULT_BULK_WRITE_CONCURRENCY,
+    DEFAULT_INSERT_MANY_CHUNK_SIZE,
+)
+from astrapy.utils.tracing import in_current_context
+
+
+@dataclass
+class _BulkWriteUnit:
+    """
+    A unit of execution in a bulk write: either a chunk of coalesced insertions
+    (with the index of the originating operation for each document), or a single
+    non-insertion operation.
+    """
+
+    documents: list[Any] = field(default_factory=list)
+    document_operation_indices: list[int] = field(default_factory=list)
+    operation: Any = None
+    operation_index: int = -1
+
+    @property
+    def operation_indices(self) -> list[int]:
+        if self.operation is not None:
+            return [self.operation_index]
+        return sorted(set(self.document_operation_indices))
+
+
+@dataclass
+class _BulkWriteOutcome:
+    """The results (and failures) of one or more units of a bulk write."""
+
+    raw_results: list[dict[str, Any]] = field(default_factory=list)
+    # (operation index, inserted ID, inserted ID tuple or None)
+    inserted: list[tuple[int, Any, Any]] = field(default_factory=list)
+    # operation index => (operation, method return value)
+    operation_results: dict[int, tuple[Any, Any]] = field(default_factory=dict)
+    operation_errors: dict[int, Exception] = field(default_factory=dict)
+    exceptions: list[Exception] = field(default_factory=list)
+
+    def fail(self, operation_indices: Iterable[int], exception: Exception) -> None:
+        for operation_index in operation_indices:
+            self.operation_errors[operation_index] = exception
+        if not any(exc is exception for exc in self.exceptions):
+            self.exceptions.append(exception)
+
+    def record_insertions(
+        self,
+        unit: _BulkWriteUnit,
+        *,
+        raw_results: list[dict[str, Any]],
+        inserted_ids: list[Any],
+        inserted_id_tuples: list[Any] | None,
+        exception: Exception | None,
+    ) -> None:
+        self.raw_results += raw_results
+        doc_responses: list[dict[str, Any]] | None = None
+        if len(raw_results) == 1:
+            doc_responses = (raw_results[0].get("status") or {}).get(
+                "documentResponses"
+            )
+        if doc_responses is not None and len(doc_responses) == len(unit.documents):
+            ok_positions = [
+                position
+                for position, doc_response in enumerate(doc_responses)
+                if doc_response.get("status") == "OK"
+            ]
+            failed_positions = [
+                position
+                for position, doc_response in enumerate(doc_responses)
+                if doc_response.get("status") == "ERROR"
+            ]
+        else:
+            # no per-document information: IDs are in the order of the documents
+            ok_positions = list(range(len(inserted_ids)))
+            failed_positions = list(range(len(inserted_ids), len(unit.documents)))
+        _id_tuples = inserted_id_tuples or [None] * len(inserted_ids)
+        for position, inserted_id, inserted_id_tuple in zip(
+            ok_positions, inserted_ids, _id_tuples
+        ):
+            self.inserted.append(
+                (
+                    unit.document_operation_indices[position],
+                    inserted_id,
+                    inserted_id_tuple,
+                )
+            )
+        if exception is not None:
+            self.fail(
+                sorted(
+                    {
+                        unit.document_operation_indices[position]
+                        for position in failed_positions
+                    }
+                ),
+                exception,
+            )
+
+    def merge(self, other: _BulkWriteOutcome) -> None:
+        self.raw_results += other.raw_results
+        self.inserted += other.inserted
+        self.operation_results.update(other.operation_results)
+        self.operation_errors.update(other.operation_errors)
+        self.exceptions += [
+            exc
+            for exc in other.exceptions
+            if not any(exc is own_exc for own_exc in self.exceptions)
+        ]
+
+
+def _collection_insertion_documents(operation: Any) -> list[Any] | None:
+    if isinstance(operation, InsertOne):
+        return [operation.document]
+    if isinstance(operation, InsertMany):
+        return operation.documents
+    if isinstance(operation, _CollectionSingleOperation):
+        return None
+    raise ValueError(
+        f"Unsupported operation for a collection bulk_write: {operation!r}. "
+        f"Expected an instance of {BaseOperation.__name__}."
+    )
+
+
+def _table_insertion_documents(operation: Any) -> list[Any] | None:
+    if isinstance(operation, TableInsertOne):
+        return [operation.row]
+    if isinstance(operation, TableInsertMany):
+        return operation.rows
+    if isinstance(operation, _TableSingleOperation):
+        return None
+    raise ValueError(
+        f"Unsupported operation for a table bulk_write: {operation!r}. "
+        f"Expected an instance of {BaseTableOperation.__name__}."
+    )
+
+
+def _bulk_write_settings(
+    *,
+    ordered: bool,
+    chunk_size: int | None,
+    concurrency: int | None,
+) -> tuple[int, int]:
+    """Validate and normalize the chunk size and concurrency of a bulk write."""
+
+    if concurrency is None:
+        _concurrency = 1 if ordered else DEFAULT_BULK_WRITE_CONCURRENCY
+    else:
+        _concurrency = concurrency
+    if _concurrency > 1 and ordered:
+        raise ValueError("Cannot run ordered bulk_write concurrently.")
+    if _concurrency < 1:
+        raise ValueError("The concurrency of bulk_write must be a positive integer.")
+    _chunk_size = DEFAULT_INSERT_MANY_CHUNK_SIZE if chunk_size is None else chunk_size
+    return _chunk_size, _concurrency
+
+
+def _plan_bulk_write(
+    operations: Iterable[Any],
+    *,
+    insertion_documents: Callable[[Any], list[Any] | None],
+    ordered: bool,
+    chunk_size: int,
+) -> list[_BulkWriteUnit]:
+    """
+    Arrange the operations of a bulk write into units. Consecutive insertions
+    are coalesced into chunks; for unordered bulk writes, all insertions are.
+    """
+
+    units: list[_BulkWriteUnit] = []
+    pending_documents: list[Any] = []
+    pending_indices: list[int] = []
+
+    def _flush_insertions() -> None:
+        for start in range(0, len(pending_documents), chunk_size):
+            units.append(
+                _BulkWriteUnit(
+                    documents=pending_documents[start : start + chunk_size],
+                    document_operation_indices=pending_indices[
+                        start : start + chunk_size
+                    ],
+                )
+            )
+        pending_documents.clear()
+        pending_indices.clear()
+
+    for operation_index, operation in enumerate(operations):
+        documents = insertion_documents(operation)
+        if documents is not None:
+            pending_documents += documents
+            pending_indices += [operation_index] * len(documents)
+        else:
+            if ordered:
+                _flush_insertions()
+            units.append(
+                _BulkWriteUnit(operation=operation, operation_index=operation_index)
+            )
+    _flush_insertions()
+    return units
+
+
+def _remaining_ms(timeout_manager: MultiCallTimeoutManager) -> int:
+    # zero, i.e. no timeout, for sub-methods if the bulk write has no deadline
+    return timeout_manager.remaining_timeout().request_ms or 0
+
+
+def _execute_unit(
+    target: Any,
+    unit: _BulkWriteUnit,
+    *,
+    ordered: bool,
+    timeout_manager: MultiCallTimeoutManager,
+    request_timeout_ms: int | None,
+) -> _BulkWriteOutcome:
+    outcome = _BulkWriteOutcome()
+    try:
+        general_method_timeout_ms = _remaining_ms(timeout_manager)
+        if unit.operation is None:
+            im_result = target.insert_many(
+                unit.documents,
+                ordered=ordered,
+                chunk_size=len(unit.documents),
+                concurrency=1,
+                general_method_timeout_ms=general_method_timeout_ms,
+                request_timeout_ms=request_timeout_ms,
+            )
+            outcome.record_insertions(
+                unit,
+                raw_results=im_result.raw_results,
+                inserted_ids=im_result.inserted_ids,
+                inserted_id_tuples=getattr(im_result, "inserted_id_tuples", None),
+                exception=None,
+            )
+        else:
+            op_result = unit.operation._execute(
+                target,
+                general_method_timeout_ms=general_method_timeout_ms,
+                request_timeout_ms=request_timeout_ms,
+            )
+            outcome.operation_results[unit.operation_index] = (
+                unit.operation,
+                op_result,
+            )
+    except (CollectionInsertManyException, TableInsertManyException) as exc:
+        _record_insert_many_exception(outcome, unit, exc)
+    except DataAPIException as exc:
+        outcome.fail(unit.operation_indices, exc)
+    return outcome
+
+
+async def _aexecute_unit(
+    target: Any,
+    unit: _BulkWriteUnit,
+    *,
+    ordered: bool,
+    timeout_manager: MultiCallTimeoutManager,
+    request_timeout_ms: int | None,
+) -> _BulkWriteOutcome:
+    outcome = _BulkWriteOutcome()
+    try:
+        general_method_timeout_ms = _remaining_ms(timeout_manager)
+        if unit.operation is None:
+            im_result = await target.insert_many(
+                unit.documents,
+                ordered=ordered,
+                chunk_size=len(unit.documents),
+                concurrency=1,
+                general_method_timeout_ms=general_method_timeout_ms,
+                request_timeout_ms=request_timeout_ms,
+            )
+            outcome.record_insertions(
+                unit,
+                raw_results=im_result.raw_results,
+                inserted_ids=im_result.inserted_ids,
+                inserted_id_tuples=getattr(im_result, "inserted_id_tuples", None),
+                exception=None,
+            )
+        else:
+            op_result = await unit.operation._aexecute(
+                target,
+                general_method_timeout_ms=general_method_timeout_ms,
+                request_timeout_ms=request_timeout_ms,
+            )
+            outcome.operation_results[unit.operation_index] = (
+                unit.operation,
+                op_result,
+            )
+    except (CollectionInsertManyException, TableInsertManyException) as exc:
+        _record_insert_many_exception(outcome, unit, exc)
+    except DataAPIException as exc:
+        outcome.fail(unit.operation_indices, exc)
+    return outcome
+
+
+def _record_insert_many_exception(
+    outcome: _BulkWriteOutcome,
+    unit: _BulkWriteUnit,
+    exc: CollectionInsertManyException | TableInsertManyException,
+) -> None:
+    root_exception: Exception = exc.exceptions[0] if exc.exceptions else exc
+    outcome.record_insertions(
+        unit,
+        raw_results=[
+            response_exc.raw_response
+            for response_exc in exc.exceptions
+            if isinstance(response_exc, DataAPIResponseException)
+        ],
+        inserted_ids=exc.inserted_ids,
+        inserted_id_tuples=getattr(exc, "inserted_id_tuples", None),
+        exception=root_exception,
+    )
+
+
+def _execute_bulk_write(
+    target: Any,
+    units: list[_BulkWriteUnit],
+    *,
+    ordered: bool,
+    concurrency: int,
+    timeout_manager: MultiCallTimeoutManager,
+    request_timeout_ms: int | None,
+) -> _BulkWriteOutcome:
+    def _run(unit: _BulkWriteUnit) -> _BulkWriteOutcome:
+        return _execute_unit(
+            target,
+            unit,
+            ordered=ordered,
+            timeout_manager=timeout_manager,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+    outcome = _BulkWriteOutcome()
+    if ordered or concurrency == 1:
+        for unit in units:
+            outcome.merge(_run(unit))
+            if ordered and outcome.operation_errors:
+                break
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for unit_outcome in executor.map(in_current_context(_run), units):
+                outcome.merge(unit_outcome)
+    return outcome
+
+
+async def _aexecute_bulk_write(
+    target: Any,
+    units: list[_BulkWriteUnit],
+    *,
+    ordered: bool,
+    concurrency: int,
+    timeout_manager: MultiCallTimeoutManager,
+    request_timeout_ms: int | None,
+) -> _BulkWriteOutcome:
+    async def _run(unit: _BulkWriteUnit) -> _BulkWriteOutcome:
+        return await _aexecute_unit(
+            target,
+            unit,
+            ordered=ordered,
+            timeout_manager=timeout_manager,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+    outcome = _BulkWriteOutcome()
+    if ordered or concurrency == 1:
+        for unit in units:
+            outcome.merge(await _run(unit))
+            if ordered and outcome.operation_errors:
+                break
+    else:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _concurrent_run(unit: _BulkWriteUnit) -> _BulkWriteOutcome:
+            async with semaphore:
+                return await _run(unit)
+
+        for unit_outcome in await asyncio.gather(
+            *(_concurrent_run(unit) for unit in units)
+        ):
+            outcome.merge(unit_outcome)
+    return outcome
+
+
+def _ids_by_operation(
+    inserted: list[tuple[int, Any, Any]], item_index: int
+) -> dict[int, list[Any]]:
+    ids_by_operation: dict[int, list[Any]] = {}
+    for insertion in sorted(inserted, key=lambda ins: ins[0]):
+        ids_by_operation.setdefault(insertion[0], []).append(insertion[item_index])
+    return ids_by_operation
+
+
+def _collection_bulk_write_result(
+    outcome: _BulkWriteOutcome,
+) -> CollectionBulkWriteResult:
+    raw_results = list(outcome.raw_results)
+    matched_count, modified_count, deleted_count = 0, 0, 0
+    upserted_ids: dict[int, Any] = {}
+    for operation_index, (_, op_result) in sorted(outcome.operation_results.items()):
+        raw_results += op_result.raw_results
+        if isinstance(op_result, CollectionUpdateResult):
+            update_info = op_result.update_info
+            if "upserted" in update_info:
+                upserted_ids[operation_index] = update_info["upserted"]
+                matched_count += update_info.get("n", 1) - 1
+            else:
+                matched_count += update_info.get("n", 0)
+            modified_count += update_info.get("nModified", 0)
+        elif isinstance(op_result, CollectionDeleteResult):
+            deleted_count += op_result.deleted_count
+    return CollectionBulkWriteResult(
+        raw_results=raw_results,
+        inserted_count=len(outcome.inserted),
+        matched_count=matched_count,
+        modified_count=modified_count,
+        deleted_count=deleted_count,
+        upserted_count=len(upserted_ids),
+        inserted_ids=_ids_by_operation(outcome.inserted, 1),
+        upserted_ids=upserted_ids,
+    )
+
+
+def _table_bulk_write_result(outcome: _BulkWriteOutcome) -> TableBulkWriteResult:
+    operations = [operation for operation, _ in outcome.operation_results.values()]
+    return TableBulkWriteResult(
+        raw_results=list(outcome.raw_results),
+        inserted_count=len(outcome.inserted),
+        update_count=sum(
+            1 for operation in operations if isinstance(operation, TableUpdateOne)
+        ),
+        delete_count=sum(
+            1
+            for operation in operations
+            if isinstance(operation, TableDeleteOne | TableDeleteMany)
+        ),
+        inserted_ids=_ids_by_operation(outcome.inserted, 1),
+        inserted_id_tuples=_ids_by_operation(outcome.inserted, 2),
+    )
@@ -39,6 +39,7 @@ from astrapy.data_types import DataAPIDate, DataAPIMap, DataAPITimestamp, DataAP
 from astrapy.ids import UUID, ObjectId
 from astrapy.settings.error_messages import CANNOT_ENCODE_NAIVE_DATETIME_ERROR_MESSAGE
 from astrapy.utils.api_options import FullSerdesOptions
+from astrapy.utils.profiling import ProfilePhase, profile_phase
 
 FIND_AND_RERANK_VECTOR_FLOAT_PATH = [
     "status",
@@ -132,10 +133,11 @@ def preprocess_collection_payload(
     """
 
     if payload:
-        return cast(
-            dict[str, Any],
-            preprocess_collection_payload_value([], payload, options=options),
-        )
+        with profile_phase(ProfilePhase.PREPROCESS, payload=payload):
+            return cast(
+                dict[str, Any],
+                preprocess_collection_payload_value([], payload, options=options),
+            )
     else:
         return payload
 
@@ -208,7 +210,8 @@ def postprocess_collection_response(
     This is the place where e.g. `{"$date": 123}` is
     converted back into a datetime object.
     """
-    return cast(
-        DefaultDocumentType,
-        postprocess_collection_response_value([], response, options=options),
-    )
+    with profile_phase(ProfilePhase.POSTPROCESS):
+        return cast(
+            DefaultDocumentType,
+            postprocess_collection_response_value([], response, options=options),
+        )
@@ -0,0 +1,434 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Columnar conversion of raw table `find` pages.
+
+The builders in this module work directly on the rows as they come out of the
+JSON parsing of a Data API response (i.e. before the row-by-row postprocessing
+into dictionaries), using the `projectionSchema` of the response to determine
+a column type for each field. NumPy and PyArrow are optional dependencies:
+they are imported only when a columnar conversion is actually requested.
+"""
+
+from __future__ import annotations
+
+import base64
+import copy
+import decimal
+import json
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from astrapy.data.info.table_descriptor.table_columns import (
+    TableColumnTypeDescriptor,
+    TableScalarColumnTypeDescriptor,
+    TableVectorColumnTypeDescriptor,
+)
+from astrapy.data.utils.table_converters import (
+    _column_filler_value,
+    _create_column_tpostprocessor,
+)
+from astrapy.data.utils.table_types import ColumnType, TableVectorColumnType
+from astrapy.utils.api_options import FullSerdesOptions
+
+logger = logging.getLogger(__name__)
+
+COLUMNAR_FORMAT_NUMPY = "numpy"
+COLUMNAR_FORMAT_ARROW = "arrow"
+COLUMNAR_FORMATS = {COLUMNAR_FORMAT_NUMPY, COLUMNAR_FORMAT_ARROW}
+
+# column kinds, i.e. how each column is laid out in the columnar output
+_KIND_INT = "int"
+_KIND_FLOAT = "float"
+_KIND_BOOL = "bool"
+_KIND_TEXT = "text"
+_KIND_BLOB = "blob"
+_KIND_VECTOR = "vector"
+_KIND_OBJECT = "object"
+
+_INT_COLUMN_TYPES: dict[ColumnType, tuple[str, str]] = {
+    # column type => (numpy dtype, pyarrow type name)
+    ColumnType.TINYINT: ("int8", "int8"),
+    ColumnType.SMALLINT: ("int16", "int16"),
+    ColumnType.INT: ("int32", "int32"),
+    ColumnType.BIGINT: ("int64", "int64"),
+    ColumnType.COUNTER: ("int64", "int64"),
+}
+_FLOAT_COLUMN_TYPES: dict[ColumnType, tuple[str, str]] = {
+    ColumnType.FLOAT: ("float32", "float32"),
+    ColumnType.DOUBLE: ("float64", "float64"),
+}
+_TEXT_COLUMN_TYPES = {ColumnType.TEXT, ColumnType.ASCII}
+
+NUMPY_IMPORT_ERROR_MESSAGE = (
+    "The 'numpy' package is required for columnar export in the NumPy format. "
+    'Please install it, e.g. `pip install "astrapy[columnar]"`.'
+)
+PYARROW_IMPORT_ERROR_MESSAGE = (
+    "The 'pyarrow' package is required for columnar export in the Arrow format. "
+    'Please install it, e.g. `pip install "astrapy[columnar]"`.'
+)
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(NUMPY_IMPORT_ERROR_MESSAGE)
+    return numpy
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(PYARROW_IMPORT_ERROR_MESSAGE)
+    return pyarrow
+
+
+def _raw_to_text(raw_value: Any) -> str | None:
+    """
+    Render a raw value (as found in the parsed JSON) into its textual form,
+    for columns with no native counterpart in the Arrow output.
+    """
+    if raw_value is None:
+        return None
+    elif isinstance(raw_value, str):
+        return raw_value
+    elif isinstance(raw_value, decimal.Decimal):
+        return str(raw_value)
+    return json.dumps(
+        raw_value,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+def _raw_to_float(raw_value: Any) -> float:
+    # handles Decimal and the "NaN"/"Infinity"/"-Infinity" wire strings alike
+    return float(raw_value)
+
+
+class _ColumnSpec:
+    """
+    The columnar layout of a single column, derived from its schema descriptor.
+    """
+
+    name: str
+    kind: str
+    numpy_dtype: str | None
+    arrow_type_name: str | None
+    dimension: int | None
+    postprocessor: Callable[[Any], Any] | None
+    filler: Any
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        col_def: TableColumnTypeDescriptor | None,
+        options: FullSerdesOptions,
+    ) -> None:
+        self.name = name
+        self.numpy_dtype = None
+        self.arrow_type_name = None
+        self.dimension = None
+        self.postprocessor = None
+        self.filler = None
+        if col_def is None:
+            # the similarity pseudocolumn
+            self.kind = _KIND_FLOAT
+            self.numpy_dtype, self.arrow_type_name = "float64", "float64"
+        elif isinstance(col_def, TableScalarColumnTypeDescriptor):
+            column_type = col_def.column_type
+            if column_type in _INT_COLUMN_TYPES:
+                self.kind = _KIND_INT
+                self.numpy_dtype, self.arrow_type_name = _INT_COLUMN_TYPES[column_type]
+            elif column_type in _FLOAT_COLUMN_TYPES:
+                self.kind = _KIND_FLOAT
+                self.numpy_dtype, self.arrow_type_name = _FLOAT_COLUMN_TYPES[
+                    column_type
+                ]
+            elif column_type == ColumnType.BOOLEAN:
+                self.kind = _KIND_BOOL
+                self.numpy_dtype, self.arrow_type_name = "bool", "bool_"
+            elif column_type in _TEXT_COLUMN_TYPES:
+                self.kind = _KIND_TEXT
+            elif column_type == ColumnType.BLOB:
+                self.kind = _KIND_BLOB
+            else:
+                self.kind = _KIND_OBJECT
+        elif (
+            isinstance(col_def, TableVectorColumnTypeDescriptor)
+            and col_def.column_type == TableVectorColumnType.VECTOR
+            and col_def.dimension is not None
+        ):
+            self.kind = _KIND_VECTOR
+            # the schema may come with Decimal numbers (table payloads)
+            self.dimension = int(col_def.dimension)
+        else:
+            self.kind = _KIND_OBJECT
+        if self.kind in {_KIND_BLOB, _KIND_OBJECT} and col_def is not None:
+            self.postprocessor = _create_column_tpostprocessor(col_def, options=options)
+            self.filler = _column_filler_value(col_def)
+
+    def _postprocess(self, raw_value: Any, is_missing: bool) -> Any:
+        if self.postprocessor is None:
+            return raw_value
+        if is_missing:
+            return self.postprocessor(copy.copy(self.filler))
+        return self.postprocessor(raw_value)
+
+    def to_numpy(self, np: Any, raw_values: list[Any], missing: list[bool]) -> Any:
+        """
+        Return a 1-d (or, for vectors, 2-d) numpy array for the column.
+
+        Nulls in integer columns promote the array to float64 (with NaN),
+        nulls in boolean columns promote it to an object array.
+        """
+        n_rows = len(raw_values)
+        if self.kind == _KIND_INT:
+            if any(raw_value is None for raw_value in raw_values):
+                return np.array(
+                    [
+                        np.nan if raw_value is None else _raw_to_float(raw_value)
+                        for raw_value in raw_values
+                    ],
+                    dtype="float64",
+                )
+            return np.fromiter(
+                (int(raw_value) for raw_value in raw_values),
+                dtype=self.numpy_dtype,
+                count=n_rows,
+            )
+        elif self.kind == _KIND_FLOAT:
+            return np.fromiter(
+                (
+                    np.nan if raw_value is None else _raw_to_float(raw_value)
+                    for raw_value in raw_values
+                ),
+                dtype=self.numpy_dtype,
+                count=n_rows,
+            )
+        elif self.kind == _KIND_BOOL:
+            if any(raw_value is None for raw_value in raw_values):
+                bool_array = np.empty(n_rows, dtype=object)
+                bool_array[:] = raw_values
+                return bool_array
+            return np.fromiter(raw_values, dtype="bool", count=n_rows)
+        elif self.kind == _KIND_VECTOR:
+            assert self.dimension is not None
+            matrix = np.full((n_rows, self.dimension), np.nan, dtype="float32")
+            for row_index, raw_value in enumerate(raw_values):
+                if raw_value is None:
+                    continue
+                elif isinstance(raw_value, dict):
+                    # {"$binary": ...}, big-endian float32 as per Data API
+                    matrix[row_index] = np.frombuffer(
+                        base64.b64decode(raw_value["$binary"]),
+                        dtype=">f4",
+                    )
+                else:
+                    matrix[row_index] = [
+                        _raw_to_float(component) for component in raw_value
+                    ]
+            return matrix
+        else:
+            object_array = np.empty(n_rows, dtype=object)
+            for row_index, (raw_value, is_missing) in enumerate(
+                zip(raw_values, missing)
+            ):
+                object_array[row_index] = self._postprocess(raw_value, is_missing)
+            return object_array
+
+    def numpy_field(self, column_array: Any) -> tuple[Any, ...]:
+        if self.kind == _KIND_VECTOR:
+            return (self.name, column_array.dtype, (self.dimension,))
+        return (self.name, column_array.dtype)
+
+    def to_arrow(self, pa: Any, raw_values: list[Any]) -> Any:
+        """Return a pyarrow Array for the column."""
+        if self.kind == _KIND_INT:
+            return pa.array(
+                [
+                    None if raw_value is None else int(raw_value)
+                    for raw_value in raw_values
+                ],
+                type=getattr(pa, self.arrow_type_name or "int64")(),
+            )
+        elif self.kind == _KIND_FLOAT:
+            return pa.array(
+                [
+                    None if raw_value is None else _raw_to_float(raw_value)
+                    for raw_value in raw_values
+                ],
+                type=getattr(pa, self.arrow_type_name or "float64")(),
+            )
+        elif self.kind == _KIND_BOOL:
+            return pa.array(raw_values, type=pa.bool_())
+        elif self.kind == _KIND_TEXT:
+            return pa.array(raw_values, type=pa.string())
+        elif self.kind == _KIND_BLOB:
+            return pa.array(
+                [self._postprocess(raw_value, False) for raw_value in raw_values],
+                type=pa.binary(),
+            )
+        elif self.kind == _KIND_VECTOR:
+            np = _import_numpy()
+            vectors: list[Any] = []
+            for raw_value in raw_values:
+                if raw_value is None:
+                    vectors.append(None)
+                elif isinstance(raw_value, dict):
+                    vectors.append(
+                        np.frombuffer(
+                            base64.b64decode(raw_value["$binary"]),
+                            dtype=">f4",
+                        ).astype("float32")
+                    )
+                else:
+                    vectors.append(
+                        [_raw_to_float(component) for component in raw_value]
+                    )
+            return pa.array(
+                vectors,
+                type=pa.list_(pa.float32(), self.dimension),
+            )
+        else:
+            return pa.array(
+                [_raw_to_text(raw_value) for raw_value in raw_values],
+                type=pa.string(),
+            )
+
+
+class _TableColumnarBuilder:
+    """
+    An object turning raw `find` pages into columnar batches, for a given
+    projection schema. Instances are cached and reused for all pages sharing
+    the same schema.
+
+    Columns whose type has no native columnar counterpart (e.g. dates,
+    UUIDs, maps, UDTs) are exported as object arrays holding the same values
+    a regular cursor would return (NumPy), or as their textual representation
+    as found in the API response (Arrow).
+    """
+
+    columns_dict: dict[str, Any]
+    similarity_pseudocolumn: str | None
+    column_specs: list[_ColumnSpec]
+
+    def __init__(
+        self,
+        *,
+        columns_dict: dict[str, Any],
+        similarity_pseudocolumn: str | None,
+        options: FullSerdesOptions,
+    ) -> None:
+        self.columns_dict = columns_dict
+        self.similarity_pseudocolumn = similarity_pseudocolumn
+        self.column_specs = [
+            _ColumnSpec(
+                name=col_name,
+                col_def=TableColumnTypeDescriptor.coerce(col_dict),
+                options=options,
+            )
+            for col_name, col_dict in columns_dict.items()
+            if col_name != similarity_pseudocolumn
+        ]
+        if similarity_pseudocolumn is not None:
+            self.column_specs.append(
+                _ColumnSpec(name=similarity_pseudocolumn, col_def=None, options=options)
+            )
+
+    def _check_fields(self, raw_rows: list[dict[str, Any]]) -> None:
+        column_name_set = {col_spec.name for col_spec in self.column_specs}
+        for raw_row in raw_rows:
+            extra_fields = raw_row.keys() - column_name_set
+            if extra_fields:
+                xf_desc = ", ".join(f'"{f}"' for f in sorted(extra_fields))
+                raise ValueError(f"Returned row has unexpected fields: {xf_desc}")
+
+    def to_numpy(self, raw_rows: list[dict[str, Any]]) -> Any:
+        """Build a numpy structured array out of a list of raw rows."""
+        np = _import_numpy()
+        self._check_fields(raw_rows)
+        fields: list[tuple[Any, ...]] = []
+        column_arrays: list[Any] = []
+        for col_spec in self.column_specs:
+            column_array = col_spec.to_numpy(
+                np,
+                [raw_row.get(col_spec.name) for raw_row in raw_rows],
+                [col_spec.name not in raw_row for raw_row in raw_rows],
+            )
+            column_arrays.append(column_array)
+            fields.append(col_spec.numpy_field(column_array))
+        structured = np.empty(len(raw_rows), dtype=np.dtype(fields))
+        for col_spec, column_array in zip(self.column_specs, column_arrays):
+            structured[col_spec.name] = column_array
+        return structured
+
+    def to_arrow(self, raw_rows: list[dict[str, Any]]) -> Any:
+        """Build a pyarrow RecordBatch out of a list of raw rows."""
+        pa = _import_pyarrow()
+        self._check_fields(raw_rows)
+        return pa.RecordBatch.from_arrays(
+            [
+                col_spec.to_arrow(
+                    pa,
+                    [raw_row.get(col_spec.name) for raw_row in raw_rows],
+                )
+                for col_spec in self.column_specs
+            ],
+            names=[col_spec.name for col_spec in self.column_specs],
+        )
+
+    def build(self, raw_rows: list[dict[str, Any]], *, format: str) -> Any:
+        validate_columnar_format(format)
+        if format == COLUMNAR_FORMAT_NUMPY:
+            return self.to_numpy(raw_rows)
+        return self.to_arrow(raw_rows)
+
+
+def concatenate_numpy_batches(batches: list[Any]) -> dict[str, Any]:
+    """
+    Merge several structured arrays, field by field, into a dictionary
+    of column arrays. Concatenating per column (rather than as a whole structured
+    array) tolerates pages where a column dtype was promoted because of nulls.
+    """
+    np = _import_numpy()
+    if not batches:
+        return {}
+    field_names = batches[0].dtype.names or ()
+    return {
+        field_name: np.concatenate([batch[field_name] for batch in batches])
+        for field_name in field_names
+    }
+
+
+def concatenate_arrow_batches(batches: list[Any]) -> Any:
+    """Merge several RecordBatches into a pyarrow Table."""
+    pa = _import_pyarrow()
+    if not batches:
+        return pa.table({})
+    return pa.Table.from_batches(batches)
+
+
+def validate_columnar_format(format: str) -> None:
+    if format not in COLUMNAR_FORMATS:
+        raise ValueError(
+            f"Unsupported columnar format '{format}'. "
+            f"Allowed values: {', '.join(sorted(COLUMNAR_FORMATS))}."
+        )
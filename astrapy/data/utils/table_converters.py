@@ -61,6 +61,7 @@ from astrapy.ids import UUID, ObjectId
 from astrapy.settings.error_messages import CANNOT_ENCODE_NAIVE_DATETIME_ERROR_MESSAGE
 from astrapy.utils.api_options import FullSerdesOptions
 from astrapy.utils.date_utils import _get_datetime_offset
+from astrapy.utils.profiling import ProfilePhase, profile_phase
 
 NAN_FLOAT_STRING_REPRESENTATION = "NaN"
 PLUS_INFINITY_FLOAT_STRING_REPRESENTATION = "Infinity"
@@ -863,15 +864,16 @@ def preprocess_table_payload(
     """
 
     if payload:
-        return cast(
-            dict[str, Any],
-            preprocess_table_payload_value(
-                [],
-                payload,
-                options=options,
-                map2tuple_checker=map2tuple_checker,
-            ),
-        )
+        with profile_phase(ProfilePhase.PREPROCESS, payload=payload):
+            return cast(
+                dict[str, Any],
+                preprocess_table_payload_value(
+                    [],
+                    payload,
+                    options=options,
+                    map2tuple_checker=map2tuple_checker,
+                ),
+            )
     else:
         return payload
 
@@ -964,9 +966,10 @@ class _TableConverterAgent(Generic[ROW]):
         """
         The primary key schema is not coerced here, just parsed from its json
         """
-        return self._get_key_postprocessor(
-            primary_key_schema_dict=primary_key_schema_dict
-        )(primary_key_list)
+        with profile_phase(ProfilePhase.POSTPROCESS):
+            return self._get_key_postprocessor(
+                primary_key_schema_dict=primary_key_schema_dict
+            )(primary_key_list)
 
     def postprocess_keys(
         self,
@@ -978,13 +981,14 @@ class _TableConverterAgent(Generic[ROW]):
         The primary key schema is not coerced here, just parsed from its json
         """
         if primary_key_lists:
-            _k_postprocessor = self._get_key_postprocessor(
-                primary_key_schema_dict=primary_key_schema_dict
-            )
-            return [
-                _k_postprocessor(primary_key_list)
-                for primary_key_list in primary_key_lists
-            ]
+            with profile_phase(ProfilePhase.POSTPROCESS):
+                _k_postprocessor = self._get_key_postprocessor(
+                    primary_key_schema_dict=primary_key_schema_dict
+                )
+                return [
+                    _k_postprocessor(primary_key_list)
+                    for primary_key_list in primary_key_lists
+                ]
         else:
             return []
 
@@ -998,9 +1002,11 @@ class _TableConverterAgent(Generic[ROW]):
         """
         The columns schema is not coerced here, just parsed from its json
         """
-        return self._get_row_postprocessor(
-            columns_dict=columns_dict, similarity_pseudocolumn=similarity_pseudocolumn
-        )(raw_dict)  # type: ignore[return-value]
+        with profile_phase(ProfilePhase.POSTPROCESS):
+            return self._get_row_postprocessor(
+                columns_dict=columns_dict,
+                similarity_pseudocolumn=similarity_pseudocolumn,
+            )(raw_dict)  # type: ignore[return-value]
 
     def postprocess_rows(
         self,
@@ -1013,10 +1019,11 @@ class _TableConverterAgent(Generic[ROW]):
         The columns schema is not coerced here, just parsed from its json
         """
         if raw_dicts:
-            _r_postprocessor = self._get_row_postprocessor(
-                columns_dict=columns_dict,
-                similarity_pseudocolumn=similarity_pseudocolumn,
-            )
-            return [cast(ROW, _r_postprocessor(raw_dict)) for raw_dict in raw_dicts]
+            with profile_phase(ProfilePhase.POSTPROCESS):
+                _r_postprocessor = self._get_row_postprocessor(
+                    columns_dict=columns_dict,
+                    similarity_pseudocolumn=similarity_pseudocolumn,
+                )
+                return [cast(ROW, _r_postprocessor(raw_dict)) for raw_dict in raw_dicts]
         else:
             return []
@@ -14,6 +14,11 @@
 
 from __future__ import annotations
 
+from astrapy.event_observers.background import (
+    BackgroundObserver,
+    BackgroundObserverStats,
+    OverflowPolicy,
+)
 from astrapy.event_observers.context_managers import event_collector
 from astrapy.event_observers.events import (
     ObservableError,
@@ -23,7 +28,29 @@ from astrapy.event_observers.events import (
     ObservableResponse,
     ObservableWarning,
 )
+from astrapy.event_observers.metrics import (
+    CommandMetrics,
+    LatencyHistogram,
+    MetricsObserver,
+)
 from astrapy.event_observers.observers import Observer
+from astrapy.event_observers.prometheus import (
+    OPENMETRICS_CONTENT_TYPE,
+    PrometheusObserver,
+)
+from astrapy.event_observers.slow_operations import (
+    SlowOperationObserver,
+    SlowOperationRecord,
+)
+from astrapy.event_observers.tracing import (
+    InMemorySpanExporter,
+    OTLPSpanExporter,
+    Span,
+    SpanExporter,
+    SpanKind,
+    SpanStatus,
+    TracingObserver,
+)
 
 __all__ = (
     "event_collector",
@@ -34,4 +61,21 @@ __all__ = (
     "ObservableRequest",
     "ObservableResponse",
     "Observer",
+    "MetricsObserver",
+    "LatencyHistogram",
+    "CommandMetrics",
+    "BackgroundObserver",
+    "BackgroundObserverStats",
+    "OverflowPolicy",
+    "PrometheusObserver",
+    "OPENMETRICS_CONTENT_TYPE",
+    "TracingObserver",
+    "Span",
+    "SpanKind",
+    "SpanStatus",
+    "SpanExporter",
+    "InMemorySpanExporter",
+    "OTLPSpanExporter",
+    "SlowOperationObserver",
+    "SlowOperationRecord",
 )
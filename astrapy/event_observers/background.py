@@ -0,0 +1,385 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from astrapy.event_observers.events import ObservableEvent
+from astrapy.event_observers.observers import Observer
+from astrapy.utils.str_enum import StrEnum
+
+logger = logging.getLogger(__name__)
+
+# an item in the delivery queues: (event, sender, function_name, request_id)
+_QueuedEvent = tuple[ObservableEvent, Any, str | None, str | None]
+
+
+class OverflowPolicy(StrEnum):
+    """
+    Enum for the possible behaviours of a BackgroundObserver whose queue is full.
+    """
+
+    DROP = "drop"
+    BACKPRESSURE = "backpressure"
+
+
+@dataclass
+class BackgroundObserverStats:
+    """
+    Counters and timings of a BackgroundObserver, to measure its overhead.
+
+    Attributes:
+        enqueued: the number of events queued for background delivery.
+        delivered: the number of events delivered to the wrapped observer
+            (by the background thread/tasks or, on overflow, by the caller).
+        dropped: the number of events discarded because the queue was full.
+        delivered_inline: the number of events delivered by the caller
+            because the queue was full (backpressure policy, in event loops).
+        max_queue_size: the largest number of events waiting in a queue.
+        enqueue_s: the total time, in seconds, spent by the request-issuing
+            code in handing events over, i.e. the overhead on the request path
+            (including any wait or inline delivery caused by backpressure).
+        delivery_s: the total time, in seconds, spent in the wrapped observer.
+    """
+
+    enqueued: int
+    delivered: int
+    dropped: int
+    delivered_inline: int
+    max_queue_size: int
+    enqueue_s: float
+    delivery_s: float
+
+    @property
+    def mean_enqueue_s(self) -> float | None:
+        """The mean time, in seconds, spent on the request path per event."""
+
+        handled = self.enqueued + self.dropped + self.delivered_inline
+        if handled == 0:
+            return None
+        return self.enqueue_s / handled
+
+
+class _LoopDelivery:
+    # the pending events of an event loop, and the task delivering them
+    def __init__(self) -> None:
+        self.events: deque[_QueuedEvent] = deque()
+        self.task: asyncio.Task[None] | None = None
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class BackgroundObserver(Observer):
+    """
+    An observer delivering the events to another observer off the request path,
+    through a bounded queue and in batches.
+
+    Events received outside of an event loop are delivered by a background
+    (daemon) thread; events received within an event loop (i.e. from the async
+    classes) are delivered by a task in that loop, started when needed, so that
+    the request path only appends the event to a queue. The declared interests
+    of the wrapped observer (`event_types`, `needs_body`) are honoured.
+
+    When a queue is full, the `overflow_policy` applies: with "drop", the event
+    is discarded (and counted); with "backpressure", the caller waits for room
+    in the queue or, within an event loop (where waiting would block the loop),
+    delivers the event itself.
+
+    The wrapped observer receives events from the background thread and, for the
+    async classes, from the event loops, hence it must be thread-safe if used
+    from both. Events still in the queues when the process exits are lost:
+    `flush` (or `close`) waits for their delivery.
+
+    Args:
+        observer: the Observer to deliver the events to.
+        max_queue_size: the maximum number of events waiting for delivery
+            (in the thread queue and, separately, in each event loop).
+        overflow_policy: a value in the `OverflowPolicy` enum (or the equivalent
+            string), "drop" or "backpressure".
+        batch_size: the maximum number of events delivered in a row, before
+            waiting for new events (thread) or yielding control (event loop).
+
+    Example:
+        >>> from astrapy.api_options import APIOptions
+        >>> from astrapy.event_observers import BackgroundObserver
+        >>> bg_observer = BackgroundObserver(my_slow_observer)
+        >>> instrumented_table = my_table.with_options(
+        ...     api_options=APIOptions(event_observers={"slow": bg_observer}),
+        ... )
+        >>> # ... use 'instrumented_table' ...
+        >>> bg_observer.flush()
+        True
+        >>> bg_observer.stats().dropped
+        0
+    """
+
+    def __init__(
+        self,
+        observer: Observer,
+        *,
+        max_queue_size: int = 10000,
+        overflow_policy: str | OverflowPolicy = OverflowPolicy.DROP,
+        batch_size: int = 100,
+    ) -> None:
+        self.observer = observer
+        self.event_types = observer.event_types
+        self.needs_body = observer.needs_body
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = OverflowPolicy.coerce(overflow_policy)
+        self.batch_size = batch_size
+        self._enqueued = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._delivered_inline = 0
+        self._max_queue_size = 0
+        self._enqueue_s = 0.0
+        self._delivery_s = 0.0
+        self._closed = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._stats_lock = threading.Lock()
+        self._idle = threading.Condition(self._stats_lock)
+        # the events queued and not delivered yet
+        self._pending = 0
+        self._thread_lock = threading.Lock()
+        self._queue: queue.Queue[_QueuedEvent | None] = queue.Queue(
+            maxsize=self.max_queue_size
+        )
+        self._thread: threading.Thread | None = None
+        self._loop_deliveries: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopDelivery
+        ] = weakref.WeakKeyDictionary()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.observer}, "
+            f"overflow_policy={self.overflow_policy.value})"
+        )
+
+    def receive(
+        self,
+        event: ObservableEvent,
+        sender: Any = None,
+        function_name: str | None = None,
+        request_id: str | None = None,
+    ) -> None:
+        start_time = time.perf_counter()
+        if self._pid != os.getpid():
+            # in a forked child, the thread and the queued events are gone
+            self._reset()
+        item: _QueuedEvent = (event, sender, function_name, request_id)
+        loop = _running_loop()
+        if self._closed:
+            self._deliver([item])
+            outcome = "inline"
+        elif loop is None:
+            outcome = self._enqueue_threaded(item)
+        else:
+            outcome = self._enqueue_loop(loop, item)
+        with self._stats_lock:
+            self._enqueue_s += time.perf_counter() - start_time
+            if outcome == "enqueued":
+                self._enqueued += 1
+            elif outcome == "dropped":
+                self._dropped += 1
+            else:
+                self._delivered_inline += 1
+
+    def _deliver(self, items: list[_QueuedEvent]) -> None:
+        start_time = time.perf_counter()
+        for event, sender, function_name, request_id in items:
+            try:
+                self.observer.receive(
+                    event,
+                    sender=sender,
+                    function_name=function_name,
+                    request_id=request_id,
+                )
+            except Exception:
+                logger.exception("Error in the delivery of an event to an observer.")
+        with self._stats_lock:
+            self._delivery_s += time.perf_counter() - start_time
+            self._delivered += len(items)
+
+    def _mark_queued(self, queue_size: int) -> None:
+        with self._stats_lock:
+            self._pending += 1
+            self._max_queue_size = max(self._max_queue_size, queue_size)
+
+    def _mark_done(self, count: int) -> None:
+        with self._idle:
+            self._pending -= count
+            if self._pending == 0:
+                self._idle.notify_all()
+
+    def _enqueue_threaded(self, item: _QueuedEvent) -> str:
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run_thread,
+                        args=(self._queue,),
+                        name=f"astrapy-{self.__class__.__name__}",
+                        daemon=True,
+                    )
+                    self._thread.start()
+        # (counted before queueing: the delivery may complete right away)
+        self._mark_queued(self._queue.qsize() + 1)
+        try:
+            if self.overflow_policy == OverflowPolicy.DROP:
+                self._queue.put_nowait(item)
+            else:
+                self._queue.put(item)
+        except queue.Full:
+            self._mark_done(1)
+            return "dropped"
+        return "enqueued"
+
+    def _run_thread(self, event_queue: queue.Queue[_QueuedEvent | None]) -> None:
+        while True:
+            item = event_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    next_item = event_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if next_item is None:
+                    self._deliver(batch)
+                    self._mark_done(len(batch))
+                    return
+                batch.append(next_item)
+            self._deliver(batch)
+            self._mark_done(len(batch))
+
+    def _enqueue_loop(self, loop: asyncio.AbstractEventLoop, item: _QueuedEvent) -> str:
+        # (only ever called from within the loop: no locking needed here)
+        loop_delivery = self._loop_deliveries.get(loop)
+        if loop_delivery is None:
+            loop_delivery = _LoopDelivery()
+            self._loop_deliveries[loop] = loop_delivery
+        if len(loop_delivery.events) >= self.max_queue_size:
+            if self.overflow_policy == OverflowPolicy.DROP:
+                return "dropped"
+            self._deliver([item])
+            return "inline"
+        loop_delivery.events.append(item)
+        self._mark_queued(len(loop_delivery.events))
+        if loop_delivery.task is None or loop_delivery.task.done():
+            loop_delivery.task = loop.create_task(self._run_loop(loop_delivery))
+        return "enqueued"
+
+    async def _run_loop(self, loop_delivery: _LoopDelivery) -> None:
+        # runs until the queue is empty (a new task is started when needed)
+        while loop_delivery.events:
+            # the request path goes on before the delivery
+            await asyncio.sleep(0)
+            batch = [
+                loop_delivery.events.popleft()
+                for _ in range(min(self.batch_size, len(loop_delivery.events)))
+            ]
+            self._deliver(batch)
+            self._mark_done(len(batch))
+
+    def stats(self) -> BackgroundObserverStats:
+        """
+        Return the counters and timings of this observer.
+
+        Returns:
+            a BackgroundObserverStats object.
+        """
+
+        with self._stats_lock:
+            return BackgroundObserverStats(
+                enqueued=self._enqueued,
+                delivered=self._delivered,
+                dropped=self._dropped,
+                delivered_inline=self._delivered_inline,
+                max_queue_size=self._max_queue_size,
+                enqueue_s=self._enqueue_s,
+                delivery_s=self._delivery_s,
+            )
+
+    def flush(self, timeout_s: float | None = None) -> bool:
+        """
+        Wait until all queued events are delivered.
+
+        Not to be called from an event loop with undelivered events (the delivery
+        there needs the loop to run): use `async_flush` in that case.
+
+        Args:
+            timeout_s: the maximum time to wait, in seconds (None: no limit).
+
+        Returns:
+            True if all events were delivered, False if the timeout expired.
+        """
+
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout_s)
+
+    async def async_flush(self) -> None:
+        """
+        Wait until all events queued in the running event loop are delivered.
+        Events queued outside of this loop are not waited for.
+        """
+
+        loop_delivery = self._loop_deliveries.get(asyncio.get_running_loop())
+        while loop_delivery is not None and loop_delivery.task is not None:
+            task = loop_delivery.task
+            await asyncio.shield(task)
+            if loop_delivery.task is task:
+                return
+
+    def close(self, timeout_s: float | None = None) -> bool:
+        """
+        Deliver the queued events and stop the background thread. The events
+        received afterwards are delivered synchronously by the caller.
+
+        Args:
+            timeout_s: the maximum time to wait for the delivery, in seconds.
+
+        Returns:
+            True if all events were delivered, False if the timeout expired.
+        """
+
+        self._closed = True
+        flushed = self.flush(timeout_s=timeout_s)
+        with self._thread_lock:
+            if self._thread is not None:
+                try:
+                    self._queue.put_nowait(None)
+                    self._thread = None
+                except queue.Full:
+                    # (not flushed in time: the thread goes on delivering)
+                    pass
+        return flushed
@@ -99,6 +99,9 @@ class ObservableRequest(ObservableEvent):
     An event representing a request being sent, captured with its
     payload exactly as will be sent to the API.
 
+    Time instants are readings of a monotonic clock (`time.perf_counter()`),
+    hence only meaningful when compared to each other.
+
     Attributes:
         event_type: it has value ObservableEventType.REQUEST in this case.
         payload: the payload as a string.
@@ -108,6 +111,12 @@ class ObservableRequest(ObservableEvent):
         redacted_headers: a dictionary of the non-sensitive headers being used
             for the request. Authentication credentials and API Keys are removed.
         dev_ops_api: true if and only if the request is aimed at the DevOps API.
+        command_name: the Data API command, such as "findOne" (None for
+            DevOps API requests).
+        started_at: the instant the processing of the request started (i.e. before
+            encoding the payload).
+        encode_duration_s: the time spent encoding the payload, in seconds.
+        payload_size: the size of the encoded payload, in bytes.
     """
 
     payload: str | None
@@ -116,6 +125,10 @@ class ObservableRequest(ObservableEvent):
     query_parameters: dict[str, Any] | None
     redacted_headers: dict[str, Any] | None
     dev_ops_api: bool
+    command_name: str | None
+    started_at: float | None
+    encode_duration_s: float | None
+    payload_size: int | None
 
     def __init__(
         self,
@@ -125,6 +138,11 @@ class ObservableRequest(ObservableEvent):
         query_parameters: dict[str, Any] | None,
         redacted_headers: dict[str, Any] | None,
         dev_ops_api: bool,
+        *,
+        command_name: str | None = None,
+        started_at: float | None = None,
+        encode_duration_s: float | None = None,
+        payload_size: int | None = None,
     ) -> None:
         self.event_type = ObservableEventType.REQUEST
         self.payload = payload
@@ -133,6 +151,10 @@ class ObservableRequest(ObservableEvent):
         self.query_parameters = query_parameters
         self.redacted_headers = redacted_headers
         self.dev_ops_api = dev_ops_api
+        self.command_name = command_name
+        self.started_at = started_at
+        self.encode_duration_s = encode_duration_s
+        self.payload_size = payload_size
 
 
 @dataclass
@@ -141,16 +163,67 @@ class ObservableResponse(ObservableEvent):
     An event representing a response received by the Data API, whose body
     is captured exactly as is sent by the Data API.
 
+    Time instants are readings of a monotonic clock (`time.perf_counter()`),
+    hence only meaningful when compared to each other.
+
     Attributes:
         event_type: it has value ObservableEventType.RESPONSE in this case.
         body: a string expressing the response body.
         status_code: the response HTTP status code.
+        command_name: the Data API command, such as "findOne" (None for
+            DevOps API requests).
+        started_at: the instant the processing of the request started (the same
+            as for the corresponding request event).
+        ended_at: the instant the response was received (before decoding it).
+        encode_duration_s: the time spent encoding the request payload, in seconds.
+        decode_duration_s: the time spent decoding the response body, in seconds.
+            This is None if the response was not decoded as JSON by astrapy (e.g.
+            for HTTP errors and for some of the DevOps API requests).
+        payload_size: the size of the request payload, in bytes.
+        response_size: the size of the response body, in bytes.
     """
 
     body: str | None
     status_code: int
+    command_name: str | None
+    started_at: float | None
+    ended_at: float | None
+    encode_duration_s: float | None
+    decode_duration_s: float | None
+    payload_size: int | None
+    response_size: int | None
 
-    def __init__(self, body: str | None, *, status_code: int) -> None:
+    def __init__(
+        self,
+        body: str | None,
+        *,
+        status_code: int,
+        command_name: str | None = None,
+        started_at: float | None = None,
+        ended_at: float | None = None,
+        encode_duration_s: float | None = None,
+        decode_duration_s: float | None = None,
+        payload_size: int | None = None,
+        response_size: int | None = None,
+    ) -> None:
         self.event_type = ObservableEventType.RESPONSE
         self.body = body
         self.status_code = status_code
+        self.command_name = command_name
+        self.started_at = started_at
+        self.ended_at = ended_at
+        self.encode_duration_s = encode_duration_s
+        self.decode_duration_s = decode_duration_s
+        self.payload_size = payload_size
+        self.response_size = response_size
+
+    @property
+    def duration_s(self) -> float | None:
+        """
+        The time, in seconds, from the start of the request processing
+        to the reception of the response, if available.
+        """
+
+        if self.started_at is None or self.ended_at is None:
+            return None
+        return self.ended_at - self.started_at
@@ -0,0 +1,366 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from astrapy.event_observers.events import (
+    ObservableEvent,
+    ObservableEventType,
+    ObservableResponse,
+)
+from astrapy.event_observers.observers import Observer
+
+# how many recent requests are remembered, to attribute errors to commands
+RECENT_REQUESTS_MAX_SIZE = 1024
+
+
+class LatencyHistogram:
+    """
+    A histogram of durations with bounded memory and bounded relative error,
+    in the style of HDR histograms.
+
+    Durations are recorded with microsecond resolution. Each power-of-two range
+    of values is split into `2 ** sub_bucket_bits` equal sub-buckets, so that
+    percentiles are accurate within a relative error of `2 ** -sub_bucket_bits`
+    (about 3% with the default). Values above `max_value_s` are recorded as
+    `max_value_s`. Exact minimum, maximum and total are kept as well.
+
+    The histogram is not thread-safe: concurrent writers must synchronize.
+
+    Args:
+        sub_bucket_bits: the logarithm of the number of linear sub-buckets
+            per power of two.
+        max_value_s: the largest trackable value, in seconds.
+
+    Example:
+        >>> histogram = LatencyHistogram()
+        >>> for duration_s in [0.010, 0.012, 0.011, 0.250]:
+        ...     histogram.record(duration_s)
+        ...
+        >>> histogram.count
+        4
+        >>> round(histogram.percentile(50), 3)
+        0.011
+    """
+
+    def __init__(
+        self,
+        *,
+        sub_bucket_bits: int = 5,
+        max_value_s: float = 3600.0,
+    ) -> None:
+        self.sub_bucket_bits = sub_bucket_bits
+        self.max_value_s = max_value_s
+        self._sub_buckets = 1 << sub_bucket_bits
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total_s = 0.0
+        self.min_s: float | None = None
+        self.max_s: float | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(count={self.count}, "
+            f"min_s={self.min_s}, max_s={self.max_s})"
+        )
+
+    def _index(self, value_us: int) -> int:
+        if value_us < 2 * self._sub_buckets:
+            return value_us
+        shift = value_us.bit_length() - self.sub_bucket_bits - 1
+        return (shift + 1) * self._sub_buckets + (value_us >> shift) - self._sub_buckets
+
+    def _bucket_bounds_us(self, index: int) -> tuple[int, int]:
+        # lower (inclusive) and upper (exclusive) bounds of a bucket
+        if index < 2 * self._sub_buckets:
+            return index, index + 1
+        shift = index // self._sub_buckets - 1
+        sub_bucket = index % self._sub_buckets + self._sub_buckets
+        return sub_bucket << shift, (sub_bucket + 1) << shift
+
+    def record(self, value_s: float) -> None:
+        """
+        Record a duration.
+
+        Args:
+            value_s: the duration, in seconds. Negative values count as zero.
+        """
+
+        _value_s = min(max(value_s, 0.0), self.max_value_s)
+        index = self._index(int(_value_s * 1_000_000))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total_s += _value_s
+        if self.min_s is None or _value_s < self.min_s:
+            self.min_s = _value_s
+        if self.max_s is None or _value_s > self.max_s:
+            self.max_s = _value_s
+
+    @property
+    def mean_s(self) -> float | None:
+        """The mean of the recorded durations, in seconds (None if empty)."""
+
+        if self.count == 0:
+            return None
+        return self.total_s / self.count
+
+    def percentile(self, percentile: float) -> float | None:
+        """
+        Estimate a percentile of the recorded durations.
+
+        Args:
+            percentile: a number between 0 and 100, e.g. 99 for the p99 latency.
+
+        Returns:
+            the estimated duration, in seconds, within the histogram precision
+            (None if no values were recorded).
+        """
+
+        if self.count == 0 or self.min_s is None or self.max_s is None:
+            return None
+        target_rank = max(1, round(self.count * min(max(percentile, 0), 100) / 100))
+        cumulative = 0
+        for index in sorted(self._counts):
+            cumulative += self._counts[index]
+            if cumulative >= target_rank:
+                lower_us, upper_us = self._bucket_bounds_us(index)
+                value_s = (lower_us + upper_us - 1) / 2_000_000
+                return min(max(value_s, self.min_s), self.max_s)
+        return self.max_s
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """
+        Return the non-empty buckets of the histogram.
+
+        Returns:
+            a list of (upper bound in seconds, count) pairs, sorted by bound.
+            The counts are not cumulative.
+        """
+
+        return [
+            (self._bucket_bounds_us(index)[1] / 1_000_000, self._counts[index])
+            for index in sorted(self._counts)
+        ]
+
+    def copy(self) -> LatencyHistogram:
+        """Return an independent copy of this histogram."""
+
+        histogram = LatencyHistogram(
+            sub_bucket_bits=self.sub_bucket_bits,
+            max_value_s=self.max_value_s,
+        )
+        histogram._counts = dict(self._counts)
+        histogram.count = self.count
+        histogram.total_s = self.total_s
+        histogram.min_s = self.min_s
+        histogram.max_s = self.max_s
+        return histogram
+
+
+@dataclass
+class CommandMetrics:
+    """
+    The metrics collected by a MetricsObserver for a single command.
+
+    Attributes:
+        command_name: the Data API command name, such as "findOne". It is None
+            for the requests without a command (i.e. DevOps API requests).
+        request_count: the number of responses received.
+        error_count: the number of failed requests, i.e. those with a non-2xx
+            HTTP status or with errors in the Data API response.
+        bytes_sent: the total size of the request payloads, in bytes.
+        bytes_received: the total size of the response bodies, in bytes.
+        encode_s: the total time spent encoding payloads, in seconds.
+        decode_s: the total time spent decoding responses, in seconds.
+        latency: a LatencyHistogram of the request durations (from the start of
+            the request processing to the reception of the response).
+    """
+
+    command_name: str | None
+    request_count: int
+    error_count: int
+    bytes_sent: int
+    bytes_received: int
+    encode_s: float
+    decode_s: float
+    latency: LatencyHistogram
+
+    def copy(self) -> CommandMetrics:
+        return CommandMetrics(
+            command_name=self.command_name,
+            request_count=self.request_count,
+            error_count=self.error_count,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            encode_s=self.encode_s,
+            decode_s=self.decode_s,
+            latency=self.latency.copy(),
+        )
+
+
+class MetricsObserver(Observer):
+    """
+    An observer collecting per-command latency histograms and throughput
+    counters from the request/response events.
+
+    Memory is bounded: one LatencyHistogram and a few counters for each distinct
+    command name. The observer is thread-safe and can be shared by any number
+    of objects (and attached to both sync and async classes). It declares no
+    interest in the response bodies, which are then not decoded on its behalf.
+
+    Args:
+        sub_bucket_bits: the precision of the latency histograms
+            (see `LatencyHistogram`).
+
+    Example:
+        >>> from astrapy.api_options import APIOptions
+        >>> from astrapy.event_observers import MetricsObserver
+        >>> metrics = MetricsObserver()
+        >>> instrumented_table = my_table.with_options(
+        ...     api_options=APIOptions(event_observers={"metrics": metrics}),
+        ... )
+        >>> for pk in range(100):
+        ...     _ = instrumented_table.find_one({"id": pk})
+        ...
+        >>> metrics.summary()["findOne"]["request_count"]
+        100
+        >>> metrics.summary()["findOne"]["p99_s"]
+        0.0371
+    """
+
+    event_types = frozenset({ObservableEventType.RESPONSE, ObservableEventType.ERROR})
+    needs_body = False
+
+    def __init__(self, *, sub_bucket_bits: int = 5) -> None:
+        self.sub_bucket_bits = sub_bucket_bits
+        self._lock = threading.Lock()
+        self._commands: dict[str | None, CommandMetrics] = {}
+        # recent request IDs, to attribute the error events to a command
+        self._recent_requests: OrderedDict[str, str | None] = OrderedDict()
+        self._started_at = time.perf_counter()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(commands={len(self._commands)})"
+
+    def _command_metrics(self, command_name: str | None) -> CommandMetrics:
+        command_metrics = self._commands.get(command_name)
+        if command_metrics is None:
+            command_metrics = CommandMetrics(
+                command_name=command_name,
+                request_count=0,
+                error_count=0,
+                bytes_sent=0,
+                bytes_received=0,
+                encode_s=0.0,
+                decode_s=0.0,
+                latency=LatencyHistogram(sub_bucket_bits=self.sub_bucket_bits),
+            )
+            self._commands[command_name] = command_metrics
+        return command_metrics
+
+    def receive(
+        self,
+        event: ObservableEvent,
+        sender: Any = None,
+        function_name: str | None = None,
+        request_id: str | None = None,
+    ) -> None:
+        if isinstance(event, ObservableResponse):
+            duration_s = event.duration_s
+            with self._lock:
+                command_metrics = self._command_metrics(event.command_name)
+                command_metrics.request_count += 1
+                if not 200 <= event.status_code < 300:
+                    command_metrics.error_count += 1
+                command_metrics.bytes_sent += event.payload_size or 0
+                command_metrics.bytes_received += event.response_size or 0
+                command_metrics.encode_s += event.encode_duration_s or 0.0
+                command_metrics.decode_s += event.decode_duration_s or 0.0
+                if duration_s is not None:
+                    command_metrics.latency.record(duration_s)
+                if request_id is not None:
+                    self._recent_requests[request_id] = event.command_name
+                    if len(self._recent_requests) > RECENT_REQUESTS_MAX_SIZE:
+                        self._recent_requests.popitem(last=False)
+        elif event.event_type == ObservableEventType.ERROR and request_id is not None:
+            with self._lock:
+                # (counted once per request, however many errors it returned)
+                if request_id in self._recent_requests:
+                    command_name = self._recent_requests.pop(request_id)
+                    self._command_metrics(command_name).error_count += 1
+
+    @property
+    def elapsed_s(self) -> float:
+        """The time, in seconds, since the creation (or last reset) of the observer."""
+
+        return time.perf_counter() - self._started_at
+
+    def get_metrics(self) -> dict[str | None, CommandMetrics]:
+        """
+        Return a snapshot of the metrics collected so far.
+
+        Returns:
+            a dictionary from the command name to a CommandMetrics object.
+            The snapshot is not affected by events received afterwards.
+        """
+
+        with self._lock:
+            return {
+                command_name: command_metrics.copy()
+                for command_name, command_metrics in self._commands.items()
+            }
+
+    def summary(self) -> dict[str | None, dict[str, Any]]:
+        """
+        Return a summary of the metrics collected so far, with throughput figures
+        and the main latency percentiles, as plain dictionaries (e.g. for logging).
+
+        Returns:
+            a dictionary from the command name to a dictionary of figures:
+            "request_count", "error_count", "requests_per_s", "bytes_sent",
+            "bytes_received", "mean_s", "p50_s", "p90_s", "p99_s", "max_s".
+        """
+
+        elapsed_s = self.elapsed_s
+        return {
+            command_name: {
+                "request_count": command_metrics.request_count,
+                "error_count": command_metrics.error_count,
+                "requests_per_s": command_metrics.request_count / elapsed_s
+                if elapsed_s > 0
+                else None,
+                "bytes_sent": command_metrics.bytes_sent,
+                "bytes_received": command_metrics.bytes_received,
+                "mean_s": command_metrics.latency.mean_s,
+                "p50_s": command_metrics.latency.percentile(50),
+                "p90_s": command_metrics.latency.percentile(90),
+                "p99_s": command_metrics.latency.percentile(99),
+                "max_s": command_metrics.latency.max_s,
+            }
+            for command_name, command_metrics in self.get_metrics().items()
+        }
+
+    def reset(self) -> None:
+        """Discard all metrics collected so far and restart the elapsed time."""
+
+        with self._lock:
+            self._commands = {}
+            self._recent_requests = OrderedDict()
+            self._started_at = time.perf_counter()
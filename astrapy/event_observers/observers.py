@@ -15,7 +15,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable
 from typing import Any
 
 from astrapy.event_observers.events import ObservableEvent, ObservableEventType
@@ -31,9 +31,38 @@ class Observer(ABC):
 
     This class offers two static factory methods for common use-cases:
     `from_event_list` and `from_event_dict`.
+
+    Observers can declare their interests, so that the events nobody is
+    interested in are not even created: only the event types in `event_types`
+    (if not None) are dispatched to the observer, and response bodies are only
+    decoded into strings if an interested observer has `needs_body` set.
+
+    Events are dispatched synchronously, within the request processing: observers
+    doing nontrivial work should be wrapped in a `BackgroundObserver` (see).
+
+    Attributes:
+        enabled: if False, no events are dispatched to the observer.
+        event_types: the event types the observer is interested in (None: all).
+        needs_body: whether the observer uses the response bodies. If no
+            interested observer does, the `body` of response events is None.
     """
 
     enabled: bool = True
+    event_types: Collection[ObservableEventType] | None = None
+    needs_body: bool = True
+
+    def is_interested(self, event_type: ObservableEventType) -> bool:
+        """
+        Whether events of a given type are to be dispatched to this observer.
+
+        Args:
+            event_type: an ObservableEventType.
+
+        Returns:
+            True if the event type is among the declared interests.
+        """
+
+        return self.event_types is None or event_type in self.event_types
 
     @abstractmethod
     def receive(
@@ -106,7 +135,7 @@ class Observer(ABC):
                 function_name: str | None = None,
                 request_id: str | None = None,
             ) -> None:
-                if event.event_type in self.event_types:
+                if self.is_interested(event.event_type):
                     self.event_list.append(event)
 
         return _ObserverFromList(event_list, event_types)
@@ -166,7 +195,7 @@ class Observer(ABC):
                 function_name: str | None = None,
                 request_id: str | None = None,
             ) -> None:
-                if event.event_type in self.event_types:
+                if self.is_interested(event.event_type):
                     self.event_dict[event.event_type] = self.event_dict.get(
                         event.event_type, []
                     ) + [event]
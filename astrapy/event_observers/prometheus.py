@@ -0,0 +1,459 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from astrapy.event_observers.events import (
+    ObservableError,
+    ObservableEvent,
+    ObservableEventType,
+    ObservableRequest,
+    ObservableResponse,
+    ObservableWarning,
+)
+from astrapy.event_observers.observers import Observer
+from astrapy.utils.tracing import ScopeKind, current_scope
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+# the labels describing the target of a request, in their exposition order
+PROMETHEUS_LABEL_NAMES = ("command", "keyspace", "target")
+DEFAULT_PROMETHEUS_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# the label value replacing all values beyond the cardinality limits
+OVERFLOW_LABEL_VALUE = "_other_"
+# requests remembered (in flight, or just completed) to label later events
+PENDING_REQUESTS_MAX_SIZE = 10000
+
+_LabelValues = tuple[str, ...]
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_number(value: float) -> str:
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class _HistogramSeries:
+    def __init__(self, bucket_count: int) -> None:
+        self.bucket_counts = [0] * (bucket_count + 1)
+        self.count = 0
+        self.sum = 0.0
+
+
+class PrometheusObserver(Observer):
+    """
+    An observer maintaining Prometheus metrics about the requests, exposed
+    in the OpenMetrics text format.
+
+    The metrics, all prefixed with the `namespace`, are:
+    `requests_total` (counter), `request_errors_total` (counter of responses with
+    an HTTP error status, with a `status_code` label), `api_errors_total` and
+    `api_warnings_total` (counters of the errors and warnings in the Data API
+    responses, with an `error_code` label), `request_duration_seconds`
+    (histogram), `requests_in_flight` (gauge), `request_bytes_total` and
+    `response_bytes_total` (counters).
+
+    All metrics are labeled by request target: the Data API `command` (empty for
+    the DevOps API), the `keyspace` and the `target` collection or table (empty
+    if not applicable). The metrics are available through `render()`, or
+    on a local HTTP endpoint started with `start_http_server`. No third-party
+    packages are used.
+
+    Label cardinality can be limited in two ways: by choosing which labels are
+    used at all (`label_names`) and by capping the number of distinct label sets
+    per metric (`max_series`), beyond which the label values of new sets are all
+    replaced by "_other_".
+
+    Args:
+        namespace: the prefix for the metric names.
+        label_names: the target labels to use, a subset of "command", "keyspace"
+            and "target". For instance, dropping "target" keeps the number of
+            series independent from the number of collections and tables.
+        buckets: the upper bounds, in seconds, of the latency histogram buckets.
+        max_series: the maximum number of distinct label sets per metric.
+
+    Example:
+        >>> from astrapy.api_options import APIOptions
+        >>> from astrapy.event_observers import PrometheusObserver
+        >>> prometheus_observer = PrometheusObserver()
+        >>> prometheus_observer.start_http_server(9464)
+        ('127.0.0.1', 9464)
+        >>> client = DataAPIClient(
+        ...     api_options=APIOptions(
+        ...         event_observers={"prometheus": prometheus_observer},
+        ...     ),
+        ... )
+        >>> # ... use 'client' and its spawned objects, then:
+        >>> print(prometheus_observer.render())
+        # TYPE astrapy_requests counter
+        # HELP astrapy_requests Requests completed with a response.
+        astrapy_requests_total{command="findOne",keyspace="ks",target="coll"} 12
+        ...
+        # EOF
+    """
+
+    event_types = frozenset(
+        {
+            ObservableEventType.REQUEST,
+            ObservableEventType.RESPONSE,
+            ObservableEventType.ERROR,
+            ObservableEventType.WARNING,
+        }
+    )
+    needs_body = False
+
+    def __init__(
+        self,
+        *,
+        namespace: str = "astrapy",
+        label_names: Iterable[str] = PROMETHEUS_LABEL_NAMES,
+        buckets: Iterable[float] = DEFAULT_PROMETHEUS_BUCKETS,
+        max_series: int = 1000,
+    ) -> None:
+        _label_names = set(label_names)
+        unknown_labels = _label_names - set(PROMETHEUS_LABEL_NAMES)
+        if unknown_labels:
+            raise ValueError(
+                f"Unknown label names: {', '.join(sorted(unknown_labels))}. "
+                f"Allowed label names are: {', '.join(PROMETHEUS_LABEL_NAMES)}."
+            )
+        self.namespace = namespace
+        self.label_names = tuple(
+            name for name in PROMETHEUS_LABEL_NAMES if name in _label_names
+        )
+        self.buckets = tuple(sorted(buckets))
+        self.max_series = max_series
+        self._lock = threading.Lock()
+        self._requests: dict[_LabelValues, int] = {}
+        self._request_errors: dict[_LabelValues, int] = {}
+        self._api_errors: dict[_LabelValues, int] = {}
+        self._api_warnings: dict[_LabelValues, int] = {}
+        self._in_flight: dict[_LabelValues, int] = {}
+        self._request_bytes: dict[_LabelValues, int] = {}
+        self._response_bytes: dict[_LabelValues, int] = {}
+        self._durations: dict[_LabelValues, _HistogramSeries] = {}
+        # request ID -> (label values, whether still in flight)
+        self._pending: OrderedDict[str, tuple[_LabelValues, bool]] = OrderedDict()
+        self._http_server: ThreadingHTTPServer | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(namespace={self.namespace}, "
+            f"label_names={','.join(self.label_names)})"
+        )
+
+    def _label_values(self, command_name: str | None, sender: Any) -> _LabelValues:
+        all_values: dict[str, str] = {"command": command_name or ""}
+        if "keyspace" in self.label_names or "target" in self.label_names:
+            # (collections and tables have a name; databases, only a keyspace)
+            target = getattr(sender, "name", None)
+            keyspace = getattr(sender, "keyspace", None)
+            all_values["keyspace"] = keyspace if isinstance(keyspace, str) else ""
+            all_values["target"] = target if isinstance(target, str) else ""
+        return tuple(all_values[name] for name in self.label_names)
+
+    def _series_key(
+        self,
+        series: dict[_LabelValues, Any],
+        key: _LabelValues,
+    ) -> _LabelValues:
+        if key in series or len(series) < self.max_series:
+            return key
+        return tuple(OVERFLOW_LABEL_VALUE for _ in key)
+
+    def _increment(
+        self,
+        series: dict[_LabelValues, int],
+        key: _LabelValues,
+        amount: int = 1,
+    ) -> None:
+        _key = self._series_key(series, key)
+        series[_key] = series.get(_key, 0) + amount
+
+    def _remember(self, request_id: str, labels: _LabelValues, in_flight: bool) -> None:
+        self._pending[request_id] = (labels, in_flight)
+        if len(self._pending) > PENDING_REQUESTS_MAX_SIZE:
+            # a request with no response (e.g. a timeout) is not in flight anymore
+            _, (old_labels, old_in_flight) = self._pending.popitem(last=False)
+            if old_in_flight:
+                self._increment(self._in_flight, old_labels, -1)
+
+    def _end_request(self, request_id: str) -> None:
+        # the request is over, with or without a response (e.g. a timeout)
+        with self._lock:
+            pending = self._pending.pop(request_id, None)
+            if pending is not None and pending[1]:
+                self._increment(self._in_flight, pending[0], -1)
+
+    def receive(
+        self,
+        event: ObservableEvent,
+        sender: Any = None,
+        function_name: str | None = None,
+        request_id: str | None = None,
+    ) -> None:
+        if isinstance(event, ObservableRequest):
+            labels = self._label_values(event.command_name, sender)
+            with self._lock:
+                self._increment(self._in_flight, labels)
+                if request_id is not None:
+                    self._remember(request_id, labels, True)
+            scope = current_scope()
+            if (
+                request_id is not None
+                and scope is not None
+                and scope.kind == ScopeKind.REQUEST
+            ):
+                _request_id = request_id
+                scope.add_end_callback(
+                    lambda _scope, error: self._end_request(_request_id)
+                )
+        elif isinstance(event, ObservableResponse):
+            duration_s = event.duration_s
+            with self._lock:
+                pending = (
+                    self._pending.pop(request_id, None)
+                    if request_id is not None
+                    else None
+                )
+                if pending is None:
+                    labels = self._label_values(event.command_name, sender)
+                else:
+                    labels, in_flight = pending
+                    if in_flight:
+                        self._increment(self._in_flight, labels, -1)
+                self._increment(self._requests, labels)
+                if not 200 <= event.status_code < 300:
+                    self._increment(
+                        self._request_errors, (*labels, str(event.status_code))
+                    )
+                self._increment(self._request_bytes, labels, event.payload_size or 0)
+                self._increment(self._response_bytes, labels, event.response_size or 0)
+                if duration_s is not None:
+                    key = self._series_key(self._durations, labels)
+                    histogram = self._durations.get(key)
+                    if histogram is None:
+                        histogram = _HistogramSeries(len(self.buckets))
+                        self._durations[key] = histogram
+                    histogram.bucket_counts[
+                        bisect.bisect_left(self.buckets, duration_s)
+                    ] += 1
+                    histogram.count += 1
+                    histogram.sum += duration_s
+                if request_id is not None:
+                    # for the errors and warnings in the response
+                    self._remember(request_id, labels, False)
+        elif isinstance(event, ObservableError | ObservableWarning):
+            if isinstance(event, ObservableError):
+                error_code = event.error.error_code or ""
+                series = self._api_errors
+            else:
+                error_code = event.warning.error_code or ""
+                series = self._api_warnings
+            with self._lock:
+                pending = (
+                    self._pending.get(request_id) if request_id is not None else None
+                )
+                labels = (
+                    pending[0]
+                    if pending is not None
+                    else self._label_values(None, sender)
+                )
+                self._increment(series, (*labels, error_code))
+
+    def render(self) -> str:
+        """
+        Render the current values of all metrics.
+
+        Returns:
+            a string in the OpenMetrics text format (whose content type is
+            `OPENMETRICS_CONTENT_TYPE`), terminated by "# EOF".
+        """
+
+        names = self.label_names
+        lines: list[str] = []
+
+        def _family(
+            name: str,
+            metric_type: str,
+            help_text: str,
+            series: dict[_LabelValues, int],
+            extra_label: str | None = None,
+        ) -> None:
+            family_name = f"{self.namespace}_{name}"
+            lines.append(f"# TYPE {family_name} {metric_type}")
+            lines.append(f"# HELP {family_name} {help_text}")
+            sample_name = (
+                f"{family_name}_total" if metric_type == "counter" else family_name
+            )
+            label_names = (*names, extra_label) if extra_label else names
+            for label_values, value in sorted(series.items()):
+                lines.append(
+                    f"{sample_name}{_format_labels(label_names, label_values)} "
+                    f"{_format_number(value)}"
+                )
+
+        with self._lock:
+            _family(
+                "requests",
+                "counter",
+                "Requests completed with a response.",
+                self._requests,
+            )
+            _family(
+                "request_errors",
+                "counter",
+                "Responses with an HTTP error status.",
+                self._request_errors,
+                extra_label="status_code",
+            )
+            _family(
+                "api_errors",
+                "counter",
+                "Errors returned in the Data API responses.",
+                self._api_errors,
+                extra_label="error_code",
+            )
+            _family(
+                "api_warnings",
+                "counter",
+                "Warnings returned in the Data API responses.",
+                self._api_warnings,
+                extra_label="error_code",
+            )
+            _family(
+                "requests_in_flight",
+                "gauge",
+                "Requests sent and waiting for a response.",
+                self._in_flight,
+            )
+            _family(
+                "request_bytes",
+                "counter",
+                "Total size of the request payloads, in bytes.",
+                self._request_bytes,
+            )
+            _family(
+                "response_bytes",
+                "counter",
+                "Total size of the response bodies, in bytes.",
+                self._response_bytes,
+            )
+            family_name = f"{self.namespace}_request_duration_seconds"
+            lines.append(f"# TYPE {family_name} histogram")
+            lines.append(f"# UNIT {family_name} seconds")
+            lines.append(
+                f"# HELP {family_name} Time from the start of the request "
+                "processing to the reception of the response."
+            )
+            for label_values, histogram in sorted(self._durations.items()):
+                cumulative = 0
+                bounds = [*(_format_number(b) for b in self.buckets), "+Inf"]
+                for bound, bucket_count in zip(bounds, histogram.bucket_counts):
+                    cumulative += bucket_count
+                    bucket_labels = _format_labels(
+                        (*names, "le"), (*label_values, bound)
+                    )
+                    lines.append(f"{family_name}_bucket{bucket_labels} {cumulative}")
+                labels_text = _format_labels(names, label_values)
+                lines.append(f"{family_name}_count{labels_text} {histogram.count}")
+                lines.append(
+                    f"{family_name}_sum{labels_text} {_format_number(histogram.sum)}"
+                )
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def start_http_server(
+        self,
+        port: int,
+        addr: str = "127.0.0.1",
+    ) -> tuple[str, int]:
+        """
+        Start serving the metrics over HTTP, from a background (daemon) thread.
+        The metrics are served for GET requests to any path (e.g. "/metrics").
+
+        Args:
+            port: the port to listen on. Zero picks a free port.
+            addr: the address to bind to. The default only accepts local
+                connections: use "0.0.0.0" to accept remote scrapes.
+
+        Returns:
+            the (address, port) pair the server is listening on.
+        """
+
+        if self._http_server is not None:
+            raise RuntimeError("The HTTP server is already running.")
+        observer = self
+
+        class _MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                body = observer.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        http_server = ThreadingHTTPServer((addr, port), _MetricsHandler)
+        http_server.daemon_threads = True
+        threading.Thread(
+            target=http_server.serve_forever,
+            name=f"astrapy-{self.__class__.__name__}",
+            daemon=True,
+        ).start()
+        self._http_server = http_server
+        host, bound_port = http_server.server_address[:2]
+        return str(host), int(bound_port)
+
+    def stop_http_server(self) -> None:
+        """Stop the HTTP server started with `start_http_server`, if any."""
+
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
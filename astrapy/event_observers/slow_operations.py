@@ -0,0 +1,549 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from astrapy.event_observers.events import (
+    ObservableError,
+    ObservableEvent,
+    ObservableEventType,
+    ObservableRequest,
+    ObservableResponse,
+)
+from astrapy.event_observers.observers import Observer
+from astrapy.utils.tracing import (
+    ScopeKind,
+    _OperationScope,
+    current_request_attributes,
+    current_scope,
+)
+
+logger = logging.getLogger(__name__)
+
+# requests remembered (in flight) to attach their response to the record
+PENDING_REQUESTS_MAX_SIZE = 10000
+# the placeholder for the redacted values in filter and sort shapes
+REDACTED_VALUE = "?"
+
+
+def _value_shape(value: Any) -> Any:
+    # field names and operators are kept, the values are redacted
+    if isinstance(value, dict):
+        return {key: _value_shape(item) for key, item in value.items()}
+    if isinstance(value, list) and value and all(isinstance(v, dict) for v in value):
+        # e.g. the operands of "$and"/"$or"
+        return [_value_shape(item) for item in value]
+    return REDACTED_VALUE
+
+
+def _sort_shape(sort: Any) -> Any:
+    # sort directions are kept (vectors and vectorize strings are redacted)
+    if not isinstance(sort, dict):
+        return REDACTED_VALUE
+    return {
+        key: (
+            value
+            if isinstance(value, int)
+            and not isinstance(value, bool)
+            and value in (1, -1)
+            else REDACTED_VALUE
+        )
+        for key, value in sort.items()
+    }
+
+
+def _payload_shapes(payload: str | None) -> tuple[Any, Any]:
+    """The shapes of the filter and the sort of a command payload, if any."""
+
+    if not payload:
+        return None, None
+    try:
+        command = json.loads(payload)
+    except ValueError:
+        return None, None
+    if not isinstance(command, dict) or len(command) != 1:
+        return None, None
+    body = next(iter(command.values()))
+    if not isinstance(body, dict):
+        return None, None
+    filter_shape = _value_shape(body["filter"]) if "filter" in body else None
+    sort_shape = _sort_shape(body["sort"]) if "sort" in body else None
+    return filter_shape, sort_shape
+
+
+@dataclass
+class SlowOperationRecord:
+    """
+    The record of a slow (or sampled) operation or request.
+
+    Attributes:
+        kind: "operation" for a method issuing several requests (such as
+            `insert_many` or the scan of a cursor), "request" for an HTTP request.
+        name: the method name for operations, the command name for requests.
+        started_at: the time the operation or request started (epoch seconds).
+        duration_s: the duration, in seconds.
+        slow: True if the duration exceeded the threshold, False for a record
+            of a fast operation collected by sampling.
+        keyspace: the keyspace, if applicable.
+        target: the collection or table, if applicable.
+        command: the (first) command sent by the operation, such as "find".
+        filter_shape: the filter of the (first) command, with all values
+            redacted (only field names and operators are retained).
+        sort_shape: likewise, the sort clause (sort directions are retained).
+        request_count: the number of requests made.
+        pages: the number of pages fetched (cursors and paginated writes).
+        chunks: the number of chunks written (insertions).
+        bytes_out: the total size of the request payloads, in bytes.
+        bytes_in: the total size of the response bodies, in bytes.
+        encode_s: the total time spent encoding request payloads, in seconds.
+        network_s: the total time spent waiting for responses, in seconds.
+        decode_s: the total time spent decoding response bodies, in seconds.
+        error: a description of the error the operation ended with, if any.
+        function_name: the name of the method issuing the request (requests only).
+        request_id: the ID of the request (requests only).
+    """
+
+    kind: str
+    name: str
+    started_at: float
+    duration_s: float
+    slow: bool
+    keyspace: str | None = None
+    target: str | None = None
+    command: str | None = None
+    filter_shape: Any = None
+    sort_shape: Any = None
+    request_count: int = 0
+    pages: int = 0
+    chunks: int = 0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    encode_s: float = 0.0
+    network_s: float = 0.0
+    decode_s: float = 0.0
+    error: str | None = None
+    function_name: str | None = None
+    request_id: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Express the record as a JSON-serializable dictionary."""
+
+        return asdict(self)
+
+
+@dataclass
+class _Totals:
+    # counters shared by requests and operations
+    keyspace: str | None = None
+    target: str | None = None
+    command: str | None = None
+    payload: str | None = None
+    request_count: int = 0
+    pages: int = 0
+    chunks: int = 0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    encode_s: float = 0.0
+    network_s: float = 0.0
+    decode_s: float = 0.0
+    error_messages: list[str] = field(default_factory=list)
+
+    def add(self, other: _Totals) -> None:
+        if self.request_count == 0:
+            self.keyspace = other.keyspace
+            self.target = other.target
+            self.command = other.command
+            self.payload = other.payload
+        self.request_count += other.request_count
+        self.pages += other.pages
+        self.chunks += other.chunks
+        self.bytes_out += other.bytes_out
+        self.bytes_in += other.bytes_in
+        self.encode_s += other.encode_s
+        self.network_s += other.network_s
+        self.decode_s += other.decode_s
+        self.error_messages.extend(other.error_messages)
+
+
+@dataclass
+class _OperationState:
+    totals: _Totals
+    parent: _OperationState | None
+    ended: bool = False
+
+
+@dataclass
+class _PendingRequest:
+    totals: _Totals
+    started_at: float
+    ended_at: float | None
+    function_name: str | None
+    operation: _OperationState | None
+
+
+class SlowOperationObserver(Observer):
+    """
+    An observer logging a single structured record for each operation or
+    request exceeding a duration threshold.
+
+    Each request is checked against `request_threshold_s`. Additionally,
+    methods issuing several requests (`insert_many`, `update_many`,
+    `delete_many`, `distinct`, `bulk_write`, the scan of a find cursor...) are
+    checked, as a whole, against `threshold_s`. A record (see
+    `SlowOperationRecord`) reports the command, the collection or table, the
+    shape of the filter with all values redacted, the number of pages and
+    requests, the bytes sent and received and a breakdown of the duration.
+
+    Records are logged on the `astrapy.event_observers.slow_operations` logger
+    as a JSON string (the record dictionary is also found in the
+    `slow_operation` attribute of the log record), and the last `max_records`
+    slow ones are kept in memory for inspection with `get_records()`.
+
+    A fraction `sample_rate` of the operations and requests below the threshold
+    is logged as well (with `slow` set to False), for a baseline to compare
+    the slow ones to. Sampled records are not kept in memory.
+
+    Operations in progress are tracked through context variables, hence this
+    observer must not be wrapped in a `BackgroundObserver`. The work done for
+    a fast, non-sampled request is a small amount of bookkeeping: notably, the
+    request payload is parsed (to find the filter) only when a record is made.
+
+    Args:
+        threshold_s: the duration, in seconds, above which an operation is slow.
+        request_threshold_s: the duration, in seconds, above which a single
+            request is slow. Defaults to `threshold_s`.
+        sample_rate: the fraction, between 0 and 1, of the operations/requests
+            below the threshold that are logged anyway.
+        max_records: how many of the most recent slow records are kept.
+        log_level: the logging level for the records.
+
+    Example:
+        >>> import logging
+        >>> from astrapy.api_options import APIOptions
+        >>> from astrapy.event_observers import SlowOperationObserver
+        >>> slow_log = SlowOperationObserver(threshold_s=0.5, sample_rate=0.001)
+        >>> observed_collection = my_collection.with_options(
+        ...     api_options=APIOptions(
+        ...         event_observers={"slow": slow_log},
+        ...     ),
+        ... )
+        >>> observed_collection.update_many({"tag": "x"}, {"$set": {"f": 1}})
+        >>> slow_log.get_records()[-1].as_dict()
+        {'kind': 'request', 'name': 'updateMany', ..., 'filter_shape': {'tag': '?'}, ...}
+    """
+
+    event_types = frozenset(
+        {
+            ObservableEventType.REQUEST,
+            ObservableEventType.RESPONSE,
+            ObservableEventType.ERROR,
+        }
+    )
+    needs_body = False
+
+    def __init__(
+        self,
+        threshold_s: float = 1.0,
+        *,
+        request_threshold_s: float | None = None,
+        sample_rate: float = 0.0,
+        max_records: int = 100,
+        log_level: int = logging.WARNING,
+    ) -> None:
+        self.threshold_s = threshold_s
+        self.request_threshold_s = (
+            threshold_s if request_threshold_s is None else request_threshold_s
+        )
+        self.sample_rate = sample_rate
+        self.log_level = log_level
+        self._lock = threading.Lock()
+        self._records: deque[SlowOperationRecord] = deque(maxlen=max_records)
+        self._operations: dict[_OperationScope, _OperationState] = {}
+        self._pending: OrderedDict[str, _PendingRequest] = OrderedDict()
+        # to convert perf_counter readings into epoch-based times
+        self._clock_offset_s = time.time() - time.perf_counter()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(threshold_s={self.threshold_s}, "
+            f"request_threshold_s={self.request_threshold_s}, "
+            f"sample_rate={self.sample_rate})"
+        )
+
+    def _is_recorded(self, duration_s: float, threshold_s: float) -> bool | None:
+        # True: slow; False: sampled; None: not to record
+        if duration_s >= threshold_s:
+            return True
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return False
+        return None
+
+    def _emit(self, record: SlowOperationRecord) -> None:
+        if record.slow:
+            with self._lock:
+                self._records.append(record)
+        if logger.isEnabledFor(self.log_level):
+            record_dict = record.as_dict()
+            logger.log(
+                self.log_level,
+                "%s %s: %s",
+                "Slow" if record.slow else "Sampled",
+                record.kind,
+                json.dumps(record_dict, separators=(",", ":")),
+                extra={"slow_operation": record_dict},
+            )
+
+    def _make_record(
+        self,
+        *,
+        kind: str,
+        name: str,
+        started_at: float,
+        duration_s: float,
+        slow: bool,
+        totals: _Totals,
+        error: str | None,
+        function_name: str | None = None,
+        request_id: str | None = None,
+    ) -> SlowOperationRecord:
+        filter_shape, sort_shape = _payload_shapes(totals.payload)
+        return SlowOperationRecord(
+            kind=kind,
+            name=name,
+            started_at=self._clock_offset_s + started_at,
+            duration_s=duration_s,
+            slow=slow,
+            keyspace=totals.keyspace,
+            target=totals.target,
+            command=totals.command,
+            filter_shape=filter_shape,
+            sort_shape=sort_shape,
+            request_count=totals.request_count,
+            pages=totals.pages,
+            chunks=totals.chunks,
+            bytes_out=totals.bytes_out,
+            bytes_in=totals.bytes_in,
+            encode_s=totals.encode_s,
+            network_s=totals.network_s,
+            decode_s=totals.decode_s,
+            error=error,
+            function_name=function_name,
+            request_id=request_id,
+        )
+
+    def _operation_state(self, scope: _OperationScope) -> _OperationState:
+        # (called with the lock held)
+        operation_state = self._operations.get(scope)
+        if operation_state is not None:
+            return operation_state
+        parent_scope = scope.parent.operation if scope.parent is not None else None
+        operation_state = _OperationState(
+            totals=_Totals(),
+            parent=(
+                self._operation_state(parent_scope)
+                if parent_scope is not None
+                else None
+            ),
+        )
+        if scope.add_end_callback(self._end_operation):
+            self._operations[scope] = operation_state
+        else:
+            operation_state.ended = True
+        return operation_state
+
+    def _end_operation(
+        self, scope: _OperationScope, error: BaseException | None
+    ) -> None:
+        with self._lock:
+            operation_state = self._operations.pop(scope, None)
+            if operation_state is None:
+                return
+            operation_state.ended = True
+            totals = operation_state.totals
+        ended_at = scope.ended_at or time.perf_counter()
+        duration_s = ended_at - scope.started_at
+        is_recorded = self._is_recorded(duration_s, self.threshold_s)
+        if is_recorded is None:
+            return
+        error_message = (
+            f"{type(error).__name__}: {error}"
+            if error is not None
+            else "; ".join(totals.error_messages) or None
+        )
+        self._emit(
+            self._make_record(
+                kind="operation",
+                name=scope.name,
+                started_at=scope.started_at,
+                duration_s=duration_s,
+                slow=is_recorded,
+                totals=totals,
+                error=error_message,
+            )
+        )
+
+    def _end_request(self, request_id: str, error: BaseException | None) -> None:
+        with self._lock:
+            pending = self._pending.pop(request_id, None)
+            if pending is None:
+                return
+            totals = pending.totals
+            if pending.ended_at is not None:
+                ended_at = pending.ended_at + totals.decode_s
+            else:
+                # no response (e.g. a timeout): all the time was spent waiting
+                ended_at = time.perf_counter()
+                totals.network_s = max(
+                    ended_at - pending.started_at - totals.encode_s, 0.0
+                )
+            if error is not None:
+                totals.error_messages.append(f"{type(error).__name__}: {error}")
+            # the totals of all enclosing operations include the request's
+            operation_state = pending.operation
+            while operation_state is not None:
+                if not operation_state.ended:
+                    operation_state.totals.add(totals)
+                operation_state = operation_state.parent
+        duration_s = ended_at - pending.started_at
+        is_recorded = self._is_recorded(duration_s, self.request_threshold_s)
+        if is_recorded is None:
+            return
+        self._emit(
+            self._make_record(
+                kind="request",
+                name=totals.command or pending.function_name or "request",
+                started_at=pending.started_at,
+                duration_s=duration_s,
+                slow=is_recorded,
+                totals=totals,
+                error="; ".join(totals.error_messages) or None,
+                function_name=pending.function_name,
+                request_id=request_id,
+            )
+        )
+
+    def _start_request(
+        self,
+        event: ObservableRequest,
+        sender: Any,
+        function_name: str | None,
+        request_id: str,
+    ) -> None:
+        scope = current_scope()
+        operation_scope = scope.operation if scope is not None else None
+        request_attributes = current_request_attributes()
+        # (collections and tables have a name; databases, only a keyspace)
+        keyspace = getattr(sender, "keyspace", None)
+        target = getattr(sender, "name", None)
+        totals = _Totals(
+            keyspace=keyspace if isinstance(keyspace, str) else None,
+            target=target if isinstance(target, str) else None,
+            command=event.command_name,
+            payload=event.payload,
+            request_count=1,
+            pages=1 if "page_number" in request_attributes else 0,
+            chunks=1 if "chunk_index" in request_attributes else 0,
+            bytes_out=event.payload_size or 0,
+            encode_s=event.encode_duration_s or 0.0,
+        )
+        with self._lock:
+            self._pending[request_id] = _PendingRequest(
+                totals=totals,
+                started_at=(
+                    event.started_at
+                    if event.started_at is not None
+                    else time.perf_counter()
+                ),
+                ended_at=None,
+                function_name=function_name,
+                operation=(
+                    self._operation_state(operation_scope)
+                    if operation_scope is not None
+                    else None
+                ),
+            )
+            if len(self._pending) > PENDING_REQUESTS_MAX_SIZE:
+                self._pending.popitem(last=False)
+        if scope is not None and scope.kind == ScopeKind.REQUEST:
+            # the request ends with the request scope (after the errors, if any)
+            scope.add_end_callback(
+                lambda _scope, error: self._end_request(request_id, error)
+            )
+
+    def receive(
+        self,
+        event: ObservableEvent,
+        sender: Any = None,
+        function_name: str | None = None,
+        request_id: str | None = None,
+    ) -> None:
+        if request_id is None:
+            return
+        if isinstance(event, ObservableRequest):
+            self._start_request(event, sender, function_name, request_id)
+            return
+        finish_now = False
+        with self._lock:
+            pending = self._pending.get(request_id)
+            if pending is None:
+                return
+            totals = pending.totals
+            if isinstance(event, ObservableResponse):
+                pending.ended_at = (
+                    event.ended_at
+                    if event.ended_at is not None
+                    else time.perf_counter()
+                )
+                totals.bytes_in = event.response_size or 0
+                totals.decode_s = event.decode_duration_s or 0.0
+                totals.network_s = max(
+                    pending.ended_at - pending.started_at - totals.encode_s, 0.0
+                )
+                if not 200 <= event.status_code < 300:
+                    totals.error_messages.append(f"HTTP status {event.status_code}")
+                # requests issued outside of the commander scopes end here
+                scope = current_scope()
+                finish_now = scope is None or scope.kind != ScopeKind.REQUEST
+            elif isinstance(event, ObservableError):
+                totals.error_messages.append(
+                    event.error.error_code or event.error.message or "API error"
+                )
+        if finish_now:
+            self._end_request(request_id, None)
+
+    def get_records(self) -> list[SlowOperationRecord]:
+        """
+        Get the most recent slow records, oldest first.
+
+        Returns:
+            a list of SlowOperationRecord objects.
+        """
+
+        with self._lock:
+            return list(self._records)
+
+    def clear(self) -> None:
+        """Discard the slow records kept in memory."""
+
+        with self._lock:
+            self._records.clear()
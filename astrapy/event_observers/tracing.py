@@ -0,0 +1,781 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import logging
+import os
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from astrapy.event_observers.events import (
+    ObservableError,
+    ObservableEvent,
+    ObservableEventType,
+    ObservableRequest,
+    ObservableResponse,
+    ObservableWarning,
+)
+from astrapy.event_observers.observers import Observer
+from astrapy.utils.str_enum import StrEnum
+from astrapy.utils.tracing import (
+    ScopeKind,
+    _OperationScope,
+    current_request_attributes,
+    current_scope,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OTLP_TRACES_ENDPOINT = "http://localhost:4318/v1/traces"
+# prefix for the attributes specific to astrapy
+ATTRIBUTE_PREFIX = "astrapy."
+# requests remembered (in flight) to attach their response to the span
+PENDING_REQUESTS_MAX_SIZE = 10000
+
+# the OTLP enum values for the span kinds and statuses
+_OTLP_SPAN_KINDS = {"internal": 1, "client": 3}
+_OTLP_STATUS_CODES = {"unset": 0, "ok": 1, "error": 2}
+
+
+class SpanKind(StrEnum):
+    """
+    The kinds of span: operations (e.g. an `insert_many` call) are "internal",
+    single HTTP requests are "client".
+    """
+
+    INTERNAL = "internal"
+    CLIENT = "client"
+
+
+class SpanStatus(StrEnum):
+    """
+    The outcome of the work described by a span.
+    """
+
+    UNSET = "unset"
+    OK = "ok"
+    ERROR = "error"
+
+
+@dataclass
+class Span:
+    """
+    A timed unit of work in a trace: an operation such as an `insert_many` call
+    or a cursor scan, or one of its HTTP requests.
+
+    The spans of the requests issued by an operation are children of the span of
+    the operation and share its `trace_id`. Identifiers and times follow the
+    OpenTelemetry conventions.
+
+    Attributes:
+        name: the operation name (e.g. "insert_many") or, for requests, the Data
+            API command (e.g. "insertMany").
+        trace_id: the trace identifier, 32 hexadecimal digits.
+        span_id: the span identifier, 16 hexadecimal digits.
+        parent_span_id: the identifier of the parent span, None for root spans.
+        kind: a value in the SpanKind enum.
+        start_time_ns: the start of the span, in nanoseconds since the epoch.
+        end_time_ns: the end of the span, in nanoseconds since the epoch.
+        attributes: a dictionary of descriptive attributes, such as
+            "astrapy.chunk_index", "astrapy.page_number", "astrapy.command",
+            the request and response sizes, and the encoding and decoding durations.
+        status: a value in the SpanStatus enum.
+        status_message: a description of the error, for failed spans.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    kind: SpanKind
+    start_time_ns: int
+    end_time_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: SpanStatus = SpanStatus.UNSET
+    status_message: str | None = None
+
+    @property
+    def duration_s(self) -> float | None:
+        """The duration of the span in seconds, if it has ended."""
+
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+
+class SpanExporter(ABC):
+    """
+    The destination of the spans collected by a `TracingObserver`.
+
+    The `export` method is called with all spans of a trace when its root
+    operation ends, within the request processing: implementations doing
+    nontrivial work (such as network calls) should defer it.
+    """
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        """
+        Export a group of finished spans.
+
+        Args:
+            spans: the spans to export.
+        """
+        ...
+
+    def flush(self, timeout_s: float | None = None) -> bool:
+        """
+        Wait until the spans exported so far have reached their destination.
+
+        Args:
+            timeout_s: the maximum time to wait, in seconds (None: no limit).
+
+        Returns:
+            True if all spans were delivered, False if the timeout expired.
+        """
+
+        return True
+
+    def shutdown(self) -> None:
+        """Flush the pending spans and release any resources."""
+
+        self.flush()
+
+
+class InMemorySpanExporter(SpanExporter):
+    """
+    A span exporter keeping the exported spans in a list, mostly useful in
+    tests and for interactive inspection of slow operations.
+
+    Example:
+        >>> from astrapy.api_options import APIOptions
+        >>> from astrapy.event_observers import InMemorySpanExporter, TracingObserver
+        >>> exporter = InMemorySpanExporter()
+        >>> traced_collection = my_collection.with_options(
+        ...     api_options=APIOptions(
+        ...         event_observers={"tracing": TracingObserver(exporter)},
+        ...     ),
+        ... )
+        >>> traced_collection.insert_many([{"a": i} for i in range(120)])
+        CollectionInsertManyResult(...)
+        >>> for span in exporter.get_finished_spans():
+        ...     print(span.name, span.attributes.get("astrapy.chunk_index"))
+        ...
+        insert_many None
+        insertMany 0
+        insertMany 1
+        insertMany 2
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spans: list[Span] = []
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self._spans)} spans>)"
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+
+    def get_finished_spans(self) -> list[Span]:
+        """
+        Return the spans exported so far, in order of export.
+        Within a trace, the operation span comes before the spans it contains.
+        """
+
+        with self._lock:
+            return list(self._spans)
+
+    def get_traces(self) -> dict[str, list[Span]]:
+        """Return the spans exported so far, grouped by trace ID."""
+
+        traces: dict[str, list[Span]] = {}
+        for span in self.get_finished_spans():
+            traces.setdefault(span.trace_id, []).append(span)
+        return traces
+
+    def clear(self) -> None:
+        """Discard all spans exported so far."""
+
+        with self._lock:
+            self._spans = []
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, list | tuple):
+        return {"arrayValue": {"values": [_otlp_value(item) for item in value]}}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+class OTLPSpanExporter(SpanExporter):
+    """
+    A span exporter sending the spans to an OpenTelemetry collector (or any
+    compatible backend) with the OTLP/HTTP protocol, JSON encoding.
+
+    Spans are sent in batches by a background (daemon) thread, hence exporting
+    does not slow down the operations. A batch is sent when `max_batch_size`
+    spans are waiting, or every `export_interval_s` seconds. Failed exports are
+    logged and their spans dropped; if more than `max_queue_size` spans are
+    waiting, the new ones are dropped. Spans not sent when the process exits
+    are lost: `flush` (or `shutdown`) waits for their delivery.
+
+    Args:
+        endpoint: the full URL of the OTLP/HTTP traces endpoint.
+        headers: additional HTTP headers for the export requests, e.g. for
+            authentication with the backend.
+        service_name: the "service.name" resource attribute.
+        resource_attributes: additional attributes describing the resource
+            (i.e. the process/application) the spans come from.
+        max_batch_size: the maximum number of spans sent in a single request.
+        max_queue_size: the maximum number of spans waiting to be sent.
+        export_interval_s: the maximum time a span waits before being sent.
+        timeout_s: the timeout for the export requests.
+
+    Example:
+        >>> from astrapy.api_options import APIOptions
+        >>> from astrapy.event_observers import OTLPSpanExporter, TracingObserver
+        >>> tracing_observer = TracingObserver(
+        ...     OTLPSpanExporter(service_name="my-app"),
+        ... )
+        >>> client = DataAPIClient(
+        ...     api_options=APIOptions(
+        ...         event_observers={"tracing": tracing_observer},
+        ...     ),
+        ... )
+    """
+
+    def __init__(
+        self,
+        endpoint: str = DEFAULT_OTLP_TRACES_ENDPOINT,
+        *,
+        headers: dict[str, str] | None = None,
+        service_name: str = "astrapy",
+        resource_attributes: dict[str, Any] | None = None,
+        max_batch_size: int = 512,
+        max_queue_size: int = 8192,
+        export_interval_s: float = 5.0,
+        timeout_s: float = 10.0,
+    ) -> None:
+        self.endpoint = endpoint
+        self.headers = headers or {}
+        self.resource_attributes = {
+            "service.name": service_name,
+            **(resource_attributes or {}),
+        }
+        self.max_batch_size = max_batch_size
+        self.max_queue_size = max_queue_size
+        self.export_interval_s = export_interval_s
+        self.timeout_s = timeout_s
+        self.dropped = 0
+        self._shut_down = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._condition = threading.Condition()
+        self._queue: list[Span] = []
+        # the spans taken from the queue and not yet sent
+        self._sending = 0
+        self._flush_waiters = 0
+        self._thread: threading.Thread | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.endpoint})"
+
+    def encode_spans(self, spans: Sequence[Span]) -> dict[str, Any]:
+        """
+        Encode spans into an OTLP "ExportTraceServiceRequest", in the JSON
+        encoding (i.e. the body of an export request).
+
+        Args:
+            spans: the spans to encode.
+
+        Returns:
+            a JSON-serializable dictionary.
+        """
+
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes(self.resource_attributes),
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "astrapy"},
+                            "spans": [
+                                {
+                                    "traceId": span.trace_id,
+                                    "spanId": span.span_id,
+                                    **(
+                                        {"parentSpanId": span.parent_span_id}
+                                        if span.parent_span_id
+                                        else {}
+                                    ),
+                                    "name": span.name,
+                                    "kind": _OTLP_SPAN_KINDS[span.kind.value],
+                                    "startTimeUnixNano": str(span.start_time_ns),
+                                    "endTimeUnixNano": str(
+                                        span.end_time_ns or span.start_time_ns
+                                    ),
+                                    "attributes": _otlp_attributes(span.attributes),
+                                    "status": {
+                                        "code": _OTLP_STATUS_CODES[span.status.value],
+                                        **(
+                                            {"message": span.status_message}
+                                            if span.status_message
+                                            else {}
+                                        ),
+                                    },
+                                }
+                                for span in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def export(self, spans: Sequence[Span]) -> None:
+        if self._pid != os.getpid():
+            # in a forked child, the thread and the queued spans are gone
+            self._reset()
+        with self._condition:
+            if self._shut_down:
+                return
+            room = self.max_queue_size - len(self._queue)
+            if len(spans) > room:
+                self.dropped += len(spans) - max(room, 0)
+                spans = spans[: max(room, 0)]
+            self._queue.extend(spans)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run_thread,
+                    name=f"astrapy-{self.__class__.__name__}",
+                    daemon=True,
+                )
+                self._thread.start()
+            if len(self._queue) >= self.max_batch_size or self._flush_waiters:
+                self._condition.notify_all()
+
+    def _send(self, batch: list[Span]) -> None:
+        try:
+            response = httpx.post(
+                self.endpoint,
+                json=self.encode_spans(batch),
+                headers=self.headers,
+                timeout=self.timeout_s,
+            )
+            response.raise_for_status()
+        except Exception:
+            logger.exception(f"Error exporting {len(batch)} spans to {self.endpoint}.")
+
+    def _run_thread(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(self._queue) >= self.max_batch_size
+                    or (self._flush_waiters > 0 and bool(self._queue))
+                    or self._shut_down,
+                    timeout=self.export_interval_s,
+                )
+                batch = self._queue[: self.max_batch_size]
+                self._queue = self._queue[self.max_batch_size :]
+                self._sending = len(batch)
+                stopping = self._shut_down and not self._queue
+            if batch:
+                self._send(batch)
+            with self._condition:
+                self._sending = 0
+                self._condition.notify_all()
+                if stopping:
+                    self._thread = None
+                    return
+
+    def flush(self, timeout_s: float | None = None) -> bool:
+        with self._condition:
+            if self._thread is None:
+                return not self._queue
+            # (the waiting spans are sent right away, without waiting for a batch)
+            self._flush_waiters += 1
+            self._condition.notify_all()
+            try:
+                return self._condition.wait_for(
+                    lambda: not self._queue and not self._sending,
+                    timeout=timeout_s,
+                )
+            finally:
+                self._flush_waiters -= 1
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._shut_down = True
+            self._condition.notify_all()
+        self.flush()
+
+
+@dataclass
+class _OperationTrace:
+    # the spans of an operation in progress
+    span: Span
+    parent: _OperationTrace | None
+    children: list[Span] = field(default_factory=list)
+    request_count: int = 0
+    ended: bool = False
+
+
+@dataclass
+class _PendingRequest:
+    span: Span
+    operation: _OperationTrace | None
+
+
+def _new_trace_id() -> str:
+    return f"{random.getrandbits(128):032x}"
+
+
+def _new_span_id() -> str:
+    return f"{random.getrandbits(64):016x}"
+
+
+class TracingObserver(Observer):
+    """
+    An observer building tracing spans out of the request events, linking all
+    the requests issued by an operation together.
+
+    Operations issuing several requests (`insert_many`, `update_many`,
+    `delete_many`, `distinct`, `bulk_write`, the scan of a find cursor...) get
+    a parent span, whose children are the spans of their HTTP requests. Request
+    spans carry the command, the chunk index or page number where applicable,
+    the request/response sizes, the encoding and decoding durations and, if
+    the request failed, the error. Requests not issued within an operation
+    (e.g. by `find_one`) are standalone spans.
+
+    The spans of a trace are handed to the `exporter` when its root operation
+    ends (for a cursor, when its last page is retrieved or when it is closed).
+    Operations in progress are tracked through context variables, hence this
+    observer must not be wrapped in a `BackgroundObserver`: the work done on the
+    request path is a small amount of bookkeeping, while any slow exporting is
+    up to the exporter (`OTLPSpanExporter` sends spans from a background thread).
+
+    Args:
+        exporter: a SpanExporter, for instance an `InMemorySpanExporter` or
+            an `OTLPSpanExporter`.
+
+    Example:
+        >>> from astrapy.api_options import APIOptions
+        >>> from astrapy.event_observers import InMemorySpanExporter, TracingObserver
+        >>> exporter = InMemorySpanExporter()
+        >>> traced_table = my_table.with_options(
+        ...     api_options=APIOptions(
+        ...         event_observers={"tracing": TracingObserver(exporter)},
+        ...     ),
+        ... )
+        >>> rows = traced_table.find({}).to_list()
+        >>> slowest_page = max(
+        ...     (s for s in exporter.get_finished_spans() if s.name == "find"),
+        ...     key=lambda s: s.duration_s,
+        ... )
+        >>> slowest_page.attributes["astrapy.page_number"]
+        3
+    """
+
+    event_types = frozenset(
+        {
+            ObservableEventType.REQUEST,
+            ObservableEventType.RESPONSE,
+            ObservableEventType.ERROR,
+            ObservableEventType.WARNING,
+        }
+    )
+    needs_body = False
+
+    def __init__(self, exporter: SpanExporter) -> None:
+        self.exporter = exporter
+        self._lock = threading.Lock()
+        self._operations: dict[_OperationScope, _OperationTrace] = {}
+        self._pending: OrderedDict[str, _PendingRequest] = OrderedDict()
+        # to convert perf_counter readings into epoch-based times
+        self._clock_offset_ns = time.time_ns() - time.perf_counter_ns()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.exporter})"
+
+    def _to_time_ns(self, perf_counter_s: float) -> int:
+        return self._clock_offset_ns + int(perf_counter_s * 1e9)
+
+    def _operation_trace(self, scope: _OperationScope) -> _OperationTrace:
+        # (called with the lock held)
+        operation_trace = self._operations.get(scope)
+        if operation_trace is not None:
+            return operation_trace
+        parent_scope = scope.parent.operation if scope.parent is not None else None
+        parent_trace = (
+            self._operation_trace(parent_scope) if parent_scope is not None else None
+        )
+        operation_trace = _OperationTrace(
+            span=Span(
+                name=scope.name,
+                trace_id=(
+                    parent_trace.span.trace_id
+                    if parent_trace is not None
+                    else _new_trace_id()
+                ),
+                span_id=_new_span_id(),
+                parent_span_id=(
+                    parent_trace.span.span_id if parent_trace is not None else None
+                ),
+                kind=SpanKind.INTERNAL,
+                start_time_ns=self._to_time_ns(scope.started_at),
+                attributes={
+                    f"{ATTRIBUTE_PREFIX}{key}": value
+                    for key, value in scope.attributes.items()
+                },
+            ),
+            parent=parent_trace,
+        )
+        if scope.add_end_callback(self._end_operation):
+            self._operations[scope] = operation_trace
+        else:
+            # (too late to collect the operation: its requests are standalone)
+            operation_trace.ended = True
+        return operation_trace
+
+    def _export(self, spans: list[Span]) -> None:
+        try:
+            self.exporter.export(spans)
+        except Exception:
+            logger.exception("Error in the export of tracing spans.")
+
+    def _end_operation(
+        self, scope: _OperationScope, error: BaseException | None
+    ) -> None:
+        with self._lock:
+            operation_trace = self._operations.pop(scope, None)
+            if operation_trace is None:
+                return
+            operation_trace.ended = True
+            span = operation_trace.span
+            span.end_time_ns = self._to_time_ns(scope.ended_at or time.perf_counter())
+            span.attributes[f"{ATTRIBUTE_PREFIX}request_count"] = (
+                operation_trace.request_count
+            )
+            if error is not None:
+                span.status = SpanStatus.ERROR
+                span.status_message = f"{type(error).__name__}: {error}"
+            else:
+                span.status = SpanStatus.OK
+            for child in operation_trace.children:
+                if child.end_time_ns is None:
+                    # a request never completed (its scope, if any, is left behind)
+                    child.end_time_ns = span.end_time_ns
+                    child.status = SpanStatus.ERROR
+                    child.status_message = "No response received."
+                    self._pending.pop(
+                        child.attributes.get(f"{ATTRIBUTE_PREFIX}request_id", ""), None
+                    )
+            spans = [span] + operation_trace.children
+            parent_trace = operation_trace.parent
+            if parent_trace is not None and not parent_trace.ended:
+                parent_trace.children.extend(spans)
+                return
+        self._export(spans)
+
+    def _end_request(self, request_id: str, error: BaseException | None) -> None:
+        with self._lock:
+            pending = self._pending.pop(request_id, None)
+            if pending is None:
+                return
+            span = pending.span
+            if span.end_time_ns is None:
+                span.end_time_ns = self._to_time_ns(time.perf_counter())
+            if error is not None:
+                span.status = SpanStatus.ERROR
+                span.status_message = f"{type(error).__name__}: {error}"
+            elif span.status == SpanStatus.UNSET:
+                span.status = SpanStatus.OK
+            if pending.operation is not None and not pending.operation.ended:
+                return
+        self._export([span])
+
+    def _start_request(
+        self,
+        event: ObservableRequest,
+        sender: Any,
+        function_name: str | None,
+        request_id: str,
+    ) -> None:
+        scope = current_scope()
+        operation_scope = scope.operation if scope is not None else None
+        attributes: dict[str, Any] = {
+            f"{ATTRIBUTE_PREFIX}request_id": request_id,
+            f"{ATTRIBUTE_PREFIX}function_name": function_name,
+            f"{ATTRIBUTE_PREFIX}command": event.command_name,
+            "http.request.method": event.http_method,
+            "url.full": event.url,
+            f"{ATTRIBUTE_PREFIX}encode_duration_s": event.encode_duration_s,
+            f"{ATTRIBUTE_PREFIX}payload_size": event.payload_size,
+        }
+        # (collections and tables have a name; databases, only a keyspace)
+        keyspace = getattr(sender, "keyspace", None)
+        target = getattr(sender, "name", None)
+        if isinstance(keyspace, str):
+            attributes[f"{ATTRIBUTE_PREFIX}keyspace"] = keyspace
+        if isinstance(target, str):
+            attributes[f"{ATTRIBUTE_PREFIX}target"] = target
+        for key, value in current_request_attributes().items():
+            attributes[f"{ATTRIBUTE_PREFIX}{key}"] = value
+        with self._lock:
+            operation_trace = (
+                self._operation_trace(operation_scope)
+                if operation_scope is not None
+                else None
+            )
+            span = Span(
+                name=event.command_name or function_name or event.http_method,
+                trace_id=(
+                    operation_trace.span.trace_id
+                    if operation_trace is not None
+                    else _new_trace_id()
+                ),
+                span_id=_new_span_id(),
+                parent_span_id=(
+                    operation_trace.span.span_id
+                    if operation_trace is not None
+                    else None
+                ),
+                kind=SpanKind.CLIENT,
+                start_time_ns=self._to_time_ns(
+                    event.started_at
+                    if event.started_at is not None
+                    else time.perf_counter()
+                ),
+                attributes={k: v for k, v in attributes.items() if v is not None},
+            )
+            if operation_trace is not None:
+                operation_trace.children.append(span)
+                operation_trace.request_count += 1
+            self._pending[request_id] = _PendingRequest(span, operation_trace)
+            if len(self._pending) > PENDING_REQUESTS_MAX_SIZE:
+                self._pending.popitem(last=False)
+        if scope is not None and scope.kind == ScopeKind.REQUEST:
+            # the request span ends with the request scope (after the errors, if any)
+            scope.add_end_callback(
+                lambda _scope, error: self._end_request(request_id, error)
+            )
+
+    def receive(
+        self,
+        event: ObservableEvent,
+        sender: Any = None,
+        function_name: str | None = None,
+        request_id: str | None = None,
+    ) -> None:
+        if request_id is None:
+            return
+        if isinstance(event, ObservableRequest):
+            self._start_request(event, sender, function_name, request_id)
+            return
+        finish_now = False
+        with self._lock:
+            pending = self._pending.get(request_id)
+            if pending is None:
+                return
+            span = pending.span
+            if isinstance(event, ObservableResponse):
+                ended_at = (
+                    event.ended_at
+                    if event.ended_at is not None
+                    else time.perf_counter()
+                )
+                span.end_time_ns = self._to_time_ns(
+                    ended_at + (event.decode_duration_s or 0.0)
+                )
+                span.attributes.update(
+                    {
+                        k: v
+                        for k, v in {
+                            "http.response.status_code": event.status_code,
+                            f"{ATTRIBUTE_PREFIX}decode_duration_s": (
+                                event.decode_duration_s
+                            ),
+                            f"{ATTRIBUTE_PREFIX}response_size": event.response_size,
+                        }.items()
+                        if v is not None
+                    }
+                )
+                if not 200 <= event.status_code < 300:
+                    span.status = SpanStatus.ERROR
+                    span.status_message = f"HTTP status {event.status_code}"
+                # requests issued outside of the commander scopes end here
+                scope = current_scope()
+                finish_now = scope is None or scope.kind != ScopeKind.REQUEST
+            elif isinstance(event, ObservableError):
+                error_codes = span.attributes.setdefault(
+                    f"{ATTRIBUTE_PREFIX}error_codes", []
+                )
+                error_codes.append(event.error.error_code or "")
+                span.status = SpanStatus.ERROR
+                span.status_message = (
+                    event.error.message or event.error.error_code or "API error"
+                )
+            elif isinstance(event, ObservableWarning):
+                warning_codes = span.attributes.setdefault(
+                    f"{ATTRIBUTE_PREFIX}warning_codes", []
+                )
+                warning_codes.append(event.warning.error_code or "")
+        if finish_now:
+            self._end_request(request_id, None)
+
+    def flush(self, timeout_s: float | None = None) -> bool:
+        """
+        Flush the exporter (see `SpanExporter.flush`). Operations still
+        in progress are not exported.
+
+        Args:
+            timeout_s: the maximum time to wait, in seconds (None: no limit).
+
+        Returns:
+            True if all exported spans were delivered, False otherwise.
+        """
+
+        return self.exporter.flush(timeout_s=timeout_s)
+
+    def shutdown(self) -> None:
+        """Shut the exporter down (see `SpanExporter.shutdown`)."""
+
+        self.exporter.shutdown()
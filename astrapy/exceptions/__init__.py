@@ -20,6 +20,7 @@ from dataclasses import dataclass
 import httpx
 
 from astrapy.exceptions.collection_exceptions import (
+    CollectionBulkWriteException,
     CollectionDeleteManyException,
     CollectionInsertManyException,
     CollectionUpdateManyException,
@@ -46,7 +47,9 @@ from astrapy.exceptions.error_descriptors import (
     DataAPIWarningDescriptor,
 )
 from astrapy.exceptions.table_exceptions import (
+    TableBulkWriteException,
     TableInsertManyException,
+    TableUpdateManyException,
     TooManyRowsToCountException,
 )
 
@@ -325,9 +328,12 @@ __all__ = [
     "CollectionInsertManyException",
     "CollectionDeleteManyException",
     "CollectionUpdateManyException",
+    "CollectionBulkWriteException",
     "MultiCallTimeoutManager",
     "TooManyRowsToCountException",
     "TableInsertManyException",
+    "TableUpdateManyException",
+    "TableBulkWriteException",
 ]
 
 __pdoc__ = {
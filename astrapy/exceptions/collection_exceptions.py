@@ -22,6 +22,7 @@ from astrapy.exceptions.data_api_exceptions import DataAPIException
 
 if TYPE_CHECKING:
     from astrapy.results import (
+        CollectionBulkWriteResult,
         CollectionDeleteResult,
         CollectionUpdateResult,
     )
@@ -130,3 +131,34 @@ class CollectionUpdateManyException(DataAPIException):
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}({self.cause.__str__()})"
+
+
+@dataclass
+class CollectionBulkWriteException(DataAPIException):
+    """
+    An exception occurring during a bulk_write on a collection. As with
+    insert_many, it represents both the root error(s) that happened and
+    information on the portion of the operations that succeeded.
+
+    Attributes:
+        partial_result: a CollectionBulkWriteResult object, just like the one
+            that would be the return value of the operation, had it succeeded
+            completely: it accounts for the successful operations.
+        exceptions: a list of the root exceptions leading to this error. The list,
+            under normal circumstances, is not empty.
+        operation_errors: a map from the index of each failed operation (in the
+            list of operations to the bulk_write) to its root exception.
+    """
+
+    partial_result: CollectionBulkWriteResult
+    exceptions: Sequence[Exception]
+    operation_errors: dict[int, Exception]
+
+    def __str__(self) -> str:
+        exc_desc = ", ".join(exc.__str__() for exc in self.exceptions[:8])
+        if len(self.exceptions) > 8:
+            exc_desc += " ... (more exceptions)"
+        return (
+            f"{self.__class__.__name__}({exc_desc} "
+            f"[with {len(self.operation_errors)} failed operations])"
+        )
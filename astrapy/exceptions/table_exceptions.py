@@ -16,10 +16,13 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from astrapy.exceptions.data_api_exceptions import DataAPIException
 
+if TYPE_CHECKING:
+    from astrapy.results import TableBulkWriteResult, TableUpdateManyResult
+
 
 @dataclass
 class TooManyRowsToCountException(DataAPIException):
@@ -82,3 +85,56 @@ class TableInsertManyException(DataAPIException):
             )
         else:
             return f"{self.__class__.__name__}()"
+
+
+@dataclass
+class TableUpdateManyException(DataAPIException):
+    """
+    An exception occurring during an update_many on a table (an operation that
+    spans a primary-key scan and many `updateOne` requests), which stopped the
+    scan: as such, besides information on the root-cause error, there is
+    a partial result about the rows processed until then.
+
+    Attributes:
+        partial_result: a TableUpdateManyResult object, just like the one that would
+            be the return value of the operation, had it succeeded completely.
+        cause: a root exception that happened during the update_many, causing
+            the method call to stop and raise this error.
+    """
+
+    partial_result: TableUpdateManyResult
+    cause: Exception
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.cause.__str__()})"
+
+
+@dataclass
+class TableBulkWriteException(DataAPIException):
+    """
+    An exception occurring during a bulk_write on a table. As with
+    insert_many, it represents both the root error(s) that happened and
+    information on the portion of the operations that succeeded.
+
+    Attributes:
+        partial_result: a TableBulkWriteResult object, just like the one
+            that would be the return value of the operation, had it succeeded
+            completely: it accounts for the successful operations.
+        exceptions: a list of the root exceptions leading to this error. The list,
+            under normal circumstances, is not empty.
+        operation_errors: a map from the index of each failed operation (in the
+            list of operations to the bulk_write) to its root exception.
+    """
+
+    partial_result: TableBulkWriteResult
+    exceptions: Sequence[Exception]
+    operation_errors: dict[int, Exception]
+
+    def __str__(self) -> str:
+        exc_desc = ", ".join(exc.__str__() for exc in self.exceptions[:8])
+        if len(self.exceptions) > 8:
+            exc_desc += " ... (more exceptions)"
+        return (
+            f"{self.__class__.__name__}({exc_desc} "
+            f"[with {len(self.operation_errors)} failed operations])"
+        )
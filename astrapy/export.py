@@ -0,0 +1,824 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The `astrapy-export` command-line tool: bulk export of a collection or a table
+to a directory of NDJSON (optionally compressed) or Parquet files.
+
+The export machinery is also available programmatically through `run_export`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import bz2
+import glob
+import gzip
+import json
+import logging
+import lzma
+import os
+import queue
+import re
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import IO, Any, TextIO
+
+from astrapy import Collection, Table
+from astrapy.data.cursors.checkpoint import CursorCheckpoint
+from astrapy.data.utils.table_columnar import _import_pyarrow, _TableColumnarBuilder
+from astrapy.utils.cli_tools import (
+    ProgressReporter,
+    add_connection_arguments,
+    configure_logging,
+    database_from_arguments,
+    json_encoder_for,
+    parse_json_argument,
+)
+from astrapy.utils.file_utils import _atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMAT_NDJSON = "ndjson"
+EXPORT_FORMAT_PARQUET = "parquet"
+EXPORT_FORMATS = {EXPORT_FORMAT_NDJSON, EXPORT_FORMAT_PARQUET}
+EXPORT_COMPRESSIONS: dict[str, tuple[Callable[[IO[bytes]], Any] | None, str]] = {
+    "none": (None, ""),
+    "gzip": (lambda fileobj: gzip.GzipFile(fileobj=fileobj, mode="wb"), ".gz"),
+    "bz2": (lambda fileobj: bz2.BZ2File(fileobj, mode="wb"), ".bz2"),
+    "xz": (lambda fileobj: lzma.LZMAFile(fileobj, mode="wb"), ".xz"),
+}
+EXPORT_STATE_DIRECTORY = "_export_state"
+EXPORT_MANIFEST_FILE = "manifest.json"
+COLLECTION_PARQUET_COLUMN = "document"
+# How long a thread blocked on a page queue waits before checking for aborts
+QUEUE_POLL_INTERVAL_S = 0.1
+
+
+class ExportAbortedException(Exception):
+    """An export segment was interrupted because another segment failed."""
+
+    pass
+
+
+@dataclass
+class ExportStats:
+    """
+    Running counters for an export, safe to update from several threads.
+
+    Attributes:
+        rows: number of rows/documents written by this run.
+        pages: number of pages retrieved (and written) by this run.
+        bytes_written: amount of (uncompressed) data written by this run.
+        resumed_rows: number of rows/documents already written by previous runs,
+            as found in the checkpoints the export was resumed from.
+        start_time: the `time.monotonic()` value at the start of the export.
+    """
+
+    rows: int = 0
+    pages: int = 0
+    bytes_written: int = 0
+    resumed_rows: int = 0
+    start_time: float = field(default_factory=time.monotonic)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add_page(self, rows: int, bytes_written: int) -> None:
+        with self._lock:
+            self.rows += rows
+            self.pages += 1
+            self.bytes_written += bytes_written
+
+    def add_resumed_rows(self, rows: int) -> None:
+        with self._lock:
+            self.resumed_rows += rows
+
+    @property
+    def elapsed_s(self) -> float:
+        return time.monotonic() - self.start_time
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / max(self.elapsed_s, 1e-9)
+
+    def summary(self) -> str:
+        elapsed_s = self.elapsed_s
+        mb_per_second = self.bytes_written / max(elapsed_s, 1e-9) / 1_000_000
+        resumed_desc = (
+            f" (plus {self.resumed_rows} from previous runs)"
+            if self.resumed_rows
+            else ""
+        )
+        return (
+            f"{self.rows} rows{resumed_desc}, {self.pages} pages, "
+            f"{self.bytes_written / 1_000_000:.2f} MB in {elapsed_s:.1f} s: "
+            f"{self.rows_per_second:.0f} rows/s, {mb_per_second:.2f} MB/s"
+        )
+
+
+class _PartWriter(ABC):
+    """Writes the pages of one export segment. Positions mark durable points."""
+
+    @abstractmethod
+    def write_page(
+        self,
+        raw_documents: list[dict[str, Any]],
+        projection_schema: dict[str, Any] | None,
+    ) -> int:
+        """Write a page, returning the amount of (uncompressed) bytes written."""
+        ...
+
+    @abstractmethod
+    def commit(self) -> int:
+        """Make all written pages durable and return the position marker."""
+        ...
+
+    def close(self) -> int:
+        return self.commit()
+
+
+class _NDJSONPartWriter(_PartWriter):
+    """
+    Writes one JSON document per line to a file, optionally compressed.
+    The position is the file size: every commit terminates the current compressed
+    stream, so that the file can be safely truncated at any committed position
+    (decompressors read concatenated streams transparently).
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        compressor: Callable[[IO[bytes]], Any] | None,
+        encoder: Callable[[dict[str, Any]], str],
+        position: int,
+    ) -> None:
+        self.path = path
+        self.compressor = compressor
+        self.encoder = encoder
+        self.raw_file = open(path, "r+b" if os.path.exists(path) else "wb")
+        self.raw_file.truncate(position)
+        self.raw_file.seek(position)
+        self.stream: Any = None
+
+    def write_page(
+        self,
+        raw_documents: list[dict[str, Any]],
+        projection_schema: dict[str, Any] | None,
+    ) -> int:
+        if self.stream is None:
+            if self.compressor is None:
+                self.stream = self.raw_file
+            else:
+                self.stream = self.compressor(self.raw_file)
+        chunk = "".join(
+            f"{self.encoder(document)}\n" for document in raw_documents
+        ).encode("utf-8")
+        self.stream.write(chunk)
+        return len(chunk)
+
+    def commit(self) -> int:
+        if self.stream is not None and self.stream is not self.raw_file:
+            self.stream.close()
+        self.stream = None
+        self.raw_file.flush()
+        os.fsync(self.raw_file.fileno())
+        return self.raw_file.tell()
+
+    def close(self) -> int:
+        position = self.commit()
+        self.raw_file.close()
+        return position
+
+
+class _ParquetPartWriter(_PartWriter):
+    """
+    Writes the pages to a sequence of Parquet files ("chunks"), a new one being
+    started at each commit. The position is the index of the next chunk.
+    """
+
+    def __init__(
+        self,
+        *,
+        path_template: str,
+        batch_builder: Callable[[list[dict[str, Any]], dict[str, Any] | None], Any],
+        position: int,
+    ) -> None:
+        self.pq = _import_pyarrow().parquet
+        self.path_template = path_template
+        self.batch_builder = batch_builder
+        self.chunk_index = position
+        self.chunk_path: str | None = None
+        self.writer: Any = None
+        # discard any chunk written after the last commit of a previous run
+        chunk_pattern = re.compile(r"-(\d+)\.parquet$")
+        for chunk_path in glob.glob(path_template.replace("{chunk:06d}", "*")):
+            chunk_match = chunk_pattern.search(chunk_path)
+            if chunk_match and int(chunk_match.group(1)) >= position:
+                os.remove(chunk_path)
+
+    def write_page(
+        self,
+        raw_documents: list[dict[str, Any]],
+        projection_schema: dict[str, Any] | None,
+    ) -> int:
+        if not raw_documents:
+            return 0
+        batch = self.batch_builder(raw_documents, projection_schema)
+        if self.writer is None:
+            self.chunk_path = self.path_template.format(chunk=self.chunk_index)
+            self.writer = self.pq.ParquetWriter(self.chunk_path, batch.schema)
+        self.writer.write_batch(batch)
+        return int(batch.nbytes)
+
+    def commit(self) -> int:
+        if self.writer is not None:
+            self.writer.close()
+            assert self.chunk_path is not None
+            with open(self.chunk_path, "rb") as chunk_file:
+                os.fsync(chunk_file.fileno())
+            self.writer = None
+            self.chunk_index += 1
+        return self.chunk_index
+
+
+@dataclass
+class _SegmentState:
+    checkpoint: CursorCheckpoint
+    position: int
+    rows: int
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "checkpoint": self.checkpoint.to_json(),
+                "position": self.position,
+                "rows": self.rows,
+            }
+        )
+
+    @staticmethod
+    def from_json(json_string: str) -> _SegmentState:
+        raw_dict = json.loads(json_string)
+        return _SegmentState(
+            checkpoint=CursorCheckpoint.from_json(raw_dict["checkpoint"]),
+            position=raw_dict["position"],
+            rows=raw_dict["rows"],
+        )
+
+
+def _merge_filters(
+    base_filter: dict[str, Any] | None,
+    segment_filter: dict[str, Any] | None,
+) -> dict[str, Any] | None:
+    if not base_filter:
+        return segment_filter
+    if not segment_filter:
+        return base_filter
+    if set(base_filter.keys()) & set(segment_filter.keys()):
+        return {"$and": [base_filter, segment_filter]}
+    return {**base_filter, **segment_filter}
+
+
+class _Prefetcher:
+    """
+    Fetch the raw pages of a cursor in a background thread, keeping up to
+    `prefetch` pages ready in a queue while the previous ones are being written.
+    Each page comes with the checkpoint of the cursor right after it.
+    """
+
+    _END = object()
+
+    def __init__(
+        self,
+        *,
+        cursor: Any,
+        prefetch: int,
+        abort_event: threading.Event,
+    ) -> None:
+        self.cursor = cursor
+        self.abort_event = abort_event
+        self.stop_event = threading.Event()
+        self.page_queue: queue.Queue[Any] = queue.Queue(maxsize=max(prefetch, 1))
+        self.thread = threading.Thread(target=self._produce, daemon=True)
+
+    def _fetch(self) -> Any:
+        raw_page = self.cursor._fetch_next_raw_page()
+        if raw_page is None:
+            return self._END
+        if isinstance(raw_page, tuple):
+            raw_documents, projection_schema = raw_page
+        else:
+            raw_documents, projection_schema = raw_page, None
+        return (raw_documents, projection_schema, self.cursor.checkpoint())
+
+    def _put(self, item: Any) -> bool:
+        while not (self.stop_event.is_set() or self.abort_event.is_set()):
+            try:
+                self.page_queue.put(item, timeout=QUEUE_POLL_INTERVAL_S)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        try:
+            while True:
+                item = self._fetch()
+                if not self._put(item) or item is self._END:
+                    return
+        except BaseException as exc:
+            self._put(exc)
+
+    def __iter__(
+        self,
+    ) -> Iterator[tuple[list[dict[str, Any]], dict[str, Any] | None, CursorCheckpoint]]:
+        self.thread.start()
+        try:
+            while True:
+                try:
+                    item = self.page_queue.get(timeout=QUEUE_POLL_INTERVAL_S)
+                except queue.Empty:
+                    if self.abort_event.is_set():
+                        raise ExportAbortedException()
+                    continue
+                if item is self._END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            self.stop_event.set()
+            self.thread.join()
+
+
+class _SegmentExport:
+    """The export of a single segment (i.e. one find cursor) to its part files."""
+
+    def __init__(
+        self,
+        *,
+        index: int,
+        source: Collection[Any] | Table[Any],
+        filter: dict[str, Any] | None,
+        projection: dict[str, Any] | None,
+        output_dir: str,
+        format: str,
+        compression: str,
+        checkpoint_every: int,
+        prefetch: int,
+        resume: bool,
+        request_timeout_ms: int | None,
+        stats: ExportStats,
+        abort_event: threading.Event,
+    ) -> None:
+        self.index = index
+        self.source = source
+        self.filter = filter
+        self.projection = projection
+        self.output_dir = output_dir
+        self.format = format
+        self.compression = compression
+        self.checkpoint_every = checkpoint_every
+        self.prefetch = prefetch
+        self.resume = resume
+        self.request_timeout_ms = request_timeout_ms
+        self.stats = stats
+        self.abort_event = abort_event
+        self.state_path = os.path.join(
+            output_dir, EXPORT_STATE_DIRECTORY, f"part-{index:04d}.json"
+        )
+
+    def _load_state(self) -> _SegmentState | None:
+        if not os.path.exists(self.state_path):
+            return None
+        with open(self.state_path, encoding="utf-8") as i_file:
+            return _SegmentState.from_json(i_file.read())
+
+    def _make_writer(self, position: int) -> _PartWriter:
+        encoder = json_encoder_for(self.source)
+        if self.format == EXPORT_FORMAT_NDJSON:
+            compressor, extension = EXPORT_COMPRESSIONS[self.compression]
+            return _NDJSONPartWriter(
+                path=os.path.join(
+                    self.output_dir, f"part-{self.index:04d}.ndjson{extension}"
+                ),
+                compressor=compressor,
+                encoder=encoder,
+                position=position,
+            )
+        pa = _import_pyarrow()
+        import pyarrow.parquet  # noqa: F401
+
+        batch_builder: Callable[[list[dict[str, Any]], dict[str, Any] | None], Any]
+        if isinstance(self.source, Table):
+            builders: dict[str, _TableColumnarBuilder] = {}
+            serdes_options = self.source.api_options.serdes_options
+
+            def batch_builder(
+                raw_rows: list[dict[str, Any]],
+                projection_schema: dict[str, Any] | None,
+            ) -> Any:
+                schema_key = json.dumps(projection_schema, sort_keys=True, default=str)
+                if schema_key not in builders:
+                    builders[schema_key] = _TableColumnarBuilder(
+                        columns_dict=projection_schema or {},
+                        similarity_pseudocolumn=None,
+                        options=serdes_options,
+                    )
+                return builders[schema_key].to_arrow(raw_rows)
+
+        else:
+
+            def batch_builder(
+                raw_documents: list[dict[str, Any]],
+                projection_schema: dict[str, Any] | None,
+            ) -> Any:
+                return pa.RecordBatch.from_arrays(
+                    [pa.array([encoder(doc) for doc in raw_documents], pa.string())],
+                    names=[COLLECTION_PARQUET_COLUMN],
+                )
+
+        return _ParquetPartWriter(
+            path_template=os.path.join(
+                self.output_dir, f"part-{self.index:04d}-{{chunk:06d}}.parquet"
+            ),
+            batch_builder=batch_builder,
+            position=position,
+        )
+
+    def _iterate_pages(
+        self, cursor: Any
+    ) -> Iterator[tuple[list[dict[str, Any]], dict[str, Any] | None, CursorCheckpoint]]:
+        if self.prefetch > 0:
+            yield from _Prefetcher(
+                cursor=cursor,
+                prefetch=self.prefetch,
+                abort_event=self.abort_event,
+            )
+            return
+        while True:
+            if self.abort_event.is_set():
+                raise ExportAbortedException()
+            raw_page = cursor._fetch_next_raw_page()
+            if raw_page is None:
+                return
+            if isinstance(raw_page, tuple):
+                yield (raw_page[0], raw_page[1], cursor.checkpoint())
+            else:
+                yield (raw_page, None, cursor.checkpoint())
+
+    def run(self) -> None:
+        state = self._load_state() if self.resume else None
+        if state is not None:
+            self.stats.add_resumed_rows(state.rows)
+            if state.checkpoint.exhausted:
+                logger.info(f"export segment {self.index}: already complete")
+                return
+            logger.info(f"export segment {self.index}: resuming from checkpoint")
+            cursor = state.checkpoint.resume(self.source)
+            position, rows = state.position, state.rows
+        else:
+            cursor = self.source.find(
+                self.filter,
+                projection=self.projection,
+                request_timeout_ms=self.request_timeout_ms,
+            )
+            position, rows = 0, 0
+        writer = self._make_writer(position)
+        try:
+            pages_since_commit = 0
+            for raw_documents, projection_schema, checkpoint in self._iterate_pages(
+                cursor
+            ):
+                bytes_written = writer.write_page(raw_documents, projection_schema)
+                rows += len(raw_documents)
+                self.stats.add_page(len(raw_documents), bytes_written)
+                pages_since_commit += 1
+                if pages_since_commit >= self.checkpoint_every or checkpoint.exhausted:
+                    position = writer.commit()
+                    _atomic_write_text(
+                        self.state_path,
+                        _SegmentState(
+                            checkpoint=checkpoint,
+                            position=position,
+                            rows=rows,
+                        ).to_json(),
+                    )
+                    pages_since_commit = 0
+        finally:
+            writer.close()
+        logger.info(f"export segment {self.index}: complete ({rows} rows)")
+
+
+def _manifest_for(
+    source: Collection[Any] | Table[Any],
+    *,
+    format: str,
+    compression: str,
+    segment_count: int,
+) -> dict[str, Any]:
+    return {
+        "sourceType": "table" if isinstance(source, Table) else "collection",
+        "keyspace": source.keyspace,
+        "sourceName": source.name,
+        "format": format,
+        "compression": compression,
+        "segments": segment_count,
+    }
+
+
+def run_export(
+    source: Collection[Any] | Table[Any],
+    *,
+    output_dir: str,
+    format: str = EXPORT_FORMAT_NDJSON,
+    compression: str = "none",
+    filter: dict[str, Any] | None = None,
+    projection: dict[str, Any] | None = None,
+    segments: list[dict[str, Any]] | None = None,
+    parallelism: int = 4,
+    prefetch: int = 2,
+    checkpoint_every: int = 10,
+    resume: bool = False,
+    request_timeout_ms: int | None = None,
+    progress_interval_s: float | None = None,
+    progress_stream: TextIO | None = None,
+) -> ExportStats:
+    """
+    Export all documents/rows of a collection/table, matching an optional filter,
+    to a directory of part files (one or more per segment).
+
+    Each segment is scanned by its own find cursor; segments are processed in
+    parallel, and each one prefetches pages in the background while writing the
+    previous ones. The progress of each segment is periodically checkpointed, so
+    that an interrupted export can be resumed without re-scanning what is done.
+
+    Args:
+        source: a (sync) Collection or Table.
+        output_dir: the target directory. It is created if it does not exist.
+            Unless resuming, it must not contain the state of another export.
+        format: "ndjson" (one JSON document per line, in the Data API
+            JSON representation) or "parquet" (requires pyarrow; for tables,
+            a column per table column; for collections, a single "document"
+            column with the JSON representation of the documents).
+        compression: for NDJSON only, one of "none", "gzip", "bz2", "xz".
+        filter: a filter applied to all segments.
+        projection: a projection, evaluated on the Data API side.
+        segments: a list of filters, each defining a segment of the data. These
+            should be non-overlapping and cover the data of interest.
+            If omitted, the whole export is a single segment.
+        parallelism: the maximum number of segments processed concurrently.
+        prefetch: the number of pages each segment fetches ahead of writing.
+            Zero disables background prefetching.
+        checkpoint_every: a checkpoint is saved every this many pages.
+        resume: if True, resume an interrupted export found in `output_dir`.
+        request_timeout_ms: a timeout, in milliseconds, for each page request.
+        progress_interval_s: if provided, periodically write a progress line
+            every this many seconds to `progress_stream` (default: stderr).
+        progress_stream: the stream for progress lines.
+
+    Returns:
+        an ExportStats object with the counters for the export.
+    """
+
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: '{format}'.")
+    if compression not in EXPORT_COMPRESSIONS:
+        raise ValueError(f"Unsupported compression: '{compression}'.")
+    if format != EXPORT_FORMAT_NDJSON and compression != "none":
+        raise ValueError("Compression can be specified only for the NDJSON format.")
+    if format == EXPORT_FORMAT_PARQUET:
+        _import_pyarrow()
+    if parallelism < 1 or checkpoint_every < 1 or prefetch < 0:
+        raise ValueError(
+            "Parameters parallelism and checkpoint_every must be positive, "
+            "prefetch must be non-negative."
+        )
+    segment_filters: list[dict[str, Any] | None] = [
+        _merge_filters(filter, segment_filter) for segment_filter in (segments or [{}])
+    ]
+
+    state_dir = os.path.join(output_dir, EXPORT_STATE_DIRECTORY)
+    manifest_path = os.path.join(state_dir, EXPORT_MANIFEST_FILE)
+    manifest = _manifest_for(
+        source,
+        format=format,
+        compression=compression,
+        segment_count=len(segment_filters),
+    )
+    if os.path.exists(manifest_path):
+        if not resume:
+            raise ValueError(
+                f"Directory '{output_dir}' contains a previous export: "
+                "resume it or choose another directory."
+            )
+        with open(manifest_path, encoding="utf-8") as i_file:
+            found_manifest = json.load(i_file)
+        if found_manifest != manifest:
+            raise ValueError(
+                f"The export found in '{output_dir}' has different settings "
+                f"({found_manifest}) and cannot be resumed with {manifest}."
+            )
+    else:
+        os.makedirs(state_dir, exist_ok=True)
+        _atomic_write_text(manifest_path, json.dumps(manifest))
+
+    stats = ExportStats()
+    abort_event = threading.Event()
+
+    segment_exports = [
+        _SegmentExport(
+            index=segment_index,
+            source=source,
+            filter=segment_filter,
+            projection=projection,
+            output_dir=output_dir,
+            format=format,
+            compression=compression,
+            checkpoint_every=checkpoint_every,
+            prefetch=prefetch,
+            resume=resume,
+            request_timeout_ms=request_timeout_ms,
+            stats=stats,
+            abort_event=abort_event,
+        )
+        for segment_index, segment_filter in enumerate(segment_filters)
+    ]
+
+    def _run_segment(segment_export: _SegmentExport) -> None:
+        try:
+            segment_export.run()
+        except BaseException:
+            abort_event.set()
+            raise
+
+    with ProgressReporter(
+        prefix="astrapy-export",
+        summary=stats.summary,
+        interval_s=progress_interval_s,
+        stream=progress_stream,
+    ):
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            futures = [
+                executor.submit(_run_segment, segment_export)
+                for segment_export in segment_exports
+            ]
+            errors = [
+                exc
+                for exc in (future.exception() for future in futures)
+                if exc is not None
+            ]
+    # report the root cause rather than the consequent aborts
+    root_errors = [exc for exc in errors if not isinstance(exc, ExportAbortedException)]
+    if root_errors or errors:
+        raise (root_errors or errors)[0]
+    return stats
+
+
+parser = argparse.ArgumentParser(
+    description=(
+        "Bulk export of a collection or a table to NDJSON or Parquet files. "
+        "Supplied parameters take precedence over environment variables."
+    ),
+)
+add_connection_arguments(parser)
+source_group = parser.add_mutually_exclusive_group(required=True)
+source_group.add_argument("--collection", "-c", type=str, help="Collection to export")
+source_group.add_argument("--table", type=str, help="Table to export")
+parser.add_argument(
+    "--output",
+    "-o",
+    type=str,
+    required=True,
+    help="Output directory. Part files and export state are written there.",
+)
+parser.add_argument(
+    "--format",
+    "-f",
+    choices=sorted(EXPORT_FORMATS),
+    default=EXPORT_FORMAT_NDJSON,
+    help="Output format (Parquet requires the 'columnar' extra, i.e. pyarrow).",
+)
+parser.add_argument(
+    "--compression",
+    choices=list(EXPORT_COMPRESSIONS.keys()),
+    default="none",
+    help="Compression for NDJSON output.",
+)
+parser.add_argument("--filter", type=str, help="Filter, as a JSON string")
+projection_group = parser.add_mutually_exclusive_group()
+projection_group.add_argument(
+    "--projection", type=str, help="Projection, as a JSON string"
+)
+projection_group.add_argument(
+    "--fields",
+    type=str,
+    help="Comma-separated list of fields to export (shorthand for a projection)",
+)
+parser.add_argument(
+    "--segment",
+    type=str,
+    action="append",
+    dest="segments",
+    help=(
+        "A filter (JSON string) defining a segment to scan in parallel with "
+        "the others. Repeat for each segment; segments should not overlap."
+    ),
+)
+parser.add_argument(
+    "--parallelism",
+    type=int,
+    default=4,
+    help="Maximum number of segments scanned concurrently.",
+)
+parser.add_argument(
+    "--prefetch",
+    type=int,
+    default=2,
+    help="Pages fetched ahead of writing, per segment (0 to disable).",
+)
+parser.add_argument(
+    "--checkpoint-every",
+    type=int,
+    default=10,
+    help="Save a checkpoint every this many pages, per segment.",
+)
+parser.add_argument(
+    "--resume",
+    action="store_true",
+    help="Resume an interrupted export found in the output directory.",
+)
+parser.add_argument(
+    "--request-timeout-ms",
+    type=int,
+    help="Timeout for each page request, in milliseconds.",
+)
+parser.add_argument(
+    "--progress-interval",
+    type=float,
+    default=5.0,
+    help="Seconds between progress reports on stderr (0 to disable).",
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parser.parse_args(argv)
+    configure_logging(args)
+
+    filter = parse_json_argument(parser, "--filter", args.filter)
+    projection: dict[str, Any] | None
+    if args.fields:
+        projection = {
+            field_name.strip(): True
+            for field_name in args.fields.split(",")
+            if field_name.strip()
+        }
+    else:
+        projection = parse_json_argument(parser, "--projection", args.projection)
+    segments = [
+        parse_json_argument(parser, "--segment", segment)
+        for segment in (args.segments or [])
+    ]
+
+    database = database_from_arguments(args, parser)
+    source: Collection[Any] | Table[Any]
+    if args.collection:
+        source = database.get_collection(args.collection)
+    else:
+        source = database.get_table(args.table)
+
+    try:
+        stats = run_export(
+            source,
+            output_dir=args.output,
+            format=args.format,
+            compression=args.compression,
+            filter=filter,
+            projection=projection,
+            segments=segments or None,
+            parallelism=args.parallelism,
+            prefetch=args.prefetch,
+            checkpoint_every=args.checkpoint_every,
+            resume=args.resume,
+            request_timeout_ms=args.request_timeout_ms,
+            progress_interval_s=args.progress_interval,
+        )
+    except (ValueError, ImportError) as exc:
+        raise SystemExit(f"astrapy-export: {exc}")
+    sys.stderr.write(f"[astrapy-export] done. {stats.summary()}\n")
@@ -0,0 +1,793 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The `astrapy-load` command-line tool: bulk loading of NDJSON or CSV files
+(optionally paired with a `.npy` file of vectors) into a collection or a table.
+
+The loading machinery is also available programmatically through `run_load`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import bz2
+import csv
+import decimal
+import functools
+import gzip
+import json
+import logging
+import lzma
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import IO, Any, TextIO
+
+from astrapy import Collection, Table
+from astrapy.constants import DefaultIdType
+from astrapy.exceptions import (
+    CollectionInsertManyException,
+    DataAPIException,
+    DataAPIResponseException,
+    TableInsertManyException,
+)
+from astrapy.ids import ObjectId, uuid4, uuid6, uuid7
+from astrapy.settings.defaults import DEFAULT_INSERT_MANY_CHUNK_SIZE
+from astrapy.utils.cli_tools import (
+    ProgressReporter,
+    add_connection_arguments,
+    configure_logging,
+    database_from_arguments,
+    json_encoder_for,
+)
+from astrapy.utils.file_utils import _atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+LOAD_FORMAT_NDJSON = "ndjson"
+LOAD_FORMAT_CSV = "csv"
+LOAD_FORMATS = {LOAD_FORMAT_NDJSON, LOAD_FORMAT_CSV}
+LOAD_FORMAT_EXTENSIONS = {
+    ".ndjson": LOAD_FORMAT_NDJSON,
+    ".jsonl": LOAD_FORMAT_NDJSON,
+    ".json": LOAD_FORMAT_NDJSON,
+    ".csv": LOAD_FORMAT_CSV,
+}
+DEFAULT_LOAD_CONCURRENCY = 8
+DEFAULT_LOAD_MAX_CHUNK_BYTES = 4_000_000
+DEFAULT_LOAD_RETRIES = 3
+DEFAULT_LOAD_RETRY_BASE_DELAY_S = 0.5
+DOCUMENT_ALREADY_EXISTS_ERROR_CODE = "DOCUMENT_ALREADY_EXISTS"
+# the `_id` generated by the API for each collection `defaultId` type
+DEFAULT_ID_FACTORIES: dict[str, Callable[[], Any]] = {
+    DefaultIdType.UUID: uuid4,
+    DefaultIdType.UUIDV6: uuid6,
+    DefaultIdType.UUIDV7: uuid7,
+    DefaultIdType.OBJECTID: ObjectId,
+}
+NUMPY_IMPORT_ERROR_MESSAGE = (
+    "The 'numpy' package is required for loading vectors from .npy files. "
+    "Please install it, e.g. `pip install numpy`."
+)
+
+
+@dataclass
+class LoadStats:
+    """
+    Running counters for a load, safe to update from several threads.
+
+    Attributes:
+        inserted: number of documents/rows inserted by this run.
+        rejected: number of documents/rows definitely failing to be inserted
+            by this run (e.g. because of a duplicate ID).
+        retried: number of documents/rows re-submitted after a failed request.
+        chunks: number of chunks (i.e. `insert_many` calls) completed by this run.
+        bytes_sent: amount of JSON data for the inserted/rejected records.
+        skipped: number of input records skipped when resuming a previous load.
+        start_time: the `time.monotonic()` value at the start of the load.
+    """
+
+    inserted: int = 0
+    rejected: int = 0
+    retried: int = 0
+    chunks: int = 0
+    bytes_sent: int = 0
+    skipped: int = 0
+    start_time: float = field(default_factory=time.monotonic)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add_chunk(
+        self, *, inserted: int, rejected: int, retried: int, bytes_sent: int
+    ) -> None:
+        with self._lock:
+            self.inserted += inserted
+            self.rejected += rejected
+            self.retried += retried
+            self.chunks += 1
+            self.bytes_sent += bytes_sent
+
+    @property
+    def elapsed_s(self) -> float:
+        return time.monotonic() - self.start_time
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.inserted / max(self.elapsed_s, 1e-9)
+
+    def summary(self) -> str:
+        elapsed_s = self.elapsed_s
+        mb_per_second = self.bytes_sent / max(elapsed_s, 1e-9) / 1_000_000
+        skipped_desc = f", {self.skipped} skipped (resume)" if self.skipped else ""
+        return (
+            f"{self.inserted} inserted, {self.rejected} rejected, "
+            f"{self.retried} retried{skipped_desc}, {self.chunks} chunks, "
+            f"{self.bytes_sent / 1_000_000:.2f} MB in {elapsed_s:.1f} s: "
+            f"{self.rows_per_second:.0f} rows/s, {mb_per_second:.2f} MB/s"
+        )
+
+
+def _open_text(path: str) -> IO[str]:
+    """Open a (possibly gzip/bz2/xz-compressed) text file for streaming reads."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    if path.endswith(".bz2"):
+        return bz2.open(path, "rt", encoding="utf-8", newline="")
+    if path.endswith(".xz"):
+        return lzma.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+def _infer_format(path: str) -> str:
+    base_path = path
+    for compression_extension in (".gz", ".bz2", ".xz"):
+        if base_path.endswith(compression_extension):
+            base_path = base_path[: -len(compression_extension)]
+    extension = os.path.splitext(base_path)[1].lower()
+    if extension not in LOAD_FORMAT_EXTENSIONS:
+        raise ValueError(
+            f"Cannot infer the input format of '{path}': please specify it."
+        )
+    return LOAD_FORMAT_EXTENSIONS[extension]
+
+
+def _iterate_ndjson(text_file: IO[str], use_decimals: bool) -> Iterator[dict[str, Any]]:
+    parse_float = decimal.Decimal if use_decimals else None
+    for line_number, line in enumerate(text_file):
+        if not line.strip():
+            continue
+        try:
+            document = json.loads(line, parse_float=parse_float)
+        except json.JSONDecodeError as exc:
+            raise ValueError(
+                f"Invalid JSON at line {line_number + 1} of the input: {exc}"
+            )
+        if not isinstance(document, dict):
+            raise ValueError(
+                f"Line {line_number + 1} of the input is not a JSON object."
+            )
+        yield document
+
+
+def _iterate_csv(
+    text_file: IO[str],
+    json_columns: set[str],
+    use_decimals: bool,
+) -> Iterator[dict[str, Any]]:
+    parse_float = decimal.Decimal if use_decimals else None
+    for row in csv.DictReader(text_file):
+        # empty cells are left out of the document
+        yield {
+            column: (
+                json.loads(value, parse_float=parse_float)
+                if column in json_columns
+                else value
+            )
+            for column, value in row.items()
+            if value != ""
+        }
+
+
+def _iterate_records(
+    *,
+    input_path: str,
+    format: str,
+    csv_json_columns: set[str],
+    use_decimals: bool,
+    vectors_path: str | None,
+    vector_column: str,
+) -> Generator[dict[str, Any], None, None]:
+    with _open_text(input_path) as text_file:
+        records: Iterator[dict[str, Any]]
+        if format == LOAD_FORMAT_NDJSON:
+            records = _iterate_ndjson(text_file, use_decimals)
+        else:
+            records = _iterate_csv(text_file, csv_json_columns, use_decimals)
+        if vectors_path is None:
+            yield from records
+            return
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(NUMPY_IMPORT_ERROR_MESSAGE)
+        # memory-mapped: the vectors are read from disk as the records stream by
+        vectors = np.load(vectors_path, mmap_mode="r")
+        if vectors.ndim != 2:
+            raise ValueError(
+                f"The vectors in '{vectors_path}' must form a 2-dimensional array."
+            )
+        for record_index, record in enumerate(records):
+            if record_index >= vectors.shape[0]:
+                raise ValueError(
+                    f"The vectors in '{vectors_path}' are fewer than the records."
+                )
+            record[vector_column] = vectors[record_index].astype(float).tolist()
+            yield record
+
+
+@dataclass
+class _Chunk:
+    index: int
+    start: int
+    documents: list[dict[str, Any]]
+    byte_size: int
+
+
+def _iterate_chunks(
+    records: Iterator[dict[str, Any]],
+    *,
+    start: int,
+    chunk_size: int,
+    max_chunk_bytes: int,
+    encoder: Any,
+) -> Iterator[_Chunk]:
+    """
+    Group records into chunks, closing a chunk when it reaches either the
+    maximum number of documents or the maximum (estimated) payload size.
+    """
+
+    chunk_index = 0
+    chunk_start = start
+    documents: list[dict[str, Any]] = []
+    byte_size = 0
+    for record in records:
+        record_bytes = len(encoder(record))
+        if documents and (
+            len(documents) >= chunk_size or byte_size + record_bytes > max_chunk_bytes
+        ):
+            yield _Chunk(chunk_index, chunk_start, documents, byte_size)
+            chunk_index += 1
+            chunk_start += len(documents)
+            documents, byte_size = [], 0
+        documents.append(record)
+        byte_size += record_bytes
+    if documents:
+        yield _Chunk(chunk_index, chunk_start, documents, byte_size)
+
+
+class _OffsetTracker:
+    """
+    Track completed chunks (which may complete out of order) and persist the
+    resume offset, i.e. the number of input records all fully processed.
+    """
+
+    def __init__(
+        self,
+        *,
+        offset_path: str,
+        input_path: str,
+        offset: int,
+        checkpoint_every: int,
+    ) -> None:
+        self.offset_path = offset_path
+        self.input_path = input_path
+        self.offset = offset
+        self.checkpoint_every = checkpoint_every
+        self.next_chunk_index = 0
+        self.completed: dict[int, int] = {}
+        self.chunks_since_save = 0
+        self._lock = threading.Lock()
+
+    def save(self) -> None:
+        _atomic_write_text(
+            self.offset_path,
+            json.dumps({"input": self.input_path, "offset": self.offset}),
+        )
+
+    def complete(self, chunk: _Chunk) -> None:
+        with self._lock:
+            self.completed[chunk.index] = len(chunk.documents)
+            while self.next_chunk_index in self.completed:
+                self.offset += self.completed.pop(self.next_chunk_index)
+                self.next_chunk_index += 1
+            self.chunks_since_save += 1
+            if self.chunks_since_save >= self.checkpoint_every:
+                self.save()
+                self.chunks_since_save = 0
+
+
+def _id_factory(collection: Collection[Any]) -> Callable[[], Any] | None:
+    """
+    A generator of `_id` values of the kind the API would create for the
+    collection, according to its `defaultId` option (if none is set: UUIDv4
+    strings). None for unknown `defaultId` types, left to the API.
+    """
+
+    default_id = collection.options().default_id
+    if default_id is None:
+        return lambda: str(uuid4())
+    return DEFAULT_ID_FACTORIES.get(default_id.default_id_type)
+
+
+class _ChunkLoader:
+    """
+    Insert the chunks into the target, retrying the documents whose insertion
+    outcome is unknown and recording the definitely-failed ones as rejects.
+
+    Collection documents without an `_id` get one (from `id_factory`) before
+    the first attempt: otherwise the API would generate a fresh `_id` on each
+    retry and a retried document already written by a failed attempt would be
+    inserted twice instead of being reported as already existing.
+    """
+
+    def __init__(
+        self,
+        *,
+        target: Collection[Any] | Table[Any],
+        retries: int,
+        retry_base_delay_s: float,
+        request_timeout_ms: int | None,
+        rejects_file: TextIO | None,
+        stats: LoadStats,
+        id_factory: Callable[[], Any] | None,
+    ) -> None:
+        self.target = target
+        self.retries = retries
+        self.retry_base_delay_s = retry_base_delay_s
+        self.request_timeout_ms = request_timeout_ms
+        self.rejects_file = rejects_file
+        self.stats = stats
+        self.encoder = json_encoder_for(target)
+        self.id_factory = id_factory
+        self._rejects_lock = threading.Lock()
+
+    def _reject(self, record_number: int, document: Any, error: str) -> None:
+        logger.warning("record %s rejected: %s", record_number, error)
+        if self.rejects_file is not None:
+            with self._rejects_lock:
+                self.rejects_file.write(
+                    json.dumps(
+                        {
+                            "record": record_number,
+                            "error": error,
+                            "document": json.loads(self.encoder(document)),
+                        }
+                    )
+                    + "\n"
+                )
+
+    @staticmethod
+    def _document_errors(
+        exc: CollectionInsertManyException | TableInsertManyException,
+        num_documents: int,
+    ) -> list[str | None] | None:
+        """
+        Determine the per-document error codes (None for inserted documents) from
+        an insert_many exception, if the response carries that information.
+        """
+
+        if len(exc.exceptions) != 1 or not isinstance(
+            exc.exceptions[0], DataAPIResponseException
+        ):
+            return None
+        raw_response = exc.exceptions[0].raw_response
+        doc_responses = (raw_response.get("status") or {}).get("documentResponses")
+        if not doc_responses or len(doc_responses) != num_documents:
+            return None
+        errors = raw_response.get("errors") or []
+        doc_errors: list[str | None] = []
+        for doc_response in doc_responses:
+            if doc_response.get("status") == "OK":
+                doc_errors.append(None)
+            elif doc_response.get("status") == "ERROR":
+                error_index = doc_response.get("errorsIdx")
+                if isinstance(error_index, int) and error_index < len(errors):
+                    doc_errors.append(errors[error_index].get("errorCode", "ERROR"))
+                else:
+                    doc_errors.append("ERROR")
+            else:
+                # e.g. "SKIPPED": not attempted, to be retried
+                return None
+        return doc_errors
+
+    def load(self, chunk: _Chunk) -> None:
+        if self.id_factory is not None:
+            for document in chunk.documents:
+                if "_id" not in document:
+                    document["_id"] = self.id_factory()
+        # (record number, document, whether a previous attempt may have written it)
+        pending = [
+            (chunk.start + position, document, False)
+            for position, document in enumerate(chunk.documents)
+        ]
+        inserted, rejected, retried = 0, 0, 0
+        for attempt in range(self.retries + 1):
+            if attempt > 0:
+                retried += len(pending)
+                time.sleep(self.retry_base_delay_s * 2 ** (attempt - 1))
+            try:
+                self.target.insert_many(
+                    [document for _, document, _ in pending],
+                    ordered=False,
+                    chunk_size=len(pending),
+                    concurrency=1,
+                    request_timeout_ms=self.request_timeout_ms,
+                )
+                inserted += len(pending)
+                pending = []
+                break
+            except (CollectionInsertManyException, TableInsertManyException) as exc:
+                doc_errors = self._document_errors(exc, len(pending))
+                if doc_errors is None:
+                    logger.info(
+                        "chunk %s failed (attempt %s): %s", chunk.index, attempt, exc
+                    )
+                    pending = [(num, doc, True) for num, doc, _ in pending]
+                    continue
+                for (record_number, document, uncertain), error in zip(
+                    pending, doc_errors
+                ):
+                    if error is None or (
+                        uncertain and error == DOCUMENT_ALREADY_EXISTS_ERROR_CODE
+                    ):
+                        # a retry finding a document written by a previous attempt
+                        inserted += 1
+                    else:
+                        rejected += 1
+                        self._reject(record_number, document, error)
+                pending = []
+                break
+            except DataAPIException as exc:
+                logger.info(
+                    "chunk %s failed (attempt %s): %s", chunk.index, attempt, exc
+                )
+                pending = [(num, doc, True) for num, doc, _ in pending]
+        for record_number, document, _ in pending:
+            rejected += 1
+            self._reject(record_number, document, "RETRIES_EXHAUSTED")
+        self.stats.add_chunk(
+            inserted=inserted,
+            rejected=rejected,
+            retried=retried,
+            bytes_sent=chunk.byte_size,
+        )
+
+
+def run_load(
+    target: Collection[Any] | Table[Any],
+    *,
+    input_path: str,
+    format: str | None = None,
+    csv_json_columns: list[str] | None = None,
+    vectors_path: str | None = None,
+    vector_column: str = "$vector",
+    chunk_size: int = DEFAULT_INSERT_MANY_CHUNK_SIZE,
+    max_chunk_bytes: int = DEFAULT_LOAD_MAX_CHUNK_BYTES,
+    concurrency: int = DEFAULT_LOAD_CONCURRENCY,
+    retries: int = DEFAULT_LOAD_RETRIES,
+    retry_base_delay_s: float = DEFAULT_LOAD_RETRY_BASE_DELAY_S,
+    offset_path: str | None = None,
+    checkpoint_every: int = 10,
+    resume: bool = False,
+    rejects_path: str | None = None,
+    request_timeout_ms: int | None = None,
+    progress_interval_s: float | None = None,
+    progress_stream: TextIO | None = None,
+) -> LoadStats:
+    """
+    Load all records of an input file into a collection or a table.
+
+    The input is streamed: at any time, only the chunks being inserted (at most
+    twice the concurrency) are held in memory. The resume offset, i.e. the
+    number of input records fully processed, is periodically saved to a file,
+    so that an interrupted load can be resumed without re-inserting everything.
+
+    Documents without an `_id` loaded into a collection get one on the client,
+    so that retries cannot insert them twice: the ID is of the type set by the
+    `defaultId` option of the collection (read once, at the start) or, if the
+    collection has none, a UUIDv4 string, as the API itself would generate.
+
+    Args:
+        target: a (sync) Collection or Table.
+        input_path: the input file. Files ending in ".gz", ".bz2" or ".xz" are
+            decompressed on the fly.
+        format: "ndjson" (one JSON object per line) or "csv" (with a header row;
+            cells are strings, empty cells are omitted). If not provided, it is
+            inferred from the file extension.
+        csv_json_columns: for CSV input, the columns whose cells are to be
+            parsed as JSON (e.g. numbers, lists, nested objects).
+        vectors_path: a `.npy` file containing a 2-dimensional array, whose
+            rows are added, as vectors, to the records (in the same order).
+            This requires numpy.
+        vector_column: the field/column receiving the vectors from `vectors_path`.
+        chunk_size: the maximum number of records in a single insertion request.
+        max_chunk_bytes: the maximum (estimated) size of a single insertion request.
+        concurrency: the maximum number of concurrent insertion requests.
+        retries: how many times the records in a chunk are re-submitted if the
+            outcome of the insertion is unknown (e.g. on timeouts, HTTP errors).
+            Documents failing with a specific error (e.g. a duplicate ID) are
+            not retried but rejected right away.
+        retry_base_delay_s: the delay before the first retry, doubling thereafter.
+        offset_path: the file storing the resume offset. Defaults to the input
+            path with an ".offset.json" suffix.
+        checkpoint_every: the resume offset is saved every this many chunks.
+        resume: if True, skip the records already processed by a previous run,
+            according to the offset file.
+        rejects_path: an optional NDJSON file where rejected records are written
+            (along with their record number and error code).
+        request_timeout_ms: a timeout, in milliseconds, for each insertion request.
+        progress_interval_s: if provided, periodically write a progress line
+            every this many seconds to `progress_stream` (default: stderr).
+        progress_stream: the stream for progress lines.
+
+    Returns:
+        a LoadStats object with the counters for the load.
+    """
+
+    _format = format or _infer_format(input_path)
+    if _format not in LOAD_FORMATS:
+        raise ValueError(f"Unsupported input format: '{_format}'.")
+    if concurrency < 1 or chunk_size < 1 or checkpoint_every < 1 or retries < 0:
+        raise ValueError(
+            "Parameters concurrency, chunk_size and checkpoint_every must be "
+            "positive, retries must be non-negative."
+        )
+    _offset_path = offset_path or f"{input_path}.offset.json"
+    start_offset = 0
+    if os.path.exists(_offset_path):
+        if not resume:
+            raise ValueError(
+                f"Offset file '{_offset_path}' found for a previous load: "
+                "resume it or remove the file."
+            )
+        with open(_offset_path, encoding="utf-8") as i_file:
+            start_offset = json.load(i_file)["offset"]
+
+    use_decimals = isinstance(target, Table) or (
+        target.api_options.serdes_options.use_decimals_in_collections
+    )
+    records = _iterate_records(
+        input_path=input_path,
+        format=_format,
+        csv_json_columns=set(csv_json_columns or []),
+        use_decimals=use_decimals,
+        vectors_path=vectors_path,
+        vector_column=vector_column,
+    )
+    stats = LoadStats()
+    for _ in range(start_offset):
+        if next(records, None) is None:
+            break
+        stats.skipped += 1
+    tracker = _OffsetTracker(
+        offset_path=_offset_path,
+        input_path=os.path.abspath(input_path),
+        offset=start_offset,
+        checkpoint_every=checkpoint_every,
+    )
+    rejects_file = (
+        open(rejects_path, "a", encoding="utf-8") if rejects_path is not None else None
+    )
+    loader = _ChunkLoader(
+        target=target,
+        retries=retries,
+        retry_base_delay_s=retry_base_delay_s,
+        request_timeout_ms=request_timeout_ms,
+        rejects_file=rejects_file,
+        stats=stats,
+        id_factory=_id_factory(target) if isinstance(target, Collection) else None,
+    )
+    # backpressure: reading the input pauses while too many chunks are in flight
+    in_flight = threading.BoundedSemaphore(2 * concurrency)
+    errors: list[BaseException] = []
+
+    def _on_done(chunk: _Chunk, future: Future[None]) -> None:
+        in_flight.release()
+        exc = future.exception()
+        if exc is not None:
+            errors.append(exc)
+        else:
+            tracker.complete(chunk)
+
+    try:
+        with ProgressReporter(
+            prefix="astrapy-load",
+            summary=stats.summary,
+            interval_s=progress_interval_s,
+            stream=progress_stream,
+        ):
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for chunk in _iterate_chunks(
+                    records,
+                    start=start_offset,
+                    chunk_size=chunk_size,
+                    max_chunk_bytes=max_chunk_bytes,
+                    encoder=loader.encoder,
+                ):
+                    in_flight.acquire()
+                    if errors:
+                        in_flight.release()
+                        break
+                    future = executor.submit(loader.load, chunk)
+                    future.add_done_callback(functools.partial(_on_done, chunk))
+    finally:
+        # all submitted chunks are done by now: persist the final offset
+        tracker.save()
+        records.close()
+        if rejects_file is not None:
+            rejects_file.close()
+    if errors:
+        raise errors[0]
+    return stats
+
+
+parser = argparse.ArgumentParser(
+    description=(
+        "Bulk loading of NDJSON or CSV files into a collection or a table. "
+        "Supplied parameters take precedence over environment variables."
+    ),
+)
+add_connection_arguments(parser)
+target_group = parser.add_mutually_exclusive_group(required=True)
+target_group.add_argument(
+    "--collection",
+    "-c",
+    type=str,
+    help=(
+        "Target collection. Documents without an _id get one before insertion, "
+        "so that retries cannot duplicate them: of the collection defaultId "
+        "type if set, else a UUIDv4 string."
+    ),
+)
+target_group.add_argument("--table", type=str, help="Target table")
+parser.add_argument(
+    "--input",
+    "-i",
+    type=str,
+    required=True,
+    help="Input file (.gz, .bz2, .xz files are decompressed on the fly).",
+)
+parser.add_argument(
+    "--format",
+    "-f",
+    choices=sorted(LOAD_FORMATS),
+    help="Input format. Inferred from the file extension if omitted.",
+)
+parser.add_argument(
+    "--csv-json-columns",
+    type=str,
+    help="Comma-separated list of CSV columns whose cells are parsed as JSON.",
+)
+parser.add_argument(
+    "--vectors",
+    type=str,
+    help="A .npy file with one vector per input record (requires numpy).",
+)
+parser.add_argument(
+    "--vector-column",
+    type=str,
+    default="$vector",
+    help="Field/column receiving the vectors from --vectors.",
+)
+parser.add_argument(
+    "--chunk-size",
+    type=int,
+    default=DEFAULT_INSERT_MANY_CHUNK_SIZE,
+    help="Maximum number of records per insertion request.",
+)
+parser.add_argument(
+    "--max-chunk-bytes",
+    type=int,
+    default=DEFAULT_LOAD_MAX_CHUNK_BYTES,
+    help="Maximum (estimated) size of an insertion request, in bytes.",
+)
+parser.add_argument(
+    "--concurrency",
+    type=int,
+    default=DEFAULT_LOAD_CONCURRENCY,
+    help="Maximum number of concurrent insertion requests.",
+)
+parser.add_argument(
+    "--retries",
+    type=int,
+    default=DEFAULT_LOAD_RETRIES,
+    help="Retries for records whose insertion outcome is unknown.",
+)
+parser.add_argument(
+    "--offset-file",
+    type=str,
+    help="File storing the resume offset (default: <input>.offset.json).",
+)
+parser.add_argument(
+    "--checkpoint-every",
+    type=int,
+    default=10,
+    help="Save the resume offset every this many chunks.",
+)
+parser.add_argument(
+    "--resume",
+    action="store_true",
+    help="Skip the records already processed according to the offset file.",
+)
+parser.add_argument(
+    "--rejects",
+    type=str,
+    help="NDJSON file collecting the rejected records and their errors.",
+)
+parser.add_argument(
+    "--request-timeout-ms",
+    type=int,
+    help="Timeout for each insertion request, in milliseconds.",
+)
+parser.add_argument(
+    "--progress-interval",
+    type=float,
+    default=5.0,
+    help="Seconds between progress reports on stderr (0 to disable).",
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parser.parse_args(argv)
+    configure_logging(args)
+
+    database = database_from_arguments(args, parser)
+    target: Collection[Any] | Table[Any]
+    if args.collection:
+        target = database.get_collection(args.collection)
+    else:
+        target = database.get_table(args.table)
+
+    try:
+        stats = run_load(
+            target,
+            input_path=args.input,
+            format=args.format,
+            csv_json_columns=[
+                column.strip()
+                for column in (args.csv_json_columns or "").split(",")
+                if column.strip()
+            ],
+            vectors_path=args.vectors,
+            vector_column=args.vector_column,
+            chunk_size=args.chunk_size,
+            max_chunk_bytes=args.max_chunk_bytes,
+            concurrency=args.concurrency,
+            retries=args.retries,
+            offset_path=args.offset_file,
+            checkpoint_every=args.checkpoint_every,
+            resume=args.resume,
+            rejects_path=args.rejects,
+            request_timeout_ms=args.request_timeout_ms,
+            progress_interval_s=args.progress_interval,
+        )
+    except (ValueError, ImportError, OSError) as exc:
+        raise SystemExit(f"astrapy-load: {exc}")
+    sys.stderr.write(f"[astrapy-load] done. {stats.summary()}\n")
+    if stats.rejected:
+        raise SystemExit(1)
@@ -0,0 +1,491 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Operation classes for the `bulk_write` method of collections and tables.
+
+Each operation mirrors the corresponding collection/table method and accepts
+the same parameters, except for the timeouts (which are set for the whole
+bulk write). Consecutive insertions in a bulk write are coalesced into as few
+`insertMany` API commands as possible.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from astrapy.constants import FilterType, SortType
+from astrapy.results import CollectionDeleteResult, CollectionUpdateResult
+
+if TYPE_CHECKING:
+    from astrapy import AsyncCollection, AsyncTable, Collection, Table
+
+
+class BaseOperation(ABC):
+    """
+    Base class for all operations amenable to be used
+    in bulk writes on collections.
+    """
+
+
+class _CollectionSingleOperation(BaseOperation):
+    """An operation in a bulk write executed as a method call of its own."""
+
+    @abstractmethod
+    def _execute(
+        self,
+        collection: Collection[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> CollectionUpdateResult | CollectionDeleteResult: ...
+
+    @abstractmethod
+    async def _aexecute(
+        self,
+        collection: AsyncCollection[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> CollectionUpdateResult | CollectionDeleteResult: ...
+
+
+@dataclass
+class InsertOne(BaseOperation):
+    """
+    Represents an `insert_one` operation on a collection.
+
+    Attributes:
+        document: the document to insert.
+    """
+
+    document: dict[str, Any]
+
+
+@dataclass
+class InsertMany(BaseOperation):
+    """
+    Represents an `insert_many` operation on a collection.
+
+    Attributes:
+        documents: the documents to insert.
+    """
+
+    documents: list[dict[str, Any]]
+
+    def __init__(self, documents: Iterable[dict[str, Any]]) -> None:
+        self.documents = list(documents)
+
+
+@dataclass
+class UpdateOne(_CollectionSingleOperation):
+    """
+    Represents an `update_one` operation on a collection.
+
+    Attributes:
+        filter: a filter condition to select a target document.
+        update: an update prescription to apply to the document.
+        sort: controls ordering in results, hence which document is updated.
+        upsert: controls what happens when no documents match the filter.
+    """
+
+    filter: FilterType
+    update: dict[str, Any]
+    sort: SortType | None = None
+    upsert: bool = False
+
+    def _execute(
+        self,
+        collection: Collection[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> CollectionUpdateResult:
+        return collection.update_one(
+            self.filter,
+            self.update,
+            sort=self.sort,
+            upsert=self.upsert,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+    async def _aexecute(
+        self,
+        collection: AsyncCollection[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> CollectionUpdateResult:
+        return await collection.update_one(
+            self.filter,
+            self.update,
+            sort=self.sort,
+            upsert=self.upsert,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+
+@dataclass
+class UpdateMany(_CollectionSingleOperation):
+    """
+    Represents an `update_many` operation on a collection.
+
+    Attributes:
+        filter: a filter condition to select target documents.
+        update: an update prescription to apply to the documents.
+        upsert: controls what happens when no documents match the filter.
+    """
+
+    filter: FilterType
+    update: dict[str, Any]
+    upsert: bool = False
+
+    def _execute(
+        self,
+        collection: Collection[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> CollectionUpdateResult:
+        return collection.update_many(
+            self.filter,
+            self.update,
+            upsert=self.upsert,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+    async def _aexecute(
+        self,
+        collection: AsyncCollection[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> CollectionUpdateResult:
+        return await collection.update_many(
+            self.filter,
+            self.update,
+            upsert=self.upsert,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+
+@dataclass
+class ReplaceOne(_CollectionSingleOperation):
+    """
+    Represents a `replace_one` operation on a collection.
+
+    Attributes:
+        filter: a filter condition to select a target document.
+        replacement: the replacement document.
+        sort: controls ordering in results, hence which document is replaced.
+        upsert: controls what happens when no documents match the filter.
+    """
+
+    filter: FilterType
+    replacement: dict[str, Any]
+    sort: SortType | None = None
+    upsert: bool = False
+
+    def _execute(
+        self,
+        collection: Collection[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> CollectionUpdateResult:
+        return collection.replace_one(
+            self.filter,
+            self.replacement,
+            sort=self.sort,
+            upsert=self.upsert,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+    async def _aexecute(
+        self,
+        collection: AsyncCollection[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> CollectionUpdateResult:
+        return await collection.replace_one(
+            self.filter,
+            self.replacement,
+            sort=self.sort,
+            upsert=self.upsert,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+
+@dataclass
+class DeleteOne(_CollectionSingleOperation):
+    """
+    Represents a `delete_one` operation on a collection.
+
+    Attributes:
+        filter: a filter condition to select a target document.
+        sort: controls ordering in results, hence which document is deleted.
+    """
+
+    filter: FilterType
+    sort: SortType | None = None
+
+    def _execute(
+        self,
+        collection: Collection[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> CollectionDeleteResult:
+        return collection.delete_one(
+            self.filter,
+            sort=self.sort,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+    async def _aexecute(
+        self,
+        collection: AsyncCollection[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> CollectionDeleteResult:
+        return await collection.delete_one(
+            self.filter,
+            sort=self.sort,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+
+@dataclass
+class DeleteMany(_CollectionSingleOperation):
+    """
+    Represents a `delete_many` operation on a collection.
+
+    Attributes:
+        filter: a filter condition to select target documents.
+    """
+
+    filter: FilterType
+
+    def _execute(
+        self,
+        collection: Collection[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> CollectionDeleteResult:
+        return collection.delete_many(
+            self.filter,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+    async def _aexecute(
+        self,
+        collection: AsyncCollection[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> CollectionDeleteResult:
+        return await collection.delete_many(
+            self.filter,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+
+class BaseTableOperation(ABC):
+    """
+    Base class for all operations amenable to be used
+    in bulk writes on tables.
+    """
+
+
+class _TableSingleOperation(BaseTableOperation):
+    """An operation in a bulk write executed as a method call of its own."""
+
+    @abstractmethod
+    def _execute(
+        self,
+        table: Table[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> None: ...
+
+    @abstractmethod
+    async def _aexecute(
+        self,
+        table: AsyncTable[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> None: ...
+
+
+@dataclass
+class TableInsertOne(BaseTableOperation):
+    """
+    Represents an `insert_one` operation on a table.
+
+    Attributes:
+        row: the row to insert.
+    """
+
+    row: dict[str, Any]
+
+
+@dataclass
+class TableInsertMany(BaseTableOperation):
+    """
+    Represents an `insert_many` operation on a table.
+
+    Attributes:
+        rows: the rows to insert.
+    """
+
+    rows: list[dict[str, Any]]
+
+    def __init__(self, rows: Iterable[dict[str, Any]]) -> None:
+        self.rows = list(rows)
+
+
+@dataclass
+class TableUpdateOne(_TableSingleOperation):
+    """
+    Represents an `update_one` operation on a table.
+
+    Attributes:
+        filter: a predicate expressing the table primary key in full.
+        update: an update prescription to apply to the row.
+    """
+
+    filter: FilterType
+    update: dict[str, Any]
+
+    def _execute(
+        self,
+        table: Table[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> None:
+        table.update_one(
+            self.filter,
+            self.update,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+    async def _aexecute(
+        self,
+        table: AsyncTable[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> None:
+        await table.update_one(
+            self.filter,
+            self.update,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+
+@dataclass
+class TableDeleteOne(_TableSingleOperation):
+    """
+    Represents a `delete_one` operation on a table.
+
+    Attributes:
+        filter: a predicate expressing the table primary key in full.
+    """
+
+    filter: FilterType
+
+    def _execute(
+        self,
+        table: Table[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> None:
+        table.delete_one(
+            self.filter,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+    async def _aexecute(
+        self,
+        table: AsyncTable[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> None:
+        await table.delete_one(
+            self.filter,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+
+@dataclass
+class TableDeleteMany(_TableSingleOperation):
+    """
+    Represents a `delete_many` operation on a table.
+
+    Attributes:
+        filter: a filter condition to select the rows to delete.
+    """
+
+    filter: FilterType
+
+    def _execute(
+        self,
+        table: Table[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> None:
+        table.delete_many(
+            self.filter,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
+
+    async def _aexecute(
+        self,
+        table: AsyncTable[Any],
+        *,
+        general_method_timeout_ms: int,
+        request_timeout_ms: int | None,
+    ) -> None:
+        await table.delete_many(
+            self.filter,
+            general_method_timeout_ms=general_method_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+        )
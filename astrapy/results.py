@@ -15,9 +15,25 @@
 from __future__ import annotations
 
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
+from astrapy.utils.operation_stats import OperationStats
+
+__all__ = [
+    "CollectionBulkWriteResult",
+    "CollectionDeleteResult",
+    "CollectionInsertManyResult",
+    "CollectionInsertOneResult",
+    "CollectionUpdateResult",
+    "OperationResult",
+    "OperationStats",
+    "TableBulkWriteResult",
+    "TableInsertManyResult",
+    "TableInsertOneResult",
+    "TableUpdateManyResult",
+]
+
 
 @dataclass
 class OperationResult(ABC):
@@ -28,9 +44,15 @@ class OperationResult(ABC):
         raw_results: response/responses from the Data API call.
             Depending on the exact delete method being used, this
             list of raw responses can contain exactly one or a number of items.
+        stats: for the results of `insert_many`, `update_many` and `delete_many`,
+            an OperationStats object with statistics about the requests made
+            (number, latency, bytes, chunk sizes, queueing). None otherwise.
     """
 
     raw_results: list[dict[str, Any]]
+    stats: OperationStats | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def _piecewise_repr(self, pieces: list[str | None]) -> str:
         return f"{self.__class__.__name__}({', '.join(pc for pc in pieces if pc)})"
@@ -197,3 +219,123 @@ class TableInsertManyResult(OperationResult):
                 "raw_results=..." if self.raw_results is not None else None,
             ]
         )
+
+
+def _ids_by_operation_repr(ids_by_operation: dict[int, list[Any]]) -> str:
+    num_ids = sum(len(op_ids) for op_ids in ids_by_operation.values())
+    if num_ids > 5:
+        return f"{{... ({num_ids} total in {len(ids_by_operation)} operations)}}"
+    return str(ids_by_operation)
+
+
+@dataclass
+class CollectionBulkWriteResult(OperationResult):
+    """
+    Class that represents the result of a bulk_write operation on a collection.
+
+    Attributes:
+        raw_results: responses from the Data API calls
+        inserted_count: number of inserted documents
+        matched_count: number of documents matched by the update/replace operations
+        modified_count: number of documents modified by the update/replace operations
+        deleted_count: number of deleted documents
+        upserted_count: number of documents upserted by the update/replace operations
+        inserted_ids: a map from the index of each insert operation (in the list
+            of operations to the bulk_write) to the IDs of its inserted documents
+        upserted_ids: a map from the index of each upserting operation (in the
+            list of operations to the bulk_write) to the ID of the upserted document
+    """
+
+    inserted_count: int
+    matched_count: int
+    modified_count: int
+    deleted_count: int
+    upserted_count: int
+    inserted_ids: dict[int, list[Any]]
+    upserted_ids: dict[int, Any]
+
+    def __repr__(self) -> str:
+        return self._piecewise_repr(
+            [
+                f"inserted_count={self.inserted_count}",
+                f"matched_count={self.matched_count}",
+                f"modified_count={self.modified_count}",
+                f"deleted_count={self.deleted_count}",
+                f"upserted_count={self.upserted_count}",
+                f"inserted_ids={_ids_by_operation_repr(self.inserted_ids)}",
+                f"upserted_ids={self.upserted_ids}" if self.upserted_ids else None,
+                "raw_results=..." if self.raw_results is not None else None,
+            ]
+        )
+
+
+@dataclass
+class TableUpdateManyResult(OperationResult):
+    """
+    Class that represents the result of update_many operations on a table.
+
+    Attributes:
+        raw_results: responses from the `updateOne` Data API calls
+        matched_count: number of rows found matching the filter
+        modified_count: number of rows successfully updated. Tables do not
+            report whether an update actually changed the row.
+        failed_ids: the primary keys of the rows whose update failed,
+            in the form of dictionaries
+        failed_id_tuples: the same as `failed_ids`, with each ID in the form
+            of a tuple
+        exceptions: the error for each failed row, in the same order
+            as `failed_ids`
+    """
+
+    matched_count: int
+    modified_count: int
+    failed_ids: list[dict[str, Any]]
+    failed_id_tuples: list[tuple[Any, ...]]
+    exceptions: list[Exception]
+
+    def __repr__(self) -> str:
+        return self._piecewise_repr(
+            [
+                f"matched_count={self.matched_count}",
+                f"modified_count={self.modified_count}",
+                f"failed_ids={self.failed_ids}" if self.failed_ids else None,
+                "raw_results=..." if self.raw_results is not None else None,
+            ]
+        )
+
+
+@dataclass
+class TableBulkWriteResult(OperationResult):
+    """
+    Class that represents the result of a bulk_write operation on a table.
+
+    Attributes:
+        raw_results: responses from the Data API calls for the insertions
+        inserted_count: number of inserted rows
+        update_count: number of update operations completed. Tables do not
+            report about matched or modified rows.
+        delete_count: number of delete operations completed. Tables do not
+            report about the number of deleted rows.
+        inserted_ids: a map from the index of each insert operation (in the list
+            of operations to the bulk_write) to the IDs of its inserted rows,
+            in the form of dictionaries
+        inserted_id_tuples: the same as `inserted_ids`, with each ID in the form
+            of a tuple
+    """
+
+    inserted_count: int
+    update_count: int
+    delete_count: int
+    inserted_ids: dict[int, list[Any]]
+    inserted_id_tuples: dict[int, list[tuple[Any, ...]]]
+
+    def __repr__(self) -> str:
+        return self._piecewise_repr(
+            [
+                f"inserted_count={self.inserted_count}",
+                f"update_count={self.update_count}",
+                f"delete_count={self.delete_count}",
+                f"inserted_ids={_ids_by_operation_repr(self.inserted_ids)}",
+                "raw_results=..." if self.raw_results is not None else None,
+            ]
+        )
@@ -63,6 +63,19 @@ DEFAULT_DATETIME_TZINFO = datetime.timezone.utc
 
 DEFAULT_INSERT_MANY_CHUNK_SIZE = 50
 DEFAULT_INSERT_MANY_CONCURRENCY = 20
+DEFAULT_BULK_WRITE_CONCURRENCY = 20
+DEFAULT_TABLE_UPDATE_MANY_CONCURRENCY = 20
+# one page of `find` results (the Data API accepts up to 100 `$in` values,
+# but a larger batch would take several page requests in sequence)
+DEFAULT_LOADER_MAX_BATCH_SIZE = 20
+DEFAULT_LOADER_BATCH_WINDOW_MS = 2
+DEFAULT_LOADER_ASYNC_BATCH_WINDOW_MS = 0
+DEFAULT_LOADER_CONCURRENCY = 10
+DEFAULT_READ_CACHE_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_READ_CACHE_TTL_MS = 30000
+DEFAULT_METADATA_CACHE_TTL_MS = 300000
+DEFAULT_ADMIN_METADATA_CACHE_TTL_MS = 60000
+DEFAULT_ADMIN_METADATA_CACHE_CATALOG_TTL_MS = 24 * 3600 * 1000
 DEFAULT_REQUEST_TIMEOUT_MS = 10000
 DEFAULT_GENERAL_METHOD_TIMEOUT_MS = 30000
 DEFAULT_COLLECTION_ADMIN_TIMEOUT_MS = 60000
@@ -90,6 +90,17 @@ class MapEncodingMode(StrEnum):
     ALWAYS = "ALWAYS"
 
 
+class ConnectionReuseMode(StrEnum):
+    """
+    Enum for the possible values of the setting controlling how the pooled
+    HTTP connections are reused across threads.
+    """
+
+    SHARED = "SHARED"
+    PER_THREAD = "PER_THREAD"
+    DISABLED = "DISABLED"
+
+
 def normalize_optional_projection(
     projection: ProjectionType | None,
 ) -> dict[str, bool | dict[str, int | Iterable[int]]] | None:
@@ -0,0 +1,1183 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import logging
+import math
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any
+
+import httpx
+
+from astrapy.data.utils.extended_json_converters import (
+    convert_ejson_binary_object_to_bytes,
+)
+from astrapy.data_types.data_api_vector import bytes_to_floats
+from astrapy.settings.defaults import DEFAULT_ASTRA_DB_KEYSPACE
+from astrapy.utils.http_clients import mount_transport, unmount_transport
+
+logger = logging.getLogger(__name__)
+
+# The emulator keeps all data in memory and processes one command at a time
+# (a lock guards the data), after the configured latency has elapsed. It
+# mimics the response shapes of the Data API closely enough for astrapy,
+# not its exact limits, error codes or the full query language.
+
+DEFAULT_EMULATOR_ENDPOINT = "http://data-api.emulator"
+DEFAULT_PAGE_SIZE = 20
+MAX_SORTED_RESULTS = 1000
+UPDATE_MANY_PAGE_SIZE = 20
+DELETE_MANY_PAGE_SIZE = 20
+MAX_COUNT = 1000
+
+_EJSON_KEYS = {"$date", "$uuid", "$objectId", "$binary"}
+
+
+class _EmulatedAPIError(Exception):
+    def __init__(self, error_code: str, message: str) -> None:
+        super().__init__(message)
+        self.error_code = error_code
+        self.message = message
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "errorCode": self.error_code,
+            "message": self.message,
+            "family": "REQUEST",
+            "scope": "EMULATOR",
+            "title": self.error_code,
+            "id": str(uuid.uuid4()),
+        }
+
+
+@dataclass
+class EmulatorFault:
+    """
+    A fault to inject into the responses of a DataAPIEmulator.
+
+    Attributes:
+        command: the command affected (such as "insertMany"), None for all.
+        target: the name of the collection/table affected, None for all.
+        http_status: if set, the affected requests fail with this HTTP status
+            code. Otherwise, they get a Data API error (an `errors` list in a
+            HTTP 200 response), without the command being executed.
+        error_code: the error code of the returned error.
+        message: the message of the returned error.
+        probability: the probability that a matching request is affected.
+        times: the number of requests to affect, after which the fault is
+            removed. None for no limit.
+    """
+
+    command: str | None = None
+    target: str | None = None
+    http_status: int | None = None
+    error_code: str = "EMULATED_FAULT"
+    message: str = "Fault injected by the Data API emulator."
+    probability: float = 1.0
+    times: int | None = 1
+
+
+def _comparable(value: Any) -> Any:
+    if isinstance(value, dict) and len(value) == 1 and "$date" in value:
+        return value["$date"]
+    return value
+
+
+def _type_rank(value: Any) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, bool):
+        return 1
+    if isinstance(value, int | float):
+        return 2
+    if isinstance(value, str):
+        return 3
+    return 4
+
+
+def _sort_key(found: bool, value: Any) -> tuple[int, Any]:
+    if not found:
+        return (0, 0)
+    _value = _comparable(value)
+    rank = _type_rank(_value)
+    if rank == 4:
+        return (rank, json.dumps(_value, sort_keys=True))
+    if rank == 0:
+        return (rank, 0)
+    return (rank, _value)
+
+
+def _get_path(document: dict[str, Any], path: str) -> tuple[bool, Any]:
+    value: Any = document
+    for segment in path.split("."):
+        if isinstance(value, dict) and segment in value:
+            value = value[segment]
+        elif (
+            isinstance(value, list) and segment.isdigit() and int(segment) < len(value)
+        ):
+            value = value[int(segment)]
+        else:
+            return False, None
+    return True, value
+
+
+def _set_path(document: dict[str, Any], path: str, value: Any) -> None:
+    segments = path.split(".")
+    target = document
+    for segment in segments[:-1]:
+        target = target.setdefault(segment, {})
+        if not isinstance(target, dict):
+            raise _EmulatedAPIError(
+                "UNSUPPORTED_UPDATE_OPERATION_PATH",
+                f"Cannot set '{path}' through a non-object value.",
+            )
+    target[segments[-1]] = value
+
+
+def _unset_path(document: dict[str, Any], path: str) -> None:
+    *parent_segments, last_segment = path.split(".")
+    target: Any = document
+    for segment in parent_segments:
+        target = target.get(segment) if isinstance(target, dict) else None
+    if isinstance(target, dict):
+        target.pop(last_segment, None)
+
+
+def _is_operator_dict(condition: Any) -> bool:
+    return (
+        isinstance(condition, dict)
+        and bool(condition)
+        and all(key.startswith("$") for key in condition)
+        and not (len(condition) == 1 and next(iter(condition)) in _EJSON_KEYS)
+    )
+
+
+def _equals(found: bool, value: Any, operand: Any) -> bool:
+    if not found:
+        return False
+    if value == operand:
+        return True
+    # an array matches if any of its items does
+    return isinstance(value, list) and operand in value
+
+
+def _compare(found: bool, value: Any, operand: Any, op: str) -> bool:
+    if not found:
+        return False
+    _value, _operand = _comparable(value), _comparable(operand)
+    rank = _type_rank(_value)
+    if rank not in {2, 3} or rank != _type_rank(_operand):
+        return False
+    if op == "$gt":
+        return bool(_value > _operand)
+    if op == "$gte":
+        return bool(_value >= _operand)
+    if op == "$lt":
+        return bool(_value < _operand)
+    return bool(_value <= _operand)
+
+
+def _matches_condition(found: bool, value: Any, condition: Any) -> bool:
+    if not _is_operator_dict(condition):
+        return _equals(found, value, condition)
+    for op, operand in condition.items():
+        if op == "$eq":
+            result = _equals(found, value, operand)
+        elif op == "$ne":
+            result = not _equals(found, value, operand)
+        elif op == "$in":
+            result = any(_equals(found, value, item) for item in operand)
+        elif op == "$nin":
+            result = not any(_equals(found, value, item) for item in operand)
+        elif op in {"$gt", "$gte", "$lt", "$lte"}:
+            result = _compare(found, value, operand, op)
+        elif op == "$exists":
+            result = found == bool(operand)
+        else:
+            raise _EmulatedAPIError(
+                "UNSUPPORTED_FILTER_OPERATION",
+                f"Filter operator '{op}' is not supported by the emulator.",
+            )
+        if not result:
+            return False
+    return True
+
+
+def _matches(document: dict[str, Any], filter: dict[str, Any]) -> bool:
+    for key, condition in filter.items():
+        if key == "$and":
+            if not all(_matches(document, sub_filter) for sub_filter in condition):
+                return False
+        elif key == "$or":
+            if not any(_matches(document, sub_filter) for sub_filter in condition):
+                return False
+        elif key == "$not":
+            if _matches(document, condition):
+                return False
+        else:
+            found, value = _get_path(document, key)
+            if not _matches_condition(found, value, condition):
+                return False
+    return True
+
+
+def _vector_floats(value: Any) -> list[float] | None:
+    if isinstance(value, list) and all(isinstance(item, int | float) for item in value):
+        return [float(item) for item in value]
+    if isinstance(value, dict) and set(value.keys()) == {"$binary"}:
+        return bytes_to_floats(convert_ejson_binary_object_to_bytes(value))
+    return None
+
+
+def _similarity(metric: str, vector1: list[float], vector2: list[float]) -> float:
+    if len(vector1) != len(vector2):
+        raise _EmulatedAPIError(
+            "VECTOR_SIZE_MISMATCH",
+            f"Vector of size {len(vector1)} used with vectors of size {len(vector2)}.",
+        )
+    dot = sum(x1 * x2 for x1, x2 in zip(vector1, vector2))
+    if metric == "dot_product":
+        return (1 + dot) / 2
+    if metric == "euclidean":
+        return 1 / (1 + sum((x1 - x2) ** 2 for x1, x2 in zip(vector1, vector2)))
+    norms = math.sqrt(sum(x * x for x in vector1) * sum(x * x for x in vector2))
+    if norms == 0:
+        return 0.0
+    return (1 + dot / norms) / 2
+
+
+class _EmulatedStore:
+    """
+    The contents of a collection or table: the stored items (in insertion
+    order) keyed on the JSON-encoding of their identity.
+    """
+
+    is_table = False
+
+    def __init__(self, name: str, metric: str) -> None:
+        self.name = name
+        self.metric = metric
+        self.items: dict[str, dict[str, Any]] = {}
+
+    def key_of(self, item: dict[str, Any]) -> str:
+        raise NotImplementedError
+
+    def identity_of(self, item: dict[str, Any]) -> Any:
+        raise NotImplementedError
+
+    def response_id_of(self, item: dict[str, Any]) -> Any:
+        # the identity of a (possibly invalid) item, for the insertion responses
+        raise NotImplementedError
+
+    def new_item(self, item: dict[str, Any]) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def vector_sort(self, sort: dict[str, Any]) -> tuple[str, list[float]] | None:
+        raise NotImplementedError
+
+    def project(
+        self, item: dict[str, Any], projection: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def status_extras(self, projection: dict[str, Any] | None) -> dict[str, Any]:
+        return {}
+
+
+class _EmulatedCollection(_EmulatedStore):
+    def key_of(self, item: dict[str, Any]) -> str:
+        return json.dumps(item["_id"], sort_keys=True)
+
+    def identity_of(self, item: dict[str, Any]) -> Any:
+        return item["_id"]
+
+    def response_id_of(self, item: dict[str, Any]) -> Any:
+        return item.get("_id")
+
+    def new_item(self, item: dict[str, Any]) -> dict[str, Any]:
+        new_item = copy.deepcopy(item)
+        if "_id" not in new_item:
+            new_item = {"_id": str(uuid.uuid4()), **new_item}
+        if "$vector" in new_item:
+            new_item["$vector"] = _vector_floats(new_item["$vector"])
+        return new_item
+
+    def vector_sort(self, sort: dict[str, Any]) -> tuple[str, list[float]] | None:
+        if "$vector" not in sort:
+            return None
+        query_vector = _vector_floats(sort["$vector"])
+        if query_vector is None:
+            raise _EmulatedAPIError("INVALID_SORT_CLAUSE", "Invalid '$vector' sort.")
+        return "$vector", query_vector
+
+    def project(
+        self, item: dict[str, Any], projection: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        _projection = projection or {}
+        if "*" in _projection:
+            return copy.deepcopy(item) if _projection["*"] else {}
+        inclusions = {key for key, value in _projection.items() if value} - {"_id"}
+        if inclusions:
+            projected = {key: item[key] for key in item if key in inclusions}
+            if _projection.get("_id", True):
+                projected = {"_id": item["_id"], **projected}
+        else:
+            exclusions = {key for key, value in _projection.items() if not value}
+            projected = {
+                key: value
+                for key, value in item.items()
+                if key not in exclusions and key != "$vector"
+            }
+        return copy.deepcopy(projected)
+
+
+class _EmulatedTable(_EmulatedStore):
+    is_table = True
+
+    def __init__(
+        self,
+        name: str,
+        columns: dict[str, dict[str, Any]],
+        primary_key: list[str],
+        metric: str,
+    ) -> None:
+        super().__init__(name=name, metric=metric)
+        self.columns = columns
+        self.primary_key = primary_key
+
+    def key_of(self, item: dict[str, Any]) -> str:
+        return json.dumps(self.identity_of(item), sort_keys=True)
+
+    def identity_of(self, item: dict[str, Any]) -> Any:
+        return [item.get(column) for column in self.primary_key]
+
+    def response_id_of(self, item: dict[str, Any]) -> Any:
+        return self.identity_of(item)
+
+    def new_item(self, item: dict[str, Any]) -> dict[str, Any]:
+        unknown_columns = set(item.keys()) - set(self.columns.keys())
+        if unknown_columns:
+            raise _EmulatedAPIError(
+                "UNKNOWN_TABLE_COLUMNS",
+                f"Unknown columns for table '{self.name}': "
+                f"{', '.join(sorted(unknown_columns))}.",
+            )
+        missing_columns = [col for col in self.primary_key if item.get(col) is None]
+        if missing_columns:
+            raise _EmulatedAPIError(
+                "MISSING_PRIMARY_KEY_COLUMNS",
+                f"Missing primary key columns: {', '.join(missing_columns)}.",
+            )
+        return {
+            column: copy.deepcopy(value)
+            for column, value in item.items()
+            if value is not None
+        }
+
+    def vector_sort(self, sort: dict[str, Any]) -> tuple[str, list[float]] | None:
+        for column, value in sort.items():
+            if self.columns.get(column, {}).get("type") == "vector":
+                query_vector = _vector_floats(value)
+                if query_vector is None:
+                    raise _EmulatedAPIError(
+                        "INVALID_SORT_CLAUSE", f"Invalid vector sort on '{column}'."
+                    )
+                return column, query_vector
+        return None
+
+    def projected_columns(self, projection: dict[str, Any] | None) -> list[str]:
+        _projection = projection or {}
+        if "*" in _projection:
+            return list(self.columns) if _projection["*"] else []
+        inclusions = {key for key, value in _projection.items() if value}
+        if inclusions:
+            return [column for column in self.columns if column in inclusions]
+        exclusions = {key for key, value in _projection.items() if not value}
+        return [column for column in self.columns if column not in exclusions]
+
+    def project(
+        self, item: dict[str, Any], projection: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        return {
+            column: copy.deepcopy(item[column])
+            for column in self.projected_columns(projection)
+            if column in item
+        }
+
+    def status_extras(self, projection: dict[str, Any] | None) -> dict[str, Any]:
+        return {
+            "projectionSchema": {
+                column: self.columns[column]
+                for column in self.projected_columns(projection)
+            }
+        }
+
+    def primary_key_schema(self) -> dict[str, Any]:
+        return {column: self.columns[column] for column in self.primary_key}
+
+    def descriptor(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "definition": {
+                "columns": copy.deepcopy(self.columns),
+                "primaryKey": {
+                    "partitionBy": self.primary_key[:1],
+                    "partitionSort": {column: 1 for column in self.primary_key[1:]},
+                },
+            },
+        }
+
+
+def _apply_update(
+    document: dict[str, Any], update: dict[str, Any], *, inserting: bool
+) -> None:
+    for operator, fields in update.items():
+        if operator == "$set":
+            for path, value in fields.items():
+                _set_path(document, path, copy.deepcopy(value))
+        elif operator == "$setOnInsert":
+            if inserting:
+                for path, value in fields.items():
+                    _set_path(document, path, copy.deepcopy(value))
+        elif operator == "$unset":
+            for path in fields:
+                _unset_path(document, path)
+        elif operator == "$inc":
+            for path, increment in fields.items():
+                found, value = _get_path(document, path)
+                _set_path(document, path, (value if found else 0) + increment)
+        elif operator == "$push":
+            for path, item in fields.items():
+                found, value = _get_path(document, path)
+                _set_path(document, path, [*(value if found else []), item])
+        else:
+            raise _EmulatedAPIError(
+                "UNSUPPORTED_UPDATE_OPERATION",
+                f"Update operator '{operator}' is not supported by the emulator.",
+            )
+
+
+def _update_document(document: dict[str, Any], update: dict[str, Any]) -> bool:
+    # return whether the document was modified
+    if any("_id" in (fields or {}) for fields in update.values()):
+        raise _EmulatedAPIError("UNSUPPORTED_UPDATE_FOR_DOC_ID", "Cannot update _id.")
+    before = copy.deepcopy(document)
+    _apply_update(document, update, inserting=False)
+    return document != before
+
+
+def _equality_fields(filter: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: value
+        for key, value in filter.items()
+        if not key.startswith("$") and not _is_operator_dict(value)
+    }
+
+
+class _EmulatorRequestHandler(BaseHTTPRequestHandler):
+    # set on the subclass created for each server
+    emulator: DataAPIEmulator
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        status_code, content = self.emulator._handle(self.path, body)
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(format, *args)
+
+
+class EmulatorServer:
+    """
+    A local HTTP server for a DataAPIEmulator, serving requests from
+    background threads. Obtained with the `serve` method of the emulator;
+    it can be used as a context manager (stopping the server at exit).
+
+    Attributes:
+        url: the base URL of the server, to be used as the API endpoint.
+    """
+
+    def __init__(self, emulator: DataAPIEmulator, host: str, port: int) -> None:
+        handler_class = type(
+            "_BoundEmulatorRequestHandler",
+            (_EmulatorRequestHandler,),
+            {"emulator": emulator},
+        )
+        self._server = ThreadingHTTPServer((host, port), handler_class)
+        self._server.daemon_threads = True
+        bound_host, bound_port = self._server.server_address[:2]
+        self.url = f"http://{bound_host!s}:{bound_port}"
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="astrapy-data-api-emulator",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(url={self.url})"
+
+    def __enter__(self) -> EmulatorServer:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the server and wait for its thread to exit."""
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+class DataAPIEmulator(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    An in-memory stand-in for the Data API, for testing and benchmarking
+    without a database.
+
+    The emulator supports, on collections and tables, the `find` (with
+    `pageState` pagination), `findOne`, `insertOne`, `insertMany`, `updateOne`,
+    `updateMany`, `deleteMany` and `countDocuments` commands, plus
+    `createCollection`, `deleteCollection` and `listTables`. Filters support equality, the
+    `$eq`, `$ne`, `$in`, `$nin`, `$gt`, `$gte`, `$lt`, `$lte` and `$exists`
+    operators, `$and`, `$or` and `$not`; sorting by field values and by vector
+    similarity (by brute force, with the metric of the collection/table).
+    Projections apply to top-level fields only. Table responses carry the
+    `projectionSchema` and `primaryKeySchema` derived from the declared columns,
+    and `listTables` describes the declared tables.
+    Unknown collection names are created as empty collections on first use,
+    while tables must be declared with `create_table`.
+
+    The emulator is a httpx transport: it can be mounted in place of the
+    network for all astrapy objects (see `mounted`), or be served on a local
+    port (see `serve`).
+
+    Args:
+        latency_s: the time each request waits before being processed.
+        latency_jitter_s: a random additional wait, up to this many seconds.
+        page_size: the number of documents/rows per page of `find` results.
+        max_concurrent_requests: if set, the requests in excess of this number
+            of concurrent requests are rejected with a HTTP 429 status code.
+        seed: the seed for the random choices (latency jitter, faults).
+
+    Attributes:
+        request_count: the number of requests received so far.
+        command_counts: a Counter of the commands received so far.
+        throttled_count: the number of requests rejected for throttling.
+
+    Example:
+        >>> from astrapy import DataAPIClient
+        >>> from astrapy.testing import DataAPIEmulator, EmulatorFault
+        >>> emulator = DataAPIEmulator(latency_s=0.005)
+        >>> emulator.inject_fault(EmulatorFault(command="insertMany"))
+        >>> with emulator.mounted() as api_endpoint:
+        ...     database = DataAPIClient(environment="other").get_database(
+        ...         api_endpoint, keyspace="default_keyspace"
+        ...     )
+        ...     collection = database.get_collection("my_collection")
+        ...     collection.insert_many([{"a": i} for i in range(100)])
+        ...
+        Traceback (most recent call last):
+          ...
+        astrapy.exceptions.data_api_exceptions.CollectionInsertManyException: ...
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_s: float = 0.0,
+        latency_jitter_s: float = 0.0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_concurrent_requests: int | None = None,
+        seed: int | None = None,
+    ) -> None:
+        self.latency_s = latency_s
+        self.latency_jitter_s = latency_jitter_s
+        self.page_size = page_size
+        self.max_concurrent_requests = max_concurrent_requests
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stores: dict[tuple[str, str], _EmulatedStore] = {}
+        self._faults: list[EmulatorFault] = []
+        self._active_requests = 0
+        self.request_count = 0
+        self.command_counts: Counter[str] = Counter()
+        self.throttled_count = 0
+        self._handlers: dict[
+            str, Callable[[_EmulatedStore, dict[str, Any]], dict[str, Any]]
+        ] = {
+            "find": self._find,
+            "findOne": self._find_one,
+            "insertOne": self._insert_one,
+            "insertMany": self._insert_many,
+            "updateOne": self._update_one,
+            "updateMany": self._update_many,
+            "deleteMany": self._delete_many,
+            "countDocuments": self._count_documents,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(latency_s={self.latency_s}, "
+            f"page_size={self.page_size}, "
+            f"max_concurrent_requests={self.max_concurrent_requests})"
+        )
+
+    # data management
+
+    def create_collection(
+        self,
+        name: str,
+        *,
+        keyspace: str = DEFAULT_ASTRA_DB_KEYSPACE,
+        metric: str = "cosine",
+        documents: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """
+        Create (or replace) a collection, optionally with initial documents.
+
+        Args:
+            name: the name of the collection.
+            keyspace: the keyspace of the collection.
+            metric: the similarity metric for vector sorts ("cosine",
+                "dot_product" or "euclidean").
+            documents: the documents to store, in wire format (i.e. as they
+                would be found in an `insertMany` payload). Documents without
+                an `_id` get a random UUID string.
+        """
+
+        collection = _EmulatedCollection(name=name, metric=metric)
+        for document in documents or []:
+            new_document = collection.new_item(document)
+            collection.items[collection.key_of(new_document)] = new_document
+        with self._lock:
+            self._stores[(keyspace, name)] = collection
+
+    def create_table(
+        self,
+        name: str,
+        *,
+        columns: dict[str, str | dict[str, Any]],
+        primary_key: list[str],
+        keyspace: str = DEFAULT_ASTRA_DB_KEYSPACE,
+        metric: str = "cosine",
+        rows: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """
+        Create (or replace) a table, optionally with initial rows.
+
+        Args:
+            name: the name of the table.
+            columns: a map from column names to their type, either a string
+                such as "int" or a dictionary such as `{"type": "vector",
+                "dimension": 3}` (the format of the `projectionSchema`).
+            primary_key: the names of the primary key columns. The first column
+                is the partition key, the others are clustering columns (in
+                ascending order).
+            keyspace: the keyspace of the table.
+            metric: the similarity metric for vector sorts.
+            rows: the rows to store, in wire format.
+        """
+
+        table = _EmulatedTable(
+            name=name,
+            columns={
+                column: {"type": col_type} if isinstance(col_type, str) else col_type
+                for column, col_type in columns.items()
+            },
+            primary_key=primary_key,
+            metric=metric,
+        )
+        for row in rows or []:
+            new_row = table.new_item(row)
+            table.items[table.key_of(new_row)] = new_row
+        with self._lock:
+            self._stores[(keyspace, name)] = table
+
+    def documents(
+        self, name: str, *, keyspace: str = DEFAULT_ASTRA_DB_KEYSPACE
+    ) -> list[dict[str, Any]]:
+        """
+        The documents (or rows) stored in a collection (or table), in wire
+        format. An empty list is returned for unknown names.
+        """
+
+        with self._lock:
+            store = self._stores.get((keyspace, name))
+            if store is None:
+                return []
+            return copy.deepcopy(list(store.items.values()))
+
+    def inject_fault(self, fault: EmulatorFault) -> None:
+        """Add a fault to inject into the responses (see EmulatorFault)."""
+
+        with self._lock:
+            self._faults.append(fault)
+
+    def clear_faults(self) -> None:
+        """Remove all the faults still to be injected."""
+
+        with self._lock:
+            self._faults.clear()
+
+    # mounting
+
+    @contextmanager
+    def mounted(self, api_endpoint: str = DEFAULT_EMULATOR_ENDPOINT) -> Iterator[str]:
+        """
+        A context manager routing all astrapy requests to an API endpoint
+        (sync and async) to the emulator, without network.
+
+        Args:
+            api_endpoint: the API endpoint to emulate. Requests to other
+                endpoints are unaffected.
+
+        Returns:
+            the API endpoint, to create databases with.
+        """
+
+        mount_transport(api_endpoint, self)
+        try:
+            yield api_endpoint
+        finally:
+            unmount_transport(api_endpoint)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> EmulatorServer:
+        """
+        Start serving the emulator over HTTP, from background threads.
+
+        Args:
+            host: the interface to listen on.
+            port: the port to listen on. The default, zero, picks a free port.
+
+        Returns:
+            an EmulatorServer, whose `url` is the API endpoint to use and
+            whose `close` method stops the server.
+        """
+
+        return EmulatorServer(self, host=host, port=port)
+
+    # transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        status_code, content = self._handle(request.url.path, request.read())
+        return httpx.Response(
+            status_code,
+            content=content,
+            headers={"Content-Type": "application/json"},
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        if not self._enter_request():
+            return self._throttled_response()
+        try:
+            await asyncio.sleep(self._latency())
+            status_code, content = self._respond(request.url.path, body)
+        finally:
+            self._exit_request()
+        return httpx.Response(
+            status_code,
+            content=content,
+            headers={"Content-Type": "application/json"},
+        )
+
+    def _handle(self, path: str, body: bytes) -> tuple[int, bytes]:
+        if not self._enter_request():
+            throttled = self._throttled_response()
+            return throttled.status_code, throttled.content
+        try:
+            latency = self._latency()
+            if latency > 0:
+                time.sleep(latency)
+            return self._respond(path, body)
+        finally:
+            self._exit_request()
+
+    def _latency(self) -> float:
+        if self.latency_jitter_s > 0:
+            return self.latency_s + self._random.uniform(0, self.latency_jitter_s)
+        return self.latency_s
+
+    def _enter_request(self) -> bool:
+        with self._lock:
+            self.request_count += 1
+            if (
+                self.max_concurrent_requests is not None
+                and self._active_requests >= self.max_concurrent_requests
+            ):
+                self.throttled_count += 1
+                return False
+            self._active_requests += 1
+            return True
+
+    def _exit_request(self) -> None:
+        with self._lock:
+            self._active_requests -= 1
+
+    def _throttled_response(self) -> httpx.Response:
+        error = _EmulatedAPIError(
+            "TOO_MANY_REQUESTS", "Request rejected by the emulator throttling."
+        )
+        return httpx.Response(429, json={"errors": [error.as_dict()]})
+
+    def _pick_fault(self, command: str, target: str) -> EmulatorFault | None:
+        for fault in self._faults:
+            if fault.command is not None and fault.command != command:
+                continue
+            if fault.target is not None and fault.target != target:
+                continue
+            if self._random.random() >= fault.probability:
+                continue
+            if fault.times is not None:
+                fault.times -= 1
+                if fault.times <= 0:
+                    self._faults.remove(fault)
+            return fault
+        return None
+
+    def _respond(self, path: str, body: bytes) -> tuple[int, bytes]:
+        status_code = 200
+        try:
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                raise _EmulatedAPIError("INVALID_REQUEST", "Malformed JSON payload.")
+            if not isinstance(payload, dict) or len(payload) != 1:
+                raise _EmulatedAPIError(
+                    "INVALID_REQUEST", "The payload must contain exactly one command."
+                )
+            command, arguments = next(iter(payload.items()))
+            _arguments = arguments or {}
+            segments = [segment for segment in path.split("/") if segment]
+            with self._lock:
+                self.command_counts[command] += 1
+                target = segments[-1] if segments else ""
+                fault = self._pick_fault(command, target)
+                if fault is not None:
+                    if fault.http_status is not None:
+                        status_code = fault.http_status
+                    raise _EmulatedAPIError(fault.error_code, fault.message)
+                if command in {"createCollection", "deleteCollection"}:
+                    response = self._keyspace_command(target, command, _arguments)
+                elif command == "listTables":
+                    response = self._list_tables(target, _arguments)
+                elif command in self._handlers:
+                    if len(segments) < 2:
+                        raise _EmulatedAPIError(
+                            "INVALID_REQUEST", f"Unexpected path '{path}'."
+                        )
+                    store = self._stores.get((segments[-2], target))
+                    if store is None:
+                        store = _EmulatedCollection(name=target, metric="cosine")
+                        self._stores[(segments[-2], target)] = store
+                    response = self._handlers[command](store, _arguments)
+                else:
+                    raise _EmulatedAPIError(
+                        "UNSUPPORTED_COMMAND",
+                        f"Command '{command}' is not supported by the emulator.",
+                    )
+        except _EmulatedAPIError as api_error:
+            response = {"errors": [api_error.as_dict()]}
+        return status_code, json.dumps(response, separators=(",", ":")).encode()
+
+    # commands
+
+    def _keyspace_command(
+        self, keyspace: str, command: str, arguments: dict[str, Any]
+    ) -> dict[str, Any]:
+        name = arguments["name"]
+        if command == "createCollection":
+            metric = (arguments.get("options") or {}).get("vector", {}).get("metric")
+            self._stores[(keyspace, name)] = _EmulatedCollection(
+                name=name, metric=metric or "cosine"
+            )
+        else:
+            self._stores.pop((keyspace, name), None)
+        return {"status": {"ok": 1}}
+
+    def _list_tables(self, keyspace: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        tables = [
+            store
+            for (store_keyspace, _), store in self._stores.items()
+            if store_keyspace == keyspace and isinstance(store, _EmulatedTable)
+        ]
+        if (arguments.get("options") or {}).get("explain"):
+            return {"status": {"tables": [table.descriptor() for table in tables]}}
+        return {"status": {"tables": [table.name for table in tables]}}
+
+    def _select(
+        self,
+        store: _EmulatedStore,
+        arguments: dict[str, Any],
+        *,
+        paginate: bool,
+    ) -> tuple[list[dict[str, Any]], str | None, list[float] | None]:
+        # the selected items (projected, with similarities if required),
+        # the next page state and the query vector of a vector sort
+        filter = arguments.get("filter") or {}
+        sort = arguments.get("sort") or {}
+        options = arguments.get("options") or {}
+        projection = arguments.get("projection")
+        limit = options.get("limit")
+        matching = [item for item in store.items.values() if _matches(item, filter)]
+        similarities: dict[int, float] = {}
+        vector_sort = store.vector_sort(sort) if sort else None
+        next_page_state: str | None = None
+        if vector_sort is not None:
+            vector_field, query_vector = vector_sort
+            scored: list[tuple[float, dict[str, Any]]] = []
+            for item in matching:
+                item_vector = _vector_floats(item.get(vector_field))
+                if item_vector is not None:
+                    similarity = _similarity(store.metric, query_vector, item_vector)
+                    scored.append((similarity, item))
+            scored.sort(key=lambda pair: -pair[0])
+            matching = [item for _, item in scored]
+            similarities = {id(item): similarity for similarity, item in scored}
+        elif sort:
+            for field, direction in reversed(list(sort.items())):
+                matching.sort(
+                    key=lambda item: _sort_key(*_get_path(item, field)),
+                    reverse=direction == -1,
+                )
+        if sort:
+            start = options.get("skip") or 0
+            end = start + min(limit or MAX_SORTED_RESULTS, MAX_SORTED_RESULTS)
+        else:
+            start = int(options.get("pageState") or 0) if paginate else 0
+            end = start + self.page_size if paginate else start + 1
+            if limit:
+                end = min(end, limit)
+            if paginate and end < len(matching) and (not limit or end < limit):
+                next_page_state = str(end)
+        selected = []
+        for item in matching[start:end]:
+            projected = store.project(item, projection)
+            if options.get("includeSimilarity") and id(item) in similarities:
+                projected["$similarity"] = similarities[id(item)]
+            selected.append(projected)
+        return (
+            selected,
+            next_page_state,
+            vector_sort[1] if vector_sort is not None else None,
+        )
+
+    def _find(self, store: _EmulatedStore, arguments: dict[str, Any]) -> dict[str, Any]:
+        documents, next_page_state, query_vector = self._select(
+            store, arguments, paginate=True
+        )
+        status = store.status_extras(arguments.get("projection"))
+        if (arguments.get("options") or {}).get("includeSortVector"):
+            status["sortVector"] = query_vector
+        response: dict[str, Any] = {
+            "data": {"documents": documents, "nextPageState": next_page_state}
+        }
+        if status:
+            response["status"] = status
+        return response
+
+    def _find_one(
+        self, store: _EmulatedStore, arguments: dict[str, Any]
+    ) -> dict[str, Any]:
+        documents, _, _ = self._select(store, arguments, paginate=False)
+        response: dict[str, Any] = {
+            "data": {"document": documents[0] if documents else None}
+        }
+        status = store.status_extras(arguments.get("projection"))
+        if status:
+            response["status"] = status
+        return response
+
+    def _insert(self, store: _EmulatedStore, item: dict[str, Any]) -> Any:
+        new_item = store.new_item(item)
+        key = store.key_of(new_item)
+        if key in store.items and not store.is_table:
+            raise _EmulatedAPIError(
+                "DOCUMENT_ALREADY_EXISTS",
+                f"Document already exists with the given _id: {key}.",
+            )
+        store.items[key] = new_item
+        return store.identity_of(new_item)
+
+    def _insert_one(
+        self, store: _EmulatedStore, arguments: dict[str, Any]
+    ) -> dict[str, Any]:
+        status: dict[str, Any] = {
+            "insertedIds": [self._insert(store, arguments["document"])]
+        }
+        if isinstance(store, _EmulatedTable):
+            status["primaryKeySchema"] = store.primary_key_schema()
+        return {"status": status}
+
+    def _insert_many(
+        self, store: _EmulatedStore, arguments: dict[str, Any]
+    ) -> dict[str, Any]:
+        ordered = (arguments.get("options") or {}).get("ordered", False)
+        document_responses: list[dict[str, Any]] = []
+        errors: list[dict[str, Any]] = []
+        for document in arguments.get("documents") or []:
+            if ordered and errors:
+                document_responses.append(
+                    {"_id": store.response_id_of(document), "status": "SKIPPED"}
+                )
+                continue
+            try:
+                inserted_id = self._insert(store, document)
+                document_responses.append({"_id": inserted_id, "status": "OK"})
+            except _EmulatedAPIError as api_error:
+                document_responses.append(
+                    {
+                        "_id": store.response_id_of(document),
+                        "status": "ERROR",
+                        "errorsIdx": len(errors),
+                    }
+                )
+                errors.append(api_error.as_dict())
+        status: dict[str, Any] = {"documentResponses": document_responses}
+        if isinstance(store, _EmulatedTable):
+            status["primaryKeySchema"] = store.primary_key_schema()
+        response: dict[str, Any] = {"status": status}
+        if errors:
+            response["errors"] = errors
+        return response
+
+    def _upsert(
+        self, store: _EmulatedStore, filter: dict[str, Any], update: dict[str, Any]
+    ) -> Any:
+        document = copy.deepcopy(_equality_fields(filter))
+        _apply_update(document, update, inserting=True)
+        return self._insert(store, document)
+
+    def _update_one(
+        self, store: _EmulatedStore, arguments: dict[str, Any]
+    ) -> dict[str, Any]:
+        filter = arguments.get("filter") or {}
+        update = arguments.get("update") or {}
+        if isinstance(store, _EmulatedTable):
+            # on tables, updates are always upserts of the filtered primary key
+            key_values = _equality_fields(filter)
+            if set(key_values) != set(store.primary_key):
+                raise _EmulatedAPIError(
+                    "MISSING_PRIMARY_KEY_COLUMNS",
+                    "The filter must specify the full primary key.",
+                )
+            key = store.key_of(key_values)
+            row = store.items.get(key) or store.new_item(key_values)
+            updated = copy.deepcopy(row)
+            _apply_update(updated, update, inserting=False)
+            store.items[key] = store.new_item(updated)
+            return {"status": {"matchedCount": 1, "modifiedCount": 1}}
+        matching, _, _ = self._select(
+            store,
+            {"filter": filter, "sort": arguments.get("sort"), "projection": {"*": 1}},
+            paginate=False,
+        )
+        if not matching:
+            if (arguments.get("options") or {}).get("upsert"):
+                upserted_id = self._upsert(store, filter, update)
+                return {
+                    "status": {
+                        "matchedCount": 0,
+                        "modifiedCount": 0,
+                        "upsertedId": upserted_id,
+                    }
+                }
+            return {"status": {"matchedCount": 0, "modifiedCount": 0}}
+        document = store.items[store.key_of(matching[0])]
+        modified = _update_document(document, update)
+        return {"status": {"matchedCount": 1, "modifiedCount": int(modified)}}
+
+    def _update_many(
+        self, store: _EmulatedStore, arguments: dict[str, Any]
+    ) -> dict[str, Any]:
+        # items are processed in batches, by position in the insertion order,
+        # the page state being the position to resume from
+        filter = arguments.get("filter") or {}
+        update = arguments.get("update") or {}
+        options = arguments.get("options") or {}
+        start = int(options.get("pageState") or 0)
+        keys = list(store.items.keys())
+        matched = 0
+        modified = 0
+        next_page_state: str | None = None
+        for position in range(start, len(keys)):
+            document = store.items[keys[position]]
+            if not _matches(document, filter):
+                continue
+            if matched == UPDATE_MANY_PAGE_SIZE:
+                next_page_state = str(position)
+                break
+            matched += 1
+            modified += int(_update_document(document, update))
+        status: dict[str, Any] = {"matchedCount": matched, "modifiedCount": modified}
+        if next_page_state is not None:
+            status["moreData"] = True
+            status["nextPageState"] = next_page_state
+        elif matched == 0 and start == 0 and options.get("upsert"):
+            status["upsertedId"] = self._upsert(store, filter, update)
+        return {"status": status}
+
+    def _delete_many(
+        self, store: _EmulatedStore, arguments: dict[str, Any]
+    ) -> dict[str, Any]:
+        filter = arguments.get("filter") or {}
+        matching_keys = [
+            key for key, item in store.items.items() if _matches(item, filter)
+        ]
+        if isinstance(store, _EmulatedTable):
+            for key in matching_keys:
+                del store.items[key]
+            return {"status": {"deletedCount": -1}}
+        for key in matching_keys[:DELETE_MANY_PAGE_SIZE]:
+            del store.items[key]
+        status: dict[str, Any] = {
+            "deletedCount": min(len(matching_keys), DELETE_MANY_PAGE_SIZE)
+        }
+        if len(matching_keys) > DELETE_MANY_PAGE_SIZE:
+            status["moreData"] = True
+        return {"status": status}
+
+    def _count_documents(
+        self, store: _EmulatedStore, arguments: dict[str, Any]
+    ) -> dict[str, Any]:
+        filter = arguments.get("filter") or {}
+        count = sum(1 for item in store.items.values() if _matches(item, filter))
+        if count > MAX_COUNT:
+            return {"status": {"count": MAX_COUNT, "moreData": True}}
+        return {"status": {"count": count}}
@@ -0,0 +1,352 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from astrapy.exceptions import (
+    DataAPITimeoutException,
+    DevOpsAPITimeoutException,
+    _TimeoutContext,
+)
+from astrapy.settings.defaults import (
+    DEFAULT_ADMIN_METADATA_CACHE_CATALOG_TTL_MS,
+    DEFAULT_ADMIN_METADATA_CACHE_TTL_MS,
+)
+from astrapy.utils.file_utils import _atomic_write_text
+from astrapy.utils.lookup_cache import (
+    LookupCacheKey,
+    _LookupCacheEntry,
+    _SharedLookupCache,
+    waiting_timeout_text,
+)
+from astrapy.utils.metadata_cache import MetadataCacheStats
+
+logger = logging.getLogger(__name__)
+
+ADMIN_METADATA_CACHE_FILE_VERSION = 1
+
+
+class AdminMetadataCache(_SharedLookupCache):
+    """
+    A client-side cache for administrative lookups: database information
+    (`Database.info()`, `AstraDBDatabaseAdmin.info()`, `AstraDBAdmin.database_info()`),
+    available regions (`AstraDBAdmin.find_available_regions()`) and the catalogs
+    of embedding/reranking providers (`find_embedding_providers()`,
+    `find_reranking_providers()` of the database admins).
+
+    A cache is attached through the `admin_metadata_cache` setting of the API
+    options: all admin objects, databases and database admins spawned with that
+    setting share the same cache. Database information and the (rarely changing)
+    catalogs have separate time-to-live settings. Entries are kept separate for
+    different tokens. Concurrent lookups for the same item issue a single request,
+    whose response is shared by all of them.
+
+    Creating or dropping databases and keyspaces through the admin objects
+    invalidates the cached database information; the `invalidate` method
+    forces fresh lookups explicitly. Polling for database and keyspace
+    status changes never uses the cache.
+
+    Optionally, the cache can be persisted to a local JSON file, to survive
+    process restarts (e.g. to speed up the startup of short-lived workers).
+    The file holds the API responses, not the tokens.
+
+    Args:
+        ttl_ms: the time-to-live of cached database information, in milliseconds.
+            Passing None makes entries last until invalidated.
+        catalog_ttl_ms: the time-to-live of the cached region and provider catalogs,
+            in milliseconds. Passing None makes entries last until invalidated.
+        persist_path: if provided, the path to a file where the cache is persisted.
+            Existing (unexpired) entries are loaded from the file upon creation
+            of the cache, and the file is rewritten whenever the entries change.
+
+    Example:
+        >>> from astrapy import DataAPIClient
+        >>> from astrapy.api_options import AdminMetadataCache, APIOptions
+        >>>
+        >>> admin_cache = AdminMetadataCache(persist_path="/tmp/astrapy_admin.json")
+        >>> my_client = DataAPIClient(
+        ...     "AstraCS:...",
+        ...     api_options=APIOptions(admin_metadata_cache=admin_cache),
+        ... )
+        >>> my_astra_db_admin = my_client.get_admin()
+        >>> regions = my_astra_db_admin.find_available_regions()  # API request
+        >>> regions = my_astra_db_admin.find_available_regions()  # from the cache
+        >>> admin_cache.invalidate(kind=AdminMetadataCache.AVAILABLE_REGIONS)
+    """
+
+    DATABASE_INFO = "database_info"
+    AVAILABLE_REGIONS = "available_regions"
+    EMBEDDING_PROVIDERS = "embedding_providers"
+    RERANKING_PROVIDERS = "reranking_providers"
+
+    def __init__(
+        self,
+        *,
+        ttl_ms: int | None = DEFAULT_ADMIN_METADATA_CACHE_TTL_MS,
+        catalog_ttl_ms: int | None = DEFAULT_ADMIN_METADATA_CACHE_CATALOG_TTL_MS,
+        persist_path: str | None = None,
+    ) -> None:
+        for ttl_name, ttl_value in (
+            ("ttl_ms", ttl_ms),
+            ("catalog_ttl_ms", catalog_ttl_ms),
+        ):
+            if ttl_value is not None and ttl_value <= 0:
+                raise ValueError(
+                    f"The cache `{ttl_name}` must be a positive integer or None."
+                )
+        super().__init__()
+        self.ttl_ms = ttl_ms
+        self.catalog_ttl_ms = catalog_ttl_ms
+        self.persist_path = persist_path
+        self._persist_lock = threading.Lock()
+        if self.persist_path is not None:
+            self._load_persisted()
+
+    def __repr__(self) -> str:
+        pieces = [
+            f"ttl_ms={self.ttl_ms}",
+            f"catalog_ttl_ms={self.catalog_ttl_ms}",
+            None
+            if self.persist_path is None
+            else f'persist_path="{self.persist_path}"',
+        ]
+        inner_desc = ", ".join(pc for pc in pieces if pc is not None)
+        return f"{self.__class__.__name__}({inner_desc})"
+
+    def stats(self) -> MetadataCacheStats:
+        """
+        Return a snapshot of the cache counters.
+
+        Returns:
+            a MetadataCacheStats object.
+        """
+
+        with self._lock:
+            return MetadataCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                deduplicated=self._deduplicated,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+            )
+
+    def invalidate(
+        self,
+        *,
+        kind: str | None = None,
+        database_id: str | None = None,
+    ) -> None:
+        """
+        Discard cached entries, so that the next lookups reach the API.
+        With no arguments, the whole cache is cleared.
+
+        Args:
+            kind: if provided, only the entries of this kind are discarded. This is
+                one of `AdminMetadataCache.DATABASE_INFO`, `.AVAILABLE_REGIONS`,
+                `.EMBEDDING_PROVIDERS` and `.RERANKING_PROVIDERS`.
+            database_id: if provided, only the database information for the
+                database with this ID is discarded.
+        """
+
+        self._discard(self._invalidation_predicate(kind, database_id))
+        self._after_change()
+
+    async def _async_invalidate(
+        self,
+        *,
+        kind: str | None = None,
+        database_id: str | None = None,
+    ) -> None:
+        self._discard(self._invalidation_predicate(kind, database_id))
+        await self._async_after_change()
+
+    def _invalidation_predicate(
+        self,
+        kind: str | None,
+        database_id: str | None,
+    ) -> Callable[[LookupCacheKey], bool]:
+        _kind = self.DATABASE_INFO if database_id is not None else kind
+
+        def _predicate(key: LookupCacheKey) -> bool:
+            if _kind is not None and key[0] != _kind:
+                return False
+            return database_id is None or key[3] == database_id
+
+        return _predicate
+
+    def _now(self) -> float:
+        # wall-clock time, as expiration times are persisted
+        return time.time()
+
+    def _ttl_ms_for(self, key: LookupCacheKey) -> int | None:
+        if key[0] == self.DATABASE_INFO:
+            return self.ttl_ms
+        return self.catalog_ttl_ms
+
+    def _after_change(self) -> None:
+        if self.persist_path is not None:
+            self._persist()
+
+    async def _async_after_change(self) -> None:
+        if self.persist_path is not None:
+            await asyncio.to_thread(self._persist)
+
+    def _persist(self) -> None:
+        if self.persist_path is None:
+            return
+        with self._lock:
+            file_entries = [
+                {
+                    "key": list(key),
+                    "response": entry.response,
+                    "expires_at": entry.expires_at,
+                }
+                for key, entry in self._entries.items()
+            ]
+        with self._persist_lock:
+            try:
+                _atomic_write_text(
+                    self.persist_path,
+                    json.dumps(
+                        {
+                            "version": ADMIN_METADATA_CACHE_FILE_VERSION,
+                            "entries": file_entries,
+                        }
+                    ),
+                )
+            except OSError as exc:
+                logger.warning(f"Could not persist the admin metadata cache: {exc}")
+
+    def _load_persisted(self) -> None:
+        if self.persist_path is None or not os.path.isfile(self.persist_path):
+            return
+        try:
+            with open(self.persist_path) as i_file:
+                file_content = json.load(i_file)
+            if file_content.get("version") != ADMIN_METADATA_CACHE_FILE_VERSION:
+                raise ValueError("unsupported file version")
+            now = self._now()
+            with self._lock:
+                for file_entry in file_content["entries"]:
+                    expires_at = file_entry["expires_at"]
+                    if expires_at is None or expires_at > now:
+                        self._entries[tuple(file_entry["key"])] = _LookupCacheEntry(
+                            response=file_entry["response"],
+                            expires_at=expires_at,
+                        )
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning(f"Could not load the admin metadata cache: {exc}")
+
+
+def admin_metadata_cache_key(
+    kind: str,
+    *,
+    token: str | None,
+    base_url: str,
+    detail: str,
+) -> LookupCacheKey:
+    """
+    Build the key for an entry of an AdminMetadataCache. Entries for different
+    tokens are kept separate (only a digest of the token ends up in the key).
+    """
+
+    token_digest = hashlib.sha256((token or "").encode()).hexdigest()[:16]
+    return (kind, token_digest, base_url.rstrip("/"), detail)
+
+
+def _admin_timeout_exception_factory(
+    *,
+    timeout_context: _TimeoutContext,
+    endpoint: str,
+    dev_ops_api: bool,
+) -> Callable[[], Exception]:
+    def _factory() -> Exception:
+        exc_class = (
+            DevOpsAPITimeoutException if dev_ops_api else DataAPITimeoutException
+        )
+        return exc_class(
+            text=waiting_timeout_text(timeout_context),
+            timeout_type="generic",
+            endpoint=endpoint,
+            raw_payload=None,
+        )
+
+    return _factory
+
+
+def _waiting_timeout_s(timeout_context: _TimeoutContext) -> float | None:
+    if not timeout_context.request_ms:
+        return None
+    return timeout_context.request_ms / 1000.0
+
+
+def cached_admin_lookup(
+    cache: AdminMetadataCache | None,
+    key: LookupCacheKey,
+    loader: Callable[[], Any],
+    *,
+    timeout_context: _TimeoutContext,
+    dev_ops_api: bool,
+) -> Any:
+    """
+    Run an admin lookup through a cache, if one is provided. Lookups waiting
+    for an identical request in flight obey the timeout of the request.
+    """
+
+    if cache is None:
+        return loader()
+    return cache._get_or_load(
+        key,
+        loader,
+        timeout_s=_waiting_timeout_s(timeout_context),
+        timeout_exception=_admin_timeout_exception_factory(
+            timeout_context=timeout_context,
+            endpoint=key[2],
+            dev_ops_api=dev_ops_api,
+        ),
+    )
+
+
+async def async_cached_admin_lookup(
+    cache: AdminMetadataCache | None,
+    key: LookupCacheKey,
+    loader: Callable[[], Awaitable[Any]],
+    *,
+    timeout_context: _TimeoutContext,
+    dev_ops_api: bool,
+) -> Any:
+    """Async counterpart of `cached_admin_lookup`."""
+
+    if cache is None:
+        return await loader()
+    return await cache._async_get_or_load(
+        key,
+        loader,
+        timeout_s=_waiting_timeout_s(timeout_context),
+        timeout_exception=_admin_timeout_exception_factory(
+            timeout_context=timeout_context,
+            endpoint=key[2],
+            dev_ops_api=dev_ops_api,
+        ),
+    )
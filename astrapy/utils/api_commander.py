@@ -14,23 +14,27 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import re
-import ssl
+import time
 import weakref
 from collections.abc import Iterable, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
 from decimal import Decimal
 from types import TracebackType
 from typing import Any, cast
 
-import certifi
 import httpx
 from uuid6 import uuid7
 
-from astrapy.constants import CallerType
+from astrapy.constants import CallerType, ConnectionReuseMode
 from astrapy.event_observers import (
     ObservableError,
+    ObservableEvent,
+    ObservableEventType,
     ObservableRequest,
     ObservableResponse,
     ObservableWarning,
@@ -39,6 +43,7 @@ from astrapy.event_observers import (
 from astrapy.exceptions import (
     DataAPIHttpException,
     DataAPIResponseException,
+    DataAPITimeoutException,
     DevOpsAPIHttpException,
     DevOpsAPIResponseException,
     UnexpectedDataAPIResponseException,
@@ -56,14 +61,34 @@ from astrapy.settings.defaults import (
     DEFAULT_REDACTED_HEADER_NAMES,
     FIXED_SECRET_PLACEHOLDER,
 )
-from astrapy.utils.meta import issue_plain_warning
-from astrapy.utils.python_version import get_python_version
+from astrapy.utils.http_clients import (
+    _HTTPClientPool,
+    get_client_pool,
+    get_ssl_context,
+)
+from astrapy.utils.lookup_cache import waiting_timeout_text
+from astrapy.utils.metadata_cache import (
+    METADATA_COMMANDS,
+    SCHEMA_CHANGING_COMMANDS,
+    MetadataCache,
+    MetadataCacheKey,
+)
+from astrapy.utils.operation_stats import OperationStats, current_stats_collectors
+from astrapy.utils.profiling import ProfilePhase, profile_phase
+from astrapy.utils.read_cache import (
+    CACHEABLE_COMMANDS,
+    SCHEMA_COMMANDS,
+    ReadCache,
+    ReadCacheKey,
+    _invalidate_for_schema_command,
+)
 from astrapy.utils.request_tools import (
     HttpMethod,
     log_httpx_request,
     log_httpx_response,
     to_httpx_timeout,
 )
+from astrapy.utils.tracing import current_request_attributes, request_scope
 from astrapy.utils.user_agents import (
     compose_full_user_agent,
     detect_astrapy_user_agent,
@@ -71,29 +96,15 @@ from astrapy.utils.user_agents import (
 
 user_agent_astrapy = detect_astrapy_user_agent()
 
-PYTHON_VERSION_SSL_ISSUES_WARNING = (
-    "SSL connection reuse disabled due to a Python 3.12.[0-11] bug. "
-    "This may reduce performance under certain workloads. "
-    "Please upgrade to Python 3.12.12 or newer if possible."
-)
-CLIENT_SSL_CONTEXT = ssl.create_default_context(
-    cafile=certifi.where()
-)  # portable CA roots
-
 logger = logging.getLogger(__name__)
 
-# Used only for a range of Python versions where a SSL bug is detected.
-no_pooling_limits = httpx.Limits(max_keepalive_connections=0, keepalive_expiry=0)
-disable_ssl_reuse: bool
-python_version = get_python_version()
-if python_version >= (3, 12, 0) and python_version < (3, 12, 12):
-    issue_plain_warning(
-        PYTHON_VERSION_SSL_ISSUES_WARNING,
-        stacklevel=3,
-    )
-    disable_ssl_reuse = True
-else:
-    disable_ssl_reuse = False
+
+def __getattr__(name: str) -> Any:
+    # the default SSL context, formerly created at import time
+    if name == "CLIENT_SSL_CONTEXT":
+        return get_ssl_context()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # these are a mixture from disparate alphabet, to minimize the chance
 # of a collision with user-provided actual content:
@@ -126,10 +137,41 @@ class _MarkedDecimalEncoder(json.JSONEncoder):
         return re.sub(DECIMAL_CLEANER_PATTERN, r"\1", json_string)
 
 
-class APICommander:
-    client: httpx.Client
-    async_client: httpx.AsyncClient
+@dataclass
+class _RequestMeasures:
+    """
+    The measurements taken while processing a request, for the observer events.
+    """
+
+    command_name: str | None = None
+    started_at: float = 0.0
+    ended_at: float = 0.0
+    encode_duration_s: float = 0.0
+    payload_size: int = 0
 
+
+def _record_request_stats(
+    stats_collectors: tuple[OperationStats, ...],
+    *,
+    measures: _RequestMeasures,
+    payload: dict[str, Any] | None,
+    raw_response: httpx.Response | None,
+) -> None:
+    ended_at = measures.ended_at or time.perf_counter()
+    chunk_size: int | None = None
+    if measures.command_name == "insertMany" and payload is not None:
+        chunk_size = len(payload["insertMany"].get("documents") or [])
+    for stats in stats_collectors:
+        stats._record_request(
+            latency_s=ended_at - measures.started_at - measures.encode_duration_s,
+            bytes_out=measures.payload_size,
+            bytes_in=len(raw_response.content) if raw_response is not None else 0,
+            page="page_number" in current_request_attributes(),
+            chunk_size=chunk_size,
+        )
+
+
+class APICommander:
     def __init__(
         self,
         *,
@@ -144,27 +186,23 @@ class APICommander:
         handle_decimals_writes: bool = False,
         handle_decimals_reads: bool = False,
         ca_cert_path: str | None = None,
+        connection_reuse_mode: ConnectionReuseMode | None = None,
+        read_cache: ReadCache | None = None,
+        metadata_cache: MetadataCache | None = None,
     ) -> None:
         self.ca_cert_path = ca_cert_path
-        if ca_cert_path is not None:
-            ssl_context = ssl.create_default_context(cafile=ca_cert_path)
-        else:
-            ssl_context = CLIENT_SSL_CONTEXT
+        self.connection_reuse_mode = connection_reuse_mode
+        self.read_cache = read_cache
+        self.metadata_cache = metadata_cache
+        # the (costly) httpx clients are shared, and created on first use
+        self._client_pool: _HTTPClientPool = get_client_pool(
+            ca_cert_path, connection_reuse_mode
+        )
 
         ssl_control_headers: dict[str, str | None]
-        if disable_ssl_reuse:
-            self.client = httpx.Client(
-                limits=no_pooling_limits,
-                verify=ssl_context,
-            )
-            self.async_client = httpx.AsyncClient(
-                limits=no_pooling_limits,
-                verify=ssl_context,
-            )
+        if self._client_pool.connection_reuse_mode == ConnectionReuseMode.DISABLED:
             ssl_control_headers = {"Connection": "close"}
         else:
-            self.client = httpx.Client(verify=ssl_context)
-            self.async_client = httpx.AsyncClient(verify=ssl_context)
             ssl_control_headers = {}
 
         self.api_endpoint = api_endpoint.rstrip("/")
@@ -230,6 +268,16 @@ class APICommander:
             else FIXED_SECRET_PLACEHOLDER
             for k, v in self.full_headers.items()
         }
+        # (cached responses are only ever served back to the same credentials)
+        self._credentials_digest = hashlib.sha256(
+            json.dumps(
+                sorted(
+                    (k.upper(), v)
+                    for k, v in self.full_headers.items()
+                    if k.upper() in self.upper_full_redacted_header_names
+                )
+            ).encode()
+        ).hexdigest()[:16]
         self.full_path = ("/".join([self.api_endpoint, self.path])).rstrip("/")
 
     def __repr__(self) -> str:
@@ -257,6 +305,14 @@ class APICommander:
         else:
             return False
 
+    @property
+    def client(self) -> httpx.Client:
+        return self._client_pool.get_client()
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        return self._client_pool.get_async_client()
+
     async def __aenter__(self) -> APICommander:
         return self
 
@@ -266,7 +322,9 @@ class APICommander:
         exc_value: BaseException | None = None,
         traceback: TracebackType | None = None,
     ) -> None:
-        await self.async_client.aclose()
+        # the client of this event loop is dropped from the pool and closed once
+        # idle (the other commanders sharing it transparently get a new one)
+        await self._client_pool.retire_async_client()
 
     def _get_spawner(self) -> object | None:
         if self.spawner_ref is None:
@@ -298,6 +356,9 @@ class APICommander:
             ),
             dev_ops_api=dev_ops_api if dev_ops_api is not None else self.dev_ops_api,
             ca_cert_path=self.ca_cert_path,
+            connection_reuse_mode=self.connection_reuse_mode,
+            read_cache=self.read_cache,
+            metadata_cache=self.metadata_cache,
         )
 
     def _compose_request_url(self, additional_path: str | None) -> str:
@@ -313,24 +374,38 @@ class APICommander:
         payload: dict[str, Any] | None,
         caller_function_name: str | None,
         request_id: str,
+        measures: _RequestMeasures | None = None,
     ) -> dict[str, Any]:
         # try to process the httpx raw response into a JSON or throw a failure
+        # (if measures are passed, the response event is dispatched here)
         raw_response_json: dict[str, Any]
+        decode_start = time.perf_counter()
         try:
-            if self.handle_decimals_reads:
-                # for decimal-aware contents (aka 'tables'), all number-looking things
-                # are made into Decimal.
-                # (for collections, this will be it. for Tables, schema-aware
-                # proper post-processing will refine types, e.g. back to int, ...)
-                raw_response_json = self._decimal_aware_parse_json_response(
-                    raw_response.text,
-                )
-            else:
-                raw_response_json = self._decimal_unaware_parse_json_response(
-                    raw_response.text,
-                )
+            with profile_phase(
+                ProfilePhase.DECODE, command=self._command_name(payload)
+            ):
+                if self.handle_decimals_reads:
+                    # for decimal-aware contents (aka 'tables'), all number-looking
+                    # things are made into Decimal.
+                    # (for collections, this will be it. for Tables, schema-aware
+                    # proper post-processing will refine types, e.g. back to int...)
+                    raw_response_json = self._decimal_aware_parse_json_response(
+                        raw_response.text,
+                    )
+                else:
+                    raw_response_json = self._decimal_unaware_parse_json_response(
+                        raw_response.text,
+                    )
         except ValueError:
             # json() parsing has failed (e.g., empty body)
+            if measures is not None:
+                self._dispatch_response_event(
+                    raw_response,
+                    measures=measures,
+                    decode_duration_s=None,
+                    caller_function_name=caller_function_name,
+                    request_id=request_id,
+                )
             if payload is not None:
                 command_desc = "/".join(sorted(payload.keys()))
             else:
@@ -341,6 +416,14 @@ class APICommander:
                     "raw_response": raw_response.text,
                 },
             )
+        if measures is not None:
+            self._dispatch_response_event(
+                raw_response,
+                measures=measures,
+                decode_duration_s=time.perf_counter() - decode_start,
+                caller_function_name=caller_function_name,
+                request_id=request_id,
+            )
 
         # no warnings check for DevOps API (there, 'status' may contain a string)
         dictforced_response: dict[str, Any] = (
@@ -355,21 +438,19 @@ class APICommander:
                     DataAPIWarningDescriptor(warning_item)
                     for warning_item in warning_items
                 ]
-                if self.event_observers:
-                    wrn_events = [
-                        ObservableWarning(warning=warning_descriptor)
-                        for warning_descriptor in warning_descriptors
-                    ]
-                    sender = self._get_spawner()
-                    for ev_obs in self.event_observers.values():
-                        if ev_obs is not None and ev_obs.enabled:
-                            for wrn_event in wrn_events:
-                                ev_obs.receive(
-                                    wrn_event,
-                                    sender=sender,
-                                    function_name=caller_function_name,
-                                    request_id=request_id,
-                                )
+                for stats in current_stats_collectors():
+                    stats._record_warnings(warning_descriptors)
+                wrn_observers = self._interested_observers(ObservableEventType.WARNING)
+                if wrn_observers:
+                    self._dispatch_events(
+                        wrn_observers,
+                        [
+                            ObservableWarning(warning=warning_descriptor)
+                            for warning_descriptor in warning_descriptors
+                        ],
+                        caller_function_name=caller_function_name,
+                        request_id=request_id,
+                    )
                 for warning_descriptor in warning_descriptors:
                     full_warning = (
                         f"The {self._api_description} returned "
@@ -378,21 +459,17 @@ class APICommander:
                     logger.warning(full_warning)
 
         if "errors" in dictforced_response:
-            if self.event_observers:
-                err_events = [
-                    ObservableError(error=DataAPIErrorDescriptor(err_dict))
-                    for err_dict in dictforced_response["errors"]
-                ]
-                sender = self._get_spawner()
-                for ev_obs in self.event_observers.values():
-                    if ev_obs is not None and ev_obs.enabled:
-                        for err_event in err_events:
-                            ev_obs.receive(
-                                err_event,
-                                sender=sender,
-                                function_name=caller_function_name,
-                                request_id=request_id,
-                            )
+            err_observers = self._interested_observers(ObservableEventType.ERROR)
+            if err_observers:
+                self._dispatch_events(
+                    err_observers,
+                    [
+                        ObservableError(error=DataAPIErrorDescriptor(err_dict))
+                        for err_dict in dictforced_response["errors"]
+                    ],
+                    caller_function_name=caller_function_name,
+                    request_id=request_id,
+                )
             if raise_api_errors:
                 logger.warning(
                     f"APICommander about to raise from: {dictforced_response['errors']}"
@@ -404,6 +481,81 @@ class APICommander:
 
         return raw_response_json
 
+    def _command_name(self, payload: dict[str, Any] | None) -> str | None:
+        if self.dev_ops_api or not payload:
+            return None
+        return next(iter(payload))
+
+    def _request_scope(
+        self, payload: dict[str, Any] | None
+    ) -> AbstractContextManager[Any]:
+        # a scope for the request (observers may need its end, e.g. for tracing)
+        if not self.event_observers:
+            return nullcontext()
+        return request_scope(self._command_name(payload))
+
+    def _interested_observers(self, event_type: ObservableEventType) -> list[Observer]:
+        # (empty if the events of this type are not to be even created)
+        if not self.event_observers:
+            return []
+        return [
+            ev_obs
+            for ev_obs in self.event_observers.values()
+            if ev_obs is not None
+            and ev_obs.enabled
+            and ev_obs.is_interested(event_type)
+        ]
+
+    def _dispatch_events(
+        self,
+        observers: list[Observer],
+        events: list[ObservableEvent],
+        *,
+        caller_function_name: str | None,
+        request_id: str,
+    ) -> None:
+        sender = self._get_spawner()
+        for ev_obs in observers:
+            for event in events:
+                ev_obs.receive(
+                    event,
+                    sender=sender,
+                    function_name=caller_function_name,
+                    request_id=request_id,
+                )
+
+    def _dispatch_response_event(
+        self,
+        raw_response: httpx.Response,
+        *,
+        measures: _RequestMeasures,
+        decode_duration_s: float | None,
+        caller_function_name: str | None,
+        request_id: str,
+    ) -> None:
+        rsp_observers = self._interested_observers(ObservableEventType.RESPONSE)
+        if not rsp_observers:
+            return
+        # the body is decoded into a string only if someone needs it
+        needs_body = any(ev_obs.needs_body for ev_obs in rsp_observers)
+        rsp_event = ObservableResponse(
+            body=raw_response.text if needs_body else None,
+            status_code=raw_response.status_code,
+            command_name=measures.command_name,
+            started_at=measures.started_at,
+            ended_at=measures.ended_at,
+            encode_duration_s=measures.encode_duration_s,
+            decode_duration_s=decode_duration_s,
+            payload_size=measures.payload_size,
+            response_size=len(raw_response.content),
+        )
+        self._dispatch_events(
+            rsp_observers,
+            [rsp_event],
+            caller_function_name=caller_function_name,
+            request_id=request_id,
+        )
+
     @staticmethod
     def _decimal_unaware_parse_json_response(response_text: str) -> dict[str, Any]:
         return cast(
@@ -473,16 +625,28 @@ class APICommander:
         additional_path: str | None = None,
         request_params: dict[str, Any] = {},
         timeout_context: _TimeoutContext | None = None,
+        measures: _RequestMeasures | None = None,
     ) -> httpx.Response:
+        # if measures are passed, they are filled and the response event for
+        # a successful response is left to the caller (who decodes the response)
         if request_id is None:
             request_id = str(uuid7())
+        _measures = measures or _RequestMeasures()
+        _measures.command_name = self._command_name(payload)
+        _measures.started_at = time.perf_counter()
         request_url = self._compose_request_url(additional_path)
         _timeout_context = timeout_context or _TimeoutContext(request_ms=None)
-        encoded_payload = (
-            self._decimal_aware_encode_payload(payload)
-            if self.handle_decimals_writes
-            else self._decimal_unaware_encode_payload(payload)
-        )
+        with profile_phase(ProfilePhase.ENCODE, command=_measures.command_name):
+            encoded_payload = (
+                self._decimal_aware_encode_payload(payload)
+                if self.handle_decimals_writes
+                else self._decimal_unaware_encode_payload(payload)
+            )
+            request_content = (
+                encoded_payload.encode() if encoded_payload is not None else None
+            )
+        _measures.encode_duration_s = time.perf_counter() - _measures.started_at
+        _measures.payload_size = len(request_content) if request_content else 0
         log_httpx_request(
             http_method=http_method,
             full_url=request_url,
@@ -493,7 +657,8 @@ class APICommander:
             caller_function_name=caller_function_name,
         )
         httpx_timeout_s = to_httpx_timeout(_timeout_context)
-        if self.event_observers:
+        req_observers = self._interested_observers(ObservableEventType.REQUEST)
+        if req_observers:
             req_event = ObservableRequest(
                 payload=encoded_payload,
                 http_method=http_method,
@@ -501,29 +666,41 @@ class APICommander:
                 query_parameters=request_params,
                 redacted_headers=self._loggable_headers,
                 dev_ops_api=self.dev_ops_api,
+                command_name=_measures.command_name,
+                started_at=_measures.started_at,
+                encode_duration_s=_measures.encode_duration_s,
+                payload_size=_measures.payload_size,
+            )
+            self._dispatch_events(
+                req_observers,
+                [req_event],
+                caller_function_name=caller_function_name,
+                request_id=request_id,
             )
-            sender = self._get_spawner()
-            for ev_obs in self.event_observers.values():
-                if ev_obs is not None and ev_obs.enabled:
-                    ev_obs.receive(
-                        req_event,
-                        sender=sender,
-                        function_name=caller_function_name,
-                        request_id=request_id,
-                    )
 
         try:
-            raw_response = self.client.request(
-                method=http_method,
-                url=request_url,
-                content=encoded_payload.encode()
-                if encoded_payload is not None
-                else None,
-                params=request_params,
-                timeout=httpx_timeout_s,
-                headers=self.full_headers,
-            )
+            with profile_phase(ProfilePhase.NETWORK, command=_measures.command_name):
+                pooled_client = self._client_pool.acquire_client()
+                try:
+                    raw_response = cast(httpx.Client, pooled_client.client).request(
+                        method=http_method,
+                        url=request_url,
+                        content=request_content,
+                        params=request_params,
+                        timeout=httpx_timeout_s,
+                        headers=self.full_headers,
+                    )
+                finally:
+                    self._client_pool.release_client(pooled_client)
         except httpx.TimeoutException as timeout_exc:
+            stats_collectors = current_stats_collectors()
+            if stats_collectors:
+                _record_request_stats(
+                    stats_collectors,
+                    measures=_measures,
+                    payload=payload,
+                    raw_response=None,
+                )
             if self.dev_ops_api:
                 raise to_devopsapi_timeout_exception(
                     timeout_exc, timeout_context=_timeout_context
@@ -533,19 +710,23 @@ class APICommander:
                     timeout_exc, timeout_context=_timeout_context
                 )
 
-        if self.event_observers:
-            rsp_event = ObservableResponse(
-                body=raw_response.text,
-                status_code=raw_response.status_code,
+        _measures.ended_at = time.perf_counter()
+        stats_collectors = current_stats_collectors()
+        if stats_collectors:
+            _record_request_stats(
+                stats_collectors,
+                measures=_measures,
+                payload=payload,
+                raw_response=raw_response,
+            )
+        if self.event_observers and (measures is None or not raw_response.is_success):
+            self._dispatch_response_event(
+                raw_response,
+                measures=_measures,
+                decode_duration_s=None,
+                caller_function_name=caller_function_name,
+                request_id=request_id,
             )
-            for ev_obs in self.event_observers.values():
-                if ev_obs is not None and ev_obs.enabled:
-                    ev_obs.receive(
-                        rsp_event,
-                        sender=self._get_spawner(),
-                        function_name=caller_function_name,
-                        request_id=request_id,
-                    )
         try:
             raw_response.raise_for_status()
         except httpx.HTTPStatusError as http_exc:
@@ -563,16 +744,28 @@ class APICommander:
         additional_path: str | None = None,
         request_params: dict[str, Any] = {},
         timeout_context: _TimeoutContext | None = None,
+        measures: _RequestMeasures | None = None,
     ) -> httpx.Response:
+        # if measures are passed, they are filled and the response event for
+        # a successful response is left to the caller (who decodes the response)
         if request_id is None:
             request_id = str(uuid7())
+        _measures = measures or _RequestMeasures()
+        _measures.command_name = self._command_name(payload)
+        _measures.started_at = time.perf_counter()
         request_url = self._compose_request_url(additional_path)
         _timeout_context = timeout_context or _TimeoutContext(request_ms=None)
-        encoded_payload = (
-            self._decimal_aware_encode_payload(payload)
-            if self.handle_decimals_writes
-            else self._decimal_unaware_encode_payload(payload)
-        )
+        with profile_phase(ProfilePhase.ENCODE, command=_measures.command_name):
+            encoded_payload = (
+                self._decimal_aware_encode_payload(payload)
+                if self.handle_decimals_writes
+                else self._decimal_unaware_encode_payload(payload)
+            )
+            request_content = (
+                encoded_payload.encode() if encoded_payload is not None else None
+            )
+        _measures.encode_duration_s = time.perf_counter() - _measures.started_at
+        _measures.payload_size = len(request_content) if request_content else 0
         log_httpx_request(
             http_method=http_method,
             full_url=request_url,
@@ -583,7 +776,8 @@ class APICommander:
             caller_function_name=caller_function_name,
         )
         httpx_timeout_s = to_httpx_timeout(_timeout_context)
-        if self.event_observers:
+        req_observers = self._interested_observers(ObservableEventType.REQUEST)
+        if req_observers:
             req_event = ObservableRequest(
                 payload=encoded_payload,
                 http_method=http_method,
@@ -591,29 +785,43 @@ class APICommander:
                 query_parameters=request_params,
                 redacted_headers=self._loggable_headers,
                 dev_ops_api=self.dev_ops_api,
+                command_name=_measures.command_name,
+                started_at=_measures.started_at,
+                encode_duration_s=_measures.encode_duration_s,
+                payload_size=_measures.payload_size,
+            )
+            self._dispatch_events(
+                req_observers,
+                [req_event],
+                caller_function_name=caller_function_name,
+                request_id=request_id,
             )
-            sender = self._get_spawner()
-            for ev_obs in self.event_observers.values():
-                if ev_obs is not None and ev_obs.enabled:
-                    ev_obs.receive(
-                        req_event,
-                        sender=sender,
-                        function_name=caller_function_name,
-                        request_id=request_id,
-                    )
 
         try:
-            raw_response = await self.async_client.request(
-                method=http_method,
-                url=request_url,
-                content=encoded_payload.encode()
-                if encoded_payload is not None
-                else None,
-                params=request_params,
-                timeout=httpx_timeout_s,
-                headers=self.full_headers,
-            )
+            with profile_phase(ProfilePhase.NETWORK, command=_measures.command_name):
+                pooled_client = self._client_pool.acquire_async_client()
+                try:
+                    raw_response = await cast(
+                        httpx.AsyncClient, pooled_client.client
+                    ).request(
+                        method=http_method,
+                        url=request_url,
+                        content=request_content,
+                        params=request_params,
+                        timeout=httpx_timeout_s,
+                        headers=self.full_headers,
+                    )
+                finally:
+                    await self._client_pool.release_async_client(pooled_client)
         except httpx.TimeoutException as timeout_exc:
+            stats_collectors = current_stats_collectors()
+            if stats_collectors:
+                _record_request_stats(
+                    stats_collectors,
+                    measures=_measures,
+                    payload=payload,
+                    raw_response=None,
+                )
             if self.dev_ops_api:
                 raise to_devopsapi_timeout_exception(
                     timeout_exc, timeout_context=_timeout_context
@@ -623,20 +831,23 @@ class APICommander:
                     timeout_exc, timeout_context=_timeout_context
                 )
 
-        if self.event_observers:
-            rsp_event = ObservableResponse(
-                body=raw_response.text,
-                status_code=raw_response.status_code,
+        _measures.ended_at = time.perf_counter()
+        stats_collectors = current_stats_collectors()
+        if stats_collectors:
+            _record_request_stats(
+                stats_collectors,
+                measures=_measures,
+                payload=payload,
+                raw_response=raw_response,
+            )
+        if self.event_observers and (measures is None or not raw_response.is_success):
+            self._dispatch_response_event(
+                raw_response,
+                measures=_measures,
+                decode_duration_s=None,
+                caller_function_name=caller_function_name,
+                request_id=request_id,
             )
-            sender = self._get_spawner()
-            for ev_obs in self.event_observers.values():
-                if ev_obs is not None and ev_obs.enabled:
-                    ev_obs.receive(
-                        rsp_event,
-                        sender=sender,
-                        function_name=caller_function_name,
-                        request_id=request_id,
-                    )
         try:
             raw_response.raise_for_status()
         except httpx.HTTPStatusError as http_exc:
@@ -644,6 +855,85 @@ class APICommander:
         log_httpx_response(response=raw_response)
         return raw_response
 
+    def _read_cache_key(
+        self,
+        http_method: str,
+        payload: dict[str, Any] | None,
+        additional_path: str | None,
+    ) -> tuple[str, ReadCacheKey | None]:
+        # the request URL, along with the cache key if the command is a cacheable read
+        request_url = self._compose_request_url(additional_path)
+        if (
+            http_method != HttpMethod.POST
+            or payload is None
+            or len(payload) != 1
+            or next(iter(payload)) not in CACHEABLE_COMMANDS
+        ):
+            return request_url, None
+        return request_url, (
+            request_url,
+            self._credentials_digest,
+            self._cache_encode_payload(payload),
+        )
+
+    def _cache_encode_payload(self, payload: dict[str, Any]) -> str:
+        encoded_payload: str | None
+        if self.handle_decimals_writes:
+            encoded_payload = self._decimal_aware_encode_payload(payload)
+        else:
+            encoded_payload = self._decimal_unaware_encode_payload(payload)
+        return encoded_payload or ""
+
+    def _metadata_command_name(self, payload: dict[str, Any] | None) -> str | None:
+        # the command name, if relevant to the metadata cache
+        if self.metadata_cache is None or payload is None or len(payload) != 1:
+            return None
+        command_name = next(iter(payload))
+        if (
+            command_name in METADATA_COMMANDS
+            or command_name in SCHEMA_CHANGING_COMMANDS
+        ):
+            return command_name
+        return None
+
+    def _metadata_cache_key(
+        self,
+        payload: dict[str, Any],
+        additional_path: str | None,
+    ) -> MetadataCacheKey:
+        return (
+            self.api_endpoint,
+            self._credentials_digest,
+            self._compose_request_url(additional_path),
+            self._cache_encode_payload(payload),
+        )
+
+    def _metadata_wait_timeout_exception(
+        self,
+        timeout_context: _TimeoutContext | None,
+        payload: dict[str, Any],
+        additional_path: str | None,
+    ) -> DataAPITimeoutException:
+        return DataAPITimeoutException(
+            text=waiting_timeout_text(timeout_context),
+            timeout_type="generic",
+            endpoint=self._compose_request_url(additional_path),
+            raw_payload=self._cache_encode_payload(payload),
+        )
+
+    @staticmethod
+    def _metadata_wait_timeout_s(
+        timeout_context: _TimeoutContext | None,
+    ) -> float | None:
+        if timeout_context is None or not timeout_context.request_ms:
+            return None
+        return timeout_context.request_ms / 1000.0
+
+    def _parse_cached_response(self, response_text: str) -> dict[str, Any]:
+        if self.handle_decimals_reads:
+            return self._decimal_aware_parse_json_response(response_text)
+        return self._decimal_unaware_parse_json_response(response_text)
+
     def request(
         self,
         *,
@@ -655,25 +945,38 @@ class APICommander:
         timeout_context: _TimeoutContext | None = None,
         caller_function_name: str | None = None,
     ) -> dict[str, Any]:
-        request_id = str(uuid7())
-        raw_response = self.raw_request(
-            http_method=http_method,
-            payload=payload,
-            additional_path=additional_path,
-            request_params=request_params,
-            timeout_context=timeout_context,
-            caller_function_name=caller_function_name,
-            request_id=request_id,
-        )
-        return self._raw_response_to_json(
-            raw_response,
-            raise_api_errors=raise_api_errors,
-            payload=payload,
-            caller_function_name=caller_function_name,
-            request_id=request_id,
+        request_kwargs: dict[str, Any] = {
+            "http_method": http_method,
+            "payload": payload,
+            "additional_path": additional_path,
+            "request_params": request_params,
+            "raise_api_errors": raise_api_errors,
+            "timeout_context": timeout_context,
+            "caller_function_name": caller_function_name,
+        }
+        metadata_command_name = self._metadata_command_name(payload)
+        if metadata_command_name is None:
+            return self._request(**request_kwargs)
+        metadata_cache = cast(MetadataCache, self.metadata_cache)
+        _payload = cast(dict[str, Any], payload)
+        if metadata_command_name in SCHEMA_CHANGING_COMMANDS:
+            try:
+                return self._request(**request_kwargs)
+            finally:
+                metadata_cache.invalidate(self.api_endpoint)
+        return cast(
+            dict[str, Any],
+            metadata_cache._get_or_load(
+                self._metadata_cache_key(_payload, additional_path),
+                loader=lambda: self._request(**request_kwargs),
+                timeout_s=self._metadata_wait_timeout_s(timeout_context),
+                timeout_exception=lambda: self._metadata_wait_timeout_exception(
+                    timeout_context, _payload, additional_path
+                ),
+            ),
         )
 
-    async def async_request(
+    def _request(
         self,
         *,
         http_method: str = HttpMethod.POST,
@@ -684,20 +987,169 @@ class APICommander:
         timeout_context: _TimeoutContext | None = None,
         caller_function_name: str | None = None,
     ) -> dict[str, Any]:
+        read_cache = self.read_cache
+        request_url: str | None = None
+        cache_key: ReadCacheKey | None = None
+        cache_generation = 0
+        if read_cache is not None:
+            request_url, cache_key = self._read_cache_key(
+                http_method, payload, additional_path
+            )
+            if cache_key is not None:
+                cached_text, cache_generation = read_cache._lookup(cache_key)
+                if cached_text is not None:
+                    return self._parse_cached_response(cached_text)
         request_id = str(uuid7())
-        raw_response = await self.async_raw_request(
-            http_method=http_method,
-            payload=payload,
-            additional_path=additional_path,
-            request_params=request_params,
-            timeout_context=timeout_context,
-            caller_function_name=caller_function_name,
-            request_id=request_id,
-        )
-        return self._raw_response_to_json(
-            raw_response,
-            raise_api_errors=raise_api_errors,
-            payload=payload,
-            caller_function_name=caller_function_name,
-            request_id=request_id,
+        # (the response event is dispatched once the response is decoded)
+        measures = _RequestMeasures() if self.event_observers else None
+        try:
+            with self._request_scope(payload):
+                raw_response = self.raw_request(
+                    http_method=http_method,
+                    payload=payload,
+                    additional_path=additional_path,
+                    request_params=request_params,
+                    timeout_context=timeout_context,
+                    caller_function_name=caller_function_name,
+                    request_id=request_id,
+                    measures=measures,
+                )
+                response_json = self._raw_response_to_json(
+                    raw_response,
+                    raise_api_errors=raise_api_errors,
+                    payload=payload,
+                    caller_function_name=caller_function_name,
+                    request_id=request_id,
+                    measures=measures,
+                )
+        finally:
+            if read_cache is not None and request_url is not None and cache_key is None:
+                # any other command may be a write: invalidate, even if it failed
+                read_cache._invalidate(request_url)
+            if (
+                payload is not None
+                and len(payload) == 1
+                and next(iter(payload)) in SCHEMA_COMMANDS
+            ):
+                _invalidate_for_schema_command(
+                    self._compose_request_url(additional_path), payload
+                )
+        if read_cache is not None and cache_key is not None:
+            if "errors" not in response_json:
+                read_cache._store(
+                    cache_key,
+                    raw_response.text,
+                    len(raw_response.content),
+                    cache_generation,
+                )
+        return response_json
+
+    async def async_request(
+        self,
+        *,
+        http_method: str = HttpMethod.POST,
+        payload: dict[str, Any] | None = None,
+        additional_path: str | None = None,
+        request_params: dict[str, Any] = {},
+        raise_api_errors: bool = True,
+        timeout_context: _TimeoutContext | None = None,
+        caller_function_name: str | None = None,
+    ) -> dict[str, Any]:
+        request_kwargs: dict[str, Any] = {
+            "http_method": http_method,
+            "payload": payload,
+            "additional_path": additional_path,
+            "request_params": request_params,
+            "raise_api_errors": raise_api_errors,
+            "timeout_context": timeout_context,
+            "caller_function_name": caller_function_name,
+        }
+        metadata_command_name = self._metadata_command_name(payload)
+        if metadata_command_name is None:
+            return await self._async_request(**request_kwargs)
+        metadata_cache = cast(MetadataCache, self.metadata_cache)
+        _payload = cast(dict[str, Any], payload)
+        if metadata_command_name in SCHEMA_CHANGING_COMMANDS:
+            try:
+                return await self._async_request(**request_kwargs)
+            finally:
+                metadata_cache.invalidate(self.api_endpoint)
+        return cast(
+            dict[str, Any],
+            await metadata_cache._async_get_or_load(
+                self._metadata_cache_key(_payload, additional_path),
+                loader=lambda: self._async_request(**request_kwargs),
+                timeout_s=self._metadata_wait_timeout_s(timeout_context),
+                timeout_exception=lambda: self._metadata_wait_timeout_exception(
+                    timeout_context, _payload, additional_path
+                ),
+            ),
         )
+
+    async def _async_request(
+        self,
+        *,
+        http_method: str = HttpMethod.POST,
+        payload: dict[str, Any] | None = None,
+        additional_path: str | None = None,
+        request_params: dict[str, Any] = {},
+        raise_api_errors: bool = True,
+        timeout_context: _TimeoutContext | None = None,
+        caller_function_name: str | None = None,
+    ) -> dict[str, Any]:
+        read_cache = self.read_cache
+        request_url: str | None = None
+        cache_key: ReadCacheKey | None = None
+        cache_generation = 0
+        if read_cache is not None:
+            request_url, cache_key = self._read_cache_key(
+                http_method, payload, additional_path
+            )
+            if cache_key is not None:
+                cached_text, cache_generation = read_cache._lookup(cache_key)
+                if cached_text is not None:
+                    return self._parse_cached_response(cached_text)
+        request_id = str(uuid7())
+        # (the response event is dispatched once the response is decoded)
+        measures = _RequestMeasures() if self.event_observers else None
+        try:
+            with self._request_scope(payload):
+                raw_response = await self.async_raw_request(
+                    http_method=http_method,
+                    payload=payload,
+                    additional_path=additional_path,
+                    request_params=request_params,
+                    timeout_context=timeout_context,
+                    caller_function_name=caller_function_name,
+                    request_id=request_id,
+                    measures=measures,
+                )
+                response_json = self._raw_response_to_json(
+                    raw_response,
+                    raise_api_errors=raise_api_errors,
+                    payload=payload,
+                    caller_function_name=caller_function_name,
+                    request_id=request_id,
+                    measures=measures,
+                )
+        finally:
+            if read_cache is not None and request_url is not None and cache_key is None:
+                # any other command may be a write: invalidate, even if it failed
+                read_cache._invalidate(request_url)
+            if (
+                payload is not None
+                and len(payload) == 1
+                and next(iter(payload)) in SCHEMA_COMMANDS
+            ):
+                _invalidate_for_schema_command(
+                    self._compose_request_url(additional_path), payload
+                )
+        if read_cache is not None and cache_key is not None:
+            if "errors" not in response_json:
+                read_cache._store(
+                    cache_key,
+                    raw_response.text,
+                    len(raw_response.content),
+                    cache_generation,
+                )
+        return response_json
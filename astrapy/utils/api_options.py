@@ -32,6 +32,7 @@ from astrapy.authentication import (
 )
 from astrapy.constants import (
     CallerType,
+    ConnectionReuseMode,
     Environment,
     MapEncodingMode,
     SerializerFunctionType,
@@ -57,9 +58,16 @@ from astrapy.settings.defaults import (
     DEV_OPS_VERSION_ENV_MAP,
     FIXED_SECRET_PLACEHOLDER,
 )
+from astrapy.utils.admin_metadata_cache import AdminMetadataCache
+from astrapy.utils.metadata_cache import MetadataCache
+from astrapy.utils.read_cache import ReadCache
 from astrapy.utils.unset import _UNSET, UnsetType
 
+# how many results of overrides with full options objects are memoized
+OVERRIDE_MEMO_MAX_SIZE = 16
+
 if TYPE_CHECKING:
+    from astrapy.admin.polling import PollingStrategy
     from astrapy.event_observers.observers import Observer
 
 
@@ -940,6 +948,35 @@ class APIOptions:
             When set, a per-instance SSL context is created with the given CA file
             instead of using the default certifi-based CA bundle. Defaults to None
             (use the bundled certifi CA roots).
+        connection_reuse_mode: how the pooled HTTP connections are reused. Takes
+            values in the `astrapy.constants.ConnectionReuseMode` enum: "SHARED"
+            (connections are shared by all threads), "PER_THREAD" (each thread
+            has its own pool of reusable connections) or "DISABLED" (a new
+            connection for each request). Async connections are always confined
+            to their event loop. Defaults to None, i.e. "DISABLED" on the Python
+            versions 3.12.0 to 3.12.11 (which have a bug with the reuse of SSL
+            connections across threads) and "SHARED" otherwise: on the affected
+            versions, "PER_THREAD" restores connection reuse for
+            multithreaded applications.
+        read_cache: an optional instance of `ReadCache` (see) to serve repeated
+            reads (such as `find_one` or `estimated_document_count`) issued by
+            collections and tables from a client-side cache. Writes to a collection
+            or table invalidate its cached reads. Passing None disables caching.
+            Defaults to None.
+        metadata_cache: an optional instance of `MetadataCache` (see) to serve
+            repeated schema lookups (such as `list_tables`, `Table.definition` or
+            `Collection.options`) from a client-side cache. Schema changes made
+            through the client invalidate the cached metadata. Passing None
+            disables caching. Defaults to None.
+        admin_metadata_cache: an optional instance of `AdminMetadataCache` (see)
+            to serve repeated administrative lookups (such as database information,
+            available regions and embedding/reranking provider catalogs) from
+            a client-side cache. Passing None disables caching. Defaults to None.
+        polling_strategy: an optional `PollingStrategy` (see) choosing the intervals
+            between status checks when waiting for database and keyspace operations
+            to complete (e.g. `create_database` with `wait_until_active=True`).
+            Passing None means fixed intervals (a few seconds for keyspaces,
+            longer for databases). Defaults to None.
         timeout_options: an instance of `TimeoutOptions` (see) to control the timeout
             behavior for the various kinds of operations involving the Data/DevOps API.
         serdes_options: an instance of `SerdesOptions` (see) to customize the
@@ -1029,6 +1066,11 @@ class APIOptions:
     reranking_api_key: RerankingHeadersProvider | UnsetType = _UNSET
     event_observers: dict[str, Observer | None] | UnsetType = _UNSET
     ca_cert_path: str | None | UnsetType = _UNSET
+    connection_reuse_mode: ConnectionReuseMode | None | UnsetType = _UNSET
+    read_cache: ReadCache | None | UnsetType = _UNSET
+    metadata_cache: MetadataCache | None | UnsetType = _UNSET
+    admin_metadata_cache: AdminMetadataCache | None | UnsetType = _UNSET
+    polling_strategy: PollingStrategy | None | UnsetType = _UNSET
     timeout_options: TimeoutOptions | UnsetType = _UNSET
     serdes_options: SerdesOptions | UnsetType = _UNSET
     data_api_url_options: DataAPIURLOptions | UnsetType = _UNSET
@@ -1046,6 +1088,11 @@ class APIOptions:
         reranking_api_key: str | RerankingHeadersProvider | UnsetType = _UNSET,
         event_observers: dict[str, Observer | None] | UnsetType = _UNSET,
         ca_cert_path: str | None | UnsetType = _UNSET,
+        connection_reuse_mode: str | ConnectionReuseMode | None | UnsetType = _UNSET,
+        read_cache: ReadCache | None | UnsetType = _UNSET,
+        metadata_cache: MetadataCache | None | UnsetType = _UNSET,
+        admin_metadata_cache: AdminMetadataCache | None | UnsetType = _UNSET,
+        polling_strategy: PollingStrategy | None | UnsetType = _UNSET,
         timeout_options: TimeoutOptions | UnsetType = _UNSET,
         serdes_options: SerdesOptions | UnsetType = _UNSET,
         data_api_url_options: DataAPIURLOptions | UnsetType = _UNSET,
@@ -1070,6 +1117,16 @@ class APIOptions:
         )
         self.event_observers = event_observers
         self.ca_cert_path = ca_cert_path
+        if isinstance(connection_reuse_mode, str):
+            self.connection_reuse_mode = ConnectionReuseMode.coerce(
+                connection_reuse_mode
+            )
+        else:
+            self.connection_reuse_mode = connection_reuse_mode
+        self.read_cache = read_cache
+        self.metadata_cache = metadata_cache
+        self.admin_metadata_cache = admin_metadata_cache
+        self.polling_strategy = polling_strategy
         self.timeout_options = timeout_options
         self.serdes_options = serdes_options
         self.data_api_url_options = data_api_url_options
@@ -1133,6 +1190,21 @@ class APIOptions:
                 if isinstance(self.ca_cert_path, UnsetType)
                 else f"ca_cert_path={self.ca_cert_path}",
                 None
+                if isinstance(self.connection_reuse_mode, UnsetType)
+                else f"connection_reuse_mode={self.connection_reuse_mode}",
+                None
+                if isinstance(self.read_cache, UnsetType)
+                else f"read_cache={self.read_cache}",
+                None
+                if isinstance(self.metadata_cache, UnsetType)
+                else f"metadata_cache={self.metadata_cache}",
+                None
+                if isinstance(self.admin_metadata_cache, UnsetType)
+                else f"admin_metadata_cache={self.admin_metadata_cache}",
+                None
+                if isinstance(self.polling_strategy, UnsetType)
+                else f"polling_strategy={self.polling_strategy}",
+                None
                 if isinstance(self.timeout_options, UnsetType)
                 else f"timeout_options={self.timeout_options}",
                 None
@@ -1214,6 +1286,35 @@ class FullAPIOptions(APIOptions):
             When set, a per-instance SSL context is created with the given CA file
             instead of using the default certifi-based CA bundle. Defaults to None
             (use the bundled certifi CA roots).
+        connection_reuse_mode: how the pooled HTTP connections are reused. Takes
+            values in the `astrapy.constants.ConnectionReuseMode` enum: "SHARED"
+            (connections are shared by all threads), "PER_THREAD" (each thread
+            has its own pool of reusable connections) or "DISABLED" (a new
+            connection for each request). Async connections are always confined
+            to their event loop. Defaults to None, i.e. "DISABLED" on the Python
+            versions 3.12.0 to 3.12.11 (which have a bug with the reuse of SSL
+            connections across threads) and "SHARED" otherwise: on the affected
+            versions, "PER_THREAD" restores connection reuse for
+            multithreaded applications.
+        read_cache: an optional instance of `ReadCache` (see) to serve repeated
+            reads (such as `find_one` or `estimated_document_count`) issued by
+            collections and tables from a client-side cache. Writes to a collection
+            or table invalidate its cached reads. Passing None disables caching.
+            Defaults to None.
+        metadata_cache: an optional instance of `MetadataCache` (see) to serve
+            repeated schema lookups (such as `list_tables`, `Table.definition` or
+            `Collection.options`) from a client-side cache. Schema changes made
+            through the client invalidate the cached metadata. Passing None
+            disables caching. Defaults to None.
+        admin_metadata_cache: an optional instance of `AdminMetadataCache` (see)
+            to serve repeated administrative lookups (such as database information,
+            available regions and embedding/reranking provider catalogs) from
+            a client-side cache. Passing None disables caching. Defaults to None.
+        polling_strategy: an optional `PollingStrategy` (see) choosing the intervals
+            between status checks when waiting for database and keyspace operations
+            to complete (e.g. `create_database` with `wait_until_active=True`).
+            Passing None means fixed intervals (a few seconds for keyspaces,
+            longer for databases). Defaults to None.
         timeout_options: an instance of `TimeoutOptions` (see) to control the timeout
             behavior for the various kinds of operations involving the Data/DevOps API.
         serdes_options: an instance of `SerdesOptions` (see) to customize the
@@ -1237,6 +1338,11 @@ class FullAPIOptions(APIOptions):
     reranking_api_key: RerankingHeadersProvider
     event_observers: dict[str, Observer | None]
     ca_cert_path: str | None
+    connection_reuse_mode: ConnectionReuseMode | None
+    read_cache: ReadCache | None
+    metadata_cache: MetadataCache | None
+    admin_metadata_cache: AdminMetadataCache | None
+    polling_strategy: PollingStrategy | None
     timeout_options: FullTimeoutOptions
     serdes_options: FullSerdesOptions
     data_api_url_options: FullDataAPIURLOptions
@@ -1255,6 +1361,11 @@ class FullAPIOptions(APIOptions):
         reranking_api_key: str | RerankingHeadersProvider,
         event_observers: dict[str, Observer | None],
         ca_cert_path: str | None,
+        connection_reuse_mode: ConnectionReuseMode | None,
+        read_cache: ReadCache | None,
+        metadata_cache: MetadataCache | None,
+        admin_metadata_cache: AdminMetadataCache | None,
+        polling_strategy: PollingStrategy | None,
         timeout_options: FullTimeoutOptions,
         serdes_options: FullSerdesOptions,
         data_api_url_options: FullDataAPIURLOptions,
@@ -1271,12 +1382,19 @@ class FullAPIOptions(APIOptions):
             reranking_api_key=reranking_api_key,
             event_observers=event_observers,
             ca_cert_path=ca_cert_path,
+            connection_reuse_mode=connection_reuse_mode,
+            read_cache=read_cache,
+            metadata_cache=metadata_cache,
+            admin_metadata_cache=admin_metadata_cache,
+            polling_strategy=polling_strategy,
             timeout_options=timeout_options,
             serdes_options=serdes_options,
             data_api_url_options=data_api_url_options,
             dev_ops_api_url_options=dev_ops_api_url_options,
         )
         self.environment = environment
+        # memoized results of `with_override` calls with full options objects
+        self._override_memo: dict[int, tuple[FullAPIOptions, FullAPIOptions]] = {}
 
     def __repr__(self) -> str:
         # special items
@@ -1319,14 +1437,34 @@ class FullAPIOptions(APIOptions):
         `admin_additional_headers` and `redacted_header_names`, in which cases
         merging takes place.
 
+        Full options objects are treated as immutable, which makes overrides
+        cheap when spawning objects: overriding with an options object having no
+        defined settings returns this very object, and the results of overriding
+        with a full options object are memoized.
+
         Args:
             other: a not-necessarily-fully-specified options object. All its defined
                 settings take precedence.
         """
 
-        if isinstance(other, UnsetType) or other is None:
+        if isinstance(other, UnsetType) or other is None or other is self:
             return self
-
+        if not isinstance(other, FullAPIOptions):
+            if all(value is _UNSET for value in vars(other).values()):
+                return self
+            return self._with_override(other)
+
+        memoized = self._override_memo.get(id(other))
+        # (the memo keeps a reference to `other`, hence its id is not reused)
+        if memoized is not None and memoized[0] is other:
+            return memoized[1]
+        result = self._with_override(other)
+        if len(self._override_memo) >= OVERRIDE_MEMO_MAX_SIZE:
+            self._override_memo.clear()
+        self._override_memo[id(other)] = (other, result)
+        return result
+
+    def _with_override(self, other: APIOptions) -> FullAPIOptions:
         database_additional_headers: dict[str, str | None]
         admin_additional_headers: dict[str, str | None]
         redacted_header_names: set[str]
@@ -1416,6 +1554,31 @@ class FullAPIOptions(APIOptions):
                 if not isinstance(other.ca_cert_path, UnsetType)
                 else self.ca_cert_path
             ),
+            connection_reuse_mode=(
+                other.connection_reuse_mode
+                if not isinstance(other.connection_reuse_mode, UnsetType)
+                else self.connection_reuse_mode
+            ),
+            read_cache=(
+                other.read_cache
+                if not isinstance(other.read_cache, UnsetType)
+                else self.read_cache
+            ),
+            metadata_cache=(
+                other.metadata_cache
+                if not isinstance(other.metadata_cache, UnsetType)
+                else self.metadata_cache
+            ),
+            admin_metadata_cache=(
+                other.admin_metadata_cache
+                if not isinstance(other.admin_metadata_cache, UnsetType)
+                else self.admin_metadata_cache
+            ),
+            polling_strategy=(
+                other.polling_strategy
+                if not isinstance(other.polling_strategy, UnsetType)
+                else self.polling_strategy
+            ),
             timeout_options=timeout_options,
             serdes_options=serdes_options,
             data_api_url_options=data_api_url_options,
@@ -1476,6 +1639,11 @@ def defaultAPIOptions(environment: str) -> FullAPIOptions:
         reranking_api_key=RerankingAPIKeyHeaderProvider(None),
         event_observers={},
         ca_cert_path=None,
+        connection_reuse_mode=None,
+        read_cache=None,
+        metadata_cache=None,
+        admin_metadata_cache=None,
+        polling_strategy=None,
         timeout_options=defaultTimeoutOptions,
         serdes_options=defaultSerdesOptions,
         data_api_url_options=defaultDataAPIURLOptions,
@@ -0,0 +1,249 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared machinery for the astrapy command-line tools."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+from collections.abc import Callable
+from types import TracebackType
+from typing import Any, TextIO
+
+from astrapy.admin import parse_api_endpoint
+from astrapy.authentication import (
+    StaticTokenProvider,
+    TokenProvider,
+    UsernamePasswordTokenProvider,
+)
+from astrapy.client import DataAPIClient
+from astrapy.constants import Environment
+from astrapy.data.collection import Collection
+from astrapy.data.table import Table
+from astrapy.database import Database
+from astrapy.utils.api_commander import APICommander
+
+LOGGING_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
+def add_connection_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add to a parser the arguments to connect to a database, as well as
+    the logging-level argument, consistently with the `astrapy-repl` tool.
+    """
+
+    parser.add_argument(
+        "--endpoint",
+        "-e",
+        type=str,
+        help=(
+            "API Endpoint to the Data API. Env vars: ASTRA_DB_API_ENDPOINT, "
+            "LOCAL_DATA_API_ENDPOINT"
+        ),
+    )
+    parser.add_argument(
+        "--token",
+        "-t",
+        type=str,
+        help="Token for Data API authentication. Env var: ASTRA_DB_APPLICATION_TOKEN",
+    )
+    parser.add_argument(
+        "--username",
+        "-u",
+        type=str,
+        help=(
+            "Username (alternative to token; requires password). "
+            "Env var: LOCAL_DATA_API_USERNAME"
+        ),
+    )
+    parser.add_argument(
+        "--password",
+        "-p",
+        type=str,
+        help=(
+            "Password (alternative to token; requires username). "
+            "Env var: LOCAL_DATA_API_PASSWORD"
+        ),
+    )
+    parser.add_argument(
+        "--keyspace",
+        "-k",
+        type=str,
+        help="Targeted keyspace. Env vars: ASTRA_DB_KEYSPACE, LOCAL_DATA_API_KEYSPACE",
+    )
+    parser.add_argument(
+        "--environment",
+        choices=Environment.values,
+        help="Target environment. Usually auto-detected from endpoint.",
+    )
+    parser.add_argument(
+        "--log-level",
+        "-l",
+        type=str.upper,
+        dest="loglevel",
+        choices=list(LOGGING_LEVELS.keys()),
+        help="Logging level.",
+    )
+
+
+def database_from_arguments(
+    args: argparse.Namespace,
+    parser: argparse.ArgumentParser,
+) -> Database:
+    """
+    Build a Database from parsed command-line arguments (as defined by
+    `add_connection_arguments`). Parameters take precedence over environment
+    variables. Invalid combinations result in a parser error.
+    """
+
+    _endpoint = (
+        args.endpoint
+        or os.getenv("ASTRA_DB_API_ENDPOINT")
+        or os.getenv("LOCAL_DATA_API_ENDPOINT")
+    )
+    _keyspace = (
+        args.keyspace
+        or os.getenv("ASTRA_DB_KEYSPACE")
+        or os.getenv("LOCAL_DATA_API_KEYSPACE")
+        or None
+    )
+    _environment = args.environment or None
+    _token_provider: TokenProvider
+    _token = args.token or os.getenv("ASTRA_DB_APPLICATION_TOKEN")
+    _username = args.username or os.getenv("LOCAL_DATA_API_USERNAME")
+    _password = args.password or os.getenv("LOCAL_DATA_API_PASSWORD")
+    if _token and (_username or _password):
+        parser.error("Specify either a token or username/password pair, not both.")
+    if (_username and not _password) or (_password and not _username):
+        parser.error("Username and password must be provided together.")
+    if _username and _password:
+        _token_provider = UsernamePasswordTokenProvider(_username, _password)
+    else:
+        _token_provider = StaticTokenProvider(_token)
+
+    if not _endpoint:
+        parser.error(
+            "The endpoint is required, either via env. var or command-line argument."
+        )
+
+    if not _environment:
+        parsed_endpoint = parse_api_endpoint(_endpoint)
+        if parsed_endpoint:
+            _environment = parsed_endpoint.environment
+        else:
+            _environment = Environment.HCD
+    client = DataAPIClient(environment=_environment)
+    return client.get_database(
+        _endpoint,
+        token=_token_provider,
+        keyspace=_keyspace,
+    )
+
+
+def configure_logging(args: argparse.Namespace) -> None:
+    if args.loglevel:
+        logging.basicConfig(level=LOGGING_LEVELS[args.loglevel])
+
+
+def parse_json_argument(
+    parser: argparse.ArgumentParser,
+    argument_name: str,
+    value: str | None,
+) -> Any:
+    """Parse a JSON-valued argument (None if not given), or exit with an error."""
+
+    if value is None:
+        return None
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError as exc:
+        parser.error(f"Argument {argument_name} is not valid JSON ({exc}).")
+
+
+def json_encoder_for(source: Collection[Any] | Table[Any]) -> Callable[[Any], str]:
+    """
+    Return a function encoding documents/rows to JSON (in their Data API
+    representation) for a given collection or table, i.e. able to handle
+    Decimal values whenever the source may have them.
+    """
+
+    decimals_possible = (
+        isinstance(source, Table)
+        or source.api_options.serdes_options.use_decimals_in_collections
+    )
+    if decimals_possible:
+        return lambda document: (
+            APICommander._decimal_aware_encode_payload(document) or ""
+        )
+    return lambda document: APICommander._decimal_unaware_encode_payload(document) or ""
+
+
+class ProgressReporter:
+    """
+    A context manager periodically writing a progress line to a stream
+    (default: stderr) from a background thread, while the context is active.
+    No reporting occurs if the interval is None or zero.
+    """
+
+    def __init__(
+        self,
+        *,
+        prefix: str,
+        summary: Callable[[], str],
+        interval_s: float | None,
+        stream: TextIO | None = None,
+    ) -> None:
+        self.prefix = prefix
+        self.summary = summary
+        self.interval_s = interval_s
+        self.stream = stream
+        self._done_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _report(self, interval_s: float) -> None:
+        stream = self.stream or sys.stderr
+        while not self._done_event.wait(interval_s):
+            stream.write(f"[{self.prefix}] {self.summary()}\n")
+            stream.flush()
+
+    def __enter__(self) -> ProgressReporter:
+        if self.interval_s:
+            self._thread = threading.Thread(
+                target=self._report,
+                args=(self.interval_s,),
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._done_event.set()
+        if self._thread is not None:
+            self._thread.join()
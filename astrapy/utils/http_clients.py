@@ -0,0 +1,484 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import os
+import ssl
+import threading
+import weakref
+from typing import cast
+
+import httpx
+
+from astrapy.settings.definitions.definitions_data import ConnectionReuseMode
+from astrapy.utils.meta import issue_plain_warning
+from astrapy.utils.python_version import get_python_version
+
+PYTHON_VERSION_SSL_ISSUES_WARNING = (
+    "SSL connection reuse disabled due to a Python 3.12.[0-11] bug. "
+    "This may reduce performance under certain workloads. "
+    "Please upgrade to Python 3.12.12 or newer if possible, or set the "
+    "'connection_reuse_mode' API option to \"PER_THREAD\"."
+)
+
+# Used only for a range of Python versions where a SSL bug is detected
+# (unless a connection reuse mode is set explicitly).
+no_pooling_limits = httpx.Limits(max_keepalive_connections=0, keepalive_expiry=0)
+disable_ssl_reuse: bool
+python_version = get_python_version()
+if python_version >= (3, 12, 0) and python_version < (3, 12, 12):
+    disable_ssl_reuse = True
+else:
+    disable_ssl_reuse = False
+_ssl_issues_warning_issued = False
+
+
+def resolve_connection_reuse_mode(
+    connection_reuse_mode: ConnectionReuseMode | None,
+) -> ConnectionReuseMode:
+    """
+    Turn the connection reuse mode from the API options into an actual mode.
+
+    Args:
+        connection_reuse_mode: a ConnectionReuseMode, or None for the automatic
+            choice (depending on the Python version).
+
+    Returns:
+        a ConnectionReuseMode.
+    """
+
+    global _ssl_issues_warning_issued
+    if connection_reuse_mode is not None:
+        return connection_reuse_mode
+    if disable_ssl_reuse:
+        if not _ssl_issues_warning_issued:
+            _ssl_issues_warning_issued = True
+            issue_plain_warning(
+                PYTHON_VERSION_SSL_ISSUES_WARNING,
+                stacklevel=3,
+            )
+        return ConnectionReuseMode.DISABLED
+    return ConnectionReuseMode.SHARED
+
+
+# SSL contexts are costly to create (the CA bundle is parsed): they are created
+# on first use and then shared, one per CA certificate path (None: certifi roots)
+_ssl_contexts: dict[str | None, ssl.SSLContext] = {}
+_ssl_contexts_lock = threading.Lock()
+
+
+def get_ssl_context(ca_cert_path: str | None = None) -> ssl.SSLContext:
+    """
+    Return the SSL context for connections trusting the given CA certificates,
+    creating it on first use.
+
+    Contexts are cached by path: changes to the contents of a CA file are
+    not picked up once the corresponding context has been created.
+
+    Args:
+        ca_cert_path: the path to a CA certificate file (PEM format). If None,
+            the portable CA roots bundled with `certifi` are used.
+
+    Returns:
+        an `ssl.SSLContext`, shared by all callers asking for the same path.
+    """
+
+    ssl_context = _ssl_contexts.get(ca_cert_path)
+    if ssl_context is None:
+        with _ssl_contexts_lock:
+            ssl_context = _ssl_contexts.get(ca_cert_path)
+            if ssl_context is None:
+                if ca_cert_path is None:
+                    import certifi
+
+                    # portable CA roots
+                    ssl_context = ssl.create_default_context(cafile=certifi.where())
+                else:
+                    ssl_context = ssl.create_default_context(cafile=ca_cert_path)
+                _ssl_contexts[ca_cert_path] = ssl_context
+    return ssl_context
+
+
+# Transports mounted in place of the network for some URL prefixes (e.g. an
+# in-process Data API emulator), passed as `mounts` to all new httpx clients.
+_mounted_transports: dict[str, httpx.BaseTransport | httpx.AsyncBaseTransport] = {}
+
+
+def mount_transport(
+    url_prefix: str, transport: httpx.BaseTransport | httpx.AsyncBaseTransport
+) -> None:
+    """
+    Route the requests to a URL prefix through the given httpx transport, for
+    all astrapy objects. Meant for testing and benchmarking.
+
+    Args:
+        url_prefix: a URL prefix as accepted by the `mounts` parameter of httpx
+            clients, such as "http://emulator.local".
+        transport: the transport. Sync requests require it to be a
+            `httpx.BaseTransport`, async requests a `httpx.AsyncBaseTransport`.
+    """
+
+    with _client_pools_lock:
+        _mounted_transports[url_prefix] = transport
+        _reset_client_pools()
+
+
+def unmount_transport(url_prefix: str) -> None:
+    """
+    Stop routing the requests to a URL prefix through a mounted transport.
+
+    Args:
+        url_prefix: a URL prefix passed to `mount_transport` earlier.
+    """
+
+    with _client_pools_lock:
+        _mounted_transports.pop(url_prefix, None)
+        _reset_client_pools()
+
+
+def _sync_mounts() -> dict[str, httpx.BaseTransport] | None:
+    mounts = {
+        url_prefix: transport
+        for url_prefix, transport in _mounted_transports.items()
+        if isinstance(transport, httpx.BaseTransport)
+    }
+    return mounts or None
+
+
+def _async_mounts() -> dict[str, httpx.AsyncBaseTransport] | None:
+    mounts = {
+        url_prefix: transport
+        for url_prefix, transport in _mounted_transports.items()
+        if isinstance(transport, httpx.AsyncBaseTransport)
+    }
+    return mounts or None
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class _PooledClient:
+    """
+    An httpx client (sync or async) held by a client pool, with a count of the
+    requests using it. A client retired from the pool (e.g. when an async
+    context is exited) is closed as soon as it has no requests in flight.
+    """
+
+    __slots__ = ("client", "requests", "retired", "finalizer", "__weakref__")
+
+    def __init__(self, client: httpx.Client | httpx.AsyncClient) -> None:
+        self.client = client
+        self.requests = 0
+        self.retired = False
+        self.finalizer: weakref.finalize | None = None
+
+
+# the tasks closing async clients retired from another thread (kept referenced)
+_closing_tasks: set[asyncio.Task[None]] = set()
+
+
+def _close_async_client_soon(
+    loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+) -> None:
+    def _start_closing() -> None:
+        task = loop.create_task(client.aclose())
+        _closing_tasks.add(task)
+        task.add_done_callback(_closing_tasks.discard)
+
+    if not loop.is_closed():
+        try:
+            loop.call_soon_threadsafe(_start_closing)
+        except RuntimeError:
+            # the loop was closed in the meantime
+            pass
+
+
+class _HTTPClientPool:
+    """
+    The httpx clients shared by all API commanders with the same transport
+    settings (i.e. the same CA certificate path and connection reuse mode).
+
+    Creating an httpx client is expensive compared to spawning a collection
+    or a table object, hence clients are created on first use and shared.
+    The requests carry all their headers and timeouts, so that the clients
+    themselves hold no per-object state.
+
+    Sync clients are thread-safe and, in the SHARED reuse mode, are shared
+    across threads. In the PER_THREAD mode each thread has a client of its own,
+    so that a pooled connection is never used by two threads (this keeps
+    connection reuse on the Python versions with SSL issues); the client is
+    closed when its thread ends. In the DISABLED mode the clients keep no
+    connections. Async clients are kept separately for each running event loop,
+    since connections opened in an event loop cannot be used from another one.
+
+    Requests go through `acquire_client`/`release_client` (and their async
+    counterparts), which count the requests in flight on each client: a client
+    dropped from the pool (by `retire_async_client`, invoked when exiting an
+    async context, or when transports are mounted) is closed only once none of
+    its requests are in flight, so that other objects sharing it are unaffected.
+
+    The pool is fork-aware: in a child process (e.g. a worker of a pre-fork
+    server), the clients inherited from the parent are discarded, without
+    closing them (their sockets still belong to the parent), and new ones are
+    created on first use. Besides the `os.register_at_fork` hook, the process ID
+    is checked on each access, to cover forks that do not run the hooks.
+    """
+
+    def __init__(
+        self,
+        ca_cert_path: str | None,
+        connection_reuse_mode: ConnectionReuseMode = ConnectionReuseMode.SHARED,
+    ) -> None:
+        self.ca_cert_path = ca_cert_path
+        self.connection_reuse_mode = connection_reuse_mode
+        self._thread_clients: weakref.WeakSet[_PooledClient] = weakref.WeakSet()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._client: _PooledClient | None = None
+        # the per-thread clients (PER_THREAD mode), in a `client` attribute
+        self._thread_local = threading.local()
+        # (their closing when the thread ends must not happen in a forked child)
+        for thread_client in list(self._thread_clients):
+            if thread_client.finalizer is not None:
+                thread_client.finalizer.detach()
+        self._thread_clients = weakref.WeakSet()
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _PooledClient
+        ] = weakref.WeakKeyDictionary()
+        # the async client used when no event loop is running
+        self._loopless_async_client: _PooledClient | None = None
+
+    def _retire_all(self) -> None:
+        """
+        Drop all clients from the pool (new ones are created on first use),
+        closing each of them once its requests in flight are done.
+        """
+
+        self._check_pid()
+        with self._lock:
+            sync_clients = [
+                pooled
+                for pooled in [self._client, *self._thread_clients]
+                if pooled is not None
+            ]
+            async_clients = list(self._async_clients.items())
+            self._client = None
+            self._thread_local = threading.local()
+            self._thread_clients = weakref.WeakSet()
+            self._async_clients = weakref.WeakKeyDictionary()
+            self._loopless_async_client = None
+            for pooled in sync_clients:
+                pooled.retired = True
+            for _, pooled in async_clients:
+                pooled.retired = True
+            idle_sync_clients = [
+                pooled.client for pooled in sync_clients if pooled.requests == 0
+            ]
+            idle_async_clients = [
+                (loop, pooled.client)
+                for loop, pooled in async_clients
+                if pooled.requests == 0
+            ]
+        for sync_client in idle_sync_clients:
+            cast(httpx.Client, sync_client).close()
+        for loop, async_client in idle_async_clients:
+            _close_async_client_soon(loop, cast(httpx.AsyncClient, async_client))
+
+    def _check_pid(self) -> None:
+        # (a lock inherited from the parent may be in any state: not used here)
+        if self._pid != os.getpid():
+            self._reset()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(ca_cert_path={self.ca_cert_path}, "
+            f"connection_reuse_mode={self.connection_reuse_mode})"
+        )
+
+    def _new_client(self) -> httpx.Client:
+        ssl_context = get_ssl_context(self.ca_cert_path)
+        if self.connection_reuse_mode == ConnectionReuseMode.DISABLED:
+            return httpx.Client(
+                limits=no_pooling_limits, verify=ssl_context, mounts=_sync_mounts()
+            )
+        return httpx.Client(verify=ssl_context, mounts=_sync_mounts())
+
+    def _new_async_client(self) -> httpx.AsyncClient:
+        ssl_context = get_ssl_context(self.ca_cert_path)
+        if self.connection_reuse_mode == ConnectionReuseMode.DISABLED:
+            return httpx.AsyncClient(
+                limits=no_pooling_limits, verify=ssl_context, mounts=_async_mounts()
+            )
+        return httpx.AsyncClient(verify=ssl_context, mounts=_async_mounts())
+
+    def _pooled_client(self) -> _PooledClient:
+        self._check_pid()
+        if self.connection_reuse_mode == ConnectionReuseMode.PER_THREAD:
+            thread_client: _PooledClient | None = getattr(
+                self._thread_local, "client", None
+            )
+            if thread_client is None:
+                new_client = self._new_client()
+                thread_client = _PooledClient(new_client)
+                # the thread-local storage goes away with the thread
+                thread_client.finalizer = weakref.finalize(
+                    thread_client, new_client.close
+                )
+                self._thread_local.client = thread_client
+                with self._lock:
+                    self._thread_clients.add(thread_client)
+            return thread_client
+        client = self._client
+        if client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = _PooledClient(self._new_client())
+                client = self._client
+        return client
+
+    def _pooled_async_client(self) -> _PooledClient:
+        self._check_pid()
+        loop = _running_loop()
+        with self._lock:
+            if loop is None:
+                if self._loopless_async_client is None:
+                    self._loopless_async_client = _PooledClient(
+                        self._new_async_client()
+                    )
+                return self._loopless_async_client
+            async_client = self._async_clients.get(loop)
+            if async_client is None:
+                async_client = _PooledClient(self._new_async_client())
+                self._async_clients[loop] = async_client
+            return async_client
+
+    def get_client(self) -> httpx.Client:
+        return cast(httpx.Client, self._pooled_client().client)
+
+    def get_async_client(self) -> httpx.AsyncClient:
+        return cast(httpx.AsyncClient, self._pooled_async_client().client)
+
+    def acquire_client(self) -> _PooledClient:
+        """Get the sync client for a request, to be passed to `release_client` after."""
+        while True:
+            pooled = self._pooled_client()
+            with self._lock:
+                # (a client retired in the meantime is not used)
+                if not pooled.retired:
+                    pooled.requests += 1
+                    return pooled
+
+    def release_client(self, pooled: _PooledClient) -> None:
+        with self._lock:
+            pooled.requests -= 1
+            close_now = pooled.retired and pooled.requests == 0
+        if close_now:
+            cast(httpx.Client, pooled.client).close()
+
+    def acquire_async_client(self) -> _PooledClient:
+        """
+        Get the async client for a request (in the running event loop), to be
+        passed to `release_async_client` after.
+        """
+        while True:
+            pooled = self._pooled_async_client()
+            with self._lock:
+                if not pooled.retired:
+                    pooled.requests += 1
+                    return pooled
+
+    async def release_async_client(self, pooled: _PooledClient) -> None:
+        with self._lock:
+            pooled.requests -= 1
+            close_now = pooled.retired and pooled.requests == 0
+        if close_now:
+            await cast(httpx.AsyncClient, pooled.client).aclose()
+
+    async def retire_async_client(self) -> None:
+        """
+        Drop the async client of the running event loop, if any, from the pool,
+        closing it now or, if requests are in flight on it, once they complete.
+        A new client is created if needed later.
+        """
+
+        self._check_pid()
+        loop = _running_loop()
+        if loop is None:
+            return
+        with self._lock:
+            pooled = self._async_clients.pop(loop, None)
+            if pooled is None:
+                return
+            pooled.retired = True
+            close_now = pooled.requests == 0
+        if close_now:
+            await cast(httpx.AsyncClient, pooled.client).aclose()
+
+
+_client_pools: dict[tuple[str | None, ConnectionReuseMode], _HTTPClientPool] = {}
+_client_pools_lock = threading.Lock()
+
+
+def get_client_pool(
+    ca_cert_path: str | None = None,
+    connection_reuse_mode: ConnectionReuseMode | None = None,
+) -> _HTTPClientPool:
+    """
+    Return the shared pool of httpx clients for the given transport settings.
+
+    Args:
+        ca_cert_path: the path to a CA certificate file, or None for
+            the default CA roots.
+        connection_reuse_mode: a ConnectionReuseMode, or None for the automatic
+            choice (see `resolve_connection_reuse_mode`).
+
+    Returns:
+        the (process-wide) client pool for the settings.
+    """
+
+    pool_key = (ca_cert_path, resolve_connection_reuse_mode(connection_reuse_mode))
+    pool = _client_pools.get(pool_key)
+    if pool is None:
+        with _client_pools_lock:
+            pool = _client_pools.setdefault(pool_key, _HTTPClientPool(*pool_key))
+    return pool
+
+
+def _reset_client_pools() -> None:
+    # the clients in use are left to finish their requests, then closed
+    for pool in list(_client_pools.values()):
+        pool._retire_all()
+
+
+def _reset_client_pools_after_fork() -> None:
+    # (locks held by other threads of the parent at fork time stay locked forever)
+    global _client_pools_lock, _ssl_contexts_lock
+    _client_pools_lock = threading.Lock()
+    _ssl_contexts_lock = threading.Lock()
+    # the inherited clients are dropped, not closed
+    for pool in list(_client_pools.values()):
+        pool._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_client_pools_after_fork)
@@ -0,0 +1,237 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import copy
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from astrapy.exceptions import _TimeoutContext
+
+LookupCacheKey = tuple[str, ...]
+
+
+def waiting_timeout_text(timeout_context: _TimeoutContext | None) -> str:
+    """The error text for a lookup timing out while waiting for a load in flight."""
+
+    text_0 = "timed out waiting for an identical request in flight"
+    if timeout_context is not None and timeout_context.label:
+        timeout_ms = timeout_context.nominal_ms or timeout_context.request_ms
+        return f"{text_0} (timeout honoured: {timeout_context.label} = {timeout_ms} ms)"
+    return text_0
+
+
+@dataclass
+class _LookupCacheEntry:
+    response: Any
+    expires_at: float | None
+
+
+class _SharedLookupCache(ABC):
+    """
+    The machinery common to the caches of API responses whose lookups are
+    shared: entries with a time-to-live, and concurrent lookups for the same
+    key (from threads, or from tasks in the same event loop) waiting for
+    a single load in flight.
+
+    Subclasses set the TTL of the entries and may persist them.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[LookupCacheKey, _LookupCacheEntry] = {}
+        self._inflight: dict[LookupCacheKey, concurrent.futures.Future[Any]] = {}
+        self._async_inflight: dict[LookupCacheKey, asyncio.Future[Any]] = {}
+        # bumped at each invalidation, so that loads in flight are not stored
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._deduplicated = 0
+        self._invalidations = 0
+
+    def _now(self) -> float:
+        return time.monotonic()
+
+    @abstractmethod
+    def _ttl_ms_for(self, key: LookupCacheKey) -> int | None: ...
+
+    def _is_cacheable(self, response: Any) -> bool:
+        return True
+
+    def _after_change(self) -> None:
+        """Called (without the lock held) whenever the entries change."""
+        return None
+
+    async def _async_after_change(self) -> None:
+        return None
+
+    def _discard(self, predicate: Callable[[LookupCacheKey], bool]) -> None:
+        with self._lock:
+            self._generation += 1
+            stale_keys = [key for key in self._entries if predicate(key)]
+            for key in stale_keys:
+                del self._entries[key]
+            self._invalidations += len(stale_keys)
+
+    def _cached_response(self, key: LookupCacheKey) -> Any | None:
+        # to be called with the lock held
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= self._now():
+            del self._entries[key]
+            return None
+        self._hits += 1
+        return entry.response
+
+    def _store(self, key: LookupCacheKey, response: Any, generation: int) -> bool:
+        # to be called with the lock held. The response must not be
+        # modified afterwards (it is copied whenever returned to a caller)
+        if not self._is_cacheable(response):
+            return False
+        # an invalidation took place while this load was in flight: do not store
+        if self._generation != generation:
+            return False
+        ttl_ms = self._ttl_ms_for(key)
+        self._entries[key] = _LookupCacheEntry(
+            response=response,
+            expires_at=None if ttl_ms is None else self._now() + ttl_ms / 1000.0,
+        )
+        return True
+
+    def _get_or_load(
+        self,
+        key: LookupCacheKey,
+        loader: Callable[[], Any],
+        *,
+        timeout_s: float | None,
+        timeout_exception: Callable[[], Exception],
+    ) -> Any:
+        """
+        Return the cached response for a key, or run the loader to obtain it.
+        Lookups for a key being loaded by another thread wait for that load
+        (up to `timeout_s`, then the `timeout_exception` is raised).
+        """
+
+        with self._lock:
+            cached_response = self._cached_response(key)
+            if cached_response is not None:
+                return copy.deepcopy(cached_response)
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                self._misses += 1
+                generation = self._generation
+                future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+                self._inflight[key] = future
+            else:
+                self._deduplicated += 1
+        if inflight is not None:
+            try:
+                return copy.deepcopy(inflight.result(timeout=timeout_s))
+            except concurrent.futures.TimeoutError:
+                raise timeout_exception()
+
+        try:
+            response = loader()
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(exc)
+            raise
+        shared_response = copy.deepcopy(response)
+        with self._lock:
+            del self._inflight[key]
+            stored = self._store(key, shared_response, generation)
+        future.set_result(shared_response)
+        if stored:
+            self._after_change()
+        return response
+
+    async def _async_get_or_load(
+        self,
+        key: LookupCacheKey,
+        loader: Callable[[], Awaitable[Any]],
+        *,
+        timeout_s: float | None,
+        timeout_exception: Callable[[], Exception],
+    ) -> Any:
+        """
+        Async counterpart of `_get_or_load`: lookups for a key being loaded
+        by another task (in the same event loop) wait for that load. If that
+        task is cancelled, one of the waiting lookups takes over the load.
+        """
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout_s is None else loop.time() + timeout_s
+        while True:
+            with self._lock:
+                cached_response = self._cached_response(key)
+                if cached_response is not None:
+                    return copy.deepcopy(cached_response)
+                inflight = self._async_inflight.get(key)
+                if inflight is not None and inflight.get_loop() is not loop:
+                    inflight = None
+                if inflight is None:
+                    self._misses += 1
+                    generation = self._generation
+                    future: asyncio.Future[Any] = loop.create_future()
+                    self._async_inflight[key] = future
+                else:
+                    self._deduplicated += 1
+            if inflight is None:
+                break
+            remaining_s = None if deadline is None else max(deadline - loop.time(), 0)
+            try:
+                response = await asyncio.wait_for(asyncio.shield(inflight), remaining_s)
+            except asyncio.TimeoutError:
+                raise timeout_exception()
+            except asyncio.CancelledError:
+                if inflight.cancelled():
+                    # the task running the load was cancelled, not this one:
+                    # try again (possibly running the load in this task)
+                    continue
+                raise
+            return copy.deepcopy(response)
+
+        try:
+            response = await loader()
+        except BaseException as exc:
+            with self._lock:
+                if self._async_inflight.get(key) is future:
+                    del self._async_inflight[key]
+            if isinstance(exc, asyncio.CancelledError):
+                # the waiting lookups (if any) retry, instead of being cancelled
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                # the waiting lookups (if any) get the exception as well
+                future.exception()
+            raise
+        shared_response = copy.deepcopy(response)
+        with self._lock:
+            if self._async_inflight.get(key) is future:
+                del self._async_inflight[key]
+            stored = self._store(key, shared_response, generation)
+        future.set_result(shared_response)
+        if stored:
+            await self._async_after_change()
+        return response
@@ -0,0 +1,156 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from astrapy.settings.defaults import DEFAULT_METADATA_CACHE_TTL_MS
+from astrapy.utils.lookup_cache import LookupCacheKey, _SharedLookupCache
+
+# the Data API commands reading schema metadata, whose responses can be cached
+METADATA_COMMANDS = {"findCollections", "listTables", "listTypes", "listIndexes"}
+
+# the Data API commands altering the schema, which invalidate the cached metadata
+SCHEMA_CHANGING_COMMANDS = {
+    "createCollection",
+    "deleteCollection",
+    "createTable",
+    "dropTable",
+    "alterTable",
+    "createIndex",
+    "createVectorIndex",
+    "createTextIndex",
+    "dropIndex",
+    "createType",
+    "alterType",
+    "dropType",
+}
+
+# (API endpoint, digest of the credential headers, request URL, encoded payload)
+MetadataCacheKey = LookupCacheKey
+
+
+@dataclass(frozen=True)
+class MetadataCacheStats:
+    """
+    A snapshot of the counters of a `MetadataCache`.
+
+    Attributes:
+        hits: number of lookups served from the cache.
+        misses: number of lookups that issued a request to the Data API.
+        deduplicated: number of lookups that, instead of issuing their own
+            request, waited for an identical one already in flight.
+        invalidations: number of entries discarded because of schema changes
+            or of explicit invalidation.
+        entries: number of entries currently in the cache.
+    """
+
+    hits: int
+    misses: int
+    deduplicated: int
+    invalidations: int
+    entries: int
+
+
+class MetadataCache(_SharedLookupCache):
+    """
+    A client-side cache for schema metadata, such as the results of
+    `Database.list_tables()`, `Database.list_collections()`, `Database.list_types()`,
+    `Table.definition()`, `Table.list_indexes()` and `Collection.options()`.
+
+    A cache is attached through the `metadata_cache` setting of the API options:
+    all databases, collections and tables spawned with that setting share the
+    same cache. Entries expire after a time-to-live; schema changes issued
+    through this client (such as `create_table`, `alter`, `create_index`,
+    `drop_*`, `alter_type`) discard all cached metadata for the database.
+    Concurrent lookups for the same metadata issue a single request,
+    whose response is shared by all of them.
+
+    Schema changes made by other clients are reflected in the cached metadata
+    only once the entries expire, or after an explicit `invalidate()`.
+    The cache is safe to use from several threads and from async code.
+
+    Args:
+        ttl_ms: the time-to-live of each entry, in milliseconds. Passing None
+            makes entries last until invalidated.
+
+    Example:
+        >>> from astrapy.api_options import APIOptions, MetadataCache
+        >>>
+        >>> my_metadata_cache = MetadataCache(ttl_ms=300000)
+        >>> my_cached_db = my_client.get_database(
+        ...     "https://01234567-....apps.astra.datastax.com",
+        ...     token="AstraCS:...",
+        ...     spawn_api_options=APIOptions(metadata_cache=my_metadata_cache),
+        ... )
+        >>> my_table = my_cached_db.get_table("my_table")
+        >>> my_table.definition()  # issues a listTables request
+        ListTableDefinition(columns=[match_id,round,m_vector,score,when,winner,fighters], primary_key=match_id,round)
+        >>> my_table.definition()  # served from the cache
+        ListTableDefinition(columns=[match_id,round,m_vector,score,when,winner,fighters], primary_key=match_id,round)
+        >>> my_metadata_cache.invalidate()
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_ms: int | None = DEFAULT_METADATA_CACHE_TTL_MS,
+    ) -> None:
+        if ttl_ms is not None and ttl_ms <= 0:
+            raise ValueError("The cache `ttl_ms` must be a positive integer or None.")
+        super().__init__()
+        self.ttl_ms = ttl_ms
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(ttl_ms={self.ttl_ms})"
+
+    def stats(self) -> MetadataCacheStats:
+        """
+        Return a snapshot of the cache counters.
+
+        Returns:
+            a MetadataCacheStats object.
+        """
+
+        with self._lock:
+            return MetadataCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                deduplicated=self._deduplicated,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+            )
+
+    def invalidate(self, api_endpoint: str | None = None) -> None:
+        """
+        Discard the cached metadata, so that the next lookups reach the Data API.
+
+        Args:
+            api_endpoint: if provided, only the metadata for the database with
+                this API Endpoint is discarded. Otherwise, the whole cache is cleared.
+        """
+
+        if api_endpoint is None:
+            self._discard(lambda key: True)
+        else:
+            endpoint = api_endpoint.strip("/")
+            self._discard(lambda key: key[0] == endpoint)
+
+    def _ttl_ms_for(self, key: LookupCacheKey) -> int | None:
+        return self.ttl_ms
+
+    def _is_cacheable(self, response: Any) -> bool:
+        return isinstance(response, dict) and "errors" not in response
@@ -0,0 +1,224 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import inspect
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from astrapy.exceptions.error_descriptors import DataAPIWarningDescriptor
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# The statistics objects being filled are found through a context variable,
+# holding all of them from the outermost to the innermost (so that e.g. the
+# page requests of the cursor used by a table `update_many` count for both).
+# Each request made by the API commander is recorded in all of them.
+
+
+@dataclass
+class OperationStats:
+    """
+    Statistics about the requests made by an operation, such as an
+    `insert_many` call or the scan of a cursor.
+
+    Attributes:
+        requests: the number of requests made.
+        pages: the number of result pages fetched (cursors) or paginated
+            requests made (e.g. collection `update_many` and `delete_many`).
+        total_latency_s: the total time spent waiting for responses, in seconds
+            (for concurrent requests, this can exceed the operation duration).
+        max_latency_s: the longest wait for a response, in seconds.
+        bytes_out: the total size of the request payloads, in bytes.
+        bytes_in: the total size of the response bodies, in bytes.
+        chunk_sizes: the number of documents/rows in each `insertMany`
+            request, in the order the requests were made.
+        queued_s: the total time spent waiting for a concurrency slot by the
+            requests of concurrent operations, in seconds.
+        warnings: the warnings returned by the Data API.
+    """
+
+    requests: int = 0
+    pages: int = 0
+    total_latency_s: float = 0.0
+    max_latency_s: float = 0.0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    chunk_sizes: list[int] = field(default_factory=list)
+    queued_s: float = 0.0
+    warnings: list[DataAPIWarningDescriptor] = field(default_factory=list)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(requests={self.requests}, "
+            f"pages={self.pages}, total_latency_s={self.total_latency_s:.6f}, "
+            f"max_latency_s={self.max_latency_s:.6f}, bytes_out={self.bytes_out}, "
+            f"bytes_in={self.bytes_in}, queued_s={self.queued_s:.6f})"
+        )
+
+    @property
+    def mean_latency_s(self) -> float | None:
+        """The mean wait for a response, in seconds (None if no requests)."""
+
+        if self.requests == 0:
+            return None
+        return self.total_latency_s / self.requests
+
+    def _record_request(
+        self,
+        *,
+        latency_s: float,
+        bytes_out: int,
+        bytes_in: int,
+        page: bool,
+        chunk_size: int | None,
+    ) -> None:
+        with self._lock:
+            self.requests += 1
+            if page:
+                self.pages += 1
+            self.total_latency_s += latency_s
+            self.max_latency_s = max(self.max_latency_s, latency_s)
+            self.bytes_out += bytes_out
+            self.bytes_in += bytes_in
+            if chunk_size is not None:
+                self.chunk_sizes.append(chunk_size)
+
+    def _record_queued(self, queued_s: float) -> None:
+        with self._lock:
+            self.queued_s += queued_s
+
+    def _record_warnings(self, warnings: list[DataAPIWarningDescriptor]) -> None:
+        with self._lock:
+            self.warnings.extend(warnings)
+
+
+_stats_collectors: contextvars.ContextVar[tuple[OperationStats, ...]] = (
+    contextvars.ContextVar("astrapy_operation_stats", default=())
+)
+
+
+def current_stats_collectors() -> tuple[OperationStats, ...]:
+    """The statistics objects the requests made now are recorded in."""
+
+    return _stats_collectors.get()
+
+
+@contextmanager
+def collecting_stats(stats: OperationStats) -> Iterator[OperationStats]:
+    """
+    A context manager recording the requests made within its block (including
+    those made by worker threads and tasks started in it) into a stats object.
+    """
+
+    token = _stats_collectors.set((*_stats_collectors.get(), stats))
+    try:
+        yield stats
+    finally:
+        _stats_collectors.reset(token)
+
+
+def _record_queued(collectors: tuple[OperationStats, ...], queued_s: float) -> None:
+    for stats in collectors:
+        stats._record_queued(queued_s)
+
+
+def timed_queueing(function: Callable[P, R]) -> Callable[P, R]:
+    """
+    Wrap a function about to be submitted to an executor, so that the time
+    until it starts running is recorded as time spent waiting for a slot.
+    """
+
+    collectors = _stats_collectors.get()
+    if not collectors:
+        return function
+    submitted_at = time.perf_counter()
+
+    @wraps(function)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        _record_queued(collectors, time.perf_counter() - submitted_at)
+        return function(*args, **kwargs)
+
+    return wrapper
+
+
+@asynccontextmanager
+async def timed_slot(semaphore: asyncio.Semaphore) -> AsyncIterator[None]:
+    """
+    Acquire a semaphore for the duration of the block, recording the wait
+    as time spent waiting for a concurrency slot.
+    """
+
+    collectors = _stats_collectors.get()
+    requested_at = time.perf_counter()
+    async with semaphore:
+        if collectors:
+            _record_queued(collectors, time.perf_counter() - requested_at)
+        yield
+
+
+def _attach_stats(target: Any, stats: OperationStats) -> None:
+    if hasattr(target, "stats"):
+        target.stats = stats
+
+
+def with_operation_stats(method: Callable[P, R]) -> Callable[P, R]:
+    """
+    Decorator recording the requests made by each call to a method (sync or
+    async) into a new OperationStats, attached as `stats` to the returned
+    result or, if an exception is raised, to its partial result, if any.
+    """
+
+    if inspect.iscoroutinefunction(method):
+
+        @wraps(method)
+        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+            stats = OperationStats()
+            try:
+                with collecting_stats(stats):
+                    result = await method(*args, **kwargs)
+            except Exception as exc:
+                _attach_stats(getattr(exc, "partial_result", None), stats)
+                raise
+            _attach_stats(result, stats)
+            return result
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @wraps(method)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        stats = OperationStats()
+        try:
+            with collecting_stats(stats):
+                result = method(*args, **kwargs)
+        except Exception as exc:
+            _attach_stats(getattr(exc, "partial_result", None), stats)
+            raise
+        _attach_stats(result, stats)
+        return result
+
+    return wrapper
@@ -0,0 +1,323 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+from astrapy.utils.str_enum import StrEnum
+
+# The profile being collected (if any) is found through a context variable:
+# when no profiling is active, each instrumented phase costs a lookup of the
+# variable and nothing else (the same shared no-op context manager is used).
+
+
+class ProfilePhase(StrEnum):
+    """
+    The phases of the processing of a request.
+
+    Values:
+        PREPROCESS: the conversion of the user-supplied payload (e.g. datetimes,
+            vectors, table values) into its wire-ready form.
+        ENCODE: the JSON-encoding of the payload.
+        NETWORK: the wait for the HTTP response.
+        DECODE: the JSON-decoding of the response body.
+        POSTPROCESS: the conversion of the response into the returned objects
+            (e.g. documents, table rows and primary keys).
+    """
+
+    PREPROCESS = "preprocess"
+    ENCODE = "encode"
+    NETWORK = "network"
+    DECODE = "decode"
+    POSTPROCESS = "postprocess"
+
+
+@dataclass
+class PhaseStats:
+    """
+    The time accumulated in a phase.
+
+    Attributes:
+        count: the number of times the phase was entered.
+        wall_s: the elapsed (wall clock) time, in seconds.
+        cpu_s: the CPU time of the executing thread, in seconds. For async
+            code, this includes the work done by other tasks while a phase
+            awaits (notably for the NETWORK phase).
+    """
+
+    count: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+
+    def copy(self) -> PhaseStats:
+        return PhaseStats(count=self.count, wall_s=self.wall_s, cpu_s=self.cpu_s)
+
+    def add(self, other: PhaseStats) -> None:
+        self.count += other.count
+        self.wall_s += other.wall_s
+        self.cpu_s += other.cpu_s
+
+
+class Profile:
+    """
+    The wall and CPU time spent in each phase (see `ProfilePhase`) by the
+    requests issued within a `profiling()` block, broken down by command.
+
+    Phases not tied to a specific command (e.g. the conversion of a response
+    page) are attributed to the most recent command of the same thread or task.
+
+    A profile is filled from all the threads and tasks started within the block
+    (including those of concurrent `insert_many` calls) and can be inspected
+    while the collection is in progress.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str | None, ProfilePhase], PhaseStats] = {}
+        self.started_at = time.perf_counter()
+        self.ended_at: float | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(wall_s={self.wall_s:.6f})"
+
+    def _record(
+        self, command: str | None, phase: ProfilePhase, wall_s: float, cpu_s: float
+    ) -> None:
+        with self._lock:
+            stats = self._stats.get((command, phase))
+            if stats is None:
+                stats = PhaseStats()
+                self._stats[(command, phase)] = stats
+            stats.count += 1
+            stats.wall_s += wall_s
+            stats.cpu_s += cpu_s
+
+    @property
+    def wall_s(self) -> float:
+        """The duration of the profiling block (so far), in seconds."""
+
+        return (self.ended_at or time.perf_counter()) - self.started_at
+
+    def phases(self) -> dict[ProfilePhase, PhaseStats]:
+        """
+        The time spent in each phase, summed over all commands.
+
+        Returns:
+            a dictionary from ProfilePhase to (a copy of the) PhaseStats.
+        """
+
+        totals = {phase: PhaseStats() for phase in ProfilePhase}
+        with self._lock:
+            for (_, phase), stats in self._stats.items():
+                totals[phase].add(stats)
+        return totals
+
+    def by_command(self) -> dict[str | None, dict[ProfilePhase, PhaseStats]]:
+        """
+        The time spent in each phase, separately for each command.
+
+        Returns:
+            a dictionary from command name (such as "find"; None for
+            non-Data API requests) to a dictionary from ProfilePhase to (a copy
+            of the) PhaseStats.
+        """
+
+        result: dict[str | None, dict[ProfilePhase, PhaseStats]] = {}
+        with self._lock:
+            for (command, phase), stats in self._stats.items():
+                result.setdefault(command, {})[phase] = stats.copy()
+        return result
+
+    def summary(self) -> dict[str, Any]:
+        """
+        A JSON-friendly summary of the profile.
+
+        Returns:
+            a dictionary with the wall time of the block, the total time per
+            phase and the time per phase for each command.
+        """
+
+        def _phase_dict(stats: PhaseStats) -> dict[str, Any]:
+            return {"count": stats.count, "wall_s": stats.wall_s, "cpu_s": stats.cpu_s}
+
+        return {
+            "wall_s": self.wall_s,
+            "phases": {
+                phase.value: _phase_dict(stats)
+                for phase, stats in self.phases().items()
+            },
+            "commands": {
+                str(command): {
+                    phase.value: _phase_dict(stats) for phase, stats in phases.items()
+                }
+                for command, phases in self.by_command().items()
+            },
+        }
+
+    def report(self) -> str:
+        """
+        A human-readable report of the profile.
+
+        For each phase, the share of the wall time of the block is reported.
+        A large PREPROCESS/POSTPROCESS share points to the data conversion
+        (see the serdes options), a large ENCODE/DECODE share to the JSON codec,
+        a large NETWORK share to latency, to be addressed with more concurrency.
+        Shares adding up to much less than 100% mean time spent elsewhere (e.g.
+        in the caller's code); to more than 100%, concurrent requests.
+
+        Returns:
+            a multi-line string.
+        """
+
+        wall_s = self.wall_s
+        header = f"{'':<16}{'count':>8}{'wall_s':>12}{'share':>8}{'cpu_s':>12}"
+
+        def _line(label: str, stats: PhaseStats) -> str:
+            share = stats.wall_s / wall_s if wall_s > 0 else 0.0
+            return (
+                f"{label:<16}{stats.count:>8}{stats.wall_s:>12.6f}"
+                f"{share:>8.1%}{stats.cpu_s:>12.6f}"
+            )
+
+        phases = self.phases()
+        lines = [f"astrapy profile: {wall_s:.6f} s wall time", header]
+        lines.extend(_line(phase.value, phases[phase]) for phase in ProfilePhase)
+        total = PhaseStats()
+        for stats in phases.values():
+            total.add(stats)
+        lines.append(_line("(all phases)", total))
+        for command, command_phases in sorted(
+            self.by_command().items(), key=lambda item: str(item[0])
+        ):
+            lines.append("")
+            lines.append(f"command: {command}")
+            lines.extend(
+                _line(f"  {phase.value}", command_phases[phase])
+                for phase in ProfilePhase
+                if phase in command_phases
+            )
+        return "\n".join(lines)
+
+
+_current_profile: contextvars.ContextVar[Profile | None] = contextvars.ContextVar(
+    "astrapy_profile", default=None
+)
+# the command of the latest phase, for the phases not knowing their command
+_last_command: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "astrapy_profile_last_command", default=None
+)
+
+_NOT_PROFILING: AbstractContextManager[None] = nullcontext()
+
+
+class _PhaseTimer:
+    __slots__ = ("profile", "phase", "command", "_wall_start", "_cpu_start")
+
+    def __init__(
+        self, profile: Profile, phase: ProfilePhase, command: str | None
+    ) -> None:
+        self.profile = profile
+        self.phase = phase
+        if command is None:
+            self.command = _last_command.get()
+        else:
+            self.command = command
+            _last_command.set(command)
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+
+    def __enter__(self) -> None:
+        self._cpu_start = time.thread_time()
+        self._wall_start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        wall_s = time.perf_counter() - self._wall_start
+        cpu_s = time.thread_time() - self._cpu_start
+        self.profile._record(self.command, self.phase, wall_s, cpu_s)
+
+
+def profile_phase(
+    phase: ProfilePhase,
+    *,
+    command: str | None = None,
+    payload: dict[str, Any] | None = None,
+) -> AbstractContextManager[None]:
+    """
+    A context manager timing its block as a phase of the active profile, if any.
+
+    Args:
+        phase: the ProfilePhase.
+        command: the command the phase belongs to.
+        payload: alternatively, a command payload, such as `{"find": {...}}`.
+            If neither is given, the latest command of the context is used.
+    """
+
+    profile = _current_profile.get()
+    if profile is None:
+        return _NOT_PROFILING
+    if command is None and payload:
+        command = next(iter(payload))
+    return _PhaseTimer(profile, phase, command)
+
+
+@contextmanager
+def profiling() -> Iterator[Profile]:
+    """
+    A context manager collecting a profile of all requests made within it.
+
+    The profile accumulates the wall and CPU time spent converting payloads,
+    encoding them, waiting for the responses, decoding and converting them
+    (see `ProfilePhase`), separately for each command. The requests made in
+    threads and tasks started within the block are included (provided the
+    context variables are propagated to them, as astrapy does for its own
+    worker threads and as asyncio does for tasks).
+
+    Blocks can be nested: the requests are then profiled by the innermost one.
+
+    Example:
+        >>> from astrapy.profiling import profiling
+        >>> with profiling() as profile:
+        ...     rows = my_table.find({}, limit=5000).to_list()
+        ...
+        >>> print(profile.report())
+        astrapy profile: 1.284377 s wall time
+                           count      wall_s   share       cpu_s
+        preprocess             1    0.000051    0.0%    0.000050
+        encode                 3    0.000113    0.0%    0.000112
+        network                3    0.690412   53.8%    0.010721
+        decode                 3    0.147625   11.5%    0.147440
+        postprocess            3    0.401277   31.2%    0.401012
+        ...
+    """
+
+    profile = Profile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        profile.ended_at = time.perf_counter()
+        _current_profile.reset(token)
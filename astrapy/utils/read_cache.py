@@ -0,0 +1,321 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from astrapy.settings.defaults import (
+    DEFAULT_READ_CACHE_MAX_BYTES,
+    DEFAULT_READ_CACHE_TTL_MS,
+)
+
+# the Data API commands whose responses can be served from a read cache
+CACHEABLE_COMMANDS = {"find", "findOne", "countDocuments", "estimatedDocumentCount"}
+
+# commands sent to a keyspace, (re)creating or dropping the collection/table
+# named in their "name" parameter
+TARGET_SCHEMA_COMMANDS = {
+    "createCollection",
+    "deleteCollection",
+    "createTable",
+    "dropTable",
+}
+# commands sent to the API root, creating or dropping the keyspace named in "name"
+KEYSPACE_SCHEMA_COMMANDS = {"createKeyspace", "dropKeyspace"}
+SCHEMA_COMMANDS = TARGET_SCHEMA_COMMANDS | KEYSPACE_SCHEMA_COMMANDS
+
+# the number of URLs whose write generation is tracked by each cache
+MAX_TRACKED_GENERATION_URLS = 1024
+
+# (request URL, digest of the credential headers, encoded command payload)
+ReadCacheKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class ReadCacheStats:
+    """
+    A snapshot of the counters of a `ReadCache`.
+
+    Attributes:
+        hits: number of lookups served from the cache.
+        misses: number of lookups that had to reach the Data API.
+        evictions: number of entries removed to stay within the size bound.
+        expirations: number of entries discarded for having exceeded their TTL.
+        invalidations: number of entries discarded because of a write
+            to the collection or table they were read from (or because the
+            collection, table or keyspace was dropped or recreated).
+        entries: number of entries currently in the cache.
+        size_bytes: approximate total size of the cached entries, in bytes.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    entries: int
+    size_bytes: int
+
+
+@dataclass
+class _ReadCacheEntry:
+    response_text: str
+    size_bytes: int
+    expires_at: float | None
+
+
+class ReadCache:
+    """
+    A client-side, read-through cache for the responses to read commands
+    (`find`, `find_one`, `count_documents`, `estimated_document_count` and
+    the methods built on them) issued by collections and tables.
+
+    A cache is attached through the `read_cache` setting of the API options:
+    all collections and tables spawned with that setting share the same cache.
+    Entries are keyed on the full command payload (filter, projection, sort,
+    options), on the target collection/table and on the credentials of the
+    request (token, embedding and reranking API keys), so that a response is
+    never served to a client with different credentials. The cache is bounded
+    in size, with least-recently-used entries evicted first, and each entry expires
+    after a time-to-live. Any other command sent to a collection or table
+    (e.g. writes such as `insert_one`, `update_many`, `find_one_and_replace`)
+    discards all cached entries for that collection or table. Likewise,
+    dropping or creating a collection or table through a `Database` (or
+    a keyspace through a database admin) discards the corresponding entries
+    from all caches.
+
+    Only writes issued through this client are seen by the cache: changes
+    made by other clients are reflected in the cached reads only once the
+    entries expire. The cache is safe to use from several threads and from
+    async code.
+
+    Args:
+        max_bytes: an upper bound on the total size of the cached responses.
+            Responses larger than this bound are never cached.
+        ttl_ms: the time-to-live of each entry, in milliseconds. Passing None
+            makes entries last until evicted or invalidated.
+
+    Example:
+        >>> from astrapy.api_options import APIOptions, ReadCache
+        >>>
+        >>> my_cache = ReadCache(max_bytes=4 * 1024 * 1024, ttl_ms=60000)
+        >>> cached_coll = my_database.get_collection(
+        ...     "config",
+        ...     spawn_api_options=APIOptions(read_cache=my_cache),
+        ... )
+        >>> cached_coll.find_one({"key": "feature_flags"})
+        {'_id': '...', 'key': 'feature_flags', 'flags': ['x', 'y']}
+        >>> cached_coll.find_one({"key": "feature_flags"})  # no request issued
+        {'_id': '...', 'key': 'feature_flags', 'flags': ['x', 'y']}
+        >>> my_cache.stats()
+        ReadCacheStats(hits=1, misses=1, evictions=0, expirations=0, invalidations=0, entries=1, size_bytes=168)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = DEFAULT_READ_CACHE_MAX_BYTES,
+        ttl_ms: int | None = DEFAULT_READ_CACHE_TTL_MS,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("The cache `max_bytes` must be a positive integer.")
+        if ttl_ms is not None and ttl_ms <= 0:
+            raise ValueError("The cache `ttl_ms` must be a positive integer or None.")
+        self.max_bytes = max_bytes
+        self.ttl_ms = ttl_ms
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[ReadCacheKey, _ReadCacheEntry] = OrderedDict()
+        self._keys_by_url: dict[str, set[ReadCacheKey]] = {}
+        # the latest invalidation count of the recently written URLs, with
+        # `_generation_floor` standing for all the others (see `_generation`)
+        self._generation_by_url: OrderedDict[str, int] = OrderedDict()
+        self._generation_count = 0
+        self._generation_floor = 0
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        with _read_caches_lock:
+            _read_caches.add(self)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(max_bytes={self.max_bytes}, "
+            f"ttl_ms={self.ttl_ms})"
+        )
+
+    def stats(self) -> ReadCacheStats:
+        """
+        Return a snapshot of the cache counters.
+
+        Returns:
+            a ReadCacheStats object.
+        """
+
+        with self._lock:
+            return ReadCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def clear(self) -> None:
+        """
+        Discard all cached entries. The counters are not reset.
+        """
+
+        with self._lock:
+            for url in list(self._keys_by_url.keys()):
+                self._drop_url(url)
+
+    def _lookup(self, key: ReadCacheKey) -> tuple[str | None, int]:
+        """
+        Look up an entry, returning its response text (or None if missing)
+        along with the current generation for the key's URL, to be passed
+        back to `_store` once the response for a miss is obtained.
+        """
+
+        with self._lock:
+            url = key[0]
+            generation = self._generation(url)
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at is not None and entry.expires_at <= (
+                    time.monotonic()
+                ):
+                    self._remove(key)
+                    self._expirations += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry.response_text, generation
+            self._misses += 1
+            return None, generation
+
+    def _store(
+        self,
+        key: ReadCacheKey,
+        response_text: str,
+        size_bytes: int,
+        generation: int,
+    ) -> None:
+        full_size_bytes = size_bytes + sum(len(part) for part in key)
+        if full_size_bytes > self.max_bytes:
+            return
+        expires_at = (
+            None if self.ttl_ms is None else time.monotonic() + self.ttl_ms / 1000.0
+        )
+        with self._lock:
+            url = key[0]
+            # a write went through while this read was in flight: do not store
+            if self._generation(url) != generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _ReadCacheEntry(
+                response_text=response_text,
+                size_bytes=full_size_bytes,
+                expires_at=expires_at,
+            )
+            self._keys_by_url.setdefault(url, set()).add(key)
+            self._size_bytes += full_size_bytes
+            while self._size_bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._evictions += 1
+
+    def _generation(self, url: str) -> int:
+        # to be called with the lock held. A URL dropped from the (bounded)
+        # map gets the floor, never lower than its last generation: at worst,
+        # a read in flight at that time is not stored.
+        return self._generation_by_url.get(url, self._generation_floor)
+
+    def _invalidate(self, url: str) -> None:
+        with self._lock:
+            self._generation_count += 1
+            self._generation_by_url[url] = self._generation_count
+            self._generation_by_url.move_to_end(url)
+            while len(self._generation_by_url) > MAX_TRACKED_GENERATION_URLS:
+                _, oldest_generation = self._generation_by_url.popitem(last=False)
+                self._generation_floor = max(self._generation_floor, oldest_generation)
+            self._invalidations += len(self._keys_by_url.get(url, ()))
+            self._drop_url(url)
+
+    def _invalidate_prefix(self, url_prefix: str) -> None:
+        with self._lock:
+            urls = {
+                url
+                for url in (*self._keys_by_url, *self._generation_by_url)
+                if url.startswith(url_prefix)
+            }
+            # reads in flight for untracked URLs are not stored either
+            self._generation_count += 1
+            self._generation_floor = self._generation_count
+        for url in urls:
+            self._invalidate(url)
+
+    def _drop_url(self, url: str) -> None:
+        for key in list(self._keys_by_url.get(url, ())):
+            self._remove(key)
+
+    def _remove(self, key: ReadCacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._size_bytes -= entry.size_bytes
+        url_keys = self._keys_by_url[key[0]]
+        url_keys.discard(key)
+        if not url_keys:
+            del self._keys_by_url[key[0]]
+
+
+# all live caches, for the invalidations following schema changes, which
+# may be issued by objects (e.g. a Database) that have no cache attached
+_read_caches: weakref.WeakSet[ReadCache] = weakref.WeakSet()
+_read_caches_lock = threading.Lock()
+
+
+def _invalidate_for_schema_command(request_url: str, payload: dict[str, Any]) -> None:
+    """
+    Discard, from all read caches, the entries for the collection/table
+    (or the whole keyspace) dropped or created by a schema command.
+
+    Args:
+        request_url: the URL the command was sent to (a keyspace or the API root).
+        payload: the command payload, a single-key dictionary whose key is
+            in SCHEMA_COMMANDS.
+    """
+
+    ((command_name, command_body),) = payload.items()
+    target_name = (command_body or {}).get("name")
+    if not isinstance(target_name, str):
+        return
+    target_url = f"{request_url.rstrip('/')}/{target_name}"
+    with _read_caches_lock:
+        read_caches = list(_read_caches)
+    for read_cache in read_caches:
+        if command_name in TARGET_SCHEMA_COMMANDS:
+            read_cache._invalidate(target_url)
+        else:
+            read_cache._invalidate_prefix(f"{target_url}/")
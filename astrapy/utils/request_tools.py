@@ -24,6 +24,49 @@ from astrapy.exceptions import _TimeoutContext
 logger = logging.getLogger(__name__)
 
 
+# How the request payloads and response bodies are written to the (DEBUG) logs:
+# None for the full text, 0 for just their size, N > 0 for the first N characters.
+_logged_body_max_length: int | None = None
+
+
+def set_logged_body_max_length(max_length: int | None) -> None:
+    """
+    Set how request payloads and response bodies are written to the logs.
+
+    This is a process-wide setting, affecting only the DEBUG-level logging
+    of the `astrapy.utils.request_tools` logger (when that level is not
+    enabled, payloads and bodies are never formatted or decoded for logging).
+
+    Args:
+        max_length: if None (default), payloads and bodies are logged in full.
+            If zero, they are summarized by their size only. If a positive
+            number, the text beyond this many characters is omitted
+            (with an indication of the full size).
+
+    Example:
+        >>> import logging
+        >>> from astrapy.utils.request_tools import set_logged_body_max_length
+        >>> logging.getLogger("astrapy.utils.request_tools").setLevel(logging.DEBUG)
+        >>> set_logged_body_max_length(256)
+    """
+
+    global _logged_body_max_length
+    if max_length is not None and max_length < 0:
+        raise ValueError("The logged body max length cannot be negative.")
+    _logged_body_max_length = max_length
+
+
+def _loggable_body(body: str) -> str:
+    max_length = _logged_body_max_length
+    if max_length is None:
+        return f"'{body}'"
+    if max_length == 0:
+        return f"({len(body)} characters)"
+    if len(body) <= max_length:
+        return f"'{body}'"
+    return f"'{body[:max_length]}...' ({len(body)} characters)"
+
+
 def log_httpx_request(
     http_method: str,
     full_url: str,
@@ -36,6 +79,8 @@ def log_httpx_request(
     """
     Log the details of an HTTP request for debugging purposes.
 
+    Nothing is formatted unless the logger is enabled for the DEBUG level.
+
     Args:
         http_method: the HTTP verb of the request (e.g. "POST").
         full_url: the URL of the request (e.g. "https://domain.com/full/path").
@@ -44,32 +89,43 @@ def log_httpx_request(
         encoded_payload: the payload (in bytes) sent with the request, if any.
         timeout_ms: the timeout in milliseconds, if any is set.
     """
-    logger.debug(f"Request URL: {http_method} {full_url}")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("Request URL: %s %s", http_method, full_url)
     if request_params:
-        logger.debug(f"Request params: '{request_params}'")
+        logger.debug("Request params: '%s'", request_params)
     if redacted_request_headers:
-        logger.debug(f"Request headers: '{redacted_request_headers}'")
+        logger.debug("Request headers: '%s'", redacted_request_headers)
     if encoded_payload is not None:
-        logger.debug(f"Request payload: '{encoded_payload}'")
+        logger.debug("Request payload: %s", _loggable_body(encoded_payload))
     if timeout_context:
         logger.debug(
-            f"Timeout (ms): for request {timeout_context.request_ms or '(unset)'} ms"
-            f", overall operation {timeout_context.nominal_ms or '(unset)'} ms"
+            "Timeout (ms): for request %s ms, overall operation %s ms",
+            timeout_context.request_ms or "(unset)",
+            timeout_context.nominal_ms or "(unset)",
         )
     if caller_function_name:
-        logger.debug(f"Request invoked by function: '{caller_function_name}'")
+        logger.debug("Request invoked by function: '%s'", caller_function_name)
 
 
 def log_httpx_response(response: httpx.Response) -> None:
     """
     Log the details of an httpx.Response.
 
+    The response body is decoded only if the logger is enabled for the DEBUG
+    level (and not at all if bodies are logged by their size only).
+
     Args:
         response: the httpx.Response object to log.
     """
-    logger.debug(f"Response status code: {response.status_code}")
-    logger.debug(f"Response headers: '{response.headers}'")
-    logger.debug(f"Response text: '{response.text}'")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("Response status code: %s", response.status_code)
+    logger.debug("Response headers: '%s'", response.headers)
+    if _logged_body_max_length == 0:
+        logger.debug("Response text: (%s bytes)", len(response.content))
+    else:
+        logger.debug("Response text: %s", _loggable_body(response.text))
 
 
 class HttpMethod:
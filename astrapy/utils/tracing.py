@@ -0,0 +1,260 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import contextvars
+import inspect
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+from astrapy.utils.str_enum import StrEnum
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# A scope is made current (through a context variable) while the requests of an
+# operation are issued, so that observers receiving the request events can find
+# out which operation the requests belong to (see TracingObserver). Scopes nest:
+# the commander wraps each of its requests in a "request" scope, inside the
+# "operation" scope of e.g. `insert_many` or of a cursor scan, if any.
+
+
+class ScopeKind(StrEnum):
+    """
+    The kinds of operation scopes.
+    """
+
+    OPERATION = "operation"
+    REQUEST = "request"
+
+
+# (the callbacks receive the scope and the exception it ended with, if any)
+ScopeEndCallback = Callable[["_OperationScope", "BaseException | None"], None]
+
+
+class _OperationScope:
+    """
+    A unit of work (a method call, a cursor scan, an HTTP request) to which
+    the requests issued while it is current belong.
+
+    Scopes are created by `operation_scope`, `traced_operation` and
+    `request_scope`; parties interested in knowing when a scope ends register
+    a callback, invoked at most once.
+    """
+
+    __slots__ = (
+        "name",
+        "kind",
+        "attributes",
+        "parent",
+        "started_at",
+        "ended_at",
+        "_end_callbacks",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        kind: ScopeKind = ScopeKind.OPERATION,
+        attributes: dict[str, Any] | None = None,
+        parent: _OperationScope | None = None,
+    ) -> None:
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes or {}
+        self.parent = parent
+        self.started_at = time.perf_counter()
+        self.ended_at: float | None = None
+        self._end_callbacks: list[ScopeEndCallback] = []
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name}, kind={self.kind.value})"
+
+    @property
+    def operation(self) -> _OperationScope | None:
+        """The innermost operation scope (this one or an ancestor), if any."""
+
+        scope: _OperationScope | None = self
+        while scope is not None and scope.kind != ScopeKind.OPERATION:
+            scope = scope.parent
+        return scope
+
+    def add_end_callback(self, callback: ScopeEndCallback) -> bool:
+        """
+        Register a callback for the end of the scope.
+
+        Returns:
+            False if the scope has ended already (the callback is not registered).
+        """
+
+        with self._lock:
+            if self.ended_at is not None:
+                return False
+            self._end_callbacks.append(callback)
+            return True
+
+    def end(self, error: BaseException | None = None) -> None:
+        """End the scope (ending it again has no effect)."""
+
+        with self._lock:
+            if self.ended_at is not None:
+                return
+            self.ended_at = time.perf_counter()
+            callbacks, self._end_callbacks = self._end_callbacks, []
+        for callback in callbacks:
+            callback(self, error)
+
+    @contextmanager
+    def activate(self) -> Iterator[_OperationScope]:
+        """Make this scope current (without ending it) within a `with` block."""
+
+        token = _current_scope.set(self)
+        try:
+            yield self
+        finally:
+            _current_scope.reset(token)
+
+
+_current_scope: contextvars.ContextVar[_OperationScope | None] = contextvars.ContextVar(
+    "astrapy_operation_scope", default=None
+)
+_current_request_attributes: contextvars.ContextVar[dict[str, Any] | None] = (
+    contextvars.ContextVar("astrapy_request_attributes", default=None)
+)
+
+
+def current_scope() -> _OperationScope | None:
+    """The current scope, if any."""
+
+    return _current_scope.get()
+
+
+def current_request_attributes() -> dict[str, Any]:
+    """
+    The attributes (such as the chunk index) set for the requests issued
+    in the current context.
+    """
+
+    return _current_request_attributes.get() or {}
+
+
+@contextmanager
+def _scope(
+    name: str, kind: ScopeKind, attributes: dict[str, Any]
+) -> Iterator[_OperationScope]:
+    scope = _OperationScope(
+        name, kind=kind, attributes=attributes, parent=_current_scope.get()
+    )
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    except BaseException as exc:
+        scope.end(exc)
+        raise
+    else:
+        scope.end()
+    finally:
+        _current_scope.reset(token)
+
+
+@contextmanager
+def operation_scope(name: str, **attributes: Any) -> Iterator[_OperationScope]:
+    """
+    A context manager running its block within a new operation scope.
+
+    Args:
+        name: the name of the operation, e.g. "insert_many".
+        attributes: additional descriptive attributes for the operation.
+    """
+
+    with _scope(name, ScopeKind.OPERATION, attributes) as scope:
+        yield scope
+
+
+@contextmanager
+def request_scope(name: str | None) -> Iterator[_OperationScope]:
+    """A context manager wrapping the issuing of a single request in a scope."""
+
+    with _scope(name or "request", ScopeKind.REQUEST, {}) as scope:
+        yield scope
+
+
+@contextmanager
+def request_attributes(**attributes: Any) -> Iterator[None]:
+    """
+    A context manager attaching attributes, such as the chunk index or the
+    page number, to the requests issued within its block.
+    """
+
+    token = _current_request_attributes.set(
+        {**current_request_attributes(), **attributes}
+    )
+    try:
+        yield
+    finally:
+        _current_request_attributes.reset(token)
+
+
+def in_current_context(function: Callable[P, R]) -> Callable[P, R]:
+    """
+    Wrap a function so that, wherever it is called (e.g. in a worker thread of
+    an executor), it runs with the context variables of the caller of this
+    function. Each call gets its own copy of the context, so that concurrent
+    calls are possible.
+    """
+
+    context = contextvars.copy_context()
+
+    @wraps(function)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        return context.copy().run(function, *args, **kwargs)
+
+    return wrapper
+
+
+def traced_operation(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Decorator factory running each call to a method (sync or async) within
+    its own operation scope.
+
+    Args:
+        name: the name of the operation, e.g. "insert_many".
+    """
+
+    def _decorator(method: Callable[P, R]) -> Callable[P, R]:
+        if inspect.iscoroutinefunction(method):
+
+            @wraps(method)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                with operation_scope(name):
+                    return await method(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(method)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with operation_scope(name):
+                return method(*args, **kwargs)
+
+        return wrapper
+
+    return _decorator
@@ -0,0 +1,227 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from astrapy import AstraDBAdmin, DataAPIClient, Database
+from astrapy.api_options import AdminMetadataCache, APIOptions, DevOpsAPIURLOptions
+from astrapy.settings.defaults import DEV_OPS_RESPONSE_HTTP_ACCEPTED
+from astrapy.utils.api_options import defaultAPIOptions
+from astrapy.utils.request_tools import HttpMethod
+
+DB_ID = "01234567-89ab-cdef-0123-456789abcdef"
+API_ENDPOINT = f"https://{DB_ID}-region.apps.astra-test.datastax.com"
+TOKEN = "AstraCS:the_token"
+
+DATABASE_INFO = {
+    "id": DB_ID,
+    "orgId": "the_org",
+    "ownerId": "the_owner",
+    "status": "ACTIVE",
+    "info": {
+        "name": "the_db",
+        "keyspaces": ["default_keyspace"],
+        "cloudProvider": "AWS",
+        "datacenters": [],
+    },
+}
+REGION = {
+    "classification": "standard",
+    "cloudProvider": "AWS",
+    "displayName": "US East (Ohio)",
+    "enabled": True,
+    "name": "us-east-2",
+    "region_type": "vector",
+    "reservedForQualifiedUsers": False,
+    "zone": "na",
+}
+
+
+class CountingHandler:
+    """Serve a canned JSON response (optionally after a delay), counting requests."""
+
+    def __init__(self, response: Any, *, delay_s: float = 0.0) -> None:
+        self.response = response
+        self.delay_s = delay_s
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: Request) -> Response:
+        with self._lock:
+            self.count += 1
+        time.sleep(self.delay_s)
+        return Response(json.dumps(self.response), content_type="application/json")
+
+
+def _admin_client(
+    httpserver: HTTPServer,
+    cache: AdminMetadataCache,
+    token: str = TOKEN,
+) -> DataAPIClient:
+    return DataAPIClient(
+        token,
+        environment="test",
+        api_options=APIOptions(
+            admin_metadata_cache=cache,
+            dev_ops_api_url_options=DevOpsAPIURLOptions(
+                dev_ops_url=httpserver.url_for("/"),
+                dev_ops_api_version="vx",
+            ),
+        ),
+    )
+
+
+def _serve_database_info(httpserver: HTTPServer, handler: CountingHandler) -> None:
+    httpserver.expect_request(
+        f"/vx/databases/{DB_ID}",
+        method=HttpMethod.GET,
+    ).respond_with_handler(handler)
+
+
+def _serve_regions(httpserver: HTTPServer, handler: CountingHandler) -> None:
+    httpserver.expect_request(
+        "/vx/regions/serverless",
+        method=HttpMethod.GET,
+    ).respond_with_handler(handler)
+
+
+class TestAdminMetadataCache:
+    @pytest.mark.describe("test of admin metadata cache, database info and regions")
+    def test_admin_metadata_cache_sync(self, httpserver: HTTPServer) -> None:
+        cache = AdminMetadataCache()
+        info_handler = CountingHandler(DATABASE_INFO)
+        regions_handler = CountingHandler([REGION])
+        _serve_database_info(httpserver, info_handler)
+        _serve_regions(httpserver, regions_handler)
+        client = _admin_client(httpserver, cache)
+        admin: AstraDBAdmin = client.get_admin()
+
+        assert admin.database_info(DB_ID).name == "the_db"
+        assert admin.database_info(DB_ID).name == "the_db"
+        # the database and its database admin share the entry
+        assert client.get_database(API_ENDPOINT).info().name == "the_db"
+        assert admin.get_database_admin(API_ENDPOINT).info().status == "ACTIVE"
+        assert info_handler.count == 1
+
+        admin.find_available_regions()
+        admin.find_available_regions(only_org_enabled_regions=True)
+        admin.find_available_regions(only_org_enabled_regions=False)
+        assert regions_handler.count == 2
+
+        # another token does not see the cached entries
+        _admin_client(
+            httpserver, cache, token="AstraCS:other"
+        ).get_admin().database_info(DB_ID)
+        assert info_handler.count == 2
+
+        cache.invalidate(kind=AdminMetadataCache.AVAILABLE_REGIONS)
+        admin.find_available_regions()
+        admin.database_info(DB_ID)
+        assert (info_handler.count, regions_handler.count) == (2, 3)
+
+        # dropping the database invalidates its info
+        httpserver.expect_request(
+            f"/vx/databases/{DB_ID}/terminate",
+            method=HttpMethod.POST,
+        ).respond_with_data("", status=DEV_OPS_RESPONSE_HTTP_ACCEPTED)
+        admin.drop_database(DB_ID, wait_until_active=False)
+        admin.database_info(DB_ID)
+        assert info_handler.count == 3
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (5, 6)
+
+    @pytest.mark.describe("test of admin metadata cache, persistence to file")
+    def test_admin_metadata_cache_persistence(
+        self,
+        httpserver: HTTPServer,
+        tmp_path: Path,
+    ) -> None:
+        persist_path = str(tmp_path / "admin_cache.json")
+        info_handler = CountingHandler(DATABASE_INFO)
+        regions_handler = CountingHandler([REGION])
+        _serve_database_info(httpserver, info_handler)
+        _serve_regions(httpserver, regions_handler)
+
+        cache0 = AdminMetadataCache(persist_path=persist_path)
+        admin0 = _admin_client(httpserver, cache0).get_admin()
+        admin0.database_info(DB_ID)
+        admin0.find_available_regions()
+        with open(persist_path) as p_file:
+            assert TOKEN not in p_file.read()
+        # the file is replaced atomically, leaving no temporary files behind
+        assert os.listdir(tmp_path) == ["admin_cache.json"]
+
+        # a new cache (e.g. in a new process) picks up the persisted entries
+        cache1 = AdminMetadataCache(persist_path=persist_path)
+        assert cache1.stats().entries == 2
+        admin1 = _admin_client(httpserver, cache1).get_admin()
+        assert admin1.database_info(DB_ID).raw == DATABASE_INFO
+        assert admin1.find_available_regions()[0].name == "us-east-2"
+        assert (info_handler.count, regions_handler.count) == (1, 1)
+
+        # expired entries are not loaded
+        cache1.invalidate()
+        short_cache = AdminMetadataCache(catalog_ttl_ms=50, persist_path=persist_path)
+        _admin_client(httpserver, short_cache).get_admin().find_available_regions()
+        time.sleep(0.1)
+        assert AdminMetadataCache(persist_path=persist_path).stats().entries == 0
+
+        # a corrupt file is ignored
+        with open(persist_path, "w") as p_file:
+            p_file.write("{not json")
+        assert AdminMetadataCache(persist_path=persist_path).stats().entries == 0
+
+    @pytest.mark.describe("test of admin metadata cache, async and providers")
+    async def test_admin_metadata_cache_async(self, httpserver: HTTPServer) -> None:
+        cache = AdminMetadataCache()
+        info_handler = CountingHandler(DATABASE_INFO, delay_s=0.2)
+        _serve_database_info(httpserver, info_handler)
+        admin = _admin_client(httpserver, cache).get_admin()
+        infos = await asyncio.gather(
+            *(admin.async_database_info(DB_ID) for _ in range(5))
+        )
+        assert all(info.raw == DATABASE_INFO for info in infos)
+        assert info_handler.count == 1
+        assert cache.stats().deduplicated == 4
+
+        providers_handler = CountingHandler({"status": {"embeddingProviders": {}}})
+        httpserver.expect_request(
+            "/v1",
+            method=HttpMethod.POST,
+        ).respond_with_handler(providers_handler)
+        database = Database(
+            api_endpoint=httpserver.url_for("/"),
+            keyspace="keyspace",
+            api_options=defaultAPIOptions(environment="other").with_override(
+                APIOptions(admin_metadata_cache=cache)
+            ),
+        )
+        db_admin = database.get_database_admin()
+        await db_admin.async_find_embedding_providers()
+        await db_admin.async_find_embedding_providers()
+        await db_admin.async_find_embedding_providers(filter_model_status="ALL")
+        assert providers_handler.count == 2
@@ -0,0 +1,297 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import threading
+import time
+from typing import Any
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from astrapy import AstraDBAdmin, DataAPIClient
+from astrapy.admin import (
+    AdaptivePollingStrategy,
+    DeadlineAwarePollingStrategy,
+    ExponentialPollingStrategy,
+    FixedPollingStrategy,
+    PollingState,
+    PollingStrategy,
+)
+from astrapy.api_options import APIOptions, DevOpsAPIURLOptions
+from astrapy.exceptions import DevOpsAPIException, DevOpsAPITimeoutException
+from astrapy.settings.defaults import (
+    DEV_OPS_RESPONSE_HTTP_CREATED,
+    DEV_OPS_RESPONSE_HTTP_NOT_FOUND,
+)
+from astrapy.utils.request_tools import HttpMethod
+
+DB_IDS = [f"01234567-89ab-cdef-0123-45678900000{i}" for i in range(3)]
+
+
+def _db_info(db_id: str, status: str) -> dict[str, Any]:
+    return {
+        "id": db_id,
+        "orgId": "the_org",
+        "ownerId": "the_owner",
+        "status": status,
+        "info": {
+            "name": f"db_{db_id[-1]}",
+            "keyspaces": ["default_keyspace"],
+            "cloudProvider": "AWS",
+            "region": "us-east-2",
+            "datacenters": [],
+        },
+    }
+
+
+def _state(status: str = "PENDING", **kwargs: Any) -> PollingState:
+    return PollingState(
+        **{
+            "target": "database",
+            "status": status,
+            "polls": 0,
+            "status_polls": 0,
+            "elapsed_s": 0.0,
+            "status_elapsed_s": 0.0,
+            "remaining_s": None,
+            **kwargs,
+        }
+    )
+
+
+class ScriptedStatuses:
+    """
+    Serve the database list, each database going through a scripted sequence
+    of statuses (one per listing, the last one repeating). Counts the listings.
+    """
+
+    def __init__(self, statuses: dict[str, list[str]]) -> None:
+        self.statuses = statuses
+        self.list_count = 0
+        self._lock = threading.Lock()
+
+    def _listing(self) -> list[dict[str, Any]]:
+        with self._lock:
+            listing = [
+                _db_info(db_id, db_statuses[min(self.list_count, len(db_statuses) - 1)])
+                for db_id, db_statuses in self.statuses.items()
+            ]
+            self.list_count += 1
+        return listing
+
+    def __call__(self, request: Request) -> Response:
+        return Response(json.dumps(self._listing()), content_type="application/json")
+
+    def single(self, request: Request) -> Response:
+        return Response(json.dumps(self._listing()[0]), content_type="application/json")
+
+
+def _polling_admin(
+    httpserver: HTTPServer,
+    polling_strategy: PollingStrategy,
+) -> AstraDBAdmin:
+    return DataAPIClient(
+        "AstraCS:the_token",
+        environment="test",
+        api_options=APIOptions(
+            polling_strategy=polling_strategy,
+            dev_ops_api_url_options=DevOpsAPIURLOptions(
+                dev_ops_url=httpserver.url_for("/"),
+                dev_ops_api_version="vx",
+            ),
+        ),
+    ).get_admin()
+
+
+def _serve_creations(httpserver: HTTPServer, db_ids: list[str]) -> None:
+    for db_id in db_ids:
+        httpserver.expect_oneshot_request(
+            "/vx/databases",
+            method=HttpMethod.POST,
+        ).respond_with_data(
+            "", headers={"Location": db_id}, status=DEV_OPS_RESPONSE_HTTP_CREATED
+        )
+
+
+class TestAdminPolling:
+    @pytest.mark.describe("test of polling strategies, intervals")
+    def test_polling_strategies(self) -> None:
+        fixed = FixedPollingStrategy(database_interval_s=10, keyspace_interval_s=1)
+        assert fixed.next_interval_s(_state()) == 10
+        assert fixed.next_interval_s(_state(target="keyspace")) == 1
+
+        expo = ExponentialPollingStrategy(
+            initial_interval_s=1, factor=2, max_interval_s=5
+        )
+        assert [expo.next_interval_s(_state(status_polls=i)) for i in range(5)] == [
+            1,
+            2,
+            4,
+            5,
+            5,
+        ]
+
+        adaptive = AdaptivePollingStrategy(min_interval_s=1, max_interval_s=20)
+        assert adaptive.expected_duration_s("database", "PENDING") is None
+        adaptive.observe_transition("database", "PENDING", "ACTIVE", 100.0)
+        assert adaptive.expected_duration_s("database", "PENDING") == 100.0
+        # far from the expected transition: long intervals; close to it: short ones
+        assert adaptive.next_interval_s(_state(status_elapsed_s=10.0)) == 20
+        assert adaptive.next_interval_s(_state(status_elapsed_s=99.0)) == 1
+
+        deadline_aware = DeadlineAwarePollingStrategy(
+            FixedPollingStrategy(database_interval_s=10), margin_s=1.0
+        )
+        assert deadline_aware.next_interval_s(_state()) == 10
+        assert deadline_aware.next_interval_s(_state(remaining_s=4.0)) == 3.0
+        assert deadline_aware.next_interval_s(_state(remaining_s=0.5)) == 0
+
+    @pytest.mark.describe("test of create_database with a custom polling strategy")
+    def test_create_database_polling_strategy(self, httpserver: HTTPServer) -> None:
+        _serve_creations(httpserver, DB_IDS[:1])
+        statuses = ScriptedStatuses({DB_IDS[0]: ["PENDING"] * 3 + ["ACTIVE"]})
+        httpserver.expect_request(
+            f"/vx/databases/{DB_IDS[0]}",
+            method=HttpMethod.GET,
+        ).respond_with_handler(statuses.single)
+        # the check for the polling capability of the token
+        httpserver.expect_request(
+            re.compile("/vx/databases/.+"),
+            method=HttpMethod.GET,
+        ).respond_with_data("", status=DEV_OPS_RESPONSE_HTTP_NOT_FOUND)
+        admin = _polling_admin(
+            httpserver,
+            ExponentialPollingStrategy(initial_interval_s=0.01, max_interval_s=0.05),
+        )
+        db_admin = admin.create_database(
+            "db_0",
+            cloud_provider="aws",
+            region="us-east-2",
+            timeout_ms=5000,
+        )
+        assert db_admin.id == DB_IDS[0]
+        assert statuses.list_count == 4
+
+    @pytest.mark.describe("test of shared poller, many database creations")
+    def test_status_poller_submit(self, httpserver: HTTPServer) -> None:
+        _serve_creations(httpserver, DB_IDS)
+        statuses = ScriptedStatuses(
+            {
+                DB_IDS[0]: ["PENDING", "ACTIVE"],
+                DB_IDS[1]: ["PENDING", "INITIALIZING", "ACTIVE"],
+                DB_IDS[2]: ["INITIALIZING", "ERROR"],
+            }
+        )
+        httpserver.expect_request(
+            "/vx/databases",
+            method=HttpMethod.GET,
+        ).respond_with_handler(statuses)
+        admin = _polling_admin(
+            httpserver,
+            FixedPollingStrategy(database_interval_s=0.05),
+        )
+        with admin.get_status_poller() as closed_poller:
+            db_futures = [
+                admin.submit_create_database(
+                    f"db_{i}",
+                    cloud_provider="aws",
+                    region="us-east-2",
+                    timeout_ms=5000,
+                )
+                for i in range(3)
+            ]
+            assert db_futures[0].result(timeout=5).id == DB_IDS[0]
+            assert db_futures[1].result(timeout=5).id == DB_IDS[1]
+            with pytest.raises(DevOpsAPIException, match="unexpected status ERROR"):
+                db_futures[2].result(timeout=5)
+        # one listing per cycle checks all pending databases at once
+        assert statuses.list_count == 3
+        assert admin.get_status_poller() is admin.get_status_poller()
+        # the closed poller is replaced by a new one
+        assert admin.get_status_poller() is not closed_poller
+        _serve_creations(httpserver, DB_IDS[:1])
+        db_future = admin.submit_create_database(
+            "db_0",
+            cloud_provider="aws",
+            region="us-east-2",
+            timeout_ms=5000,
+        )
+        assert db_future.result(timeout=5).id == DB_IDS[0]
+        admin.get_status_poller().close()
+
+    @pytest.mark.describe("test of shared poller, async and timeouts")
+    async def test_status_poller_submit_async(self, httpserver: HTTPServer) -> None:
+        _serve_creations(httpserver, DB_IDS[:2])
+        statuses = ScriptedStatuses(
+            {
+                DB_IDS[0]: ["PENDING", "PENDING", "ACTIVE"],
+                DB_IDS[1]: ["PENDING"],
+            }
+        )
+        httpserver.expect_request(
+            "/vx/databases",
+            method=HttpMethod.GET,
+        ).respond_with_handler(statuses)
+        admin = _polling_admin(
+            httpserver,
+            FixedPollingStrategy(database_interval_s=0.05),
+        )
+        awaitable0 = await admin.async_submit_create_database(
+            "db_0",
+            cloud_provider="aws",
+            region="us-east-2",
+        )
+        awaitable1 = await admin.async_submit_create_database(
+            "db_1",
+            cloud_provider="aws",
+            region="us-east-2",
+            database_admin_timeout_ms=300,
+        )
+        results = await asyncio.gather(awaitable0, awaitable1, return_exceptions=True)
+        assert getattr(results[0], "id", None) == DB_IDS[0]
+        assert isinstance(results[1], DevOpsAPITimeoutException)
+        admin.get_status_poller().close()
+
+    @pytest.mark.describe("test of shared poller, closed while waiting")
+    def test_status_poller_close_while_waiting(
+        self,
+        httpserver: HTTPServer,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        thread_errors: list[BaseException | None] = []
+        monkeypatch.setattr(
+            threading, "excepthook", lambda args: thread_errors.append(args.exc_value)
+        )
+        admin = _polling_admin(
+            httpserver,
+            FixedPollingStrategy(database_interval_s=30),
+        )
+        poller = admin.get_status_poller()
+        db_future = poller.wait_for_database_creation(DB_IDS[0])
+        poller_thread = poller._thread
+        assert poller_thread is not None
+        # let the poller thread reach its wait for the next cycle
+        time.sleep(0.1)
+        poller.close()
+        poller_thread.join(timeout=5)
+        assert not poller_thread.is_alive()
+        assert thread_errors == []
+        with pytest.raises(DevOpsAPIException, match="Poller closed"):
+            db_future.result(timeout=1)
@@ -105,6 +105,15 @@ class TestAPICommander:
         async_ctx = cmd_custom.async_client._transport._pool._ssl_context  # type: ignore[attr-defined]
         assert async_ctx is custom_ctx
 
+        # SSL contexts are cached per CA path
+        cmd_custom2 = APICommander(
+            api_endpoint="https://example.org",
+            path="/v1",
+            spawner=None,
+            ca_cert_path=ca_path,
+        )
+        assert cmd_custom2.client._transport._pool._ssl_context is custom_ctx  # type: ignore[attr-defined]
+
         # _copy preserves ca_cert_path
         cmd_copied = cmd_custom._copy(path="/v2")
         assert cmd_copied.ca_cert_path == ca_path
@@ -106,3 +106,26 @@ class TestAPIOptions:
         # an explicit None resets to the default (certifi bundle)
         opts_4 = opts_1.with_override(APIOptions(ca_cert_path=None))
         assert opts_4.ca_cert_path is None
+
+    @pytest.mark.describe("test of memoized overrides in APIOptions")
+    def test_apioptions_memoized_overrides(self) -> None:
+        opts_d = defaultAPIOptions(environment="dev")
+        assert opts_d.with_override(APIOptions()) is opts_d
+        assert opts_d.with_override(opts_d) is opts_d
+
+        opts_full = opts_d.with_override(
+            APIOptions(
+                database_additional_headers={"h": "v"},
+                redacted_header_names={"h"},
+            )
+        )
+        opts_1 = defaultAPIOptions(environment="dev").with_override(opts_full)
+        # memoized results are returned for the same full options object
+        assert opts_d.with_override(opts_full) is opts_d.with_override(opts_full)
+        assert opts_d.with_override(opts_full) == opts_1
+        # partial options are not memoized (they are not treated as immutable)
+        partial = APIOptions(callers=[("c", "v")])
+        opts_2 = opts_d.with_override(partial)
+        partial.callers = [("c2", "v2")]
+        assert opts_d.with_override(partial).callers == [("c2", "v2")]
+        assert opts_2.callers == [("c", "v")]
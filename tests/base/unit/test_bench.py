@@ -0,0 +1,115 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from astrapy.bench import (
+    BenchmarkResult,
+    compare_results,
+    load_results,
+    main,
+    run_benchmarks,
+)
+
+
+def _result(name: str, median_s: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name,
+        rounds=1,
+        calls_per_round=1,
+        median_s=median_s,
+        min_s=median_s,
+        max_s=median_s,
+    )
+
+
+class TestBench:
+    @pytest.mark.describe("test of running a selection of benchmarks")
+    def test_bench_run(self) -> None:
+        results = run_benchmarks(
+            only="^(vector_from_bytes|table_cursor_iteration|insert_many_chunk20_)",
+            rounds=1,
+        )
+        assert [result.name for result in results] == [
+            "vector_from_bytes",
+            "table_cursor_iteration",
+            "insert_many_chunk20_conc1",
+            "insert_many_chunk20_conc8",
+        ]
+        assert all(0 < result.min_s <= result.median_s for result in results)
+
+    @pytest.mark.describe("test of the comparison of benchmarks with a baseline")
+    def test_bench_compare(self) -> None:
+        comparisons = compare_results(
+            [_result("a", 1.2), _result("b", 1.3), _result("new", 1.0)],
+            [_result("a", 1.0), _result("b", 1.0), _result("gone", 1.0)],
+            tolerance=0.25,
+        )
+        assert [(cmp.name, cmp.regressed) for cmp in comparisons] == [
+            ("a", False),
+            ("b", True),
+        ]
+        assert comparisons[1].ratio == pytest.approx(1.3)
+
+    @pytest.mark.describe("test of bench, command-line entry point")
+    def test_bench_main(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        results_path = tmp_path / "results.json"
+        main(["--only", "^vector_", "--rounds", "2", "--save", str(results_path)])
+        saved = json.loads(results_path.read_text())
+        assert [res["name"] for res in saved["results"]] == [
+            "vector_to_bytes",
+            "vector_from_bytes",
+        ]
+        assert "vector_to_bytes" in capsys.readouterr().out
+        assert [res.name for res in load_results(str(results_path))] == [
+            "vector_to_bytes",
+            "vector_from_bytes",
+        ]
+
+        # a baseline 1000 times faster makes for a regression
+        for res in saved["results"]:
+            res["median_s"] /= 1000
+        baseline_path = tmp_path / "baseline.json"
+        baseline_path.write_text(json.dumps(saved))
+        with pytest.raises(SystemExit) as exc_info:
+            main(
+                [
+                    "--only",
+                    "^vector_to",
+                    "--rounds",
+                    "1",
+                    "--baseline",
+                    str(baseline_path),
+                ]
+            )
+        assert "vector_to_bytes" in str(exc_info.value)
+        main(
+            [
+                "--only",
+                "^vector_to",
+                "--rounds",
+                "1",
+                "--baseline",
+                str(baseline_path),
+                "--tolerance",
+                "100000",
+            ]
+        )
@@ -0,0 +1,322 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from astrapy import Collection, Database, Table
+from astrapy.exceptions import (
+    CollectionBulkWriteException,
+    DataAPIResponseException,
+    TableBulkWriteException,
+)
+from astrapy.operations import (
+    DeleteMany,
+    DeleteOne,
+    InsertMany,
+    InsertOne,
+    TableDeleteOne,
+    TableInsertMany,
+    TableInsertOne,
+    TableUpdateOne,
+    UpdateOne,
+)
+from astrapy.utils.api_options import defaultAPIOptions
+from astrapy.utils.request_tools import HttpMethod
+
+from ..conftest import DefaultCollection, DefaultTable
+
+BASE_PATH = "v1"
+KEYSPACE = "keyspace"
+COLLECTION_NAME = "collection"
+TABLE_NAME = "table"
+
+
+@pytest.fixture
+def mock_collection(httpserver: HTTPServer) -> DefaultCollection:
+    coll: DefaultCollection = Collection(
+        database=Database(
+            api_endpoint=httpserver.url_for("/"),
+            keyspace=KEYSPACE,
+            api_options=defaultAPIOptions(environment="other"),
+        ),
+        name=COLLECTION_NAME,
+        keyspace=None,
+        api_options=defaultAPIOptions(environment="other"),
+    )
+    return coll
+
+
+@pytest.fixture
+def mock_table(httpserver: HTTPServer) -> DefaultTable:
+    table: DefaultTable = Table(
+        database=Database(
+            api_endpoint=httpserver.url_for("/"),
+            keyspace=KEYSPACE,
+            api_options=defaultAPIOptions(environment="other"),
+        ),
+        name=TABLE_NAME,
+        keyspace=None,
+        api_options=defaultAPIOptions(environment="other"),
+    )
+    return table
+
+
+class CommandHandler:
+    """
+    Serve the commands used in bulk writes with canned responses, recording
+    each command received. Documents whose ID starts with "bad" are rejected
+    on insertion, and a `{"fail": true}` filter produces an API error.
+    """
+
+    def __init__(self, *, id_field: str = "_id") -> None:
+        self.id_field = id_field
+        self.commands: list[tuple[str, dict[str, Any]]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: Request) -> Response:
+        ((command_name, payload),) = request.get_json().items()
+        with self._lock:
+            self.commands.append((command_name, payload))
+        response: dict[str, Any]
+        if payload.get("filter", {}).get("fail"):
+            response = {"errors": [{"errorCode": "BAD_FILTER", "message": "Bad."}]}
+        elif command_name == "insertMany":
+            response = self._insert_many_response(payload["documents"])
+        elif command_name == "updateOne":
+            status: dict[str, Any] = {"matchedCount": 1, "modifiedCount": 1}
+            if payload.get("options", {}).get("upsert"):
+                status = {"matchedCount": 0, "modifiedCount": 0, "upsertedId": "new"}
+            response = {"status": status if self.id_field == "_id" else {}}
+        elif command_name == "deleteOne":
+            # tables do not report the number of deleted rows
+            deleted_count = 1 if self.id_field == "_id" else -1
+            response = {"status": {"deletedCount": deleted_count}}
+        elif command_name == "deleteMany":
+            response = {"status": {"deletedCount": 5}}
+        else:
+            raise ValueError(f"Unexpected command {command_name}")
+        return Response(json.dumps(response), content_type="application/json")
+
+    def _insert_many_response(self, documents: list[dict[str, Any]]) -> dict[str, Any]:
+        doc_responses: list[dict[str, Any]] = []
+        errors: list[dict[str, Any]] = []
+        for document in documents:
+            doc_id = document[self.id_field]
+            resp_id = doc_id if self.id_field == "_id" else [doc_id]
+            if str(doc_id).startswith("bad"):
+                doc_responses.append(
+                    {"_id": resp_id, "status": "ERROR", "errorsIdx": len(errors)}
+                )
+                errors.append({"errorCode": "DOC_REJECTED", "message": "Rejected."})
+            else:
+                doc_responses.append({"_id": resp_id, "status": "OK"})
+        status: dict[str, Any] = {"documentResponses": doc_responses}
+        if self.id_field != "_id":
+            status["primaryKeySchema"] = {self.id_field: {"type": "text"}}
+        response: dict[str, Any] = {"status": status}
+        if errors:
+            response["errors"] = errors
+        return response
+
+
+TABLE_OPERATIONS = [
+    TableInsertOne({"k": "a"}),
+    TableInsertMany([{"k": "b"}, {"k": "c"}]),
+    TableUpdateOne({"k": "a"}, {"$set": {"x": 1}}),
+    TableDeleteOne({"k": "b"}),
+]
+
+
+def _serve(httpserver: HTTPServer, target_name: str, handler: CommandHandler) -> None:
+    httpserver.expect_request(
+        f"/{BASE_PATH}/{KEYSPACE}/{target_name}",
+        method=HttpMethod.POST,
+    ).respond_with_handler(handler)
+
+
+class TestBulkWrite:
+    @pytest.mark.describe("test of collection bulk_write, unordered coalescing")
+    def test_collection_bulk_write_unordered(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+    ) -> None:
+        handler = CommandHandler()
+        _serve(httpserver, COLLECTION_NAME, handler)
+        result = mock_collection.bulk_write(
+            [
+                InsertOne({"_id": "a"}),
+                UpdateOne({"_id": "a"}, {"$set": {"x": 1}}),
+                InsertMany([{"_id": f"m{i}"} for i in range(5)]),
+                UpdateOne({"_id": "z"}, {"$set": {"x": 1}}, upsert=True),
+                DeleteMany({"x": 1}),
+                InsertOne({"_id": "b"}),
+            ],
+            chunk_size=4,
+            concurrency=3,
+        )
+        # all seven documents to insert travel in two insertMany commands
+        inserted = [
+            [doc["_id"] for doc in payload["documents"]]
+            for command_name, payload in handler.commands
+            if command_name == "insertMany"
+        ]
+        assert sorted(len(ids) for ids in inserted) == [3, 4]
+        assert len(handler.commands) == 5
+        assert result.inserted_count == 7
+        assert result.inserted_ids == {
+            0: ["a"],
+            2: [f"m{i}" for i in range(5)],
+            5: ["b"],
+        }
+        assert result.matched_count == 1
+        assert result.modified_count == 1
+        assert result.upserted_count == 1
+        assert result.upserted_ids == {3: "new"}
+        assert result.deleted_count == 5
+
+    @pytest.mark.describe("test of collection bulk_write, per-operation errors")
+    def test_collection_bulk_write_errors(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+    ) -> None:
+        handler = CommandHandler()
+        _serve(httpserver, COLLECTION_NAME, handler)
+        with pytest.raises(CollectionBulkWriteException) as exc_info:
+            mock_collection.bulk_write(
+                [
+                    InsertMany([{"_id": "a"}, {"_id": "b"}]),
+                    DeleteOne({"fail": True}),
+                    InsertOne({"_id": "bad1"}),
+                    DeleteOne({"_id": "a"}),
+                    InsertOne({"_id": "c"}),
+                ],
+            )
+        exc = exc_info.value
+        assert sorted(exc.operation_errors.keys()) == [1, 2]
+        assert all(
+            isinstance(op_exc, DataAPIResponseException)
+            for op_exc in exc.operation_errors.values()
+        )
+        assert len(exc.exceptions) == 2
+        assert exc.partial_result.inserted_ids == {0: ["a", "b"], 4: ["c"]}
+        assert exc.partial_result.deleted_count == 1
+
+    @pytest.mark.describe("test of collection bulk_write, ordered stops at failures")
+    def test_collection_bulk_write_ordered(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+    ) -> None:
+        handler = CommandHandler()
+        _serve(httpserver, COLLECTION_NAME, handler)
+        with pytest.raises(CollectionBulkWriteException) as exc_info:
+            mock_collection.bulk_write(
+                [
+                    InsertOne({"_id": "a"}),
+                    InsertOne({"_id": "b"}),
+                    DeleteOne({"_id": "a"}),
+                    DeleteOne({"fail": True}),
+                    InsertOne({"_id": "c"}),
+                ],
+                ordered=True,
+            )
+        # consecutive insertions only are coalesced, nothing after the failure
+        assert [command_name for command_name, _ in handler.commands] == [
+            "insertMany",
+            "deleteOne",
+            "deleteOne",
+        ]
+        assert list(exc_info.value.operation_errors.keys()) == [3]
+        assert exc_info.value.partial_result.inserted_count == 2
+        with pytest.raises(ValueError):
+            mock_collection.bulk_write([InsertOne({})], ordered=True, concurrency=2)
+        with pytest.raises(ValueError):
+            mock_collection.bulk_write([TableInsertOne({})])  # type: ignore[list-item]
+
+    @pytest.mark.describe("test of collection bulk_write, async")
+    async def test_collection_bulk_write_async(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+    ) -> None:
+        handler = CommandHandler()
+        _serve(httpserver, COLLECTION_NAME, handler)
+        with pytest.raises(CollectionBulkWriteException) as exc_info:
+            await mock_collection.to_async().bulk_write(
+                [
+                    InsertMany([{"_id": "a"}, {"_id": "bad1"}, {"_id": "b"}]),
+                    InsertOne({"_id": "c"}),
+                    UpdateOne({"_id": "a"}, {"$set": {"x": 1}}),
+                ],
+                concurrency=2,
+            )
+        assert list(exc_info.value.operation_errors.keys()) == [0]
+        partial_result = exc_info.value.partial_result
+        assert partial_result.inserted_ids == {0: ["a", "b"], 1: ["c"]}
+        assert partial_result.modified_count == 1
+
+    @pytest.mark.describe("test of table bulk_write")
+    def test_table_bulk_write(
+        self,
+        httpserver: HTTPServer,
+        mock_table: DefaultTable,
+    ) -> None:
+        handler = CommandHandler(id_field="k")
+        _serve(httpserver, TABLE_NAME, handler)
+        result = mock_table.bulk_write(TABLE_OPERATIONS, ordered=True)
+        assert [command_name for command_name, _ in handler.commands] == [
+            "insertMany",
+            "updateOne",
+            "deleteOne",
+        ]
+        assert result.inserted_count == 3
+        assert result.inserted_ids == {0: [{"k": "a"}], 1: [{"k": "b"}, {"k": "c"}]}
+        assert result.inserted_id_tuples == {0: [("a",)], 1: [("b",), ("c",)]}
+        assert result.update_count == 1
+        assert result.delete_count == 1
+
+        with pytest.raises(TableBulkWriteException) as exc_info:
+            mock_table.bulk_write(
+                [
+                    TableInsertOne({"k": "bad1"}),
+                    TableDeleteOne({"fail": True}),
+                    TableInsertOne({"k": "d"}),
+                ]
+            )
+        assert sorted(exc_info.value.operation_errors.keys()) == [0, 1]
+        assert exc_info.value.partial_result.inserted_ids == {2: [{"k": "d"}]}
+
+    @pytest.mark.describe("test of table bulk_write, async")
+    async def test_table_bulk_write_async(
+        self,
+        httpserver: HTTPServer,
+        mock_table: DefaultTable,
+    ) -> None:
+        handler = CommandHandler(id_field="k")
+        _serve(httpserver, TABLE_NAME, handler)
+        result = await mock_table.to_async().bulk_write(TABLE_OPERATIONS)
+        assert len(handler.commands) == 3
+        assert result.inserted_count == 3
+        assert result.update_count == 1
+        assert result.delete_count == 1
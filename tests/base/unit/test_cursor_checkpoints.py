@@ -0,0 +1,279 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from astrapy import Collection, Database, Table
+from astrapy.cursors import (
+    CursorCheckpoint,
+    CursorState,
+    FileCursorCheckpointStore,
+    InMemoryCursorCheckpointStore,
+)
+from astrapy.exceptions import CursorException
+from astrapy.utils.api_options import defaultAPIOptions
+from astrapy.utils.request_tools import HttpMethod
+
+from ..conftest import DefaultAsyncCollection, DefaultCollection, DefaultTable
+
+BASE_PATH = "v1"
+KEYSPACE = "keyspace"
+COLLECTION_NAME = "collection"
+TABLE_NAME = "table"
+
+THE_DATE = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+THE_DATE_MS = int(THE_DATE.timestamp() * 1000)
+WIRE_FILTER = {"d": {"$gte": {"$date": THE_DATE_MS}}}
+TABLE_WIRE_FILTER = {"d": {"$gte": "2024-01-01T00:00:00.000000+00:00"}}
+
+
+@pytest.fixture
+def mock_collection(httpserver: HTTPServer) -> DefaultCollection:
+    base_endpoint = httpserver.url_for("/")
+    coll: DefaultCollection = Collection(
+        database=Database(
+            api_endpoint=base_endpoint,
+            keyspace=KEYSPACE,
+            api_options=defaultAPIOptions(environment="other"),
+        ),
+        name=COLLECTION_NAME,
+        keyspace=None,
+        api_options=defaultAPIOptions(environment="other"),
+    )
+    return coll
+
+
+@pytest.fixture
+def mock_acollection(
+    httpserver: HTTPServer, mock_collection: DefaultCollection
+) -> DefaultAsyncCollection:
+    return mock_collection.to_async()
+
+
+@pytest.fixture
+def mock_table(httpserver: HTTPServer) -> DefaultTable:
+    base_endpoint = httpserver.url_for("/")
+    table: DefaultTable = Table(
+        database=Database(
+            api_endpoint=base_endpoint,
+            keyspace=KEYSPACE,
+            api_options=defaultAPIOptions(environment="other"),
+        ),
+        name=TABLE_NAME,
+        keyspace=None,
+        api_options=defaultAPIOptions(environment="other"),
+    )
+    return table
+
+
+def _expect_page(
+    httpserver: HTTPServer,
+    *,
+    source_name: str,
+    page_state: str | None,
+    documents: list[dict[str, Any]],
+    next_page_state: str | None,
+    status: dict[str, Any] | None = None,
+    wire_filter: dict[str, Any] = WIRE_FILTER,
+) -> None:
+    options: dict[str, Any] = {"limit": 100}
+    if page_state is not None:
+        options["pageState"] = page_state
+    httpserver.expect_oneshot_request(
+        f"/{BASE_PATH}/{KEYSPACE}/{source_name}",
+        method=HttpMethod.POST,
+        json={"find": {"filter": wire_filter, "options": options}},
+    ).respond_with_json(
+        {
+            "data": {"documents": documents, "nextPageState": next_page_state},
+            **({"status": status} if status is not None else {}),
+        }
+    )
+
+
+def _expect_collection_pages(httpserver: HTTPServer, page_states: list[str]) -> None:
+    # a three-page scan: 2 + 2 + 1 documents
+    _expect_page(
+        httpserver,
+        source_name=COLLECTION_NAME,
+        page_state=None,
+        documents=[{"_id": 0}, {"_id": 1}],
+        next_page_state="ps1",
+    )
+    if "ps1" in page_states:
+        _expect_page(
+            httpserver,
+            source_name=COLLECTION_NAME,
+            page_state="ps1",
+            documents=[{"_id": 2}, {"_id": 3}],
+            next_page_state="ps2",
+        )
+    if "ps2" in page_states:
+        _expect_page(
+            httpserver,
+            source_name=COLLECTION_NAME,
+            page_state="ps2",
+            documents=[{"_id": 4}],
+            next_page_state=None,
+        )
+
+
+class TestCursorCheckpoints:
+    @pytest.mark.describe("test of collection cursor checkpoints and resume, sync")
+    def test_collection_cursor_checkpoints_sync(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+        tmp_path: Path,
+    ) -> None:
+        _expect_collection_pages(httpserver, ["ps1"])
+        store = FileCursorCheckpointStore(tmp_path / "scan.checkpoint")
+        assert store.load() is None
+        cursor = mock_collection.find({"d": {"$gte": THE_DATE}}, limit=100)
+        ids = []
+        for document in cursor.iter_with_checkpoints(store):
+            ids.append(document["_id"])
+            if document["_id"] == 2:
+                # simulate a crash midway through the second page
+                break
+        assert ids == [0, 1, 2]
+        assert cursor.consumed == 3
+
+        checkpoint = store.load()
+        assert checkpoint is not None
+        assert checkpoint.page_state == "ps1"
+        assert checkpoint.consumed == 2
+        assert checkpoint.pages_retrieved == 1
+        assert not checkpoint.exhausted
+        assert checkpoint.filter == WIRE_FILTER
+
+        # the resumed cursor re-issues the exact same requests
+        for page_state in ["ps1", "ps2"]:
+            _expect_page(
+                httpserver,
+                source_name=COLLECTION_NAME,
+                page_state=page_state,
+                documents=[{"_id": 2}, {"_id": 3}]
+                if page_state == "ps1"
+                else [{"_id": 4}],
+                next_page_state="ps2" if page_state == "ps1" else None,
+            )
+        resumed = checkpoint.resume(mock_collection)
+        assert resumed.state == CursorState.IDLE
+        assert resumed.consumed == 2
+        assert [doc["_id"] for doc in resumed.iter_with_checkpoints(store)] == [
+            2,
+            3,
+            4,
+        ]
+        assert resumed.state == CursorState.CLOSED  # type: ignore[comparison-overlap]
+        assert resumed.consumed == 5
+
+        final_checkpoint = store.load()
+        assert final_checkpoint is not None
+        assert final_checkpoint.exhausted
+        assert final_checkpoint.page_state is None
+        assert final_checkpoint.consumed == 5
+        assert checkpoint.resume(mock_collection).consumed == 2
+        assert final_checkpoint.resume(mock_collection).state == CursorState.CLOSED
+        store.clear()
+        assert store.load() is None
+
+    @pytest.mark.describe("test of collection cursor checkpoints, every n pages, async")
+    async def test_collection_cursor_checkpoints_async(
+        self,
+        httpserver: HTTPServer,
+        mock_acollection: DefaultAsyncCollection,
+    ) -> None:
+        _expect_collection_pages(httpserver, ["ps1", "ps2"])
+        saved: list[CursorCheckpoint] = []
+
+        class RecordingStore(InMemoryCursorCheckpointStore):
+            def save(self, checkpoint: CursorCheckpoint) -> None:
+                saved.append(checkpoint)
+                super().save(checkpoint)
+
+        store = RecordingStore()
+        cursor = mock_acollection.find({"d": {"$gte": THE_DATE}}, limit=100)
+        ids = [
+            doc["_id"]
+            async for doc in cursor.iter_with_checkpoints(store, every_n_pages=2)
+        ]
+        assert ids == [0, 1, 2, 3, 4]
+        assert cursor.state == CursorState.CLOSED
+        assert [(cp.page_state, cp.consumed, cp.exhausted) for cp in saved] == [
+            ("ps2", 4, False),
+            (None, 5, True),
+        ]
+
+    @pytest.mark.describe("test of table cursor checkpoints, serialization, sync")
+    def test_table_cursor_checkpoints_sync(
+        self,
+        httpserver: HTTPServer,
+        mock_table: DefaultTable,
+    ) -> None:
+        _expect_page(
+            httpserver,
+            source_name=TABLE_NAME,
+            page_state=None,
+            documents=[{"k": 1}],
+            next_page_state="ps1",
+            status={"projectionSchema": {"k": {"type": "int"}}},
+            wire_filter=TABLE_WIRE_FILTER,
+        )
+        store = InMemoryCursorCheckpointStore()
+        cursor = mock_table.find({"d": {"$gte": THE_DATE}}, limit=100)
+        page = cursor.fetch_next_page()
+        assert page.next_page_state == "ps1"
+        checkpoint = cursor.checkpoint()
+        assert checkpoint.source_type == "table"
+        assert checkpoint.page_state == "ps1"
+        # tables render dates in their own wire format
+        assert checkpoint.filter == TABLE_WIRE_FILTER
+        assert CursorCheckpoint.from_json(checkpoint.to_json()) == checkpoint
+        store.save(checkpoint)
+        assert store.load() == checkpoint
+
+    @pytest.mark.describe("test of cursor checkpoints, restrictions")
+    def test_cursor_checkpoints_restrictions(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+        mock_table: DefaultTable,
+    ) -> None:
+        _expect_collection_pages(httpserver, [])
+        cursor = mock_collection.find({"d": {"$gte": THE_DATE}}, limit=100)
+        with pytest.raises(ValueError):
+            cursor.iter_with_checkpoints(
+                InMemoryCursorCheckpointStore(), every_n_pages=0
+            )
+        assert cursor.has_next()
+        # buffer now non-empty, i.e. not at a page boundary:
+        with pytest.raises(CursorException):
+            cursor.checkpoint()
+        with pytest.raises(CursorException):
+            cursor.iter_with_checkpoints(InMemoryCursorCheckpointStore())
+
+        checkpoint = mock_collection.find({}).checkpoint()
+        with pytest.raises(ValueError):
+            checkpoint.resume(mock_table)
+        with pytest.raises(ValueError):
+            CursorCheckpoint.from_json('{"version": 999}')
@@ -0,0 +1,264 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+
+import pytest
+
+from astrapy import DataAPIClient
+from astrapy.data_types import DataAPIDate, DataAPIVector
+from astrapy.exceptions import (
+    CollectionInsertManyException,
+    DataAPIHttpException,
+    DataAPIResponseException,
+)
+from astrapy.testing import DataAPIEmulator, EmulatorFault
+
+
+class TestDataAPIEmulator:
+    @pytest.mark.describe("test of the emulator with collections, sync")
+    def test_emulator_collection_sync(self) -> None:
+        emulator = DataAPIEmulator(page_size=10)
+        with emulator.mounted() as api_endpoint:
+            database = DataAPIClient(environment="other").get_database(
+                api_endpoint, keyspace="ks"
+            )
+            collection = database.create_collection("coll")
+
+            im_result = collection.insert_many(
+                [
+                    {"_id": i, "a": i, "tag": "even" if i % 2 == 0 else "odd"}
+                    for i in range(45)
+                ],
+                chunk_size=7,
+                concurrency=3,
+            )
+            assert len(im_result.inserted_ids) == 45
+            assert emulator.command_counts["insertMany"] == 7
+            assert collection.count_documents({}, upper_bound=100) == 45
+
+            # pagination: 35 matches in pages of 10
+            cursor = collection.find({"a": {"$gte": 10}}, projection={"a": True})
+            documents = cursor.to_list()
+            assert sorted(doc["a"] for doc in documents) == list(range(10, 45))
+            assert set(documents[0].keys()) == {"_id", "a"}
+            assert emulator.command_counts["find"] == 4
+
+            or_document = collection.find_one({"$or": [{"a": 3}, {"a": 5}]})
+            assert or_document is not None
+            assert or_document["_id"] == 3
+            assert collection.find_one(
+                {"tag": "odd"}, sort={"a": -1}, projection={"tag": False}
+            ) == {"_id": 43, "a": 43}
+            assert collection.find_one({"a": {"$in": [-1, -2]}}) is None
+            assert collection.distinct("tag", filter={"a": {"$lt": 3}}) == [
+                "even",
+                "odd",
+            ]
+
+            um_result = collection.update_many({"tag": "even"}, {"$inc": {"a": 100}})
+            assert um_result.update_info["n"] == 23
+            assert (
+                collection.count_documents({"a": {"$gte": 100}}, upper_bound=50) == 23
+            )
+
+            # deletions are paginated by the API
+            dm_result = collection.delete_many({"tag": "even"})
+            assert dm_result.deleted_count == 23
+            assert emulator.command_counts["deleteMany"] == 2
+            assert len(emulator.documents("coll", keyspace="ks")) == 22
+
+            # vector sort
+            vcollection = database.create_collection("vcoll")
+            vcollection.insert_many(
+                [
+                    {"_id": "x", "$vector": DataAPIVector([1.0, 0.0])},
+                    {"_id": "y", "$vector": [0.0, 1.0]},
+                    {"_id": "z", "$vector": [0.7, 0.7]},
+                    {"_id": "w"},
+                ]
+            )
+            hits = vcollection.find(
+                sort={"$vector": DataAPIVector([0.0, 1.0])},
+                include_similarity=True,
+                limit=2,
+            ).to_list()
+            assert [hit["_id"] for hit in hits] == ["y", "z"]
+            assert hits[0]["$similarity"] == pytest.approx(1.0)
+
+            with pytest.raises(DataAPIResponseException):
+                vcollection.insert_one({"_id": "x"})
+
+    @pytest.mark.describe("test of the emulator with tables, sync")
+    def test_emulator_table_sync(self) -> None:
+        emulator = DataAPIEmulator(page_size=3)
+        emulator.create_table(
+            "tab",
+            keyspace="ks",
+            columns={
+                "p": "int",
+                "d": "date",
+                "v": {"type": "vector", "dimension": 2},
+            },
+            primary_key=["p"],
+        )
+        with emulator.mounted("http://my-emulator") as api_endpoint:
+            database = DataAPIClient(environment="other").get_database(
+                api_endpoint, keyspace="ks"
+            )
+            table = database.get_table("tab")
+            im_result = table.insert_many(
+                [
+                    {
+                        "p": i,
+                        "d": datetime.date(2025, 1, 1 + i),
+                        "v": DataAPIVector([float(i), 1.0]),
+                    }
+                    for i in range(5)
+                ],
+                chunk_size=2,
+            )
+            assert im_result.inserted_ids == [{"p": i} for i in range(5)]
+
+            rows = table.find({"p": {"$lt": 4}}, projection={"p": 1, "d": 1}).to_list()
+            assert [row["p"] for row in rows] == [0, 1, 2, 3]
+            assert rows[1]["d"] == DataAPIDate.from_string("2025-01-02")
+            assert set(rows[0].keys()) == {"p", "d"}
+
+            hit = table.find_one(sort={"v": DataAPIVector([1.0, 0.0])})
+            assert hit is not None
+            assert hit["p"] == 4
+            assert isinstance(hit["v"], DataAPIVector)
+
+            table.update_one({"p": 1}, update={"$unset": {"d": ""}})
+            row = table.find_one({"p": 1})
+            assert row is not None
+            assert row["d"] is None
+
+            table.delete_many({"p": {"$gte": 3}})
+            assert table.count_documents({}, upper_bound=10) == 3
+
+    @pytest.mark.describe("test of table definition-based methods on the emulator")
+    def test_emulator_table_definition_methods_sync(self) -> None:
+        emulator = DataAPIEmulator(page_size=4)
+        emulator.create_table(
+            "tab",
+            keyspace="ks",
+            columns={"p": "int", "c": "int", "d": "date", "x": "int"},
+            primary_key=["p", "c"],
+            rows=[
+                {"p": p, "c": c, "d": f"2025-01-0{c + 1}", "x": 0}
+                for p in range(2)
+                for c in range(5)
+            ],
+        )
+        emulator.create_collection("coll", keyspace="ks")
+        with emulator.mounted() as api_endpoint:
+            database = DataAPIClient(environment="other").get_database(
+                api_endpoint, keyspace="ks"
+            )
+            assert database.list_table_names() == ["tab"]
+            table = database.get_table("tab")
+            primary_key = table.definition().primary_key
+            assert primary_key.partition_by == ["p"]
+            assert primary_key.partition_sort == {"c": 1}
+
+            um_result = table.update_many(
+                {"p": 1, "c": {"$gte": 2}}, update={"$set": {"x": 9}}, concurrency=2
+            )
+            assert (um_result.matched_count, um_result.modified_count) == (3, 3)
+            updated_rows = table.find({"x": 9}, projection={"c": True}).to_list()
+            assert sorted(row["c"] for row in updated_rows) == [2, 3, 4]
+
+            with table.loader(max_batch_size=3) as loader:
+                rows = loader.load_many([(1, 4), (0, 0), (7, 7), (1, 0)])
+                single_row = loader.load({"p": 0, "c": 3})
+            assert [row and (row["p"], row["c"], row["x"]) for row in rows] == [
+                (1, 4, 9),
+                (0, 0, 0),
+                None,
+                (1, 0, 0),
+            ]
+            assert single_row is not None
+            assert single_row["d"] == DataAPIDate.from_string("2025-01-04")
+
+    @pytest.mark.describe("test of the table loader on the emulator, async")
+    async def test_emulator_table_loader_async(self) -> None:
+        emulator = DataAPIEmulator()
+        emulator.create_table(
+            "tab",
+            keyspace="ks",
+            columns={"p": "int", "x": "text"},
+            primary_key=["p"],
+            rows=[{"p": i, "x": f"x{i}"} for i in range(10)],
+        )
+        with emulator.mounted() as api_endpoint:
+            adatabase = DataAPIClient(environment="other").get_async_database(
+                api_endpoint, keyspace="ks"
+            )
+            async with adatabase.get_table("tab").loader() as loader:
+                rows = await asyncio.gather(*(loader.load((i,)) for i in range(12)))
+        assert [row and row["x"] for row in rows] == [f"x{i}" for i in range(10)] + [
+            None,
+            None,
+        ]
+        # a listTables for the definition, then a single batch of lookups
+        assert emulator.command_counts["listTables"] == 1
+        assert emulator.command_counts["find"] == 1
+
+    @pytest.mark.describe("test of the emulator faults and throttling, async")
+    async def test_emulator_faults_async(self) -> None:
+        emulator = DataAPIEmulator(latency_s=0.02, max_concurrent_requests=1, seed=1)
+        emulator.inject_fault(EmulatorFault(command="insertMany", target="coll"))
+        with emulator.mounted() as api_endpoint:
+            adatabase = DataAPIClient(environment="other").get_async_database(
+                api_endpoint, keyspace="ks"
+            )
+            acollection = adatabase.get_collection("coll")
+
+            with pytest.raises(CollectionInsertManyException) as exc_info:
+                await acollection.insert_many([{"_id": 1}, {"_id": 2}])
+            assert "EMULATED_FAULT" in str(exc_info.value)
+            # the fault applied once
+            await acollection.insert_many([{"_id": 1}, {"_id": 2}])
+
+            emulator.inject_fault(
+                EmulatorFault(command="countDocuments", http_status=503, times=None)
+            )
+            with pytest.raises(DataAPIHttpException):
+                await acollection.count_documents({}, upper_bound=10)
+            emulator.clear_faults()
+
+            results = await asyncio.gather(
+                *[acollection.find_one({}) for _ in range(3)],
+                return_exceptions=True,
+            )
+            assert any(isinstance(res, DataAPIHttpException) for res in results)
+            assert emulator.throttled_count > 0
+
+    @pytest.mark.describe("test of the emulator served over HTTP")
+    def test_emulator_server(self) -> None:
+        emulator = DataAPIEmulator()
+        emulator.create_collection("coll", documents=[{"_id": "a", "x": 1}])
+        with emulator.serve() as server:
+            database = DataAPIClient(environment="other").get_database(
+                server.url, keyspace="default_keyspace"
+            )
+            collection = database.get_collection("coll")
+            assert collection.find_one({"x": 1}) == {"_id": "a", "x": 1}
+            collection.insert_one({"_id": "b", "x": 2})
+        assert len(emulator.documents("coll")) == 2
@@ -14,11 +14,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+import urllib.request
 from typing import Any
 
 import pytest
 
 from astrapy.event_observers import (
+    OPENMETRICS_CONTENT_TYPE,
+    BackgroundObserver,
+    InMemorySpanExporter,
+    LatencyHistogram,
+    MetricsObserver,
     ObservableError,
     ObservableEvent,
     ObservableEventType,
@@ -26,11 +38,23 @@ from astrapy.event_observers import (
     ObservableResponse,
     ObservableWarning,
     Observer,
+    OTLPSpanExporter,
+    OverflowPolicy,
+    PrometheusObserver,
+    SlowOperationObserver,
+    SpanKind,
+    SpanStatus,
+    TracingObserver,
 )
 from astrapy.exceptions import (
     DataAPIErrorDescriptor,
     DataAPIWarningDescriptor,
 )
+from astrapy.utils.tracing import (
+    operation_scope,
+    request_attributes,
+    request_scope,
+)
 
 OBS_ERR = ObservableError(
     error=DataAPIErrorDescriptor(
@@ -62,6 +86,27 @@ OBS_REQ = ObservableRequest(
 )
 
 
+class GatedObserver(Observer):
+    """An observer that can be held from completing the deliveries."""
+
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.gate.set()
+        self.received: list[ObservableEvent] = []
+        self.threads: set[int] = set()
+
+    def receive(
+        self,
+        event: ObservableEvent,
+        sender: Any = None,
+        function_name: str | None = None,
+        request_id: str | None = None,
+    ) -> None:
+        self.gate.wait()
+        self.threads.add(threading.get_ident())
+        self.received.append(event)
+
+
 class TestEventObservers:
     @pytest.mark.describe("test of custom observer receiving events")
     def test_custom_observer(self) -> None:
@@ -171,3 +216,461 @@ class TestEventObservers:
             OBS_WRN,
             OBS_RSP_2,
         ]
+
+    @pytest.mark.describe("test of latency histogram, precision and bounded size")
+    def test_latency_histogram(self) -> None:
+        histogram = LatencyHistogram()
+        assert histogram.percentile(50) is None
+        rnd = random.Random(123)
+        values = sorted(rnd.lognormvariate(-4, 1) for _ in range(20000))
+        for value in values:
+            histogram.record(value)
+        assert histogram.count == len(values)
+        assert histogram.min_s == values[0]
+        assert histogram.max_s == values[-1]
+        for percentile in [50, 90, 99, 99.9]:
+            exact = values[round(len(values) * percentile / 100) - 1]
+            estimate = histogram.percentile(percentile)
+            assert estimate is not None
+            assert abs(estimate - exact) / exact < 2**-histogram.sub_bucket_bits
+        # a few dozen buckets per power of two, however many values
+        assert len(histogram.buckets()) < 32 * 20
+        assert sum(count for _, count in histogram.buckets()) == len(values)
+        copied = histogram.copy()
+        histogram.record(1.0)
+        assert copied.count == len(values)
+
+    @pytest.mark.describe("test of metrics observer, per-command figures")
+    def test_metrics_observer(self) -> None:
+        metrics = MetricsObserver()
+        for i in range(10):
+            metrics.receive(
+                ObservableResponse(
+                    body="{}",
+                    status_code=200,
+                    command_name="findOne",
+                    started_at=100.0,
+                    ended_at=100.0 + 0.001 * (i + 1),
+                    encode_duration_s=0.0001,
+                    decode_duration_s=0.0002,
+                    payload_size=20,
+                    response_size=50,
+                ),
+                request_id=f"r{i}",
+            )
+        metrics.receive(
+            ObservableResponse(
+                body="{}",
+                status_code=200,
+                command_name="insertOne",
+                started_at=100.0,
+                ended_at=100.5,
+                payload_size=100,
+                response_size=10,
+            ),
+            request_id="r_ins",
+        )
+        # an API error, attributed to the command of its request
+        metrics.receive(OBS_ERR, request_id="r_ins")
+        metrics.receive(
+            ObservableResponse(body="", status_code=500, command_name="insertOne"),
+            request_id="r_500",
+        )
+
+        all_metrics = metrics.get_metrics()
+        assert set(all_metrics.keys()) == {"findOne", "insertOne"}
+        find_metrics = all_metrics["findOne"]
+        assert find_metrics.request_count == 10
+        assert find_metrics.error_count == 0
+        assert find_metrics.bytes_sent == 200
+        assert find_metrics.bytes_received == 500
+        assert find_metrics.encode_s == pytest.approx(0.001)
+        assert find_metrics.decode_s == pytest.approx(0.002)
+        assert find_metrics.latency.count == 10
+        assert find_metrics.latency.percentile(50) == pytest.approx(0.005, rel=0.05)
+        assert find_metrics.latency.max_s == pytest.approx(0.010)
+        insert_metrics = all_metrics["insertOne"]
+        assert insert_metrics.request_count == 2
+        assert insert_metrics.error_count == 2
+        assert insert_metrics.latency.count == 1
+
+        summary = metrics.summary()
+        assert summary["findOne"]["request_count"] == 10
+        assert summary["findOne"]["requests_per_s"] > 0
+        assert summary["insertOne"]["p99_s"] == pytest.approx(0.5, rel=0.05)
+
+        metrics.reset()
+        assert metrics.get_metrics() == {}
+
+    @pytest.mark.describe("test of prometheus observer, exposition format")
+    def test_prometheus_observer(self) -> None:
+        class Sender:
+            keyspace = "ks"
+            name = 'coll"x'
+
+        prom = PrometheusObserver(buckets=[0.01, 0.1])
+        for i, duration_s in enumerate([0.005, 0.05, 0.5]):
+            prom.receive(
+                ObservableRequest(
+                    payload="{}",
+                    http_method="POST",
+                    url="http://bla.bla",
+                    query_parameters={},
+                    redacted_headers={},
+                    dev_ops_api=False,
+                    command_name="findOne",
+                ),
+                sender=Sender(),
+                request_id=f"r{i}",
+            )
+            prom.receive(
+                ObservableResponse(
+                    body="{}",
+                    status_code=200 if i < 2 else 500,
+                    command_name="findOne",
+                    started_at=100.0,
+                    ended_at=100.0 + duration_s,
+                    payload_size=20,
+                    response_size=50,
+                ),
+                request_id=f"r{i}",
+            )
+        prom.receive(OBS_ERR, request_id="r0")
+        prom.receive(OBS_WRN, request_id="r1")
+        prom.receive(OBS_REQ, sender=Sender(), request_id="r_pending")
+
+        lbl = 'command="findOne",keyspace="ks",target="coll\\"x"'
+        lines = prom.render().split("\n")
+        assert lines[-2:] == ["# EOF", ""]
+        assert "# TYPE astrapy_requests counter" in lines
+        assert f"astrapy_requests_total{{{lbl}}} 3" in lines
+        assert f'astrapy_request_errors_total{{{lbl},status_code="500"}} 1' in lines
+        assert (
+            f'astrapy_api_errors_total{{{lbl},error_code="error_errorCode"}} 1' in lines
+        )
+        assert (
+            f'astrapy_api_warnings_total{{{lbl},error_code="warning_errorCode"}} 1'
+            in lines
+        )
+        assert f"astrapy_requests_in_flight{{{lbl}}} 0" in lines
+        assert (
+            'astrapy_requests_in_flight{command="",keyspace="ks",target="coll\\"x"} 1'
+            in lines
+        )
+        assert f"astrapy_request_bytes_total{{{lbl}}} 60" in lines
+        assert f"astrapy_response_bytes_total{{{lbl}}} 150" in lines
+        assert f'astrapy_request_duration_seconds_bucket{{{lbl},le="0.01"}} 1' in lines
+        assert f'astrapy_request_duration_seconds_bucket{{{lbl},le="0.1"}} 2' in lines
+        assert f'astrapy_request_duration_seconds_bucket{{{lbl},le="+Inf"}} 3' in lines
+        assert f"astrapy_request_duration_seconds_count{{{lbl}}} 3" in lines
+
+        # cardinality controls: fewer labels, capped label sets
+        capped = PrometheusObserver(label_names=["command"], max_series=2)
+        for command_name in ["a", "b", "c", "d"]:
+            capped.receive(
+                ObservableResponse(body="", status_code=200, command_name=command_name),
+            )
+        capped_lines = capped.render().split("\n")
+        assert 'astrapy_requests_total{command="a"} 1' in capped_lines
+        assert 'astrapy_requests_total{command="_other_"} 2' in capped_lines
+        with pytest.raises(ValueError):
+            PrometheusObserver(label_names=["collection"])
+
+        # the HTTP endpoint
+        host, port = prom.start_http_server(0)
+        try:
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics") as resp:
+                assert resp.headers["Content-Type"] == OPENMETRICS_CONTENT_TYPE
+                assert resp.read().decode().endswith("# EOF\n")
+        finally:
+            prom.stop_http_server()
+
+    @pytest.mark.describe("test of background observer, thread delivery")
+    def test_background_observer_thread(self) -> None:
+        gated = GatedObserver()
+        bg_observer = BackgroundObserver(gated, max_queue_size=5)
+        assert bg_observer.overflow_policy == OverflowPolicy.DROP
+        gated.gate.clear()
+        for _ in range(10):
+            bg_observer.receive(OBS_RSP_1)
+        # (one may be in delivery, out of the queue)
+        assert 4 <= bg_observer.stats().dropped <= 5
+        gated.gate.set()
+        assert bg_observer.flush(timeout_s=5)
+        stats = bg_observer.stats()
+        assert stats.enqueued + stats.dropped == 10
+        assert stats.delivered == stats.enqueued == len(gated.received)
+        assert gated.threads == {bg_observer._thread.ident}  # type: ignore[union-attr]
+        assert stats.mean_enqueue_s is not None
+
+        bp_observer = BackgroundObserver(
+            GatedObserver(),
+            max_queue_size=2,
+            overflow_policy="backpressure",
+            batch_size=1,
+        )
+        for _ in range(20):
+            bp_observer.receive(OBS_RSP_2)
+        assert bp_observer.close(timeout_s=5)
+        assert bp_observer.stats().delivered == 20
+        assert bp_observer.stats().dropped == 0
+        # after closing, the delivery is done by the caller
+        bp_observer.receive(OBS_RSP_2)
+        assert bp_observer.stats().delivered_inline == 1
+
+    @pytest.mark.describe("test of background observer, event-loop delivery")
+    async def test_background_observer_async(self) -> None:
+        gated = GatedObserver()
+        bg_observer = BackgroundObserver(
+            gated,
+            max_queue_size=3,
+            overflow_policy=OverflowPolicy.BACKPRESSURE,
+        )
+        bg_observer.receive(OBS_RSP_1)
+        bg_observer.receive(OBS_RSP_1)
+        # nothing delivered until the caller yields control
+        assert gated.received == []
+        await bg_observer.async_flush()
+        assert len(gated.received) == 2
+        assert gated.threads == {threading.get_ident()}
+
+        for _ in range(5):
+            bg_observer.receive(OBS_RSP_2)
+        # overflow with backpressure in a loop: delivered by the caller
+        assert bg_observer.stats().delivered_inline == 2
+        await asyncio.sleep(0)
+        await bg_observer.async_flush()
+        assert len(gated.received) == 7
+        assert bg_observer.stats().delivered == 7
+
+    def test_tracing_observer(self) -> None:
+        exporter = InMemorySpanExporter()
+        tracing = TracingObserver(exporter)
+
+        def _request(request_id: str, status_code: int = 200) -> None:
+            with request_scope("insertMany"):
+                tracing.receive(
+                    ObservableRequest(
+                        payload="{}",
+                        http_method="POST",
+                        url="http://bla.bla",
+                        query_parameters={},
+                        redacted_headers={},
+                        dev_ops_api=False,
+                        command_name="insertMany",
+                        started_at=time.perf_counter(),
+                        payload_size=20,
+                    ),
+                    function_name="insert_many",
+                    request_id=request_id,
+                )
+                tracing.receive(
+                    ObservableResponse(
+                        body=None,
+                        status_code=status_code,
+                        command_name="insertMany",
+                        ended_at=time.perf_counter(),
+                        decode_duration_s=0.0,
+                        response_size=50,
+                    ),
+                    request_id=request_id,
+                )
+                if request_id == "r1":
+                    tracing.receive(OBS_ERR, request_id=request_id)
+
+        with operation_scope("insert_many"):
+            for chunk_index in range(3):
+                with request_attributes(chunk_index=chunk_index):
+                    _request(f"r{chunk_index}")
+            # nothing is exported before the operation ends
+            assert exporter.get_finished_spans() == []
+
+        parent, *children = exporter.get_finished_spans()
+        assert parent.name == "insert_many"
+        assert parent.kind == SpanKind.INTERNAL
+        assert parent.parent_span_id is None
+        assert parent.status == SpanStatus.OK
+        assert parent.attributes["astrapy.request_count"] == 3
+        assert [child.attributes["astrapy.chunk_index"] for child in children] == [
+            0,
+            1,
+            2,
+        ]
+        for child in children:
+            assert child.name == "insertMany"
+            assert child.kind == SpanKind.CLIENT
+            assert child.trace_id == parent.trace_id
+            assert child.parent_span_id == parent.span_id
+            assert child.attributes["astrapy.response_size"] == 50
+            assert (child.duration_s or 0) >= 0
+            assert parent.start_time_ns <= child.start_time_ns
+            assert (child.end_time_ns or 0) <= (parent.end_time_ns or 0)
+        assert [child.status for child in children] == [
+            SpanStatus.OK,
+            SpanStatus.ERROR,
+            SpanStatus.OK,
+        ]
+        assert children[1].attributes["astrapy.error_codes"] == ["error_errorCode"]
+        assert children[1].status_message == "error_message"
+
+        # a standalone request, failing with an HTTP error
+        exporter.clear()
+        _request("r_alone", status_code=503)
+        (alone,) = exporter.get_finished_spans()
+        assert alone.parent_span_id is None
+        assert alone.status == SpanStatus.ERROR
+        assert alone.attributes["http.response.status_code"] == 503
+
+        # nested operations, a failure and a request left without response
+        exporter.clear()
+        with pytest.raises(ValueError):
+            with operation_scope("bulk_write"):
+                with operation_scope("insert_many"):
+                    _request("r_nested")
+                with request_scope("deleteOne"):
+                    tracing.receive(OBS_REQ, request_id="r_hanging")
+                    raise ValueError("Boom")
+        outer, inner, nested, hanging = exporter.get_finished_spans()
+        assert len({span.trace_id for span in (outer, inner, nested, hanging)}) == 1
+        assert inner.parent_span_id == outer.span_id
+        assert nested.parent_span_id == inner.span_id
+        assert hanging.parent_span_id == outer.span_id
+        assert outer.status == SpanStatus.ERROR
+        assert outer.status_message == "ValueError: Boom"
+        assert hanging.status == SpanStatus.ERROR
+
+    def test_slow_operation_observer(self, caplog: pytest.LogCaptureFixture) -> None:
+        slow_log = SlowOperationObserver(
+            threshold_s=10, request_threshold_s=0.05, max_records=2
+        )
+
+        def _request(request_id: str, duration_s: float, payload: str) -> None:
+            with request_scope("find"):
+                started_at = time.perf_counter()
+                slow_log.receive(
+                    ObservableRequest(
+                        payload=payload,
+                        http_method="POST",
+                        url="http://bla.bla",
+                        query_parameters={},
+                        redacted_headers={},
+                        dev_ops_api=False,
+                        command_name="find",
+                        started_at=started_at,
+                        encode_duration_s=0.001,
+                        payload_size=len(payload),
+                    ),
+                    function_name="find",
+                    request_id=request_id,
+                )
+                slow_log.receive(
+                    ObservableResponse(
+                        body=None,
+                        status_code=200,
+                        command_name="find",
+                        started_at=started_at,
+                        ended_at=started_at + duration_s,
+                        decode_duration_s=0.002,
+                        response_size=1000,
+                    ),
+                    request_id=request_id,
+                )
+
+        payload = json.dumps(
+            {
+                "find": {
+                    "filter": {
+                        "$or": [{"name": "John"}, {"age": {"$gt": 30}}],
+                        "tags": {"$in": ["a", "b"]},
+                    },
+                    "sort": {"age": -1, "$vector": [0.1, 0.2]},
+                }
+            }
+        )
+        with caplog.at_level(logging.WARNING):
+            with operation_scope("find"):
+                for page_number in range(1, 4):
+                    with request_attributes(page_number=page_number):
+                        _request(f"r{page_number}", 0.1 * (page_number - 1), payload)
+        # the first (fast) request and the operation are not recorded
+        slow_r2, slow_r3 = slow_log.get_records()
+        assert slow_r2.kind == "request"
+        assert slow_r2.request_id == "r2"
+        assert slow_r2.slow
+        assert slow_r2.name == "find"
+        assert slow_r2.pages == 1
+        assert abs(slow_r2.network_s - 0.099) < 1e-6
+        assert slow_r2.decode_s == 0.002
+        assert slow_r2.bytes_in == 1000
+        assert slow_r2.filter_shape == {
+            "$or": [{"name": "?"}, {"age": {"$gt": "?"}}],
+            "tags": {"$in": "?"},
+        }
+        assert slow_r2.sort_shape == {"age": -1, "$vector": "?"}
+        slow_log_lines = [
+            rec for rec in caplog.records if hasattr(rec, "slow_operation")
+        ]
+        assert len(slow_log_lines) == 2
+        assert "John" not in caplog.text
+        assert json.loads(slow_log_lines[0].getMessage().split(": ", 1)[1]) == (
+            slow_r2.as_dict()
+        )
+
+        # operations are checked as a whole, fast ones are sampled
+        slow_log.clear()
+        slow_log.threshold_s = 0.0
+        slow_log.request_threshold_s = 10
+        slow_log.sample_rate = 1.0
+        with pytest.raises(ValueError):
+            with operation_scope("update_many"):
+                for page_number in (1, 2):
+                    with request_attributes(page_number=page_number):
+                        _request(f"u{page_number}", 0.0, payload)
+                raise ValueError("Boom")
+        (slow_op,) = slow_log.get_records()
+        assert slow_op.kind == "operation"
+        assert slow_op.name == "update_many"
+        assert slow_op.command == "find"
+        assert slow_op.request_count == 2
+        assert slow_op.pages == 2
+        assert slow_op.bytes_out == 2 * len(payload)
+        assert slow_op.error == "ValueError: Boom"
+        sampled = [
+            rec.slow_operation
+            for rec in caplog.records
+            if hasattr(rec, "slow_operation") and not rec.slow_operation["slow"]
+        ]
+        assert [rec["request_id"] for rec in sampled] == ["u1", "u2"]
+
+    def test_otlp_span_exporter_encoding(self) -> None:
+        exporter = InMemorySpanExporter()
+        tracing = TracingObserver(exporter)
+        with operation_scope("distinct", key="a"):
+            with request_scope("find"):
+                with request_attributes(page_number=1):
+                    tracing.receive(OBS_REQ, request_id="r0")
+
+        otlp = OTLPSpanExporter(service_name="my-app")
+        encoded = otlp.encode_spans(exporter.get_finished_spans())
+        (resource_spans,) = encoded["resourceSpans"]
+        assert resource_spans["resource"]["attributes"] == [
+            {"key": "service.name", "value": {"stringValue": "my-app"}},
+        ]
+        parent_json, child_json = resource_spans["scopeSpans"][0]["spans"]
+        assert parent_json["kind"] == 1
+        assert "parentSpanId" not in parent_json
+        assert {"key": "astrapy.key", "value": {"stringValue": "a"}} in (
+            parent_json["attributes"]
+        )
+        assert parent_json["status"] == {"code": 1}
+        assert child_json["kind"] == 3
+        assert child_json["traceId"] == parent_json["traceId"]
+        assert child_json["parentSpanId"] == parent_json["spanId"]
+        assert len(child_json["traceId"]) == 32
+        assert len(child_json["spanId"]) == 16
+        assert {"key": "astrapy.page_number", "value": {"intValue": "1"}} in (
+            child_json["attributes"]
+        )
+        assert int(child_json["endTimeUnixNano"]) >= int(
+            child_json["startTimeUnixNano"]
+        )
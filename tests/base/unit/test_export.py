@@ -0,0 +1,333 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from astrapy import Collection, Database, Table
+from astrapy.export import main, run_export
+from astrapy.utils.api_options import defaultAPIOptions
+from astrapy.utils.request_tools import HttpMethod
+
+from ..conftest import DefaultCollection, DefaultTable
+
+BASE_PATH = "v1"
+KEYSPACE = "keyspace"
+COLLECTION_NAME = "collection"
+TABLE_NAME = "table"
+
+PAGE_SIZE = 3
+DOCUMENTS_PER_SEGMENT = 10
+
+
+@pytest.fixture
+def mock_collection(httpserver: HTTPServer) -> DefaultCollection:
+    coll: DefaultCollection = Collection(
+        database=Database(
+            api_endpoint=httpserver.url_for("/"),
+            keyspace=KEYSPACE,
+            api_options=defaultAPIOptions(environment="other"),
+        ),
+        name=COLLECTION_NAME,
+        keyspace=None,
+        api_options=defaultAPIOptions(environment="other"),
+    )
+    return coll
+
+
+@pytest.fixture
+def mock_table(httpserver: HTTPServer) -> DefaultTable:
+    table: DefaultTable = Table(
+        database=Database(
+            api_endpoint=httpserver.url_for("/"),
+            keyspace=KEYSPACE,
+            api_options=defaultAPIOptions(environment="other"),
+        ),
+        name=TABLE_NAME,
+        keyspace=None,
+        api_options=defaultAPIOptions(environment="other"),
+    )
+    return table
+
+
+class PagingHandler:
+    """
+    Serve `find` pages over a set of documents, segmented by the "seg" field
+    found in the filter. Page states are the offsets of the next page.
+    Optionally fail (once) when asked for a given page state.
+    """
+
+    def __init__(
+        self,
+        *,
+        segments: int = 1,
+        documents_per_segment: int = DOCUMENTS_PER_SEGMENT,
+        page_size: int = PAGE_SIZE,
+        fail_at_page_state: str | None = None,
+        projection_schema: dict[str, Any] | None = None,
+    ) -> None:
+        self.documents = {
+            seg: [
+                {"_id": f"{seg}-{i}", "seg": seg, "i": i}
+                for i in range(documents_per_segment)
+            ]
+            for seg in range(segments)
+        }
+        self.page_size = page_size
+        self.fail_at_page_state = fail_at_page_state
+        self.projection_schema = projection_schema
+        self.requests: list[dict[str, Any]] = []
+
+    def __call__(self, request: Request) -> Response:
+        find_payload = request.get_json()["find"]
+        self.requests.append(find_payload)
+        page_state = find_payload.get("options", {}).get("pageState")
+        if page_state is not None and page_state == self.fail_at_page_state:
+            self.fail_at_page_state = None
+            return Response("Service unavailable", status=503)
+        segment = find_payload.get("filter", {}).get("seg", 0)
+        offset = int(page_state or 0)
+        documents = self.documents[segment][offset : offset + self.page_size]
+        projection = find_payload.get("projection")
+        if projection:
+            documents = [
+                {k: v for k, v in doc.items() if k in projection} for doc in documents
+            ]
+        next_offset = offset + self.page_size
+        next_page_state = (
+            str(next_offset) if next_offset < len(self.documents[segment]) else None
+        )
+        response: dict[str, Any] = {
+            "data": {"documents": documents, "nextPageState": next_page_state}
+        }
+        if self.projection_schema is not None:
+            response["status"] = {"projectionSchema": self.projection_schema}
+        return Response(json.dumps(response), content_type="application/json")
+
+
+def _serve(httpserver: HTTPServer, source_name: str, handler: PagingHandler) -> None:
+    httpserver.expect_request(
+        f"/{BASE_PATH}/{KEYSPACE}/{source_name}",
+        method=HttpMethod.POST,
+    ).respond_with_handler(handler)
+
+
+def _read_ndjson_gz(path: Path) -> list[dict[str, Any]]:
+    with gzip.open(path, "rt", encoding="utf-8") as i_file:
+        return [json.loads(line) for line in i_file]
+
+
+class TestExport:
+    @pytest.mark.describe("test of export, segmented compressed NDJSON")
+    def test_export_segmented_ndjson(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+        tmp_path: Path,
+    ) -> None:
+        handler = PagingHandler(segments=2)
+        _serve(httpserver, COLLECTION_NAME, handler)
+        stats = run_export(
+            mock_collection,
+            output_dir=str(tmp_path),
+            compression="gzip",
+            filter={"i": {"$gte": 0}},
+            segments=[{"seg": 0}, {"seg": 1}],
+            parallelism=2,
+            checkpoint_every=2,
+        )
+        assert stats.rows == 2 * DOCUMENTS_PER_SEGMENT
+        assert stats.pages == 2 * 4
+        # the segment filters are merged with the overall filter
+        assert {
+            json.dumps(req["filter"], sort_keys=True) for req in handler.requests
+        } == {
+            '{"i": {"$gte": 0}, "seg": 0}',
+            '{"i": {"$gte": 0}, "seg": 1}',
+        }
+        for seg in range(2):
+            # each checkpoint interval is a separate gzip member
+            documents = _read_ndjson_gz(tmp_path / f"part-{seg:04d}.ndjson.gz")
+            assert documents == handler.documents[seg]
+
+        with pytest.raises(ValueError, match="previous export"):
+            run_export(mock_collection, output_dir=str(tmp_path), compression="gzip")
+        with pytest.raises(ValueError, match="different settings"):
+            run_export(mock_collection, output_dir=str(tmp_path), resume=True)
+        # resuming a complete export is a no-op
+        n_requests = len(handler.requests)
+        resumed_stats = run_export(
+            mock_collection,
+            output_dir=str(tmp_path),
+            compression="gzip",
+            segments=[{"seg": 0}, {"seg": 1}],
+            resume=True,
+        )
+        assert resumed_stats.rows == 0
+        assert resumed_stats.resumed_rows == 2 * DOCUMENTS_PER_SEGMENT
+        assert len(handler.requests) == n_requests
+
+    @pytest.mark.describe("test of export, interruption and resume")
+    def test_export_interrupted_resume(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+        tmp_path: Path,
+    ) -> None:
+        handler = PagingHandler(fail_at_page_state="6")
+        _serve(httpserver, COLLECTION_NAME, handler)
+        with pytest.raises(Exception):
+            run_export(
+                mock_collection,
+                output_dir=str(tmp_path),
+                compression="gzip",
+                checkpoint_every=1,
+                prefetch=0,
+            )
+        state_path = tmp_path / "_export_state" / "part-0000.json"
+        assert json.loads(state_path.read_text())["rows"] == 6
+
+        stats = run_export(
+            mock_collection,
+            output_dir=str(tmp_path),
+            compression="gzip",
+            checkpoint_every=1,
+            resume=True,
+        )
+        assert stats.rows == DOCUMENTS_PER_SEGMENT - 6
+        assert stats.resumed_rows == 6
+        # no duplicates: the scan restarted exactly at the checkpointed page
+        assert _read_ndjson_gz(tmp_path / "part-0000.ndjson.gz") == handler.documents[0]
+        assert [req["options"].get("pageState") for req in handler.requests] == [
+            None,
+            "3",
+            "6",
+            "6",
+            "9",
+        ]
+
+    @pytest.mark.describe("test of export, table to Parquet with projection")
+    def test_export_table_parquet(
+        self,
+        httpserver: HTTPServer,
+        mock_table: DefaultTable,
+        tmp_path: Path,
+    ) -> None:
+        pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        handler = PagingHandler(
+            projection_schema={"seg": {"type": "int"}, "i": {"type": "int"}},
+        )
+        _serve(httpserver, TABLE_NAME, handler)
+        stats = run_export(
+            mock_table,
+            output_dir=str(tmp_path),
+            format="parquet",
+            projection={"seg": True, "i": True},
+            checkpoint_every=3,
+        )
+        assert stats.rows == DOCUMENTS_PER_SEGMENT
+        assert handler.requests[0]["projection"] == {"seg": True, "i": True}
+        chunk_names = sorted(
+            name for name in os.listdir(tmp_path) if name.endswith(".parquet")
+        )
+        assert chunk_names == ["part-0000-000000.parquet", "part-0000-000001.parquet"]
+        arrow_table = pq.ParquetDataset(
+            [str(tmp_path / name) for name in chunk_names]
+        ).read()
+        assert arrow_table.column_names == ["seg", "i"]
+        assert arrow_table.column("i").to_pylist() == list(range(DOCUMENTS_PER_SEGMENT))
+
+        with pytest.raises(ValueError):
+            run_export(
+                mock_table,
+                output_dir=str(tmp_path / "other"),
+                format="parquet",
+                compression="gzip",
+            )
+
+    @pytest.mark.describe("test of export, command-line entry point")
+    def test_export_main(
+        self,
+        httpserver: HTTPServer,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        handler = PagingHandler()
+        _serve(httpserver, COLLECTION_NAME, handler)
+        main(
+            [
+                "--endpoint",
+                httpserver.url_for("/").rstrip("/"),
+                "--token",
+                "t",
+                "--environment",
+                "other",
+                "--keyspace",
+                KEYSPACE,
+                "--collection",
+                COLLECTION_NAME,
+                "--output",
+                str(tmp_path),
+                "--fields",
+                "i",
+                "--progress-interval",
+                "0",
+            ]
+        )
+        assert handler.requests[0]["projection"] == {"i": True}
+        lines = (tmp_path / "part-0000.ndjson").read_text().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"i": i} for i in range(DOCUMENTS_PER_SEGMENT)
+        ]
+        assert "10 rows" in capsys.readouterr().err
+
+    @pytest.mark.describe("test of export, offline throughput against a mock API")
+    def test_export_throughput(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+        tmp_path: Path,
+    ) -> None:
+        n_segments = 4
+        handler = PagingHandler(
+            segments=n_segments,
+            documents_per_segment=2000,
+            page_size=100,
+        )
+        _serve(httpserver, COLLECTION_NAME, handler)
+        stats = run_export(
+            mock_collection,
+            output_dir=str(tmp_path),
+            segments=[{"seg": seg} for seg in range(n_segments)],
+            parallelism=n_segments,
+            prefetch=4,
+        )
+        assert stats.rows == n_segments * 2000
+        assert stats.pages == n_segments * 20
+        assert stats.bytes_written == sum(
+            (tmp_path / f"part-{seg:04d}.ndjson").stat().st_size
+            for seg in range(n_segments)
+        )
+        print(f"\nExport throughput (mock API): {stats.summary()}")
@@ -0,0 +1,404 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import certifi
+import httpx
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from astrapy import DataAPIClient
+from astrapy.api_options import APIOptions
+from astrapy.constants import ConnectionReuseMode
+from astrapy.utils.http_clients import (
+    disable_ssl_reuse,
+    get_client_pool,
+    mount_transport,
+    resolve_connection_reuse_mode,
+    unmount_transport,
+)
+from astrapy.utils.request_tools import HttpMethod
+
+# a generous budget for spawning a collection/table (it used to take ~0.5 ms,
+# as each object built its own httpx clients)
+SPAWN_BUDGET_S = 0.0002
+SPAWN_COUNT = 2000
+
+# the connection reuse benchmark: threads, each issuing requests
+REUSE_THREADS = 4
+REUSE_REQUESTS_PER_THREAD = 50
+
+
+def _private_ca_cert_path(tmp_path: Path) -> str:
+    # a CA path of its own makes for a client pool not shared with other tests
+    ca_cert_path = str(tmp_path / "ca.pem")
+    shutil.copyfile(certifi.where(), ca_cert_path)
+    return ca_cert_path
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """
+    A minimal HTTP/1.1 Data API stand-in, keeping connections alive (unlike
+    the `httpserver` fixture) and counting the connections it accepts.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: CountingHTTPServer
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.connections_lock:
+            self.server.connections += 1
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = b'{"data": {"document": null}}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class CountingHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), KeepAliveHandler)
+        self.connections = 0
+        self.connections_lock = threading.Lock()
+
+
+@pytest.fixture
+def keep_alive_server() -> Iterator[CountingHTTPServer]:
+    server = CountingHTTPServer()
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestHTTPClients:
+    @pytest.mark.describe("test of shared, lazily-created httpx clients")
+    def test_http_clients_shared(self, tmp_path: Path) -> None:
+        ca_cert_path = _private_ca_cert_path(tmp_path)
+        database = DataAPIClient(
+            environment="dse",
+            api_options=APIOptions(ca_cert_path=ca_cert_path),
+        ).get_database("http://localhost:1234", keyspace="ks")
+        collection = database.get_collection("c")
+        table = database.get_table(
+            "t", spawn_api_options=APIOptions(database_additional_headers={"h": "v"})
+        )
+        pool = get_client_pool(ca_cert_path)
+        # spawning objects creates no httpx clients
+        assert pool._client is None
+
+        client = collection._api_commander.client
+        assert isinstance(client, httpx.Client)
+        assert table._api_commander.client is client
+        assert database._get_driver_commander(keyspace=None).client is client
+        # the default CA roots have their own clients
+        assert (
+            DataAPIClient(environment="dse")
+            .get_database("http://localhost:1234", keyspace="ks")
+            .get_collection("c")
+            ._api_commander.client
+            is not client
+        )
+
+    @pytest.mark.describe("test of async httpx clients, one per event loop")
+    def test_http_clients_async_per_loop(self, tmp_path: Path) -> None:
+        ca_cert_path = _private_ca_cert_path(tmp_path)
+        acol = (
+            DataAPIClient(
+                environment="dse",
+                api_options=APIOptions(ca_cert_path=ca_cert_path),
+            )
+            .get_async_database("http://localhost:1234", keyspace="ks")
+            .get_collection("c")
+        )
+
+        async def _get_clients() -> tuple[httpx.AsyncClient, httpx.AsyncClient]:
+            async_client = acol._api_commander.async_client
+            other_acol = acol.with_options(embedding_api_key="k")
+            return async_client, other_acol._api_commander.async_client
+
+        client_a1, client_a2 = asyncio.run(_get_clients())
+        client_b1, _ = asyncio.run(_get_clients())
+        assert client_a1 is client_a2
+        assert client_b1 is not client_a1
+
+        async def _release_and_get() -> tuple[httpx.AsyncClient, httpx.AsyncClient]:
+            async_client = acol._api_commander.async_client
+            async with acol:
+                pass
+            assert async_client.is_closed
+            return async_client, acol._api_commander.async_client
+
+        released_client, new_client = asyncio.run(_release_and_get())
+        assert new_client is not released_client
+        assert not new_client.is_closed
+
+    @pytest.mark.describe(
+        "test of async httpx clients, context exit with requests in flight"
+    )
+    async def test_http_clients_async_exit_in_flight(
+        self, httpserver: HTTPServer
+    ) -> None:
+        def _slow_handler(request: Request) -> Response:
+            time.sleep(0.5)
+            return Response(
+                json.dumps({"data": {"document": {"_id": "doc"}}}),
+                content_type="application/json",
+            )
+
+        httpserver.expect_request(
+            re.compile(".*"),
+            method=HttpMethod.POST,
+        ).respond_with_handler(_slow_handler)
+        adatabase = DataAPIClient(environment="other").get_async_database(
+            httpserver.url_for("/"),
+            keyspace="ks",
+        )
+        acol_slow = adatabase.get_collection("slow")
+        acol_other = adatabase.get_collection("other")
+        shared_client = acol_slow._api_commander.async_client
+        assert acol_other._api_commander.async_client is shared_client
+
+        async def _exit_other() -> None:
+            await asyncio.sleep(0.1)
+            async with acol_other:
+                pass
+            # the shared client is retired, but still serving the slow request
+            assert not shared_client.is_closed
+
+        results = await asyncio.gather(
+            acol_slow.find_one({}),
+            _exit_other(),
+            return_exceptions=True,
+        )
+        assert list(results) == [{"_id": "doc"}, None]
+        # closed once idle; later requests get a new client
+        assert shared_client.is_closed
+        assert await acol_other.find_one({}) == {"_id": "doc"}
+        assert acol_other._api_commander.async_client is not shared_client
+
+    @pytest.mark.describe("test of httpx clients closed when dropped from the pool")
+    def test_http_clients_closed_when_dropped(self, tmp_path: Path) -> None:
+        ca_cert_path = _private_ca_cert_path(tmp_path)
+        # per-thread clients are closed when their thread ends
+        per_thread_pool = get_client_pool(ca_cert_path, ConnectionReuseMode.PER_THREAD)
+        thread_clients: list[httpx.Client] = []
+        thread = threading.Thread(
+            target=lambda: thread_clients.append(per_thread_pool.get_client())
+        )
+        thread.start()
+        thread.join()
+        gc.collect()
+        assert thread_clients[0].is_closed
+
+        # mounting a transport drops (and closes) the idle clients
+        pool = get_client_pool(ca_cert_path, ConnectionReuseMode.SHARED)
+        in_use = pool.acquire_client()
+        idle_thread_client = per_thread_pool.get_client()
+
+        async def _get_async_client() -> httpx.AsyncClient:
+            async_client = pool.get_async_client()
+            mount_transport(
+                "http://mounted.local",
+                httpx.MockTransport(lambda request: httpx.Response(200)),
+            )
+            for _ in range(5):
+                await asyncio.sleep(0)
+            return async_client
+
+        try:
+            async_client = asyncio.run(_get_async_client())
+        finally:
+            unmount_transport("http://mounted.local")
+        assert async_client.is_closed
+        assert idle_thread_client.is_closed
+        assert pool.get_client() is not in_use.client
+        # the client serving a request is closed when the request is done
+        assert not in_use.client.is_closed
+        pool.release_client(in_use)
+        assert in_use.client.is_closed
+
+    @pytest.mark.describe("test of collection/table spawn rate, microbenchmark")
+    def test_spawn_rate(self) -> None:
+        database = DataAPIClient(environment="dse").get_database(
+            "http://localhost:1234", keyspace="ks"
+        )
+        database.get_collection("warmup")
+        t0 = time.perf_counter()
+        for _ in range(SPAWN_COUNT):
+            database.get_collection("c")
+            database.get_table("t")
+        spawn_s = (time.perf_counter() - t0) / (2 * SPAWN_COUNT)
+        assert spawn_s < SPAWN_BUDGET_S
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    @pytest.mark.describe("test of httpx clients rebuilt in forked processes")
+    def test_http_clients_fork(self, httpserver: HTTPServer) -> None:
+        httpserver.expect_request(
+            re.compile(".*"),
+            method=HttpMethod.POST,
+        ).respond_with_json({"data": {"document": {"_id": "doc"}}})
+        collection = (
+            DataAPIClient(environment="other")
+            .get_database(
+                httpserver.url_for("/"),
+                keyspace="ks",
+            )
+            .get_collection("c")
+        )
+        assert collection.find_one({}) == {"_id": "doc"}
+        parent_client = collection._api_commander.client
+
+        read_fd, write_fd = os.pipe()
+        child_pid = os.fork()
+        if child_pid == 0:
+            # the child: a new client, working, for the inherited collection
+            try:
+                child_ok = (
+                    collection._api_commander.client is not parent_client
+                    and collection.find_one({}) == {"_id": "doc"}
+                )
+                os.write(write_fd, b"ok" if child_ok else b"ko")
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        os.waitpid(child_pid, 0)
+        with os.fdopen(read_fd, "rb") as child_output:
+            assert child_output.read() == b"ok"
+        # the parent keeps its client and connections
+        assert collection._api_commander.client is parent_client
+        assert collection.find_one({}) == {"_id": "doc"}
+
+    @pytest.mark.describe("test of httpx clients rebuilt on process ID change")
+    def test_http_clients_pid_change(self, tmp_path: Path) -> None:
+        pool = get_client_pool(_private_ca_cert_path(tmp_path))
+        client = pool.get_client()
+        assert pool.get_client() is client
+        # as seen in a process forked without running the at-fork hooks
+        pool._pid = -1
+        assert pool.get_client() is not client
+
+    @pytest.mark.describe("test of connection reuse modes, per-thread httpx clients")
+    def test_http_clients_per_thread(self, tmp_path: Path) -> None:
+        ca_cert_path = _private_ca_cert_path(tmp_path)
+        database = DataAPIClient(
+            environment="dse",
+            api_options=APIOptions(
+                ca_cert_path=ca_cert_path,
+                connection_reuse_mode="per_thread",
+            ),
+        ).get_database("http://localhost:1234", keyspace="ks")
+        collection = database.get_collection("c")
+        table = database.get_table("t")
+        assert collection.api_options.connection_reuse_mode == (
+            ConnectionReuseMode.PER_THREAD
+        )
+        pool = get_client_pool(ca_cert_path, ConnectionReuseMode.PER_THREAD)
+        assert pool is not get_client_pool(ca_cert_path, ConnectionReuseMode.SHARED)
+
+        client = collection._api_commander.client
+        assert table._api_commander.client is client
+        thread_clients: list[httpx.Client] = []
+
+        def _get_thread_client() -> None:
+            thread_client = collection._api_commander.client
+            assert table._api_commander.client is thread_client
+            thread_clients.append(thread_client)
+
+        threads = [threading.Thread(target=_get_thread_client) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(cl) for cl in [client, *thread_clients]}) == 3
+
+        assert "Connection" not in collection._api_commander.full_headers
+        disabled_collection = collection.with_options(
+            api_options=APIOptions(connection_reuse_mode=ConnectionReuseMode.DISABLED)
+        )
+        assert disabled_collection._api_commander.full_headers["Connection"] == "close"
+        # the automatic choice depends on the Python version
+        assert resolve_connection_reuse_mode(None) == (
+            ConnectionReuseMode.DISABLED
+            if disable_ssl_reuse
+            else ConnectionReuseMode.SHARED
+        )
+
+    @pytest.mark.describe("test of connection reuse modes, benchmark")
+    def test_connection_reuse_benchmark(
+        self, keep_alive_server: CountingHTTPServer
+    ) -> None:
+        api_endpoint = f"http://127.0.0.1:{keep_alive_server.server_address[1]}"
+        connections: dict[ConnectionReuseMode, int] = {}
+        elapsed_s: dict[ConnectionReuseMode, float] = {}
+        for mode in [ConnectionReuseMode.PER_THREAD, ConnectionReuseMode.DISABLED]:
+            collection = (
+                DataAPIClient(
+                    environment="other",
+                    api_options=APIOptions(connection_reuse_mode=mode),
+                )
+                .get_database(api_endpoint, keyspace="ks")
+                .get_collection("c")
+            )
+
+            def _work() -> None:
+                for _ in range(REUSE_REQUESTS_PER_THREAD):
+                    assert collection.find_one({}) is None
+
+            keep_alive_server.connections = 0
+            threads = [threading.Thread(target=_work) for _ in range(REUSE_THREADS)]
+            t0 = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed_s[mode] = time.perf_counter() - t0
+            connections[mode] = keep_alive_server.connections
+
+        # one (TLS-handshaking, in real life) connection per request without reuse
+        assert connections[ConnectionReuseMode.PER_THREAD] == REUSE_THREADS
+        assert connections[ConnectionReuseMode.DISABLED] == (
+            REUSE_THREADS * REUSE_REQUESTS_PER_THREAD
+        )
+        # (no TLS here: setting up a connection is cheap, hence a loose comparison)
+        assert (
+            elapsed_s[ConnectionReuseMode.PER_THREAD]
+            < 2 * elapsed_s[ConnectionReuseMode.DISABLED]
+        )
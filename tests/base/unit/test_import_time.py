@@ -0,0 +1,101 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+# a generous budget (the eager import takes over 100 ms even on fast machines)
+IMPORT_ASTRAPY_BUDGET_S = 0.1
+# the best of this many cold-start runs is compared with the budget
+IMPORT_ASTRAPY_RUNS = 3
+
+# these must not be loaded by a bare `import astrapy`
+HEAVY_MODULES = [
+    "astrapy.admin",
+    "astrapy.data",
+    "astrapy.utils.api_commander",
+    "bson",
+    "httpx",
+    "toml",
+]
+
+IMPORT_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import astrapy
+elapsed_s = time.perf_counter() - t0
+heavy = [mod for mod in {heavy_modules!r} if mod in sys.modules]
+{after_import}
+print(json.dumps({{"elapsed_s": elapsed_s, "heavy": heavy, "extra": extra}}))
+"""
+
+
+def _probe(after_import: str = "extra = None") -> dict[str, Any]:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            IMPORT_PROBE.format(
+                heavy_modules=HEAVY_MODULES,
+                after_import=after_import,
+            ),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])  # type: ignore[no-any-return]
+
+
+class TestImportTime:
+    @pytest.mark.describe("test of import astrapy, no heavy modules and time budget")
+    def test_import_astrapy_cold_start(self) -> None:
+        probes = [_probe() for _ in range(IMPORT_ASTRAPY_RUNS)]
+        assert all(probe["heavy"] == [] for probe in probes)
+        best_elapsed_s = min(probe["elapsed_s"] for probe in probes)
+        assert best_elapsed_s < IMPORT_ASTRAPY_BUDGET_S
+
+    @pytest.mark.describe("test of import astrapy, lazy attributes and SSL context")
+    def test_import_astrapy_lazy_attributes(self) -> None:
+        probe = _probe(
+            "\n".join(
+                [
+                    "from astrapy import DataAPIClient, __version__",
+                    "import astrapy.utils.http_clients as http_clients",
+                    "no_ssl_at_import = http_clients._ssl_contexts == {}",
+                    "client = DataAPIClient(environment='dse')",
+                    "extra = {",
+                    "    'no_ssl_at_import': no_ssl_at_import,",
+                    "    'version': __version__,",
+                    "    'table': astrapy.Table.__name__,",
+                    "    'ids': astrapy.ids.__name__,",
+                    "    'in_dir': 'Collection' in dir(astrapy),",
+                    "}",
+                ]
+            )
+        )
+        version = probe["extra"].pop("version")
+        assert version not in {"", "unknown"}
+        assert probe["extra"] == {
+            "no_ssl_at_import": True,
+            "table": "Table",
+            "ids": "astrapy.ids",
+            "in_dir": True,
+        }
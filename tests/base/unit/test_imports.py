@@ -69,13 +69,25 @@ def test_imports() -> None:
         Table,
     )
     from astrapy.admin import (
+        AdaptivePollingStrategy,
+        DatabaseStatusPoller,
+        DeadlineAwarePollingStrategy,
+        ExponentialPollingStrategy,
+        FixedPollingStrategy,
         ParsedAPIEndpoint,
+        PollingState,
+        PollingStrategy,
         parse_api_endpoint,
     )
     from astrapy.api_options import (
+        AdminMetadataCache,
         APIOptions,
         DataAPIURLOptions,
         DevOpsAPIURLOptions,
+        MetadataCache,
+        MetadataCacheStats,
+        ReadCache,
+        ReadCacheStats,
         SerdesOptions,
         TimeoutOptions,
     )
@@ -102,7 +114,11 @@ def test_imports() -> None:
         AsyncTableFindCursor,
         CollectionFindAndRerankCursor,
         CollectionFindCursor,
+        CursorCheckpoint,
+        CursorCheckpointStore,
         CursorState,
+        FileCursorCheckpointStore,
+        InMemoryCursorCheckpointStore,
         RerankedResult,
         TableFindCursor,
     )
@@ -117,6 +133,13 @@ def test_imports() -> None:
         DataAPIVector,
     )
     from astrapy.event_observers import (
+        OPENMETRICS_CONTENT_TYPE,
+        BackgroundObserver,
+        BackgroundObserverStats,
+        CommandMetrics,
+        InMemorySpanExporter,
+        LatencyHistogram,
+        MetricsObserver,
         ObservableError,
         ObservableEvent,
         ObservableEventType,
@@ -124,9 +147,20 @@ def test_imports() -> None:
         ObservableResponse,
         ObservableWarning,
         Observer,
+        OTLPSpanExporter,
+        OverflowPolicy,
+        PrometheusObserver,
+        SlowOperationObserver,
+        SlowOperationRecord,
+        Span,
+        SpanExporter,
+        SpanKind,
+        SpanStatus,
+        TracingObserver,
         event_collector,
     )
     from astrapy.exceptions import (
+        CollectionBulkWriteException,
         CollectionDeleteManyException,
         CollectionInsertManyException,
         CollectionUpdateManyException,
@@ -142,7 +176,9 @@ def test_imports() -> None:
         DevOpsAPIResponseException,
         DevOpsAPITimeoutException,
         MultiCallTimeoutManager,
+        TableBulkWriteException,
         TableInsertManyException,
+        TableUpdateManyException,
         TooManyDocumentsToCountException,
         TooManyRowsToCountException,
         UnexpectedDataAPIResponseException,
@@ -222,14 +258,51 @@ def test_imports() -> None:
         TableVectorIndexOptions,
         VectorServiceOptions,
     )
+    from astrapy.loaders import (
+        AsyncCollectionLoader,
+        AsyncTableLoader,
+        CollectionLoader,
+        TableLoader,
+    )
+    from astrapy.operations import (
+        BaseOperation,
+        BaseTableOperation,
+        DeleteMany,
+        DeleteOne,
+        InsertMany,
+        InsertOne,
+        ReplaceOne,
+        TableDeleteMany,
+        TableDeleteOne,
+        TableInsertMany,
+        TableInsertOne,
+        TableUpdateOne,
+        UpdateMany,
+        UpdateOne,
+    )
+    from astrapy.profiling import (
+        PhaseStats,
+        Profile,
+        ProfilePhase,
+        profiling,
+    )
     from astrapy.results import (
+        CollectionBulkWriteResult,
         CollectionDeleteResult,
         CollectionInsertManyResult,
         CollectionInsertOneResult,
         CollectionUpdateResult,
         OperationResult,
+        OperationStats,
+        TableBulkWriteResult,
         TableInsertManyResult,
         TableInsertOneResult,
+        TableUpdateManyResult,
+    )
+    from astrapy.testing import (
+        DataAPIEmulator,
+        EmulatorFault,
+        EmulatorServer,
     )
     from astrapy.utils.api_options import defaultAPIOptions
     from astrapy.utils.document_paths import (
@@ -0,0 +1,364 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from astrapy import Collection, Database
+from astrapy.load import main, run_load
+from astrapy.utils.api_options import defaultAPIOptions
+from astrapy.utils.request_tools import HttpMethod
+
+from ..conftest import DefaultCollection
+
+BASE_PATH = "v1"
+KEYSPACE = "keyspace"
+COLLECTION_NAME = "collection"
+TABLE_NAME = "table"
+
+
+@pytest.fixture
+def mock_collection(httpserver: HTTPServer) -> DefaultCollection:
+    coll: DefaultCollection = Collection(
+        database=Database(
+            api_endpoint=httpserver.url_for("/"),
+            keyspace=KEYSPACE,
+            api_options=defaultAPIOptions(environment="other"),
+        ),
+        name=COLLECTION_NAME,
+        keyspace=None,
+        api_options=defaultAPIOptions(environment="other"),
+    )
+    return coll
+
+
+class InsertHandler:
+    """
+    Serve `insertMany` commands, storing the documents by `_id` (or `id` for
+    rows, generating a missing `_id` as the API does) and rejecting duplicates.
+    Optionally, fail with an HTTP error (or stall for `stall_s` seconds) right
+    after storing the documents of the first few requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        id_field: str = "_id",
+        fail_after_insert: int = 0,
+        stall_after_insert: int = 0,
+        stall_s: float = 0.0,
+    ) -> None:
+        self.id_field = id_field
+        self.fail_after_insert = fail_after_insert
+        self.stall_after_insert = stall_after_insert
+        self.stall_s = stall_s
+        self.stored: dict[Any, dict[str, Any]] = {}
+        self.requests: list[list[dict[str, Any]]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: Request) -> Response:
+        documents = request.get_json()["insertMany"]["documents"]
+        with self._lock:
+            self.requests.append(documents)
+            doc_responses: list[dict[str, Any]] = []
+            errors: list[dict[str, Any]] = []
+            for document in documents:
+                raw_id = document.get(self.id_field) or str(uuid.uuid4())
+                # (e.g. {"$uuid": ...} for typed IDs)
+                doc_id = json.dumps(raw_id) if isinstance(raw_id, dict) else raw_id
+                if doc_id in self.stored:
+                    doc_responses.append(
+                        {"_id": raw_id, "status": "ERROR", "errorsIdx": len(errors)}
+                    )
+                    errors.append(
+                        {
+                            "errorCode": "DOCUMENT_ALREADY_EXISTS",
+                            "message": f"Document already exists with the given _id {doc_id}",
+                        }
+                    )
+                else:
+                    self.stored[doc_id] = document
+                    doc_responses.append({"_id": raw_id, "status": "OK"})
+            if self.fail_after_insert > 0:
+                self.fail_after_insert -= 1
+                return Response("Bad gateway", status=502)
+            stall = self.stall_after_insert > 0
+            if stall:
+                self.stall_after_insert -= 1
+        if stall:
+            time.sleep(self.stall_s)
+        status: dict[str, Any] = {"documentResponses": doc_responses}
+        if self.id_field != "_id":
+            status["primaryKeySchema"] = {self.id_field: {"type": "int"}}
+            for doc_response in doc_responses:
+                doc_response["_id"] = [doc_response["_id"]]
+        response: dict[str, Any] = {"status": status}
+        if errors:
+            response["errors"] = errors
+        return Response(json.dumps(response), content_type="application/json")
+
+
+def _serve(
+    httpserver: HTTPServer,
+    target_name: str,
+    handler: InsertHandler,
+    *,
+    default_id_type: str | None = None,
+) -> None:
+    options = (
+        {} if default_id_type is None else {"defaultId": {"type": default_id_type}}
+    )
+    httpserver.expect_request(
+        f"/{BASE_PATH}/{KEYSPACE}",
+        method=HttpMethod.POST,
+    ).respond_with_json(
+        {"status": {"collections": [{"name": COLLECTION_NAME, "options": options}]}}
+    )
+    httpserver.expect_request(
+        f"/{BASE_PATH}/{KEYSPACE}/{target_name}",
+        method=HttpMethod.POST,
+    ).respond_with_handler(handler)
+
+
+def _write_ndjson_gz(path: Path, documents: list[dict[str, Any]]) -> None:
+    with gzip.open(path, "wt", encoding="utf-8") as o_file:
+        for document in documents:
+            o_file.write(json.dumps(document) + "\n")
+
+
+class TestLoad:
+    @pytest.mark.describe("test of load, compressed NDJSON with rejects")
+    def test_load_ndjson_rejects(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+        tmp_path: Path,
+    ) -> None:
+        handler = InsertHandler()
+        handler.stored["dup"] = {"_id": "dup"}
+        _serve(httpserver, COLLECTION_NAME, handler)
+        documents = [{"_id": f"d{i}", "i": i} for i in range(30)]
+        documents.insert(17, {"_id": "dup", "i": -1})
+        input_path = tmp_path / "input.ndjson.gz"
+        _write_ndjson_gz(input_path, documents)
+
+        stats = run_load(
+            mock_collection,
+            input_path=str(input_path),
+            chunk_size=4,
+            concurrency=3,
+            rejects_path=str(tmp_path / "rejects.ndjson"),
+        )
+        assert stats.inserted == 30
+        assert stats.rejected == 1
+        assert stats.chunks == 8
+        assert max(len(req) for req in handler.requests) == 4
+        assert set(handler.stored.keys()) == {f"d{i}" for i in range(30)} | {"dup"}
+        rejects = [
+            json.loads(line)
+            for line in (tmp_path / "rejects.ndjson").read_text().splitlines()
+        ]
+        assert rejects == [
+            {
+                "record": 17,
+                "error": "DOCUMENT_ALREADY_EXISTS",
+                "document": {"_id": "dup", "i": -1},
+            }
+        ]
+        offset_path = tmp_path / "input.ndjson.gz.offset.json"
+        assert json.loads(offset_path.read_text())["offset"] == 31
+        with pytest.raises(ValueError, match="previous load"):
+            run_load(mock_collection, input_path=str(input_path))
+
+    @pytest.mark.describe("test of load, byte-aware chunking and retries")
+    def test_load_chunking_retries(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+        tmp_path: Path,
+    ) -> None:
+        # the first request writes its documents but the client sees an error
+        handler = InsertHandler(fail_after_insert=1)
+        _serve(httpserver, COLLECTION_NAME, handler)
+        documents = [{"_id": f"d{i}", "text": "x" * 1000} for i in range(10)]
+        input_path = tmp_path / "input.jsonl"
+        input_path.write_text("".join(json.dumps(doc) + "\n" for doc in documents))
+
+        stats = run_load(
+            mock_collection,
+            input_path=str(input_path),
+            max_chunk_bytes=3500,
+            concurrency=1,
+            retry_base_delay_s=0,
+        )
+        # three ~1 KB documents per chunk
+        assert [len(req) for req in handler.requests] == [3, 3, 3, 3, 1]
+        assert stats.retried == 3
+        # the documents found on retry count as inserted, not rejected
+        assert stats.inserted == 10
+        assert stats.rejected == 0
+
+    @pytest.mark.describe("test of load, retry after timeout, documents without _id")
+    def test_load_timeout_retry_no_ids(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+        tmp_path: Path,
+    ) -> None:
+        # the first request writes its documents but the client times out
+        handler = InsertHandler(stall_after_insert=1, stall_s=1.0)
+        _serve(httpserver, COLLECTION_NAME, handler)
+        input_path = tmp_path / "input.jsonl"
+        input_path.write_text("".join(f'{{"n": {i}}}\n' for i in range(6)))
+
+        stats = run_load(
+            mock_collection,
+            input_path=str(input_path),
+            chunk_size=3,
+            concurrency=1,
+            retry_base_delay_s=0,
+            request_timeout_ms=300,
+        )
+        # the retry carries the same (client-assigned) IDs as the first attempt
+        assert [doc["_id"] for doc in handler.requests[0]] == [
+            doc["_id"] for doc in handler.requests[1]
+        ]
+        assert sorted(doc["n"] for doc in handler.stored.values()) == list(range(6))
+        assert stats.retried >= 3
+        assert stats.inserted == 6
+        assert stats.rejected == 0
+
+    @pytest.mark.parametrize(
+        ("default_id_type", "expected_id_check"),
+        [
+            (None, lambda doc_id: uuid.UUID(doc_id).version == 4),
+            ("uuid", lambda doc_id: uuid.UUID(doc_id["$uuid"]).version == 4),
+            ("uuidv7", lambda doc_id: uuid.UUID(doc_id["$uuid"]).version == 7),
+            ("objectId", lambda doc_id: len(doc_id["$objectId"]) == 24),
+        ],
+    )
+    @pytest.mark.describe(
+        "test of load, client-side IDs follow the collection defaultId"
+    )
+    def test_load_default_id_types(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+        tmp_path: Path,
+        default_id_type: str | None,
+        expected_id_check: Callable[[Any], bool],
+    ) -> None:
+        handler = InsertHandler()
+        _serve(httpserver, COLLECTION_NAME, handler, default_id_type=default_id_type)
+        input_path = tmp_path / "input.jsonl"
+        input_path.write_text('{"n": 0}\n{"n": 1, "_id": "given"}\n')
+
+        stats = run_load(mock_collection, input_path=str(input_path))
+        assert stats.inserted == 2
+        (documents,) = handler.requests
+        assert expected_id_check(documents[0]["_id"])
+        assert documents[1]["_id"] == "given"
+
+    @pytest.mark.describe("test of load, interruption and resume")
+    def test_load_resume(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+        tmp_path: Path,
+    ) -> None:
+        handler = InsertHandler()
+        _serve(httpserver, COLLECTION_NAME, handler)
+        lines = [json.dumps({"_id": f"d{i}"}) for i in range(20)]
+        input_path = tmp_path / "input.ndjson"
+        input_path.write_text("\n".join(lines[:13] + ["{broken"] + lines[14:]))
+
+        with pytest.raises(ValueError, match="line 14"):
+            run_load(
+                mock_collection,
+                input_path=str(input_path),
+                chunk_size=5,
+                checkpoint_every=1,
+            )
+        offset_path = tmp_path / "input.ndjson.offset.json"
+        assert json.loads(offset_path.read_text())["offset"] == 10
+
+        input_path.write_text("\n".join(lines))
+        stats = run_load(
+            mock_collection,
+            input_path=str(input_path),
+            chunk_size=5,
+            resume=True,
+        )
+        assert stats.skipped == 10
+        assert stats.inserted == 10
+        # every document was sent exactly once
+        sent_ids = [doc["_id"] for req in handler.requests for doc in req]
+        assert sorted(sent_ids) == sorted(f"d{i}" for i in range(20))
+
+    @pytest.mark.describe("test of load, command-line entry point, CSV and vectors")
+    def test_load_main_csv_vectors(
+        self,
+        httpserver: HTTPServer,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        np = pytest.importorskip("numpy")
+        handler = InsertHandler(id_field="id")
+        _serve(httpserver, TABLE_NAME, handler)
+        input_path = tmp_path / "input.csv"
+        input_path.write_text('id,name,tags\n1,a,"[""x""]"\n2,,[]\n')
+        vectors_path = tmp_path / "vectors.npy"
+        np.save(vectors_path, np.array([[0.5, 1.0], [1.5, 2.0]], dtype=np.float32))
+
+        main(
+            [
+                "--endpoint",
+                httpserver.url_for("/").rstrip("/"),
+                "--token",
+                "t",
+                "--environment",
+                "other",
+                "--keyspace",
+                KEYSPACE,
+                "--table",
+                TABLE_NAME,
+                "--input",
+                str(input_path),
+                "--csv-json-columns",
+                "id,tags",
+                "--vectors",
+                str(vectors_path),
+                "--vector-column",
+                "v",
+                "--progress-interval",
+                "0",
+            ]
+        )
+        assert handler.stored == {
+            1: {"id": 1, "name": "a", "tags": ["x"], "v": [0.5, 1.0]},
+            2: {"id": 2, "tags": [], "v": [1.5, 2.0]},
+        }
+        assert "2 inserted" in capsys.readouterr().err
@@ -0,0 +1,329 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from astrapy import Collection, Database, Table
+from astrapy.data_types import DataAPIDate, DataAPITimestamp
+from astrapy.exceptions import DataAPIResponseException
+from astrapy.utils.api_options import defaultAPIOptions
+from astrapy.utils.request_tools import HttpMethod
+
+from ..conftest import DefaultCollection, DefaultTable
+
+BASE_PATH = "v1"
+KEYSPACE = "keyspace"
+COLLECTION_NAME = "collection"
+TABLE_NAME = "table"
+FIND_PAGE_SIZE = 20
+
+TABLE_DEFINITION = {
+    "columns": {
+        "p": {"type": "text"},
+        "s": {"type": "int"},
+        "x": {"type": "int"},
+    },
+    "primaryKey": {"partitionBy": ["p"], "partitionSort": {"s": 1}},
+}
+TYPED_TABLE_DEFINITION = {
+    "columns": {
+        "d": {"type": "date"},
+        "u": {"type": "uuid"},
+        "t": {"type": "timestamp"},
+        "x": {"type": "int"},
+    },
+    "primaryKey": {"partitionBy": ["d", "u"], "partitionSort": {"t": 1}},
+}
+
+
+@pytest.fixture
+def mock_collection(httpserver: HTTPServer) -> DefaultCollection:
+    coll: DefaultCollection = Collection(
+        database=Database(
+            api_endpoint=httpserver.url_for("/"),
+            keyspace=KEYSPACE,
+            api_options=defaultAPIOptions(environment="other"),
+        ),
+        name=COLLECTION_NAME,
+        keyspace=None,
+        api_options=defaultAPIOptions(environment="other"),
+    )
+    return coll
+
+
+@pytest.fixture
+def mock_table(httpserver: HTTPServer) -> DefaultTable:
+    table: DefaultTable = Table(
+        database=Database(
+            api_endpoint=httpserver.url_for("/"),
+            keyspace=KEYSPACE,
+            api_options=defaultAPIOptions(environment="other"),
+        ),
+        name=TABLE_NAME,
+        keyspace=None,
+        api_options=defaultAPIOptions(environment="other"),
+    )
+    return table
+
+
+class InFindHandler:
+    """
+    Serve `find` commands whose filter has an `$in` on the last key column,
+    returning the stored items matching the filter in pages of FIND_PAGE_SIZE
+    as the API does. A lookup for the `poison` value gets an API error.
+    The filters of the first-page requests are recorded, and the requests
+    for further pages are counted.
+    """
+
+    def __init__(
+        self,
+        items: list[dict[str, Any]],
+        *,
+        key_column: str,
+        definition: dict[str, Any] = TABLE_DEFINITION,
+    ) -> None:
+        self.items = items
+        self.key_column = key_column
+        self.definition = definition
+        self.filters: list[dict[str, Any]] = []
+        self.next_page_requests = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: Request) -> Response:
+        find_payload = request.get_json()["find"]
+        find_filter = find_payload["filter"]
+        page_state = (find_payload.get("options") or {}).get("pageState")
+        with self._lock:
+            if page_state is None:
+                self.filters.append(find_filter)
+            else:
+                self.next_page_requests += 1
+        in_values = find_filter[self.key_column]["$in"]
+        response: dict[str, Any]
+        if "poison" in in_values:
+            response = {"errors": [{"errorCode": "POISON", "message": "Poison."}]}
+        else:
+            eq_clauses = {k: v for k, v in find_filter.items() if k != self.key_column}
+            matches = [
+                item
+                for item in self.items
+                if item[self.key_column] in in_values
+                and all(item[k] == v for k, v in eq_clauses.items())
+            ]
+            page_start = int(page_state or 0)
+            page_end = page_start + FIND_PAGE_SIZE
+            response = {
+                "data": {
+                    "documents": matches[page_start:page_end],
+                    "nextPageState": str(page_end) if page_end < len(matches) else None,
+                }
+            }
+            if self.key_column != "_id":
+                response["status"] = {"projectionSchema": self.definition["columns"]}
+        return Response(json.dumps(response), content_type="application/json")
+
+    @property
+    def in_sizes(self) -> list[int]:
+        return [len(ff[self.key_column]["$in"]) for ff in self.filters]
+
+
+def _serve(httpserver: HTTPServer, target_name: str, handler: InFindHandler) -> None:
+    httpserver.expect_request(
+        f"/{BASE_PATH}/{KEYSPACE}",
+        method=HttpMethod.POST,
+    ).respond_with_json(
+        {"status": {"tables": [{"name": TABLE_NAME, "definition": handler.definition}]}}
+    )
+    httpserver.expect_request(
+        f"/{BASE_PATH}/{KEYSPACE}/{target_name}",
+        method=HttpMethod.POST,
+    ).respond_with_handler(handler)
+
+
+DOCUMENTS = [{"_id": f"d{i}", "i": i} for i in range(300)]
+ROWS = [{"p": p, "s": s, "x": s * 10} for p in ("A", "B") for s in range(5)]
+ROW_UUID = "0196f2a0-48e6-7e49-9d4c-3bb4a2d9f0d1"
+# (as the API returns them)
+TYPED_ROWS = [
+    {"d": "2024-01-01", "u": ROW_UUID, "t": f"2024-01-01T1{h}:00:00.000Z", "x": h}
+    for h in range(3)
+]
+
+
+class TestLoaders:
+    @pytest.mark.describe("test of collection loader, batching from many threads")
+    def test_collection_loader(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+    ) -> None:
+        handler = InFindHandler(DOCUMENTS, key_column="_id")
+        _serve(httpserver, COLLECTION_NAME, handler)
+        keys = [f"d{i}" for i in range(40)] + ["missing"]
+        with mock_collection.loader(batch_window_ms=200) as loader:
+            with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+                documents = list(executor.map(loader.load, keys))
+        assert documents == DOCUMENTS[:40] + [None]
+        # the lookups are coalesced (with some tolerance on thread scheduling)
+        assert len(handler.filters) <= 3
+        assert sum(handler.in_sizes) == len(keys)
+        assert handler.next_page_requests == 0
+
+        handler.filters.clear()
+        with mock_collection.loader(concurrency=3) as loader:
+            many_keys = [f"d{i}" for i in range(250)] + ["d0", "d1"]
+            many_documents = loader.load_many(many_keys)
+        assert many_documents == DOCUMENTS[:250] + DOCUMENTS[:2]
+        # duplicates are looked up once, in batches of one page each
+        assert sorted(handler.in_sizes) == [10] + [20] * 12
+        assert handler.next_page_requests == 0
+
+        handler.filters.clear()
+        with mock_collection.loader(max_batch_size=100) as loader:
+            assert loader.load_many(many_keys) == many_documents
+        # larger batches are still correct, but need further page requests
+        assert sorted(handler.in_sizes) == [50, 100, 100]
+        assert handler.next_page_requests == 2 + 4 + 4
+
+        with pytest.raises(ValueError):
+            mock_collection.loader(projection={"_id": False})
+        with pytest.raises(ValueError):
+            loader.load("d0")
+
+    @pytest.mark.describe("test of collection loader, async, event-loop tick")
+    async def test_collection_loader_async(
+        self,
+        httpserver: HTTPServer,
+        mock_collection: DefaultCollection,
+    ) -> None:
+        handler = InFindHandler(DOCUMENTS, key_column="_id")
+        _serve(httpserver, COLLECTION_NAME, handler)
+        async with mock_collection.to_async().loader() as loader:
+            documents = await asyncio.gather(
+                *(loader.load(f"d{i}") for i in range(150)),
+                loader.load("d3"),
+            )
+            assert documents == DOCUMENTS[:150] + [DOCUMENTS[3]]
+            # full batches leave right away: "d3" is also in the last batch
+            assert sorted(handler.in_sizes) == [11] + [20] * 7
+            assert handler.next_page_requests == 0
+
+            # a failing batch fails all of its lookups, and only those
+            results = await asyncio.gather(
+                loader.load("d1"),
+                loader.load("poison"),
+                return_exceptions=True,
+            )
+            assert all(isinstance(res, DataAPIResponseException) for res in results)
+            assert await loader.load_many(["d5", "nope"]) == [DOCUMENTS[5], None]
+
+    @pytest.mark.describe("test of table loader, composite primary key")
+    def test_table_loader(
+        self,
+        httpserver: HTTPServer,
+        mock_table: DefaultTable,
+    ) -> None:
+        handler = InFindHandler(ROWS, key_column="s")
+        _serve(httpserver, TABLE_NAME, handler)
+        with mock_table.loader(projection={"x": True}) as loader:
+            rows = loader.load_many(
+                [
+                    {"p": "A", "s": 1},
+                    ("B", 2),
+                    {"s": 3, "p": "A"},
+                    ("B", 9),
+                ]
+            )
+            assert loader.projection == {"x": True, "p": True, "s": True}
+            with pytest.raises(ValueError):
+                loader.load({"p": "A"})
+        assert rows == [ROWS[1], ROWS[7], ROWS[3], None]
+        # one `$in` query per partition
+        assert sorted(handler.filters, key=lambda ff: str(ff["p"])) == [
+            {"p": "A", "s": {"$in": [1, 3]}},
+            {"p": "B", "s": {"$in": [2, 9]}},
+        ]
+
+    @pytest.mark.describe("test of table loader, keys of non-JSON column types")
+    def test_table_loader_typed_keys(
+        self,
+        httpserver: HTTPServer,
+        mock_table: DefaultTable,
+    ) -> None:
+        handler = InFindHandler(
+            TYPED_ROWS, key_column="t", definition=TYPED_TABLE_DEFINITION
+        )
+        _serve(httpserver, TABLE_NAME, handler)
+        with mock_table.loader(key_columns=["d", "u", "t"]) as loader:
+            rows = loader.load_many(
+                [
+                    # keys as accepted by find_one: strings for the typed columns
+                    {
+                        "d": "2024-01-01",
+                        "u": ROW_UUID.upper(),
+                        "t": "2024-01-01T10:00:00Z",
+                    },
+                    (
+                        DataAPIDate.from_string("2024-01-01"),
+                        uuid.UUID(ROW_UUID),
+                        DataAPITimestamp.from_string("2024-01-01T11:00:00.000Z"),
+                    ),
+                    ("2024-01-01", ROW_UUID, "2024-01-01T13:00:00Z"),
+                ]
+            )
+            single_row = loader.load(("2024-01-01", ROW_UUID, "2024-01-01T12:00:00Z"))
+        assert single_row is not None
+        assert single_row["x"] == 2
+        assert [row and row["x"] for row in rows] == [0, 1, None]
+        assert rows[0] is not None
+        assert rows[0]["d"] == DataAPIDate.from_string("2024-01-01")
+        assert rows[0]["u"] == uuid.UUID(ROW_UUID)
+        # the keys differing only in the last column make up a single batch
+        assert handler.filters[0] == {
+            "d": "2024-01-01",
+            "u": ROW_UUID,
+            "t": {
+                "$in": [
+                    "2024-01-01T10:00:00.000Z",
+                    "2024-01-01T11:00:00.000Z",
+                    "2024-01-01T13:00:00.000Z",
+                ]
+            },
+        }
+
+    @pytest.mark.describe("test of table loader, async")
+    async def test_table_loader_async(
+        self,
+        httpserver: HTTPServer,
+        mock_table: DefaultTable,
+    ) -> None:
+        handler = InFindHandler(ROWS, key_column="s")
+        _serve(httpserver, TABLE_NAME, handler)
+        async with mock_table.to_async().loader() as loader:
+            rows = await asyncio.gather(
+                *(loader.load({"p": "B", "s": s}) for s in range(5))
+            )
+        assert rows == ROWS[5:]
+        assert handler.filters == [{"p": "B", "s": {"$in": [0, 1, 2, 3, 4]}}]
@@ -0,0 +1,224 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from astrapy import Database
+from astrapy.api_options import APIOptions, MetadataCache
+from astrapy.exceptions import DataAPITimeoutException
+from astrapy.utils.api_options import defaultAPIOptions
+from astrapy.utils.request_tools import HttpMethod
+
+BASE_PATH = "v1"
+KEYSPACE = "keyspace"
+TABLE_NAME = "table"
+
+TABLE_DEFINITION = {
+    "columns": {
+        "p": {"type": "text"},
+        "x": {"type": "int"},
+    },
+    "primaryKey": {"partitionBy": ["p"], "partitionSort": {}},
+}
+
+
+@pytest.fixture
+def metadata_cache() -> MetadataCache:
+    return MetadataCache()
+
+
+@pytest.fixture
+def mock_database(httpserver: HTTPServer, metadata_cache: MetadataCache) -> Database:
+    return Database(
+        api_endpoint=httpserver.url_for("/"),
+        keyspace=KEYSPACE,
+        api_options=defaultAPIOptions(environment="other").with_override(
+            APIOptions(metadata_cache=metadata_cache)
+        ),
+    )
+
+
+class SchemaHandler:
+    """
+    Serve schema commands with canned responses (optionally after a delay),
+    recording the name of each command received.
+    """
+
+    def __init__(self, *, delay_s: float = 0.0) -> None:
+        self.delay_s = delay_s
+        self.command_names: list[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: Request) -> Response:
+        ((command_name, _),) = request.get_json().items()
+        with self._lock:
+            self.command_names.append(command_name)
+        time.sleep(self.delay_s)
+        response: dict[str, Any]
+        if command_name == "listTables":
+            response = {
+                "status": {
+                    "tables": [{"name": TABLE_NAME, "definition": TABLE_DEFINITION}]
+                }
+            }
+        elif command_name == "listIndexes":
+            response = {"status": {"indexes": ["x_index"]}}
+        elif command_name in {"createIndex", "dropIndex"}:
+            response = {"status": {"ok": 1}}
+        else:
+            raise ValueError(f"Unexpected command {command_name}")
+        return Response(json.dumps(response), content_type="application/json")
+
+
+def _serve(httpserver: HTTPServer, handler: SchemaHandler) -> None:
+    for path in (f"/{BASE_PATH}/{KEYSPACE}", f"/{BASE_PATH}/{KEYSPACE}/{TABLE_NAME}"):
+        httpserver.expect_request(
+            path,
+            method=HttpMethod.POST,
+        ).respond_with_handler(handler)
+
+
+class TestMetadataCache:
+    @pytest.mark.describe("test of metadata cache, hits and invalidation by DDL")
+    def test_metadata_cache_sync(
+        self,
+        httpserver: HTTPServer,
+        metadata_cache: MetadataCache,
+        mock_database: Database,
+    ) -> None:
+        handler = SchemaHandler()
+        _serve(httpserver, handler)
+        table = mock_database.get_table(TABLE_NAME)
+
+        definition = table.definition()
+        assert table.definition() == definition
+        # same listTables command: served from the cache
+        assert [td.name for td in mock_database.list_tables()] == [TABLE_NAME]
+        assert table.list_index_names() == ["x_index"]
+        assert table.list_index_names() == ["x_index"]
+        assert handler.command_names == ["listTables", "listIndexes"]
+        stats = metadata_cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (3, 2, 2)
+
+        # a schema change through any object of the database invalidates
+        table.create_index("x_index", column="x")
+        assert metadata_cache.stats().entries == 0
+        table.definition()
+        mock_database.drop_table_index("x_index")
+        table.list_index_names()
+        assert handler.command_names[2:] == [
+            "createIndex",
+            "listTables",
+            "dropIndex",
+            "listIndexes",
+        ]
+
+        metadata_cache.invalidate(api_endpoint=httpserver.url_for("/"))
+        table.definition()
+        assert handler.command_names[-1] == "listTables"
+
+        # entries are never shared across different credentials
+        other_database = mock_database.with_options(token="AstraCS:other_token")
+        other_database.get_table(TABLE_NAME).definition()
+        assert handler.command_names[-2:] == ["listTables", "listTables"]
+        table.definition()
+        assert len(handler.command_names) == 8
+
+    @pytest.mark.describe("test of metadata cache, concurrent misses from threads")
+    def test_metadata_cache_threads(
+        self,
+        httpserver: HTTPServer,
+        metadata_cache: MetadataCache,
+        mock_database: Database,
+    ) -> None:
+        handler = SchemaHandler(delay_s=0.3)
+        _serve(httpserver, handler)
+        table = mock_database.get_table(TABLE_NAME)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            definitions = list(executor.map(lambda _: table.definition(), range(8)))
+        assert all(definition == definitions[0] for definition in definitions)
+        assert handler.command_names == ["listTables"]
+        stats = metadata_cache.stats()
+        assert stats.misses == 1
+        assert stats.hits + stats.deduplicated == 7
+
+    @pytest.mark.describe("test of metadata cache, concurrent misses, async")
+    async def test_metadata_cache_async(
+        self,
+        httpserver: HTTPServer,
+        metadata_cache: MetadataCache,
+        mock_database: Database,
+    ) -> None:
+        handler = SchemaHandler()
+        _serve(httpserver, handler)
+        adatabase = mock_database.to_async()
+        atable = adatabase.get_table(TABLE_NAME)
+        definitions = await asyncio.gather(
+            *(atable.definition() for _ in range(10)),
+            adatabase.list_tables(),
+        )
+        assert handler.command_names == ["listTables"]
+        assert metadata_cache.stats().deduplicated == 10
+        assert definitions[0] == definitions[9]
+
+        await atable.create_index("x_index", column="x")
+        await atable.definition()
+        assert handler.command_names == ["listTables", "createIndex", "listTables"]
+
+    @pytest.mark.describe("test of metadata cache, async load cancelled in flight")
+    async def test_metadata_cache_async_cancellation(
+        self,
+        metadata_cache: MetadataCache,
+    ) -> None:
+        loads: list[int] = []
+
+        async def _loader() -> dict[str, Any]:
+            loads.append(len(loads))
+            await asyncio.sleep(0.2)
+            return {"status": {"load": len(loads)}}
+
+        def _get() -> Any:
+            return metadata_cache._async_get_or_load(
+                ("endpoint", "url", "payload"),
+                loader=_loader,
+                timeout_s=2,
+                timeout_exception=lambda: DataAPITimeoutException(
+                    text="timeout",
+                    timeout_type="generic",
+                    endpoint=None,
+                    raw_payload=None,
+                ),
+            )
+
+        leader = asyncio.ensure_future(_get())
+        await asyncio.sleep(0.05)
+        waiters = [asyncio.ensure_future(_get()) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        leader.cancel()
+        # the waiters, not cancelled themselves, take over the load
+        responses = await asyncio.gather(*waiters)
+        assert leader.cancelled()
+        assert responses == [{"status": {"load": 2}}] * 3
+        assert loads == [0, 1]
@@ -19,11 +19,13 @@ Unit tests for the event-observing API
 from __future__ import annotations
 
 import json
+import time
 from typing import Any
 
 import httpx
 import pytest
 from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
 
 from astrapy import DataAPIClient
 from astrapy.admin.admin import (
@@ -32,6 +34,8 @@ from astrapy.admin.admin import (
 )
 from astrapy.api_options import APIOptions, DevOpsAPIURLOptions
 from astrapy.event_observers import (
+    InMemorySpanExporter,
+    MetricsObserver,
     ObservableError,
     ObservableEvent,
     ObservableEventType,
@@ -39,9 +43,18 @@ from astrapy.event_observers import (
     ObservableResponse,
     ObservableWarning,
     Observer,
+    OTLPSpanExporter,
+    PrometheusObserver,
+    SlowOperationObserver,
+    SpanStatus,
+    TracingObserver,
     event_collector,
 )
-from astrapy.exceptions import DataAPIResponseException
+from astrapy.exceptions import (
+    CollectionInsertManyException,
+    DataAPIResponseException,
+    DataAPITimeoutException,
+)
 from astrapy.exceptions.error_descriptors import (
     DataAPIErrorDescriptor,
     DataAPIWarningDescriptor,
@@ -231,6 +244,448 @@ class TestObservingEvents:
         assert isinstance(ev_list[3], ObservableError)
         assert ev_list[3].error == DataAPIErrorDescriptor({"title": "Error!"})
 
+    @pytest.mark.describe("test of measurements in the emitted events, sync")
+    def test_eventobservers_measurements_sync(self, httpserver: HTTPServer) -> None:
+        root_endpoint = httpserver.url_for("/")
+
+        ev_list: list[ObservableEvent] = []
+        my_obs = Observer.from_event_list(ev_list)
+        metrics = MetricsObserver()
+        api_options = APIOptions(
+            event_observers={"test": my_obs, "metrics": metrics},
+        )
+
+        client = DataAPIClient(environment="other", api_options=api_options)
+        database = client.get_database(root_endpoint, keyspace="xkeyspace")
+        collection = database.get_collection("xcollt")
+        expected_url = "/v1/xkeyspace/xcollt"
+        response_dict = {"data": {"document": {"_id": "x"}}}
+        for _ in range(3):
+            httpserver.expect_oneshot_request(
+                expected_url,
+                method=HttpMethod.POST,
+            ).respond_with_json(response_dict)
+            collection.find_one({"_id": "x"})
+
+        assert len(ev_list) == 6
+        rq_evt, rs_evt = ev_list[0], ev_list[1]
+        assert isinstance(rq_evt, ObservableRequest)
+        assert isinstance(rs_evt, ObservableResponse)
+        assert rq_evt.command_name == "findOne"
+        assert rq_evt.payload_size == len((rq_evt.payload or "").encode())
+        assert rq_evt.encode_duration_s is not None
+        assert rs_evt.command_name == "findOne"
+        assert rs_evt.started_at == rq_evt.started_at
+        assert rs_evt.duration_s is not None and rs_evt.duration_s > 0
+        assert rs_evt.decode_duration_s is not None
+        assert rs_evt.payload_size == rq_evt.payload_size
+        assert rs_evt.response_size == len((rs_evt.body or "").encode())
+
+        # an HTTP error: the response is not decoded
+        httpserver.expect_oneshot_request(
+            expected_url,
+            method=HttpMethod.POST,
+        ).respond_with_data("Nope", status=503)
+        with pytest.raises(httpx.HTTPStatusError):
+            collection.find_one({"_id": "x"})
+        assert isinstance(ev_list[-1], ObservableResponse)
+        assert ev_list[-1].status_code == 503
+        assert ev_list[-1].decode_duration_s is None
+        assert ev_list[-1].duration_s is not None
+
+        find_metrics = metrics.get_metrics()["findOne"]
+        assert find_metrics.request_count == 4
+        assert find_metrics.error_count == 1
+        assert find_metrics.latency.count == 4
+        assert find_metrics.bytes_received == sum(
+            ev.response_size or 0
+            for ev in ev_list
+            if isinstance(ev, ObservableResponse)
+        )
+
+    @pytest.mark.describe("test of measurements in the emitted events, async")
+    async def test_eventobservers_measurements_async(
+        self, httpserver: HTTPServer
+    ) -> None:
+        root_endpoint = httpserver.url_for("/")
+
+        metrics = MetricsObserver()
+        api_options = APIOptions(event_observers={"metrics": metrics})
+
+        client = DataAPIClient(environment="other", api_options=api_options)
+        adatabase = client.get_async_database(root_endpoint, keyspace="xkeyspace")
+        acollection = adatabase.get_collection("xcollt")
+        httpserver.expect_oneshot_request(
+            "/v1/xkeyspace/xcollt",
+            method=HttpMethod.POST,
+        ).respond_with_json({"status": {"insertedIds": ["x"]}})
+        await acollection.insert_one({"_id": "x"})
+        httpserver.expect_oneshot_request(
+            "/v1/xkeyspace",
+            method=HttpMethod.POST,
+        ).respond_with_json({"status": {"collections": []}})
+        await adatabase.list_collection_names()
+
+        summary = metrics.summary()
+        assert set(summary.keys()) == {"insertOne", "findCollections"}
+        assert summary["insertOne"]["request_count"] == 1
+        assert summary["insertOne"]["bytes_sent"] > 0
+        assert summary["findCollections"]["max_s"] is not None
+
+    @pytest.mark.describe("test of the prometheus observer on requests, sync")
+    def test_eventobservers_prometheus_sync(self, httpserver: HTTPServer) -> None:
+        root_endpoint = httpserver.url_for("/")
+
+        prom = PrometheusObserver()
+        api_options = APIOptions(event_observers={"prometheus": prom})
+
+        client = DataAPIClient(environment="other", api_options=api_options)
+        database = client.get_database(root_endpoint, keyspace="xkeyspace")
+        table = database.get_table("xtable")
+        httpserver.expect_oneshot_request(
+            "/v1/xkeyspace/xtable",
+            method=HttpMethod.POST,
+        ).respond_with_json(
+            {
+                "data": {"document": None},
+                "errors": [{"errorCode": "E_CODE", "message": "m"}],
+            }
+        )
+        with pytest.raises(DataAPIResponseException):
+            table.find_one({"id": 1})
+        httpserver.expect_oneshot_request(
+            "/v1/xkeyspace",
+            method=HttpMethod.POST,
+        ).respond_with_json({"status": {"tables": []}})
+        database.list_table_names()
+
+        lines = prom.render().split("\n")
+        tbl_labels = 'command="findOne",keyspace="xkeyspace",target="xtable"'
+        db_labels = 'command="listTables",keyspace="xkeyspace",target=""'
+        assert f"astrapy_requests_total{{{tbl_labels}}} 1" in lines
+        assert (
+            f'astrapy_api_errors_total{{{tbl_labels},error_code="E_CODE"}} 1' in lines
+        )
+        assert f"astrapy_requests_in_flight{{{tbl_labels}}} 0" in lines
+        assert f"astrapy_requests_total{{{db_labels}}} 1" in lines
+        assert f"astrapy_request_duration_seconds_count{{{db_labels}}} 1" in lines
+
+    @pytest.mark.describe("test of the prometheus observer on request timeouts, sync")
+    def test_eventobservers_prometheus_timeout_sync(
+        self, httpserver: HTTPServer
+    ) -> None:
+        root_endpoint = httpserver.url_for("/")
+
+        prom = PrometheusObserver()
+        api_options = APIOptions(event_observers={"prometheus": prom})
+
+        client = DataAPIClient(environment="other", api_options=api_options)
+        database = client.get_database(root_endpoint, keyspace="xkeyspace")
+        table = database.get_table("xtable")
+
+        def _slow_handler(request: Request) -> Response:
+            time.sleep(0.5)
+            return Response(json.dumps({"data": {"document": None}}))
+
+        httpserver.expect_oneshot_request(
+            "/v1/xkeyspace/xtable",
+            method=HttpMethod.POST,
+        ).respond_with_handler(_slow_handler)
+        with pytest.raises(DataAPITimeoutException):
+            table.find_one({"id": 1}, request_timeout_ms=100)
+
+        lines = prom.render().split("\n")
+        tbl_labels = 'command="findOne",keyspace="xkeyspace",target="xtable"'
+        # a request with no response is not in flight once it has timed out
+        assert f"astrapy_requests_in_flight{{{tbl_labels}}} 0" in lines
+        assert not any(line.startswith("astrapy_requests_total") for line in lines)
+
+    @pytest.mark.describe("test of tracing spans for multi-request operations, sync")
+    def test_eventobservers_tracing_sync(self, httpserver: HTTPServer) -> None:
+        root_endpoint = httpserver.url_for("/")
+
+        def _handler(request: Request) -> Response:
+            payload = json.loads(request.data)
+            if "insertMany" in payload:
+                documents = payload["insertMany"]["documents"]
+                return Response(
+                    json.dumps(
+                        {
+                            "status": {
+                                "documentResponses": [
+                                    {"_id": doc["_id"], "status": "OK"}
+                                    for doc in documents
+                                ]
+                            }
+                        }
+                    ),
+                    content_type="application/json",
+                )
+            if "findOne" in payload:
+                return Response(
+                    json.dumps({"data": {"document": {"_id": "first"}}}),
+                    content_type="application/json",
+                )
+            # a find: two pages
+            page_state = payload["find"].get("options", {}).get("pageState")
+            return Response(
+                json.dumps(
+                    {
+                        "data": {
+                            "documents": [{"_id": page_state or "first"}],
+                            "nextPageState": None if page_state else "p2",
+                        }
+                    }
+                ),
+                content_type="application/json",
+            )
+
+        httpserver.expect_request(
+            "/v1/xkeyspace/xcollt",
+            method=HttpMethod.POST,
+        ).respond_with_handler(_handler)
+
+        exporter = InMemorySpanExporter()
+        api_options = APIOptions(
+            event_observers={"tracing": TracingObserver(exporter)},
+        )
+        client = DataAPIClient(environment="other", api_options=api_options)
+        database = client.get_database(root_endpoint, keyspace="xkeyspace")
+        collection = database.get_collection("xcollt")
+
+        # concurrent chunks are issued by worker threads
+        collection.insert_many(
+            [{"_id": i} for i in range(5)],
+            chunk_size=2,
+            concurrency=3,
+        )
+        im_parent, *im_children = exporter.get_finished_spans()
+        assert im_parent.name == "insert_many"
+        assert im_parent.attributes["astrapy.request_count"] == 3
+        assert sorted(
+            child.attributes["astrapy.chunk_index"] for child in im_children
+        ) == [0, 1, 2]
+        for child in im_children:
+            assert child.parent_span_id == im_parent.span_id
+            assert child.name == "insertMany"
+            assert child.attributes["astrapy.keyspace"] == "xkeyspace"
+            assert child.attributes["astrapy.target"] == "xcollt"
+            assert child.status == SpanStatus.OK
+
+        # a cursor scan is an operation, ending with its last page
+        exporter.clear()
+        assert len(collection.find({}).to_list()) == 2
+        find_parent, *find_children = exporter.get_finished_spans()
+        assert find_parent.name == "find"
+        assert [child.attributes["astrapy.page_number"] for child in find_children] == [
+            1,
+            2,
+        ]
+        assert {child.parent_span_id for child in find_children} == {
+            find_parent.span_id
+        }
+
+        # a single-request method is a standalone span
+        exporter.clear()
+        collection.find_one({})
+        (fo_span,) = exporter.get_finished_spans()
+        assert fo_span.name == "findOne"
+        assert fo_span.parent_span_id is None
+
+    @pytest.mark.describe("test of tracing spans for multi-request operations, async")
+    async def test_eventobservers_tracing_async(self, httpserver: HTTPServer) -> None:
+        root_endpoint = httpserver.url_for("/")
+
+        def _handler(request: Request) -> Response:
+            documents = json.loads(request.data)["insertMany"]["documents"]
+            if documents[0]["_id"] == 2:
+                errors = [{"errorCode": "E_CODE", "message": "Chunk failed."}]
+                return Response(
+                    json.dumps({"status": {"documentResponses": []}, "errors": errors}),
+                    content_type="application/json",
+                )
+            doc_responses = [{"_id": doc["_id"], "status": "OK"} for doc in documents]
+            return Response(
+                json.dumps({"status": {"documentResponses": doc_responses}}),
+                content_type="application/json",
+            )
+
+        httpserver.expect_request(
+            "/v1/xkeyspace/xcollt",
+            method=HttpMethod.POST,
+        ).respond_with_handler(_handler)
+
+        exporter = InMemorySpanExporter()
+        api_options = APIOptions(
+            event_observers={"tracing": TracingObserver(exporter)},
+        )
+        client = DataAPIClient(environment="other", api_options=api_options)
+        adatabase = client.get_async_database(root_endpoint, keyspace="xkeyspace")
+        acollection = adatabase.get_collection("xcollt")
+
+        with pytest.raises(CollectionInsertManyException):
+            await acollection.insert_many(
+                [{"_id": i} for i in range(6)],
+                chunk_size=2,
+                concurrency=3,
+            )
+        im_parent, *im_children = exporter.get_finished_spans()
+        assert im_parent.name == "insert_many"
+        assert im_parent.status == SpanStatus.ERROR
+        children_by_chunk = {
+            child.attributes["astrapy.chunk_index"]: child for child in im_children
+        }
+        assert set(children_by_chunk.keys()) == {0, 1, 2}
+        assert children_by_chunk[0].status == SpanStatus.OK
+        assert children_by_chunk[1].status == SpanStatus.ERROR
+        assert children_by_chunk[1].attributes["astrapy.error_codes"] == ["E_CODE"]
+        assert {child.trace_id for child in im_children} == {im_parent.trace_id}
+
+    @pytest.mark.describe("test of the slow-operation log, sync")
+    def test_eventobservers_slow_operations_sync(self, httpserver: HTTPServer) -> None:
+        root_endpoint = httpserver.url_for("/")
+
+        def _handler(request: Request) -> Response:
+            page_state = json.loads(request.data)["find"]["options"].get("pageState")
+            return Response(
+                json.dumps(
+                    {
+                        "data": {
+                            "documents": [{"_id": page_state or "first"}],
+                            "nextPageState": None if page_state else "p2",
+                        }
+                    }
+                ),
+                content_type="application/json",
+            )
+
+        httpserver.expect_request(
+            "/v1/xkeyspace/xcollt",
+            method=HttpMethod.POST,
+        ).respond_with_handler(_handler)
+
+        slow_log = SlowOperationObserver(threshold_s=0, request_threshold_s=10)
+        api_options = APIOptions(
+            event_observers={"slow": slow_log},
+        )
+        client = DataAPIClient(environment="other", api_options=api_options)
+        database = client.get_database(root_endpoint, keyspace="xkeyspace")
+        collection = database.get_collection("xcollt")
+
+        collection.find({"secret": "s3cr3t"}, limit=10).to_list()
+        (record,) = slow_log.get_records()
+        assert record.kind == "operation"
+        assert record.name == "find"
+        assert record.keyspace == "xkeyspace"
+        assert record.target == "xcollt"
+        assert record.command == "find"
+        assert record.filter_shape == {"secret": "?"}
+        assert record.request_count == 2
+        assert record.pages == 2
+        assert record.bytes_in > 0
+        assert record.duration_s >= record.network_s > 0
+
+    @pytest.mark.describe("test of the OTLP span exporter, sync")
+    def test_eventobservers_otlp_exporter_sync(self, httpserver: HTTPServer) -> None:
+        root_endpoint = httpserver.url_for("/")
+        received: list[dict[str, Any]] = []
+
+        def _otlp_handler(request: Request) -> Response:
+            received.append(json.loads(request.data))
+            return Response("{}", content_type="application/json")
+
+        httpserver.expect_request(
+            "/v1/traces",
+            method=HttpMethod.POST,
+        ).respond_with_handler(_otlp_handler)
+        httpserver.expect_request(
+            "/v1/xkeyspace/xcollt",
+            method=HttpMethod.POST,
+        ).respond_with_json({"status": {"deletedCount": 3}})
+
+        otlp_exporter = OTLPSpanExporter(
+            httpserver.url_for("/v1/traces"),
+            export_interval_s=60,
+        )
+        api_options = APIOptions(
+            event_observers={"tracing": TracingObserver(otlp_exporter)},
+        )
+        client = DataAPIClient(environment="other", api_options=api_options)
+        database = client.get_database(root_endpoint, keyspace="xkeyspace")
+        collection = database.get_collection("xcollt")
+        collection.delete_many({})
+
+        assert otlp_exporter.flush(timeout_s=10)
+        otlp_exporter.shutdown()
+        spans = [
+            span
+            for request_body in received
+            for resource_spans in request_body["resourceSpans"]
+            for scope_spans in resource_spans["scopeSpans"]
+            for span in scope_spans["spans"]
+        ]
+        assert [span["name"] for span in spans] == ["delete_many", "deleteMany"]
+        assert spans[1]["parentSpanId"] == spans[0]["spanId"]
+
+    @pytest.mark.describe("test of declared observer interests, sync")
+    def test_eventobservers_declared_interests_sync(
+        self, httpserver: HTTPServer
+    ) -> None:
+        root_endpoint = httpserver.url_for("/")
+
+        class CountingObserver(Observer):
+            def __init__(self) -> None:
+                self.received: list[ObservableEvent] = []
+
+            def receive(
+                self,
+                event: ObservableEvent,
+                sender: Any = None,
+                function_name: str | None = None,
+                request_id: str | None = None,
+            ) -> None:
+                self.received.append(event)
+
+        no_body_obs = CountingObserver()
+        no_body_obs.event_types = {ObservableEventType.RESPONSE}
+        no_body_obs.needs_body = False
+        api_options = APIOptions(event_observers={"no_body": no_body_obs})
+
+        client = DataAPIClient(environment="other", api_options=api_options)
+        database = client.get_database(root_endpoint, keyspace="xkeyspace")
+        collection = database.get_collection("xcollt")
+        httpserver.expect_oneshot_request(
+            "/v1/xkeyspace/xcollt",
+            method=HttpMethod.POST,
+        ).respond_with_json(
+            {"data": {"document": None}, "status": {"warnings": [{"title": "W"}]}}
+        )
+        collection.find_one()
+
+        # only the events of interest are received, with no body
+        assert len(no_body_obs.received) == 1
+        rs_evt = no_body_obs.received[0]
+        assert isinstance(rs_evt, ObservableResponse)
+        assert rs_evt.body is None
+        assert rs_evt.response_size is not None and rs_evt.response_size > 0
+
+        # an observer needing the bodies gets them (and so do all others)
+        body_obs = CountingObserver()
+        b_collection = collection.with_options(
+            api_options=APIOptions(event_observers={"body": body_obs}),
+        )
+        httpserver.expect_oneshot_request(
+            "/v1/xkeyspace/xcollt",
+            method=HttpMethod.POST,
+        ).respond_with_json({"data": {"document": None}})
+        b_collection.find_one()
+        assert [ev.event_type for ev in body_obs.received] == [
+            ObservableEventType.REQUEST,
+            ObservableEventType.RESPONSE,
+        ]
+        assert isinstance(no_body_obs.received[-1], ObservableResponse)
+        assert no_body_obs.received[-1].body is not None
+
     @pytest.mark.describe("test of admin classes attached event observers, sync")
     def test_adminclasses_attached_eventobservers_sync(
         self, httpserver: HTTPServer
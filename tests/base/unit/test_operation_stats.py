@@ -0,0 +1,153 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from astrapy import DataAPIClient
+from astrapy.exceptions import CollectionDeleteManyException
+from astrapy.results import OperationStats
+from astrapy.utils.operation_stats import collecting_stats, timed_slot
+from astrapy.utils.request_tools import HttpMethod
+
+
+def _handler(request: Request) -> Response:
+    payload = json.loads(request.data)
+    response: dict[str, object]
+    if "insertMany" in payload:
+        documents = payload["insertMany"]["documents"]
+        response = {
+            "status": {
+                "documentResponses": [
+                    {"_id": doc["_id"], "status": "OK"} for doc in documents
+                ]
+            }
+        }
+    elif "insertOne" in payload:
+        response = {
+            "status": {"insertedIds": [payload["insertOne"]["document"]["_id"]]}
+        }
+    elif "deleteMany" in payload:
+        response = {
+            "status": {"deletedCount": 0},
+            "errors": [{"errorCode": "E_CODE", "message": "Failed."}],
+        }
+    else:
+        page_state = payload["find"]["options"].get("pageState")
+        response = {
+            "data": {
+                "documents": [{"_id": page_state or "first"}],
+                "nextPageState": None if page_state else "p2",
+            },
+            "status": {
+                "warnings": [{"errorCode": "W_CODE", "message": "Warned."}],
+            },
+        }
+    return Response(json.dumps(response), content_type="application/json")
+
+
+class TestOperationStats:
+    @pytest.mark.describe("test of the stats of insert_many and cursors, sync")
+    def test_operation_stats_sync(self, httpserver: HTTPServer) -> None:
+        root_endpoint = httpserver.url_for("/")
+        httpserver.expect_request(
+            "/v1/xkeyspace/xcollt",
+            method=HttpMethod.POST,
+        ).respond_with_handler(_handler)
+        client = DataAPIClient(environment="other")
+        database = client.get_database(root_endpoint, keyspace="xkeyspace")
+        collection = database.get_collection("xcollt")
+
+        im_result = collection.insert_many(
+            [{"_id": i} for i in range(5)],
+            chunk_size=2,
+            concurrency=2,
+        )
+        im_stats = im_result.stats
+        assert im_stats is not None
+        assert im_stats.requests == 3
+        assert im_stats.pages == 0
+        assert sorted(im_stats.chunk_sizes) == [1, 2, 2]
+        assert im_stats.bytes_out > 0
+        assert im_stats.bytes_in > 0
+        assert 0 < im_stats.max_latency_s <= im_stats.total_latency_s
+        assert im_stats.mean_latency_s is not None
+        assert im_stats.queued_s >= 0
+
+        cursor = collection.find({})
+        assert cursor.stats.requests == 0
+        assert len(cursor.to_list()) == 2
+        assert cursor.stats.requests == 2
+        assert cursor.stats.pages == 2
+        assert [wrn.error_code for wrn in cursor.stats.warnings] == [
+            "W_CODE",
+            "W_CODE",
+        ]
+        cursor.rewind()
+        assert cursor.stats.requests == 0
+
+        # stats of a failed operation go with the partial result
+        with pytest.raises(CollectionDeleteManyException) as exc_info:
+            collection.delete_many({})
+        fail_stats = exc_info.value.partial_result.stats
+        assert fail_stats is not None
+        assert fail_stats.requests == 1
+        assert fail_stats.pages == 1
+
+        # single-request methods have no stats
+        assert collection.insert_one({"_id": "x"}).stats is None
+
+    @pytest.mark.describe("test of the stats of insert_many, async")
+    async def test_operation_stats_async(self, httpserver: HTTPServer) -> None:
+        root_endpoint = httpserver.url_for("/")
+        httpserver.expect_request(
+            "/v1/xkeyspace/xcollt",
+            method=HttpMethod.POST,
+        ).respond_with_handler(_handler)
+        client = DataAPIClient(environment="other")
+        adatabase = client.get_async_database(root_endpoint, keyspace="xkeyspace")
+        acollection = adatabase.get_collection("xcollt")
+
+        im_result = await acollection.insert_many(
+            [{"_id": i} for i in range(7)],
+            chunk_size=2,
+            concurrency=2,
+        )
+        im_stats = im_result.stats
+        assert im_stats is not None
+        assert im_stats.requests == 4
+        assert sorted(im_stats.chunk_sizes) == [1, 2, 2, 2]
+
+        cursor = acollection.find({})
+        assert len(await cursor.to_list()) == 2
+        assert cursor.stats.pages == 2
+
+    @pytest.mark.describe("test of the recording of waits for concurrency slots")
+    async def test_operation_stats_timed_slot(self) -> None:
+        stats = OperationStats()
+        semaphore = asyncio.Semaphore(1)
+
+        async def _hold() -> None:
+            async with timed_slot(semaphore):
+                await asyncio.sleep(0.05)
+
+        with collecting_stats(stats):
+            await asyncio.gather(_hold(), _hold())
+        assert stats.queued_s >= 0.04
@@ -0,0 +1,142 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from astrapy import DataAPIClient
+from astrapy.profiling import ProfilePhase, profiling
+from astrapy.utils.profiling import _NOT_PROFILING, profile_phase
+from astrapy.utils.request_tools import HttpMethod
+
+
+def _handler(request: Request) -> Response:
+    payload = json.loads(request.data)
+    response: dict[str, object]
+    if "insertMany" in payload:
+        documents = payload["insertMany"]["documents"]
+        response = {
+            "status": {
+                "documentResponses": [
+                    {"_id": doc["_id"], "status": "OK"} for doc in documents
+                ]
+            }
+        }
+    elif "find" in payload and "xtable" in request.path:
+        response = {
+            "data": {
+                "documents": [{"p": 1, "d": "2025-01-01"}, {"p": 2, "d": None}],
+                "nextPageState": None,
+            },
+            "status": {
+                "projectionSchema": {
+                    "p": {"type": "int"},
+                    "d": {"type": "date"},
+                },
+            },
+        }
+    else:
+        page_state = payload["find"]["options"].get("pageState")
+        response = {
+            "data": {
+                "documents": [{"_id": page_state or "first", "v": {"$date": 0}}],
+                "nextPageState": None if page_state else "p2",
+            }
+        }
+    return Response(json.dumps(response), content_type="application/json")
+
+
+class TestProfiling:
+    @pytest.mark.describe("test of the no-op phases outside of profiling")
+    def test_profiling_off(self) -> None:
+        assert profile_phase(ProfilePhase.ENCODE, command="find") is _NOT_PROFILING
+        with profiling():
+            assert (
+                profile_phase(ProfilePhase.ENCODE, command="find") is not _NOT_PROFILING
+            )
+        assert profile_phase(ProfilePhase.ENCODE, command="find") is _NOT_PROFILING
+
+    @pytest.mark.describe("test of the profiling of requests, sync")
+    def test_profiling_sync(self, httpserver: HTTPServer) -> None:
+        root_endpoint = httpserver.url_for("/")
+        for path in ["/v1/xkeyspace/xcollt", "/v1/xkeyspace/xtable"]:
+            httpserver.expect_request(
+                path,
+                method=HttpMethod.POST,
+            ).respond_with_handler(_handler)
+        client = DataAPIClient(environment="other")
+        database = client.get_database(root_endpoint, keyspace="xkeyspace")
+        collection = database.get_collection("xcollt")
+        table = database.get_table("xtable")
+
+        with profiling() as profile:
+            assert len(collection.find({}).to_list()) == 2
+            collection.insert_many(
+                [{"_id": i} for i in range(5)],
+                chunk_size=2,
+                concurrency=2,
+            )
+            rows = table.find({}).to_list()
+        assert [row["p"] for row in rows] == [1, 2]
+
+        by_command = profile.by_command()
+        assert set(by_command.keys()) == {"find", "insertMany"}
+        # two pages for the collection, one for the table
+        assert by_command["find"][ProfilePhase.NETWORK].count == 3
+        assert by_command["find"][ProfilePhase.DECODE].count == 3
+        assert by_command["find"][ProfilePhase.POSTPROCESS].count == 3
+        assert by_command["find"][ProfilePhase.PREPROCESS].count == 3
+        # the insertions, from the worker threads
+        assert by_command["insertMany"][ProfilePhase.ENCODE].count == 3
+        assert by_command["insertMany"][ProfilePhase.NETWORK].count == 3
+
+        phases = profile.phases()
+        assert phases[ProfilePhase.NETWORK].count == 6
+        assert all(stats.wall_s >= 0 for stats in phases.values())
+        assert sum(stats.wall_s for stats in phases.values()) > 0
+        assert profile.ended_at is not None
+        assert profile.summary()["phases"]["network"]["count"] == 6
+        report = profile.report()
+        assert "command: insertMany" in report
+        assert "postprocess" in report
+
+    @pytest.mark.describe("test of the profiling of requests, async")
+    async def test_profiling_async(self, httpserver: HTTPServer) -> None:
+        root_endpoint = httpserver.url_for("/")
+        httpserver.expect_request(
+            "/v1/xkeyspace/xcollt",
+            method=HttpMethod.POST,
+        ).respond_with_handler(_handler)
+        client = DataAPIClient(environment="other")
+        adatabase = client.get_async_database(root_endpoint, keyspace="xkeyspace")
+        acollection = adatabase.get_collection("xcollt")
+
+        with profiling() as outer_profile:
+            await acollection.insert_many(
+                [{"_id": i} for i in range(5)],
+                chunk_size=2,
+                concurrency=3,
+            )
+            with profiling() as inner_profile:
+                assert len(await acollection.find({}).to_list()) == 2
+
+        assert set(outer_profile.by_command().keys()) == {"insertMany"}
+        assert outer_profile.phases()[ProfilePhase.NETWORK].count == 3
+        assert set(inner_profile.by_command().keys()) == {"find"}
+        assert inner_profile.phases()[ProfilePhase.POSTPROCESS].count == 2
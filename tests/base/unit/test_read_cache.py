@@ -0,0 +1,282 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from astrapy import Collection, Database, Table
+from astrapy.api_options import APIOptions, ReadCache
+from astrapy.exceptions import DataAPIResponseException
+from astrapy.utils.api_options import FullAPIOptions, defaultAPIOptions
+from astrapy.utils.read_cache import MAX_TRACKED_GENERATION_URLS
+from astrapy.utils.request_tools import HttpMethod
+
+from ..conftest import DefaultCollection, DefaultTable
+
+BASE_PATH = "v1"
+KEYSPACE = "keyspace"
+COLLECTION_NAME = "collection"
+TABLE_NAME = "table"
+
+PROJECTION_SCHEMA = {"_id": {"type": "text"}, "v": {"type": "int"}}
+
+
+def _cached_api_options(read_cache: ReadCache) -> FullAPIOptions:
+    return defaultAPIOptions(environment="other").with_override(
+        APIOptions(read_cache=read_cache)
+    )
+
+
+@pytest.fixture
+def read_cache() -> ReadCache:
+    return ReadCache()
+
+
+@pytest.fixture
+def mock_collection(httpserver: HTTPServer, read_cache: ReadCache) -> DefaultCollection:
+    coll: DefaultCollection = Collection(
+        database=Database(
+            api_endpoint=httpserver.url_for("/"),
+            keyspace=KEYSPACE,
+            api_options=defaultAPIOptions(environment="other"),
+        ),
+        name=COLLECTION_NAME,
+        keyspace=None,
+        api_options=_cached_api_options(read_cache),
+    )
+    return coll
+
+
+@pytest.fixture
+def mock_table(httpserver: HTTPServer, read_cache: ReadCache) -> DefaultTable:
+    table: DefaultTable = Table(
+        database=Database(
+            api_endpoint=httpserver.url_for("/"),
+            keyspace=KEYSPACE,
+            api_options=defaultAPIOptions(environment="other"),
+        ),
+        name=TABLE_NAME,
+        keyspace=None,
+        api_options=_cached_api_options(read_cache),
+    )
+    return table
+
+
+class CountingHandler:
+    """
+    Serve reads and writes with canned responses, recording the name of each
+    command received. A `{"fail": true}` filter produces an API error.
+    """
+
+    def __init__(self) -> None:
+        self.command_names: list[str] = []
+        self.version = 0
+
+    def __call__(self, request: Request) -> Response:
+        ((command_name, payload),) = request.get_json().items()
+        self.command_names.append(command_name)
+        response: dict[str, Any]
+        if (payload.get("filter") or {}).get("fail"):
+            response = {"errors": [{"errorCode": "BAD_FILTER", "message": "Bad."}]}
+        elif command_name == "findOne":
+            response = {
+                "data": {"document": {"_id": "a", "v": self.version}},
+                "status": {"projectionSchema": PROJECTION_SCHEMA},
+            }
+        elif command_name == "countDocuments":
+            response = {"status": {"count": 10 + self.version}}
+        elif command_name == "estimatedDocumentCount":
+            response = {"status": {"count": 100 + self.version}}
+        elif command_name == "insertOne":
+            self.version += 1
+            response = {"status": {"insertedIds": ["b"]}}
+        elif command_name == "deleteOne":
+            self.version += 1
+            response = {"status": {"deletedCount": -1}}
+        else:
+            raise ValueError(f"Unexpected command {command_name}")
+        return Response(json.dumps(response), content_type="application/json")
+
+
+def _serve(httpserver: HTTPServer, target_name: str, handler: CountingHandler) -> None:
+    httpserver.expect_request(
+        f"/{BASE_PATH}/{KEYSPACE}/{target_name}",
+        method=HttpMethod.POST,
+    ).respond_with_handler(handler)
+
+
+class TestReadCache:
+    @pytest.mark.describe("test of read cache, size bound and TTL")
+    def test_read_cache_eviction(self) -> None:
+        cache = ReadCache(max_bytes=100, ttl_ms=None)
+        for i in range(4):
+            _, generation = cache._lookup(("url", "", f"key{i}"))
+            cache._store(("url", "", f"key{i}"), "x" * 20, 20, generation)
+        # each entry is 20 + 3 + 4 bytes: the first one was evicted
+        assert cache._lookup(("url", "", "key0"))[0] is None
+        assert cache._lookup(("url", "", "key3"))[0] == "x" * 20
+        # entries too large for the cache are not stored
+        cache._store(("url", "", "big"), "x" * 200, 200, 0)
+        assert cache._lookup(("url", "", "big"))[0] is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (1, 6, 1)
+        assert (stats.entries, stats.size_bytes) == (3, 81)
+
+        # a store for a read in flight during an invalidation is discarded
+        _, generation = cache._lookup(("url", "", "late"))
+        cache._invalidate("url")
+        cache._store(("url", "", "late"), "x", 1, generation)
+        assert cache.stats().entries == 0
+        assert cache.stats().invalidations == 3
+
+        ttl_cache = ReadCache(ttl_ms=50)
+        ttl_cache._store(("url", "", "key"), "x", 1, 0)
+        assert ttl_cache._lookup(("url", "", "key"))[0] == "x"
+        time.sleep(0.1)
+        assert ttl_cache._lookup(("url", "", "key"))[0] is None
+        assert ttl_cache.stats().expirations == 1
+
+        with pytest.raises(ValueError):
+            ReadCache(max_bytes=0)
+
+    @pytest.mark.describe("test of read cache, bounded write generations")
+    def test_read_cache_generations(self) -> None:
+        cache = ReadCache(ttl_ms=None)
+        _, generation = cache._lookup(("url", "", "late"))
+        cache._invalidate("url")
+        for i in range(2 * MAX_TRACKED_GENERATION_URLS):
+            cache._invalidate(f"other_url_{i}")
+        assert len(cache._generation_by_url) == MAX_TRACKED_GENERATION_URLS
+        # the write to "url" is not forgotten by dropping it from the map
+        cache._store(("url", "", "late"), "x", 1, generation)
+        assert cache._lookup(("url", "", "late"))[0] is None
+        _, generation = cache._lookup(("url", "", "key"))
+        cache._store(("url", "", "key"), "x", 1, generation)
+        assert cache._lookup(("url", "", "key"))[0] == "x"
+
+        # invalidation of a whole URL prefix
+        _, generation = cache._lookup(("ks/untracked", "", "key"))
+        cache._invalidate_prefix("ks/")
+        assert cache._lookup(("url", "", "key"))[0] == "x"
+        cache._store(("ks/untracked", "", "key"), "x", 1, generation)
+        assert cache._lookup(("ks/untracked", "", "key"))[0] is None
+
+    @pytest.mark.describe("test of read cache, collection reads and invalidation")
+    def test_read_cache_collection(
+        self,
+        httpserver: HTTPServer,
+        read_cache: ReadCache,
+        mock_collection: DefaultCollection,
+    ) -> None:
+        handler = CountingHandler()
+        _serve(httpserver, COLLECTION_NAME, handler)
+
+        assert mock_collection.find_one({"_id": "a"}) == {"_id": "a", "v": 0}
+        assert mock_collection.find_one({"_id": "a"}) == {"_id": "a", "v": 0}
+        assert mock_collection.estimated_document_count() == 100
+        assert mock_collection.estimated_document_count() == 100
+        assert mock_collection.count_documents({}, upper_bound=50) == 10
+        assert mock_collection.count_documents({}, upper_bound=50) == 10
+        # a different payload is a different entry
+        mock_collection.find_one({"_id": "a"}, projection={"v": True})
+        assert handler.command_names == [
+            "findOne",
+            "estimatedDocumentCount",
+            "countDocuments",
+            "findOne",
+        ]
+        stats = read_cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (3, 4, 4)
+
+        # a write invalidates all entries for the collection
+        mock_collection.insert_one({"_id": "b"})
+        assert read_cache.stats().entries == 0
+        assert mock_collection.find_one({"_id": "a"}) == {"_id": "a", "v": 1}
+        assert mock_collection.estimated_document_count() == 101
+
+        # a failing write invalidates as well; errors are not cached
+        with pytest.raises(DataAPIResponseException):
+            mock_collection.delete_one({"fail": True})
+        assert read_cache.stats().entries == 0
+        for _ in range(2):
+            with pytest.raises(DataAPIResponseException):
+                mock_collection.find_one({"fail": True})
+        assert handler.command_names.count("findOne") == 5
+
+        # a copy of the collection shares the cache
+        mock_collection.find_one({"_id": "a"})
+        mock_collection.with_options(api_options=APIOptions()).find_one({"_id": "a"})
+        assert handler.command_names.count("findOne") == 6
+
+        # ... but entries are never shared across different credentials
+        mock_collection.with_options(
+            api_options=APIOptions(token="AstraCS:other_token")
+        ).find_one({"_id": "a"})
+        mock_collection.with_options(embedding_api_key="sk-key").find_one({"_id": "a"})
+        assert handler.command_names.count("findOne") == 8
+        mock_collection.with_options(embedding_api_key="sk-key").find_one({"_id": "a"})
+        assert handler.command_names.count("findOne") == 8
+
+    @pytest.mark.describe("test of read cache, invalidation by schema commands")
+    def test_read_cache_schema_commands(
+        self,
+        httpserver: HTTPServer,
+        read_cache: ReadCache,
+        mock_collection: DefaultCollection,
+    ) -> None:
+        handler = CountingHandler()
+        _serve(httpserver, COLLECTION_NAME, handler)
+        httpserver.expect_request(
+            f"/{BASE_PATH}/{KEYSPACE}",
+            method=HttpMethod.POST,
+        ).respond_with_json({"status": {"ok": 1}})
+        # the database has no read cache attached
+        database = mock_collection.database
+
+        mock_collection.find_one({"_id": "a"})
+        database.drop_collection("another_collection")
+        mock_collection.find_one({"_id": "a"})
+        assert handler.command_names == ["findOne"]
+
+        database.drop_collection(COLLECTION_NAME)
+        assert read_cache.stats().entries == 0
+        mock_collection.find_one({"_id": "a"})
+        assert handler.command_names == ["findOne", "findOne"]
+
+        database.drop_table(COLLECTION_NAME)
+        assert read_cache.stats().invalidations == 2
+
+    @pytest.mark.describe("test of read cache, async table")
+    async def test_read_cache_table_async(
+        self,
+        httpserver: HTTPServer,
+        read_cache: ReadCache,
+        mock_table: DefaultTable,
+    ) -> None:
+        handler = CountingHandler()
+        _serve(httpserver, TABLE_NAME, handler)
+        atable = mock_table.to_async()
+        assert (await atable.find_one({"_id": "a"}) or {})["v"] == 0
+        assert (await atable.find_one({"_id": "a"}) or {})["v"] == 0
+        await atable.delete_one({"_id": "a"})
+        assert (await atable.find_one({"_id": "a"}) or {})["v"] == 1
+        assert handler.command_names == ["findOne", "deleteOne", "findOne"]
+        assert read_cache.stats().invalidations == 1
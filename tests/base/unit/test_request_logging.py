@@ -0,0 +1,115 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from astrapy.exceptions import _TimeoutContext
+from astrapy.utils.request_tools import (
+    log_httpx_request,
+    log_httpx_response,
+    set_logged_body_max_length,
+)
+
+LOGGER_NAME = "astrapy.utils.request_tools"
+LARGE_PAYLOAD = '{"insertMany": {"documents": [' + '{"a": 1},' * 200_000 + "]}}"
+
+
+class _UndecodableResponse(httpx.Response):
+    @property
+    def text(self) -> str:
+        raise AssertionError("The response body should not be decoded.")
+
+
+def _log_request(encoded_payload: str) -> None:
+    log_httpx_request(
+        http_method="POST",
+        full_url="https://domain.com/full/path",
+        request_params={},
+        redacted_request_headers={"Token": "***"},
+        encoded_payload=encoded_payload,
+        timeout_context=_TimeoutContext(request_ms=1000),
+        caller_function_name="my_function",
+    )
+
+
+@pytest.fixture
+def body_max_length() -> Iterator[None]:
+    yield
+    set_logged_body_max_length(None)
+
+
+class TestRequestLogging:
+    @pytest.mark.describe("test of request logging with DEBUG disabled")
+    def test_request_logging_disabled(self, caplog: pytest.LogCaptureFixture) -> None:
+        with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+            _log_request(LARGE_PAYLOAD)
+            log_httpx_response(_UndecodableResponse(200, content=b"{}"))
+        assert caplog.records == []
+
+    @pytest.mark.describe("test of truncated and summarized logged bodies")
+    def test_request_logging_bodies(
+        self, caplog: pytest.LogCaptureFixture, body_max_length: None
+    ) -> None:
+        response = httpx.Response(200, content=b'{"status": {"count": 123}}')
+        with caplog.at_level(logging.DEBUG, logger=LOGGER_NAME):
+            _log_request('{"find": {}}')
+            log_httpx_response(response)
+            set_logged_body_max_length(8)
+            _log_request('{"find": {}}')
+            log_httpx_response(response)
+            set_logged_body_max_length(0)
+            _log_request('{"find": {}}')
+            log_httpx_response(_UndecodableResponse(200, content=b"{}"))
+        messages = [
+            record.getMessage()
+            for record in caplog.records
+            if "payload" in record.getMessage() or "text" in record.getMessage()
+        ]
+        assert messages == [
+            "Request payload: '{\"find\": {}}'",
+            'Response text: \'{"status": {"count": 123}}\'',
+            "Request payload: '{\"find\":...' (12 characters)",
+            "Response text: '{\"status...' (26 characters)",
+            "Request payload: (12 characters)",
+            "Response text: (2 bytes)",
+        ]
+        assert any("overall operation" in rec.getMessage() for rec in caplog.records)
+
+        with pytest.raises(ValueError):
+            set_logged_body_max_length(-1)
+
+    @pytest.mark.describe("microbenchmark of request logging with DEBUG disabled")
+    def test_request_logging_disabled_overhead(self) -> None:
+        logger = logging.getLogger(LOGGER_NAME)
+        previous_level = logger.level
+        logger.setLevel(logging.WARNING)
+        response = httpx.Response(200, content=LARGE_PAYLOAD.encode())
+        num_calls = 2000
+        try:
+            started_at = time.perf_counter()
+            for _ in range(num_calls):
+                _log_request(LARGE_PAYLOAD)
+                log_httpx_response(response)
+            per_request_s = (time.perf_counter() - started_at) / num_calls
+        finally:
+            logger.setLevel(previous_level)
+        # formatting (let alone decoding) the 2-MB bodies would take far longer
+        assert per_request_s < 20e-6
@@ -0,0 +1,280 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import base64
+import gc
+import struct
+import tracemalloc
+from typing import Any
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from astrapy import Database, Table
+from astrapy.cursors import CursorState
+from astrapy.exceptions import CursorException
+from astrapy.utils.api_options import defaultAPIOptions
+from astrapy.utils.request_tools import HttpMethod
+
+from ..conftest import DefaultAsyncTable, DefaultTable
+
+BASE_PATH = "v1"
+KEYSPACE = "keyspace"
+TABLE_NAME = "table"
+PATH_SUFFIX = f"{KEYSPACE}/{TABLE_NAME}"
+
+PROJECTION_SCHEMA = {
+    "id": {"type": "int"},
+    "score": {"type": "double"},
+    "flag": {"type": "boolean"},
+    "name": {"type": "text"},
+    "v": {"type": "vector", "dimension": 2},
+    "tags": {"type": "set", "valueType": "text"},
+}
+
+
+def _binary_vector(floats: list[float]) -> dict[str, str]:
+    packed = struct.pack(f">{'f' * len(floats)}", *floats)
+    return {"$binary": base64.b64encode(packed).decode()}
+
+
+PAGE_0 = {
+    "data": {
+        "documents": [
+            {
+                "id": 1,
+                "score": 0.5,
+                "flag": True,
+                "name": "a",
+                "v": [1.0, 2.0],
+                "tags": ["x"],
+            },
+            {"id": 2, "score": "NaN", "flag": False, "name": "b", "v": None},
+        ],
+        "nextPageState": "ps1",
+    },
+    "status": {"projectionSchema": PROJECTION_SCHEMA},
+}
+PAGE_1 = {
+    "data": {
+        "documents": [
+            {
+                "id": 3,
+                "score": 1.5,
+                "flag": True,
+                "name": "c",
+                "v": _binary_vector([3.0, 4.0]),
+            },
+        ],
+        "nextPageState": None,
+    },
+    "status": {"projectionSchema": PROJECTION_SCHEMA},
+}
+
+
+@pytest.fixture
+def mock_table(httpserver: HTTPServer) -> DefaultTable:
+    base_endpoint = httpserver.url_for("/")
+    table: DefaultTable = Table(
+        database=Database(
+            api_endpoint=base_endpoint,
+            keyspace=KEYSPACE,
+            api_options=defaultAPIOptions(environment="other"),
+        ),
+        name=TABLE_NAME,
+        keyspace=None,
+        api_options=defaultAPIOptions(environment="other"),
+    )
+    return table
+
+
+@pytest.fixture
+def mock_atable(httpserver: HTTPServer, mock_table: DefaultTable) -> DefaultAsyncTable:
+    return mock_table.to_async()
+
+
+def _expect_two_pages(httpserver: HTTPServer) -> None:
+    httpserver.expect_oneshot_request(
+        f"/{BASE_PATH}/{PATH_SUFFIX}",
+        method=HttpMethod.POST,
+    ).respond_with_json(PAGE_0)
+    httpserver.expect_oneshot_request(
+        f"/{BASE_PATH}/{PATH_SUFFIX}",
+        method=HttpMethod.POST,
+    ).respond_with_json(PAGE_1)
+
+
+def _check_numpy_columns(columns: dict[str, Any]) -> None:
+    import numpy as np
+
+    assert list(columns.keys()) == list(PROJECTION_SCHEMA.keys())
+    assert columns["id"].dtype == np.int32
+    assert columns["id"].tolist() == [1, 2, 3]
+    assert columns["score"].dtype == np.float64
+    assert columns["score"][0] == 0.5
+    assert np.isnan(columns["score"][1])
+    assert columns["flag"].tolist() == [True, False, True]
+    assert columns["name"].tolist() == ["a", "b", "c"]
+    assert columns["v"].shape == (3, 2)
+    assert columns["v"][0].tolist() == [1.0, 2.0]
+    assert np.isnan(columns["v"][1]).all()
+    assert columns["v"][2].tolist() == [3.0, 4.0]
+    # set columns are object columns with the usual (filled) astrapy values
+    assert set(columns["tags"][0]) == {"x"}
+    assert len(columns["tags"][1]) == 0
+
+
+class TestTableColumnar:
+    @pytest.mark.describe("test of table cursor to_columns in numpy format, sync")
+    def test_table_cursor_to_columns_numpy_sync(
+        self,
+        httpserver: HTTPServer,
+        mock_table: DefaultTable,
+    ) -> None:
+        pytest.importorskip("numpy")
+        _expect_two_pages(httpserver)
+        cursor = mock_table.find({})
+        columns = cursor.to_columns()
+        _check_numpy_columns(columns)
+        assert cursor.state == CursorState.CLOSED
+        assert cursor.consumed == 3
+
+    @pytest.mark.describe("test of table cursor to_columns in numpy format, async")
+    async def test_table_cursor_to_columns_numpy_async(
+        self,
+        httpserver: HTTPServer,
+        mock_atable: DefaultAsyncTable,
+    ) -> None:
+        pytest.importorskip("numpy")
+        _expect_two_pages(httpserver)
+        cursor = mock_atable.find({})
+        columns = await cursor.to_columns()
+        _check_numpy_columns(columns)
+        assert cursor.state == CursorState.CLOSED
+        assert cursor.consumed == 3
+
+    @pytest.mark.describe("test of table cursor iter_column_batches, sync")
+    def test_table_cursor_iter_column_batches_sync(
+        self,
+        httpserver: HTTPServer,
+        mock_table: DefaultTable,
+    ) -> None:
+        pytest.importorskip("numpy")
+        _expect_two_pages(httpserver)
+        cursor = mock_table.find({})
+        batches = cursor.iter_column_batches()
+        batch0 = next(batches)
+        assert batch0.dtype.names == tuple(PROJECTION_SCHEMA.keys())
+        assert len(batch0) == 2
+        assert cursor.state == CursorState.STARTED
+        assert cursor.consumed == 2
+        batch1 = next(batches)
+        assert len(batch1) == 1
+        with pytest.raises(StopIteration):
+            next(batches)
+        assert cursor.state == CursorState.CLOSED  # type: ignore[comparison-overlap]
+
+    @pytest.mark.describe("test of table cursor iter_column_batches, async")
+    async def test_table_cursor_iter_column_batches_async(
+        self,
+        httpserver: HTTPServer,
+        mock_atable: DefaultAsyncTable,
+    ) -> None:
+        pytest.importorskip("numpy")
+        _expect_two_pages(httpserver)
+        cursor = mock_atable.find({})
+        lengths = [len(batch) async for batch in cursor.iter_column_batches()]
+        assert lengths == [2, 1]
+        assert cursor.state == CursorState.CLOSED
+
+    @pytest.mark.describe("test of table cursor to_columns in arrow format, sync")
+    def test_table_cursor_to_columns_arrow_sync(
+        self,
+        httpserver: HTTPServer,
+        mock_table: DefaultTable,
+    ) -> None:
+        pa = pytest.importorskip("pyarrow")
+        _expect_two_pages(httpserver)
+        arrow_table = mock_table.find({}).to_columns(format="arrow")
+        assert arrow_table.num_rows == 3
+        assert arrow_table.schema.field("id").type == pa.int32()
+        assert arrow_table.schema.field("v").type == pa.list_(pa.float32(), 2)
+        assert arrow_table.column("id").to_pylist() == [1, 2, 3]
+        assert arrow_table.column("v").to_pylist() == [[1.0, 2.0], None, [3.0, 4.0]]
+        assert arrow_table.column("tags").to_pylist() == ['["x"]', None, None]
+
+    @pytest.mark.describe("test of table cursor columnar export, restrictions")
+    def test_table_cursor_columnar_restrictions(
+        self,
+        mock_table: DefaultTable,
+    ) -> None:
+        with pytest.raises(ValueError):
+            mock_table.find({}).to_columns(format="parquet")
+        with pytest.raises(CursorException):
+            mock_table.find({}).map(lambda row: row).iter_column_batches()
+        closed_cursor = mock_table.find({})
+        closed_cursor.close()
+        with pytest.raises(CursorException):
+            closed_cursor.to_columns()
+
+    @pytest.mark.describe("test of table cursor columnar export, memory vs to_list")
+    def test_table_cursor_columnar_memory(
+        self,
+        httpserver: HTTPServer,
+        mock_table: DefaultTable,
+    ) -> None:
+        pytest.importorskip("numpy")
+        n_rows = 2000
+        page = {
+            "data": {
+                "documents": [
+                    {"id": i, "score": i / 2, "v": [i, i + 1]} for i in range(n_rows)
+                ],
+                "nextPageState": None,
+            },
+            "status": {
+                "projectionSchema": {
+                    "id": {"type": "int"},
+                    "score": {"type": "double"},
+                    "v": {"type": "vector", "dimension": 2},
+                },
+            },
+        }
+
+        def _retained_bytes(method_name: str) -> int:
+            httpserver.expect_oneshot_request(
+                f"/{BASE_PATH}/{PATH_SUFFIX}",
+                method=HttpMethod.POST,
+            ).respond_with_json(page)
+            cursor = mock_table.find({})
+            tracemalloc.start()
+            try:
+                result = getattr(cursor, method_name)()
+                assert len(result["id"] if method_name == "to_columns" else result) == (
+                    n_rows
+                )
+                gc.collect()
+                with_result, _ = tracemalloc.get_traced_memory()
+                del result
+                gc.collect()
+                without_result, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            return with_result - without_result
+
+        list_bytes = _retained_bytes("to_list")
+        columns_bytes = _retained_bytes("to_columns")
+        assert columns_bytes * 5 < list_bytes
@@ -0,0 +1,205 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from astrapy import Database, Table
+from astrapy.exceptions import DataAPIResponseException, TableUpdateManyException
+from astrapy.utils.api_options import defaultAPIOptions
+from astrapy.utils.request_tools import HttpMethod
+
+from ..conftest import DefaultTable
+
+BASE_PATH = "v1"
+KEYSPACE = "keyspace"
+TABLE_NAME = "table"
+
+PAGE_SIZE = 2
+NUM_ROWS = 7
+TABLE_DEFINITION = {
+    "columns": {
+        "p": {"type": "text"},
+        "s": {"type": "int"},
+        "x": {"type": "int"},
+    },
+    "primaryKey": {"partitionBy": ["p"], "partitionSort": {"s": 1}},
+}
+
+
+@pytest.fixture
+def mock_table(httpserver: HTTPServer) -> DefaultTable:
+    table: DefaultTable = Table(
+        database=Database(
+            api_endpoint=httpserver.url_for("/"),
+            keyspace=KEYSPACE,
+            api_options=defaultAPIOptions(environment="other"),
+        ),
+        name=TABLE_NAME,
+        keyspace=None,
+        api_options=defaultAPIOptions(environment="other"),
+    )
+    return table
+
+
+class TableHandler:
+    """
+    Serve `find` pages over a set of rows and `updateOne` commands,
+    recording the commands received. Updates to rows with `s == fail_s`
+    get an API error; optionally, the `find` for a page state fails.
+    """
+
+    def __init__(
+        self,
+        *,
+        fail_s: int | None = None,
+        fail_at_page_state: str | None = None,
+    ) -> None:
+        self.rows = [{"p": "A", "s": s, "x": 10 * s} for s in range(NUM_ROWS)]
+        self.fail_s = fail_s
+        self.fail_at_page_state = fail_at_page_state
+        self.find_payloads: list[dict[str, Any]] = []
+        self.updated_keys: list[tuple[str, int]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: Request) -> Response:
+        ((command_name, payload),) = request.get_json().items()
+        response: dict[str, Any]
+        if command_name == "find":
+            self.find_payloads.append(payload)
+            page_state = payload.get("options", {}).get("pageState")
+            if page_state is not None and page_state == self.fail_at_page_state:
+                return Response("Service unavailable", status=503)
+            offset = int(page_state or 0)
+            projection = payload["projection"]
+            rows = [
+                {k: v for k, v in row.items() if k in projection}
+                for row in self.rows[offset : offset + PAGE_SIZE]
+            ]
+            next_offset = offset + PAGE_SIZE
+            response = {
+                "data": {
+                    "documents": rows,
+                    "nextPageState": (
+                        str(next_offset) if next_offset < len(self.rows) else None
+                    ),
+                },
+                "status": {
+                    "projectionSchema": {
+                        col: TABLE_DEFINITION["columns"][col]  # type: ignore[index]
+                        for col in projection
+                    }
+                },
+            }
+        elif command_name == "updateOne":
+            row_key = (payload["filter"]["p"], payload["filter"]["s"])
+            with self._lock:
+                self.updated_keys.append(row_key)
+            if row_key[1] == self.fail_s:
+                response = {"errors": [{"errorCode": "BAD_UPDATE", "message": "No."}]}
+            else:
+                response = {"status": {"matchedCount": 1, "modifiedCount": 1}}
+        else:
+            raise ValueError(f"Unexpected command {command_name}")
+        return Response(json.dumps(response), content_type="application/json")
+
+
+def _serve(httpserver: HTTPServer, handler: TableHandler) -> None:
+    httpserver.expect_request(
+        f"/{BASE_PATH}/{KEYSPACE}",
+        method=HttpMethod.POST,
+    ).respond_with_json(
+        {"status": {"tables": [{"name": TABLE_NAME, "definition": TABLE_DEFINITION}]}}
+    )
+    httpserver.expect_request(
+        f"/{BASE_PATH}/{KEYSPACE}/{TABLE_NAME}",
+        method=HttpMethod.POST,
+    ).respond_with_handler(handler)
+
+
+class TestTableUpdateMany:
+    @pytest.mark.describe("test of table update_many, scan and fan-out")
+    def test_table_update_many(
+        self,
+        httpserver: HTTPServer,
+        mock_table: DefaultTable,
+    ) -> None:
+        handler = TableHandler(fail_s=3)
+        _serve(httpserver, handler)
+        result = mock_table.update_many(
+            {"x": {"$gt": -1}},
+            {"$set": {"x": 0}},
+            concurrency=3,
+        )
+        # the scan projects the primary-key columns only
+        assert all(
+            fp["projection"] == {"p": True, "s": True} for fp in handler.find_payloads
+        )
+        assert handler.find_payloads[0]["filter"] == {"x": {"$gt": -1}}
+        assert sorted(handler.updated_keys) == [("A", s) for s in range(NUM_ROWS)]
+        assert result.matched_count == NUM_ROWS
+        assert result.modified_count == NUM_ROWS - 1
+        assert len(result.raw_results) == NUM_ROWS - 1
+        assert result.failed_ids == [{"p": "A", "s": 3}]
+        assert result.failed_id_tuples == [("A", 3)]
+        assert isinstance(result.exceptions[0], DataAPIResponseException)
+
+        with pytest.raises(ValueError):
+            mock_table.update_many({}, {"$set": {"x": 0}}, concurrency=0)
+
+    @pytest.mark.describe("test of table update_many, failure of the scan")
+    def test_table_update_many_scan_failure(
+        self,
+        httpserver: HTTPServer,
+        mock_table: DefaultTable,
+    ) -> None:
+        handler = TableHandler(fail_at_page_state="4")
+        _serve(httpserver, handler)
+        with pytest.raises(TableUpdateManyException) as exc_info:
+            mock_table.update_many({}, {"$set": {"x": 0}})
+        # the rows of the pages read before the failure are all updated
+        partial_result = exc_info.value.partial_result
+        assert partial_result.matched_count == 4
+        assert partial_result.modified_count == 4
+        assert sorted(handler.updated_keys) == [("A", s) for s in range(4)]
+
+    @pytest.mark.describe("test of table update_many, async")
+    async def test_table_update_many_async(
+        self,
+        httpserver: HTTPServer,
+        mock_table: DefaultTable,
+    ) -> None:
+        handler = TableHandler(fail_s=5)
+        _serve(httpserver, handler)
+        result = await mock_table.to_async().update_many(
+            {},
+            {"$set": {"x": 0}},
+            concurrency=2,
+        )
+        assert sorted(handler.updated_keys) == [("A", s) for s in range(NUM_ROWS)]
+        assert result.matched_count == NUM_ROWS
+        assert result.modified_count == NUM_ROWS - 1
+        assert result.failed_id_tuples == [("A", 5)]
+
+        handler.fail_at_page_state = "2"
+        with pytest.raises(TableUpdateManyException) as exc_info:
+            await mock_table.to_async().update_many({}, {"$set": {"x": 0}})
+        assert exc_info.value.partial_result.matched_count == 2